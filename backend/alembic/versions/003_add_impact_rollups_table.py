@@ -0,0 +1,59 @@
+"""add impact_rollups table
+
+Pre-aggregated orphan resource totals per account, type, region, status and
+day, maintained by app.crud.impact_rollup and read by the /impact endpoints.
+
+Existing accounts are backfilled with:
+    python scripts/rebuild_impact_rollups.py
+
+Revision ID: 003_add_impact_rollups
+Revises: 002_merge_heads
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_add_impact_rollups'
+down_revision: Union[str, None] = '002_merge_heads'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('impact_rollups',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('cloud_account_id', sa.UUID(), nullable=False),
+    sa.Column('provider', sa.String(length=20), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('region', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=30), nullable=False),
+    sa.Column('detected_on', sa.Date(), nullable=False),
+    sa.Column('changed_on', sa.Date(), nullable=False),
+    sa.Column('resource_count', sa.Integer(), nullable=False),
+    sa.Column('monthly_cost', sa.Float(), nullable=False),
+    sa.Column('wasted_cost', sa.Float(), nullable=False),
+    sa.Column('age_days_total', sa.Float(), nullable=False),
+    sa.Column('age_days_count', sa.Integer(), nullable=False),
+    sa.Column('max_monthly_cost', sa.Float(), nullable=False),
+    sa.Column('min_cleanup_hours', sa.Float(), nullable=True),
+    sa.Column('last_changed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['cloud_account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_impact_rollups_cloud_account_id'), 'impact_rollups', ['cloud_account_id'], unique=False)
+    op.create_index(op.f('ix_impact_rollups_user_id'), 'impact_rollups', ['user_id'], unique=False)
+    op.create_index('ix_impact_rollups_key', 'impact_rollups', ['cloud_account_id', 'resource_type', 'region', 'status', 'detected_on', 'changed_on'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_impact_rollups_key', table_name='impact_rollups')
+    op.drop_index(op.f('ix_impact_rollups_user_id'), table_name='impact_rollups')
+    op.drop_index(op.f('ix_impact_rollups_cloud_account_id'), table_name='impact_rollups')
+    op.drop_table('impact_rollups')
@@ -0,0 +1,64 @@
+"""add latest scan pointers to cloud_accounts
+
+cloud_accounts.latest_orphan_scan_id / latest_inventory_scan_id point at the
+latest completed scan of each kind (set at scan completion, see
+app.crud.scan.set_latest_scan), replacing the max(scans.created_at)
+subqueries of the orphan resource listings and statistics. Existing
+accounts are backfilled from their scans.
+
+Also adds a composite index on orphan_resources(scan_id, status,
+resource_type, estimated_monthly_cost) covering those queries.
+
+Revision ID: 004_add_latest_scan_pointers
+Revises: 003_add_impact_rollups
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_add_latest_scan_pointers'
+down_revision: Union[str, None] = '003_add_impact_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('cloud_accounts', sa.Column('latest_orphan_scan_id', sa.UUID(), nullable=True))
+    op.add_column('cloud_accounts', sa.Column('latest_inventory_scan_id', sa.UUID(), nullable=True))
+    op.create_foreign_key('fk_cloud_accounts_latest_orphan_scan_id', 'cloud_accounts', 'scans', ['latest_orphan_scan_id'], ['id'], ondelete='SET NULL')
+    op.create_foreign_key('fk_cloud_accounts_latest_inventory_scan_id', 'cloud_accounts', 'scans', ['latest_inventory_scan_id'], ['id'], ondelete='SET NULL')
+    op.create_index('ix_orphan_resources_scan_status_type_cost', 'orphan_resources', ['scan_id', 'status', 'resource_type', 'estimated_monthly_cost'], unique=False)
+
+    # Backfill: latest completed scan of each kind per account
+    op.execute("""
+        UPDATE cloud_accounts SET
+            latest_orphan_scan_id = (
+                SELECT scans.id FROM scans
+                WHERE scans.cloud_account_id = cloud_accounts.id
+                  AND scans.status = 'completed'
+                  AND scans.scan_type != 'inventory'
+                ORDER BY COALESCE(scans.completed_at, scans.created_at) DESC
+                LIMIT 1
+            ),
+            latest_inventory_scan_id = (
+                SELECT scans.id FROM scans
+                WHERE scans.cloud_account_id = cloud_accounts.id
+                  AND scans.status = 'completed'
+                  AND scans.scan_type = 'inventory'
+                ORDER BY COALESCE(scans.completed_at, scans.created_at) DESC
+                LIMIT 1
+            )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_orphan_resources_scan_status_type_cost', table_name='orphan_resources')
+    op.drop_constraint('fk_cloud_accounts_latest_inventory_scan_id', 'cloud_accounts', type_='foreignkey')
+    op.drop_constraint('fk_cloud_accounts_latest_orphan_scan_id', 'cloud_accounts', type_='foreignkey')
+    op.drop_column('cloud_accounts', 'latest_inventory_scan_id')
+    op.drop_column('cloud_accounts', 'latest_orphan_scan_id')
@@ -0,0 +1,40 @@
+"""add keyset pagination indexes to resource listings
+
+Composite (filter column, sort column, id) indexes backing the cursor
+pagination of the orphan resource and inventory listings (see
+app.crud.pagination): sort by cost, type or region within the latest scan
+(orphan_resources) or the cloud account (all_cloud_resources).
+
+Revision ID: 005_add_resource_keyset_indexes
+Revises: 004_add_latest_scan_pointers
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_add_resource_keyset_indexes'
+down_revision: Union[str, None] = '004_add_latest_scan_pointers'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_orphan_resources_scan_cost_id', 'orphan_resources', ['scan_id', 'estimated_monthly_cost', 'id'], unique=False)
+    op.create_index('ix_orphan_resources_scan_type_id', 'orphan_resources', ['scan_id', 'resource_type', 'id'], unique=False)
+    op.create_index('ix_orphan_resources_scan_region_id', 'orphan_resources', ['scan_id', 'region', 'id'], unique=False)
+    op.create_index('ix_all_cloud_resources_account_cost_id', 'all_cloud_resources', ['cloud_account_id', 'estimated_monthly_cost', 'id'], unique=False)
+    op.create_index('ix_all_cloud_resources_account_type_id', 'all_cloud_resources', ['cloud_account_id', 'resource_type', 'id'], unique=False)
+    op.create_index('ix_all_cloud_resources_account_region_id', 'all_cloud_resources', ['cloud_account_id', 'region', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_all_cloud_resources_account_region_id', table_name='all_cloud_resources')
+    op.drop_index('ix_all_cloud_resources_account_type_id', table_name='all_cloud_resources')
+    op.drop_index('ix_all_cloud_resources_account_cost_id', table_name='all_cloud_resources')
+    op.drop_index('ix_orphan_resources_scan_region_id', table_name='orphan_resources')
+    op.drop_index('ix_orphan_resources_scan_type_id', table_name='orphan_resources')
+    op.drop_index('ix_orphan_resources_scan_cost_id', table_name='orphan_resources')
@@ -0,0 +1,59 @@
+"""add scan retention summary columns and orphan resources archive
+
+Scans compacted by the retention job (see app.crud.scan_retention) lose
+their resource rows and keep scans.summary (counts and monthly costs per
+type/region) and scans.compacted_at. Their orphan resources can be archived
+to orphan_resources_archive, partitioned by month of the scan's creation
+date (partitions are created by the job as needed).
+
+Revision ID: 006_add_scan_retention
+Revises: 005_add_resource_keyset_indexes
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_scan_retention'
+down_revision: Union[str, None] = '005_add_resource_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scans', sa.Column('compacted_at', sa.DateTime(), nullable=True))
+    op.add_column('scans', sa.Column('summary', postgresql.JSON(astext_type=sa.Text()), nullable=True))
+    op.create_table('orphan_resources_archive',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('scan_created_at', sa.DateTime(), nullable=False),
+    sa.Column('scan_id', sa.UUID(), nullable=False),
+    sa.Column('cloud_account_id', sa.UUID(), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('resource_id', sa.String(length=255), nullable=False),
+    sa.Column('resource_name', sa.String(length=255), nullable=True),
+    sa.Column('region', sa.String(length=50), nullable=False),
+    sa.Column('estimated_monthly_cost', sa.Float(), nullable=False),
+    sa.Column('resource_metadata', postgresql.JSON(astext_type=sa.Text()), nullable=True),
+    sa.Column('status', sa.String(length=30), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'scan_created_at'),
+    postgresql_partition_by='RANGE (scan_created_at)'
+    )
+    op.create_index(op.f('ix_orphan_resources_archive_cloud_account_id'), 'orphan_resources_archive', ['cloud_account_id'], unique=False)
+    op.create_index(op.f('ix_orphan_resources_archive_scan_id'), 'orphan_resources_archive', ['scan_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_orphan_resources_archive_scan_id'), table_name='orphan_resources_archive')
+    op.drop_index(op.f('ix_orphan_resources_archive_cloud_account_id'), table_name='orphan_resources_archive')
+    # Drops the monthly partitions with it
+    op.drop_table('orphan_resources_archive')
+    op.drop_column('scans', 'summary')
+    op.drop_column('scans', 'compacted_at')
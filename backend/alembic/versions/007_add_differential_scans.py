@@ -0,0 +1,69 @@
+"""add differential scan persistence
+
+Differential scans (SCAN_DIFFERENTIAL_PERSISTENCE) only write the orphan
+resources added or changed since the account's previous scan, found by
+orphan_resources.fingerprint, take over the unchanged rows, and log every
+change in orphan_resource_changes (see app.crud.orphan_resource_change).
+scans.base_scan_id is the scan a differential scan was compared with.
+
+The latest_orphan_resources view exposes the current findings of every
+account (the rows of its latest orphan scan) to external consumers.
+
+Revision ID: 007_add_differential_scans
+Revises: 006_add_scan_retention
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_differential_scans'
+down_revision: Union[str, None] = '006_add_scan_retention'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('orphan_resources', sa.Column('fingerprint', sa.String(length=64), nullable=True))
+    op.add_column('scans', sa.Column('base_scan_id', sa.UUID(), nullable=True))
+    op.create_foreign_key('fk_scans_base_scan_id', 'scans', 'scans', ['base_scan_id'], ['id'], ondelete='SET NULL')
+    op.create_table('orphan_resource_changes',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('scan_id', sa.UUID(), nullable=False),
+    sa.Column('cloud_account_id', sa.UUID(), nullable=False),
+    sa.Column('orphan_resource_id', sa.UUID(), nullable=True),
+    sa.Column('change_type', sa.String(length=20), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('resource_id', sa.String(length=255), nullable=False),
+    sa.Column('resource_name', sa.String(length=255), nullable=True),
+    sa.Column('region', sa.String(length=50), nullable=False),
+    sa.Column('estimated_monthly_cost', sa.Float(), nullable=False),
+    sa.Column('previous_monthly_cost', sa.Float(), nullable=True),
+    sa.Column('fingerprint', sa.String(length=64), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['cloud_account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['scan_id'], ['scans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_orphan_resource_changes_cloud_account_id'), 'orphan_resource_changes', ['cloud_account_id'], unique=False)
+    op.create_index(op.f('ix_orphan_resource_changes_scan_id'), 'orphan_resource_changes', ['scan_id'], unique=False)
+    op.execute("""
+        CREATE VIEW latest_orphan_resources AS
+        SELECT orphan_resources.*
+        FROM orphan_resources
+        JOIN cloud_accounts ON orphan_resources.scan_id = cloud_accounts.latest_orphan_scan_id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP VIEW IF EXISTS latest_orphan_resources")
+    op.drop_index(op.f('ix_orphan_resource_changes_scan_id'), table_name='orphan_resource_changes')
+    op.drop_index(op.f('ix_orphan_resource_changes_cloud_account_id'), table_name='orphan_resource_changes')
+    op.drop_table('orphan_resource_changes')
+    op.drop_constraint('fk_scans_base_scan_id', 'scans', type_='foreignkey')
+    op.drop_column('scans', 'base_scan_id')
+    op.drop_column('orphan_resources', 'fingerprint')
@@ -0,0 +1,49 @@
+"""add scenario evaluations for incremental scans
+
+Incremental scheduled scans (SCAN_INCREMENTAL_SCHEDULED) reuse the last
+findings of a metric-based scenario while the change markers of its input
+resources are unchanged. scenario_evaluations keeps, per account, region
+and scenario, the digest of those markers and the findings of the last
+full evaluation (see app.providers.incremental).
+
+Revision ID: 008_add_scenario_evaluations
+Revises: 007_add_differential_scans
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_add_scenario_evaluations'
+down_revision: Union[str, None] = '007_add_differential_scans'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scenario_evaluations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('cloud_account_id', sa.UUID(), nullable=False),
+    sa.Column('region', sa.String(length=50), nullable=False),
+    sa.Column('scenario', sa.String(length=100), nullable=False),
+    sa.Column('inputs_digest', sa.String(length=64), nullable=False),
+    sa.Column('findings', sa.JSON(), nullable=False),
+    sa.Column('evaluated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['cloud_account_id'], ['cloud_accounts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_scenario_evaluations_key',
+        'scenario_evaluations',
+        ['cloud_account_id', 'region', 'scenario'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scenario_evaluations_key', table_name='scenario_evaluations')
+    op.drop_table('scenario_evaluations')
@@ -345,14 +345,18 @@ async def export_ml_datasets(
     db: Annotated[AsyncSession, Depends(get_db)],
     _: Annotated[User, Depends(get_current_superuser)],
     days: int = Query(90, ge=7, le=365, description="Number of days to export"),
-    output_format: str = Query("json", regex="^(json|csv)$", description="Export format (json or csv)"),
+    output_format: str = Query(
+        "json",
+        regex="^(json|jsonl|csv|parquet)$",
+        description="Export format (json, jsonl, csv or parquet)",
+    ),
 ) -> MLExportResponse:
     """
     Export ML datasets for training (superuser only).
 
     Args:
         days: Number of days to export (7-365, default: 90)
-        output_format: Export format (json or csv, default: json)
+        output_format: Export format (json, jsonl, csv or parquet, default: json)
 
     Returns:
         Export result with file paths and record counts
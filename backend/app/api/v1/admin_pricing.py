@@ -17,6 +17,7 @@ from app.schemas.admin_pricing import (
     PricingRefreshResponse,
     PricingStats,
 )
+from app.services.pricing_service import get_tier_stats
 from app.workers.celery_app import celery_app
 
 router = APIRouter()
@@ -40,6 +41,7 @@ async def get_pricing_stats(
     - Source breakdown (API vs fallback)
     - Cache hit rate
     - API success rate
+    - Lookup hit rate per cache tier (memory, Redis, PostgreSQL), all workers
 
     Returns:
         PricingStats object with all statistics
@@ -87,6 +89,8 @@ async def get_pricing_stats(
         else 0.0
     )
 
+    tier_stats = await get_tier_stats()
+
     return PricingStats(
         total_cached_prices=total_cached_prices,
         expired_prices=expired_prices,
@@ -95,6 +99,9 @@ async def get_pricing_stats(
         last_refresh_at=last_refresh_at,
         cache_hit_rate=round(cache_hit_rate, 2),
         api_success_rate=round(api_success_rate, 2),
+        tiers=tier_stats["tiers"],
+        api_fetches=tier_stats["api_fetches"],
+        fallback_lookups=tier_stats["fallbacks"],
     )
 
 
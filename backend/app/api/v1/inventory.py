@@ -3,7 +3,8 @@
 import uuid
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -13,6 +14,7 @@ from app.core.config import settings
 from app.models.user import User
 from app.crud import all_cloud_resource as crud_inventory
 from app.crud import cloud_account as crud_cloud_account
+from app.crud.pagination import DEFAULT_SORT, next_cursor, stream_ndjson
 from app.schemas.all_cloud_resource import (
     AllCloudResource,
     CostBreakdown,
@@ -152,31 +154,58 @@ async def get_optimizable_resources(
 @limiter.limit(settings.RATE_LIMIT_API_DEFAULT)
 async def get_all_resources(
     request: Request,
+    response: Response,
     cloud_account_id: uuid.UUID = Query(..., description="Cloud account ID"),
     resource_type: str | None = Query(None, description="Filter by resource type"),
     is_optimizable: bool | None = Query(
         None, description="Filter by optimization status"
     ),
     min_cost: float | None = Query(None, description="Minimum monthly cost filter"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (prefer cursor)"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of results"),
+    sort: str = Query(
+        DEFAULT_SORT, regex="^(cost|type|region)$", description="Sort by cost, type or region"
+    ),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    output_format: str = Query(
+        "json", alias="format", regex="^(json|ndjson)$", description="ndjson streams all rows"
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> list[AllCloudResource]:
+) -> list[AllCloudResource] | StreamingResponse:
     """
     Get all cloud resources for an account (with filters).
 
     Returns paginated list of all resources from the latest scan.
     Supports filtering by type, optimization status, and cost.
+    Sorted by cost (descending), type or region, then id. Pages are chained
+    with the cursor returned in the X-Next-Cursor header (absent on the last
+    page). With format=ndjson, all matching resources are streamed as NDJSON
+    in one response (for exports).
     """
     # Verify account belongs to user
     account = await crud_cloud_account.get_cloud_account_by_id(db, cloud_account_id, current_user.id)
     if not account or account.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Cloud account not found")
 
-    resources = await crud_inventory.get_resources_by_account(
-        db, cloud_account_id, resource_type, is_optimizable, min_cost, skip, limit
-    )
+    try:
+        if output_format == "ndjson":
+            query = crud_inventory.resources_by_account_query(
+                cloud_account_id, resource_type, is_optimizable, min_cost, sort, cursor
+            )
+            return StreamingResponse(
+                stream_ndjson(query, AllCloudResource), media_type="application/x-ndjson"
+            )
+
+        resources = await crud_inventory.get_resources_by_account(
+            db, cloud_account_id, resource_type, is_optimizable, min_cost, skip, limit, sort, cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    page_cursor = next_cursor(resources, sort, limit)
+    if page_cursor:
+        response.headers["X-Next-Cursor"] = page_cursor
     return resources
 
 
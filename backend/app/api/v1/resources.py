@@ -3,12 +3,14 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, get_db
 from app.crud import cloud_account as cloud_account_crud
 from app.crud import orphan_resource as orphan_resource_crud
+from app.crud.pagination import DEFAULT_SORT, next_cursor, stream_ndjson
 from app.models.orphan_resource import ResourceStatus
 from app.models.user import User
 from app.schemas.orphan_resource import (
@@ -23,6 +25,7 @@ router = APIRouter()
 
 @router.get("/", response_model=list[OrphanResource])
 async def list_orphan_resources(
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_active_user)],
     cloud_account_id: uuid.UUID | None = Query(None),
@@ -30,11 +33,19 @@ async def list_orphan_resources(
     resource_type: str | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> list[OrphanResource]:
+    sort: str = Query(DEFAULT_SORT, regex="^(cost|type|region)$"),
+    cursor: str | None = Query(None, description="X-Next-Cursor of the previous page"),
+    output_format: str = Query(
+        "json", alias="format", regex="^(json|ndjson)$", description="ndjson streams all rows"
+    ),
+) -> list[OrphanResource] | StreamingResponse:
     """
     List orphan resources.
 
-    Can filter by cloud account, status, and resource type.
+    Can filter by cloud account, status, and resource type. Sorted by cost
+    (descending), type or region, then id. Pages are chained with the cursor
+    returned in the X-Next-Cursor header (absent on the last page). With
+    format=ndjson, all matching resources are streamed as NDJSON in one response.
     """
     if cloud_account_id:
         # Verify account belongs to user
@@ -48,64 +59,31 @@ async def list_orphan_resources(
                 detail="Cloud account not found",
             )
 
-        resources = await orphan_resource_crud.get_orphan_resources_by_account(
-            db, cloud_account_id, status_filter, resource_type, skip, limit
-        )
-    else:
-        # Get resources for all user's accounts
-        # Only show resources from the latest scan per account
-        from app.models.cloud_account import CloudAccount
-        from app.models.orphan_resource import OrphanResource as OrphanResourceModel
-        from app.models.scan import Scan
-        from sqlalchemy import select, and_, func
-
-        # Subquery to get the latest ORPHAN scan ID per cloud account
-        # Filter out INVENTORY scans to avoid interference
-        latest_scan_subquery = (
-            select(
-                Scan.cloud_account_id,
-                func.max(Scan.created_at).label("max_created_at")
+    try:
+        if output_format == "ndjson":
+            # Only show resources from the latest ORPHAN scan per account
+            query = orphan_resource_crud.latest_orphan_resources_query(
+                current_user.id, cloud_account_id, status_filter, resource_type, sort, cursor
             )
-            .where(
-                Scan.status == "completed",
-                Scan.scan_type != "inventory"
+            return StreamingResponse(
+                stream_ndjson(query, OrphanResource), media_type="application/x-ndjson"
             )
-            .group_by(Scan.cloud_account_id)
-            .subquery()
-        )
 
-        latest_scan_ids = (
-            select(Scan.id)
-            .join(
-                latest_scan_subquery,
-                and_(
-                    Scan.cloud_account_id == latest_scan_subquery.c.cloud_account_id,
-                    Scan.created_at == latest_scan_subquery.c.max_created_at
-                )
+        if cloud_account_id:
+            resources = await orphan_resource_crud.get_orphan_resources_by_account(
+                db, cloud_account_id, status_filter, resource_type, skip, limit, sort, cursor
             )
-            .subquery()
-        )
-
-        query = (
-            select(OrphanResourceModel)
-            .join(CloudAccount)
-            .where(
-                and_(
-                    CloudAccount.user_id == current_user.id,
-                    OrphanResourceModel.scan_id.in_(select(latest_scan_ids))
-                )
+        else:
+            # Get resources for all user's accounts
+            resources = await orphan_resource_crud.get_latest_orphan_resources_by_user(
+                db, current_user.id, status_filter, resource_type, skip, limit, sort, cursor
             )
-        )
-
-        if status_filter:
-            query = query.where(OrphanResourceModel.status == status_filter.value)
-
-        if resource_type:
-            query = query.where(OrphanResourceModel.resource_type == resource_type)
-
-        result = await db.execute(query.offset(skip).limit(limit))
-        resources = list(result.scalars().all())
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
+    page_cursor = next_cursor(resources, sort, limit)
+    if page_cursor:
+        response.headers["X-Next-Cursor"] = page_cursor
     return resources
 
 
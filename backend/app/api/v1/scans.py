@@ -1,21 +1,27 @@
 """Scan API endpoints."""
 
 import uuid
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 
 from celery.result import AsyncResult
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
+from sse_starlette.sse import EventSourceResponse
 
 from app.api.deps import get_current_active_user, get_db
 from app.core.rate_limit import scan_limit
 from app.core.subscription_dependencies import check_scan_limit
 from app.crud import cloud_account as cloud_account_crud
+from app.crud import orphan_resource_change as orphan_resource_change_crud
 from app.crud import scan as scan_crud
+from app.models.orphan_resource_change import ChangeType
+from app.models.scan import Scan as ScanModel
 from app.models.scan import ScanType
 from app.models.user import User
+from app.schemas.orphan_resource import OrphanResourceChange
 from app.schemas.scan import Scan, ScanCreate, ScanProgress, ScanSummary, ScanWithResources
+from app.services.scan_progress import get_progress_snapshot, stream_progress
 from app.services.subscription_service import SubscriptionService
 from app.workers.celery_app import celery_app
 from app.workers.tasks import scan_cloud_account
@@ -258,6 +264,41 @@ async def delete_all_scans(
     await scan_crud.delete_all_scans_by_user(db, current_user.id)
 
 
+async def _get_user_scan(db: AsyncSession, scan_id: uuid.UUID, user: User) -> ScanModel:
+    """Get a scan of the user's cloud accounts (404 if missing, 403 if not owned)."""
+    scan_with_owner = await scan_crud.get_scan_with_owner(db, scan_id)
+
+    if not scan_with_owner:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Scan not found",
+        )
+
+    # Verify scan belongs to user's account
+    scan, owner_id = scan_with_owner
+    if owner_id != user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this scan",
+        )
+
+    return scan
+
+
+def _finished_scan_progress(scan: ScanModel) -> ScanProgress:
+    """Progress of a scan that has completed or failed (from the scan record)."""
+    return ScanProgress(
+        state=scan.status.upper(),
+        current=scan.total_resources_scanned,
+        total=scan.total_resources_scanned,
+        percent=100 if scan.status == "completed" else 0,
+        current_step="Completed" if scan.status == "completed" else "Failed",
+        region="",
+        resources_found=scan.orphan_resources_found,
+        elapsed_seconds=0,
+    )
+
+
 @router.get("/{scan_id}/progress", response_model=ScanProgress)
 async def get_scan_progress(
     scan_id: uuid.UUID,
@@ -267,46 +308,38 @@ async def get_scan_progress(
     """
     Get real-time progress of an ongoing scan.
 
-    Returns Celery task state and progress metadata:
+    Returns the last progress snapshot published by the scan worker to Redis
+    (prefer GET /scans/{scan_id}/progress/stream to be notified of updates).
+    Falls back to the Celery task state if no snapshot is available:
     - PENDING: Task not started yet
     - PROGRESS: Task is running (with detailed progress info)
     - SUCCESS: Task completed successfully
     - FAILURE: Task failed with an error
     """
-    # Get scan
-    scan = await scan_crud.get_scan_by_id(db, scan_id)
-
-    if not scan:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Scan not found",
-        )
-
-    # Verify scan belongs to user's account
-    account = await cloud_account_crud.get_cloud_account_by_id(
-        db, scan.cloud_account_id, current_user.id
-    )
-
-    if not account:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this scan",
-        )
+    scan = await _get_user_scan(db, scan_id, current_user)
 
     # If scan doesn't have a task ID or is already completed/failed, return default state
     if not scan.celery_task_id or scan.status in ["completed", "failed"]:
+        return _finished_scan_progress(scan)
+
+    # Snapshot pushed by the scan worker
+    snapshot = await get_progress_snapshot(str(scan_id))
+    if snapshot:
+        return ScanProgress(**snapshot)
+
+    if scan.status == "pending":
         return ScanProgress(
-            state=scan.status.upper(),
-            current=scan.total_resources_scanned,
-            total=scan.total_resources_scanned,
-            percent=100 if scan.status == "completed" else 0,
-            current_step="Completed" if scan.status == "completed" else "Failed",
+            state="PENDING",
+            current=0,
+            total=1,
+            percent=0,
+            current_step="Waiting to start...",
             region="",
-            resources_found=scan.orphan_resources_found,
+            resources_found=0,
             elapsed_seconds=0,
         )
 
-    # Get Celery task result
+    # Get Celery task result (Redis snapshot unavailable)
     task_result = AsyncResult(scan.celery_task_id, app=celery_app)
 
     # Extract progress info from Celery task
@@ -332,6 +365,7 @@ async def get_scan_progress(
             region=info.get("region", ""),
             resources_found=info.get("resources_found", 0),
             elapsed_seconds=info.get("elapsed_seconds", 0),
+            regions=info.get("regions", {}),
         )
     elif task_result.state == "SUCCESS":
         return ScanProgress(
@@ -369,6 +403,60 @@ async def get_scan_progress(
         )
 
 
+@router.get("/{scan_id}/progress/stream")
+async def stream_scan_progress(
+    scan_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> EventSourceResponse:
+    """
+    Stream the progress of a scan using Server-Sent Events.
+
+    Sends a "progress" event (ScanProgress JSON) with the current state, then
+    one per update published by the scan worker. The stream ends after the
+    SUCCESS or FAILURE event.
+    """
+    scan = await _get_user_scan(db, scan_id, current_user)
+    finished = (
+        _finished_scan_progress(scan) if scan.status in ["completed", "failed"] else None
+    )
+
+    async def event_generator() -> AsyncGenerator[dict, None]:
+        """Generate SSE events from the scan's Redis progress channel."""
+        if finished:
+            yield {"event": "progress", "data": finished.model_dump_json()}
+            return
+
+        try:
+            async for event in stream_progress(str(scan_id)):
+                yield {"event": "progress", "data": ScanProgress(**event).model_dump_json()}
+        except Exception as e:
+            # Send error event (clients fall back to GET /scans/{scan_id}/progress)
+            yield {"event": "error", "data": str(e)}
+
+    return EventSourceResponse(event_generator())
+
+
+@router.get("/{scan_id}/changes", response_model=list[OrphanResourceChange])
+async def list_scan_changes(
+    scan_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    change_type: ChangeType | None = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+) -> list[OrphanResourceChange]:
+    """
+    List the findings a differential scan added, changed or removed since its base scan.
+
+    Empty for scans that wrote all their findings (SCAN_DIFFERENTIAL_PERSISTENCE off).
+    """
+    await _get_user_scan(db, scan_id, current_user)
+    return await orphan_resource_change_crud.get_changes_by_scan(
+        db, scan_id, change_type=change_type, skip=skip, limit=limit
+    )
+
+
 @router.delete("/{scan_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_scan(
     scan_id: uuid.UUID,
@@ -139,6 +139,7 @@ async def test_resource_detection(
         )
 
     # Initialize provider
+    pricing_service = None
     if account.provider == "aws":
         # Create pricing service
         pricing_service = PricingService(db)
@@ -154,6 +155,8 @@ async def test_resource_detection(
         try:
             await provider.validate_credentials()
         except Exception as e:
+            await provider.close()
+            await pricing_service.close()
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Invalid AWS credentials: {str(e)}",
@@ -241,3 +244,9 @@ async def test_resource_detection(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Test detection failed: {str(e)}",
         )
+
+    finally:
+        # Release pooled clients and the pricing service's Redis pool
+        await provider.close()
+        if pricing_service is not None:
+            await pricing_service.close()
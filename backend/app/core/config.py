@@ -121,6 +121,26 @@ class Settings(BaseSettings):
     RATE_LIMIT_ADMIN: str = "50/minute"  # Admin endpoints
     RATE_LIMIT_API_DEFAULT: str = "100/minute"  # Default for all API endpoints
 
+    # Scan Performance
+    SCAN_MAX_CONCURRENT_SCENARIOS: int = 8  # Scenarios running at once per provider/region scan
+    SCAN_MAX_CONCURRENT_PER_SERVICE: int = 4  # Scenarios running at once per cloud API service
+    SCAN_MAX_CONCURRENT_REGIONS: int = 4  # Regions scanned at once per account scan
+    SCAN_PERSIST_CHUNK_SIZE: int = 1000  # Result rows per bulk INSERT when saving scan results
+    SCAN_PROGRESS_TTL_SECONDS: int = 3600  # Lifetime of a scan progress snapshot in Redis
+    SCAN_RETENTION_KEEP_LAST: int = 10  # Scans per account keeping their resources (older ones are compacted)
+    SCAN_RETENTION_ARCHIVE_DETAILS: bool = False  # Move resources of compacted scans to orphan_resources_archive
+    SCAN_DIFFERENTIAL_PERSISTENCE: bool = False  # Write only findings changed since the account's previous scan
+    SCAN_INCREMENTAL_SCHEDULED: bool = False  # Scheduled scans reuse verdicts of scenarios whose inputs are unchanged
+    SCAN_INCREMENTAL_MAX_AGE_HOURS: int = 72  # Reused verdicts older than this are evaluated again
+    AWS_MAX_POOL_CONNECTIONS: int = 50  # HTTP connections per pooled AWS client (service, region)
+    AZURE_SCAN_MAX_THREADS: int = 8  # Worker threads running blocking Azure SDK scenarios per scan
+    AZURE_USE_RESOURCE_GRAPH: bool = False  # List Azure resources via Resource Graph (needs azure-mgmt-resourcegraph)
+    GCP_SCAN_MAX_THREADS: int = 8  # Worker threads running blocking GCP client scenarios per scan
+    M365_GRAPH_MAX_CONCURRENCY: int = 8  # Concurrent Microsoft Graph requests per Microsoft 365 scan
+    PRICING_MEMORY_CACHE_SIZE: int = 4096  # Prices kept in each process' in-memory LRU
+    PRICING_MEMORY_CACHE_TTL_SECONDS: int = 300  # Lifetime of an in-memory price
+    PRICING_REDIS_TTL_SECONDS: int = 86400  # Lifetime of a price cached in Redis (24h, like pricing_cache)
+
     # Stripe Payment
     STRIPE_SECRET_KEY: str = ""
     STRIPE_PUBLISHABLE_KEY: str = ""
@@ -3,9 +3,11 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import func, select, and_, or_
+from sqlalchemy import delete, func, insert, select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 
+from app.crud.pagination import DEFAULT_SORT, apply_keyset
 from app.models.all_cloud_resource import AllCloudResource, OptimizationPriority
 from app.schemas.all_cloud_resource import AllCloudResourceCreate
 
@@ -43,14 +45,59 @@ async def bulk_create_resources(
     Returns:
         List of created resource objects
     """
-    resources = [AllCloudResource(**r.model_dump()) for r in resources_in]
-    db.add_all(resources)
+    # One INSERT ... RETURNING per chunk instead of a flush and a refresh per object
+    resources: list[AllCloudResource] = []
+    rows = [r.model_dump() for r in resources_in]
+    for start in range(0, len(rows), 1000):
+        result = await db.scalars(
+            insert(AllCloudResource).returning(AllCloudResource), rows[start : start + 1000]
+        )
+        resources.extend(result.all())
     await db.commit()
-    for resource in resources:
-        await db.refresh(resource)
     return resources
 
 
+async def bulk_insert_resources(
+    db: AsyncSession, rows: list[dict[str, Any]], chunk_size: int = 1000
+) -> int:
+    """
+    Insert many cloud resources without building ORM objects.
+
+    Rows are sent with executemany INSERTs (batched into multi-row VALUES by
+    the driver) and committed chunk by chunk, so inventory scans of tens of
+    thousands of resources neither hold a big identity map nor pay a
+    per-object flush.
+
+    Args:
+        db: Database session
+        rows: Column values per resource (scan_id, cloud_account_id, resource_type, ...)
+        chunk_size: Rows per INSERT statement and transaction
+
+    Returns:
+        Number of rows inserted
+    """
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(AllCloudResource), rows[start : start + chunk_size])
+        await db.commit()
+    return len(rows)
+
+
+async def delete_resources_by_scan(db: AsyncSession, scan_id: uuid.UUID) -> int:
+    """
+    Delete all cloud resources of a scan in one statement.
+
+    Args:
+        db: Database session
+        scan_id: Scan UUID
+
+    Returns:
+        Number of rows deleted
+    """
+    result = await db.execute(delete(AllCloudResource).where(AllCloudResource.scan_id == scan_id))
+    await db.commit()
+    return result.rowcount or 0
+
+
 async def get_resource_by_id(
     db: AsyncSession, resource_id: uuid.UUID
 ) -> AllCloudResource | None:
@@ -97,29 +144,30 @@ async def get_resources_by_scan(
     return list(result.scalars().all())
 
 
-async def get_resources_by_account(
-    db: AsyncSession,
+def resources_by_account_query(
     cloud_account_id: uuid.UUID,
     resource_type: str | None = None,
     is_optimizable: bool | None = None,
     min_cost: float | None = None,
-    skip: int = 0,
-    limit: int = 100,
-) -> list[AllCloudResource]:
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
+) -> Select:
     """
-    Get resources for a specific cloud account from the latest scan.
+    Build the listing of a cloud account's resources.
 
     Args:
-        db: Database session
         cloud_account_id: Cloud account UUID
         resource_type: Optional resource type filter
         is_optimizable: Optional filter for optimizable resources
         min_cost: Optional minimum monthly cost filter
-        skip: Number of records to skip
-        limit: Maximum number of records to return
+        sort: Sort key: cost (descending), type or region
+        cursor: Cursor of the previous page (keyset pagination)
 
     Returns:
-        List of resource objects from the latest scan
+        Select of resources in (sort column, id) order
+
+    Raises:
+        ValueError: If the sort key or cursor is invalid
     """
     # Build query with filters
     query = select(AllCloudResource).where(
@@ -135,7 +183,43 @@ async def get_resources_by_account(
     if min_cost is not None:
         query = query.where(AllCloudResource.estimated_monthly_cost >= min_cost)
 
-    query = query.order_by(AllCloudResource.estimated_monthly_cost.desc())
+    return apply_keyset(query, AllCloudResource, sort, cursor)
+
+
+async def get_resources_by_account(
+    db: AsyncSession,
+    cloud_account_id: uuid.UUID,
+    resource_type: str | None = None,
+    is_optimizable: bool | None = None,
+    min_cost: float | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
+) -> list[AllCloudResource]:
+    """
+    Get resources for a specific cloud account from the latest scan.
+
+    Args:
+        db: Database session
+        cloud_account_id: Cloud account UUID
+        resource_type: Optional resource type filter
+        is_optimizable: Optional filter for optimizable resources
+        min_cost: Optional minimum monthly cost filter
+        skip: Number of records to skip (prefer cursor)
+        limit: Maximum number of records to return
+        sort: Sort key: cost (descending), type or region
+        cursor: Cursor of the previous page (keyset pagination)
+
+    Returns:
+        List of resource objects from the latest scan
+
+    Raises:
+        ValueError: If the sort key or cursor is invalid
+    """
+    query = resources_by_account_query(
+        cloud_account_id, resource_type, is_optimizable, min_cost, sort, cursor
+    )
     query = query.offset(skip).limit(limit)
 
     result = await db.execute(query)
@@ -366,26 +450,3 @@ async def get_cost_breakdown(
         "by_region": by_region,
     }
 
-
-async def delete_resources_by_scan(db: AsyncSession, scan_id: uuid.UUID) -> int:
-    """
-    Delete all resources for a specific scan.
-
-    Args:
-        db: Database session
-        scan_id: Scan UUID
-
-    Returns:
-        Number of deleted resources
-    """
-    result = await db.execute(
-        select(AllCloudResource).where(AllCloudResource.scan_id == scan_id)
-    )
-    resources = result.scalars().all()
-    count = len(resources)
-
-    for resource in resources:
-        await db.delete(resource)
-
-    await db.commit()
-    return count
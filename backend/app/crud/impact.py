@@ -1,13 +1,14 @@
 """CRUD operations for Impact dashboard and environmental calculations."""
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Literal
 
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cloud_account import CloudAccount
+from app.models.impact_rollup import ImpactRollup
 from app.models.orphan_resource import OrphanResource, ResourceStatus
 from app.models.scan import Scan
 from app.schemas.impact import (
@@ -160,33 +161,37 @@ def _get_power_consumption(resource_type: str) -> float:
     return RESOURCE_POWER_CONSUMPTION.get(resource_type, RESOURCE_POWER_CONSUMPTION["default"])
 
 
-def _calculate_co2_for_resource(
-    resource: OrphanResource,
+def _calculate_co2(
     provider: str,
+    region: str,
+    resource_type: str,
+    resource_count: int = 1,
     months_saved: float = 1.0,
 ) -> float:
     """
-    Calculate CO2 emissions saved (kg) by deleting a resource.
+    Calculate CO2 emissions saved (kg) by deleting resources of one type and region.
 
     Args:
-        resource: OrphanResource object
         provider: Cloud provider ('aws', 'azure')
+        region: Region of the resources
+        resource_type: Type of the resources
+        resource_count: Number of resources deleted (default: 1)
         months_saved: Number of months to calculate for (default: 1 month)
 
     Returns:
         CO2 emissions saved in kilograms
     """
     # Get carbon intensity for this region
-    carbon_intensity = _get_carbon_intensity(provider, resource.region)
+    carbon_intensity = _get_carbon_intensity(provider, region)
 
     # Get power consumption for this resource type
-    power_consumption_kwh = _get_power_consumption(resource.resource_type)
+    power_consumption_kwh = _get_power_consumption(resource_type)
 
     # Calculate total hours
     hours = months_saved * 30 * 24  # months * days * hours
 
-    # CO2 = hours * kWh/hour * kg CO2/kWh
-    co2_kg = hours * power_consumption_kwh * carbon_intensity
+    # CO2 = resources * hours * kWh/hour * kg CO2/kWh
+    co2_kg = resource_count * hours * power_consumption_kwh * carbon_intensity
 
     return round(co2_kg, 2)
 
@@ -244,7 +249,9 @@ async def get_impact_summary(
     Get comprehensive impact summary for a user.
 
     Calculates financial savings, environmental impact, and engagement metrics
-    across all user's cloud accounts and orphan resources.
+    across all user's cloud accounts from the impact rollups, grouped down to
+    (provider, status, type, region) in SQL, so the cost does not grow with
+    scan history.
 
     Args:
         db: Database session
@@ -255,121 +262,115 @@ async def get_impact_summary(
     """
     # Get all cloud accounts for this user
     accounts_result = await db.execute(
-        select(CloudAccount).where(CloudAccount.user_id == user_id)
+        select(CloudAccount.id).where(CloudAccount.user_id == user_id)
     )
-    accounts = list(accounts_result.scalars().all())
-    account_ids = [account.id for account in accounts]
+    account_ids = list(accounts_result.scalars().all())
 
     if not account_ids:
         # Return empty summary
         return _create_empty_impact_summary()
 
-    # Get all orphan resources across all accounts
-    resources_result = await db.execute(
-        select(OrphanResource).where(OrphanResource.cloud_account_id.in_(account_ids))
+    rollups_result = await db.execute(
+        select(
+            ImpactRollup.provider,
+            ImpactRollup.status,
+            ImpactRollup.resource_type,
+            ImpactRollup.region,
+            func.sum(ImpactRollup.resource_count).label("resource_count"),
+            func.sum(ImpactRollup.monthly_cost).label("monthly_cost"),
+            func.sum(ImpactRollup.wasted_cost).label("wasted_cost"),
+            func.max(ImpactRollup.last_changed_at).label("last_changed_at"),
+        )
+        .where(ImpactRollup.user_id == user_id)
+        .group_by(
+            ImpactRollup.provider,
+            ImpactRollup.status,
+            ImpactRollup.resource_type,
+            ImpactRollup.region,
+        )
     )
-    all_resources = list(resources_result.scalars().all())
-
-    # Group resources by status
-    active_resources = [r for r in all_resources if r.status == ResourceStatus.ACTIVE.value]
-    deleted_resources = [r for r in all_resources if r.status == ResourceStatus.DELETED.value]
-    ignored_resources = [r for r in all_resources if r.status == ResourceStatus.IGNORED.value]
-    marked_resources = [
-        r for r in all_resources if r.status == ResourceStatus.MARKED_FOR_DELETION.value
-    ]
-
-    # Financial calculations
-    total_monthly_savings = sum(r.estimated_monthly_cost for r in deleted_resources)
-    total_annual_savings = total_monthly_savings * 12
-    potential_monthly_savings = sum(r.estimated_monthly_cost for r in active_resources)
 
-    # Calculate "already wasted" - money wasted before detection
+    resources_by_status: dict[str, int] = {}
+    monthly_cost_by_status: dict[str, float] = {}
     already_wasted_total = 0.0
-    for resource in all_resources:
-        if resource.resource_metadata and "age_days" in resource.resource_metadata:
-            age_days = resource.resource_metadata["age_days"]
-            daily_cost = resource.estimated_monthly_cost / 30
-            already_wasted_total += age_days * daily_cost
-
-    # Environmental impact - only for deleted resources
     total_co2_saved_kg = 0.0
     co2_by_provider: dict[str, float] = {}
+    savings_by_provider: dict[str, float] = {}
+    savings_by_resource_type: dict[str, float] = {}
+    resources_by_resource_type: dict[str, int] = {}
+    last_cleanup_date = None
 
-    for resource in deleted_resources:
-        # Find the provider for this resource
-        provider = "aws"  # Default
-        for account in accounts:
-            if account.id == resource.cloud_account_id:
-                provider = account.provider
-                break
+    for row in rollups_result.all():
+        resources_by_status[row.status] = (
+            resources_by_status.get(row.status, 0) + row.resource_count
+        )
+        monthly_cost_by_status[row.status] = (
+            monthly_cost_by_status.get(row.status, 0.0) + row.monthly_cost
+        )
+
+        # "Already wasted" - money wasted before detection
+        already_wasted_total += row.wasted_cost
 
-        co2 = _calculate_co2_for_resource(resource, provider, months_saved=1.0)
+        if row.status != ResourceStatus.DELETED.value:
+            continue
+
+        # Environmental impact - only for deleted resources
+        co2 = _calculate_co2(
+            row.provider, row.region, row.resource_type, row.resource_count, months_saved=1.0
+        )
         total_co2_saved_kg += co2
+        co2_by_provider[row.provider] = co2_by_provider.get(row.provider, 0.0) + co2
 
-        # Accumulate by provider
-        co2_by_provider[provider] = co2_by_provider.get(provider, 0.0) + co2
+        # Savings breakdown by provider and resource type
+        savings_by_provider[row.provider] = (
+            savings_by_provider.get(row.provider, 0.0) + row.monthly_cost
+        )
+        savings_by_resource_type[row.resource_type] = (
+            savings_by_resource_type.get(row.resource_type, 0.0) + row.monthly_cost
+        )
+        resources_by_resource_type[row.resource_type] = (
+            resources_by_resource_type.get(row.resource_type, 0) + row.resource_count
+        )
+
+        if row.last_changed_at and (
+            last_cleanup_date is None or row.last_changed_at > last_cleanup_date
+        ):
+            last_cleanup_date = row.last_changed_at
+
+    # Financial calculations
+    total_monthly_savings = monthly_cost_by_status.get(ResourceStatus.DELETED.value, 0.0)
+    total_annual_savings = total_monthly_savings * 12
+    potential_monthly_savings = monthly_cost_by_status.get(ResourceStatus.ACTIVE.value, 0.0)
 
     # Environmental equivalents
     trees_equivalent = _calculate_trees_equivalent(total_co2_saved_kg)
     car_km_equivalent = _calculate_car_km_equivalent(total_co2_saved_kg)
     home_days_equivalent = _calculate_home_days_equivalent(total_co2_saved_kg)
 
-    # Savings breakdown by provider
-    savings_by_provider: dict[str, float] = {}
-    for resource in deleted_resources:
-        provider = "aws"
-        for account in accounts:
-            if account.id == resource.cloud_account_id:
-                provider = account.provider
-                break
-        savings_by_provider[provider] = (
-            savings_by_provider.get(provider, 0.0) + resource.estimated_monthly_cost
-        )
-
-    # Savings breakdown by resource type
-    savings_by_resource_type: dict[str, float] = {}
-    resources_by_resource_type: dict[str, int] = {}
-
-    for resource in deleted_resources:
-        rt = resource.resource_type
-        savings_by_resource_type[rt] = (
-            savings_by_resource_type.get(rt, 0.0) + resource.estimated_monthly_cost
-        )
-        resources_by_resource_type[rt] = resources_by_resource_type.get(rt, 0) + 1
-
     # User engagement metrics
-    total_detected = len(all_resources)
-    total_deleted = len(deleted_resources)
+    total_detected = sum(resources_by_status.values())
+    total_deleted = resources_by_status.get(ResourceStatus.DELETED.value, 0)
     cleanup_rate = total_deleted / total_detected if total_detected > 0 else 0.0
 
     # Get first scan date
     first_scan_result = await db.execute(
-        select(Scan)
-        .where(Scan.cloud_account_id.in_(account_ids))
-        .order_by(Scan.created_at.asc())
-        .limit(1)
+        select(func.min(Scan.created_at)).where(Scan.cloud_account_id.in_(account_ids))
     )
-    first_scan = first_scan_result.scalar_one_or_none()
-    first_scan_date = first_scan.created_at if first_scan else None
+    first_scan_date = first_scan_result.scalar_one_or_none()
 
     days_since_first_scan = 0
     if first_scan_date:
         days_since_first_scan = (datetime.utcnow() - first_scan_date).days
 
-    # Get last cleanup date
-    last_cleanup_date = None
-    if deleted_resources:
-        last_cleanup_date = max(r.updated_at for r in deleted_resources)
-
     # Calculate cleanup streak
-    cleanup_streak_days = await _calculate_cleanup_streak(db, account_ids)
+    cleanup_streak_days = await _calculate_cleanup_streak(db, user_id)
 
     return ImpactSummary(
         # Financial
         total_resources_detected=total_detected,
         total_resources_deleted=total_deleted,
-        total_resources_active=len(active_resources),
-        total_resources_ignored=len(ignored_resources),
+        total_resources_active=resources_by_status.get(ResourceStatus.ACTIVE.value, 0),
+        total_resources_ignored=resources_by_status.get(ResourceStatus.IGNORED.value, 0),
         total_monthly_savings=round(total_monthly_savings, 2),
         total_annual_savings=round(total_annual_savings, 2),
         potential_monthly_savings=round(potential_monthly_savings, 2),
@@ -395,39 +396,34 @@ async def get_impact_summary(
 
 async def _calculate_cleanup_streak(
     db: AsyncSession,
-    account_ids: list[uuid.UUID],
+    user_id: uuid.UUID,
 ) -> int:
     """
     Calculate consecutive days with at least one resource deletion.
 
     Args:
         db: Database session
-        account_ids: List of cloud account IDs
+        user_id: User UUID
 
     Returns:
         Number of consecutive days with cleanup activity
     """
-    # Get all deleted resources ordered by updated_at desc
+    # Get unique cleanup dates (day granularity)
     result = await db.execute(
-        select(OrphanResource)
+        select(ImpactRollup.changed_on)
         .where(
             and_(
-                OrphanResource.cloud_account_id.in_(account_ids),
-                OrphanResource.status == ResourceStatus.DELETED.value,
+                ImpactRollup.user_id == user_id,
+                ImpactRollup.status == ResourceStatus.DELETED.value,
             )
         )
-        .order_by(OrphanResource.updated_at.desc())
+        .distinct()
     )
-    deleted_resources = list(result.scalars().all())
+    cleanup_dates = set(result.scalars().all())
 
-    if not deleted_resources:
+    if not cleanup_dates:
         return 0
 
-    # Get unique dates (day granularity)
-    cleanup_dates = set()
-    for resource in deleted_resources:
-        cleanup_dates.add(resource.updated_at.date())
-
     # Sort dates descending
     sorted_dates = sorted(cleanup_dates, reverse=True)
 
@@ -481,7 +477,8 @@ async def get_impact_timeline(
     """
     Get timeline data for impact charts.
 
-    Groups resources by time periods and calculates cumulative savings.
+    Groups the daily impact rollups by time periods and calculates
+    cumulative savings.
 
     Args:
         db: Database session
@@ -491,63 +488,53 @@ async def get_impact_timeline(
     Returns:
         ImpactTimeline with data points grouped by period
     """
-    # Get all cloud accounts
-    accounts_result = await db.execute(
-        select(CloudAccount).where(CloudAccount.user_id == user_id)
-    )
-    accounts = list(accounts_result.scalars().all())
-    account_ids = [account.id for account in accounts]
-
-    if not account_ids:
-        return ImpactTimeline(period=period, data_points=[], summary={})
-
-    # Get all resources
-    resources_result = await db.execute(
-        select(OrphanResource).where(OrphanResource.cloud_account_id.in_(account_ids))
+    rollups_result = await db.execute(
+        select(
+            ImpactRollup.provider,
+            ImpactRollup.status,
+            ImpactRollup.resource_type,
+            ImpactRollup.region,
+            ImpactRollup.detected_on,
+            ImpactRollup.changed_on,
+            func.sum(ImpactRollup.resource_count).label("resource_count"),
+            func.sum(ImpactRollup.monthly_cost).label("monthly_cost"),
+        )
+        .where(ImpactRollup.user_id == user_id)
+        .group_by(
+            ImpactRollup.provider,
+            ImpactRollup.status,
+            ImpactRollup.resource_type,
+            ImpactRollup.region,
+            ImpactRollup.detected_on,
+            ImpactRollup.changed_on,
+        )
     )
-    all_resources = list(resources_result.scalars().all())
 
     # Group by time period
     data_by_period: dict[datetime, dict] = {}
 
-    for resource in all_resources:
-        # Use created_at for detection, updated_at for deletion
-        detection_date = _truncate_to_period(resource.created_at, period)
-
-        if detection_date not in data_by_period:
-            data_by_period[detection_date] = {
+    def period_data(day: date) -> dict:
+        period_date = _truncate_to_period(datetime.combine(day, time.min), period)
+        if period_date not in data_by_period:
+            data_by_period[period_date] = {
                 "resources_detected": 0,
                 "resources_deleted": 0,
                 "monthly_savings": 0.0,
                 "co2_saved_kg": 0.0,
             }
-
-        data_by_period[detection_date]["resources_detected"] += 1
-
-        # If deleted, add to deletion stats
-        if resource.status == ResourceStatus.DELETED.value:
-            deletion_date = _truncate_to_period(resource.updated_at, period)
-
-            if deletion_date not in data_by_period:
-                data_by_period[deletion_date] = {
-                    "resources_detected": 0,
-                    "resources_deleted": 0,
-                    "monthly_savings": 0.0,
-                    "co2_saved_kg": 0.0,
-                }
-
-            data_by_period[deletion_date]["resources_deleted"] += 1
-            data_by_period[deletion_date]["monthly_savings"] += resource.estimated_monthly_cost
-
-            # Calculate CO2
-            provider = "aws"
-            for account in accounts:
-                if account.id == resource.cloud_account_id:
-                    provider = account.provider
-                    break
-
-            co2 = _calculate_co2_for_resource(resource, provider, months_saved=1.0)
-            data_by_period[deletion_date]["co2_saved_kg"] += co2
+        return data_by_period[period_date]
+
+    for row in rollups_result.all():
+        # Detection day for detections, last status change for deletions
+        period_data(row.detected_on)["resources_detected"] += row.resource_count
+
+        if row.status == ResourceStatus.DELETED.value:
+            deletion_data = period_data(row.changed_on)
+            deletion_data["resources_deleted"] += row.resource_count
+            deletion_data["monthly_savings"] += row.monthly_cost
+            deletion_data["co2_saved_kg"] += _calculate_co2(
+                row.provider, row.region, row.resource_type, row.resource_count, months_saved=1.0
+            )
 
     # Sort periods
     sorted_periods = sorted(data_by_period.keys())
@@ -642,40 +629,31 @@ async def get_user_achievements(
     # Get impact summary for calculations
     summary = await get_impact_summary(db, user_id)
 
-    # Get all cloud accounts
-    accounts_result = await db.execute(
-        select(CloudAccount).where(CloudAccount.user_id == user_id)
-    )
-    account_ids = [account.id for account in accounts_result.scalars().all()]
-
-    # Get all deleted resources to check for speed records
-    deleted_resources = []
-    if account_ids:
-        result = await db.execute(
-            select(OrphanResource).where(
-                and_(
-                    OrphanResource.cloud_account_id.in_(account_ids),
-                    OrphanResource.status == ResourceStatus.DELETED.value,
-                )
+    # Fastest cleanup
+    fastest_result = await db.execute(
+        select(func.min(ImpactRollup.min_cleanup_hours)).where(
+            and_(
+                ImpactRollup.user_id == user_id,
+                ImpactRollup.status == ResourceStatus.DELETED.value,
             )
         )
-        deleted_resources = list(result.scalars().all())
+    )
+    fastest_cleanup_hours = fastest_result.scalar_one_or_none()
 
-    # Calculate fastest cleanup
-    fastest_cleanup_hours = None
-    if deleted_resources:
-        for resource in deleted_resources:
-            hours = (resource.updated_at - resource.created_at).total_seconds() / 3600
-            if fastest_cleanup_hours is None or hours < fastest_cleanup_hours:
-                fastest_cleanup_hours = hours
-
-    # Count resources deleted in last 24 hours
-    resources_deleted_24h = 0
+    # Count resources deleted in last 24 hours (rollups only have day granularity)
     cutoff = datetime.utcnow() - timedelta(hours=24)
-    for resource in deleted_resources:
-        if resource.updated_at >= cutoff:
-            resources_deleted_24h += 1
-
+    deleted_24h_result = await db.execute(
+        select(func.count(OrphanResource.id))
+        .join(CloudAccount, OrphanResource.cloud_account_id == CloudAccount.id)
+        .where(
+            and_(
+                CloudAccount.user_id == user_id,
+                OrphanResource.status == ResourceStatus.DELETED.value,
+                OrphanResource.updated_at >= cutoff,
+            )
+        )
+    )
+    resources_deleted_24h = deleted_24h_result.scalar_one()
     # Define achievements
     achievements_config = [
         {
@@ -822,68 +800,54 @@ async def get_quick_stats(
     Returns:
         QuickStats with interesting metrics
     """
-    # Get all cloud accounts
-    accounts_result = await db.execute(
-        select(CloudAccount).where(CloudAccount.user_id == user_id)
-    )
-    account_ids = [account.id for account in accounts_result.scalars().all()]
-
-    if not account_ids:
-        return _create_empty_quick_stats()
-
-    # Get all resources
-    resources_result = await db.execute(
-        select(OrphanResource).where(OrphanResource.cloud_account_id.in_(account_ids))
+    rollups_result = await db.execute(
+        select(
+            ImpactRollup.resource_type,
+            ImpactRollup.region,
+            ImpactRollup.status,
+            func.sum(ImpactRollup.resource_count).label("resource_count"),
+            func.sum(ImpactRollup.age_days_total).label("age_days_total"),
+            func.sum(ImpactRollup.age_days_count).label("age_days_count"),
+            func.max(ImpactRollup.max_monthly_cost).label("max_monthly_cost"),
+            func.min(ImpactRollup.min_cleanup_hours).label("min_cleanup_hours"),
+        )
+        .where(ImpactRollup.user_id == user_id)
+        .group_by(ImpactRollup.resource_type, ImpactRollup.region, ImpactRollup.status)
     )
-    all_resources = list(resources_result.scalars().all())
+    rollups = [row for row in rollups_result.all() if row.resource_count > 0]
 
-    if not all_resources:
+    if not rollups:
         return _create_empty_quick_stats()
 
     # Biggest cleanup
-    biggest_cleanup = max(all_resources, key=lambda r: r.estimated_monthly_cost)
-    biggest_cleanup_monthly_cost = biggest_cleanup.estimated_monthly_cost
+    biggest_cleanup = max(rollups, key=lambda r: r.max_monthly_cost)
+    biggest_cleanup_monthly_cost = biggest_cleanup.max_monthly_cost
     biggest_cleanup_resource_type = biggest_cleanup.resource_type
 
-    # Most common resource type
     type_counts: dict[str, int] = {}
-    for resource in all_resources:
-        type_counts[resource.resource_type] = type_counts.get(resource.resource_type, 0) + 1
+    region_counts: dict[str, int] = {}
+    fastest_cleanup_hours = None
+    total_age_days = 0.0
+    age_count = 0
 
-    most_common_resource_type = None
-    most_common_resource_count = 0
-    if type_counts:
-        most_common_resource_type = max(type_counts, key=type_counts.get)  # type: ignore
-        most_common_resource_count = type_counts[most_common_resource_type]
+    for row in rollups:
+        type_counts[row.resource_type] = type_counts.get(row.resource_type, 0) + row.resource_count
+        region_counts[row.region] = region_counts.get(row.region, 0) + row.resource_count
+        total_age_days += row.age_days_total
+        age_count += row.age_days_count
+        if row.status == ResourceStatus.DELETED.value and row.min_cleanup_hours is not None:
+            if fastest_cleanup_hours is None or row.min_cleanup_hours < fastest_cleanup_hours:
+                fastest_cleanup_hours = row.min_cleanup_hours
 
-    # Fastest cleanup
-    deleted_resources = [r for r in all_resources if r.status == ResourceStatus.DELETED.value]
-    fastest_cleanup_hours = None
-    if deleted_resources:
-        for resource in deleted_resources:
-            hours = (resource.updated_at - resource.created_at).total_seconds() / 3600
-            if fastest_cleanup_hours is None or hours < fastest_cleanup_hours:
-                fastest_cleanup_hours = hours
+    # Most common resource type
+    most_common_resource_type = max(type_counts, key=type_counts.get)  # type: ignore
+    most_common_resource_count = type_counts[most_common_resource_type]
 
     # Top region
-    region_counts: dict[str, int] = {}
-    for resource in all_resources:
-        region_counts[resource.region] = region_counts.get(resource.region, 0) + 1
-
-    top_region = None
-    top_region_count = 0
-    if region_counts:
-        top_region = max(region_counts, key=region_counts.get)  # type: ignore
-        top_region_count = region_counts[top_region]
+    top_region = max(region_counts, key=region_counts.get)  # type: ignore
+    top_region_count = region_counts[top_region]
 
     # Average resource age
-    total_age_days = 0.0
-    age_count = 0
-    for resource in all_resources:
-        if resource.resource_metadata and "age_days" in resource.resource_metadata:
-            total_age_days += resource.resource_metadata["age_days"]
-            age_count += 1
-
     average_resource_age_days = total_age_days / age_count if age_count > 0 else 0.0
 
     return QuickStats(
@@ -0,0 +1,327 @@
+"""CRUD operations for the pre-aggregated impact rollups."""
+
+import uuid
+from datetime import date, datetime
+from typing import Any, Iterable
+
+from sqlalchemy import case, delete, or_, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.cloud_account import CloudAccount
+from app.models.impact_rollup import ImpactRollup
+from app.models.orphan_resource import OrphanResource, ResourceStatus
+
+# Columns of an orphan resource that feed the rollups
+ROLLUP_SOURCE_COLUMNS = (
+    "resource_type",
+    "region",
+    "status",
+    "estimated_monthly_cost",
+    "resource_metadata",
+    "created_at",
+    "updated_at",
+)
+
+# Columns identifying a rollup row (besides user/account/provider)
+ROLLUP_KEY_COLUMNS = ("resource_type", "region", "status", "detected_on", "changed_on")
+
+RollupKey = tuple[str, str, str, Any, Any]
+
+# Aggregates that can be subtracted again (extremes cannot, see _accumulate)
+ADDITIVE_COLUMNS = (
+    "resource_count",
+    "monthly_cost",
+    "wasted_cost",
+    "age_days_total",
+    "age_days_count",
+)
+
+
+def resource_values(resource: OrphanResource) -> dict[str, Any]:
+    """Snapshot the rollup-relevant columns of an orphan resource."""
+    return {column: getattr(resource, column) for column in ROLLUP_SOURCE_COLUMNS}
+
+
+def _empty_aggregates() -> dict[str, Any]:
+    """Aggregates of a rollup row without resources."""
+    return {
+        "resource_count": 0,
+        "monthly_cost": 0.0,
+        "wasted_cost": 0.0,
+        "age_days_total": 0.0,
+        "age_days_count": 0,
+        "max_monthly_cost": 0.0,
+        "min_cleanup_hours": None,
+        "last_changed_at": None,
+    }
+
+
+def _accumulate(
+    rollups: dict[RollupKey, dict[str, Any]], resource: dict[str, Any], sign: int = 1
+) -> None:
+    """
+    Add (sign=1) or subtract (sign=-1) one resource to the rollup deltas.
+
+    Rows inserted in bulk may lack status/created_at/updated_at (server
+    defaults): they count as active resources detected now.
+    """
+    now = datetime.utcnow()
+    status = resource.get("status") or ResourceStatus.ACTIVE.value
+    created_at = resource.get("created_at") or now
+    updated_at = resource.get("updated_at") or created_at
+    cost = resource.get("estimated_monthly_cost") or 0.0
+
+    key = (
+        resource["resource_type"],
+        resource["region"],
+        status,
+        created_at.date(),
+        updated_at.date(),
+    )
+    aggregates = rollups.setdefault(key, _empty_aggregates())
+
+    aggregates["resource_count"] += sign
+    aggregates["monthly_cost"] += sign * cost
+
+    metadata = resource.get("resource_metadata") or {}
+    age_days = metadata.get("age_days")
+    if isinstance(age_days, (int, float)):
+        aggregates["wasted_cost"] += sign * age_days * cost / 30
+        aggregates["age_days_total"] += sign * age_days
+        aggregates["age_days_count"] += sign
+
+    # Extremes can only be raised/lowered, never subtracted
+    if sign < 0:
+        return
+    aggregates["max_monthly_cost"] = max(aggregates["max_monthly_cost"], cost)
+    if status == ResourceStatus.DELETED.value:
+        hours = (updated_at - created_at).total_seconds() / 3600
+        if aggregates["min_cleanup_hours"] is None or hours < aggregates["min_cleanup_hours"]:
+            aggregates["min_cleanup_hours"] = hours
+    if aggregates["last_changed_at"] is None or updated_at > aggregates["last_changed_at"]:
+        aggregates["last_changed_at"] = updated_at
+
+
+def _upsert_statement(db: AsyncSession, rows: list[dict[str, Any]]):
+    """INSERT ... ON CONFLICT (rollup key) DO UPDATE adding the deltas, for the session's dialect."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(ImpactRollup).values(rows)
+    current = ImpactRollup.__table__.c
+    new = stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            ImpactRollup.cloud_account_id,
+            *(getattr(ImpactRollup, column) for column in ROLLUP_KEY_COLUMNS),
+        ],
+        set_={
+            "resource_count": current.resource_count + new.resource_count,
+            "monthly_cost": current.monthly_cost + new.monthly_cost,
+            "wasted_cost": current.wasted_cost + new.wasted_cost,
+            "age_days_total": current.age_days_total + new.age_days_total,
+            "age_days_count": current.age_days_count + new.age_days_count,
+            "max_monthly_cost": case(
+                (new.max_monthly_cost > current.max_monthly_cost, new.max_monthly_cost),
+                else_=current.max_monthly_cost,
+            ),
+            "min_cleanup_hours": case(
+                (
+                    or_(
+                        current.min_cleanup_hours.is_(None),
+                        new.min_cleanup_hours < current.min_cleanup_hours,
+                    ),
+                    new.min_cleanup_hours,
+                ),
+                else_=current.min_cleanup_hours,
+            ),
+            "last_changed_at": case(
+                (
+                    or_(
+                        current.last_changed_at.is_(None),
+                        new.last_changed_at > current.last_changed_at,
+                    ),
+                    new.last_changed_at,
+                ),
+                else_=current.last_changed_at,
+            ),
+        },
+    )
+
+
+async def _write_deltas(
+    db: AsyncSession,
+    cloud_account_id: uuid.UUID,
+    rollups: dict[RollupKey, dict[str, Any]],
+    chunk_size: int = 1000,
+    commit: bool = True,
+) -> None:
+    """Upsert rollup deltas of an account, drop rows left without resources and commit."""
+    if rollups:
+        result = await db.execute(
+            select(CloudAccount.user_id, CloudAccount.provider).where(
+                CloudAccount.id == cloud_account_id
+            )
+        )
+        account = result.one_or_none()
+        if account is not None:
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "user_id": account.user_id,
+                    "cloud_account_id": cloud_account_id,
+                    "provider": account.provider,
+                    **dict(zip(ROLLUP_KEY_COLUMNS, key)),
+                    **aggregates,
+                }
+                for key, aggregates in rollups.items()
+            ]
+            for start in range(0, len(rows), chunk_size):
+                await db.execute(_upsert_statement(db, rows[start : start + chunk_size]))
+            await db.execute(
+                delete(ImpactRollup).where(
+                    ImpactRollup.cloud_account_id == cloud_account_id,
+                    ImpactRollup.resource_count <= 0,
+                )
+            )
+    if commit:
+        await db.commit()
+
+
+async def apply_resource_changes(
+    db: AsyncSession,
+    cloud_account_id: uuid.UUID,
+    added: Iterable[dict[str, Any]] = (),
+    removed: Iterable[dict[str, Any]] = (),
+    commit: bool = True,
+) -> None:
+    """
+    Update the rollups of an account for added and removed orphan resources.
+
+    A status change is the removal of the old values plus the addition of
+    the new ones (see `resource_values`).
+
+    Args:
+        db: Database session
+        cloud_account_id: Cloud account the resources belong to
+        added: Column values of new resources (rows inserted by a scan, ...)
+        removed: Column values of deleted resources
+        commit: Commit the update (False: left to the caller's transaction)
+    """
+    rollups: dict[RollupKey, dict[str, Any]] = {}
+    for resource in removed:
+        _accumulate(rollups, resource, sign=-1)
+    for resource in added:
+        _accumulate(rollups, resource)
+    await _write_deltas(db, cloud_account_id, rollups, commit=commit)
+
+
+async def summarize_scan_rollups(
+    db: AsyncSession, scan_ids: list[uuid.UUID], batch_size: int = 5000
+) -> dict[uuid.UUID, list[dict[str, Any]]]:
+    """
+    Rollup contributions of the orphan resources of scans, as JSON-ready rows.
+
+    Compaction (app.crud.scan_retention) stores them in the scan summaries,
+    so a compacted scan's resources can still be subtracted from the
+    rollups when the scan is deleted (see `subtract_scan_rollups`).
+
+    Args:
+        db: Database session
+        scan_ids: Scan UUIDs
+        batch_size: Rows fetched per round trip
+
+    Returns:
+        Dict of scan UUID -> rollup key columns and additive aggregates per rollup row
+    """
+    rollups: dict[uuid.UUID, dict[RollupKey, dict[str, Any]]] = {
+        scan_id: {} for scan_id in scan_ids
+    }
+    result = await db.stream(
+        select(
+            OrphanResource.scan_id,
+            *(getattr(OrphanResource, column) for column in ROLLUP_SOURCE_COLUMNS),
+        ).where(OrphanResource.scan_id.in_(scan_ids))
+    )
+    async for partition in result.partitions(batch_size):
+        for row in partition:
+            resource = row._asdict()
+            _accumulate(rollups[resource.pop("scan_id")], resource)
+
+    return {
+        scan_id: [
+            {
+                **dict(zip(ROLLUP_KEY_COLUMNS, key[:3])),
+                "detected_on": key[3].isoformat(),
+                "changed_on": key[4].isoformat(),
+                **{column: aggregates[column] for column in ADDITIVE_COLUMNS},
+            }
+            for key, aggregates in scan_rollups.items()
+        ]
+        for scan_id, scan_rollups in rollups.items()
+    }
+
+
+async def subtract_scan_rollups(
+    db: AsyncSession, cloud_account_id: uuid.UUID, contributions: Iterable[dict[str, Any]]
+) -> None:
+    """
+    Subtract contributions recorded by `summarize_scan_rollups` from the rollups of an account.
+
+    Args:
+        db: Database session
+        cloud_account_id: Cloud account the scan belongs to
+        contributions: Rollup rows of the scan (e.g., from a compacted scan's summary)
+    """
+    rollups: dict[RollupKey, dict[str, Any]] = {}
+    for contribution in contributions:
+        key = (
+            contribution["resource_type"],
+            contribution["region"],
+            contribution["status"],
+            date.fromisoformat(contribution["detected_on"]),
+            date.fromisoformat(contribution["changed_on"]),
+        )
+        aggregates = rollups.setdefault(key, _empty_aggregates())
+        for column in ADDITIVE_COLUMNS:
+            aggregates[column] -= contribution[column]
+    await _write_deltas(db, cloud_account_id, rollups)
+
+
+async def rebuild_account_rollups(
+    db: AsyncSession, cloud_account_id: uuid.UUID, batch_size: int = 5000
+) -> None:
+    """
+    Recompute the rollups of an account from its orphan resources.
+
+    Used to backfill existing accounts. Only the rollup columns are
+    streamed, never ORM objects. Resources of scans compacted by the
+    retention job (app.crud.scan_retention) are gone, so a rebuild drops
+    their history from the rollups.
+
+    Args:
+        db: Database session
+        cloud_account_id: Cloud account UUID
+        batch_size: Rows fetched per round trip
+    """
+    rollups: dict[RollupKey, dict[str, Any]] = {}
+    result = await db.stream(
+        select(*(getattr(OrphanResource, column) for column in ROLLUP_SOURCE_COLUMNS)).where(
+            OrphanResource.cloud_account_id == cloud_account_id
+        )
+    )
+    async for partition in result.partitions(batch_size):
+        for row in partition:
+            _accumulate(rollups, row._asdict())
+
+    # Replaced in the same transaction, readers never see the account empty
+    await db.execute(
+        delete(ImpactRollup).where(ImpactRollup.cloud_account_id == cloud_account_id)
+    )
+    await _write_deltas(db, cloud_account_id, rollups)
+
+
+async def rebuild_user_rollups(db: AsyncSession, user_id: uuid.UUID) -> None:
+    """Recompute the rollups of every cloud account of a user."""
+    result = await db.execute(select(CloudAccount.id).where(CloudAccount.user_id == user_id))
+    for cloud_account_id in result.scalars().all():
+        await rebuild_account_rollups(db, cloud_account_id)
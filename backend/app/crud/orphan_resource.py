@@ -3,9 +3,12 @@
 import uuid
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, insert, literal_column, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 
+from app.crud import impact_rollup as impact_rollup_crud
+from app.crud.pagination import DEFAULT_SORT, apply_keyset
 from app.models.orphan_resource import OrphanResource, ResourceStatus
 from app.schemas.orphan_resource import OrphanResourceCreate, OrphanResourceUpdate
 
@@ -27,9 +30,87 @@ async def create_orphan_resource(
     db.add(resource)
     await db.commit()
     await db.refresh(resource)
+    await impact_rollup_crud.apply_resource_changes(
+        db, resource.cloud_account_id, added=[impact_rollup_crud.resource_values(resource)]
+    )
     return resource
 
 
+async def bulk_insert_orphan_resources(
+    db: AsyncSession, rows: list[dict[str, Any]], chunk_size: int = 1000, commit: bool = True
+) -> int:
+    """
+    Insert many orphan resources without building ORM objects.
+
+    Rows are sent with executemany INSERTs (batched into multi-row VALUES by
+    the driver) and committed chunk by chunk, so large scans neither hold a
+    big identity map nor pay a per-object flush. The impact rollups of the
+    accounts are updated once all rows are in.
+
+    Args:
+        db: Database session
+        rows: Column values per orphan resource (scan_id, cloud_account_id, resource_type, ...)
+        chunk_size: Rows per INSERT statement and transaction
+        commit: Commit each chunk (False: every row left to the caller's transaction)
+
+    Returns:
+        Number of rows inserted
+    """
+    # Stored values (server-side defaults included) of the rollup columns
+    statement = insert(OrphanResource).returning(
+        OrphanResource.cloud_account_id,
+        *(getattr(OrphanResource, column) for column in impact_rollup_crud.ROLLUP_SOURCE_COLUMNS),
+    )
+    added_by_account: dict[uuid.UUID, list[dict[str, Any]]] = {}
+    for start in range(0, len(rows), chunk_size):
+        result = await db.execute(statement, rows[start : start + chunk_size])
+        for row in result.mappings().all():
+            added_by_account.setdefault(row["cloud_account_id"], []).append(dict(row))
+        if commit:
+            await db.commit()
+
+    for cloud_account_id, added in added_by_account.items():
+        await impact_rollup_crud.apply_resource_changes(
+            db, cloud_account_id, added=added, commit=commit
+        )
+    return len(rows)
+
+
+async def delete_orphan_resources_by_scan(db: AsyncSession, scan_id: uuid.UUID) -> int:
+    """
+    Delete all orphan resources of a scan in one statement.
+
+    The deleted rows' rollup columns are returned by the DELETE itself and
+    subtracted from the impact rollups.
+
+    Args:
+        db: Database session
+        scan_id: Scan UUID
+
+    Returns:
+        Number of rows deleted
+    """
+    result = await db.execute(
+        delete(OrphanResource)
+        .where(OrphanResource.scan_id == scan_id)
+        .returning(
+            OrphanResource.cloud_account_id,
+            *(
+                getattr(OrphanResource, column)
+                for column in impact_rollup_crud.ROLLUP_SOURCE_COLUMNS
+            ),
+        )
+    )
+    removed_by_account: dict[uuid.UUID, list[dict[str, Any]]] = {}
+    for row in result.mappings().all():
+        removed_by_account.setdefault(row["cloud_account_id"], []).append(dict(row))
+    await db.commit()
+
+    for cloud_account_id, removed in removed_by_account.items():
+        await impact_rollup_crud.apply_resource_changes(db, cloud_account_id, removed=removed)
+    return sum(len(removed) for removed in removed_by_account.values())
+
+
 async def get_orphan_resource_by_id(
     db: AsyncSession, resource_id: uuid.UUID
 ) -> OrphanResource | None:
@@ -76,6 +157,54 @@ async def get_orphan_resources_by_scan(
     return list(result.scalars().all())
 
 
+def latest_orphan_resources_query(
+    user_id: uuid.UUID | None = None,
+    cloud_account_id: uuid.UUID | None = None,
+    status: ResourceStatus | None = None,
+    resource_type: str | None = None,
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
+) -> Select:
+    """
+    Build the listing of resources from the latest completed scan of each account.
+
+    Args:
+        user_id: Optional user UUID to filter by (SECURITY: prevents data leaks)
+        cloud_account_id: Optional cloud account UUID to filter by
+        status: Optional status filter
+        resource_type: Optional resource type filter
+        sort: Sort key: cost (descending), type or region
+        cursor: Cursor of the previous page (keyset pagination)
+
+    Returns:
+        Select of orphan resources in (sort column, id) order
+
+    Raises:
+        ValueError: If the sort key or cursor is invalid
+    """
+    from app.models.cloud_account import CloudAccount
+
+    # Query resources from the latest completed ORPHAN scan of each account
+    # (no rows for accounts without a completed scan)
+    query = select(OrphanResource).join(
+        CloudAccount, OrphanResource.scan_id == CloudAccount.latest_orphan_scan_id
+    )
+
+    if user_id:
+        query = query.where(CloudAccount.user_id == user_id)
+
+    if cloud_account_id:
+        query = query.where(CloudAccount.id == cloud_account_id)
+
+    if status:
+        query = query.where(OrphanResource.status == status.value)
+
+    if resource_type:
+        query = query.where(OrphanResource.resource_type == resource_type)
+
+    return apply_keyset(query, OrphanResource, sort, cursor)
+
+
 async def get_orphan_resources_by_account(
     db: AsyncSession,
     cloud_account_id: uuid.UUID,
@@ -83,6 +212,8 @@ async def get_orphan_resources_by_account(
     resource_type: str | None = None,
     skip: int = 0,
     limit: int = 100,
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
 ) -> list[OrphanResource]:
     """
     Get orphan resources for a specific cloud account from the latest scan.
@@ -92,43 +223,64 @@ async def get_orphan_resources_by_account(
         cloud_account_id: Cloud account UUID
         status: Optional status filter
         resource_type: Optional resource type filter
-        skip: Number of records to skip
+        skip: Number of records to skip (prefer cursor)
         limit: Maximum number of records to return
+        sort: Sort key: cost (descending), type or region
+        cursor: Cursor of the previous page (keyset pagination)
 
     Returns:
         List of orphan resource objects from the latest completed scan
+
+    Raises:
+        ValueError: If the sort key or cursor is invalid
     """
-    from app.models.scan import Scan
-
-    # Get the latest completed ORPHAN scan for this account
-    # Filter out INVENTORY scans to avoid interference
-    latest_scan_result = await db.execute(
-        select(Scan)
-        .where(
-            Scan.cloud_account_id == cloud_account_id,
-            Scan.status == "completed",
-            Scan.scan_type != "inventory"
-        )
-        .order_by(Scan.created_at.desc())
-        .limit(1)
+    query = latest_orphan_resources_query(
+        cloud_account_id=cloud_account_id,
+        status=status,
+        resource_type=resource_type,
+        sort=sort,
+        cursor=cursor,
     )
-    latest_scan = latest_scan_result.scalar_one_or_none()
+    result = await db.execute(query.offset(skip).limit(limit))
+    return list(result.scalars().all())
 
-    if not latest_scan:
-        # No completed scans found
-        return []
 
-    # Query resources from the latest scan
-    query = select(OrphanResource).where(
-        OrphanResource.scan_id == latest_scan.id
-    )
+async def get_latest_orphan_resources_by_user(
+    db: AsyncSession,
+    user_id: uuid.UUID,
+    status: ResourceStatus | None = None,
+    resource_type: str | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
+) -> list[OrphanResource]:
+    """
+    Get orphan resources of all the user's cloud accounts from their latest scans.
 
-    if status:
-        query = query.where(OrphanResource.status == status.value)
+    Args:
+        db: Database session
+        user_id: User UUID
+        status: Optional status filter
+        resource_type: Optional resource type filter
+        skip: Number of records to skip (prefer cursor)
+        limit: Maximum number of records to return
+        sort: Sort key: cost (descending), type or region
+        cursor: Cursor of the previous page (keyset pagination)
 
-    if resource_type:
-        query = query.where(OrphanResource.resource_type == resource_type)
+    Returns:
+        List of orphan resource objects from the latest completed scans
 
+    Raises:
+        ValueError: If the sort key or cursor is invalid
+    """
+    query = latest_orphan_resources_query(
+        user_id=user_id,
+        status=status,
+        resource_type=resource_type,
+        sort=sort,
+        cursor=cursor,
+    )
     result = await db.execute(query.offset(skip).limit(limit))
     return list(result.scalars().all())
 
@@ -157,6 +309,7 @@ async def update_orphan_resource(
     if not resource:
         return None
 
+    before = impact_rollup_crud.resource_values(resource)
     update_data = resource_update.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         if field == "status" and isinstance(value, ResourceStatus):
@@ -166,6 +319,12 @@ async def update_orphan_resource(
 
     await db.commit()
     await db.refresh(resource)
+
+    after = impact_rollup_crud.resource_values(resource)
+    if after != before:
+        await impact_rollup_crud.apply_resource_changes(
+            db, resource.cloud_account_id, added=[after], removed=[before]
+        )
     return resource
 
 
@@ -188,8 +347,11 @@ async def delete_orphan_resource(
     resource = result.scalar_one_or_none()
 
     if resource:
+        cloud_account_id = resource.cloud_account_id
+        removed = impact_rollup_crud.resource_values(resource)
         await db.delete(resource)
         await db.commit()
+        await impact_rollup_crud.apply_resource_changes(db, cloud_account_id, removed=[removed])
 
     return resource
 
@@ -212,87 +374,63 @@ async def get_orphan_resource_statistics(
     Returns:
         Dictionary with orphan resource statistics
     """
-    from app.models.scan import Scan
     from app.models.cloud_account import CloudAccount
-    from sqlalchemy import and_, func
 
-    # Get latest ORPHAN scan IDs per cloud account
-    # SECURITY: Filter by user_id to prevent cross-user data leakage
-    # Filter out INVENTORY scans to avoid interference
-    latest_scan_subquery_query = (
-        select(
-            Scan.cloud_account_id,
-            func.max(Scan.created_at).label("max_created_at")
-        )
-        .where(
-            Scan.status == "completed",
-            Scan.scan_type != "inventory"
-        )
-    )
+    # Only the grouped columns of resources from the latest ORPHAN scan of each
+    # account (no ORM objects, no resource_metadata JSON)
+    filtered = select(
+        OrphanResource.resource_type,
+        OrphanResource.region,
+        OrphanResource.status,
+        OrphanResource.estimated_monthly_cost,
+    ).join(CloudAccount, OrphanResource.scan_id == CloudAccount.latest_orphan_scan_id)
 
-    # Add user_id filter if provided (CRITICAL for multi-tenant security)
+    # SECURITY: Filter by user_id to prevent cross-user data leakage
     if user_id:
-        latest_scan_subquery_query = latest_scan_subquery_query.join(
-            CloudAccount, Scan.cloud_account_id == CloudAccount.id
-        ).where(CloudAccount.user_id == user_id)
-
-    latest_scan_subquery = latest_scan_subquery_query.group_by(
-        Scan.cloud_account_id
-    ).subquery()
-
-    latest_scan_ids = (
-        select(Scan.id)
-        .join(
-            latest_scan_subquery,
-            and_(
-                Scan.cloud_account_id == latest_scan_subquery.c.cloud_account_id,
-                Scan.created_at == latest_scan_subquery.c.max_created_at
-            )
-        )
-        .subquery()
-    )
-
-    # Query resources from latest scans only
-    query = select(OrphanResource).where(
-        OrphanResource.scan_id.in_(select(latest_scan_ids))
-    )
+        filtered = filtered.where(CloudAccount.user_id == user_id)
 
     if cloud_account_id:
-        query = query.where(OrphanResource.cloud_account_id == cloud_account_id)
+        filtered = filtered.where(OrphanResource.cloud_account_id == cloud_account_id)
 
     if status:
-        query = query.where(OrphanResource.status == status.value)
-
-    result = await db.execute(query)
-    resources = result.scalars().all()
+        filtered = filtered.where(OrphanResource.status == status.value)
 
-    # Total resources
-    total_resources = len(resources)
+    filtered = filtered.cte("filtered_orphans")
 
-    # By type
-    by_type: dict[str, int] = {}
-    for resource in resources:
-        by_type[resource.resource_type] = by_type.get(resource.resource_type, 0) + 1
-
-    # By region
-    by_region: dict[str, int] = {}
-    for resource in resources:
-        by_region[resource.region] = by_region.get(resource.region, 0) + 1
-
-    # By status
-    by_status: dict[str, int] = {}
-    for resource in resources:
-        by_status[resource.status] = by_status.get(resource.status, 0) + 1
+    # Counts and cost per type, region and status in one statement (three
+    # grouped selects over the same CTE; GROUPING SETS is PostgreSQL-only)
+    grouped = [
+        select(
+            literal_column(f"'{dimension}'").label("dimension"),
+            column.label("key"),
+            func.count().label("count"),
+            func.coalesce(func.sum(filtered.c.estimated_monthly_cost), 0.0).label("cost"),
+        ).group_by(column)
+        for dimension, column in (
+            ("type", filtered.c.resource_type),
+            ("region", filtered.c.region),
+            ("status", filtered.c.status),
+        )
+    ]
+    result = await db.execute(union_all(*grouped))
+
+    breakdowns: dict[str, dict[str, int]] = {"type": {}, "region": {}, "status": {}}
+    total_resources = 0
+    total_monthly_cost = 0.0
+    for dimension, key, count, cost in result.all():
+        breakdowns[dimension][key] = count
+        # Every resource has exactly one status: the status groups give the totals
+        if dimension == "status":
+            total_resources += count
+            total_monthly_cost += cost or 0.0
 
-    # Total costs
-    total_monthly_cost = sum(resource.estimated_monthly_cost for resource in resources)
     total_annual_cost = total_monthly_cost * 12
 
     return {
         "total_resources": total_resources,
-        "by_type": by_type,
-        "by_region": by_region,
-        "by_status": by_status,
+        "by_type": breakdowns["type"],
+        "by_region": breakdowns["region"],
+        "by_status": breakdowns["status"],
         "total_monthly_cost": round(total_monthly_cost, 2),
         "total_annual_cost": round(total_annual_cost, 2),
     }
@@ -316,53 +454,19 @@ async def get_top_cost_resources(
     Returns:
         List of orphan resources sorted by cost (descending)
     """
-    from app.models.scan import Scan
     from app.models.cloud_account import CloudAccount
-    from sqlalchemy import and_, func
-
-    # Get latest ORPHAN scan IDs per cloud account
-    # SECURITY: Filter by user_id to prevent cross-user data leakage
-    # Filter out INVENTORY scans to avoid interference
-    latest_scan_subquery_query = (
-        select(
-            Scan.cloud_account_id,
-            func.max(Scan.created_at).label("max_created_at")
-        )
-        .where(
-            Scan.status == "completed",
-            Scan.scan_type != "inventory"
-        )
-    )
 
-    # Add user_id filter if provided (CRITICAL for multi-tenant security)
-    if user_id:
-        latest_scan_subquery_query = latest_scan_subquery_query.join(
-            CloudAccount, Scan.cloud_account_id == CloudAccount.id
-        ).where(CloudAccount.user_id == user_id)
-
-    latest_scan_subquery = latest_scan_subquery_query.group_by(
-        Scan.cloud_account_id
-    ).subquery()
-
-    latest_scan_ids = (
-        select(Scan.id)
-        .join(
-            latest_scan_subquery,
-            and_(
-                Scan.cloud_account_id == latest_scan_subquery.c.cloud_account_id,
-                Scan.created_at == latest_scan_subquery.c.max_created_at
-            )
-        )
-        .subquery()
-    )
-
-    # Query only from latest scans
+    # Query only from the latest ORPHAN scan of each account
     query = (
         select(OrphanResource)
-        .where(OrphanResource.scan_id.in_(select(latest_scan_ids)))
+        .join(CloudAccount, OrphanResource.scan_id == CloudAccount.latest_orphan_scan_id)
         .order_by(OrphanResource.estimated_monthly_cost.desc())
     )
 
+    # SECURITY: Filter by user_id to prevent cross-user data leakage
+    if user_id:
+        query = query.where(CloudAccount.user_id == user_id)
+
     if cloud_account_id:
         query = query.where(OrphanResource.cloud_account_id == cloud_account_id)
 
@@ -0,0 +1,350 @@
+"""CRUD operations for differential scans (findings changed between consecutive scans)."""
+
+import hashlib
+import json
+import uuid
+from typing import Any
+
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.crud import orphan_resource as orphan_resource_crud
+from app.models.orphan_resource import OrphanResource, ResourceStatus
+from app.models.orphan_resource_change import ChangeType, OrphanResourceChange
+
+# Metadata keys that make a finding different (volatile values such as ages
+# or metric samples are left out: they change on every scan)
+FINGERPRINT_METADATA_KEYS = (
+    "orphan_type",
+    "scenario",
+    "detection_scenario",
+    "confidence",
+    "confidence_level",
+    "state",
+    "status",
+)
+
+Identity = tuple[str, str, str]
+
+
+def _identity(row: Any) -> Identity:
+    """(resource_type, resource_id, region) of a finding (row dict or result row)."""
+    if isinstance(row, dict):
+        return (row["resource_type"], row["resource_id"], row["region"])
+    return (row.resource_type, row.resource_id, row.region)
+
+
+def finding_fingerprint(row: dict[str, Any]) -> str:
+    """
+    Hash of a finding: identity, cost and key metadata.
+
+    Two scans finding a resource with the same fingerprint found the same
+    waste, so a differential scan keeps the existing row.
+
+    Args:
+        row: Column values of an orphan_resources row
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    metadata = row.get("resource_metadata") or {}
+    payload = [
+        *_identity(row),
+        round(float(row.get("estimated_monthly_cost") or 0.0), 2),
+        {key: metadata[key] for key in FINGERPRINT_METADATA_KEYS if key in metadata},
+    ]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _change_row(
+    row: dict[str, Any], change_type: ChangeType, previous_monthly_cost: float | None = None
+) -> dict[str, Any]:
+    """Column values of an orphan_resource_changes row for a finding."""
+    return {
+        "id": uuid.uuid4(),
+        "scan_id": row["scan_id"],
+        "cloud_account_id": row["cloud_account_id"],
+        "orphan_resource_id": row.get("id") if change_type != ChangeType.REMOVED else None,
+        "change_type": change_type.value,
+        "resource_type": row["resource_type"],
+        "resource_id": row["resource_id"],
+        "resource_name": row.get("resource_name"),
+        "region": row["region"],
+        "estimated_monthly_cost": row.get("estimated_monthly_cost") or 0.0,
+        "previous_monthly_cost": previous_monthly_cost,
+        "fingerprint": row.get("fingerprint"),
+    }
+
+
+async def _insert_changes(
+    db: AsyncSession, rows: list[dict[str, Any]], chunk_size: int = 1000, commit: bool = True
+) -> None:
+    """Insert change rows with executemany INSERTs and commit (if asked)."""
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(OrphanResourceChange), rows[start : start + chunk_size])
+    if commit:
+        await db.commit()
+
+
+async def _insert_findings(
+    db: AsyncSession,
+    replaced: list[tuple[dict[str, Any], Any]],
+    chunk_size: int = 1000,
+    commit: bool = True,
+) -> list[dict[str, Any]]:
+    """Insert added (no match) and changed findings with their change rows."""
+    inserted: list[dict[str, Any]] = []
+    changes: list[dict[str, Any]] = []
+    for row, match in replaced:
+        row = {
+            **row,
+            "id": uuid.uuid4(),
+            "status": match.status if match is not None else ResourceStatus.ACTIVE.value,
+        }
+        inserted.append(row)
+        if match is None:
+            changes.append(_change_row(row, ChangeType.ADDED))
+        else:
+            changes.append(_change_row(row, ChangeType.CHANGED, match.estimated_monthly_cost))
+
+    # Changes first: a row is never left in the scan without its change (see revert)
+    await _insert_changes(db, changes, chunk_size, commit=commit)
+    await orphan_resource_crud.bulk_insert_orphan_resources(
+        db, inserted, chunk_size=chunk_size, commit=commit
+    )
+    return inserted
+
+
+async def write_differential_orphans(
+    db: AsyncSession,
+    scan_id: uuid.UUID,
+    base_scan_id: uuid.UUID,
+    rows: list[dict[str, Any]],
+    chunk_size: int = 1000,
+) -> tuple[list[dict[str, Any]], dict[uuid.UUID, dict[str, Any]]]:
+    """
+    Persist findings of a differential scan (e.g., the results of one region).
+
+    New and changed findings are inserted (changed ones keep the status of
+    the row they replace, which stays on the base scan) and logged in
+    orphan_resource_changes. Findings unchanged since the base scan (same
+    fingerprint) are not written: their base scan rows are only staged, and
+    `carry_over_orphans` moves them to the scan once it completes, so the
+    base scan keeps its full set of findings while the scan runs.
+
+    Args:
+        db: Database session
+        scan_id: Scan the findings belong to
+        base_scan_id: Previous scan of the account
+        rows: Column values per orphan resource, with their fingerprint
+        chunk_size: Rows per statement
+
+    Returns:
+        Rows inserted (findings added or changed since the base scan), and
+        the findings to carry over keyed by the ID of their base scan row
+    """
+    previous: dict[Identity, list[Any]] = {}
+    resource_ids = sorted({row["resource_id"] for row in rows})
+    for start in range(0, len(resource_ids), chunk_size):
+        result = await db.execute(
+            select(
+                OrphanResource.id,
+                OrphanResource.resource_type,
+                OrphanResource.resource_id,
+                OrphanResource.region,
+                OrphanResource.fingerprint,
+                OrphanResource.status,
+                OrphanResource.estimated_monthly_cost,
+            ).where(
+                OrphanResource.scan_id == base_scan_id,
+                OrphanResource.resource_id.in_(resource_ids[start : start + chunk_size]),
+            )
+        )
+        for match in result.all():
+            previous.setdefault(_identity(match), []).append(match)
+
+    carried: dict[uuid.UUID, dict[str, Any]] = {}
+    replaced: list[tuple[dict[str, Any], Any]] = []
+    for row in rows:
+        matches = previous.get(_identity(row))
+        match = matches.pop() if matches else None
+        if match is not None and match.fingerprint == row["fingerprint"]:
+            carried[match.id] = row
+        else:
+            replaced.append((row, match))
+
+    inserted = await _insert_findings(db, replaced, chunk_size)
+    return inserted, carried
+
+
+async def carry_over_orphans(
+    db: AsyncSession,
+    scan_id: uuid.UUID,
+    base_scan_id: uuid.UUID,
+    carried: dict[uuid.UUID, dict[str, Any]],
+    chunk_size: int = 1000,
+) -> list[dict[str, Any]]:
+    """
+    Move the unchanged findings of a completed differential scan from its base scan.
+
+    Nothing is committed: the caller commits the move together with the
+    scan's completion and latest scan pointer, so readers of the latest scan
+    never see the findings missing. The moved rows keep their status
+    (ignored, marked for deletion...).
+
+    Args:
+        db: Database session (the transaction completing the scan)
+        scan_id: Differential scan UUID
+        base_scan_id: Previous scan of the account
+        carried: Findings staged by `write_differential_orphans`, keyed by base scan row ID
+        chunk_size: Rows per statement
+
+    Returns:
+        Rows inserted instead (findings taken over meanwhile by a concurrent scan of the account)
+    """
+    carried_ids = list(carried)
+    moved: set[uuid.UUID] = set()
+    for start in range(0, len(carried_ids), chunk_size):
+        result = await db.execute(
+            update(OrphanResource)
+            .where(
+                OrphanResource.id.in_(carried_ids[start : start + chunk_size]),
+                OrphanResource.scan_id == base_scan_id,
+            )
+            .values(scan_id=scan_id)
+            .returning(OrphanResource.id)
+            .execution_options(synchronize_session=False)
+        )
+        moved.update(result.scalars().all())
+
+    replaced = [(row, None) for row_id, row in carried.items() if row_id not in moved]
+    return await _insert_findings(db, replaced, chunk_size, commit=False)
+
+
+async def record_removed_orphans(
+    db: AsyncSession,
+    scan_id: uuid.UUID,
+    base_scan_id: uuid.UUID,
+    chunk_size: int = 1000,
+    commit: bool = True,
+) -> int:
+    """
+    Log the findings of the base scan that a completed differential scan did not find.
+
+    Args:
+        db: Database session
+        scan_id: Differential scan UUID (all its findings written and carried over)
+        base_scan_id: Previous scan of the account
+        commit: Commit the change log (False: left to the caller's transaction)
+
+    Returns:
+        Number of findings removed
+    """
+    current = aliased(OrphanResource)
+    found = exists().where(
+        current.scan_id == scan_id,
+        current.resource_type == OrphanResource.resource_type,
+        current.resource_id == OrphanResource.resource_id,
+        current.region == OrphanResource.region,
+    )
+    result = await db.execute(
+        select(
+            OrphanResource.cloud_account_id,
+            OrphanResource.resource_type,
+            OrphanResource.resource_id,
+            OrphanResource.resource_name,
+            OrphanResource.region,
+            OrphanResource.estimated_monthly_cost,
+            OrphanResource.fingerprint,
+        ).where(OrphanResource.scan_id == base_scan_id, ~found)
+    )
+    changes = [
+        _change_row({**row, "scan_id": scan_id}, ChangeType.REMOVED)
+        for row in result.mappings().all()
+    ]
+    await _insert_changes(db, changes, chunk_size, commit=commit)
+    return len(changes)
+
+
+async def revert_differential_scan(
+    db: AsyncSession, scan_id: uuid.UUID, base_scan_id: uuid.UUID
+) -> int:
+    """
+    Move the findings a differential scan took over back to its base scan.
+
+    Used before a completed scan's own rows are deleted (deleted scan), so
+    the base scan gets its full set of findings back.
+
+    Args:
+        db: Database session
+        scan_id: Differential scan UUID
+        base_scan_id: Scan the findings were taken from
+
+    Returns:
+        Number of rows moved back
+    """
+    written = select(OrphanResourceChange.orphan_resource_id).where(
+        OrphanResourceChange.scan_id == scan_id,
+        OrphanResourceChange.orphan_resource_id.is_not(None),
+    )
+    result = await db.execute(
+        update(OrphanResource)
+        .where(OrphanResource.scan_id == scan_id, OrphanResource.id.not_in(written))
+        .values(scan_id=base_scan_id)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def delete_changes_by_scan(db: AsyncSession, scan_id: uuid.UUID) -> int:
+    """
+    Delete the change log of a scan in one statement.
+
+    Args:
+        db: Database session
+        scan_id: Scan UUID
+
+    Returns:
+        Number of rows deleted
+    """
+    result = await db.execute(
+        delete(OrphanResourceChange).where(OrphanResourceChange.scan_id == scan_id)
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def get_changes_by_scan(
+    db: AsyncSession,
+    scan_id: uuid.UUID,
+    change_type: ChangeType | None = None,
+    skip: int = 0,
+    limit: int = 100,
+) -> list[OrphanResourceChange]:
+    """
+    Get the findings a differential scan added, changed or removed.
+
+    Args:
+        db: Database session
+        scan_id: Scan UUID
+        change_type: Optional change type filter
+        skip: Number of records to skip
+        limit: Maximum number of records to return
+
+    Returns:
+        List of changes, most expensive first
+    """
+    query = select(OrphanResourceChange).where(OrphanResourceChange.scan_id == scan_id)
+    if change_type:
+        query = query.where(OrphanResourceChange.change_type == change_type.value)
+
+    result = await db.execute(
+        query.order_by(
+            OrphanResourceChange.estimated_monthly_cost.desc(), OrphanResourceChange.id
+        )
+        .offset(skip)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,149 @@
+"""Keyset (cursor) pagination and NDJSON streaming for resource listings."""
+
+import base64
+import json
+import uuid
+from typing import Any, AsyncIterator, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import tuple_
+from sqlalchemy.sql import Select
+
+from app.core.database import AsyncSessionLocal
+
+# Sort keys accepted by the listings -> resource column (sorted with the id as tie-breaker)
+SORT_COLUMNS = {
+    "cost": "estimated_monthly_cost",
+    "type": "resource_type",
+    "region": "region",
+}
+DEFAULT_SORT = "cost"
+
+# Most expensive first; type and region alphabetically
+DESCENDING_SORTS = {"cost"}
+
+
+def encode_cursor(sort: str, value: Any, row_id: uuid.UUID) -> str:
+    """
+    Encode the position after a row as an opaque cursor.
+
+    Args:
+        sort: Sort key of the listing
+        value: Sort column value of the row
+        row_id: Row UUID
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort, value, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, uuid.UUID]:
+    """
+    Decode a cursor returned by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+        sort: Sort key of the current request (must match the cursor's)
+
+    Returns:
+        Tuple of (sort column value, row UUID)
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        row_uuid = uuid.UUID(row_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if cursor_sort != sort:
+        raise ValueError(f"Cursor was issued for sort '{cursor_sort}', not '{sort}'")
+    return value, row_uuid
+
+
+def apply_keyset(
+    query: Select,
+    model: Any,
+    sort: str = DEFAULT_SORT,
+    cursor: str | None = None,
+) -> Select:
+    """
+    Order a listing by (sort column, id) and start it after the cursor.
+
+    The (sort column, id) order is total, so pages never skip or repeat rows,
+    and each page is an index range scan whatever its depth.
+
+    Args:
+        query: Select of model rows
+        model: Model class (exposes the sort columns and id)
+        sort: Sort key (see SORT_COLUMNS)
+        cursor: Cursor of the previous page (None for the first page)
+
+    Returns:
+        Ordered (and filtered) select; the caller applies the limit
+
+    Raises:
+        ValueError: If the sort key or cursor is invalid
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Invalid sort '{sort}'")
+
+    column = getattr(model, SORT_COLUMNS[sort])
+    descending = sort in DESCENDING_SORTS
+
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort)
+        position = tuple_(column, model.id)
+        query = query.where(position < (value, row_id) if descending else position > (value, row_id))
+
+    if descending:
+        return query.order_by(column.desc(), model.id.desc())
+    return query.order_by(column.asc(), model.id.asc())
+
+
+def next_cursor(rows: Sequence[Any], sort: str, limit: int) -> str | None:
+    """
+    Cursor of the page following rows (None if rows is the last page).
+
+    Args:
+        rows: Rows of the current page
+        sort: Sort key of the listing
+        limit: Page size requested
+
+    Returns:
+        Cursor string or None
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(sort, getattr(last, SORT_COLUMNS[sort]), last.id)
+
+
+async def stream_ndjson(
+    query: Select, schema: type[BaseModel], batch_size: int = 1000
+) -> AsyncIterator[bytes]:
+    """
+    Stream the rows of a listing as newline-delimited JSON.
+
+    Uses its own session and a server-side cursor (the request's session is
+    closed before a streaming response body is sent), so a full listing is
+    sent in one response with bounded memory.
+
+    Args:
+        query: Select of model rows (already filtered and ordered)
+        schema: Response schema of one row
+        batch_size: Rows fetched per round trip
+
+    Yields:
+        Chunks of NDJSON lines (one per batch)
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions(batch_size):
+            yield "".join(
+                schema.model_validate(row).model_dump_json() + "\n" for row in partition
+            ).encode()
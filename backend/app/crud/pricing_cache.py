@@ -0,0 +1,95 @@
+"""CRUD operations for the pricing cache."""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.pricing_cache import PricingCache
+
+# Lifetime of a refreshed price (matches PricingCache.expires_at default)
+PRICE_TTL = timedelta(hours=24)
+
+
+def _upsert_statement(db: AsyncSession, rows: list[dict[str, Any]]):
+    """INSERT ... ON CONFLICT (provider, service, region) DO UPDATE for the session's dialect."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(PricingCache).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[PricingCache.provider, PricingCache.service, PricingCache.region],
+        set_={
+            "price_per_unit": stmt.excluded.price_per_unit,
+            "unit": stmt.excluded.unit,
+            "source": stmt.excluded.source,
+            "api_metadata": stmt.excluded.api_metadata,
+            "last_updated": stmt.excluded.last_updated,
+            "expires_at": stmt.excluded.expires_at,
+        },
+    )
+
+
+async def upsert_prices(
+    db: AsyncSession, provider: str, rows: list[dict[str, Any]], chunk_size: int = 1000
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Insert or update many prices of a provider in one batch.
+
+    Prices identical to the cached ones (same price and source) are not
+    rewritten: only their expiration is extended, with a single UPDATE, so
+    `last_updated` keeps the time the price last changed.
+
+    Args:
+        db: Database session
+        provider: Cloud provider ('aws', 'azure', 'gcp')
+        rows: Prices with service, region, price_per_unit, unit and source keys
+        chunk_size: Rows per INSERT ... ON CONFLICT statement
+
+    Returns:
+        Tuple of (rows inserted or changed, number of unchanged prices)
+    """
+    now = datetime.utcnow()
+    expires_at = now + PRICE_TTL
+
+    result = await db.execute(
+        select(
+            PricingCache.id,
+            PricingCache.service,
+            PricingCache.region,
+            PricingCache.price_per_unit,
+            PricingCache.source,
+        ).where(PricingCache.provider == provider)
+    )
+    existing = {
+        (service, region): (entry_id, price, source)
+        for entry_id, service, region, price, source in result.all()
+    }
+
+    changed: list[dict[str, Any]] = []
+    unchanged_ids = []
+    for row in rows:
+        current = existing.get((row["service"], row["region"]))
+        if current and current[1] == row["price_per_unit"] and current[2] == row["source"]:
+            unchanged_ids.append(current[0])
+        else:
+            changed.append(
+                {
+                    "provider": provider,
+                    "api_metadata": None,
+                    **row,
+                    "last_updated": now,
+                    "expires_at": expires_at,
+                }
+            )
+
+    for start in range(0, len(changed), chunk_size):
+        await db.execute(_upsert_statement(db, changed[start : start + chunk_size]))
+    for start in range(0, len(unchanged_ids), chunk_size):
+        await db.execute(
+            update(PricingCache)
+            .where(PricingCache.id.in_(unchanged_ids[start : start + chunk_size]))
+            .values(expires_at=expires_at)
+        )
+    await db.commit()
+    return changed, len(unchanged_ids)
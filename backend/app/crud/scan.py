@@ -3,11 +3,20 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import delete, desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.scan import Scan, ScanStatus
+from app.crud import all_cloud_resource as all_cloud_resource_crud
+from app.crud import impact_rollup as impact_rollup_crud
+from app.crud import orphan_resource as orphan_resource_crud
+from app.crud import orphan_resource_change as orphan_resource_change_crud
+from app.models.all_cloud_resource import AllCloudResource
+from app.models.cloud_account import CloudAccount
+from app.models.impact_rollup import ImpactRollup
+from app.models.orphan_resource import OrphanResource
+from app.models.orphan_resource_change import OrphanResourceChange
+from app.models.scan import Scan, ScanStatus, ScanType
 from app.schemas.scan import ScanCreate, ScanUpdate
 
 
@@ -56,6 +65,80 @@ async def get_scan_by_id(
     return result.scalar_one_or_none()
 
 
+async def get_scan_with_owner(
+    db: AsyncSession, scan_id: uuid.UUID
+) -> tuple[Scan, uuid.UUID] | None:
+    """
+    Get scan by ID together with the user owning its cloud account (one query).
+
+    Args:
+        db: Database session
+        scan_id: Scan UUID
+
+    Returns:
+        Tuple of (scan, owner user UUID) or None if not found
+    """
+    from app.models.cloud_account import CloudAccount
+
+    result = await db.execute(
+        select(Scan, CloudAccount.user_id)
+        .join(CloudAccount, Scan.cloud_account_id == CloudAccount.id)
+        .where(Scan.id == scan_id)
+    )
+    row = result.one_or_none()
+    return (row[0], row[1]) if row else None
+
+
+def set_latest_scan(account: CloudAccount, scan: Scan) -> None:
+    """
+    Point the account at a scan that just completed.
+
+    Called when the scan is marked as completed, so the pointer is committed
+    in the same transaction as the scan status.
+
+    Args:
+        account: Cloud account of the scan
+        scan: Completed scan
+    """
+    if scan.scan_type == ScanType.INVENTORY.value:
+        account.latest_inventory_scan_id = scan.id
+    else:
+        account.latest_orphan_scan_id = scan.id
+
+
+async def refresh_latest_scans(db: AsyncSession, cloud_account_ids: list[uuid.UUID]) -> None:
+    """
+    Recompute the latest scan pointers of accounts from their scans (e.g., after deletions).
+
+    Args:
+        db: Database session
+        cloud_account_ids: Cloud account UUIDs
+    """
+    from app.models.cloud_account import CloudAccount
+
+    def latest(inventory: bool):
+        return (
+            select(Scan.id)
+            .where(
+                Scan.cloud_account_id == CloudAccount.id,
+                Scan.status == ScanStatus.COMPLETED.value,
+                (Scan.scan_type == ScanType.INVENTORY.value)
+                if inventory
+                else (Scan.scan_type != ScanType.INVENTORY.value),
+            )
+            .order_by(func.coalesce(Scan.completed_at, Scan.created_at).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    await db.execute(
+        update(CloudAccount)
+        .where(CloudAccount.id.in_(cloud_account_ids))
+        .values(latest_orphan_scan_id=latest(False), latest_inventory_scan_id=latest(True))
+    )
+    await db.commit()
+
+
 async def get_scans_by_account(
     db: AsyncSession,
     cloud_account_id: uuid.UUID,
@@ -113,7 +196,7 @@ async def get_scans_by_user(
 
     result = await db.execute(
         select(Scan)
-        .join(CloudAccount)
+        .join(CloudAccount, Scan.cloud_account_id == CloudAccount.id)
         .where(
             CloudAccount.user_id == user_id,
             Scan.scan_type != "inventory"
@@ -149,6 +232,11 @@ async def update_scan(
     for field, value in update_data.items():
         setattr(scan, field, value)
 
+    if update_data.get("status") == ScanStatus.COMPLETED:
+        account = await db.get(CloudAccount, scan.cloud_account_id)
+        if account:
+            set_latest_scan(account, scan)
+
     await db.commit()
     await db.refresh(scan)
     return scan
@@ -225,7 +313,13 @@ async def get_scan_statistics(
 
 async def delete_scan(db: AsyncSession, scan_id: uuid.UUID) -> bool:
     """
-    Delete a scan and all its associated orphan resources.
+    Delete a scan and all its associated resources.
+
+    Resources are deleted with one statement per table (never loaded), and
+    the scan's orphan resources are subtracted from the impact rollups (for
+    a compacted scan, the contribution recorded in its summary). Findings a
+    differential scan took over from its base scan are moved back to it
+    first.
 
     Args:
         db: Database session
@@ -234,14 +328,40 @@ async def delete_scan(db: AsyncSession, scan_id: uuid.UUID) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    result = await db.execute(select(Scan).where(Scan.id == scan_id))
-    scan = result.scalar_one_or_none()
+    result = await db.execute(
+        select(Scan.cloud_account_id, Scan.base_scan_id, Scan.compacted_at, Scan.summary).where(
+            Scan.id == scan_id
+        )
+    )
+    row = result.one_or_none()
 
-    if not scan:
+    if row is None:
         return False
+    cloud_account_id, base_scan_id, compacted_at, summary = row
 
-    await db.delete(scan)
+    # The resources of a compacted scan are gone, but not their rollup history
+    if compacted_at is not None:
+        await impact_rollup_crud.subtract_scan_rollups(
+            db, cloud_account_id, (summary or {}).get("impact_rollups", [])
+        )
+
+    # A differential scan gives the findings it took over back to its base scan
+    if base_scan_id is not None:
+        await orphan_resource_change_crud.revert_differential_scan(db, scan_id, base_scan_id)
+    await orphan_resource_crud.delete_orphan_resources_by_scan(db, scan_id)
+    await orphan_resource_change_crud.delete_changes_by_scan(db, scan_id)
+    await all_cloud_resource_crud.delete_resources_by_scan(db, scan_id)
+    await db.execute(
+        update(Scan)
+        .where(Scan.base_scan_id == scan_id)
+        .values(base_scan_id=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(delete(Scan).where(Scan.id == scan_id))
     await db.commit()
+
+    # Point the account back at its previous completed scan
+    await refresh_latest_scans(db, [cloud_account_id])
     return True
 
 
@@ -249,6 +369,9 @@ async def delete_all_scans_by_user(db: AsyncSession, user_id: uuid.UUID) -> int:
     """
     Delete all scans for a user's cloud accounts.
 
+    Scans and their resources are deleted with one DELETE ... WHERE scan_id
+    IN (...) statement per table, whatever the number of rows.
+
     Args:
         db: Database session
         user_id: User UUID
@@ -256,19 +379,33 @@ async def delete_all_scans_by_user(db: AsyncSession, user_id: uuid.UUID) -> int:
     Returns:
         Number of scans deleted
     """
-    from app.models.cloud_account import CloudAccount
+    user_scan_ids = (
+        select(Scan.id)
+        .join(CloudAccount, Scan.cloud_account_id == CloudAccount.id)
+        .where(CloudAccount.user_id == user_id)
+    )
 
-    # Get all scans for the user's accounts
-    result = await db.execute(
-        select(Scan)
-        .join(CloudAccount)
+    # No completed scan left to point at
+    await db.execute(
+        update(CloudAccount)
         .where(CloudAccount.user_id == user_id)
+        .values(latest_orphan_scan_id=None, latest_inventory_scan_id=None)
     )
-    scans = result.scalars().all()
 
-    # Delete all scans
-    for scan in scans:
-        await db.delete(scan)
+    # Loaded objects are not synchronized: the rows are never loaded here
+    for model in (OrphanResource, OrphanResourceChange, AllCloudResource):
+        await db.execute(
+            delete(model)
+            .where(model.scan_id.in_(user_scan_ids))
+            .execution_options(synchronize_session=False)
+        )
+    result = await db.execute(
+        delete(Scan)
+        .where(Scan.id.in_(user_scan_ids))
+        .execution_options(synchronize_session=False)
+    )
 
+    # Nothing left to roll up (including compacted scan history)
+    await db.execute(delete(ImpactRollup).where(ImpactRollup.user_id == user_id))
     await db.commit()
-    return len(scans)
+    return result.rowcount or 0
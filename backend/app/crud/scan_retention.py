@@ -0,0 +1,297 @@
+"""Scan history retention: compact the resources of old scans into summaries."""
+
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, exists, func, insert, literal, or_, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import impact_rollup as impact_rollup_crud
+from app.models.all_cloud_resource import AllCloudResource
+from app.models.cloud_account import CloudAccount
+from app.models.orphan_resource import OrphanResource
+from app.models.orphan_resource_archive import OrphanResourceArchive
+from app.models.scan import Scan, ScanStatus
+
+# Scans in these states are finished and can be compacted
+FINISHED_STATUSES = (ScanStatus.COMPLETED.value, ScanStatus.FAILED.value)
+
+# Columns copied from orphan_resources to orphan_resources_archive
+ARCHIVED_COLUMNS = (
+    "id",
+    "scan_id",
+    "cloud_account_id",
+    "resource_type",
+    "resource_id",
+    "resource_name",
+    "region",
+    "estimated_monthly_cost",
+    "resource_metadata",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+
+async def get_compactable_scan_ids(
+    db: AsyncSession, keep_last: int, limit: int
+) -> list[uuid.UUID]:
+    """
+    Get the oldest not yet compacted scans beyond the last keep_last finished ones of their account.
+
+    Scans an account points at (latest orphan/inventory scan) are never
+    compacted, whatever their rank.
+
+    Args:
+        db: Database session
+        keep_last: Number of most recent scans kept per account
+        limit: Maximum number of scan ids returned
+
+    Returns:
+        List of scan UUIDs, oldest first
+    """
+    # Only finished scans are ranked: a running scan does not push one out
+    ranked = (
+        select(
+            Scan.id,
+            Scan.compacted_at,
+            Scan.created_at,
+            func.row_number()
+            .over(
+                partition_by=Scan.cloud_account_id,
+                order_by=(Scan.created_at.desc(), Scan.id.desc()),
+            )
+            .label("rank"),
+        )
+        .where(Scan.status.in_(FINISHED_STATUSES))
+        .subquery()
+    )
+
+    is_latest = exists().where(
+        or_(
+            CloudAccount.latest_orphan_scan_id == ranked.c.id,
+            CloudAccount.latest_inventory_scan_id == ranked.c.id,
+        )
+    )
+    result = await db.execute(
+        select(ranked.c.id)
+        .where(
+            ranked.c.rank > keep_last,
+            ranked.c.compacted_at.is_(None),
+            ~is_latest,
+        )
+        .order_by(ranked.c.created_at.asc())
+        .limit(limit)
+    )
+    return list(result.scalars().all())
+
+
+def _empty_summary() -> dict[str, Any]:
+    """Summary of a resource table without rows."""
+    return {"count": 0, "monthly_cost": 0.0, "by_type": {}, "by_region": {}}
+
+
+def _add_to_summary(
+    summary: dict[str, Any], resource_type: str, region: str, count: int, cost: float
+) -> None:
+    """Add one (type, region) group to a summary."""
+    cost = float(cost or 0.0)
+    summary["count"] += count
+    summary["monthly_cost"] += cost
+    for key, value in (("by_type", resource_type), ("by_region", region)):
+        group = summary[key].setdefault(value, {"count": 0, "monthly_cost": 0.0})
+        group["count"] += count
+        group["monthly_cost"] += cost
+
+
+async def summarize_scans(
+    db: AsyncSession, scan_ids: list[uuid.UUID]
+) -> dict[uuid.UUID, dict[str, Any]]:
+    """
+    Summarize the resources of scans (counts and monthly costs per type and region).
+
+    Args:
+        db: Database session
+        scan_ids: Scan UUIDs
+
+    Returns:
+        Dict of scan UUID -> {"orphan_resources": ..., "inventory_resources": ...}
+    """
+    summaries = {
+        scan_id: {"orphan_resources": _empty_summary(), "inventory_resources": _empty_summary()}
+        for scan_id in scan_ids
+    }
+
+    for key, model in (
+        ("orphan_resources", OrphanResource),
+        ("inventory_resources", AllCloudResource),
+    ):
+        result = await db.execute(
+            select(
+                model.scan_id,
+                model.resource_type,
+                model.region,
+                func.count(model.id),
+                func.sum(model.estimated_monthly_cost),
+            )
+            .where(model.scan_id.in_(scan_ids))
+            .group_by(model.scan_id, model.resource_type, model.region)
+        )
+        for scan_id, resource_type, region, count, cost in result.all():
+            _add_to_summary(summaries[scan_id][key], resource_type, region, count, cost)
+
+    for summary in summaries.values():
+        for table_summary in summary.values():
+            table_summary["monthly_cost"] = round(table_summary["monthly_cost"], 2)
+            for groups in (table_summary["by_type"], table_summary["by_region"]):
+                for group in groups.values():
+                    group["monthly_cost"] = round(group["monthly_cost"], 2)
+    return summaries
+
+
+def _month_start(value: datetime) -> date:
+    """First day of the month of a datetime."""
+    return value.date().replace(day=1)
+
+
+async def _ensure_archive_partitions(db: AsyncSession, scan_ids: list[uuid.UUID]) -> None:
+    """Create the monthly orphan_resources_archive partitions the scans' rows go to (PostgreSQL)."""
+    if db.bind.dialect.name != "postgresql":
+        return
+
+    result = await db.execute(select(Scan.created_at).where(Scan.id.in_(scan_ids)))
+    table = OrphanResourceArchive.__tablename__
+    for month in sorted({_month_start(created_at) for created_at in result.scalars().all()}):
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        await db.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {table}_y{month:%Y}m{month:%m} "
+                f"PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+            )
+        )
+
+
+async def archive_orphan_resources(db: AsyncSession, scan_ids: list[uuid.UUID]) -> int:
+    """
+    Copy the orphan resources of scans to orphan_resources_archive (not committed).
+
+    Args:
+        db: Database session
+        scan_ids: Scan UUIDs
+
+    Returns:
+        Number of rows archived
+    """
+    await _ensure_archive_partitions(db, scan_ids)
+
+    result = await db.execute(
+        insert(OrphanResourceArchive).from_select(
+            [*ARCHIVED_COLUMNS, "scan_created_at", "archived_at"],
+            select(
+                *(getattr(OrphanResource, column) for column in ARCHIVED_COLUMNS),
+                Scan.created_at,
+                literal(datetime.utcnow()),
+            )
+            .join(Scan, OrphanResource.scan_id == Scan.id)
+            .where(OrphanResource.scan_id.in_(scan_ids)),
+        )
+    )
+    return result.rowcount or 0
+
+
+async def compact_scans(
+    db: AsyncSession, scan_ids: list[uuid.UUID], archive: bool = False
+) -> dict[str, int]:
+    """
+    Replace the resources of scans with a per-scan summary, in one transaction.
+
+    Resources are deleted with one DELETE ... WHERE scan_id IN (...) per
+    table. The impact rollups are left untouched: they keep the compacted
+    scans' history (see app.crud.impact_rollup). Each scan's contribution
+    to them is kept in its summary ("impact_rollups"), for when the scan is
+    deleted.
+
+    Args:
+        db: Database session
+        scan_ids: Scan UUIDs
+        archive: Copy the orphan resources to orphan_resources_archive first
+
+    Returns:
+        Dict with the number of rows archived and deleted
+    """
+    summaries = await summarize_scans(db, scan_ids)
+    rollups = await impact_rollup_crud.summarize_scan_rollups(db, scan_ids)
+    for scan_id, summary in summaries.items():
+        summary["impact_rollups"] = rollups[scan_id]
+    archived = await archive_orphan_resources(db, scan_ids) if archive else 0
+
+    deleted = {}
+    for key, model in (
+        ("orphan_resources_deleted", OrphanResource),
+        ("inventory_resources_deleted", AllCloudResource),
+    ):
+        result = await db.execute(
+            delete(model)
+            .where(model.scan_id.in_(scan_ids))
+            .execution_options(synchronize_session=False)
+        )
+        deleted[key] = result.rowcount or 0
+
+    compacted_at = datetime.utcnow()
+    await db.execute(
+        update(Scan),
+        [
+            {"id": scan_id, "summary": summary, "compacted_at": compacted_at}
+            for scan_id, summary in summaries.items()
+        ],
+    )
+    await db.commit()
+    return {"orphan_resources_archived": archived, **deleted}
+
+
+async def compact_scan_history(
+    db: AsyncSession,
+    keep_last: int | None = None,
+    archive: bool | None = None,
+    batch_size: int = 100,
+) -> dict[str, int]:
+    """
+    Compact every scan beyond the last keep_last of its account.
+
+    Scans are compacted in batches (one transaction each), so the job can be
+    interrupted and resumed.
+
+    Args:
+        db: Database session
+        keep_last: Scans kept per account (default: SCAN_RETENTION_KEEP_LAST)
+        archive: Archive orphan resources (default: SCAN_RETENTION_ARCHIVE_DETAILS)
+        batch_size: Scans compacted per transaction
+
+    Returns:
+        Dict with the number of scans compacted and rows archived/deleted
+    """
+    if keep_last is None:
+        keep_last = settings.SCAN_RETENTION_KEEP_LAST
+    if archive is None:
+        archive = settings.SCAN_RETENTION_ARCHIVE_DETAILS
+
+    totals = {
+        "scans_compacted": 0,
+        "orphan_resources_archived": 0,
+        "orphan_resources_deleted": 0,
+        "inventory_resources_deleted": 0,
+    }
+    while True:
+        scan_ids = await get_compactable_scan_ids(db, keep_last, batch_size)
+        if not scan_ids:
+            break
+
+        counts = await compact_scans(db, scan_ids, archive=archive)
+        totals["scans_compacted"] += len(scan_ids)
+        for key, value in counts.items():
+            totals[key] += value
+
+    return totals
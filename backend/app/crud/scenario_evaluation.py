@@ -0,0 +1,77 @@
+"""CRUD operations for scenario evaluations (verdicts reused by incremental scans)."""
+
+import uuid
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.scenario_evaluation import ScenarioEvaluation
+
+
+def _upsert_statement(db: AsyncSession, rows: list[dict[str, Any]]):
+    """INSERT ... ON CONFLICT (account, region, scenario) DO UPDATE for the session's dialect."""
+    dialect = postgresql if db.bind.dialect.name == "postgresql" else sqlite
+    stmt = dialect.insert(ScenarioEvaluation).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[
+            ScenarioEvaluation.cloud_account_id,
+            ScenarioEvaluation.region,
+            ScenarioEvaluation.scenario,
+        ],
+        set_={
+            "inputs_digest": stmt.excluded.inputs_digest,
+            "findings": stmt.excluded.findings,
+            "evaluated_at": stmt.excluded.evaluated_at,
+        },
+    )
+
+
+async def get_evaluations_by_account(
+    db: AsyncSession, cloud_account_id: uuid.UUID
+) -> list[ScenarioEvaluation]:
+    """
+    Get the last scenario evaluations of an account, in every region.
+
+    Args:
+        db: Database session
+        cloud_account_id: Cloud account UUID
+
+    Returns:
+        List of scenario evaluations
+    """
+    result = await db.execute(
+        select(ScenarioEvaluation).where(ScenarioEvaluation.cloud_account_id == cloud_account_id)
+    )
+    return list(result.scalars().all())
+
+
+async def upsert_evaluations(
+    db: AsyncSession,
+    cloud_account_id: uuid.UUID,
+    region: str,
+    rows: list[dict[str, Any]],
+    chunk_size: int = 100,
+) -> int:
+    """
+    Replace the last evaluations of scenarios in one region of an account.
+
+    Args:
+        db: Database session
+        cloud_account_id: Cloud account UUID
+        region: Region the scenarios were evaluated in
+        rows: Evaluations with scenario, inputs_digest, evaluated_at and findings keys
+        chunk_size: Rows per INSERT ... ON CONFLICT statement
+
+    Returns:
+        Number of evaluations written
+    """
+    rows = [
+        {"id": uuid.uuid4(), "cloud_account_id": cloud_account_id, "region": region, **row}
+        for row in rows
+    ]
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(_upsert_statement(db, rows[start : start + chunk_size]))
+    await db.commit()
+    return len(rows)
@@ -93,6 +93,7 @@ app.add_middleware(
         "X-Requested-With",
         "X-CSRF-Token",
     ],
+    expose_headers=["X-Next-Cursor"],  # Keyset pagination cursor of resource listings
     max_age=settings.CORS_MAX_AGE,
 )
 
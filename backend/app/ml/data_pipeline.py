@@ -2,16 +2,23 @@
 ML Data Pipeline & ETL Service.
 
 Export and prepare ML training datasets from collected anonymized data.
+
+Exports stream rows from the database with a server-side cursor, one batch
+of `EXPORT_BATCH_SIZE` rows at a time, and write each batch straight to the
+output file (a Parquet row group, NDJSON/JSON lines or CSV rows), so memory
+stays bounded whatever the date range.
 """
 
+import csv
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import JSON, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql import Select
 
 from app.core.config import settings
 from app.models.cloudwatch_metrics_history import CloudWatchMetricsHistory
@@ -26,12 +33,213 @@ AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False  # type: ignore
 )
 
+# Rows fetched per server-side cursor round trip (and per Parquet row group)
+EXPORT_BATCH_SIZE = 5000
+
+# File extension per export format
+EXPORT_EXTENSIONS = {"json": "json", "jsonl": "jsonl", "csv": "csv", "parquet": "parquet"}
+
+# Last exported created_at per dataset, for incremental exports
+WATERMARKS_FILENAME = ".export_watermarks.json"
+
+# How far incremental exports stay behind the database clock. created_at is
+# the inserting transaction's start time (the ML collector inserts a whole scan
+# in one transaction, bounded by the Celery task time limit), so rows created
+# within this margin may not be committed yet: they go to the next export.
+EXPORT_WATERMARK_MARGIN = timedelta(hours=1)
+
+ML_TRAINING_FIELDS = [
+    "resource_type",
+    "provider",
+    "region_anonymized",
+    "resource_age_days",
+    "detection_scenario",
+    "metrics_summary",
+    "cost_monthly",
+    "confidence_level",
+    "user_action",
+    "resource_config",
+    "detected_at",
+]
+
+USER_ACTION_FIELDS = [
+    "user_hash",
+    "resource_type",
+    "provider",
+    "detection_scenario",
+    "confidence_level",
+    "action_taken",
+    "time_to_action_hours",
+    "cost_monthly",
+    "cost_saved_monthly",
+    "industry_anonymized",
+    "company_size_bucket",
+    "detected_at",
+    "action_at",
+]
+
+COST_TREND_FIELDS = [
+    "account_hash",
+    "month",
+    "provider",
+    "total_spend",
+    "waste_detected",
+    "waste_eliminated",
+    "waste_percentage",
+    "top_waste_categories",
+    "total_resources_scanned",
+    "orphan_resources_found",
+    "regional_breakdown",
+    "scan_count",
+]
+
+
+async def _stream_batches(
+    query: Select, batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Yield the rows of a column query as lists of dicts, batch by batch (server-side cursor)."""
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.mappings().partitions(batch_size):
+            yield [dict(row) for row in partition]
+
+
+def _json_value(value: Any) -> Any:
+    """Convert a column value to its JSON/CSV representation."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+async def _write_json(
+    filepath: Path, batches: AsyncIterator[List[Dict[str, Any]]], lines: bool
+) -> int:
+    """Write rows as newline-delimited JSON (lines=True) or as one JSON array."""
+    count = 0
+    with open(filepath, "w") as f:
+        if not lines:
+            f.write("[")
+        async for batch in batches:
+            for row in batch:
+                record = json.dumps({k: _json_value(v) for k, v in row.items()})
+                if lines:
+                    f.write(record + "\n")
+                else:
+                    f.write(("," if count else "") + "\n" + record)
+                count += 1
+        if not lines:
+            f.write("\n]\n")
+    return count
+
+
+async def _write_csv(
+    filepath: Path, batches: AsyncIterator[List[Dict[str, Any]]], fieldnames: List[str]
+) -> int:
+    """Write rows as CSV (columns outside fieldnames, e.g. nested JSON, are dropped)."""
+    count = 0
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+        async for batch in batches:
+            writer.writerows({k: _json_value(v) for k, v in row.items()} for row in batch)
+            count += len(batch)
+    return count
+
+
+async def _write_parquet(
+    filepath: Path, batches: AsyncIterator[List[Dict[str, Any]]], columns: Sequence[Any]
+) -> int:
+    """Write rows as Parquet, one row group per batch (nested JSON columns as strings)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_types = {
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        datetime: pa.timestamp("us"),
+    }
+    json_columns = {column.key for column in columns if isinstance(column.type, JSON)}
+    schema = pa.schema(
+        [
+            (
+                column.key,
+                pa.string()
+                if column.key in json_columns
+                else arrow_types.get(column.type.python_type, pa.string()),
+            )
+            for column in columns
+        ]
+    )
+
+    count = 0
+    with pq.ParquetWriter(str(filepath), schema) as writer:
+        async for batch in batches:
+            for row in batch:
+                for key in json_columns:
+                    if row[key] is not None:
+                        row[key] = json.dumps(row[key])
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+async def _export_query(
+    name: str,
+    columns: Sequence[Any],
+    query: Select,
+    output_format: str,
+    output_dir: str,
+    csv_fields: List[str],
+) -> tuple[str, int]:
+    """
+    Stream a column query into an export file.
+
+    Args:
+        name: Dataset name (file name prefix)
+        columns: Selected model columns (in output order)
+        query: Select of those columns
+        output_format: json, jsonl, csv or parquet
+        output_dir: Directory to save export files
+        csv_fields: Columns kept in CSV exports
+
+    Returns:
+        Tuple of (file path, number of rows exported)
+    """
+    if output_format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("⚠️ pyarrow not installed, exporting JSON lines instead of Parquet")
+            output_format = "jsonl"
+    if output_format not in EXPORT_EXTENSIONS:
+        # JSON is default fallback
+        output_format = "json"
+
+    # Create output directory if it doesn't exist
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate filename with timestamp
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filepath = output_path / f"{name}_{timestamp}.{EXPORT_EXTENSIONS[output_format]}"
+
+    batches = _stream_batches(query)
+    if output_format == "parquet":
+        count = await _write_parquet(filepath, batches, columns)
+    elif output_format == "csv":
+        count = await _write_csv(filepath, batches, csv_fields)
+    else:
+        count = await _write_json(filepath, batches, lines=output_format == "jsonl")
+
+    return str(filepath), count
+
 
 async def export_ml_training_dataset(
     start_date: datetime,
     end_date: datetime,
     output_format: str = "json",
     output_dir: str = "/tmp/cloudwaste_ml_exports",
+    since: datetime | None = None,
+    until: datetime | None = None,
 ) -> str:
     """
     Export ML training dataset for waste prediction models.
@@ -39,82 +247,34 @@ async def export_ml_training_dataset(
     Args:
         start_date: Start date for data export
         end_date: End date for data export
-        output_format: Format for export (json, csv, parquet)
+        output_format: Format for export (json, jsonl, csv, parquet)
         output_dir: Directory to save export files
+        since: Only records created after this watermark (incremental export)
+        until: Only records created up to this time
 
     Returns:
         Path to exported file
     """
-    async with AsyncSessionLocal() as db:
-        # Query ml_training_data
-        result = await db.execute(
-            select(MLTrainingData)
-            .where(MLTrainingData.detected_at >= start_date)
-            .where(MLTrainingData.detected_at <= end_date)
-            .order_by(MLTrainingData.detected_at.desc())
-        )
-        ml_records = result.scalars().all()
-
-        # Convert to dictionaries
-        dataset = []
-        for record in ml_records:
-            dataset.append(
-                {
-                    "resource_type": record.resource_type,
-                    "provider": record.provider,
-                    "region_anonymized": record.region_anonymized,
-                    "resource_age_days": record.resource_age_days,
-                    "detection_scenario": record.detection_scenario,
-                    "metrics_summary": record.metrics_summary,
-                    "cost_monthly": record.cost_monthly,
-                    "confidence_level": record.confidence_level,
-                    "user_action": record.user_action,
-                    "resource_config": record.resource_config,
-                    "detected_at": record.detected_at.isoformat(),
-                }
-            )
+    columns = [getattr(MLTrainingData, field) for field in ML_TRAINING_FIELDS]
+    query = (
+        select(*columns)
+        .where(MLTrainingData.detected_at >= start_date)
+        .where(MLTrainingData.detected_at <= end_date)
+        .order_by(MLTrainingData.detected_at.desc())
+    )
+    if since:
+        query = query.where(MLTrainingData.created_at > since)
+    if until:
+        query = query.where(MLTrainingData.created_at <= until)
+
+    # Flatten nested JSON fields for CSV
+    csv_fields = [f for f in ML_TRAINING_FIELDS if f not in ("metrics_summary", "resource_config")]
+    filepath, count = await _export_query(
+        "ml_training_data", columns, query, output_format, output_dir, csv_fields
+    )
 
-        # Create output directory if it doesn't exist
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ml_training_data_{timestamp}.{output_format}"
-        filepath = output_path / filename
-
-        # Export based on format
-        if output_format == "json":
-            with open(filepath, "w") as f:
-                json.dump(dataset, f, indent=2)
-        elif output_format == "csv":
-            # Flatten nested JSON fields for CSV
-            import csv
-
-            if dataset:
-                with open(filepath, "w", newline="") as f:
-                    # Get all fields (excluding complex nested structures)
-                    fieldnames = [
-                        "resource_type",
-                        "provider",
-                        "region_anonymized",
-                        "resource_age_days",
-                        "detection_scenario",
-                        "cost_monthly",
-                        "confidence_level",
-                        "user_action",
-                        "detected_at",
-                    ]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                    writer.writeheader()
-                    writer.writerows(dataset)
-        else:
-            # JSON is default fallback
-            with open(filepath, "w") as f:
-                json.dump(dataset, f, indent=2)
-
-        print(f"✅ Exported {len(dataset)} ML training records to {filepath}")
-        return str(filepath)
+    print(f"✅ Exported {count} ML training records to {filepath}")
+    return filepath
 
 
 async def export_user_action_patterns(
@@ -122,6 +282,8 @@ async def export_user_action_patterns(
     end_date: datetime,
     output_format: str = "json",
     output_dir: str = "/tmp/cloudwaste_ml_exports",
+    since: datetime | None = None,
+    until: datetime | None = None,
 ) -> str:
     """
     Export user action patterns for recommendation models.
@@ -129,67 +291,32 @@ async def export_user_action_patterns(
     Args:
         start_date: Start date for data export
         end_date: End date for data export
-        output_format: Format for export (json, csv)
+        output_format: Format for export (json, jsonl, csv, parquet)
         output_dir: Directory to save export files
+        since: Only records created after this watermark (incremental export)
+        until: Only records created up to this time
 
     Returns:
         Path to exported file
     """
-    async with AsyncSessionLocal() as db:
-        # Query user_action_patterns
-        result = await db.execute(
-            select(UserActionPattern)
-            .where(UserActionPattern.action_at >= start_date)
-            .where(UserActionPattern.action_at <= end_date)
-            .order_by(UserActionPattern.action_at.desc())
-        )
-        action_records = result.scalars().all()
-
-        # Convert to dictionaries
-        dataset = []
-        for record in action_records:
-            dataset.append(
-                {
-                    "user_hash": record.user_hash,
-                    "resource_type": record.resource_type,
-                    "provider": record.provider,
-                    "detection_scenario": record.detection_scenario,
-                    "confidence_level": record.confidence_level,
-                    "action_taken": record.action_taken,
-                    "time_to_action_hours": record.time_to_action_hours,
-                    "cost_monthly": record.cost_monthly,
-                    "cost_saved_monthly": record.cost_saved_monthly,
-                    "industry_anonymized": record.industry_anonymized,
-                    "company_size_bucket": record.company_size_bucket,
-                    "detected_at": record.detected_at.isoformat(),
-                    "action_at": record.action_at.isoformat(),
-                }
-            )
-
-        # Create output directory
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"user_action_patterns_{timestamp}.{output_format}"
-        filepath = output_path / filename
-
-        # Export
-        if output_format == "json":
-            with open(filepath, "w") as f:
-                json.dump(dataset, f, indent=2)
-        elif output_format == "csv":
-            import csv
+    columns = [getattr(UserActionPattern, field) for field in USER_ACTION_FIELDS]
+    query = (
+        select(*columns)
+        .where(UserActionPattern.action_at >= start_date)
+        .where(UserActionPattern.action_at <= end_date)
+        .order_by(UserActionPattern.action_at.desc())
+    )
+    if since:
+        query = query.where(UserActionPattern.created_at > since)
+    if until:
+        query = query.where(UserActionPattern.created_at <= until)
 
-            if dataset:
-                with open(filepath, "w", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=dataset[0].keys())
-                    writer.writeheader()
-                    writer.writerows(dataset)
+    filepath, count = await _export_query(
+        "user_action_patterns", columns, query, output_format, output_dir, USER_ACTION_FIELDS
+    )
 
-        print(f"✅ Exported {len(dataset)} user action patterns to {filepath}")
-        return str(filepath)
+    print(f"✅ Exported {count} user action patterns to {filepath}")
+    return filepath
 
 
 async def export_cost_trends(
@@ -200,83 +327,34 @@ async def export_cost_trends(
     """
     Export cost trend data for forecasting models.
 
+    Cost trends are updated in place (one row per account and month), so
+    they are always exported in full for the requested months.
+
     Args:
         months: Number of months to export (default: 12)
-        output_format: Format for export (json, csv)
+        output_format: Format for export (json, jsonl, csv, parquet)
         output_dir: Directory to save export files
 
     Returns:
         Path to exported file
     """
-    async with AsyncSessionLocal() as db:
-        # Calculate start month
-        end_month = datetime.now().strftime("%Y-%m")
-        start_date = datetime.now() - timedelta(days=months * 30)
-        start_month = start_date.strftime("%Y-%m")
-
-        # Query cost_trend_data
-        result = await db.execute(
-            select(CostTrendData).where(CostTrendData.month >= start_month).order_by(CostTrendData.month)
-        )
-        cost_records = result.scalars().all()
-
-        # Convert to dictionaries
-        dataset = []
-        for record in cost_records:
-            dataset.append(
-                {
-                    "account_hash": record.account_hash,
-                    "month": record.month,
-                    "provider": record.provider,
-                    "total_spend": record.total_spend,
-                    "waste_detected": record.waste_detected,
-                    "waste_eliminated": record.waste_eliminated,
-                    "waste_percentage": record.waste_percentage,
-                    "top_waste_categories": record.top_waste_categories,
-                    "total_resources_scanned": record.total_resources_scanned,
-                    "orphan_resources_found": record.orphan_resources_found,
-                    "regional_breakdown": record.regional_breakdown,
-                    "scan_count": record.scan_count,
-                }
-            )
+    # Calculate start month
+    start_date = datetime.now() - timedelta(days=months * 30)
+    start_month = start_date.strftime("%Y-%m")
+
+    columns = [getattr(CostTrendData, field) for field in COST_TREND_FIELDS]
+    query = select(*columns).where(CostTrendData.month >= start_month).order_by(CostTrendData.month)
+
+    # Flatten for CSV (exclude complex JSON fields)
+    csv_fields = [
+        f for f in COST_TREND_FIELDS if f not in ("top_waste_categories", "regional_breakdown")
+    ]
+    filepath, count = await _export_query(
+        "cost_trends", columns, query, output_format, output_dir, csv_fields
+    )
 
-        # Create output directory
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"cost_trends_{timestamp}.{output_format}"
-        filepath = output_path / filename
-
-        # Export
-        if output_format == "json":
-            with open(filepath, "w") as f:
-                json.dump(dataset, f, indent=2)
-        elif output_format == "csv":
-            import csv
-
-            if dataset:
-                with open(filepath, "w", newline="") as f:
-                    # Flatten for CSV (exclude complex JSON fields)
-                    fieldnames = [
-                        "account_hash",
-                        "month",
-                        "provider",
-                        "total_spend",
-                        "waste_detected",
-                        "waste_eliminated",
-                        "waste_percentage",
-                        "total_resources_scanned",
-                        "orphan_resources_found",
-                        "scan_count",
-                    ]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                    writer.writeheader()
-                    writer.writerows(dataset)
-
-        print(f"✅ Exported {len(dataset)} cost trend records to {filepath}")
-        return str(filepath)
+    print(f"✅ Exported {count} cost trend records to {filepath}")
+    return filepath
 
 
 async def validate_data_quality(dataset: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -339,16 +417,41 @@ async def validate_data_quality(dataset: List[Dict[str, Any]]) -> Dict[str, Any]
     }
 
 
+def _load_watermarks(output_dir: str) -> Dict[str, datetime]:
+    """Read the incremental export watermarks of an export directory."""
+    path = Path(output_dir) / WATERMARKS_FILENAME
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return {name: datetime.fromisoformat(value) for name, value in json.load(f).items()}
+
+
+def _save_watermarks(output_dir: str, watermarks: Dict[str, datetime]) -> None:
+    """Write the incremental export watermarks of an export directory."""
+    path = Path(output_dir) / WATERMARKS_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({name: value.isoformat() for name, value in watermarks.items()}, f)
+
+
 async def export_all_ml_datasets(
     output_format: str = "json",
     output_dir: str = "/tmp/cloudwaste_ml_exports",
+    incremental: bool = False,
 ) -> Dict[str, str]:
     """
     Export all ML datasets (training data, user actions, cost trends).
 
+    With incremental=True, training data and user actions only include the
+    records created since the previous incremental export into the same
+    directory (watermarks are kept in WATERMARKS_FILENAME there), up to
+    EXPORT_WATERMARK_MARGIN before now: each record is exported exactly once,
+    after the transaction that inserted it has committed.
+
     Args:
-        output_format: Format for export (json, csv)
+        output_format: Format for export (json, jsonl, csv, parquet)
         output_dir: Directory to save export files
+        incremental: Only export records created since the last export
 
     Returns:
         Dictionary with paths to all exported files
@@ -356,6 +459,13 @@ async def export_all_ml_datasets(
     end_date = datetime.now()
     start_date = end_date - timedelta(days=90)  # Last 90 days
 
+    watermarks: Dict[str, datetime] = _load_watermarks(output_dir) if incremental else {}
+    # Upper bound read from the database clock, which also sets created_at
+    async with AsyncSessionLocal() as db:
+        until = (await db.execute(select(func.localtimestamp()))).scalar_one()
+    if incremental:
+        until -= EXPORT_WATERMARK_MARGIN
+
     results = {}
 
     # Export ML training data
@@ -364,6 +474,8 @@ async def export_all_ml_datasets(
         end_date=end_date,
         output_format=output_format,
         output_dir=output_dir,
+        since=watermarks.get("ml_training_data"),
+        until=until,
     )
 
     # Export user action patterns
@@ -372,6 +484,8 @@ async def export_all_ml_datasets(
         end_date=end_date,
         output_format=output_format,
         output_dir=output_dir,
+        since=watermarks.get("user_action_patterns"),
+        until=until,
     )
 
     # Export cost trends (last 12 months)
@@ -379,5 +493,10 @@ async def export_all_ml_datasets(
         months=12, output_format=output_format, output_dir=output_dir
     )
 
+    if incremental:
+        _save_watermarks(
+            output_dir, {"ml_training_data": until, "user_action_patterns": until}
+        )
+
     print(f"✅ All ML datasets exported to {output_dir}")
     return results
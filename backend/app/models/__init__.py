@@ -4,6 +4,10 @@ from app.models.user import User
 from app.models.cloud_account import CloudAccount
 from app.models.scan import Scan
 from app.models.orphan_resource import OrphanResource
+from app.models.orphan_resource_archive import OrphanResourceArchive
+from app.models.orphan_resource_change import OrphanResourceChange
+from app.models.impact_rollup import ImpactRollup
+from app.models.scenario_evaluation import ScenarioEvaluation
 from app.models.all_cloud_resource import AllCloudResource
 from app.models.detection_rule import DetectionRule
 from app.models.chat import ChatConversation, ChatMessage
@@ -22,6 +26,10 @@ __all__ = [
     "CloudAccount",
     "Scan",
     "OrphanResource",
+    "OrphanResourceArchive",
+    "OrphanResourceChange",
+    "ImpactRollup",
+    "ScenarioEvaluation",
     "AllCloudResource",
     "DetectionRule",
     "ChatConversation",
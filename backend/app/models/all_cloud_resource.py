@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Boolean
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Boolean
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -45,6 +45,17 @@ class AllCloudResource(Base):
     """
 
     __tablename__ = "all_cloud_resources"
+    __table_args__ = (
+        # Keyset pagination of an account's resources per sort key (see app.crud.pagination)
+        Index(
+            "ix_all_cloud_resources_account_cost_id",
+            "cloud_account_id",
+            "estimated_monthly_cost",
+            "id",
+        ),
+        Index("ix_all_cloud_resources_account_type_id", "cloud_account_id", "resource_type", "id"),
+        Index("ix_all_cloud_resources_account_region_id", "cloud_account_id", "region", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -72,6 +72,27 @@ class CloudAccount(Base):
     last_scan_at: Mapped[datetime | None] = mapped_column(
         nullable=True,
     )
+    # Latest completed scans, set when a scan completes (see app.crud.scan.set_latest_scan)
+    latest_orphan_scan_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "scans.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_cloud_accounts_latest_orphan_scan_id",
+        ),
+        nullable=True,
+    )
+    latest_inventory_scan_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey(
+            "scans.id",
+            ondelete="SET NULL",
+            use_alter=True,
+            name="fk_cloud_accounts_latest_inventory_scan_id",
+        ),
+        nullable=True,
+    )
 
     # Scheduled scan settings
     scheduled_scan_enabled: Mapped[bool] = mapped_column(
@@ -113,6 +134,7 @@ class CloudAccount(Base):
     scans: Mapped[list["Scan"]] = relationship(  # type: ignore
         "Scan",
         back_populates="cloud_account",
+        foreign_keys="Scan.cloud_account_id",
         cascade="all, delete-orphan",
     )
     orphan_resources: Mapped[list["OrphanResource"]] = relationship(  # type: ignore
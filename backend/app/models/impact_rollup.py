@@ -0,0 +1,135 @@
+"""Impact rollup database model (pre-aggregated orphan resource totals)."""
+
+import uuid
+from datetime import date, datetime
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ImpactRollup(Base):
+    """
+    Orphan resource totals per account, type, region, status and day.
+
+    The /impact endpoints used to load every OrphanResource a user ever had
+    on each request. This table holds the same numbers pre-aggregated: one
+    row per (cloud account, resource type, region, status, detection day,
+    last status change day), kept up to date when scan results are written,
+    when a resource status changes and when findings are deleted
+    (see app.crud.impact_rollup).
+
+    Counts and sums are exact. max_monthly_cost, min_cleanup_hours and
+    last_changed_at only ever grow (or shrink, for the minimum) between
+    rebuilds of the account, since a removed resource cannot be subtracted
+    from them.
+    """
+
+    __tablename__ = "impact_rollups"
+    __table_args__ = (
+        Index(
+            "ix_impact_rollups_key",
+            "cloud_account_id",
+            "resource_type",
+            "region",
+            "status",
+            "detected_on",
+            "changed_on",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    cloud_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("cloud_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    provider: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    resource_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    region: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+    )
+    # Day the resources were detected (OrphanResource.created_at)
+    detected_on: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+    # Day of the last status change (OrphanResource.updated_at), i.e. the
+    # cleanup day for deleted resources
+    changed_on: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+
+    # Aggregates
+    resource_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    monthly_cost: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+    # Cost accrued before detection (resource_metadata.age_days * daily cost)
+    wasted_cost: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+    age_days_total: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+    age_days_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    max_monthly_cost: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        default=0.0,
+    )
+    # Fastest detection-to-status-change time (hours)
+    min_cleanup_hours: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    last_changed_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<ImpactRollup {self.resource_type}:{self.region}:{self.status} "
+            f"x{self.resource_count}>"
+        )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -25,6 +25,20 @@ class OrphanResource(Base):
     """Orphan resource model."""
 
     __tablename__ = "orphan_resources"
+    __table_args__ = (
+        # Covers the listings and statistics of the latest scans (filter, group, sort)
+        Index(
+            "ix_orphan_resources_scan_status_type_cost",
+            "scan_id",
+            "status",
+            "resource_type",
+            "estimated_monthly_cost",
+        ),
+        # Keyset pagination of the latest scan's resources per sort key (see app.crud.pagination)
+        Index("ix_orphan_resources_scan_cost_id", "scan_id", "estimated_monthly_cost", "id"),
+        Index("ix_orphan_resources_scan_type_id", "scan_id", "resource_type", "id"),
+        Index("ix_orphan_resources_scan_region_id", "scan_id", "region", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -78,6 +92,11 @@ class OrphanResource(Base):
         nullable=False,
         index=True,
     )
+    # Hash of the finding (see app.crud.orphan_resource_change.finding_fingerprint)
+    fingerprint: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(),
         nullable=False,
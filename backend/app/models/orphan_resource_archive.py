@@ -0,0 +1,87 @@
+"""Orphan resource archive database model (detail rows of compacted scans)."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Float, String
+from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class OrphanResourceArchive(Base):
+    """
+    Orphan resources of scans compacted by the retention job.
+
+    When SCAN_RETENTION_ARCHIVE_DETAILS is enabled, the retention job moves
+    the orphan resources of old scans here instead of only deleting them
+    (see app.crud.scan_retention), keeping orphan_resources small.
+
+    On PostgreSQL the table is partitioned by month of scan_created_at; the
+    retention job creates the monthly partitions it needs. No foreign keys:
+    archived rows outlive their scan and cloud account rows.
+    """
+
+    __tablename__ = "orphan_resources_archive"
+    __table_args__ = {"postgresql_partition_by": "RANGE (scan_created_at)"}
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+    )
+    # Partition key (part of the primary key, as PostgreSQL requires)
+    scan_created_at: Mapped[datetime] = mapped_column(
+        primary_key=True,
+    )
+    scan_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        index=True,
+    )
+    cloud_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        index=True,
+    )
+    resource_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    resource_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    resource_name: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    region: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    estimated_monthly_cost: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+    resource_metadata: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(30),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+    )
+    archived_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<OrphanResourceArchive {self.resource_type}:{self.resource_id}>"
@@ -0,0 +1,95 @@
+"""Orphan resource change database model (findings diff between consecutive scans)."""
+
+import uuid
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Float, ForeignKey, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class ChangeType(str, Enum):
+    """Finding change type enumeration."""
+
+    ADDED = "added"  # Not found by the previous scan
+    CHANGED = "changed"  # Found with another cost or key metadata
+    REMOVED = "removed"  # Found by the previous scan only
+
+
+class OrphanResourceChange(Base):
+    """
+    Change of a finding between a differential scan and its base scan.
+
+    A differential scan (SCAN_DIFFERENTIAL_PERSISTENCE) only writes the
+    orphan resources added or changed since its base scan and takes over the
+    unchanged ones, so these rows are the scan's own history.
+    """
+
+    __tablename__ = "orphan_resource_changes"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    scan_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("scans.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    cloud_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("cloud_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # orphan_resources row written by the scan (None for removals)
+    orphan_resource_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
+    change_type: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    resource_type: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    resource_id: Mapped[str] = mapped_column(
+        String(255),
+        nullable=False,
+    )
+    resource_name: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+    )
+    region: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    estimated_monthly_cost: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+    )
+    previous_monthly_cost: Mapped[float | None] = mapped_column(
+        Float,
+        nullable=True,
+    )
+    fingerprint: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<OrphanResourceChange {self.change_type} {self.resource_type}:{self.resource_id}>"
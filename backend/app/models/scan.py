@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 
 from sqlalchemy import Float, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -87,6 +87,22 @@ class Scan(Base):
     completed_at: Mapped[datetime | None] = mapped_column(
         nullable=True,
     )
+    # Previous scan a differential scan was compared with: findings unchanged
+    # since then were moved from it (see app.crud.orphan_resource_change)
+    base_scan_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("scans.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    # Set when the scan's resources were removed by the retention job (see
+    # app.crud.scan_retention); summary then keeps the counts and costs per type/region
+    compacted_at: Mapped[datetime | None] = mapped_column(
+        nullable=True,
+    )
+    summary: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(),
         nullable=False,
@@ -96,6 +112,7 @@ class Scan(Base):
     cloud_account: Mapped["CloudAccount"] = relationship(  # type: ignore
         "CloudAccount",
         back_populates="scans",
+        foreign_keys=[cloud_account_id],
     )
     orphan_resources: Mapped[list["OrphanResource"]] = relationship(  # type: ignore
         "OrphanResource",
@@ -0,0 +1,70 @@
+"""Scenario evaluation database model (last verdicts reused by incremental scans)."""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ScenarioEvaluation(Base):
+    """
+    Last full evaluation of a metric-based scenario in one region of an account.
+
+    Incremental scans (SCAN_INCREMENTAL_SCHEDULED) compare the change
+    markers of the scenario's input resources with inputs_digest: while they
+    are unchanged and the evaluation is recent enough, the findings stored
+    here are reused instead of querying the metrics again
+    (see app.providers.incremental).
+    """
+
+    __tablename__ = "scenario_evaluations"
+    __table_args__ = (
+        Index(
+            "ix_scenario_evaluations_key",
+            "cloud_account_id",
+            "region",
+            "scenario",
+            unique=True,
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
+    cloud_account_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("cloud_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    region: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+    )
+    # Provider method name of the scenario (e.g., 'scan_idle_running_instances')
+    scenario: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+    )
+    # Hash of the change markers of the scenario's input resources
+    inputs_digest: Mapped[str] = mapped_column(
+        String(64),
+        nullable=False,
+    )
+    # Findings of the evaluation (see OrphanResourceData.to_dict)
+    findings: Mapped[list] = mapped_column(
+        JSON,
+        nullable=False,
+    )
+    evaluated_at: Mapped[datetime] = mapped_column(
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<ScenarioEvaluation {self.region}:{self.scenario}>"
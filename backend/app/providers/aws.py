@@ -10,7 +10,13 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError, EndpointConnectionError, ConnectionError
 
+from app.core.config import settings
+from app.providers.aws_client_pool import AWSClientPool
+from app.providers.aws_metrics import CloudWatchMetricCollector, MetricQuery
+from app.providers.aws_snapshot import EC2RegionSnapshot
 from app.providers.base import CloudProviderBase, OrphanResourceData
+from app.providers.incremental import record_scenario_error
+from app.services.pricing_service import PriceTable
 
 # Logger for AWS connectivity debugging
 logger = logging.getLogger(__name__)
@@ -228,12 +234,30 @@ class AWSProvider(CloudProviderBase):
         # CloudFormation pricing (CloudFormation itself is FREE - only underlying resources cost money)
     }
 
+    # CloudWatch-based scenarios reusing their last verdict in incremental
+    # scans while these resources are unchanged (markers from EC2RegionSnapshot)
+    INCREMENTAL_SCENARIO_INPUTS: dict[str, tuple[str, ...]] = {
+        "scan_unattached_volumes": ("ebs_volume",),
+        "scan_low_iops_usage_volumes": ("ebs_volume",),
+        "scan_low_throughput_usage_volumes": ("ebs_volume",),
+        "scan_volume_type_downgrade_opportunities": ("ebs_volume",),
+        "scan_idle_eips": ("elastic_ip", "ec2_instance"),
+        "scan_low_traffic_eips": ("elastic_ip", "ec2_instance"),
+        "scan_eips_on_failed_instances": ("elastic_ip", "ec2_instance"),
+        "scan_oversized_instances": ("ec2_instance",),
+        "scan_burstable_credit_waste": ("ec2_instance",),
+        "scan_idle_running_instances": ("ec2_instance",),
+        "scan_spot_eligible_workloads": ("ec2_instance",),
+        "scan_scheduled_unused_instances": ("ec2_instance",),
+    }
+
     def __init__(
         self,
         access_key: str,
         secret_key: str,
         regions: list[str] | None = None,
         pricing_service: Any | None = None,
+        price_table: PriceTable | None = None,
     ) -> None:
         """
         Initialize AWS provider.
@@ -243,6 +267,7 @@ class AWSProvider(CloudProviderBase):
             secret_key: AWS Secret Access Key
             regions: List of AWS regions to scan (None = all regions)
             pricing_service: Optional PricingService for dynamic pricing (uses hardcoded fallback if None)
+            price_table: Optional price snapshot loaded at scan start (checked before pricing_service)
         """
         super().__init__(access_key, secret_key, regions)
 
@@ -258,11 +283,70 @@ class AWSProvider(CloudProviderBase):
             aws_secret_access_key=secret_key,
         )
 
+        # Long-lived clients, one per (service, region), shared by every scenario of the scan
+        self.client_pool = AWSClientPool(
+            self.session, self.config, max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS
+        )
+
         # Store pricing service for dynamic pricing
         self.pricing_service = pricing_service
 
+        # Prices snapshotted at scan start: cost calculations are in-memory lookups
+        self.price_table = price_table
+
+        # Per-region EC2 describe snapshots shared by all scenarios of this scan
+        self._ec2_snapshots: dict[str, EC2RegionSnapshot] = {}
+
+        # Per-region CloudWatch collectors batching metric lookups through GetMetricData
+        self._metric_collectors: dict[str, CloudWatchMetricCollector] = {}
+
         logger.info(f"AWSProvider initialized with config: connect_timeout=90s, read_timeout=90s, retries=5 (adaptive)")
 
+    async def close(self) -> None:
+        """Close pooled AWS clients and their connections."""
+        await self.client_pool.close()
+
+    def _ec2_snapshot(self, region: str) -> EC2RegionSnapshot:
+        """
+        Get the shared EC2 describe snapshot for a region.
+
+        Volumes, instances, snapshots and Elastic IPs are listed once per
+        region and scan, then filtered in memory by each scenario.
+
+        Args:
+            region: AWS region name
+
+        Returns:
+            EC2RegionSnapshot for the region
+        """
+        if region not in self._ec2_snapshots:
+            self._ec2_snapshots[region] = EC2RegionSnapshot(self.client_pool, region, self.config)
+        return self._ec2_snapshots[region]
+
+    async def resource_change_markers(
+        self, region: str, resource_types: list[str]
+    ) -> dict[str, dict[str, str]]:
+        """
+        Collect change markers of EBS volumes, EC2 instances and Elastic IPs.
+
+        Markers come from the region's EC2 snapshot, whose describe calls the
+        scenarios need anyway.
+
+        Args:
+            region: AWS region name
+            resource_types: Resource types to collect markers for
+
+        Returns:
+            Resource type -> {resource ID: change marker} (supported types only)
+        """
+        snapshot = self._ec2_snapshot(region)
+        markers = {}
+        for resource_type in resource_types:
+            type_markers = await snapshot.change_markers(resource_type)
+            if type_markers is not None:
+                markers[resource_type] = type_markers
+        return markers
+
     def _safe_datetime_age(
         self,
         created_at: Any,
@@ -333,7 +417,7 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Use explicit endpoint URL to bypass potential DNS/routing issues
-            async with self.session.client(
+            async with self.client_pool.client(
                 "sts",
                 region_name="us-east-1",
                 endpoint_url="https://sts.us-east-1.amazonaws.com",
@@ -414,10 +498,120 @@ class AWSProvider(CloudProviderBase):
         Returns:
             List of region names (e.g., ['us-east-1', 'eu-west-1'])
         """
-        async with self.session.client("ec2", region_name="us-east-1", config=self.config) as ec2:
+        async with self.client_pool.client("ec2", region_name="us-east-1", config=self.config) as ec2:
             response = await ec2.describe_regions()
             return [region["RegionName"] for region in response["Regions"]]
 
+    def _metric_collector(self, region: str) -> CloudWatchMetricCollector:
+        """
+        Get the shared CloudWatch metric collector for a region.
+
+        All metric lookups of the scan go through GetMetricData batches of up
+        to 500 queries instead of one get_metric_statistics call per metric.
+
+        Args:
+            region: AWS region name
+
+        Returns:
+            CloudWatchMetricCollector for the region
+        """
+        if region not in self._metric_collectors:
+            self._metric_collectors[region] = CloudWatchMetricCollector(
+                self.client_pool, region, self.config
+            )
+        return self._metric_collectors[region]
+
+    def metric_cache_stats(self) -> dict[str, Any]:
+        """
+        Aggregate CloudWatch cache counters across the regions scanned so far.
+
+        Returns:
+            Dict with cache_hits, cache_misses, hit_rate and api_calls
+        """
+        hits = sum(c.cache_hits for c in self._metric_collectors.values())
+        misses = sum(c.cache_misses for c in self._metric_collectors.values())
+        return {
+            "cache_hits": hits,
+            "cache_misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "api_calls": sum(c.api_calls for c in self._metric_collectors.values()),
+        }
+
+    def _volume_usage_history_queries(
+        self, volume_id: str, region: str, created_at: datetime
+    ) -> list[MetricQuery]:
+        """Build the VolumeReadOps/VolumeWriteOps queries used by _check_volume_usage_history."""
+        collector = self._metric_collector(region)
+
+        # Check last 90 days of activity (or since creation if younger)
+        lookback_days = min(90, (collector.end_time - created_at).days)
+        start_time, end_time = collector.window(lookback_days)
+
+        return [
+            MetricQuery.create(
+                "AWS/EBS", metric_name, {"VolumeId": volume_id}, "Sum", start_time, end_time
+            )
+            for metric_name in ("VolumeReadOps", "VolumeWriteOps")
+        ]
+
+    def _volume_metric_queries(
+        self,
+        volume_id: str,
+        region: str,
+        metric_names: list[str],
+        period_days: int = 30,
+        statistic: str = "Average",
+    ) -> list[MetricQuery]:
+        """Build the EBS queries used by _get_volume_metrics (1 day aggregation)."""
+        start_time, end_time = self._metric_collector(region).window(period_days)
+        return [
+            MetricQuery.create(
+                "AWS/EBS", metric_name, {"VolumeId": volume_id}, statistic, start_time, end_time
+            )
+            for metric_name in metric_names
+        ]
+
+    def _nat_gateway_metric_queries(
+        self, nat_gateway_id: str, region: str, period_days: int = 30
+    ) -> list[MetricQuery]:
+        """Build the NAT Gateway queries used by _get_eip_nat_gateway_metrics."""
+        start_time, end_time = self._metric_collector(region).window(period_days)
+        metrics_to_fetch = [
+            ("BytesInFromSource", "Sum"),
+            ("BytesOutToDestination", "Sum"),
+            ("ActiveConnectionCount", "Average"),
+        ]
+        return [
+            MetricQuery.create(
+                "AWS/NATGateway",
+                metric_name,
+                {"NatGatewayId": nat_gateway_id},
+                statistic,
+                start_time,
+                end_time,
+            )
+            for metric_name, statistic in metrics_to_fetch
+        ]
+
+    def _ec2_network_metric_queries(
+        self, instance_id: str, region: str, period_days: int = 30
+    ) -> list[MetricQuery]:
+        """Build the EC2 network/status queries used by _get_ec2_network_metrics."""
+        start_time, end_time = self._metric_collector(region).window(period_days)
+        metric_names = [
+            "NetworkIn",
+            "NetworkOut",
+            "StatusCheckFailed",
+            "StatusCheckFailed_Instance",
+            "StatusCheckFailed_System",
+        ]
+        return [
+            MetricQuery.create(
+                "AWS/EC2", metric_name, {"InstanceId": instance_id}, "Sum", start_time, end_time
+            )
+            for metric_name in metric_names
+        ]
+
     async def _check_volume_usage_history(
         self, volume_id: str, region: str, created_at: datetime
     ) -> dict:
@@ -432,78 +626,55 @@ class AWSProvider(CloudProviderBase):
         - usage_category: str ("never_used", "recently_abandoned", "long_abandoned")
         """
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
-                now = datetime.now(timezone.utc)
-
-                # Check last 90 days of activity (or since creation if younger)
-                lookback_days = min(90, (now - created_at).days)
-                start_time = now - timedelta(days=lookback_days)
-
-                # Get VolumeReadOps metric
-                read_response = await cw.get_metric_statistics(
-                    Namespace="AWS/EBS",
-                    MetricName="VolumeReadOps",
-                    Dimensions=[{"Name": "VolumeId", "Value": volume_id}],
-                    StartTime=start_time,
-                    EndTime=now,
-                    Period=86400,  # 1 day
-                    Statistics=["Sum"],
-                )
-
-                # Get VolumeWriteOps metric
-                write_response = await cw.get_metric_statistics(
-                    Namespace="AWS/EBS",
-                    MetricName="VolumeWriteOps",
-                    Dimensions=[{"Name": "VolumeId", "Value": volume_id}],
-                    StartTime=start_time,
-                    EndTime=now,
-                    Period=86400,  # 1 day
-                    Statistics=["Sum"],
-                )
-
-                # Calculate total operations
-                read_datapoints = read_response.get("Datapoints", [])
-                write_datapoints = write_response.get("Datapoints", [])
-
-                total_read_ops = sum(dp["Sum"] for dp in read_datapoints)
-                total_write_ops = sum(dp["Sum"] for dp in write_datapoints)
-                total_ops = total_read_ops + total_write_ops
-
-                # Determine last active date
-                all_datapoints = read_datapoints + write_datapoints
-                last_active_date = None
-                if all_datapoints:
-                    # Find most recent datapoint with activity
-                    active_datapoints = [
-                        dp for dp in all_datapoints if dp.get("Sum", 0) > 0
-                    ]
-                    if active_datapoints:
-                        last_active_date = max(dp["Timestamp"] for dp in active_datapoints)
-
-                # Determine usage category
-                ever_used = total_ops > 0
-
-                if not ever_used:
-                    usage_category = "never_used"
-                elif last_active_date:
-                    days_since_last_use = (now - last_active_date).days
-                    if days_since_last_use < 7:
-                        usage_category = "recently_active"  # Not orphan
-                    elif days_since_last_use < 30:
-                        usage_category = "recently_abandoned"
-                    else:
-                        usage_category = "long_abandoned"
+            collector = self._metric_collector(region)
+            now = collector.end_time
+
+            read_query, write_query = self._volume_usage_history_queries(volume_id, region, created_at)
+            series = await collector.fetch([read_query, write_query])
+
+            # Calculate total operations
+            read_datapoints = series[read_query]
+            write_datapoints = series[write_query]
+
+            total_read_ops = sum(dp["Sum"] for dp in read_datapoints)
+            total_write_ops = sum(dp["Sum"] for dp in write_datapoints)
+            total_ops = total_read_ops + total_write_ops
+
+            # Determine last active date
+            all_datapoints = read_datapoints + write_datapoints
+            last_active_date = None
+            if all_datapoints:
+                # Find most recent datapoint with activity
+                active_datapoints = [
+                    dp for dp in all_datapoints if dp.get("Sum", 0) > 0
+                ]
+                if active_datapoints:
+                    last_active_date = max(dp["Timestamp"] for dp in active_datapoints)
+
+            # Determine usage category
+            ever_used = total_ops > 0
+
+            if not ever_used:
+                usage_category = "never_used"
+            elif last_active_date:
+                days_since_last_use = (now - last_active_date).days
+                if days_since_last_use < 7:
+                    usage_category = "recently_active"  # Not orphan
+                elif days_since_last_use < 30:
+                    usage_category = "recently_abandoned"
                 else:
-                    usage_category = "unknown"
+                    usage_category = "long_abandoned"
+            else:
+                usage_category = "unknown"
 
-                return {
-                    "ever_used": ever_used,
-                    "last_active_date": last_active_date.isoformat() if last_active_date else None,
-                    "total_read_ops": int(total_read_ops),
-                    "total_write_ops": int(total_write_ops),
-                    "usage_category": usage_category,
-                    "days_since_last_use": (now - last_active_date).days if last_active_date else None,
-                }
+            return {
+                "ever_used": ever_used,
+                "last_active_date": last_active_date.isoformat() if last_active_date else None,
+                "total_read_ops": int(total_read_ops),
+                "total_write_ops": int(total_write_ops),
+                "usage_category": usage_category,
+                "days_since_last_use": (now - last_active_date).days if last_active_date else None,
+            }
 
         except Exception as e:
             print(f"Error checking volume usage history for {volume_id}: {e}")
@@ -538,33 +709,24 @@ class AWSProvider(CloudProviderBase):
             Dict with metric_name → calculated value (averaged across period)
         """
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
-                now = datetime.now(timezone.utc)
-                start_time = now - timedelta(days=period_days)
-
-                results = {}
-                for metric_name in metric_names:
-                    response = await cw.get_metric_statistics(
-                        Namespace="AWS/EBS",
-                        MetricName=metric_name,
-                        Dimensions=[{"Name": "VolumeId", "Value": volume_id}],
-                        StartTime=start_time,
-                        EndTime=now,
-                        Period=86400,  # 1 day aggregation
-                        Statistics=[statistic],
-                    )
-
-                    datapoints = response.get("Datapoints", [])
-                    if datapoints:
-                        # Calculate average/sum across all datapoints
-                        if statistic == "Sum":
-                            results[metric_name] = sum(dp[statistic] for dp in datapoints)
-                        else:  # Average, Maximum, Minimum
-                            results[metric_name] = sum(dp[statistic] for dp in datapoints) / len(datapoints)
-                    else:
-                        results[metric_name] = 0.0
+            queries = self._volume_metric_queries(
+                volume_id, region, metric_names, period_days, statistic
+            )
+            series = await self._metric_collector(region).fetch(queries)
+
+            results = {}
+            for query in queries:
+                datapoints = series[query]
+                if datapoints:
+                    # Calculate average/sum across all datapoints
+                    if statistic == "Sum":
+                        results[query.metric_name] = sum(dp[statistic] for dp in datapoints)
+                    else:  # Average, Maximum, Minimum
+                        results[query.metric_name] = sum(dp[statistic] for dp in datapoints) / len(datapoints)
+                else:
+                    results[query.metric_name] = 0.0
 
-                return results
+            return results
 
         except Exception as e:
             print(f"Error fetching CloudWatch metrics for volume {volume_id}: {e}")
@@ -596,49 +758,31 @@ class AWSProvider(CloudProviderBase):
                 - total_traffic_gb: Total traffic in GB (bytes_in + bytes_out)
         """
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
-                now = datetime.now(timezone.utc)
-                start_time = now - timedelta(days=period_days)
-
-                # Fetch NAT Gateway metrics
-                metrics_to_fetch = [
-                    ("BytesInFromSource", "Sum"),
-                    ("BytesOutToDestination", "Sum"),
-                    ("ActiveConnectionCount", "Average"),
-                ]
-
-                results = {}
-                for metric_name, statistic in metrics_to_fetch:
-                    response = await cw.get_metric_statistics(
-                        Namespace="AWS/NATGateway",
-                        MetricName=metric_name,
-                        Dimensions=[{"Name": "NatGatewayId", "Value": nat_gateway_id}],
-                        StartTime=start_time,
-                        EndTime=now,
-                        Period=86400,  # 1 day aggregation
-                        Statistics=[statistic],
-                    )
-
-                    datapoints = response.get("Datapoints", [])
-                    if datapoints:
-                        if statistic == "Sum":
-                            results[metric_name] = sum(dp[statistic] for dp in datapoints)
-                        else:  # Average
-                            results[metric_name] = sum(dp[statistic] for dp in datapoints) / len(datapoints)
-                    else:
-                        results[metric_name] = 0.0
+            queries = self._nat_gateway_metric_queries(nat_gateway_id, region, period_days)
+            series = await self._metric_collector(region).fetch(queries)
+
+            results = {}
+            for query in queries:
+                datapoints = series[query]
+                if datapoints:
+                    if query.statistic == "Sum":
+                        results[query.metric_name] = sum(dp[query.statistic] for dp in datapoints)
+                    else:  # Average
+                        results[query.metric_name] = sum(dp[query.statistic] for dp in datapoints) / len(datapoints)
+                else:
+                    results[query.metric_name] = 0.0
 
-                # Calculate total traffic in GB
-                bytes_in = results.get("BytesInFromSource", 0.0)
-                bytes_out = results.get("BytesOutToDestination", 0.0)
-                total_traffic_gb = (bytes_in + bytes_out) / (1024 ** 3)  # Convert bytes to GB
+            # Calculate total traffic in GB
+            bytes_in = results.get("BytesInFromSource", 0.0)
+            bytes_out = results.get("BytesOutToDestination", 0.0)
+            total_traffic_gb = (bytes_in + bytes_out) / (1024 ** 3)  # Convert bytes to GB
 
-                return {
-                    "bytes_in_from_source": bytes_in,
-                    "bytes_out_to_destination": bytes_out,
-                    "active_connection_count": results.get("ActiveConnectionCount", 0.0),
-                    "total_traffic_gb": round(total_traffic_gb, 4),
-                }
+            return {
+                "bytes_in_from_source": bytes_in,
+                "bytes_out_to_destination": bytes_out,
+                "active_connection_count": results.get("ActiveConnectionCount", 0.0),
+                "total_traffic_gb": round(total_traffic_gb, 4),
+            }
 
         except Exception as e:
             print(f"Error fetching CloudWatch metrics for NAT Gateway {nat_gateway_id}: {e}")
@@ -678,50 +822,27 @@ class AWSProvider(CloudProviderBase):
                 - status_check_failed_system: System-level failures
         """
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
-                now = datetime.now(timezone.utc)
-                start_time = now - timedelta(days=period_days)
-
-                # Fetch EC2 network metrics
-                metrics_to_fetch = [
-                    ("NetworkIn", "Sum"),
-                    ("NetworkOut", "Sum"),
-                    ("StatusCheckFailed", "Sum"),
-                    ("StatusCheckFailed_Instance", "Sum"),
-                    ("StatusCheckFailed_System", "Sum"),
-                ]
-
-                results = {}
-                for metric_name, statistic in metrics_to_fetch:
-                    response = await cw.get_metric_statistics(
-                        Namespace="AWS/EC2",
-                        MetricName=metric_name,
-                        Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                        StartTime=start_time,
-                        EndTime=now,
-                        Period=86400,  # 1 day aggregation
-                        Statistics=[statistic],
-                    )
+            queries = self._ec2_network_metric_queries(instance_id, region, period_days)
+            series = await self._metric_collector(region).fetch(queries)
 
-                    datapoints = response.get("Datapoints", [])
-                    if datapoints:
-                        results[metric_name] = sum(dp[statistic] for dp in datapoints)
-                    else:
-                        results[metric_name] = 0.0
+            results = {
+                query.metric_name: sum(dp[query.statistic] for dp in series[query])
+                for query in queries
+            }
 
-                # Calculate total traffic in GB
-                network_in = results.get("NetworkIn", 0.0)
-                network_out = results.get("NetworkOut", 0.0)
-                total_traffic_gb = (network_in + network_out) / (1024 ** 3)  # Convert bytes to GB
+            # Calculate total traffic in GB
+            network_in = results.get("NetworkIn", 0.0)
+            network_out = results.get("NetworkOut", 0.0)
+            total_traffic_gb = (network_in + network_out) / (1024 ** 3)  # Convert bytes to GB
 
-                return {
-                    "network_in": network_in,
-                    "network_out": network_out,
-                    "total_traffic_gb": round(total_traffic_gb, 4),
-                    "status_check_failed": results.get("StatusCheckFailed", 0.0),
-                    "status_check_failed_instance": results.get("StatusCheckFailed_Instance", 0.0),
-                    "status_check_failed_system": results.get("StatusCheckFailed_System", 0.0),
-                }
+            return {
+                "network_in": network_in,
+                "network_out": network_out,
+                "total_traffic_gb": round(total_traffic_gb, 4),
+                "status_check_failed": results.get("StatusCheckFailed", 0.0),
+                "status_check_failed_instance": results.get("StatusCheckFailed_Instance", 0.0),
+                "status_check_failed_system": results.get("StatusCheckFailed_System", 0.0),
+            }
 
         except Exception as e:
             print(f"Error fetching CloudWatch metrics for instance {instance_id}: {e}")
@@ -745,6 +866,11 @@ class AWSProvider(CloudProviderBase):
         Returns:
             Price per unit (fallback to hardcoded if PricingService unavailable)
         """
+        if self.price_table is not None:
+            price = self.price_table.get("aws", service, region)
+            if price is not None:
+                return price
+
         if self.pricing_service:
             try:
                 return await self.pricing_service.get_aws_price(service, region)
@@ -873,178 +999,188 @@ class AWSProvider(CloudProviderBase):
         min_idle_days_attached = detection_rules.get("min_idle_days_attached", 30)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get ALL volumes (both available and in-use)
-                response = await ec2.describe_volumes()
-
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    volume_type = volume["VolumeType"]
-                    created_at = volume["CreateTime"]
-                    volume_state = volume["State"]  # 'available', 'in-use', etc.
-                    attachments = volume.get("Attachments", [])
-                    iops = volume.get("Iops")  # Provisioned IOPS (io1/io2/gp3)
-                    throughput = volume.get("Throughput")  # Provisioned throughput (gp3 only)
-
-                    # Determine if volume is attached
-                    is_attached = len(attachments) > 0 and volume_state == "in-use"
-                    attached_instance_id = None
-                    if is_attached:
-                        attached_instance_id = attachments[0].get("InstanceId")
-
-                    # Calculate volume age in days
-                    age_days = self._safe_datetime_age(created_at)
-
-                    # Skip if volume is too young
-                    if age_days < min_age_days:
-                        continue
-
-                    # Check usage history via CloudWatch
-                    usage_history = await self._check_volume_usage_history(
-                        volume_id, region, created_at
-                    )
-
-                    # Determine if this volume should be flagged as orphaned
-                    should_flag = False
-                    orphan_type = ""
-
-                    if not is_attached:
-                        # CASE 1: Unattached volume
-                        # Skip if volume was recently active (not orphaned)
-                        if usage_history["usage_category"] != "recently_active":
-                            should_flag = True
-                            orphan_type = "unattached"
-                    elif is_attached and detect_attached_unused:
-                        # CASE 2: Attached volume but unused
-                        # Check if there's no I/O activity for min_idle_days_attached
-                        days_since_last_use = usage_history.get("days_since_last_use")
-
-                        # Flag if never used OR idle for min_idle_days_attached
-                        if usage_history["usage_category"] == "never_used" and age_days >= min_idle_days_attached:
-                            should_flag = True
-                            orphan_type = "attached_never_used"
-                        elif days_since_last_use and days_since_last_use >= min_idle_days_attached:
-                            should_flag = True
-                            orphan_type = "attached_idle"
-
-                    # Skip if should not be flagged
-                    if not should_flag:
-                        continue
-
-                    # Calculate monthly cost using comprehensive cost calculator (includes IOPS + throughput)
-                    cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
-                    monthly_cost = cost_data["total_monthly_cost"]
-
-                    # Extract name from tags
-                    name = None
-                    for tag in volume.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+            # Get ALL volumes (both available and in-use)
+            response = await self._ec2_snapshot(region).describe_volumes()
+
+            # Fetch usage history of every candidate volume in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for volume in response.get("Volumes", [])
+                if self._safe_datetime_age(volume["CreateTime"]) >= min_age_days
+                for query in self._volume_usage_history_queries(
+                    volume["VolumeId"], region, volume["CreateTime"]
+                )
+            ])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                volume_type = volume["VolumeType"]
+                created_at = volume["CreateTime"]
+                volume_state = volume["State"]  # 'available', 'in-use', etc.
+                attachments = volume.get("Attachments", [])
+                iops = volume.get("Iops")  # Provisioned IOPS (io1/io2/gp3)
+                throughput = volume.get("Throughput")  # Provisioned throughput (gp3 only)
+
+                # Determine if volume is attached
+                is_attached = len(attachments) > 0 and volume_state == "in-use"
+                attached_instance_id = None
+                if is_attached:
+                    attached_instance_id = attachments[0].get("InstanceId")
+
+                # Calculate volume age in days
+                age_days = self._safe_datetime_age(created_at)
+
+                # Skip if volume is too young
+                if age_days < min_age_days:
+                    continue
+
+                # Check usage history via CloudWatch
+                usage_history = await self._check_volume_usage_history(
+                    volume_id, region, created_at
+                )
 
-                    # Determine confidence level and reason based on orphan type
-                    if orphan_type == "unattached":
-                        # Original logic for unattached volumes
-                        if usage_history["usage_category"] == "never_used" and age_days >= 30:
-                            confidence = "high"
-                            reason = f"Never used since creation {age_days} days ago"
-                        elif usage_history["usage_category"] == "long_abandoned":
-                            confidence = "high"
-                            days_abandoned = usage_history.get("days_since_last_use", 0)
-                            reason = f"No activity for {days_abandoned} days (was active before)"
-                        elif usage_history["usage_category"] == "recently_abandoned":
-                            confidence = "medium"
-                            days_abandoned = usage_history.get("days_since_last_use", 0)
-                            reason = f"No activity for {days_abandoned} days"
-                        elif usage_history["usage_category"] == "never_used" and age_days < 30:
-                            confidence = "low"
-                            reason = f"Created {age_days} days ago, never used yet (may be for future use)"
-                        else:
-                            # Unknown usage history (CloudWatch metrics unavailable)
-                            if age_days == 0:
-                                confidence = "low"
-                                reason = "Recently created (less than 24h), usage pattern unclear"
-                            elif age_days >= confidence_threshold_days:
-                                confidence = "medium"
-                                reason = f"Unattached for {age_days} days (usage history unavailable)"
-                            else:
-                                confidence = "low"
-                                reason = f"Unattached for {age_days} days (usage history unavailable)"
+                # Determine if this volume should be flagged as orphaned
+                should_flag = False
+                orphan_type = ""
 
-                    elif orphan_type == "attached_never_used":
-                        # Attached to an instance but NEVER used
-                        if age_days >= 60:
-                            confidence = "high"
-                            reason = f"Attached to {attached_instance_id} but never used in {age_days} days"
-                        elif age_days >= min_idle_days_attached:
-                            confidence = "medium"
-                            reason = f"Attached to {attached_instance_id} but never used in {age_days} days"
-                        else:
+                if not is_attached:
+                    # CASE 1: Unattached volume
+                    # Skip if volume was recently active (not orphaned)
+                    if usage_history["usage_category"] != "recently_active":
+                        should_flag = True
+                        orphan_type = "unattached"
+                elif is_attached and detect_attached_unused:
+                    # CASE 2: Attached volume but unused
+                    # Check if there's no I/O activity for min_idle_days_attached
+                    days_since_last_use = usage_history.get("days_since_last_use")
+
+                    # Flag if never used OR idle for min_idle_days_attached
+                    if usage_history["usage_category"] == "never_used" and age_days >= min_idle_days_attached:
+                        should_flag = True
+                        orphan_type = "attached_never_used"
+                    elif days_since_last_use and days_since_last_use >= min_idle_days_attached:
+                        should_flag = True
+                        orphan_type = "attached_idle"
+
+                # Skip if should not be flagged
+                if not should_flag:
+                    continue
+
+                # Calculate monthly cost using comprehensive cost calculator (includes IOPS + throughput)
+                cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
+                monthly_cost = cost_data["total_monthly_cost"]
+
+                # Extract name from tags
+                name = None
+                for tag in volume.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                # Determine confidence level and reason based on orphan type
+                if orphan_type == "unattached":
+                    # Original logic for unattached volumes
+                    if usage_history["usage_category"] == "never_used" and age_days >= 30:
+                        confidence = "high"
+                        reason = f"Never used since creation {age_days} days ago"
+                    elif usage_history["usage_category"] == "long_abandoned":
+                        confidence = "high"
+                        days_abandoned = usage_history.get("days_since_last_use", 0)
+                        reason = f"No activity for {days_abandoned} days (was active before)"
+                    elif usage_history["usage_category"] == "recently_abandoned":
+                        confidence = "medium"
+                        days_abandoned = usage_history.get("days_since_last_use", 0)
+                        reason = f"No activity for {days_abandoned} days"
+                    elif usage_history["usage_category"] == "never_used" and age_days < 30:
+                        confidence = "low"
+                        reason = f"Created {age_days} days ago, never used yet (may be for future use)"
+                    else:
+                        # Unknown usage history (CloudWatch metrics unavailable)
+                        if age_days == 0:
                             confidence = "low"
-                            reason = f"Attached to {attached_instance_id} but no I/O detected yet ({age_days} days old)"
-
-                    elif orphan_type == "attached_idle":
-                        # Attached but idle for extended period
-                        days_idle = usage_history.get("days_since_last_use", 0)
-                        if days_idle >= 60:
-                            confidence = "high"
-                            reason = f"Attached to {attached_instance_id} but idle for {days_idle} days (was active before)"
-                        elif days_idle >= min_idle_days_attached:
+                            reason = "Recently created (less than 24h), usage pattern unclear"
+                        elif age_days >= confidence_threshold_days:
                             confidence = "medium"
-                            reason = f"Attached to {attached_instance_id} but idle for {days_idle} days"
+                            reason = f"Unattached for {age_days} days (usage history unavailable)"
                         else:
                             confidence = "low"
-                            reason = f"Attached to {attached_instance_id} but no recent I/O activity"
+                            reason = f"Unattached for {age_days} days (usage history unavailable)"
 
+                elif orphan_type == "attached_never_used":
+                    # Attached to an instance but NEVER used
+                    if age_days >= 60:
+                        confidence = "high"
+                        reason = f"Attached to {attached_instance_id} but never used in {age_days} days"
+                    elif age_days >= min_idle_days_attached:
+                        confidence = "medium"
+                        reason = f"Attached to {attached_instance_id} but never used in {age_days} days"
                     else:
-                        # Fallback
                         confidence = "low"
-                        reason = "Detected as potentially orphaned"
+                        reason = f"Attached to {attached_instance_id} but no I/O detected yet ({age_days} days old)"
 
-                    # Build metadata
-                    metadata = {
-                        "size_gb": size_gb,
-                        "volume_type": volume_type,
-                        "created_at": created_at.isoformat(),
-                        "availability_zone": volume["AvailabilityZone"],
-                        "encrypted": volume.get("Encrypted", False),
-                        "age_days": age_days,
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": orphan_type,  # 'unattached', 'attached_never_used', 'attached_idle'
-                        "usage_history": usage_history,
-                        "volume_state": volume_state,
-                        "is_attached": is_attached,
-                        # Cost breakdown (new)
-                        "iops": iops,
-                        "throughput": throughput,
-                        "cost_breakdown": cost_data["cost_breakdown"],
-                        "storage_cost": cost_data["storage_cost"],
-                        "iops_cost": cost_data["iops_cost"],
-                        "throughput_cost": cost_data["throughput_cost"],
-                    }
+                elif orphan_type == "attached_idle":
+                    # Attached but idle for extended period
+                    days_idle = usage_history.get("days_since_last_use", 0)
+                    if days_idle >= 60:
+                        confidence = "high"
+                        reason = f"Attached to {attached_instance_id} but idle for {days_idle} days (was active before)"
+                    elif days_idle >= min_idle_days_attached:
+                        confidence = "medium"
+                        reason = f"Attached to {attached_instance_id} but idle for {days_idle} days"
+                    else:
+                        confidence = "low"
+                        reason = f"Attached to {attached_instance_id} but no recent I/O activity"
 
-                    # Add attachment info if volume is attached
-                    if is_attached and attached_instance_id:
-                        metadata["attached_instance_id"] = attached_instance_id
-                        metadata["attachment_device"] = attachments[0].get("Device", "Unknown")
-                        metadata["attachment_time"] = attachments[0].get("AttachTime").isoformat() if attachments[0].get("AttachTime") else None
+                else:
+                    # Fallback
+                    confidence = "low"
+                    reason = "Detected as potentially orphaned"
+
+                # Build metadata
+                metadata = {
+                    "size_gb": size_gb,
+                    "volume_type": volume_type,
+                    "created_at": created_at.isoformat(),
+                    "availability_zone": volume["AvailabilityZone"],
+                    "encrypted": volume.get("Encrypted", False),
+                    "age_days": age_days,
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": orphan_type,  # 'unattached', 'attached_never_used', 'attached_idle'
+                    "usage_history": usage_history,
+                    "volume_state": volume_state,
+                    "is_attached": is_attached,
+                    # Cost breakdown (new)
+                    "iops": iops,
+                    "throughput": throughput,
+                    "cost_breakdown": cost_data["cost_breakdown"],
+                    "storage_cost": cost_data["storage_cost"],
+                    "iops_cost": cost_data["iops_cost"],
+                    "throughput_cost": cost_data["throughput_cost"],
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_unattached",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_cost, 2),
-                            resource_metadata=metadata,
-                        )
+                # Add attachment info if volume is attached
+                if is_attached and attached_instance_id:
+                    metadata["attached_instance_id"] = attached_instance_id
+                    metadata["attachment_device"] = attachments[0].get("Device", "Unknown")
+                    metadata["attachment_time"] = attachments[0].get("AttachTime").isoformat() if attachments[0].get("AttachTime") else None
+
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_unattached",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_cost, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
             # Log error but don't fail entire scan
+            record_scenario_error(e)
             print(f"Error scanning unattached volumes in {region}: {e}")
 
         return orphans
@@ -1081,145 +1217,142 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get all stopped instances
-                response = await ec2.describe_instances(
-                    Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}]
-                )
-
-                for reservation in response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        instance_id = instance["InstanceId"]
-                        instance_type = instance["InstanceType"]
-                        instance_state = instance["State"]["Name"]
-                        state_transition_time = instance.get("StateTransitionReason", "")
-
-                        # Try to parse stopped duration from StateTransitionReason
-                        # Format: "User initiated (YYYY-MM-DD HH:MM:SS GMT)"
-                        stopped_since = None
-                        stopped_days = 0
+            # Get all stopped instances
+            response = await self._ec2_snapshot(region).describe_instances(states=["stopped"])
+
+            for reservation in response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    instance_id = instance["InstanceId"]
+                    instance_type = instance["InstanceType"]
+                    instance_state = instance["State"]["Name"]
+                    state_transition_time = instance.get("StateTransitionReason", "")
+
+                    # Try to parse stopped duration from StateTransitionReason
+                    # Format: "User initiated (YYYY-MM-DD HH:MM:SS GMT)"
+                    stopped_since = None
+                    stopped_days = 0
 
-                        # Get launch time as fallback
-                        launch_time = instance.get("LaunchTime")
+                    # Get launch time as fallback
+                    launch_time = instance.get("LaunchTime")
 
-                        # Try to get state transition time from tags or other sources
-                        # For now, we'll use the instance launch time as an approximation
-                        # In production, you might want to track this in CloudWatch or tags
-                        if launch_time:
-                            # Estimate: if instance was launched long ago and is stopped now,
-                            # we consider it as potentially long-stopped
-                            # This is a simplified approach
-                            now = datetime.now(timezone.utc)
-                            instance_age_days = (now - launch_time).days
+                    # Try to get state transition time from tags or other sources
+                    # For now, we'll use the instance launch time as an approximation
+                    # In production, you might want to track this in CloudWatch or tags
+                    if launch_time:
+                        # Estimate: if instance was launched long ago and is stopped now,
+                        # we consider it as potentially long-stopped
+                        # This is a simplified approach
+                        now = datetime.now(timezone.utc)
+                        instance_age_days = (now - launch_time).days
 
-                            # We can't know exactly when it was stopped without additional tracking
-                            # For conservative approach: flag only if instance is old enough
-                            if instance_age_days < min_stopped_days:
-                                continue  # Instance too young, skip
+                        # We can't know exactly when it was stopped without additional tracking
+                        # For conservative approach: flag only if instance is old enough
+                        if instance_age_days < min_stopped_days:
+                            continue  # Instance too young, skip
 
-                            # Assume it's been stopped for a significant portion of its lifetime
-                            # (This is imperfect but conservative)
-                            stopped_days = min_stopped_days  # Conservative estimate
+                        # Assume it's been stopped for a significant portion of its lifetime
+                        # (This is imperfect but conservative)
+                        stopped_days = min_stopped_days  # Conservative estimate
 
-                        # Get attached volumes
-                        for bdm in instance.get("BlockDeviceMappings", []):
-                            if "Ebs" not in bdm:
-                                continue
+                    # Get attached volumes
+                    for bdm in instance.get("BlockDeviceMappings", []):
+                        if "Ebs" not in bdm:
+                            continue
 
-                            volume_id = bdm["Ebs"].get("VolumeId")
-                            if not volume_id:
-                                continue
+                        volume_id = bdm["Ebs"].get("VolumeId")
+                        if not volume_id:
+                            continue
 
-                            # Get volume details
-                            volume_response = await ec2.describe_volumes(VolumeIds=[volume_id])
-                            if not volume_response.get("Volumes"):
-                                continue
+                        # Get volume details
+                        volume_response = await self._ec2_snapshot(region).describe_volumes(volume_ids=[volume_id])
+                        if not volume_response.get("Volumes"):
+                            continue
 
-                            volume = volume_response["Volumes"][0]
-                            size_gb = volume["Size"]
-                            volume_type = volume["VolumeType"]
-                            created_at = volume["CreateTime"]
-                            iops = volume.get("Iops")
-                            throughput = volume.get("Throughput")
+                        volume = volume_response["Volumes"][0]
+                        size_gb = volume["Size"]
+                        volume_type = volume["VolumeType"]
+                        created_at = volume["CreateTime"]
+                        iops = volume.get("Iops")
+                        throughput = volume.get("Throughput")
 
-                            # Calculate volume age
-                            volume_age_days = self._safe_datetime_age(created_at)
+                        # Calculate volume age
+                        volume_age_days = self._safe_datetime_age(created_at)
 
-                            # Skip if volume is too young
-                            if volume_age_days < min_age_days:
-                                continue
+                        # Skip if volume is too young
+                        if volume_age_days < min_age_days:
+                            continue
 
-                            # Calculate cost (volume continues to be charged even when instance is stopped)
-                            cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
-                            monthly_cost = cost_data["total_monthly_cost"]
+                        # Calculate cost (volume continues to be charged even when instance is stopped)
+                        cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
+                        monthly_cost = cost_data["total_monthly_cost"]
 
-                            # Extract volume name from tags
-                            volume_name = None
-                            for tag in volume.get("Tags", []):
-                                if tag["Key"] == "Name":
-                                    volume_name = tag["Value"]
-                                    break
+                        # Extract volume name from tags
+                        volume_name = None
+                        for tag in volume.get("Tags", []):
+                            if tag["Key"] == "Name":
+                                volume_name = tag["Value"]
+                                break
 
-                            # Extract instance name from tags
-                            instance_name = None
-                            for tag in instance.get("Tags", []):
-                                if tag["Key"] == "Name":
-                                    instance_name = tag["Value"]
-                                    break
+                        # Extract instance name from tags
+                        instance_name = None
+                        for tag in instance.get("Tags", []):
+                            if tag["Key"] == "Name":
+                                instance_name = tag["Value"]
+                                break
 
-                            # Determine confidence level based on stopped duration
-                            if stopped_days >= 90:
-                                confidence = "critical"
-                                reason = f"Volume on instance stopped for {stopped_days}+ days (instance: {instance_name or instance_id})"
-                            elif stopped_days >= 60:
-                                confidence = "high"
-                                reason = f"Volume on instance stopped for {stopped_days}+ days (instance: {instance_name or instance_id})"
-                            elif stopped_days >= min_stopped_days:
-                                confidence = "medium"
-                                reason = f"Volume on instance stopped for {stopped_days}+ days (instance: {instance_name or instance_id})"
-                            else:
-                                confidence = "low"
-                                reason = f"Volume on recently stopped instance (instance: {instance_name or instance_id})"
+                        # Determine confidence level based on stopped duration
+                        if stopped_days >= 90:
+                            confidence = "critical"
+                            reason = f"Volume on instance stopped for {stopped_days}+ days (instance: {instance_name or instance_id})"
+                        elif stopped_days >= 60:
+                            confidence = "high"
+                            reason = f"Volume on instance stopped for {stopped_days}+ days (instance: {instance_name or instance_id})"
+                        elif stopped_days >= min_stopped_days:
+                            confidence = "medium"
+                            reason = f"Volume on instance stopped for {stopped_days}+ days (instance: {instance_name or instance_id})"
+                        else:
+                            confidence = "low"
+                            reason = f"Volume on recently stopped instance (instance: {instance_name or instance_id})"
 
-                            # Build metadata
-                            metadata = {
-                                "size_gb": size_gb,
-                                "volume_type": volume_type,
-                                "created_at": created_at.isoformat(),
-                                "availability_zone": volume["AvailabilityZone"],
-                                "encrypted": volume.get("Encrypted", False),
-                                "age_days": volume_age_days,
-                                "confidence": confidence,
-                                "confidence_level": self._calculate_confidence_level(stopped_days, detection_rules),
-                                "orphan_reason": reason,
-                                "orphan_type": "volume_on_stopped_instance",
-                                "volume_state": "in-use",
-                                "is_attached": True,
-                                "attached_instance_id": instance_id,
-                                "instance_name": instance_name,
-                                "instance_type": instance_type,
-                                "instance_state": instance_state,
-                                "stopped_days": stopped_days,
-                                "device": bdm.get("DeviceName", "Unknown"),
-                                # Cost breakdown
-                                "iops": iops,
-                                "throughput": throughput,
-                                "cost_breakdown": cost_data["cost_breakdown"],
-                                "storage_cost": cost_data["storage_cost"],
-                                "iops_cost": cost_data["iops_cost"],
-                                "throughput_cost": cost_data["throughput_cost"],
-                            }
+                        # Build metadata
+                        metadata = {
+                            "size_gb": size_gb,
+                            "volume_type": volume_type,
+                            "created_at": created_at.isoformat(),
+                            "availability_zone": volume["AvailabilityZone"],
+                            "encrypted": volume.get("Encrypted", False),
+                            "age_days": volume_age_days,
+                            "confidence": confidence,
+                            "confidence_level": self._calculate_confidence_level(stopped_days, detection_rules),
+                            "orphan_reason": reason,
+                            "orphan_type": "volume_on_stopped_instance",
+                            "volume_state": "in-use",
+                            "is_attached": True,
+                            "attached_instance_id": instance_id,
+                            "instance_name": instance_name,
+                            "instance_type": instance_type,
+                            "instance_state": instance_state,
+                            "stopped_days": stopped_days,
+                            "device": bdm.get("DeviceName", "Unknown"),
+                            # Cost breakdown
+                            "iops": iops,
+                            "throughput": throughput,
+                            "cost_breakdown": cost_data["cost_breakdown"],
+                            "storage_cost": cost_data["storage_cost"],
+                            "iops_cost": cost_data["iops_cost"],
+                            "throughput_cost": cost_data["throughput_cost"],
+                        }
 
-                            orphans.append(
-                                OrphanResourceData(
-                                    resource_type="ebs_volume_on_stopped_instance",
-                                    resource_id=volume_id,
-                                    resource_name=volume_name,
-                                    region=region,
-                                    estimated_monthly_cost=round(monthly_cost, 2),
-                                    resource_metadata=metadata,
-                                )
+                        orphans.append(
+                            OrphanResourceData(
+                                resource_type="ebs_volume_on_stopped_instance",
+                                resource_id=volume_id,
+                                resource_name=volume_name,
+                                region=region,
+                                estimated_monthly_cost=round(monthly_cost, 2),
+                                resource_metadata=metadata,
                             )
+                        )
 
         except ClientError as e:
             print(f"Error scanning volumes on stopped instances in {region}: {e}")
@@ -1255,81 +1388,78 @@ class AWSProvider(CloudProviderBase):
         min_size_gb = detection_rules.get("min_size_gb", 100)  # Small volumes = marginal savings
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["gp2"]}]
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["gp2"])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                created_at = volume["CreateTime"]
+                age_days = self._safe_datetime_age(created_at)
+
+                # Skip if volume is too young or too small
+                if age_days < min_age_days or size_gb < min_size_gb:
+                    continue
+
+                # Calculate current gp2 cost
+                current_cost = size_gb * self.PRICING["ebs_gp2_per_gb"]
+
+                # Calculate gp3 cost (3000 IOPS + 125 MBps baseline included)
+                suggested_cost = size_gb * self.PRICING["ebs_gp3_per_gb"]
+                monthly_savings = current_cost - suggested_cost
+                savings_percent = (monthly_savings / current_cost) * 100
+
+                # Extract name from tags
+                name = None
+                for tag in volume.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                reason = f"gp2 volume ({size_gb} GB) should migrate to gp3 for ~{savings_percent:.0f}% cost savings (${monthly_savings:.2f}/month)"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "current_volume_type": "gp2",
+                    "suggested_volume_type": "gp3",
+                    "created_at": created_at.isoformat(),
+                    "availability_zone": volume["AvailabilityZone"],
+                    "encrypted": volume.get("Encrypted", False),
+                    "age_days": age_days,
+                    "current_monthly_cost": round(current_cost, 2),
+                    "suggested_monthly_cost": round(suggested_cost, 2),
+                    "potential_monthly_savings": round(monthly_savings, 2),
+                    "savings_percent": round(savings_percent, 1),
+                    "orphan_reason": reason,
+                    "orphan_type": "gp2_migration_opportunity",
+                    "suggested_iops": 3000,  # gp3 baseline
+                    "suggested_throughput": 125,  # gp3 baseline
+                    "migration_notes": "gp3 provides same or better performance with 20% cost reduction",
+                }
+
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_gp2_migration",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_savings, 2),  # Potential savings
+                        resource_metadata=metadata,
+                    )
                 )
 
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    created_at = volume["CreateTime"]
-                    age_days = self._safe_datetime_age(created_at)
+        except ClientError as e:
+            print(f"Error scanning gp2 migration opportunities in {region}: {e}")
 
-                    # Skip if volume is too young or too small
-                    if age_days < min_age_days or size_gb < min_size_gb:
-                        continue
+        return orphans
 
-                    # Calculate current gp2 cost
-                    current_cost = size_gb * self.PRICING["ebs_gp2_per_gb"]
+    async def scan_unnecessary_io2_volumes(
+        self, region: str, detection_rules: dict | None = None
+    ) -> list[OrphanResourceData]:
+        """
+        SCENARIO 4: Scan for io2 volumes without compliance requirements (should be io1).
 
-                    # Calculate gp3 cost (3000 IOPS + 125 MBps baseline included)
-                    suggested_cost = size_gb * self.PRICING["ebs_gp3_per_gb"]
-                    monthly_savings = current_cost - suggested_cost
-                    savings_percent = (monthly_savings / current_cost) * 100
-
-                    # Extract name from tags
-                    name = None
-                    for tag in volume.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    reason = f"gp2 volume ({size_gb} GB) should migrate to gp3 for ~{savings_percent:.0f}% cost savings (${monthly_savings:.2f}/month)"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "current_volume_type": "gp2",
-                        "suggested_volume_type": "gp3",
-                        "created_at": created_at.isoformat(),
-                        "availability_zone": volume["AvailabilityZone"],
-                        "encrypted": volume.get("Encrypted", False),
-                        "age_days": age_days,
-                        "current_monthly_cost": round(current_cost, 2),
-                        "suggested_monthly_cost": round(suggested_cost, 2),
-                        "potential_monthly_savings": round(monthly_savings, 2),
-                        "savings_percent": round(savings_percent, 1),
-                        "orphan_reason": reason,
-                        "orphan_type": "gp2_migration_opportunity",
-                        "suggested_iops": 3000,  # gp3 baseline
-                        "suggested_throughput": 125,  # gp3 baseline
-                        "migration_notes": "gp3 provides same or better performance with 20% cost reduction",
-                    }
-
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_gp2_migration",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_savings, 2),  # Potential savings
-                            resource_metadata=metadata,
-                        )
-                    )
-
-        except ClientError as e:
-            print(f"Error scanning gp2 migration opportunities in {region}: {e}")
-
-        return orphans
-
-    async def scan_unnecessary_io2_volumes(
-        self, region: str, detection_rules: dict | None = None
-    ) -> list[OrphanResourceData]:
-        """
-        SCENARIO 4: Scan for io2 volumes without compliance requirements (should be io1).
-
-        io2 provides 99.999% durability (vs io1's 99.9%) at same cost. Only needed for
-        compliance/critical workloads. Dev/test environments don't need io2.
+        io2 provides 99.999% durability (vs io1's 99.9%) at same cost. Only needed for
+        compliance/critical workloads. Dev/test environments don't need io2.
 
         Args:
             region: AWS region to scan
@@ -1353,75 +1483,72 @@ class AWSProvider(CloudProviderBase):
         ])
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["io2"]}]
-                )
-
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    iops = volume.get("Iops", 0)
-                    created_at = volume["CreateTime"]
-                    age_days = self._safe_datetime_age(created_at)
-
-                    if age_days < min_age_days:
-                        continue
-
-                    # Check for compliance tags
-                    has_compliance_tag = False
-                    environment_tag = None
-                    volume_tags = {tag["Key"].lower(): tag["Value"].lower() for tag in volume.get("Tags", [])}
-
-                    for tag_key, tag_value in volume_tags.items():
-                        if any(comp_tag.lower() in tag_value for comp_tag in compliance_tags):
-                            has_compliance_tag = True
-                            break
-
-                    # Check environment tag
-                    if "environment" in volume_tags:
-                        environment_tag = volume_tags["environment"]
-
-                    # Flag if no compliance tags AND in dev/test environment
-                    is_waste = (not has_compliance_tag) or (environment_tag in ["dev", "development", "test", "staging"])
-
-                    if not is_waste:
-                        continue
-
-                    # Calculate cost (same for io1 and io2, but io2 is overkill)
-                    cost_data = await self._calculate_volume_cost("io2", size_gb, region, iops)
-                    monthly_cost = cost_data["total_monthly_cost"]
-
-                    name = volume_tags.get("name")
-                    reason = f"io2 volume in {environment_tag or 'non-compliance'} environment - io1 durability (99.9%) is sufficient"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "current_volume_type": "io2",
-                        "suggested_volume_type": "io1",
-                        "iops": iops,
-                        "created_at": created_at.isoformat(),
-                        "availability_zone": volume["AvailabilityZone"],
-                        "encrypted": volume.get("Encrypted", False),
-                        "age_days": age_days,
-                        "environment": environment_tag,
-                        "has_compliance_tags": has_compliance_tag,
-                        "orphan_reason": reason,
-                        "orphan_type": "unnecessary_io2",
-                        "cost_breakdown": cost_data["cost_breakdown"],
-                        "recommendation": "Migrate to io1 (same cost, less durability but sufficient for non-compliance workloads)",
-                    }
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["io2"])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                iops = volume.get("Iops", 0)
+                created_at = volume["CreateTime"]
+                age_days = self._safe_datetime_age(created_at)
+
+                if age_days < min_age_days:
+                    continue
+
+                # Check for compliance tags
+                has_compliance_tag = False
+                environment_tag = None
+                volume_tags = {tag["Key"].lower(): tag["Value"].lower() for tag in volume.get("Tags", [])}
+
+                for tag_key, tag_value in volume_tags.items():
+                    if any(comp_tag.lower() in tag_value for comp_tag in compliance_tags):
+                        has_compliance_tag = True
+                        break
+
+                # Check environment tag
+                if "environment" in volume_tags:
+                    environment_tag = volume_tags["environment"]
+
+                # Flag if no compliance tags AND in dev/test environment
+                is_waste = (not has_compliance_tag) or (environment_tag in ["dev", "development", "test", "staging"])
+
+                if not is_waste:
+                    continue
+
+                # Calculate cost (same for io1 and io2, but io2 is overkill)
+                cost_data = await self._calculate_volume_cost("io2", size_gb, region, iops)
+                monthly_cost = cost_data["total_monthly_cost"]
+
+                name = volume_tags.get("name")
+                reason = f"io2 volume in {environment_tag or 'non-compliance'} environment - io1 durability (99.9%) is sufficient"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "current_volume_type": "io2",
+                    "suggested_volume_type": "io1",
+                    "iops": iops,
+                    "created_at": created_at.isoformat(),
+                    "availability_zone": volume["AvailabilityZone"],
+                    "encrypted": volume.get("Encrypted", False),
+                    "age_days": age_days,
+                    "environment": environment_tag,
+                    "has_compliance_tags": has_compliance_tag,
+                    "orphan_reason": reason,
+                    "orphan_type": "unnecessary_io2",
+                    "cost_breakdown": cost_data["cost_breakdown"],
+                    "recommendation": "Migrate to io1 (same cost, less durability but sufficient for non-compliance workloads)",
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_unnecessary_io2",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_cost, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_unnecessary_io2",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_cost, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
             print(f"Error scanning unnecessary io2 volumes in {region}: {e}")
@@ -1457,87 +1584,84 @@ class AWSProvider(CloudProviderBase):
         iops_overprovisioning_factor = detection_rules.get("iops_overprovisioning_factor", 2.0)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Scan io1, io2, and gp3 volumes (types that support provisioned IOPS)
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["io1", "io2", "gp3"]}]
-                )
-
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    volume_type = volume["VolumeType"]
-                    iops = volume.get("Iops", 0)
-                    throughput = volume.get("Throughput")
-                    created_at = volume["CreateTime"]
-                    age_days = self._safe_datetime_age(created_at)
-
-                    if age_days < min_age_days:
-                        continue
-
-                    # Calculate baseline IOPS based on volume type and size
-                    if volume_type == "gp3":
-                        baseline_iops = 3000  # gp3 baseline (free)
-                    elif volume_type in ["io1", "io2"]:
-                        # AWS recommends 50 IOPS/GB ratio, but conservative baseline is 10-30 IOPS/GB
-                        baseline_iops = size_gb * 10  # Conservative baseline
-                    else:
-                        continue
-
-                    # Check if provisioned IOPS > baseline × factor
-                    if not iops or iops <= baseline_iops * iops_overprovisioning_factor:
-                        continue
-
-                    # Calculate recommended IOPS (baseline × 1.5 for safety buffer)
-                    recommended_iops = int(baseline_iops * 1.5)
-
-                    # Calculate current and recommended costs
-                    current_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
-                    recommended_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, recommended_iops, throughput)
-
-                    monthly_savings = current_cost_data["total_monthly_cost"] - recommended_cost_data["total_monthly_cost"]
-                    savings_percent = (monthly_savings / current_cost_data["total_monthly_cost"]) * 100
-
-                    # Extract name
-                    name = None
-                    for tag in volume.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    iops_ratio = iops / baseline_iops if baseline_iops > 0 else 0
-                    reason = f"{volume_type} volume with over-provisioned IOPS ({iops} IOPS, {iops_ratio:.1f}× baseline) - reduce to {recommended_iops} IOPS for ${monthly_savings:.2f}/month savings"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "volume_type": volume_type,
-                        "provisioned_iops": iops,
-                        "baseline_iops": baseline_iops,
-                        "recommended_iops": recommended_iops,
-                        "iops_ratio": round(iops_ratio, 2),
-                        "created_at": created_at.isoformat(),
-                        "availability_zone": volume["AvailabilityZone"],
-                        "encrypted": volume.get("Encrypted", False),
-                        "age_days": age_days,
-                        "current_monthly_cost": current_cost_data["total_monthly_cost"],
-                        "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
-                        "potential_monthly_savings": round(monthly_savings, 2),
-                        "savings_percent": round(savings_percent, 1),
-                        "orphan_reason": reason,
-                        "orphan_type": "overprovisioned_iops",
-                        "current_cost_breakdown": current_cost_data["cost_breakdown"],
-                    }
+            # Scan io1, io2, and gp3 volumes (types that support provisioned IOPS)
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["io1", "io2", "gp3"])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                volume_type = volume["VolumeType"]
+                iops = volume.get("Iops", 0)
+                throughput = volume.get("Throughput")
+                created_at = volume["CreateTime"]
+                age_days = self._safe_datetime_age(created_at)
+
+                if age_days < min_age_days:
+                    continue
+
+                # Calculate baseline IOPS based on volume type and size
+                if volume_type == "gp3":
+                    baseline_iops = 3000  # gp3 baseline (free)
+                elif volume_type in ["io1", "io2"]:
+                    # AWS recommends 50 IOPS/GB ratio, but conservative baseline is 10-30 IOPS/GB
+                    baseline_iops = size_gb * 10  # Conservative baseline
+                else:
+                    continue
+
+                # Check if provisioned IOPS > baseline × factor
+                if not iops or iops <= baseline_iops * iops_overprovisioning_factor:
+                    continue
+
+                # Calculate recommended IOPS (baseline × 1.5 for safety buffer)
+                recommended_iops = int(baseline_iops * 1.5)
+
+                # Calculate current and recommended costs
+                current_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
+                recommended_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, recommended_iops, throughput)
+
+                monthly_savings = current_cost_data["total_monthly_cost"] - recommended_cost_data["total_monthly_cost"]
+                savings_percent = (monthly_savings / current_cost_data["total_monthly_cost"]) * 100
+
+                # Extract name
+                name = None
+                for tag in volume.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                iops_ratio = iops / baseline_iops if baseline_iops > 0 else 0
+                reason = f"{volume_type} volume with over-provisioned IOPS ({iops} IOPS, {iops_ratio:.1f}× baseline) - reduce to {recommended_iops} IOPS for ${monthly_savings:.2f}/month savings"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "volume_type": volume_type,
+                    "provisioned_iops": iops,
+                    "baseline_iops": baseline_iops,
+                    "recommended_iops": recommended_iops,
+                    "iops_ratio": round(iops_ratio, 2),
+                    "created_at": created_at.isoformat(),
+                    "availability_zone": volume["AvailabilityZone"],
+                    "encrypted": volume.get("Encrypted", False),
+                    "age_days": age_days,
+                    "current_monthly_cost": current_cost_data["total_monthly_cost"],
+                    "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
+                    "potential_monthly_savings": round(monthly_savings, 2),
+                    "savings_percent": round(savings_percent, 1),
+                    "orphan_reason": reason,
+                    "orphan_type": "overprovisioned_iops",
+                    "current_cost_breakdown": current_cost_data["cost_breakdown"],
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_overprovisioned_iops",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_savings, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_overprovisioned_iops",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_savings, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
             print(f"Error scanning overprovisioned IOPS volumes in {region}: {e}")
@@ -1576,84 +1700,81 @@ class AWSProvider(CloudProviderBase):
         ])
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["gp3"]}]
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["gp3"])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                iops = volume.get("Iops", 3000)
+                throughput = volume.get("Throughput")
+                created_at = volume["CreateTime"]
+                age_days = self._safe_datetime_age(created_at)
+
+                # Skip if no provisioned throughput or within baseline
+                if not throughput or throughput <= baseline_throughput:
+                    continue
+
+                if age_days < min_age_days:
+                    continue
+
+                # Check for high-throughput workload tags
+                volume_tags = {tag["Key"].lower(): tag["Value"].lower() for tag in volume.get("Tags", [])}
+                has_high_throughput_tag = any(
+                    ht_tag.lower() in str(volume_tags.values()).lower()
+                    for ht_tag in high_throughput_tags
                 )
 
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    iops = volume.get("Iops", 3000)
-                    throughput = volume.get("Throughput")
-                    created_at = volume["CreateTime"]
-                    age_days = self._safe_datetime_age(created_at)
-
-                    # Skip if no provisioned throughput or within baseline
-                    if not throughput or throughput <= baseline_throughput:
-                        continue
-
-                    if age_days < min_age_days:
-                        continue
-
-                    # Check for high-throughput workload tags
-                    volume_tags = {tag["Key"].lower(): tag["Value"].lower() for tag in volume.get("Tags", [])}
-                    has_high_throughput_tag = any(
-                        ht_tag.lower() in str(volume_tags.values()).lower()
-                        for ht_tag in high_throughput_tags
-                    )
-
-                    # Check environment
-                    environment = volume_tags.get("environment", "")
-
-                    # Flag if high throughput in dev/test or no high-throughput workload tags
-                    should_flag = (environment in ["dev", "development", "test", "staging"]) or (not has_high_throughput_tag)
-
-                    if not should_flag:
-                        continue
-
-                    # Calculate costs
-                    current_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, throughput)
-                    recommended_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, baseline_throughput)
-
-                    monthly_savings = current_cost_data["throughput_cost"]  # All throughput above baseline
-                    savings_percent = (monthly_savings / current_cost_data["total_monthly_cost"]) * 100
-
-                    name = volume_tags.get("name")
-
-                    reason = f"gp3 volume with unnecessary throughput ({throughput} MBps vs {baseline_throughput} MBps baseline) in {environment or 'non-high-throughput'} workload - ${monthly_savings:.2f}/month savings"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "volume_type": "gp3",
-                        "provisioned_throughput": throughput,
-                        "baseline_throughput": baseline_throughput,
-                        "recommended_throughput": baseline_throughput,
-                        "created_at": created_at.isoformat(),
-                        "availability_zone": volume["AvailabilityZone"],
-                        "encrypted": volume.get("Encrypted", False),
-                        "age_days": age_days,
-                        "environment": environment,
-                        "has_high_throughput_workload_tags": has_high_throughput_tag,
-                        "current_monthly_cost": current_cost_data["total_monthly_cost"],
-                        "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
-                        "potential_monthly_savings": round(monthly_savings, 2),
-                        "savings_percent": round(savings_percent, 1),
-                        "orphan_reason": reason,
-                        "orphan_type": "overprovisioned_throughput",
-                        "current_cost_breakdown": current_cost_data["cost_breakdown"],
-                    }
+                # Check environment
+                environment = volume_tags.get("environment", "")
+
+                # Flag if high throughput in dev/test or no high-throughput workload tags
+                should_flag = (environment in ["dev", "development", "test", "staging"]) or (not has_high_throughput_tag)
+
+                if not should_flag:
+                    continue
+
+                # Calculate costs
+                current_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, throughput)
+                recommended_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, baseline_throughput)
+
+                monthly_savings = current_cost_data["throughput_cost"]  # All throughput above baseline
+                savings_percent = (monthly_savings / current_cost_data["total_monthly_cost"]) * 100
+
+                name = volume_tags.get("name")
+
+                reason = f"gp3 volume with unnecessary throughput ({throughput} MBps vs {baseline_throughput} MBps baseline) in {environment or 'non-high-throughput'} workload - ${monthly_savings:.2f}/month savings"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "volume_type": "gp3",
+                    "provisioned_throughput": throughput,
+                    "baseline_throughput": baseline_throughput,
+                    "recommended_throughput": baseline_throughput,
+                    "created_at": created_at.isoformat(),
+                    "availability_zone": volume["AvailabilityZone"],
+                    "encrypted": volume.get("Encrypted", False),
+                    "age_days": age_days,
+                    "environment": environment,
+                    "has_high_throughput_workload_tags": has_high_throughput_tag,
+                    "current_monthly_cost": current_cost_data["total_monthly_cost"],
+                    "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
+                    "potential_monthly_savings": round(monthly_savings, 2),
+                    "savings_percent": round(savings_percent, 1),
+                    "orphan_reason": reason,
+                    "orphan_type": "overprovisioned_throughput",
+                    "current_cost_breakdown": current_cost_data["cost_breakdown"],
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_overprovisioned_throughput",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_savings, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_overprovisioned_throughput",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_savings, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
             print(f"Error scanning overprovisioned throughput volumes in {region}: {e}")
@@ -1690,93 +1811,102 @@ class AWSProvider(CloudProviderBase):
         safety_buffer = detection_rules.get("safety_buffer_factor", 1.5)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["io1", "io2", "gp3"]}]
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["io1", "io2", "gp3"])
+
+            # Fetch IOPS metrics of every candidate volume in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for volume in response.get("Volumes", [])
+                if volume.get("Iops") and not (volume["VolumeType"] == "gp3" and volume["Iops"] <= 3000)
+                for query in self._volume_metric_queries(
+                    volume["VolumeId"], region, ["VolumeReadOps", "VolumeWriteOps"],
+                    period_days=min_observation_days, statistic="Average",
+                )
+            ])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                volume_type = volume["VolumeType"]
+                iops = volume.get("Iops")
+                throughput = volume.get("Throughput")
+
+                # Skip if no provisioned IOPS or baseline only (gp3 with 3000 IOPS)
+                if not iops or (volume_type == "gp3" and iops <= 3000):
+                    continue
+
+                # Get IOPS usage metrics from CloudWatch
+                metrics = await self._get_volume_metrics(
+                    volume_id, region,
+                    ["VolumeReadOps", "VolumeWriteOps"],
+                    period_days=min_observation_days,
+                    statistic="Average"
                 )
 
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    volume_type = volume["VolumeType"]
-                    iops = volume.get("Iops")
-                    throughput = volume.get("Throughput")
-
-                    # Skip if no provisioned IOPS or baseline only (gp3 with 3000 IOPS)
-                    if not iops or (volume_type == "gp3" and iops <= 3000):
-                        continue
-
-                    # Get IOPS usage metrics from CloudWatch
-                    metrics = await self._get_volume_metrics(
-                        volume_id, region,
-                        ["VolumeReadOps", "VolumeWriteOps"],
-                        period_days=min_observation_days,
-                        statistic="Average"
-                    )
-
-                    avg_read_ops = metrics.get("VolumeReadOps", 0)
-                    avg_write_ops = metrics.get("VolumeWriteOps", 0)
-                    total_avg_iops = avg_read_ops + avg_write_ops
-
-                    # Calculate IOPS utilization
-                    iops_utilization = total_avg_iops / iops if iops > 0 else 0
-
-                    # Skip if utilization is above threshold
-                    if iops_utilization >= max_iops_utilization:
-                        continue
-
-                    # Calculate recommended IOPS (actual usage × safety buffer)
-                    if volume_type == "gp3":
-                        recommended_iops = max(3000, int(total_avg_iops * safety_buffer))  # Min 3000 baseline
-                    else:  # io1/io2
-                        recommended_iops = max(100, int(total_avg_iops * safety_buffer))  # Min 100 IOPS
-
-                    # Calculate costs
-                    current_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
-                    recommended_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, recommended_iops, throughput)
-
-                    monthly_savings = current_cost_data["total_monthly_cost"] - recommended_cost_data["total_monthly_cost"]
-
-                    if monthly_savings <= 0:
-                        continue
-
-                    name = None
-                    for tag in volume.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    reason = f"{volume_type} volume with {iops_utilization*100:.1f}% IOPS utilization ({int(total_avg_iops)} avg vs {iops} provisioned) - reduce to {recommended_iops} IOPS for ${monthly_savings:.2f}/month savings"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "volume_type": volume_type,
-                        "provisioned_iops": iops,
-                        "avg_read_ops_per_second": round(avg_read_ops, 2),
-                        "avg_write_ops_per_second": round(avg_write_ops, 2),
-                        "total_avg_iops": round(total_avg_iops, 2),
-                        "iops_utilization_percent": round(iops_utilization * 100, 1),
-                        "recommended_iops": recommended_iops,
-                        "observation_period_days": min_observation_days,
-                        "current_monthly_cost": current_cost_data["total_monthly_cost"],
-                        "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
-                        "potential_monthly_savings": round(monthly_savings, 2),
-                        "orphan_reason": reason,
-                        "orphan_type": "low_iops_usage",
-                    }
+                avg_read_ops = metrics.get("VolumeReadOps", 0)
+                avg_write_ops = metrics.get("VolumeWriteOps", 0)
+                total_avg_iops = avg_read_ops + avg_write_ops
+
+                # Calculate IOPS utilization
+                iops_utilization = total_avg_iops / iops if iops > 0 else 0
+
+                # Skip if utilization is above threshold
+                if iops_utilization >= max_iops_utilization:
+                    continue
+
+                # Calculate recommended IOPS (actual usage × safety buffer)
+                if volume_type == "gp3":
+                    recommended_iops = max(3000, int(total_avg_iops * safety_buffer))  # Min 3000 baseline
+                else:  # io1/io2
+                    recommended_iops = max(100, int(total_avg_iops * safety_buffer))  # Min 100 IOPS
+
+                # Calculate costs
+                current_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops, throughput)
+                recommended_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, recommended_iops, throughput)
+
+                monthly_savings = current_cost_data["total_monthly_cost"] - recommended_cost_data["total_monthly_cost"]
+
+                if monthly_savings <= 0:
+                    continue
+
+                name = None
+                for tag in volume.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                reason = f"{volume_type} volume with {iops_utilization*100:.1f}% IOPS utilization ({int(total_avg_iops)} avg vs {iops} provisioned) - reduce to {recommended_iops} IOPS for ${monthly_savings:.2f}/month savings"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "volume_type": volume_type,
+                    "provisioned_iops": iops,
+                    "avg_read_ops_per_second": round(avg_read_ops, 2),
+                    "avg_write_ops_per_second": round(avg_write_ops, 2),
+                    "total_avg_iops": round(total_avg_iops, 2),
+                    "iops_utilization_percent": round(iops_utilization * 100, 1),
+                    "recommended_iops": recommended_iops,
+                    "observation_period_days": min_observation_days,
+                    "current_monthly_cost": current_cost_data["total_monthly_cost"],
+                    "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
+                    "potential_monthly_savings": round(monthly_savings, 2),
+                    "orphan_reason": reason,
+                    "orphan_type": "low_iops_usage",
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_low_iops_usage",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_savings, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_low_iops_usage",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_savings, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning low IOPS usage volumes in {region}: {e}")
 
         return orphans
@@ -1811,88 +1941,97 @@ class AWSProvider(CloudProviderBase):
         baseline_throughput = detection_rules.get("baseline_throughput_mbps", 125)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["gp3"]}]
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["gp3"])
+
+            # Fetch throughput metrics of every candidate volume in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for volume in response.get("Volumes", [])
+                if volume.get("Throughput") and volume["Throughput"] > baseline_throughput
+                for query in self._volume_metric_queries(
+                    volume["VolumeId"], region, ["VolumeReadBytes", "VolumeWriteBytes"],
+                    period_days=min_observation_days, statistic="Average",
+                )
+            ])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                iops = volume.get("Iops", 3000)
+                throughput = volume.get("Throughput")
+
+                # Skip if no provisioned throughput above baseline
+                if not throughput or throughput <= baseline_throughput:
+                    continue
+
+                # Get throughput metrics from CloudWatch
+                metrics = await self._get_volume_metrics(
+                    volume_id, region,
+                    ["VolumeReadBytes", "VolumeWriteBytes"],
+                    period_days=min_observation_days,
+                    statistic="Average"
                 )
 
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    iops = volume.get("Iops", 3000)
-                    throughput = volume.get("Throughput")
-
-                    # Skip if no provisioned throughput above baseline
-                    if not throughput or throughput <= baseline_throughput:
-                        continue
-
-                    # Get throughput metrics from CloudWatch
-                    metrics = await self._get_volume_metrics(
-                        volume_id, region,
-                        ["VolumeReadBytes", "VolumeWriteBytes"],
-                        period_days=min_observation_days,
-                        statistic="Average"
-                    )
-
-                    avg_read_bytes = metrics.get("VolumeReadBytes", 0)
-                    avg_write_bytes = metrics.get("VolumeWriteBytes", 0)
-
-                    # Convert bytes/sec to MBps
-                    total_avg_throughput_mbps = (avg_read_bytes + avg_write_bytes) / (1024 * 1024)
-
-                    # Calculate throughput utilization
-                    throughput_utilization = total_avg_throughput_mbps / throughput if throughput > 0 else 0
-
-                    # Skip if utilization is above threshold
-                    if throughput_utilization >= max_throughput_utilization:
-                        continue
-
-                    # Calculate costs
-                    current_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, throughput)
-                    recommended_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, baseline_throughput)
-
-                    monthly_savings = current_cost_data["throughput_cost"]  # All throughput cost above baseline
-
-                    if monthly_savings <= 0:
-                        continue
-
-                    name = None
-                    for tag in volume.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    reason = f"gp3 volume with {throughput_utilization*100:.1f}% throughput utilization ({total_avg_throughput_mbps:.1f} MBps avg vs {throughput} MBps provisioned) - reduce to {baseline_throughput} MBps baseline for ${monthly_savings:.2f}/month savings"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "volume_type": "gp3",
-                        "provisioned_throughput_mbps": throughput,
-                        "avg_read_mbps": round(avg_read_bytes / (1024 * 1024), 2),
-                        "avg_write_mbps": round(avg_write_bytes / (1024 * 1024), 2),
-                        "total_avg_throughput_mbps": round(total_avg_throughput_mbps, 2),
-                        "throughput_utilization_percent": round(throughput_utilization * 100, 1),
-                        "recommended_throughput_mbps": baseline_throughput,
-                        "observation_period_days": min_observation_days,
-                        "current_monthly_cost": current_cost_data["total_monthly_cost"],
-                        "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
-                        "potential_monthly_savings": round(monthly_savings, 2),
-                        "orphan_reason": reason,
-                        "orphan_type": "low_throughput_usage",
-                    }
+                avg_read_bytes = metrics.get("VolumeReadBytes", 0)
+                avg_write_bytes = metrics.get("VolumeWriteBytes", 0)
+
+                # Convert bytes/sec to MBps
+                total_avg_throughput_mbps = (avg_read_bytes + avg_write_bytes) / (1024 * 1024)
+
+                # Calculate throughput utilization
+                throughput_utilization = total_avg_throughput_mbps / throughput if throughput > 0 else 0
+
+                # Skip if utilization is above threshold
+                if throughput_utilization >= max_throughput_utilization:
+                    continue
+
+                # Calculate costs
+                current_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, throughput)
+                recommended_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, iops, baseline_throughput)
+
+                monthly_savings = current_cost_data["throughput_cost"]  # All throughput cost above baseline
+
+                if monthly_savings <= 0:
+                    continue
+
+                name = None
+                for tag in volume.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                reason = f"gp3 volume with {throughput_utilization*100:.1f}% throughput utilization ({total_avg_throughput_mbps:.1f} MBps avg vs {throughput} MBps provisioned) - reduce to {baseline_throughput} MBps baseline for ${monthly_savings:.2f}/month savings"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "volume_type": "gp3",
+                    "provisioned_throughput_mbps": throughput,
+                    "avg_read_mbps": round(avg_read_bytes / (1024 * 1024), 2),
+                    "avg_write_mbps": round(avg_write_bytes / (1024 * 1024), 2),
+                    "total_avg_throughput_mbps": round(total_avg_throughput_mbps, 2),
+                    "throughput_utilization_percent": round(throughput_utilization * 100, 1),
+                    "recommended_throughput_mbps": baseline_throughput,
+                    "observation_period_days": min_observation_days,
+                    "current_monthly_cost": current_cost_data["total_monthly_cost"],
+                    "recommended_monthly_cost": recommended_cost_data["total_monthly_cost"],
+                    "potential_monthly_savings": round(monthly_savings, 2),
+                    "orphan_reason": reason,
+                    "orphan_type": "low_throughput_usage",
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_low_throughput_usage",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_savings, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_low_throughput_usage",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_savings, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning low throughput usage volumes in {region}: {e}")
 
         return orphans
@@ -1927,90 +2066,99 @@ class AWSProvider(CloudProviderBase):
         safety_margin = detection_rules.get("safety_margin_iops", 1.5)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Focus on expensive volume types (io1, io2)
-                response = await ec2.describe_volumes(
-                    Filters=[{"Name": "volume-type", "Values": ["io1", "io2"]}]
+            # Focus on expensive volume types (io1, io2)
+            response = await self._ec2_snapshot(region).describe_volumes(volume_types=["io1", "io2"])
+
+            # Fetch usage metrics of every volume in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for volume in response.get("Volumes", [])
+                for query in self._volume_metric_queries(
+                    volume["VolumeId"], region,
+                    ["VolumeReadOps", "VolumeWriteOps", "VolumeReadBytes", "VolumeWriteBytes"],
+                    period_days=min_observation_days, statistic="Average",
+                )
+            ])
+
+            for volume in response.get("Volumes", []):
+                volume_id = volume["VolumeId"]
+                size_gb = volume["Size"]
+                volume_type = volume["VolumeType"]
+                iops = volume.get("Iops", 0)
+
+                # Get actual usage metrics
+                metrics = await self._get_volume_metrics(
+                    volume_id, region,
+                    ["VolumeReadOps", "VolumeWriteOps", "VolumeReadBytes", "VolumeWriteBytes"],
+                    period_days=min_observation_days,
+                    statistic="Average"
                 )
 
-                for volume in response.get("Volumes", []):
-                    volume_id = volume["VolumeId"]
-                    size_gb = volume["Size"]
-                    volume_type = volume["VolumeType"]
-                    iops = volume.get("Iops", 0)
-
-                    # Get actual usage metrics
-                    metrics = await self._get_volume_metrics(
-                        volume_id, region,
-                        ["VolumeReadOps", "VolumeWriteOps", "VolumeReadBytes", "VolumeWriteBytes"],
-                        period_days=min_observation_days,
-                        statistic="Average"
-                    )
-
-                    avg_iops = metrics.get("VolumeReadOps", 0) + metrics.get("VolumeWriteOps", 0)
-                    avg_throughput_mbps = (metrics.get("VolumeReadBytes", 0) + metrics.get("VolumeWriteBytes", 0)) / (1024 * 1024)
-
-                    # Check if gp3 can handle this workload
-                    # gp3 limits: 16,000 IOPS max, 1,000 MBps max
-                    required_iops = int(avg_iops * safety_margin)
-                    required_throughput = int(avg_throughput_mbps * safety_margin)
-
-                    if required_iops > 16000 or required_throughput > 1000:
-                        continue  # gp3 cannot handle this workload
-
-                    # Calculate current io1/io2 cost
-                    current_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops)
-
-                    # Calculate gp3 cost with required IOPS and throughput
-                    suggested_iops = max(3000, required_iops)  # gp3 baseline or higher
-                    suggested_throughput = max(125, required_throughput)  # gp3 baseline or higher
-                    suggested_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, suggested_iops, suggested_throughput)
-
-                    monthly_savings = current_cost_data["total_monthly_cost"] - suggested_cost_data["total_monthly_cost"]
-                    savings_percent = (monthly_savings / current_cost_data["total_monthly_cost"]) * 100
-
-                    # Skip if savings below threshold
-                    if savings_percent < min_savings_percent:
-                        continue
-
-                    name = None
-                    for tag in volume.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    reason = f"{volume_type} volume can be downgraded to gp3 (current: {int(avg_iops)} IOPS avg, {avg_throughput_mbps:.1f} MBps avg) - migrate to gp3 ({suggested_iops} IOPS, {suggested_throughput} MBps) for ${monthly_savings:.2f}/month ({savings_percent:.0f}% savings)"
-
-                    metadata = {
-                        "size_gb": size_gb,
-                        "current_volume_type": volume_type,
-                        "suggested_volume_type": "gp3",
-                        "avg_iops": round(avg_iops, 2),
-                        "avg_throughput_mbps": round(avg_throughput_mbps, 2),
-                        "suggested_iops": suggested_iops,
-                        "suggested_throughput": suggested_throughput,
-                        "observation_period_days": min_observation_days,
-                        "current_monthly_cost": current_cost_data["total_monthly_cost"],
-                        "suggested_monthly_cost": suggested_cost_data["total_monthly_cost"],
-                        "potential_monthly_savings": round(monthly_savings, 2),
-                        "savings_percent": round(savings_percent, 1),
-                        "orphan_reason": reason,
-                        "orphan_type": "volume_type_downgrade_opportunity",
-                        "downgrade_rationale": f"gp3 can handle {required_iops} IOPS and {required_throughput} MBps (well within 16K/1000 limits)",
-                    }
+                avg_iops = metrics.get("VolumeReadOps", 0) + metrics.get("VolumeWriteOps", 0)
+                avg_throughput_mbps = (metrics.get("VolumeReadBytes", 0) + metrics.get("VolumeWriteBytes", 0)) / (1024 * 1024)
+
+                # Check if gp3 can handle this workload
+                # gp3 limits: 16,000 IOPS max, 1,000 MBps max
+                required_iops = int(avg_iops * safety_margin)
+                required_throughput = int(avg_throughput_mbps * safety_margin)
+
+                if required_iops > 16000 or required_throughput > 1000:
+                    continue  # gp3 cannot handle this workload
+
+                # Calculate current io1/io2 cost
+                current_cost_data = await self._calculate_volume_cost(volume_type, size_gb, region, iops)
+
+                # Calculate gp3 cost with required IOPS and throughput
+                suggested_iops = max(3000, required_iops)  # gp3 baseline or higher
+                suggested_throughput = max(125, required_throughput)  # gp3 baseline or higher
+                suggested_cost_data = await self._calculate_volume_cost("gp3", size_gb, region, suggested_iops, suggested_throughput)
+
+                monthly_savings = current_cost_data["total_monthly_cost"] - suggested_cost_data["total_monthly_cost"]
+                savings_percent = (monthly_savings / current_cost_data["total_monthly_cost"]) * 100
+
+                # Skip if savings below threshold
+                if savings_percent < min_savings_percent:
+                    continue
+
+                name = None
+                for tag in volume.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                reason = f"{volume_type} volume can be downgraded to gp3 (current: {int(avg_iops)} IOPS avg, {avg_throughput_mbps:.1f} MBps avg) - migrate to gp3 ({suggested_iops} IOPS, {suggested_throughput} MBps) for ${monthly_savings:.2f}/month ({savings_percent:.0f}% savings)"
+
+                metadata = {
+                    "size_gb": size_gb,
+                    "current_volume_type": volume_type,
+                    "suggested_volume_type": "gp3",
+                    "avg_iops": round(avg_iops, 2),
+                    "avg_throughput_mbps": round(avg_throughput_mbps, 2),
+                    "suggested_iops": suggested_iops,
+                    "suggested_throughput": suggested_throughput,
+                    "observation_period_days": min_observation_days,
+                    "current_monthly_cost": current_cost_data["total_monthly_cost"],
+                    "suggested_monthly_cost": suggested_cost_data["total_monthly_cost"],
+                    "potential_monthly_savings": round(monthly_savings, 2),
+                    "savings_percent": round(savings_percent, 1),
+                    "orphan_reason": reason,
+                    "orphan_type": "volume_type_downgrade_opportunity",
+                    "downgrade_rationale": f"gp3 can handle {required_iops} IOPS and {required_throughput} MBps (well within 16K/1000 limits)",
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_volume_type_downgrade",
-                            resource_id=volume_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_savings, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_volume_type_downgrade",
+                        resource_id=volume_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_savings, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning volume type downgrade opportunities in {region}: {e}")
 
         return orphans
@@ -2053,133 +2201,132 @@ class AWSProvider(CloudProviderBase):
         min_stopped_days = detection_rules.get("min_stopped_days", 30)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_addresses()
-
-                # Get all instances to check their state and launch time
-                instances_response = await ec2.describe_instances()
-                instance_info = {}  # {instance_id: {"state": str, "state_transition_reason": str}}
-                for reservation in instances_response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        instance_info[instance["InstanceId"]] = {
-                            "state": instance["State"]["Name"],
-                            "state_transition_reason": instance.get("StateTransitionReason", ""),
-                            "launch_time": instance.get("LaunchTime"),
-                        }
-
-                for address in response.get("Addresses", []):
-                    allocation_id = address.get("AllocationId", "N/A")
-                    public_ip = address.get("PublicIp", "Unknown")
-                    association_id = address.get("AssociationId")
-                    instance_id = address.get("InstanceId")
-                    network_interface_id = address.get("NetworkInterfaceId")
+            response = await self._ec2_snapshot(region).describe_addresses()
+
+            # Get all instances to check their state and launch time
+            instances_response = await self._ec2_snapshot(region).describe_instances()
+            instance_info = {}  # {instance_id: {"state": str, "state_transition_reason": str}}
+            for reservation in instances_response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    instance_info[instance["InstanceId"]] = {
+                        "state": instance["State"]["Name"],
+                        "state_transition_reason": instance.get("StateTransitionReason", ""),
+                        "launch_time": instance.get("LaunchTime"),
+                    }
 
-                    # **KEY FIX**: Use AWS native AllocationTime instead of manual tag
-                    allocation_time = address.get("AllocationTime")
+            for address in response.get("Addresses", []):
+                allocation_id = address.get("AllocationId", "N/A")
+                public_ip = address.get("PublicIp", "Unknown")
+                association_id = address.get("AssociationId")
+                instance_id = address.get("InstanceId")
+                network_interface_id = address.get("NetworkInterfaceId")
 
-                    # Calculate age using native AllocationTime
-                    # If AllocationTime is not available (older EIPs), assume it's old enough to be flagged
-                    if allocation_time:
-                        age_days = self._safe_datetime_age(allocation_time)
-                    else:
-                        # Fallback: if no AllocationTime, assume EIP is old (30 days)
-                        # This ensures we don't miss unassociated EIPs that lack this metadata
-                        age_days = 30
+                # **KEY FIX**: Use AWS native AllocationTime instead of manual tag
+                allocation_time = address.get("AllocationTime")
 
-                    # Determine orphan status
-                    should_flag = False
-                    orphan_type = ""
-                    stopped_days = 0
+                # Calculate age using native AllocationTime
+                # If AllocationTime is not available (older EIPs), assume it's old enough to be flagged
+                if allocation_time:
+                    age_days = self._safe_datetime_age(allocation_time)
+                else:
+                    # Fallback: if no AllocationTime, assume EIP is old (30 days)
+                    # This ensures we don't miss unassociated EIPs that lack this metadata
+                    age_days = 30
+
+                # Determine orphan status
+                should_flag = False
+                orphan_type = ""
+                stopped_days = 0
+
+                if not association_id:
+                    # SCENARIO 1: Unassociated Elastic IP
+                    if age_days >= min_age_days:
+                        should_flag = True
+                        orphan_type = "unassociated"
+
+                elif instance_id and instance_id in instance_info:
+                    # SCENARIO 2: EIP on stopped EC2 instance
+                    instance_state = instance_info[instance_id]["state"]
+                    if instance_state == "stopped":
+                        # Parse StateTransitionReason to calculate stopped_days
+                        # Format: "User initiated (2024-01-15 14:32:15 GMT)"
+                        state_transition_reason = instance_info[instance_id]["state_transition_reason"]
+                        try:
+                            # Extract date from StateTransitionReason
+                            import re
+                            date_match = re.search(r"\((\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", state_transition_reason)
+                            if date_match:
+                                stopped_time_str = date_match.group(1)
+                                stopped_time = datetime.strptime(stopped_time_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+                                stopped_days = self._safe_datetime_age(stopped_time)
+                        except Exception:
+                            # Fallback: assume stopped recently if we can't parse
+                            stopped_days = 0
 
-                    if not association_id:
-                        # SCENARIO 1: Unassociated Elastic IP
-                        if age_days >= min_age_days:
+                        if stopped_days >= min_stopped_days:
                             should_flag = True
-                            orphan_type = "unassociated"
-
-                    elif instance_id and instance_id in instance_info:
-                        # SCENARIO 2: EIP on stopped EC2 instance
-                        instance_state = instance_info[instance_id]["state"]
-                        if instance_state == "stopped":
-                            # Parse StateTransitionReason to calculate stopped_days
-                            # Format: "User initiated (2024-01-15 14:32:15 GMT)"
-                            state_transition_reason = instance_info[instance_id]["state_transition_reason"]
-                            try:
-                                # Extract date from StateTransitionReason
-                                import re
-                                date_match = re.search(r"\((\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", state_transition_reason)
-                                if date_match:
-                                    stopped_time_str = date_match.group(1)
-                                    stopped_time = datetime.strptime(stopped_time_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
-                                    stopped_days = self._safe_datetime_age(stopped_time)
-                            except Exception:
-                                # Fallback: assume stopped recently if we can't parse
-                                stopped_days = 0
+                            orphan_type = "associated_stopped_instance"
 
-                            if stopped_days >= min_stopped_days:
-                                should_flag = True
-                                orphan_type = "associated_stopped_instance"
-
-                    if not should_flag:
-                        continue
+                if not should_flag:
+                    continue
 
-                    # Extract name from tags
-                    name = None
-                    tags = address.get("Tags", [])
-                    for tag in tags:
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+                # Extract name from tags
+                name = None
+                tags = address.get("Tags", [])
+                for tag in tags:
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
 
-                    # Determine confidence and reason
-                    if orphan_type == "unassociated":
-                        confidence = "high" if age_days >= confidence_threshold_days else "medium"
-                        reason = f"Unassociated for {age_days} days ($3.60/month waste)"
+                # Determine confidence and reason
+                if orphan_type == "unassociated":
+                    confidence = "high" if age_days >= confidence_threshold_days else "medium"
+                    reason = f"Unassociated for {age_days} days ($3.60/month waste)"
 
-                    elif orphan_type == "associated_stopped_instance":
-                        confidence = "critical" if stopped_days >= 90 else ("high" if stopped_days >= confidence_threshold_days else "medium")
-                        reason = f"Associated to stopped instance {instance_id} for {stopped_days} days ($3.60/month waste)"
+                elif orphan_type == "associated_stopped_instance":
+                    confidence = "critical" if stopped_days >= 90 else ("high" if stopped_days >= confidence_threshold_days else "medium")
+                    reason = f"Associated to stopped instance {instance_id} for {stopped_days} days ($3.60/month waste)"
 
-                    else:
-                        confidence = "low"
-                        reason = "Detected as potentially orphaned"
+                else:
+                    confidence = "low"
+                    reason = "Detected as potentially orphaned"
+
+                # Get dynamic pricing
+                eip_price = await self._get_price("elastic_ip", region)
+
+                # Calculate already wasted cost
+                already_wasted = round((age_days / 30) * eip_price, 2)
+
+                # Build metadata
+                metadata = {
+                    "public_ip": public_ip,
+                    "domain": address.get("Domain", "vpc"),
+                    "allocation_time": allocation_time.isoformat() if allocation_time else "unknown",
+                    "age_days": age_days,
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": orphan_type,
+                    "is_associated": bool(association_id),
+                    "already_wasted": already_wasted,
+                }
 
-                    # Get dynamic pricing
-                    eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
-
-                    # Calculate already wasted cost
-                    already_wasted = round((age_days / 30) * eip_price, 2)
-
-                    # Build metadata
-                    metadata = {
-                        "public_ip": public_ip,
-                        "domain": address.get("Domain", "vpc"),
-                        "allocation_time": allocation_time.isoformat() if allocation_time else "unknown",
-                        "age_days": age_days,
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": orphan_type,
-                        "is_associated": bool(association_id),
-                        "already_wasted": already_wasted,
-                    }
-
-                    # SCENARIO 2 specific metadata
-                    if orphan_type == "associated_stopped_instance" and instance_id:
-                        metadata["associated_instance_id"] = instance_id
-                        metadata["instance_state"] = "stopped"
-                        metadata["stopped_days"] = stopped_days
-
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="elastic_ip_unassociated",
-                            resource_id=allocation_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=eip_price,
-                            resource_metadata=metadata,
-                        )
-                    )
+                # SCENARIO 2 specific metadata
+                if orphan_type == "associated_stopped_instance" and instance_id:
+                    metadata["associated_instance_id"] = instance_id
+                    metadata["instance_state"] = "stopped"
+                    metadata["stopped_days"] = stopped_days
+
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="elastic_ip_unassociated",
+                        resource_id=allocation_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=eip_price,
+                        resource_metadata=metadata,
+                    )
+                )
 
         except ClientError as e:
             print(f"Error scanning Elastic IPs (Scenarios 1-2) in {region}: {e}")
@@ -2224,94 +2371,93 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
-
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_addresses()
-
-                # Get instance tags to check for justification
-                instances_response = await ec2.describe_instances()
-                instance_tags = {}  # {instance_id: [tag_keys]}
-                for reservation in instances_response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        instance_id = instance["InstanceId"]
-                        tags = [tag["Key"].lower() for tag in instance.get("Tags", [])]
-                        instance_tags[instance_id] = tags
-
-                # Group EIPs by instance
-                instance_eips = {}  # {instance_id: [eip_data]}
-                for address in response.get("Addresses", []):
-                    instance_id = address.get("InstanceId")
-                    if instance_id:  # Only consider IPs associated with instances
-                        if instance_id not in instance_eips:
-                            instance_eips[instance_id] = []
-                        instance_eips[instance_id].append(address)
-
-                # Find instances with more than max_eips_per_instance
-                for instance_id, eips in instance_eips.items():
-                    if len(eips) <= max_eips_per_instance:
-                        continue  # Within limit
-
-                    # Check if instance has justification tags
-                    tags = instance_tags.get(instance_id, [])
-                    has_justification = any(tag in tags for tag in [t.lower() for t in allow_multiple_eips_tags])
-
-                    if has_justification:
-                        continue  # Skip - multiple EIPs are justified
-
-                    # Flag additional EIPs (beyond the first one)
-                    for i, address in enumerate(sorted(eips, key=lambda x: x.get("AllocationTime", datetime.min))):
-                        if i < max_eips_per_instance:
-                            continue  # Keep the first N EIPs
+            eip_price = await self._get_price("elastic_ip", region)
+
+            response = await self._ec2_snapshot(region).describe_addresses()
+
+            # Get instance tags to check for justification
+            instances_response = await self._ec2_snapshot(region).describe_instances()
+            instance_tags = {}  # {instance_id: [tag_keys]}
+            for reservation in instances_response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    instance_id = instance["InstanceId"]
+                    tags = [tag["Key"].lower() for tag in instance.get("Tags", [])]
+                    instance_tags[instance_id] = tags
+
+            # Group EIPs by instance
+            instance_eips = {}  # {instance_id: [eip_data]}
+            for address in response.get("Addresses", []):
+                instance_id = address.get("InstanceId")
+                if instance_id:  # Only consider IPs associated with instances
+                    if instance_id not in instance_eips:
+                        instance_eips[instance_id] = []
+                    instance_eips[instance_id].append(address)
+
+            # Find instances with more than max_eips_per_instance
+            for instance_id, eips in instance_eips.items():
+                if len(eips) <= max_eips_per_instance:
+                    continue  # Within limit
+
+                # Check if instance has justification tags
+                tags = instance_tags.get(instance_id, [])
+                has_justification = any(tag in tags for tag in [t.lower() for t in allow_multiple_eips_tags])
+
+                if has_justification:
+                    continue  # Skip - multiple EIPs are justified
+
+                # Flag additional EIPs (beyond the first one)
+                for i, address in enumerate(sorted(eips, key=lambda x: x.get("AllocationTime", datetime.min))):
+                    if i < max_eips_per_instance:
+                        continue  # Keep the first N EIPs
 
-                        allocation_id = address.get("AllocationId", "N/A")
-                        public_ip = address.get("PublicIp", "Unknown")
-                        allocation_time = address.get("AllocationTime")
+                    allocation_id = address.get("AllocationId", "N/A")
+                    public_ip = address.get("PublicIp", "Unknown")
+                    allocation_time = address.get("AllocationTime")
 
-                        if not allocation_time:
-                            continue
+                    if not allocation_time:
+                        continue
 
-                        age_days = self._safe_datetime_age(allocation_time)
-                        if age_days < min_age_days:
-                            continue
+                    age_days = self._safe_datetime_age(allocation_time)
+                    if age_days < min_age_days:
+                        continue
 
-                        # Extract name from tags
-                        name = None
-                        for tag in address.get("Tags", []):
-                            if tag["Key"] == "Name":
-                                name = tag["Value"]
-                                break
+                    # Extract name from tags
+                    name = None
+                    for tag in address.get("Tags", []):
+                        if tag["Key"] == "Name":
+                            name = tag["Value"]
+                            break
 
-                        # Confidence based on age
-                        confidence = "high" if age_days >= 30 else "medium"
-                        reason = f"Instance {instance_id} has {len(eips)} EIPs (max {max_eips_per_instance} recommended). Additional EIP #{i+1} wastes $3.60/month."
+                    # Confidence based on age
+                    confidence = "high" if age_days >= 30 else "medium"
+                    reason = f"Instance {instance_id} has {len(eips)} EIPs (max {max_eips_per_instance} recommended). Additional EIP #{i+1} wastes $3.60/month."
 
-                        already_wasted = round((age_days / 30) * eip_price, 2)
+                    already_wasted = round((age_days / 30) * eip_price, 2)
 
-                        metadata = {
-                            "public_ip": public_ip,
-                            "allocation_time": allocation_time.isoformat(),
-                            "age_days": age_days,
-                            "confidence": confidence,
-                            "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                            "orphan_reason": reason,
-                            "orphan_type": "additional_eip_per_instance",
-                            "associated_instance_id": instance_id,
-                            "total_eips_on_instance": len(eips),
-                            "eip_index": i + 1,
-                            "already_wasted": already_wasted,
-                        }
+                    metadata = {
+                        "public_ip": public_ip,
+                        "allocation_time": allocation_time.isoformat(),
+                        "age_days": age_days,
+                        "confidence": confidence,
+                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                        "orphan_reason": reason,
+                        "orphan_type": "additional_eip_per_instance",
+                        "associated_instance_id": instance_id,
+                        "total_eips_on_instance": len(eips),
+                        "eip_index": i + 1,
+                        "already_wasted": already_wasted,
+                    }
 
-                        orphans.append(
-                            OrphanResourceData(
-                                resource_type="elastic_ip_multiple_per_instance",
-                                resource_id=allocation_id,
-                                resource_name=name,
-                                region=region,
-                                estimated_monthly_cost=eip_price,
-                                resource_metadata=metadata,
-                            )
+                    orphans.append(
+                        OrphanResourceData(
+                            resource_type="elastic_ip_multiple_per_instance",
+                            resource_id=allocation_id,
+                            resource_name=name,
+                            region=region,
+                            estimated_monthly_cost=eip_price,
+                            resource_metadata=metadata,
                         )
+                    )
 
         except ClientError as e:
             print(f"Error scanning additional EIPs per instance (Scenario 3) in {region}: {e}")
@@ -2351,11 +2497,11 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
+            eip_price = await self._get_price("elastic_ip", region)
 
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all EIPs
-                eips_response = await ec2.describe_addresses()
+                eips_response = await self._ec2_snapshot(region).describe_addresses()
 
                 # Get all ENIs to check their attachment status
                 enis_response = await ec2.describe_network_interfaces()
@@ -2477,79 +2623,78 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
-
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_addresses()
-
-                for address in response.get("Addresses", []):
-                    # Check if EIP was NEVER associated
-                    association_id = address.get("AssociationId")
-                    instance_id = address.get("InstanceId")
-                    network_interface_id = address.get("NetworkInterfaceId")
-
-                    # AWS Elastic IP attributes:
-                    # - If never attached: no AssociationId, no InstanceId, no NetworkInterfaceId
-                    # - If currently unattached but was attached before: may have NetworkInterfaceId (of last attachment)
-                    # The key is: if AssociationId is None AND NetworkInterfaceOwnerId is "amazon-elb" or missing
-
-                    network_interface_owner_id = address.get("NetworkInterfaceOwnerId")
-
-                    # Only flag if:
-                    # 1. Not currently associated (no AssociationId)
-                    # 2. No previous association trace (no NetworkInterfaceId OR NetworkInterfaceOwnerId is amazon service)
-                    if association_id:
-                        continue  # Currently associated
-
-                    if network_interface_id and network_interface_owner_id not in [None, "amazon-elb", "amazon-aws"]:
-                        # Was previously associated with user resource
-                        continue
-
-                    allocation_id = address.get("AllocationId", "N/A")
-                    public_ip = address.get("PublicIp", "Unknown")
-                    allocation_time = address.get("AllocationTime")
-
-                    if not allocation_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(allocation_time)
-
-                    if age_days < min_age_days or age_days < min_never_used_days:
-                        continue
-
-                    # Extract name from tags
-                    name = None
-                    for tag in address.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    confidence = "critical" if age_days >= 90 else ("high" if age_days >= 30 else "medium")
-                    reason = f"Never associated with any resource for {age_days} days ($3.60/month waste)"
-
-                    already_wasted = round((age_days / 30) * eip_price, 2)
-
-                    metadata = {
-                        "public_ip": public_ip,
-                        "allocation_time": allocation_time.isoformat(),
-                        "age_days": age_days,
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": "never_used",
-                        "already_wasted": already_wasted,
-                    }
+            eip_price = await self._get_price("elastic_ip", region)
+
+            response = await self._ec2_snapshot(region).describe_addresses()
+
+            for address in response.get("Addresses", []):
+                # Check if EIP was NEVER associated
+                association_id = address.get("AssociationId")
+                instance_id = address.get("InstanceId")
+                network_interface_id = address.get("NetworkInterfaceId")
+
+                # AWS Elastic IP attributes:
+                # - If never attached: no AssociationId, no InstanceId, no NetworkInterfaceId
+                # - If currently unattached but was attached before: may have NetworkInterfaceId (of last attachment)
+                # The key is: if AssociationId is None AND NetworkInterfaceOwnerId is "amazon-elb" or missing
+
+                network_interface_owner_id = address.get("NetworkInterfaceOwnerId")
+
+                # Only flag if:
+                # 1. Not currently associated (no AssociationId)
+                # 2. No previous association trace (no NetworkInterfaceId OR NetworkInterfaceOwnerId is amazon service)
+                if association_id:
+                    continue  # Currently associated
+
+                if network_interface_id and network_interface_owner_id not in [None, "amazon-elb", "amazon-aws"]:
+                    # Was previously associated with user resource
+                    continue
+
+                allocation_id = address.get("AllocationId", "N/A")
+                public_ip = address.get("PublicIp", "Unknown")
+                allocation_time = address.get("AllocationTime")
+
+                if not allocation_time:
+                    continue
+
+                age_days = self._safe_datetime_age(allocation_time)
+
+                if age_days < min_age_days or age_days < min_never_used_days:
+                    continue
+
+                # Extract name from tags
+                name = None
+                for tag in address.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                confidence = "critical" if age_days >= 90 else ("high" if age_days >= 30 else "medium")
+                reason = f"Never associated with any resource for {age_days} days ($3.60/month waste)"
+
+                already_wasted = round((age_days / 30) * eip_price, 2)
+
+                metadata = {
+                    "public_ip": public_ip,
+                    "allocation_time": allocation_time.isoformat(),
+                    "age_days": age_days,
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": "never_used",
+                    "already_wasted": already_wasted,
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="elastic_ip_never_used",
-                            resource_id=allocation_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=eip_price,
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="elastic_ip_never_used",
+                        resource_id=allocation_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=eip_price,
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
             print(f"Error scanning never-used EIPs (Scenario 5) in {region}: {e}")
@@ -2591,11 +2736,11 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
+            eip_price = await self._get_price("elastic_ip", region)
 
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all EIPs
-                eips_response = await ec2.describe_addresses()
+                eips_response = await self._ec2_snapshot(region).describe_addresses()
 
                 # Get all NAT Gateways
                 nat_gateways_response = await ec2.describe_nat_gateways(
@@ -2621,6 +2766,16 @@ class AWSProvider(CloudProviderBase):
                                 "public_ip": public_ip,
                             }
 
+                # Fetch metrics of every NAT Gateway with an EIP in batched GetMetricData calls
+                await self._metric_collector(region).fetch([
+                    query
+                    for nat_gw_id in set(eip_to_nat_gateway.values())
+                    if nat_gw_id in nat_gateway_info
+                    for query in self._nat_gateway_metric_queries(
+                        nat_gw_id, region, period_days=min_observation_days
+                    )
+                ])
+
                 # Check each EIP associated with NAT Gateway
                 for address in eips_response.get("Addresses", []):
                     allocation_id = address.get("AllocationId", "N/A")
@@ -2738,95 +2893,103 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
-
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get all EIPs
-                eips_response = await ec2.describe_addresses()
-
-                # Get all running instances
-                instances_response = await ec2.describe_instances(
-                    Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
+            eip_price = await self._get_price("elastic_ip", region)
+
+            # Get all EIPs
+            eips_response = await self._ec2_snapshot(region).describe_addresses()
+
+            # Get all running instances
+            instances_response = await self._ec2_snapshot(region).describe_instances(states=["running"])
+            running_instances = {}  # {instance_id: launch_time}
+            for reservation in instances_response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    running_instances[instance["InstanceId"]] = instance.get("LaunchTime")
+
+            # Fetch metrics of every running instance with an EIP in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for instance_id in {a.get("InstanceId") for a in eips_response.get("Addresses", [])}
+                if instance_id in running_instances
+                for query in self._ec2_network_metric_queries(
+                    instance_id, region, period_days=min_observation_days
                 )
-                running_instances = {}  # {instance_id: launch_time}
-                for reservation in instances_response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        running_instances[instance["InstanceId"]] = instance.get("LaunchTime")
-
-                for address in eips_response.get("Addresses", []):
-                    instance_id = address.get("InstanceId")
-
-                    if not instance_id or instance_id not in running_instances:
-                        continue  # Only check EIPs on running instances
-
-                    allocation_id = address.get("AllocationId", "N/A")
-                    public_ip = address.get("PublicIp", "Unknown")
-                    allocation_time = address.get("AllocationTime")
-
-                    if not allocation_time:
-                        continue
-
-                    launch_time = running_instances[instance_id]
-                    running_days = self._safe_datetime_age(launch_time)
-
-                    if running_days < min_idle_days:
-                        continue
-
-                    # Get CloudWatch network metrics for the instance
-                    metrics = await self._get_ec2_network_metrics(
-                        instance_id, region, period_days=min_observation_days
-                    )
+            ])
 
-                    total_traffic_bytes = metrics.get("network_in", 0.0) + metrics.get("network_out", 0.0)
+            for address in eips_response.get("Addresses", []):
+                instance_id = address.get("InstanceId")
 
-                    # Flag if traffic is below idle threshold
-                    if total_traffic_bytes > idle_network_threshold_bytes:
-                        continue  # Instance has sufficient network activity
+                if not instance_id or instance_id not in running_instances:
+                    continue  # Only check EIPs on running instances
 
-                    # This instance (and its EIP) is idle!
-                    age_days = self._safe_datetime_age(allocation_time)
+                allocation_id = address.get("AllocationId", "N/A")
+                public_ip = address.get("PublicIp", "Unknown")
+                allocation_time = address.get("AllocationTime")
 
-                    # Extract name from tags
-                    name = None
-                    for tag in address.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+                if not allocation_time:
+                    continue
 
-                    confidence = "critical" if running_days >= 90 else ("high" if running_days >= 60 else "medium")
+                launch_time = running_instances[instance_id]
+                running_days = self._safe_datetime_age(launch_time)
 
-                    total_traffic_mb = total_traffic_bytes / (1024 * 1024)
-                    reason = f"EIP on idle running instance {instance_id} ({total_traffic_mb:.2f} MB traffic in {min_observation_days} days). Instance running but unused for {running_days} days."
+                if running_days < min_idle_days:
+                    continue
 
-                    already_wasted = round((age_days / 30) * eip_price, 2)
+                # Get CloudWatch network metrics for the instance
+                metrics = await self._get_ec2_network_metrics(
+                    instance_id, region, period_days=min_observation_days
+                )
 
-                    metadata = {
-                        "public_ip": public_ip,
-                        "allocation_time": allocation_time.isoformat(),
-                        "age_days": age_days,
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": "idle_eip",
-                        "associated_instance_id": instance_id,
-                        "instance_running_days": running_days,
-                        "total_network_traffic_mb": round(total_traffic_mb, 2),
-                        "observation_period_days": min_observation_days,
-                        "already_wasted": already_wasted,
-                    }
+                total_traffic_bytes = metrics.get("network_in", 0.0) + metrics.get("network_out", 0.0)
+
+                # Flag if traffic is below idle threshold
+                if total_traffic_bytes > idle_network_threshold_bytes:
+                    continue  # Instance has sufficient network activity
+
+                # This instance (and its EIP) is idle!
+                age_days = self._safe_datetime_age(allocation_time)
+
+                # Extract name from tags
+                name = None
+                for tag in address.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                confidence = "critical" if running_days >= 90 else ("high" if running_days >= 60 else "medium")
+
+                total_traffic_mb = total_traffic_bytes / (1024 * 1024)
+                reason = f"EIP on idle running instance {instance_id} ({total_traffic_mb:.2f} MB traffic in {min_observation_days} days). Instance running but unused for {running_days} days."
+
+                already_wasted = round((age_days / 30) * eip_price, 2)
+
+                metadata = {
+                    "public_ip": public_ip,
+                    "allocation_time": allocation_time.isoformat(),
+                    "age_days": age_days,
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": "idle_eip",
+                    "associated_instance_id": instance_id,
+                    "instance_running_days": running_days,
+                    "total_network_traffic_mb": round(total_traffic_mb, 2),
+                    "observation_period_days": min_observation_days,
+                    "already_wasted": already_wasted,
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="elastic_ip_idle",
-                            resource_id=allocation_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=eip_price,
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="elastic_ip_idle",
+                        resource_id=allocation_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=eip_price,
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning idle EIPs (Scenario 7) in {region}: {e}")
 
         return orphans
@@ -2866,97 +3029,105 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
-
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get all EIPs
-                eips_response = await ec2.describe_addresses()
-
-                # Get all running instances
-                instances_response = await ec2.describe_instances(
-                    Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
+            eip_price = await self._get_price("elastic_ip", region)
+
+            # Get all EIPs
+            eips_response = await self._ec2_snapshot(region).describe_addresses()
+
+            # Get all running instances
+            instances_response = await self._ec2_snapshot(region).describe_instances(states=["running"])
+            running_instances = {}  # {instance_id: launch_time}
+            for reservation in instances_response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    running_instances[instance["InstanceId"]] = instance.get("LaunchTime")
+
+            # Fetch metrics of every running instance with an EIP in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for instance_id in {a.get("InstanceId") for a in eips_response.get("Addresses", [])}
+                if instance_id in running_instances
+                for query in self._ec2_network_metric_queries(
+                    instance_id, region, period_days=min_observation_days
                 )
-                running_instances = {}  # {instance_id: launch_time}
-                for reservation in instances_response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        running_instances[instance["InstanceId"]] = instance.get("LaunchTime")
+            ])
 
-                for address in eips_response.get("Addresses", []):
-                    instance_id = address.get("InstanceId")
+            for address in eips_response.get("Addresses", []):
+                instance_id = address.get("InstanceId")
 
-                    if not instance_id or instance_id not in running_instances:
-                        continue  # Only check EIPs on running instances
+                if not instance_id or instance_id not in running_instances:
+                    continue  # Only check EIPs on running instances
 
-                    allocation_id = address.get("AllocationId", "N/A")
-                    public_ip = address.get("PublicIp", "Unknown")
-                    allocation_time = address.get("AllocationTime")
+                allocation_id = address.get("AllocationId", "N/A")
+                public_ip = address.get("PublicIp", "Unknown")
+                allocation_time = address.get("AllocationTime")
 
-                    if not allocation_time:
-                        continue
+                if not allocation_time:
+                    continue
 
-                    age_days = self._safe_datetime_age(allocation_time)
-                    if age_days < min_age_days:
-                        continue
+                age_days = self._safe_datetime_age(allocation_time)
+                if age_days < min_age_days:
+                    continue
 
-                    # Get CloudWatch network metrics for the instance
-                    metrics = await self._get_ec2_network_metrics(
-                        instance_id, region, period_days=min_observation_days
-                    )
+                # Get CloudWatch network metrics for the instance
+                metrics = await self._get_ec2_network_metrics(
+                    instance_id, region, period_days=min_observation_days
+                )
 
-                    total_traffic_gb = metrics.get("total_traffic_gb", 0.0)
+                total_traffic_gb = metrics.get("total_traffic_gb", 0.0)
 
-                    # Flag if traffic is low but not zero (to avoid overlap with Scenario 7)
-                    if total_traffic_gb >= low_traffic_threshold_gb:
-                        continue  # Traffic is above low-traffic threshold
+                # Flag if traffic is low but not zero (to avoid overlap with Scenario 7)
+                if total_traffic_gb >= low_traffic_threshold_gb:
+                    continue  # Traffic is above low-traffic threshold
 
-                    if total_traffic_gb < 0.001:  # Less than 1 MB
-                        continue  # Covered by Scenario 7 (idle)
+                if total_traffic_gb < 0.001:  # Less than 1 MB
+                    continue  # Covered by Scenario 7 (idle)
 
-                    # This EIP has low traffic!
-                    launch_time = running_instances[instance_id]
-                    running_days = self._safe_datetime_age(launch_time)
+                # This EIP has low traffic!
+                launch_time = running_instances[instance_id]
+                running_days = self._safe_datetime_age(launch_time)
 
-                    # Extract name from tags
-                    name = None
-                    for tag in address.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+                # Extract name from tags
+                name = None
+                for tag in address.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
 
-                    confidence = "high" if running_days >= 60 else ("medium" if running_days >= 30 else "low")
+                confidence = "high" if running_days >= 60 else ("medium" if running_days >= 30 else "low")
 
-                    reason = f"EIP on low-traffic instance {instance_id} ({total_traffic_gb:.4f} GB in {min_observation_days} days, < {low_traffic_threshold_gb} GB threshold)."
+                reason = f"EIP on low-traffic instance {instance_id} ({total_traffic_gb:.4f} GB in {min_observation_days} days, < {low_traffic_threshold_gb} GB threshold)."
 
-                    already_wasted = round((age_days / 30) * eip_price, 2)
+                already_wasted = round((age_days / 30) * eip_price, 2)
 
-                    metadata = {
-                        "public_ip": public_ip,
-                        "allocation_time": allocation_time.isoformat(),
-                        "age_days": age_days,
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": "low_traffic_eip",
-                        "associated_instance_id": instance_id,
-                        "instance_running_days": running_days,
-                        "total_traffic_gb": round(total_traffic_gb, 4),
-                        "observation_period_days": min_observation_days,
-                        "low_traffic_threshold_gb": low_traffic_threshold_gb,
-                        "already_wasted": already_wasted,
-                    }
+                metadata = {
+                    "public_ip": public_ip,
+                    "allocation_time": allocation_time.isoformat(),
+                    "age_days": age_days,
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": "low_traffic_eip",
+                    "associated_instance_id": instance_id,
+                    "instance_running_days": running_days,
+                    "total_traffic_gb": round(total_traffic_gb, 4),
+                    "observation_period_days": min_observation_days,
+                    "low_traffic_threshold_gb": low_traffic_threshold_gb,
+                    "already_wasted": already_wasted,
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="elastic_ip_low_traffic",
-                            resource_id=allocation_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=eip_price,
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="elastic_ip_low_traffic",
+                        resource_id=allocation_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=eip_price,
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning low-traffic EIPs (Scenario 8) in {region}: {e}")
 
         return orphans
@@ -2995,11 +3166,11 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
+            eip_price = await self._get_price("elastic_ip", region)
 
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all EIPs
-                eips_response = await ec2.describe_addresses()
+                eips_response = await self._ec2_snapshot(region).describe_addresses()
 
                 # Get all NAT Gateways
                 nat_gateways_response = await ec2.describe_nat_gateways(
@@ -3025,6 +3196,16 @@ class AWSProvider(CloudProviderBase):
                                 "public_ip": public_ip,
                             }
 
+                # Fetch metrics of every NAT Gateway with an EIP in batched GetMetricData calls
+                await self._metric_collector(region).fetch([
+                    query
+                    for nat_gw_id in set(eip_to_nat_gateway.values())
+                    if nat_gw_id in nat_gateway_info
+                    for query in self._nat_gateway_metric_queries(
+                        nat_gw_id, region, period_days=min_observation_days
+                    )
+                ])
+
                 # Check each EIP associated with NAT Gateway
                 for address in eips_response.get("Addresses", []):
                     allocation_id = address.get("AllocationId", "N/A")
@@ -3142,98 +3323,106 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Get dynamic pricing for Elastic IP
-            eip_price = await self.pricing_service.get_aws_price("elastic_ip", region)
+            eip_price = await self._get_price("elastic_ip", region)
+
+            # Get all EIPs
+            eips_response = await self._ec2_snapshot(region).describe_addresses()
+
+            # Get all running instances
+            instances_response = await self._ec2_snapshot(region).describe_instances(states=["running"])
+            running_instances = {}  # {instance_id: launch_time}
+            for reservation in instances_response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    running_instances[instance["InstanceId"]] = instance.get("LaunchTime")
+
+            # Fetch metrics of every running instance with an EIP in batched GetMetricData calls
+            await self._metric_collector(region).fetch([
+                query
+                for instance_id in {a.get("InstanceId") for a in eips_response.get("Addresses", [])}
+                if instance_id in running_instances
+                for query in self._ec2_network_metric_queries(
+                    instance_id, region, period_days=min_observation_days
+                )
+            ])
 
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get all EIPs
-                eips_response = await ec2.describe_addresses()
+            for address in eips_response.get("Addresses", []):
+                instance_id = address.get("InstanceId")
 
-                # Get all running instances
-                instances_response = await ec2.describe_instances(
-                    Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
-                )
-                running_instances = {}  # {instance_id: launch_time}
-                for reservation in instances_response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        running_instances[instance["InstanceId"]] = instance.get("LaunchTime")
+                if not instance_id or instance_id not in running_instances:
+                    continue  # Only check EIPs on running instances
 
-                for address in eips_response.get("Addresses", []):
-                    instance_id = address.get("InstanceId")
+                allocation_id = address.get("AllocationId", "N/A")
+                public_ip = address.get("PublicIp", "Unknown")
+                allocation_time = address.get("AllocationTime")
 
-                    if not instance_id or instance_id not in running_instances:
-                        continue  # Only check EIPs on running instances
+                if not allocation_time:
+                    continue
 
-                    allocation_id = address.get("AllocationId", "N/A")
-                    public_ip = address.get("PublicIp", "Unknown")
-                    allocation_time = address.get("AllocationTime")
+                age_days = self._safe_datetime_age(allocation_time)
 
-                    if not allocation_time:
-                        continue
+                # Get CloudWatch status check metrics for the instance
+                metrics = await self._get_ec2_network_metrics(
+                    instance_id, region, period_days=min_observation_days
+                )
 
-                    age_days = self._safe_datetime_age(allocation_time)
+                status_check_failed = metrics.get("status_check_failed", 0.0)
+                status_check_failed_instance = metrics.get("status_check_failed_instance", 0.0)
+                status_check_failed_system = metrics.get("status_check_failed_system", 0.0)
+
+                # Flag if excessive status check failures
+                if status_check_failed < max_status_check_failures:
+                    continue  # Instance is healthy or has acceptable failure rate
+
+                # This instance is failing status checks!
+                launch_time = running_instances[instance_id]
+                running_days = self._safe_datetime_age(launch_time)
+
+                if running_days < min_failed_days:
+                    continue
+
+                # Extract name from tags
+                name = None
+                for tag in address.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                confidence = "critical" if status_check_failed >= 30 else ("high" if status_check_failed >= 14 else "medium")
+
+                reason = f"EIP on failing instance {instance_id} ({int(status_check_failed)} status check failures in {min_observation_days} days). Instance may be unresponsive or misconfigured."
+
+                already_wasted = round((age_days / 30) * eip_price, 2)
+
+                metadata = {
+                    "public_ip": public_ip,
+                    "allocation_time": allocation_time.isoformat(),
+                    "age_days": age_days,
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": "eip_on_failed_instance",
+                    "associated_instance_id": instance_id,
+                    "instance_running_days": running_days,
+                    "status_check_failed_total": int(status_check_failed),
+                    "status_check_failed_instance": int(status_check_failed_instance),
+                    "status_check_failed_system": int(status_check_failed_system),
+                    "observation_period_days": min_observation_days,
+                    "already_wasted": already_wasted,
+                }
 
-                    # Get CloudWatch status check metrics for the instance
-                    metrics = await self._get_ec2_network_metrics(
-                        instance_id, region, period_days=min_observation_days
-                    )
-
-                    status_check_failed = metrics.get("status_check_failed", 0.0)
-                    status_check_failed_instance = metrics.get("status_check_failed_instance", 0.0)
-                    status_check_failed_system = metrics.get("status_check_failed_system", 0.0)
-
-                    # Flag if excessive status check failures
-                    if status_check_failed < max_status_check_failures:
-                        continue  # Instance is healthy or has acceptable failure rate
-
-                    # This instance is failing status checks!
-                    launch_time = running_instances[instance_id]
-                    running_days = self._safe_datetime_age(launch_time)
-
-                    if running_days < min_failed_days:
-                        continue
-
-                    # Extract name from tags
-                    name = None
-                    for tag in address.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
-
-                    confidence = "critical" if status_check_failed >= 30 else ("high" if status_check_failed >= 14 else "medium")
-
-                    reason = f"EIP on failing instance {instance_id} ({int(status_check_failed)} status check failures in {min_observation_days} days). Instance may be unresponsive or misconfigured."
-
-                    already_wasted = round((age_days / 30) * eip_price, 2)
-
-                    metadata = {
-                        "public_ip": public_ip,
-                        "allocation_time": allocation_time.isoformat(),
-                        "age_days": age_days,
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": "eip_on_failed_instance",
-                        "associated_instance_id": instance_id,
-                        "instance_running_days": running_days,
-                        "status_check_failed_total": int(status_check_failed),
-                        "status_check_failed_instance": int(status_check_failed_instance),
-                        "status_check_failed_system": int(status_check_failed_system),
-                        "observation_period_days": min_observation_days,
-                        "already_wasted": already_wasted,
-                    }
-
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="elastic_ip_on_failed_instance",
-                            resource_id=allocation_id,
-                            resource_name=name,
-                            region=region,
-                            estimated_monthly_cost=eip_price,
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="elastic_ip_on_failed_instance",
+                        resource_id=allocation_id,
+                        resource_name=name,
+                        region=region,
+                        estimated_monthly_cost=eip_price,
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning EIPs on failed instances (Scenario 10) in {region}: {e}")
 
         return orphans
@@ -3274,128 +3463,123 @@ class AWSProvider(CloudProviderBase):
             orphaned_volume_ids = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
-
-                # Get all existing volumes with their status
-                volumes_response = await ec2.describe_volumes()
-                volume_info = {}
-                for vol in volumes_response.get("Volumes", []):
-                    volume_info[vol["VolumeId"]] = {
-                        "state": vol["State"],
-                        "attachments": vol.get("Attachments", []),
-                    }
-
-                for snapshot in all_snapshots:
-                    snapshot_id = snapshot["SnapshotId"]
-                    volume_id = snapshot.get("VolumeId")
-                    start_time = snapshot.get("StartTime")
-
-                    # Skip snapshot if no StartTime available
-                    if not start_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(start_time)
-
-                    should_flag = False
-                    orphan_type = ""
-                    source_volume_status = "unknown"
-
-                    # CASE 1: Volume no longer exists
-                    if volume_id not in volume_info and age_days >= min_age_days:
-                        should_flag = True
-                        orphan_type = "volume_deleted"
-                        source_volume_status = "deleted"
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            # Get all existing volumes with their status
+            volumes_response = await self._ec2_snapshot(region).describe_volumes()
+            volume_info = {}
+            for vol in volumes_response.get("Volumes", []):
+                volume_info[vol["VolumeId"]] = {
+                    "state": vol["State"],
+                    "attachments": vol.get("Attachments", []),
+                }
 
-                    # CASE 2: Snapshot of idle/orphaned volume
-                    elif detect_idle_volume_snapshots and volume_id in orphaned_volume_ids:
-                        should_flag = True
-                        orphan_type = "idle_volume_snapshot"
-                        if volume_id in volume_info:
-                            vol_state = volume_info[volume_id]["state"]
-                            is_attached = len(volume_info[volume_id]["attachments"]) > 0
-                            if not is_attached:
-                                source_volume_status = "unattached"
-                            else:
-                                source_volume_status = "attached_idle"
+            for snapshot in all_snapshots:
+                snapshot_id = snapshot["SnapshotId"]
+                volume_id = snapshot.get("VolumeId")
+                start_time = snapshot.get("StartTime")
+
+                # Skip snapshot if no StartTime available
+                if not start_time:
+                    continue
+
+                age_days = self._safe_datetime_age(start_time)
+
+                should_flag = False
+                orphan_type = ""
+                source_volume_status = "unknown"
+
+                # CASE 1: Volume no longer exists
+                if volume_id not in volume_info and age_days >= min_age_days:
+                    should_flag = True
+                    orphan_type = "volume_deleted"
+                    source_volume_status = "deleted"
+
+                # CASE 2: Snapshot of idle/orphaned volume
+                elif detect_idle_volume_snapshots and volume_id in orphaned_volume_ids:
+                    should_flag = True
+                    orphan_type = "idle_volume_snapshot"
+                    if volume_id in volume_info:
+                        vol_state = volume_info[volume_id]["state"]
+                        is_attached = len(volume_info[volume_id]["attachments"]) > 0
+                        if not is_attached:
+                            source_volume_status = "unattached"
                         else:
-                            source_volume_status = "deleted"
+                            source_volume_status = "attached_idle"
+                    else:
+                        source_volume_status = "deleted"
 
-                    if not should_flag:
-                        continue
+                if not should_flag:
+                    continue
 
-                    size_gb = snapshot["VolumeSize"]
-                    monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
+                size_gb = snapshot["VolumeSize"]
+                monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                    # Determine confidence level based on orphan type and age
-                    if orphan_type == "volume_deleted":
-                        if age_days >= confidence_threshold_days:
-                            confidence = "high"
-                            reason = f"Snapshot {age_days} days old with deleted source volume (safe to delete)"
-                        elif age_days >= min_age_days * 2:
-                            confidence = "high"
-                            reason = f"Snapshot {age_days} days old with deleted source volume"
-                        elif age_days >= min_age_days:
-                            confidence = "medium"
-                            reason = f"Snapshot {age_days} days old with deleted source volume"
-                        else:
-                            confidence = "low"
-                            reason = f"Recent snapshot ({age_days} days) with deleted source volume (verify before deleting)"
-
-                    elif orphan_type == "idle_volume_snapshot":
-                        if source_volume_status == "unattached":
-                            confidence = "high"
-                            reason = f"Snapshot of unattached volume {volume_id} (volume is orphaned)"
-                        elif source_volume_status == "attached_idle":
-                            confidence = "medium"
-                            reason = f"Snapshot of idle volume {volume_id} (volume has no I/O activity)"
-                        else:
-                            confidence = "medium"
-                            reason = f"Snapshot of orphaned volume {volume_id}"
+                # Determine confidence level based on orphan type and age
+                if orphan_type == "volume_deleted":
+                    if age_days >= confidence_threshold_days:
+                        confidence = "high"
+                        reason = f"Snapshot {age_days} days old with deleted source volume (safe to delete)"
+                    elif age_days >= min_age_days * 2:
+                        confidence = "high"
+                        reason = f"Snapshot {age_days} days old with deleted source volume"
+                    elif age_days >= min_age_days:
+                        confidence = "medium"
+                        reason = f"Snapshot {age_days} days old with deleted source volume"
                     else:
                         confidence = "low"
-                        reason = "Detected as potentially orphaned"
-
-                    # Extract name/description
-                    description = snapshot.get("Description", "")
-                    name = None
-                    for tag in snapshot.get("Tags", []):
-                        if tag["Key"] == "Name":
-                            name = tag["Value"]
-                            break
+                        reason = f"Recent snapshot ({age_days} days) with deleted source volume (verify before deleting)"
 
-                    # Build metadata
-                    metadata = {
-                        "size_gb": size_gb,
-                        "volume_id": volume_id or "Unknown",
-                        "created_at": start_time.isoformat(),
-                        "age_days": age_days,
-                        "description": description,
-                        "encrypted": snapshot.get("Encrypted", False),
-                        "confidence": confidence,
-                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                        "orphan_reason": reason,
-                        "orphan_type": orphan_type,
-                        "source_volume_status": source_volume_status,
-                        "scenario": "ebs_snapshot_orphaned",
-                    }
+                elif orphan_type == "idle_volume_snapshot":
+                    if source_volume_status == "unattached":
+                        confidence = "high"
+                        reason = f"Snapshot of unattached volume {volume_id} (volume is orphaned)"
+                    elif source_volume_status == "attached_idle":
+                        confidence = "medium"
+                        reason = f"Snapshot of idle volume {volume_id} (volume has no I/O activity)"
+                    else:
+                        confidence = "medium"
+                        reason = f"Snapshot of orphaned volume {volume_id}"
+                else:
+                    confidence = "low"
+                    reason = "Detected as potentially orphaned"
+
+                # Extract name/description
+                description = snapshot.get("Description", "")
+                name = None
+                for tag in snapshot.get("Tags", []):
+                    if tag["Key"] == "Name":
+                        name = tag["Value"]
+                        break
+
+                # Build metadata
+                metadata = {
+                    "size_gb": size_gb,
+                    "volume_id": volume_id or "Unknown",
+                    "created_at": start_time.isoformat(),
+                    "age_days": age_days,
+                    "description": description,
+                    "encrypted": snapshot.get("Encrypted", False),
+                    "confidence": confidence,
+                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                    "orphan_reason": reason,
+                    "orphan_type": orphan_type,
+                    "source_volume_status": source_volume_status,
+                    "scenario": "ebs_snapshot_orphaned",
+                }
 
-                    orphans.append(
-                        OrphanResourceData(
-                            resource_type="ebs_snapshot_orphaned",
-                            resource_id=snapshot_id,
-                            resource_name=name or description,
-                            region=region,
-                            estimated_monthly_cost=round(monthly_cost, 2),
-                            resource_metadata=metadata,
-                        )
+                orphans.append(
+                    OrphanResourceData(
+                        resource_type="ebs_snapshot_orphaned",
+                        resource_id=snapshot_id,
+                        resource_name=name or description,
+                        region=region,
+                        estimated_monthly_cost=round(monthly_cost, 2),
+                        resource_metadata=metadata,
                     )
+                )
 
         except ClientError as e:
             print(f"Error scanning orphaned snapshots in {region}: {e}")
@@ -3431,96 +3615,91 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            # Get all existing volumes
+            volumes_response = await self._ec2_snapshot(region).describe_volumes()
+            volume_info = {}
+            for vol in volumes_response.get("Volumes", []):
+                volume_info[vol["VolumeId"]] = {
+                    "state": vol["State"],
+                    "attachments": vol.get("Attachments", []),
+                }
 
-                # Get all existing volumes
-                volumes_response = await ec2.describe_volumes()
-                volume_info = {}
-                for vol in volumes_response.get("Volumes", []):
-                    volume_info[vol["VolumeId"]] = {
-                        "state": vol["State"],
-                        "attachments": vol.get("Attachments", []),
-                    }
+            # Group snapshots by volume
+            snapshots_by_volume = {}
+            for snapshot in all_snapshots:
+                volume_id = snapshot.get("VolumeId")
+                if volume_id:
+                    if volume_id not in snapshots_by_volume:
+                        snapshots_by_volume[volume_id] = []
+                    snapshots_by_volume[volume_id].append(snapshot)
+
+            # Sort snapshots by creation date (newest first) for each volume
+            for volume_id in snapshots_by_volume:
+                snapshots_by_volume[volume_id].sort(
+                    key=lambda s: s["StartTime"], reverse=True
+                )
 
-                # Group snapshots by volume
-                snapshots_by_volume = {}
-                for snapshot in all_snapshots:
-                    volume_id = snapshot.get("VolumeId")
-                    if volume_id:
-                        if volume_id not in snapshots_by_volume:
-                            snapshots_by_volume[volume_id] = []
-                        snapshots_by_volume[volume_id].append(snapshot)
-
-                # Sort snapshots by creation date (newest first) for each volume
-                for volume_id in snapshots_by_volume:
-                    snapshots_by_volume[volume_id].sort(
-                        key=lambda s: s["StartTime"], reverse=True
-                    )
+            # Flag redundant snapshots
+            for volume_id, volume_snapshots in snapshots_by_volume.items():
+                if len(volume_snapshots) > max_snapshots_per_volume:
+                    # Flag snapshots beyond the retention limit
+                    for i, snapshot in enumerate(volume_snapshots):
+                        if i >= max_snapshots_per_volume:
+                            snapshot_id = snapshot["SnapshotId"]
+                            start_time = snapshot.get("StartTime")
 
-                # Flag redundant snapshots
-                for volume_id, volume_snapshots in snapshots_by_volume.items():
-                    if len(volume_snapshots) > max_snapshots_per_volume:
-                        # Flag snapshots beyond the retention limit
-                        for i, snapshot in enumerate(volume_snapshots):
-                            if i >= max_snapshots_per_volume:
-                                snapshot_id = snapshot["SnapshotId"]
-                                start_time = snapshot.get("StartTime")
-
-                                # Skip snapshot if no StartTime available
-                                if not start_time:
-                                    continue
+                            # Skip snapshot if no StartTime available
+                            if not start_time:
+                                continue
 
-                                age_days = self._safe_datetime_age(start_time)
-                                size_gb = snapshot["VolumeSize"]
-                                monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
+                            age_days = self._safe_datetime_age(start_time)
+                            size_gb = snapshot["VolumeSize"]
+                            monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                                # Extract name/description
-                                description = snapshot.get("Description", "")
-                                name = None
-                                for tag in snapshot.get("Tags", []):
-                                    if tag["Key"] == "Name":
-                                        name = tag["Value"]
-                                        break
+                            # Extract name/description
+                            description = snapshot.get("Description", "")
+                            name = None
+                            for tag in snapshot.get("Tags", []):
+                                if tag["Key"] == "Name":
+                                    name = tag["Value"]
+                                    break
 
-                                source_volume_status = "exists" if volume_id in volume_info else "deleted"
+                            source_volume_status = "exists" if volume_id in volume_info else "deleted"
 
-                                metadata = {
-                                    "size_gb": size_gb,
-                                    "volume_id": volume_id,
-                                    "created_at": start_time.isoformat(),
-                                    "age_days": age_days,
-                                    "description": description,
-                                    "encrypted": snapshot.get("Encrypted", False),
-                                    "confidence": "high",
-                                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                                    "orphan_reason": f"Redundant snapshot #{i+1} of {len(volume_snapshots)} (retention limit: {max_snapshots_per_volume})",
-                                    "orphan_type": "redundant_snapshot",
-                                    "source_volume_status": source_volume_status,
-                                    "redundant_info": {
-                                        "total_snapshots": len(volume_snapshots),
-                                        "retention_limit": max_snapshots_per_volume,
-                                        "position": i + 1,
-                                    },
-                                    "scenario": "ebs_snapshot_redundant",
-                                }
+                            metadata = {
+                                "size_gb": size_gb,
+                                "volume_id": volume_id,
+                                "created_at": start_time.isoformat(),
+                                "age_days": age_days,
+                                "description": description,
+                                "encrypted": snapshot.get("Encrypted", False),
+                                "confidence": "high",
+                                "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                                "orphan_reason": f"Redundant snapshot #{i+1} of {len(volume_snapshots)} (retention limit: {max_snapshots_per_volume})",
+                                "orphan_type": "redundant_snapshot",
+                                "source_volume_status": source_volume_status,
+                                "redundant_info": {
+                                    "total_snapshots": len(volume_snapshots),
+                                    "retention_limit": max_snapshots_per_volume,
+                                    "position": i + 1,
+                                },
+                                "scenario": "ebs_snapshot_redundant",
+                            }
 
-                                orphans.append(
-                                    OrphanResourceData(
-                                        resource_type="ebs_snapshot_redundant",
-                                        resource_id=snapshot_id,
-                                        resource_name=name or description,
-                                        region=region,
-                                        estimated_monthly_cost=round(monthly_cost, 2),
-                                        resource_metadata=metadata,
-                                    )
+                            orphans.append(
+                                OrphanResourceData(
+                                    resource_type="ebs_snapshot_redundant",
+                                    resource_id=snapshot_id,
+                                    resource_name=name or description,
+                                    region=region,
+                                    estimated_monthly_cost=round(monthly_cost, 2),
+                                    resource_metadata=metadata,
                                 )
+                            )
 
         except ClientError as e:
             print(f"Error scanning redundant snapshots in {region}: {e}")
@@ -3555,7 +3734,7 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get account ID
                 account_info = await self.validate_credentials()
                 account_id = account_info["account_id"]
@@ -3584,9 +3763,7 @@ class AWSProvider(CloudProviderBase):
                             ami_snapshots.append(snapshot_id)
 
                     # Check if any instances use this AMI
-                    instances_with_ami = await ec2.describe_instances(
-                        Filters=[{"Name": "image-id", "Values": [ami_id]}]
-                    )
+                    instances_with_ami = await self._ec2_snapshot(region).describe_instances(image_ids=[ami_id])
 
                     has_instances = False
                     for reservation in instances_with_ami.get("Reservations", []):
@@ -3600,7 +3777,7 @@ class AWSProvider(CloudProviderBase):
                             unused_ami_snapshot_ids.add((snapshot_id, ami_id))
 
                 # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
+                response = await self._ec2_snapshot(region).describe_snapshots()
                 all_snapshots = response.get("Snapshots", [])
 
                 # Flag unused AMI snapshots
@@ -3697,75 +3874,70 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
-
-                for snapshot in all_snapshots:
-                    snapshot_id = snapshot["SnapshotId"]
-                    start_time = snapshot.get("StartTime")
-
-                    # Skip snapshot if no StartTime available
-                    if not start_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(start_time)
-
-                    # Check if snapshot is old enough
-                    if age_days < old_unused_age_days:
-                        continue
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            for snapshot in all_snapshots:
+                snapshot_id = snapshot["SnapshotId"]
+                start_time = snapshot.get("StartTime")
+
+                # Skip snapshot if no StartTime available
+                if not start_time:
+                    continue
+
+                age_days = self._safe_datetime_age(start_time)
+
+                # Check if snapshot is old enough
+                if age_days < old_unused_age_days:
+                    continue
+
+                # Check if snapshot has any compliance tags
+                tags = snapshot.get("Tags", [])
+                has_compliance_tag = False
+                for tag in tags:
+                    if tag["Key"] in compliance_tags:
+                        has_compliance_tag = True
+                        break
+
+                # Flag only if no compliance tags
+                if not has_compliance_tag:
+                    size_gb = snapshot["VolumeSize"]
+                    monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                    # Check if snapshot has any compliance tags
-                    tags = snapshot.get("Tags", [])
-                    has_compliance_tag = False
+                    # Extract name/description
+                    description = snapshot.get("Description", "")
+                    name = None
                     for tag in tags:
-                        if tag["Key"] in compliance_tags:
-                            has_compliance_tag = True
+                        if tag["Key"] == "Name":
+                            name = tag["Value"]
                             break
 
-                    # Flag only if no compliance tags
-                    if not has_compliance_tag:
-                        size_gb = snapshot["VolumeSize"]
-                        monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
-
-                        # Extract name/description
-                        description = snapshot.get("Description", "")
-                        name = None
-                        for tag in tags:
-                            if tag["Key"] == "Name":
-                                name = tag["Value"]
-                                break
-
-                        metadata = {
-                            "size_gb": size_gb,
-                            "volume_id": snapshot.get("VolumeId", "Unknown"),
-                            "created_at": start_time.isoformat(),
-                            "age_days": age_days,
-                            "description": description,
-                            "encrypted": snapshot.get("Encrypted", False),
-                            "confidence": "high",
-                            "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                            "orphan_reason": f"Snapshot {age_days} days old without compliance/governance tags (likely abandoned)",
-                            "orphan_type": "old_unused",
-                            "has_compliance_tags": False,
-                            "scenario": "ebs_snapshot_old_unused",
-                        }
+                    metadata = {
+                        "size_gb": size_gb,
+                        "volume_id": snapshot.get("VolumeId", "Unknown"),
+                        "created_at": start_time.isoformat(),
+                        "age_days": age_days,
+                        "description": description,
+                        "encrypted": snapshot.get("Encrypted", False),
+                        "confidence": "high",
+                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                        "orphan_reason": f"Snapshot {age_days} days old without compliance/governance tags (likely abandoned)",
+                        "orphan_type": "old_unused",
+                        "has_compliance_tags": False,
+                        "scenario": "ebs_snapshot_old_unused",
+                    }
 
-                        orphans.append(
-                            OrphanResourceData(
-                                resource_type="ebs_snapshot_old_unused",
-                                resource_id=snapshot_id,
-                                resource_name=name or description,
-                                region=region,
-                                estimated_monthly_cost=round(monthly_cost, 2),
-                                resource_metadata=metadata,
-                            )
+                    orphans.append(
+                        OrphanResourceData(
+                            resource_type="ebs_snapshot_old_unused",
+                            resource_id=snapshot_id,
+                            resource_name=name or description,
+                            region=region,
+                            estimated_monthly_cost=round(monthly_cost, 2),
+                            resource_metadata=metadata,
                         )
+                    )
 
         except ClientError as e:
             print(f"Error scanning old unused snapshots in {region}: {e}")
@@ -3801,93 +3973,88 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
-
-                # Get all existing instances
-                instances_response = await ec2.describe_instances()
-                existing_instance_ids = set()
-                for reservation in instances_response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        existing_instance_ids.add(instance["InstanceId"])
-
-                # Pattern to match instance IDs in description (i-xxxxxxxxxxxxxxxxx)
-                instance_id_pattern = re.compile(r'i-[a-f0-9]{8,17}')
-
-                for snapshot in all_snapshots:
-                    snapshot_id = snapshot["SnapshotId"]
-                    description = snapshot.get("Description", "")
-                    start_time = snapshot.get("StartTime")
-
-                    # Skip snapshot if no StartTime available
-                    if not start_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(start_time)
-
-                    # Check if snapshot is old enough
-                    if age_days < min_age_days:
-                        continue
-
-                    # Parse instance IDs from description
-                    instance_ids_in_desc = instance_id_pattern.findall(description)
-
-                    if instance_ids_in_desc:
-                        # Check if any of these instances still exist
-                        all_deleted = True
-                        deleted_instance_ids = []
-                        for instance_id in instance_ids_in_desc:
-                            if instance_id in existing_instance_ids:
-                                all_deleted = False
-                            else:
-                                deleted_instance_ids.append(instance_id)
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            # Get all existing instances
+            instances_response = await self._ec2_snapshot(region).describe_instances()
+            existing_instance_ids = set()
+            for reservation in instances_response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    existing_instance_ids.add(instance["InstanceId"])
+
+            # Pattern to match instance IDs in description (i-xxxxxxxxxxxxxxxxx)
+            instance_id_pattern = re.compile(r'i-[a-f0-9]{8,17}')
+
+            for snapshot in all_snapshots:
+                snapshot_id = snapshot["SnapshotId"]
+                description = snapshot.get("Description", "")
+                start_time = snapshot.get("StartTime")
+
+                # Skip snapshot if no StartTime available
+                if not start_time:
+                    continue
+
+                age_days = self._safe_datetime_age(start_time)
+
+                # Check if snapshot is old enough
+                if age_days < min_age_days:
+                    continue
+
+                # Parse instance IDs from description
+                instance_ids_in_desc = instance_id_pattern.findall(description)
+
+                if instance_ids_in_desc:
+                    # Check if any of these instances still exist
+                    all_deleted = True
+                    deleted_instance_ids = []
+                    for instance_id in instance_ids_in_desc:
+                        if instance_id in existing_instance_ids:
+                            all_deleted = False
+                        else:
+                            deleted_instance_ids.append(instance_id)
 
-                        # Flag if at least one instance is deleted
-                        if deleted_instance_ids:
-                            size_gb = snapshot["VolumeSize"]
-                            monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
+                    # Flag if at least one instance is deleted
+                    if deleted_instance_ids:
+                        size_gb = snapshot["VolumeSize"]
+                        monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                            # Extract name/description
-                            name = None
-                            for tag in snapshot.get("Tags", []):
-                                if tag["Key"] == "Name":
-                                    name = tag["Value"]
-                                    break
+                        # Extract name/description
+                        name = None
+                        for tag in snapshot.get("Tags", []):
+                            if tag["Key"] == "Name":
+                                name = tag["Value"]
+                                break
 
-                            confidence = "high" if all_deleted else "medium"
+                        confidence = "high" if all_deleted else "medium"
 
-                            metadata = {
-                                "size_gb": size_gb,
-                                "volume_id": snapshot.get("VolumeId", "Unknown"),
-                                "created_at": start_time.isoformat(),
-                                "age_days": age_days,
-                                "description": description,
-                                "encrypted": snapshot.get("Encrypted", False),
-                                "confidence": confidence,
-                                "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                                "orphan_reason": f"Snapshot from deleted instance(s): {', '.join(deleted_instance_ids)}",
-                                "orphan_type": "deleted_instance_snapshot",
-                                "deleted_instance_ids": deleted_instance_ids,
-                                "all_instances_deleted": all_deleted,
-                                "scenario": "ebs_snapshot_from_deleted_instance",
-                            }
+                        metadata = {
+                            "size_gb": size_gb,
+                            "volume_id": snapshot.get("VolumeId", "Unknown"),
+                            "created_at": start_time.isoformat(),
+                            "age_days": age_days,
+                            "description": description,
+                            "encrypted": snapshot.get("Encrypted", False),
+                            "confidence": confidence,
+                            "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                            "orphan_reason": f"Snapshot from deleted instance(s): {', '.join(deleted_instance_ids)}",
+                            "orphan_type": "deleted_instance_snapshot",
+                            "deleted_instance_ids": deleted_instance_ids,
+                            "all_instances_deleted": all_deleted,
+                            "scenario": "ebs_snapshot_from_deleted_instance",
+                        }
 
-                            orphans.append(
-                                OrphanResourceData(
-                                    resource_type="ebs_snapshot_from_deleted_instance",
-                                    resource_id=snapshot_id,
-                                    resource_name=name or description,
-                                    region=region,
-                                    estimated_monthly_cost=round(monthly_cost, 2),
-                                    resource_metadata=metadata,
-                                )
+                        orphans.append(
+                            OrphanResourceData(
+                                resource_type="ebs_snapshot_from_deleted_instance",
+                                resource_id=snapshot_id,
+                                resource_name=name or description,
+                                region=region,
+                                estimated_monthly_cost=round(monthly_cost, 2),
+                                resource_metadata=metadata,
                             )
+                        )
 
         except ClientError as e:
             print(f"Error scanning snapshots from deleted instances in {region}: {e}")
@@ -3922,76 +4089,71 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
-
-                for snapshot in all_snapshots:
-                    snapshot_id = snapshot["SnapshotId"]
-                    state = snapshot.get("State", "")
-                    start_time = snapshot.get("StartTime")
-
-                    # Skip snapshot if no StartTime available
-                    if not start_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(start_time)
-
-                    # Flag if in error state OR pending for too long
-                    should_flag = False
-                    reason = ""
-
-                    if state == "error":
-                        should_flag = True
-                        reason = f"Snapshot in error state (failed to complete)"
-                        confidence = "critical"
-                    elif state == "pending" and age_days >= max_pending_days:
-                        should_flag = True
-                        reason = f"Snapshot stuck in pending state for {age_days} days (likely failed)"
-                        confidence = "high"
-
-                    if should_flag:
-                        size_gb = snapshot["VolumeSize"]
-                        monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            for snapshot in all_snapshots:
+                snapshot_id = snapshot["SnapshotId"]
+                state = snapshot.get("State", "")
+                start_time = snapshot.get("StartTime")
+
+                # Skip snapshot if no StartTime available
+                if not start_time:
+                    continue
+
+                age_days = self._safe_datetime_age(start_time)
+
+                # Flag if in error state OR pending for too long
+                should_flag = False
+                reason = ""
+
+                if state == "error":
+                    should_flag = True
+                    reason = f"Snapshot in error state (failed to complete)"
+                    confidence = "critical"
+                elif state == "pending" and age_days >= max_pending_days:
+                    should_flag = True
+                    reason = f"Snapshot stuck in pending state for {age_days} days (likely failed)"
+                    confidence = "high"
+
+                if should_flag:
+                    size_gb = snapshot["VolumeSize"]
+                    monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                        # Extract name/description
-                        description = snapshot.get("Description", "")
-                        name = None
-                        for tag in snapshot.get("Tags", []):
-                            if tag["Key"] == "Name":
-                                name = tag["Value"]
-                                break
+                    # Extract name/description
+                    description = snapshot.get("Description", "")
+                    name = None
+                    for tag in snapshot.get("Tags", []):
+                        if tag["Key"] == "Name":
+                            name = tag["Value"]
+                            break
 
-                        metadata = {
-                            "size_gb": size_gb,
-                            "volume_id": snapshot.get("VolumeId", "Unknown"),
-                            "created_at": start_time.isoformat(),
-                            "age_days": age_days,
-                            "description": description,
-                            "encrypted": snapshot.get("Encrypted", False),
-                            "confidence": confidence,
-                            "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                            "orphan_reason": reason,
-                            "orphan_type": "incomplete_failed",
-                            "snapshot_state": state,
-                            "scenario": "ebs_snapshot_incomplete_failed",
-                        }
+                    metadata = {
+                        "size_gb": size_gb,
+                        "volume_id": snapshot.get("VolumeId", "Unknown"),
+                        "created_at": start_time.isoformat(),
+                        "age_days": age_days,
+                        "description": description,
+                        "encrypted": snapshot.get("Encrypted", False),
+                        "confidence": confidence,
+                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                        "orphan_reason": reason,
+                        "orphan_type": "incomplete_failed",
+                        "snapshot_state": state,
+                        "scenario": "ebs_snapshot_incomplete_failed",
+                    }
 
-                        orphans.append(
-                            OrphanResourceData(
-                                resource_type="ebs_snapshot_incomplete_failed",
-                                resource_id=snapshot_id,
-                                resource_name=name or description,
-                                region=region,
-                                estimated_monthly_cost=round(monthly_cost, 2),
-                                resource_metadata=metadata,
-                            )
+                    orphans.append(
+                        OrphanResourceData(
+                            resource_type="ebs_snapshot_incomplete_failed",
+                            resource_id=snapshot_id,
+                            resource_name=name or description,
+                            region=region,
+                            estimated_monthly_cost=round(monthly_cost, 2),
+                            resource_metadata=metadata,
                         )
+                    )
 
         except ClientError as e:
             print(f"Error scanning incomplete/failed snapshots in {region}: {e}")
@@ -4026,57 +4188,52 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
 
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
+            for snapshot in all_snapshots:
+                snapshot_id = snapshot["SnapshotId"]
+                tags = snapshot.get("Tags", [])
+                start_time = snapshot.get("StartTime")
 
-                for snapshot in all_snapshots:
-                    snapshot_id = snapshot["SnapshotId"]
-                    tags = snapshot.get("Tags", [])
-                    start_time = snapshot.get("StartTime")
+                # Skip snapshot if no StartTime available
+                if not start_time:
+                    continue
 
-                    # Skip snapshot if no StartTime available
-                    if not start_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(start_time)
+                age_days = self._safe_datetime_age(start_time)
 
-                    # Flag if no tags and old enough
-                    if not tags and age_days >= min_untagged_age_days:
-                        size_gb = snapshot["VolumeSize"]
-                        monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
-                        description = snapshot.get("Description", "")
+                # Flag if no tags and old enough
+                if not tags and age_days >= min_untagged_age_days:
+                    size_gb = snapshot["VolumeSize"]
+                    monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
+                    description = snapshot.get("Description", "")
 
-                        metadata = {
-                            "size_gb": size_gb,
-                            "volume_id": snapshot.get("VolumeId", "Unknown"),
-                            "created_at": start_time.isoformat(),
-                            "age_days": age_days,
-                            "description": description,
-                            "encrypted": snapshot.get("Encrypted", False),
-                            "confidence": "high",
-                            "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                            "orphan_reason": f"Snapshot {age_days} days old with no tags (likely abandoned/unmanaged)",
-                            "orphan_type": "untagged",
-                            "has_tags": False,
-                            "scenario": "ebs_snapshot_untagged_unmanaged",
-                        }
+                    metadata = {
+                        "size_gb": size_gb,
+                        "volume_id": snapshot.get("VolumeId", "Unknown"),
+                        "created_at": start_time.isoformat(),
+                        "age_days": age_days,
+                        "description": description,
+                        "encrypted": snapshot.get("Encrypted", False),
+                        "confidence": "high",
+                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                        "orphan_reason": f"Snapshot {age_days} days old with no tags (likely abandoned/unmanaged)",
+                        "orphan_type": "untagged",
+                        "has_tags": False,
+                        "scenario": "ebs_snapshot_untagged_unmanaged",
+                    }
 
-                        orphans.append(
-                            OrphanResourceData(
-                                resource_type="ebs_snapshot_untagged",
-                                resource_id=snapshot_id,
-                                resource_name=description or snapshot_id,
-                                region=region,
-                                estimated_monthly_cost=round(monthly_cost, 2),
-                                resource_metadata=metadata,
-                            )
+                    orphans.append(
+                        OrphanResourceData(
+                            resource_type="ebs_snapshot_untagged",
+                            resource_id=snapshot_id,
+                            resource_name=description or snapshot_id,
+                            region=region,
+                            estimated_monthly_cost=round(monthly_cost, 2),
+                            resource_metadata=metadata,
                         )
+                    )
 
         except ClientError as e:
             print(f"Error scanning untagged snapshots in {region}: {e}")
@@ -4113,80 +4270,75 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
-
-                for snapshot in all_snapshots:
-                    snapshot_id = snapshot["SnapshotId"]
-                    tags = snapshot.get("Tags", [])
-                    start_time = snapshot.get("StartTime")
-
-                    # Skip snapshot if no StartTime available
-                    if not start_time:
-                        continue
-
-                    age_days = self._safe_datetime_age(start_time)
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            for snapshot in all_snapshots:
+                snapshot_id = snapshot["SnapshotId"]
+                tags = snapshot.get("Tags", [])
+                start_time = snapshot.get("StartTime")
+
+                # Skip snapshot if no StartTime available
+                if not start_time:
+                    continue
+
+                age_days = self._safe_datetime_age(start_time)
+
+                # Check if snapshot is old enough
+                if age_days < nonprod_max_days:
+                    continue
+
+                # Check if snapshot has non-prod environment tag
+                is_nonprod = False
+                env_value = None
+                for tag in tags:
+                    if tag["Key"] in nonprod_env_tags:
+                        tag_value = tag["Value"].lower()
+                        if tag_value in nonprod_env_values:
+                            is_nonprod = True
+                            env_value = tag_value
+                            break
 
-                    # Check if snapshot is old enough
-                    if age_days < nonprod_max_days:
-                        continue
+                # Flag if non-prod and old enough
+                if is_nonprod:
+                    size_gb = snapshot["VolumeSize"]
+                    monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                    # Check if snapshot has non-prod environment tag
-                    is_nonprod = False
-                    env_value = None
+                    # Extract name/description
+                    description = snapshot.get("Description", "")
+                    name = None
                     for tag in tags:
-                        if tag["Key"] in nonprod_env_tags:
-                            tag_value = tag["Value"].lower()
-                            if tag_value in nonprod_env_values:
-                                is_nonprod = True
-                                env_value = tag_value
-                                break
-
-                    # Flag if non-prod and old enough
-                    if is_nonprod:
-                        size_gb = snapshot["VolumeSize"]
-                        monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
-
-                        # Extract name/description
-                        description = snapshot.get("Description", "")
-                        name = None
-                        for tag in tags:
-                            if tag["Key"] == "Name":
-                                name = tag["Value"]
-                                break
+                        if tag["Key"] == "Name":
+                            name = tag["Value"]
+                            break
 
-                        metadata = {
-                            "size_gb": size_gb,
-                            "volume_id": snapshot.get("VolumeId", "Unknown"),
-                            "created_at": start_time.isoformat(),
-                            "age_days": age_days,
-                            "description": description,
-                            "encrypted": snapshot.get("Encrypted", False),
-                            "confidence": "high",
-                            "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                            "orphan_reason": f"Non-prod ({env_value}) snapshot retained for {age_days} days (exceeds {nonprod_max_days} day limit)",
-                            "orphan_type": "excessive_retention",
-                            "environment": env_value,
-                            "is_nonprod": True,
-                            "scenario": "ebs_snapshot_excessive_retention",
-                        }
+                    metadata = {
+                        "size_gb": size_gb,
+                        "volume_id": snapshot.get("VolumeId", "Unknown"),
+                        "created_at": start_time.isoformat(),
+                        "age_days": age_days,
+                        "description": description,
+                        "encrypted": snapshot.get("Encrypted", False),
+                        "confidence": "high",
+                        "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                        "orphan_reason": f"Non-prod ({env_value}) snapshot retained for {age_days} days (exceeds {nonprod_max_days} day limit)",
+                        "orphan_type": "excessive_retention",
+                        "environment": env_value,
+                        "is_nonprod": True,
+                        "scenario": "ebs_snapshot_excessive_retention",
+                    }
 
-                        orphans.append(
-                            OrphanResourceData(
-                                resource_type="ebs_snapshot_excessive_retention",
-                                resource_id=snapshot_id,
-                                resource_name=name or description,
-                                region=region,
-                                estimated_monthly_cost=round(monthly_cost, 2),
-                                resource_metadata=metadata,
-                            )
+                    orphans.append(
+                        OrphanResourceData(
+                            resource_type="ebs_snapshot_excessive_retention",
+                            resource_id=snapshot_id,
+                            resource_name=name or description,
+                            region=region,
+                            estimated_monthly_cost=round(monthly_cost, 2),
+                            resource_metadata=metadata,
                         )
+                    )
 
         except ClientError as e:
             print(f"Error scanning excessive retention snapshots in {region}: {e}")
@@ -4221,88 +4373,83 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                # Get account ID
-                account_info = await self.validate_credentials()
-                account_id = account_info["account_id"]
-
-                # Get all snapshots owned by this account
-                response = await ec2.describe_snapshots(OwnerIds=[account_id])
-                all_snapshots = response.get("Snapshots", [])
-
-                # Group snapshots by volume ID
-                snapshots_by_volume = {}
-                for snapshot in all_snapshots:
-                    volume_id = snapshot.get("VolumeId")
-                    if volume_id:
-                        if volume_id not in snapshots_by_volume:
-                            snapshots_by_volume[volume_id] = []
-                        snapshots_by_volume[volume_id].append(snapshot)
-
-                # Sort by creation time
-                for volume_id in snapshots_by_volume:
-                    snapshots_by_volume[volume_id].sort(key=lambda s: s["StartTime"])
-
-                # Find duplicates
-                for volume_id, volume_snapshots in snapshots_by_volume.items():
-                    for i, snapshot in enumerate(volume_snapshots):
-                        if i == 0:
-                            continue  # Skip first snapshot
-
-                        prev_snapshot = volume_snapshots[i - 1]
+            # Get all snapshots owned by this account
+            response = await self._ec2_snapshot(region).describe_snapshots()
+            all_snapshots = response.get("Snapshots", [])
+
+            # Group snapshots by volume ID
+            snapshots_by_volume = {}
+            for snapshot in all_snapshots:
+                volume_id = snapshot.get("VolumeId")
+                if volume_id:
+                    if volume_id not in snapshots_by_volume:
+                        snapshots_by_volume[volume_id] = []
+                    snapshots_by_volume[volume_id].append(snapshot)
+
+            # Sort by creation time
+            for volume_id in snapshots_by_volume:
+                snapshots_by_volume[volume_id].sort(key=lambda s: s["StartTime"])
+
+            # Find duplicates
+            for volume_id, volume_snapshots in snapshots_by_volume.items():
+                for i, snapshot in enumerate(volume_snapshots):
+                    if i == 0:
+                        continue  # Skip first snapshot
+
+                    prev_snapshot = volume_snapshots[i - 1]
+
+                    # Get StartTime for both snapshots (skip if either missing)
+                    snapshot_start_time = snapshot.get("StartTime")
+                    prev_snapshot_start_time = prev_snapshot.get("StartTime")
+
+                    if not snapshot_start_time or not prev_snapshot_start_time:
+                        continue
 
-                        # Get StartTime for both snapshots (skip if either missing)
-                        snapshot_start_time = snapshot.get("StartTime")
-                        prev_snapshot_start_time = prev_snapshot.get("StartTime")
+                    # Check if same size and within time window
+                    if snapshot["VolumeSize"] == prev_snapshot["VolumeSize"]:
+                        time_diff = snapshot_start_time - prev_snapshot_start_time
+                        time_diff_hours = time_diff.total_seconds() / 3600
 
-                        if not snapshot_start_time or not prev_snapshot_start_time:
-                            continue
+                        if time_diff_hours <= duplicate_window_hours:
+                            snapshot_id = snapshot["SnapshotId"]
+                            age_days = self._safe_datetime_age(snapshot_start_time)
+                            size_gb = snapshot["VolumeSize"]
+                            monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
 
-                        # Check if same size and within time window
-                        if snapshot["VolumeSize"] == prev_snapshot["VolumeSize"]:
-                            time_diff = snapshot_start_time - prev_snapshot_start_time
-                            time_diff_hours = time_diff.total_seconds() / 3600
-
-                            if time_diff_hours <= duplicate_window_hours:
-                                snapshot_id = snapshot["SnapshotId"]
-                                age_days = self._safe_datetime_age(snapshot_start_time)
-                                size_gb = snapshot["VolumeSize"]
-                                monthly_cost = size_gb * self.PRICING["snapshot_per_gb"]
-
-                                # Extract name/description
-                                description = snapshot.get("Description", "")
-                                name = None
-                                for tag in snapshot.get("Tags", []):
-                                    if tag["Key"] == "Name":
-                                        name = tag["Value"]
-                                        break
+                            # Extract name/description
+                            description = snapshot.get("Description", "")
+                            name = None
+                            for tag in snapshot.get("Tags", []):
+                                if tag["Key"] == "Name":
+                                    name = tag["Value"]
+                                    break
 
-                                metadata = {
-                                    "size_gb": size_gb,
-                                    "volume_id": volume_id,
-                                    "created_at": snapshot_start_time.isoformat(),
-                                    "age_days": age_days,
-                                    "description": description,
-                                    "encrypted": snapshot.get("Encrypted", False),
-                                    "confidence": "high",
-                                    "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
-                                    "orphan_reason": f"Duplicate snapshot created {time_diff_hours:.1f}h after previous snapshot (same volume, same size)",
-                                    "orphan_type": "duplicate",
-                                    "previous_snapshot_id": prev_snapshot["SnapshotId"],
-                                    "time_diff_hours": round(time_diff_hours, 2),
-                                    "scenario": "ebs_snapshot_duplicate_content",
-                                }
+                            metadata = {
+                                "size_gb": size_gb,
+                                "volume_id": volume_id,
+                                "created_at": snapshot_start_time.isoformat(),
+                                "age_days": age_days,
+                                "description": description,
+                                "encrypted": snapshot.get("Encrypted", False),
+                                "confidence": "high",
+                                "confidence_level": self._calculate_confidence_level(age_days, detection_rules),
+                                "orphan_reason": f"Duplicate snapshot created {time_diff_hours:.1f}h after previous snapshot (same volume, same size)",
+                                "orphan_type": "duplicate",
+                                "previous_snapshot_id": prev_snapshot["SnapshotId"],
+                                "time_diff_hours": round(time_diff_hours, 2),
+                                "scenario": "ebs_snapshot_duplicate_content",
+                            }
 
-                                orphans.append(
-                                    OrphanResourceData(
-                                        resource_type="ebs_snapshot_duplicate",
-                                        resource_id=snapshot_id,
-                                        resource_name=name or description,
-                                        region=region,
-                                        estimated_monthly_cost=round(monthly_cost, 2),
-                                        resource_metadata=metadata,
-                                    )
+                            orphans.append(
+                                OrphanResourceData(
+                                    resource_type="ebs_snapshot_duplicate",
+                                    resource_id=snapshot_id,
+                                    resource_name=name or description,
+                                    region=region,
+                                    estimated_monthly_cost=round(monthly_cost, 2),
+                                    resource_metadata=metadata,
                                 )
+                            )
 
         except ClientError as e:
             print(f"Error scanning duplicate snapshots in {region}: {e}")
@@ -4338,93 +4485,90 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_instances(
-                    Filters=[{"Name": "instance-state-name", "Values": ["stopped"]}]
-                )
+            response = await self._ec2_snapshot(region).describe_instances(states=["stopped"])
 
-                cutoff_date = datetime.now(timezone.utc) - timedelta(
-                    days=min_stopped_days
-                )
+            cutoff_date = datetime.now(timezone.utc) - timedelta(
+                days=min_stopped_days
+            )
 
-                for reservation in response.get("Reservations", []):
-                    for instance in reservation.get("Instances", []):
-                        instance_id = instance["InstanceId"]
-                        state_transition_reason = instance.get(
-                            "StateTransitionReason", ""
-                        )
+            for reservation in response.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    instance_id = instance["InstanceId"]
+                    state_transition_reason = instance.get(
+                        "StateTransitionReason", ""
+                    )
 
-                        # Extract timestamp from state transition reason
-                        # Format: "User initiated (2024-01-15 10:30:45 GMT)"
-                        stopped_date = None
-                        if "(" in state_transition_reason:
-                            try:
-                                date_str = state_transition_reason.split("(")[1].split(
-                                    ")"
-                                )[0]
-                                stopped_date = datetime.strptime(
-                                    date_str, "%Y-%m-%d %H:%M:%S %Z"
-                                ).replace(tzinfo=timezone.utc)
-                            except (ValueError, IndexError):
-                                pass
+                    # Extract timestamp from state transition reason
+                    # Format: "User initiated (2024-01-15 10:30:45 GMT)"
+                    stopped_date = None
+                    if "(" in state_transition_reason:
+                        try:
+                            date_str = state_transition_reason.split("(")[1].split(
+                                ")"
+                            )[0]
+                            stopped_date = datetime.strptime(
+                                date_str, "%Y-%m-%d %H:%M:%S %Z"
+                            ).replace(tzinfo=timezone.utc)
+                        except (ValueError, IndexError):
+                            pass
 
-                        # Calculate stopped days
-                        stopped_days = 0
-                        if stopped_date:
-                            stopped_days = (
-                                datetime.now(timezone.utc) - stopped_date
-                            ).days
+                    # Calculate stopped days
+                    stopped_days = 0
+                    if stopped_date:
+                        stopped_days = (
+                            datetime.now(timezone.utc) - stopped_date
+                        ).days
 
-                        # Only include if stopped >= min_stopped_days
-                        if stopped_date and stopped_days >= min_stopped_days:
-                            instance_type = instance["InstanceType"]
+                    # Only include if stopped >= min_stopped_days
+                    if stopped_date and stopped_days >= min_stopped_days:
+                        instance_type = instance["InstanceType"]
 
-                            # Extract name from tags
-                            name = None
-                            for tag in instance.get("Tags", []):
-                                if tag["Key"] == "Name":
-                                    name = tag["Value"]
-                                    break
+                        # Extract name from tags
+                        name = None
+                        for tag in instance.get("Tags", []):
+                            if tag["Key"] == "Name":
+                                name = tag["Value"]
+                                break
 
-                            # Determine confidence level based on stopped days
-                            if stopped_days >= confidence_threshold_days:
-                                confidence = "high"
-                                reason = f"EC2 instance stopped for {stopped_days} days (high confidence)"
-                            else:
-                                confidence = "low"
-                                reason = f"EC2 instance stopped for {stopped_days} days (low confidence)"
-
-                            # Note: Stopped instances don't incur compute costs,
-                            # but EBS volumes attached still cost money
-                            # We'll estimate based on attached volumes
-                            volume_cost = 0.0
-                            for bdm in instance.get("BlockDeviceMappings", []):
-                                if "Ebs" in bdm:
-                                    volume_id = bdm["Ebs"].get("VolumeId")
-                                    if volume_id:
-                                        # Simplified: assume 8GB gp2 per volume
-                                        volume_cost += 8 * self.PRICING["ebs_gp2_per_gb"]
+                        # Determine confidence level based on stopped days
+                        if stopped_days >= confidence_threshold_days:
+                            confidence = "high"
+                            reason = f"EC2 instance stopped for {stopped_days} days (high confidence)"
+                        else:
+                            confidence = "low"
+                            reason = f"EC2 instance stopped for {stopped_days} days (low confidence)"
 
-                            orphans.append(
-                                OrphanResourceData(
-                                    resource_type="ec2_instance_stopped",
-                                    resource_id=instance_id,
-                                    resource_name=name,
-                                    region=region,
-                                    estimated_monthly_cost=round(volume_cost, 2),
-                                    resource_metadata={
-                                        "instance_type": instance_type,
-                                        "state": "stopped",
-                                        "stopped_date": stopped_date.isoformat(),
-                                        "stopped_days": stopped_days,
-                                        "state_transition_reason": state_transition_reason,
-                                        "confidence": confidence,
-                                        "confidence_level": self._calculate_confidence_level(stopped_days, detection_rules),
-                                        "orphan_reason": reason,
-                                        "orphan_type": "stopped",
-                                    },
-                                )
+                        # Note: Stopped instances don't incur compute costs,
+                        # but EBS volumes attached still cost money
+                        # We'll estimate based on attached volumes
+                        volume_cost = 0.0
+                        for bdm in instance.get("BlockDeviceMappings", []):
+                            if "Ebs" in bdm:
+                                volume_id = bdm["Ebs"].get("VolumeId")
+                                if volume_id:
+                                    # Simplified: assume 8GB gp2 per volume
+                                    volume_cost += 8 * self.PRICING["ebs_gp2_per_gb"]
+
+                        orphans.append(
+                            OrphanResourceData(
+                                resource_type="ec2_instance_stopped",
+                                resource_id=instance_id,
+                                resource_name=name,
+                                region=region,
+                                estimated_monthly_cost=round(volume_cost, 2),
+                                resource_metadata={
+                                    "instance_type": instance_type,
+                                    "state": "stopped",
+                                    "stopped_date": stopped_date.isoformat(),
+                                    "stopped_days": stopped_days,
+                                    "state_transition_reason": state_transition_reason,
+                                    "confidence": confidence,
+                                    "confidence_level": self._calculate_confidence_level(stopped_days, detection_rules),
+                                    "orphan_reason": reason,
+                                    "orphan_type": "stopped",
+                                },
                             )
+                        )
 
         except ClientError as e:
             print(f"Error scanning stopped instances in {region}: {e}")
@@ -4471,180 +4615,181 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
-                    # Get all running instances
-                    response = await ec2.describe_instances(
-                        Filters=[{"Name": "instance-state-name", "Values": ["running"]}]
-                    )
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
+                # Get all running instances
+                response = await self._ec2_snapshot(region).describe_instances(states=["running"])
 
-                    print(f"🔍 [DEBUG] EC2 API response received for region {region}")
-                    total_instances = sum(len(r.get("Instances", [])) for r in response.get("Reservations", []))
-                    print(f"🔍 [DEBUG] Found {total_instances} running instances in {region}")
+                print(f"🔍 [DEBUG] EC2 API response received for region {region}")
+                total_instances = sum(len(r.get("Instances", [])) for r in response.get("Reservations", []))
+                print(f"🔍 [DEBUG] Found {total_instances} running instances in {region}")
 
-                    now = datetime.now(timezone.utc)
-                    # Lookback period: max(min_idle_days, 30) to ensure enough data
-                    # TEST MODE: If min_idle_days = 0, use shorter lookback (2 hours)
-                    if min_idle_days == 0:
-                        lookback_days = 0
-                        start_time = now - timedelta(hours=2)  # 2 hours for immediate testing
-                    else:
-                        lookback_days = max(min_idle_days, 30)
-                        start_time = now - timedelta(days=lookback_days)
+                now = datetime.now(timezone.utc)
+                # Lookback period: max(min_idle_days, 30) to ensure enough data
+                # TEST MODE: If min_idle_days = 0, use shorter lookback (2 hours)
+                if min_idle_days == 0:
+                    lookback_days = 0
+                    start_time = now - timedelta(hours=2)  # 2 hours for immediate testing
+                else:
+                    lookback_days = max(min_idle_days, 30)
+                    start_time = now - timedelta(days=lookback_days)
 
-                    for reservation in response.get("Reservations", []):
-                        for instance in reservation.get("Instances", []):
-                            instance_id = instance["InstanceId"]
-                            instance_type = instance["InstanceType"]
-                            launch_time = instance.get("LaunchTime")
+                for reservation in response.get("Reservations", []):
+                    for instance in reservation.get("Instances", []):
+                        instance_id = instance["InstanceId"]
+                        instance_type = instance["InstanceType"]
+                        launch_time = instance.get("LaunchTime")
 
-                            # Skip instance if no LaunchTime available
-                            if not launch_time:
-                                continue
+                        # Skip instance if no LaunchTime available
+                        if not launch_time:
+                            continue
 
-                            # Calculate instance age
-                            instance_age_days = (now - launch_time).days
+                        # Calculate instance age
+                        instance_age_days = (now - launch_time).days
 
-                            # Skip instances younger than min_idle_days
-                            if instance_age_days < min_idle_days:
-                                continue
+                        # Skip instances younger than min_idle_days
+                        if instance_age_days < min_idle_days:
+                            continue
 
-                            # Extract name from tags
-                            name = None
-                            for tag in instance.get("Tags", []):
-                                if tag["Key"] == "Name":
-                                    name = tag["Value"]
-                                    break
+                        # Extract name from tags
+                        name = None
+                        for tag in instance.get("Tags", []):
+                            if tag["Key"] == "Name":
+                                name = tag["Value"]
+                                break
 
-                            # Query CloudWatch for CPU utilization (average over lookback period)
-                            try:
-                                # TEST MODE: Use shorter period (5 min) if min_idle_days = 0
-                                period = 300 if min_idle_days == 0 else 86400  # 5 min or 1 day
+                        # Query CloudWatch for CPU utilization (average over lookback period)
+                        try:
+                            # TEST MODE: Use shorter period (5 min) if min_idle_days = 0
+                            period = 300 if min_idle_days == 0 else 86400  # 5 min or 1 day
 
-                                cpu_response = await cw.get_metric_statistics(
-                                    Namespace="AWS/EC2",
-                                    MetricName="CPUUtilization",
-                                    Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                                    StartTime=start_time,
-                                    EndTime=now,
-                                    Period=period,
-                                    Statistics=["Average"],
-                                )
+                            cpu_response = await cw.get_metric_statistics(
+                                Namespace="AWS/EC2",
+                                MetricName="CPUUtilization",
+                                Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
+                                StartTime=start_time,
+                                EndTime=now,
+                                Period=period,
+                                Statistics=["Average"],
+                            )
 
-                                # Calculate average CPU over entire period
-                                cpu_datapoints = cpu_response.get("Datapoints", [])
-                                if not cpu_datapoints:
-                                    # TEST MODE: If min_idle_days = 0, accept instances without metrics (assume idle)
-                                    if min_idle_days == 0:
-                                        avg_cpu = 0.0  # Assume idle for testing
-                                    else:
-                                        # No CPU data available - skip
-                                        continue
+                            # Calculate average CPU over entire period
+                            cpu_datapoints = cpu_response.get("Datapoints", [])
+                            if not cpu_datapoints:
+                                # TEST MODE: If min_idle_days = 0, accept instances without metrics (assume idle)
+                                if min_idle_days == 0:
+                                    avg_cpu = 0.0  # Assume idle for testing
                                 else:
-                                    avg_cpu = sum(dp["Average"] for dp in cpu_datapoints) / len(cpu_datapoints)
-
-                            except Exception as e:
-                                print(f"Error fetching CPU metrics for {instance_id}: {e}")
-                                continue
-
-                            # Query CloudWatch for Network traffic
-                            try:
-                                network_in_response = await cw.get_metric_statistics(
-                                    Namespace="AWS/EC2",
-                                    MetricName="NetworkIn",
-                                    Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                                    StartTime=start_time,
-                                    EndTime=now,
-                                    Period=period,
-                                    Statistics=["Sum"],
-                                )
+                                    # No CPU data available - skip
+                                    continue
+                            else:
+                                avg_cpu = sum(dp["Average"] for dp in cpu_datapoints) / len(cpu_datapoints)
 
-                                network_out_response = await cw.get_metric_statistics(
-                                    Namespace="AWS/EC2",
-                                    MetricName="NetworkOut",
-                                    Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                                    StartTime=start_time,
-                                    EndTime=now,
-                                    Period=period,
-                                    Statistics=["Sum"],
-                                )
+                        except Exception as e:
+                            record_scenario_error(e)
+                            print(f"Error fetching CPU metrics for {instance_id}: {e}")
+                            continue
 
-                                # Sum all network traffic
-                                network_in = sum(
-                                    dp["Sum"] for dp in network_in_response.get("Datapoints", [])
-                                )
-                                network_out = sum(
-                                    dp["Sum"] for dp in network_out_response.get("Datapoints", [])
-                                )
-                                total_network = network_in + network_out
+                        # Query CloudWatch for Network traffic
+                        try:
+                            network_in_response = await cw.get_metric_statistics(
+                                Namespace="AWS/EC2",
+                                MetricName="NetworkIn",
+                                Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
+                                StartTime=start_time,
+                                EndTime=now,
+                                Period=period,
+                                Statistics=["Sum"],
+                            )
 
-                                # TEST MODE: If no network data and min_idle_days = 0, assume idle
-                                if total_network == 0 and min_idle_days == 0 and not network_in_response.get("Datapoints"):
-                                    total_network = 0  # Assume idle for testing
+                            network_out_response = await cw.get_metric_statistics(
+                                Namespace="AWS/EC2",
+                                MetricName="NetworkOut",
+                                Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
+                                StartTime=start_time,
+                                EndTime=now,
+                                Period=period,
+                                Statistics=["Sum"],
+                            )
 
-                            except Exception as e:
-                                print(f"Error fetching network metrics for {instance_id}: {e}")
-                                # TEST MODE: If min_idle_days = 0, assume idle (no network)
-                                if min_idle_days == 0:
-                                    total_network = 0  # Assume idle for testing
-                                else:
-                                    # If we can't get network data, exclude from detection
-                                    total_network = network_threshold + 1
+                            # Sum all network traffic
+                            network_in = sum(
+                                dp["Sum"] for dp in network_in_response.get("Datapoints", [])
+                            )
+                            network_out = sum(
+                                dp["Sum"] for dp in network_out_response.get("Datapoints", [])
+                            )
+                            total_network = network_in + network_out
 
-                            # Determine if instance is idle based on thresholds
-                            is_cpu_idle = avg_cpu < cpu_threshold
-                            is_network_idle = total_network < network_threshold
+                            # TEST MODE: If no network data and min_idle_days = 0, assume idle
+                            if total_network == 0 and min_idle_days == 0 and not network_in_response.get("Datapoints"):
+                                total_network = 0  # Assume idle for testing
 
-                            if is_cpu_idle and is_network_idle:
-                                # Instance is idle - determine confidence based on age
-                                # Format lookback period message
-                                if min_idle_days == 0:
-                                    lookback_msg = "2 hours"
-                                else:
-                                    lookback_msg = f"{lookback_days} days"
+                        except Exception as e:
+                            record_scenario_error(e)
+                            print(f"Error fetching network metrics for {instance_id}: {e}")
+                            # TEST MODE: If min_idle_days = 0, assume idle (no network)
+                            if min_idle_days == 0:
+                                total_network = 0  # Assume idle for testing
+                            else:
+                                # If we can't get network data, exclude from detection
+                                total_network = network_threshold + 1
+
+                        # Determine if instance is idle based on thresholds
+                        is_cpu_idle = avg_cpu < cpu_threshold
+                        is_network_idle = total_network < network_threshold
+
+                        if is_cpu_idle and is_network_idle:
+                            # Instance is idle - determine confidence based on age
+                            # Format lookback period message
+                            if min_idle_days == 0:
+                                lookback_msg = "2 hours"
+                            else:
+                                lookback_msg = f"{lookback_days} days"
 
-                                if instance_age_days >= idle_confidence_threshold:
-                                    confidence = "high"
-                                    reason = f"Instance running with {avg_cpu:.1f}% avg CPU and {total_network / 1_000_000:.2f}MB network traffic over {lookback_msg} (high confidence)"
-                                elif min_idle_days > 0 and instance_age_days >= min_idle_days * 2:
-                                    confidence = "medium"
-                                    reason = f"Instance running with {avg_cpu:.1f}% avg CPU and {total_network / 1_000_000:.2f}MB network traffic over {lookback_msg} (medium confidence)"
-                                else:
-                                    confidence = "low"
-                                    reason = f"Instance running with {avg_cpu:.1f}% avg CPU and {total_network / 1_000_000:.2f}MB network traffic over {lookback_msg} (low confidence)"
+                            if instance_age_days >= idle_confidence_threshold:
+                                confidence = "high"
+                                reason = f"Instance running with {avg_cpu:.1f}% avg CPU and {total_network / 1_000_000:.2f}MB network traffic over {lookback_msg} (high confidence)"
+                            elif min_idle_days > 0 and instance_age_days >= min_idle_days * 2:
+                                confidence = "medium"
+                                reason = f"Instance running with {avg_cpu:.1f}% avg CPU and {total_network / 1_000_000:.2f}MB network traffic over {lookback_msg} (medium confidence)"
+                            else:
+                                confidence = "low"
+                                reason = f"Instance running with {avg_cpu:.1f}% avg CPU and {total_network / 1_000_000:.2f}MB network traffic over {lookback_msg} (low confidence)"
 
-                                # Calculate estimated monthly cost based on instance type
-                                # Simplified pricing - you can enhance this with actual pricing data
-                                estimated_cost = self._estimate_ec2_instance_cost(instance_type)
+                            # Calculate estimated monthly cost based on instance type
+                            # Simplified pricing - you can enhance this with actual pricing data
+                            estimated_cost = self._estimate_ec2_instance_cost(instance_type)
 
-                                print(f"✅ [DEBUG] Found idle running instance: {instance_id} ({name or 'unnamed'}) - CPU: {avg_cpu:.1f}%, Network: {total_network}B, Cost: ${estimated_cost}")
+                            print(f"✅ [DEBUG] Found idle running instance: {instance_id} ({name or 'unnamed'}) - CPU: {avg_cpu:.1f}%, Network: {total_network}B, Cost: ${estimated_cost}")
 
-                                orphans.append(
-                                    OrphanResourceData(
-                                        resource_type="ec2_instance_idle_running",
-                                        resource_id=instance_id,
-                                        resource_name=name,
-                                        region=region,
-                                        estimated_monthly_cost=estimated_cost,
-                                        resource_metadata={
-                                            "instance_type": instance_type,
-                                            "state": "running",
-                                            "launch_time": launch_time.isoformat(),
-                                            "instance_age_days": instance_age_days,
-                                            "avg_cpu_percent": round(avg_cpu, 2),
-                                            "total_network_bytes": int(total_network),
-                                            "lookback_days": lookback_days,
-                                            "confidence": confidence,
-                                            "confidence_level": self._calculate_confidence_level(instance_age_days, detection_rules),
-                                            "orphan_reason": reason,
-                                            "orphan_type": "idle_running",
-                                        },
-                                    )
+                            orphans.append(
+                                OrphanResourceData(
+                                    resource_type="ec2_instance_idle_running",
+                                    resource_id=instance_id,
+                                    resource_name=name,
+                                    region=region,
+                                    estimated_monthly_cost=estimated_cost,
+                                    resource_metadata={
+                                        "instance_type": instance_type,
+                                        "state": "running",
+                                        "launch_time": launch_time.isoformat(),
+                                        "instance_age_days": instance_age_days,
+                                        "avg_cpu_percent": round(avg_cpu, 2),
+                                        "total_network_bytes": int(total_network),
+                                        "lookback_days": lookback_days,
+                                        "confidence": confidence,
+                                        "confidence_level": self._calculate_confidence_level(instance_age_days, detection_rules),
+                                        "orphan_reason": reason,
+                                        "orphan_type": "idle_running",
+                                    },
                                 )
+                            )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"❌ [ERROR] Error scanning idle running instances in {region}: {e}")
         except Exception as e:
+            record_scenario_error(e)
             print(f"❌ [ERROR] Unexpected error in scan_idle_running_instances for {region}: {type(e).__name__}: {e}")
 
         print(f"🔍 [DEBUG] scan_idle_running_instances completed for {region}: Found {len(orphans)} idle instances")
@@ -4745,13 +4890,10 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2, \
-                     self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
 
                 # Get all running instances
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-                )
+                response = await self._ec2_snapshot(region).describe_instances(states=["running"])
 
                 end_time = datetime.now(timezone.utc)
                 start_time = end_time - timedelta(days=lookback_days)
@@ -4823,6 +4965,7 @@ class AWSProvider(CloudProviderBase):
                             )
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning oversized instances in {region}: {e}")
 
         return orphans
@@ -4859,57 +5002,54 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-                )
+            response = await self._ec2_snapshot(region).describe_instances(states=["running"])
 
-                for reservation in response['Reservations']:
-                    for instance in reservation['Instances']:
-                        instance_id = instance['InstanceId']
-                        instance_type = instance['InstanceType']
-                        launch_time = instance['LaunchTime']
+            for reservation in response['Reservations']:
+                for instance in reservation['Instances']:
+                    instance_id = instance['InstanceId']
+                    instance_type = instance['InstanceType']
+                    launch_time = instance['LaunchTime']
 
-                        family = instance_type.split('.')[0]
+                    family = instance_type.split('.')[0]
 
-                        if family in old_generations:
-                            size = instance_type.split('.')[1] if '.' in instance_type else 'large'
-                            new_family = generation_mapping.get(family, family)
-                            recommended_type = f"{new_family}.{size}"
+                    if family in old_generations:
+                        size = instance_type.split('.')[1] if '.' in instance_type else 'large'
+                        new_family = generation_mapping.get(family, family)
+                        recommended_type = f"{new_family}.{size}"
 
-                            current_cost = self._estimate_ec2_instance_cost(instance_type)
-                            new_cost = self._estimate_ec2_instance_cost(recommended_type)
-                            savings = current_cost - new_cost
+                        current_cost = self._estimate_ec2_instance_cost(instance_type)
+                        new_cost = self._estimate_ec2_instance_cost(recommended_type)
+                        savings = current_cost - new_cost
 
-                            tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-                            name = tags.get('Name', 'Unnamed')
+                        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
+                        name = tags.get('Name', 'Unnamed')
 
-                            metadata = {
-                                'instance_type': instance_type,
-                                'current_generation': family,
-                                'recommended_type': recommended_type,
-                                'new_generation': new_family,
-                                'launch_time': launch_time.isoformat(),
-                                'current_monthly_cost': current_cost,
-                                'new_monthly_cost': new_cost,
-                                'monthly_savings': round(savings, 2),
-                                'savings_percent': round((savings / current_cost * 100), 1) if current_cost > 0 else 0,
-                                'performance_improvement': '10-30%',
-                                'confidence': 'high',
-                                'scenario': 'ec2_instance_old_generation',
-                                'tags': tags
-                            }
+                        metadata = {
+                            'instance_type': instance_type,
+                            'current_generation': family,
+                            'recommended_type': recommended_type,
+                            'new_generation': new_family,
+                            'launch_time': launch_time.isoformat(),
+                            'current_monthly_cost': current_cost,
+                            'new_monthly_cost': new_cost,
+                            'monthly_savings': round(savings, 2),
+                            'savings_percent': round((savings / current_cost * 100), 1) if current_cost > 0 else 0,
+                            'performance_improvement': '10-30%',
+                            'confidence': 'high',
+                            'scenario': 'ec2_instance_old_generation',
+                            'tags': tags
+                        }
 
-                            orphans.append(
-                                OrphanResourceData(
-                                    resource_type="ec2_instance_old_generation",
-                                    resource_id=instance_id,
-                                    resource_name=name,
-                                    region=region,
-                                    estimated_monthly_cost=round(savings, 2),
-                                    resource_metadata=metadata,
-                                )
+                        orphans.append(
+                            OrphanResourceData(
+                                resource_type="ec2_instance_old_generation",
+                                resource_id=instance_id,
+                                resource_name=name,
+                                region=region,
+                                estimated_monthly_cost=round(savings, 2),
+                                resource_metadata=metadata,
                             )
+                        )
 
         except ClientError as e:
             print(f"Error scanning old generation instances in {region}: {e}")
@@ -4961,11 +5101,8 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2, \
-                     self.session.client("cloudwatch", region_name=region) as cloudwatch:
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-                )
+            async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
+                response = await self._ec2_snapshot(region).describe_instances(states=["running"])
 
                 end_time = datetime.now(timezone.utc)
                 start_time = end_time - timedelta(days=lookback_days)
@@ -5025,6 +5162,7 @@ class AWSProvider(CloudProviderBase):
                                 ))
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning burstable credit waste in {region}: {e}")
 
         return orphans
@@ -5051,59 +5189,56 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-                )
-
-                for reservation in response['Reservations']:
-                    for instance in reservation['Instances']:
-                        instance_id = instance['InstanceId']
-                        instance_type = instance['InstanceType']
-                        launch_time = instance['LaunchTime']
-                        age_days = self._safe_datetime_age(launch_time)
-
-                        if age_days < min_age_days:
-                            continue
+            response = await self._ec2_snapshot(region).describe_instances(states=["running"])
 
-                        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
-                        name = tags.get('Name', 'Unnamed')
+            for reservation in response['Reservations']:
+                for instance in reservation['Instances']:
+                    instance_id = instance['InstanceId']
+                    instance_type = instance['InstanceType']
+                    launch_time = instance['LaunchTime']
+                    age_days = self._safe_datetime_age(launch_time)
 
-                        # Check if non-prod environment
-                        is_nonprod = False
-                        env_value = None
-                        for tag_key in env_tags:
-                            if tag_key in tags:
-                                tag_value = tags[tag_key].lower()
-                                if tag_value in env_values:
-                                    is_nonprod = True
-                                    env_value = tag_value
-                                    break
+                    if age_days < min_age_days:
+                        continue
 
-                        if is_nonprod:
-                            monthly_cost = self._estimate_ec2_instance_cost(instance_type)
-                            # Savings assuming 67% reduction (business hours only)
-                            savings = monthly_cost * 0.67
+                    tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags', [])}
+                    name = tags.get('Name', 'Unnamed')
 
-                            orphans.append(OrphanResourceData(
-                                resource_type="ec2_instance_dev_test_24_7",
-                                resource_id=instance_id,
-                                resource_name=name,
-                                region=region,
-                                estimated_monthly_cost=round(savings, 2),
-                                resource_metadata={
-                                    'instance_type': instance_type,
-                                    'environment': env_value,
-                                    'is_nonprod': True,
-                                    'age_days': age_days,
-                                    'current_monthly_cost': monthly_cost,
-                                    'potential_savings': round(savings, 2),
-                                    'recommendation': 'Schedule on/off during business hours (9AM-6PM weekdays)',
-                                    'confidence': 'high',
-                                    'scenario': 'ec2_instance_dev_running_24_7',
-                                    'tags': tags
-                                }
-                            ))
+                    # Check if non-prod environment
+                    is_nonprod = False
+                    env_value = None
+                    for tag_key in env_tags:
+                        if tag_key in tags:
+                            tag_value = tags[tag_key].lower()
+                            if tag_value in env_values:
+                                is_nonprod = True
+                                env_value = tag_value
+                                break
+
+                    if is_nonprod:
+                        monthly_cost = self._estimate_ec2_instance_cost(instance_type)
+                        # Savings assuming 67% reduction (business hours only)
+                        savings = monthly_cost * 0.67
+
+                        orphans.append(OrphanResourceData(
+                            resource_type="ec2_instance_dev_test_24_7",
+                            resource_id=instance_id,
+                            resource_name=name,
+                            region=region,
+                            estimated_monthly_cost=round(savings, 2),
+                            resource_metadata={
+                                'instance_type': instance_type,
+                                'environment': env_value,
+                                'is_nonprod': True,
+                                'age_days': age_days,
+                                'current_monthly_cost': monthly_cost,
+                                'potential_savings': round(savings, 2),
+                                'recommendation': 'Schedule on/off during business hours (9AM-6PM weekdays)',
+                                'confidence': 'high',
+                                'scenario': 'ec2_instance_dev_running_24_7',
+                                'tags': tags
+                            }
+                        ))
 
         except ClientError as e:
             print(f"Error scanning dev/test 24/7 instances in {region}: {e}")
@@ -5130,39 +5265,36 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running', 'stopped']}]
-                )
-
-                for reservation in response['Reservations']:
-                    for instance in reservation['Instances']:
-                        instance_id = instance['InstanceId']
-                        instance_type = instance['InstanceType']
-                        launch_time = instance['LaunchTime']
-                        age_days = self._safe_datetime_age(launch_time)
-                        tags = instance.get('Tags', [])
-
-                        if not tags and age_days >= min_age_days:
-                            state = instance['State']['Name']
-                            monthly_cost = self._estimate_ec2_instance_cost(instance_type) if state == 'running' else 0
-
-                            orphans.append(OrphanResourceData(
-                                resource_type="ec2_instance_untagged",
-                                resource_id=instance_id,
-                                resource_name=instance_id,
-                                region=region,
-                                estimated_monthly_cost=round(monthly_cost, 2),
-                                resource_metadata={
-                                    'instance_type': instance_type,
-                                    'state': state,
-                                    'age_days': age_days,
-                                    'has_tags': False,
-                                    'recommendation': 'Add cost allocation tags or review for deletion',
-                                    'confidence': 'high',
-                                    'scenario': 'ec2_instance_untagged'
-                                }
-                            ))
+            response = await self._ec2_snapshot(region).describe_instances(states=["running", "stopped"])
+
+            for reservation in response['Reservations']:
+                for instance in reservation['Instances']:
+                    instance_id = instance['InstanceId']
+                    instance_type = instance['InstanceType']
+                    launch_time = instance['LaunchTime']
+                    age_days = self._safe_datetime_age(launch_time)
+                    tags = instance.get('Tags', [])
+
+                    if not tags and age_days >= min_age_days:
+                        state = instance['State']['Name']
+                        monthly_cost = self._estimate_ec2_instance_cost(instance_type) if state == 'running' else 0
+
+                        orphans.append(OrphanResourceData(
+                            resource_type="ec2_instance_untagged",
+                            resource_id=instance_id,
+                            resource_name=instance_id,
+                            region=region,
+                            estimated_monthly_cost=round(monthly_cost, 2),
+                            resource_metadata={
+                                'instance_type': instance_type,
+                                'state': state,
+                                'age_days': age_days,
+                                'has_tags': False,
+                                'recommendation': 'Add cost allocation tags or review for deletion',
+                                'confidence': 'high',
+                                'scenario': 'ec2_instance_untagged'
+                            }
+                        ))
 
         except ClientError as e:
             print(f"Error scanning untagged EC2 instances in {region}: {e}")
@@ -5214,12 +5346,8 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2, \
-                     self.session.client("cloudwatch", region_name=region) as cloudwatch:
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']},
-                            {'Name': 'instance-lifecycle', 'Values': ['on-demand']}]  # Only On-Demand
-                )
+            async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
+                response = await self._ec2_snapshot(region).describe_instances(states=["running"], on_demand_only=True)
 
                 end_time = datetime.now(timezone.utc)
                 start_time = end_time - timedelta(days=14)
@@ -5284,6 +5412,7 @@ class AWSProvider(CloudProviderBase):
                                 ))
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning Spot-eligible workloads in {region}: {e}")
 
         return orphans
@@ -5310,11 +5439,8 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2, \
-                     self.session.client("cloudwatch", region_name=region) as cloudwatch:
-                response = await ec2.describe_instances(
-                    Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-                )
+            async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
+                response = await self._ec2_snapshot(region).describe_instances(states=["running"])
 
                 end_time = datetime.now(timezone.utc)
                 start_time = end_time - timedelta(days=14)
@@ -5383,6 +5509,7 @@ class AWSProvider(CloudProviderBase):
                                     ))
 
         except ClientError as e:
+            record_scenario_error(e)
             print(f"Error scanning scheduled unused instances in {region}: {e}")
 
         return orphans
@@ -5431,10 +5558,10 @@ class AWSProvider(CloudProviderBase):
 
         try:
             # Scan Application/Network/Gateway Load Balancers (ELBv2)
-            async with self.session.client("elbv2", region_name=region) as elbv2:
+            async with self.client_pool.client("elbv2", region_name=region) as elbv2:
                 response = await elbv2.describe_load_balancers()
 
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     for lb in response.get("LoadBalancers", []):
                         lb_arn = lb["LoadBalancerArn"]
                         lb_name = lb["LoadBalancerName"]
@@ -5482,7 +5609,7 @@ class AWSProvider(CloudProviderBase):
                         sg_blocks_traffic = False
 
                         if detect_sg_blocks_traffic and security_groups:
-                            async with self.session.client("ec2", region_name=region) as ec2:
+                            async with self.client_pool.client("ec2", region_name=region) as ec2:
                                 try:
                                     sg_response = await ec2.describe_security_groups(
                                         GroupIds=security_groups
@@ -5630,10 +5757,10 @@ class AWSProvider(CloudProviderBase):
                             )
 
             # Scan Classic Load Balancers (ELB)
-            async with self.session.client("elb", region_name=region) as elb:
+            async with self.client_pool.client("elb", region_name=region) as elb:
                 response = await elb.describe_load_balancers()
 
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     for lb in response.get("LoadBalancerDescriptions", []):
                         lb_name = lb["LoadBalancerName"]
                         created_at = lb["CreatedTime"]
@@ -5660,7 +5787,7 @@ class AWSProvider(CloudProviderBase):
                         sg_blocks_traffic = False
 
                         if detect_sg_blocks_traffic and security_groups:
-                            async with self.session.client("ec2", region_name=region) as ec2:
+                            async with self.client_pool.client("ec2", region_name=region) as ec2:
                                 try:
                                     sg_response = await ec2.describe_security_groups(
                                         GroupIds=security_groups
@@ -5875,7 +6002,7 @@ class AWSProvider(CloudProviderBase):
         )
 
         try:
-            async with self.session.client(
+            async with self.client_pool.client(
                 "elbv2", region_name=region
             ) as elbv2:
                 # Get all ALB/NLB load balancers
@@ -6032,11 +6159,11 @@ class AWSProvider(CloudProviderBase):
         traffic_threshold = detection_rules.get("business_hours_traffic_threshold", 80.0)
 
         try:
-            async with self.session.client(
+            async with self.client_pool.client(
                 "elbv2", region_name=region
-            ) as elbv2, self.session.client(
+            ) as elbv2, self.client_pool.client(
                 "elb", region_name=region
-            ) as elb_classic, self.session.client(
+            ) as elb_classic, self.client_pool.client(
                 "cloudwatch", region_name=region
             ) as cloudwatch:
                 # Get all load balancers (both v2 and classic)
@@ -6331,7 +6458,7 @@ class AWSProvider(CloudProviderBase):
         dev_test_connections_lookback_days = detection_rules.get("dev_test_connections_lookback_days", 7)
 
         try:
-            async with self.session.client("rds", region_name=region) as rds, self.session.client(
+            async with self.client_pool.client("rds", region_name=region) as rds, self.client_pool.client(
                 "cloudwatch", region_name=region
             ) as cloudwatch:
                 response = await rds.describe_db_instances()
@@ -6785,7 +6912,7 @@ class AWSProvider(CloudProviderBase):
         detect_redundant_same_az = detection_rules.get("detect_redundant_same_az", True)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all NAT Gateways
                 nat_response = await ec2.describe_nat_gateways(
                     Filters=[{"Name": "state", "Values": ["available"]}]
@@ -6821,7 +6948,7 @@ class AWSProvider(CloudProviderBase):
                             nat_gw_by_vpc_az[key] = []
                         nat_gw_by_vpc_az[key].append(nat_gw)
 
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     end_time = datetime.now(timezone.utc)
                     start_time = end_time - timedelta(days=30)
 
@@ -7079,7 +7206,7 @@ class AWSProvider(CloudProviderBase):
         detect_missing_dynamodb_endpoint = detection_rules.get("detect_missing_dynamodb_endpoint", True)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all NAT Gateways
                 nat_response = await ec2.describe_nat_gateways(
                     Filters=[{"Name": "state", "Values": ["available"]}]
@@ -7099,7 +7226,7 @@ class AWSProvider(CloudProviderBase):
                     elif f"com.amazonaws.{region}.dynamodb" in service_name:
                         vpcs_with_dynamodb_endpoint.add(vpc_id)
 
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     end_time = datetime.now(timezone.utc)
                     start_time = end_time - timedelta(days=30)
 
@@ -7232,13 +7359,13 @@ class AWSProvider(CloudProviderBase):
         nonprod_env_values = detection_rules.get("nonprod_env_values", ["dev", "development", "test", "testing", "staging", "qa"])
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all NAT Gateways
                 nat_response = await ec2.describe_nat_gateways(
                     Filters=[{"Name": "state", "Values": ["available"]}]
                 )
 
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     end_time = datetime.now(timezone.utc)
                     start_time = end_time - timedelta(days=dev_test_pattern_lookback_days)
 
@@ -7395,13 +7522,13 @@ class AWSProvider(CloudProviderBase):
         traffic_drop_threshold_percent = detection_rules.get("traffic_drop_threshold_percent", 90.0)
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Get all NAT Gateways
                 nat_response = await ec2.describe_nat_gateways(
                     Filters=[{"Name": "state", "Values": ["available"]}]
                 )
 
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     now = datetime.now(timezone.utc)
 
                     for nat_gw in nat_response.get("NatGateways", []):
@@ -7577,8 +7704,8 @@ class AWSProvider(CloudProviderBase):
         archive_throughput_threshold = detection_rules.get("archive_throughput_threshold_mbps", 8.0) if detection_rules else 8.0
 
         try:
-            async with self.session.client("fsx", region_name=region) as fsx:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("fsx", region_name=region) as fsx:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     # Describe all file systems
                     response = await fsx.describe_file_systems()
 
@@ -8132,8 +8259,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("neptune", region_name=region) as neptune:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("neptune", region_name=region) as neptune:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await neptune.describe_db_clusters()
 
                     for cluster in response.get("DBClusters", []):
@@ -8231,8 +8358,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("kafka", region_name=region) as kafka:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("kafka", region_name=region) as kafka:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await kafka.list_clusters_v2()
 
                     for cluster in response.get("ClusterInfoList", []):
@@ -8411,520 +8538,508 @@ class AWSProvider(CloudProviderBase):
         LATEST_K8S_VERSION = "1.28"
 
         try:
-            async with self.session.client("eks", region_name=region) as eks:
-                async with self.session.client("ec2", region_name=region) as ec2:
-                    async with self.session.client(
-                        "cloudwatch", region_name=region
-                    ) as cloudwatch:
-                        response = await eks.list_clusters()
-
-                        for cluster_name in response.get("clusters", []):
-                            cluster_info = await eks.describe_cluster(name=cluster_name)
-                            cluster = cluster_info["cluster"]
-
-                            # Basic metadata
-                            created_at = cluster["createdAt"]
-                            age_days = self._safe_datetime_age(created_at)
-                            k8s_version = cluster.get("version", "Unknown")
-                            cluster_status = cluster.get("status", "Unknown")
-
-                            # Skip if too young
-                            if age_days < min_age_days:
-                                continue
-
-                            # Get node groups
-                            nodegroups_response = await eks.list_nodegroups(
-                                clusterName=cluster_name
-                            )
-                            nodegroups = nodegroups_response.get("nodegroups", [])
-
-                            # Get Fargate profiles (graceful failure if permission denied)
-                            fargate_profiles = []
-                            try:
-                                fargate_response = await eks.list_fargate_profiles(
-                                    clusterName=cluster_name
-                                )
-                                fargate_profiles = fargate_response.get(
-                                    "fargateProfileNames", []
-                                )
-                            except ClientError as fargate_error:
-                                # Silently continue if Fargate permissions are missing
-                                # This allows detection to work even without Fargate access
-                                if fargate_error.response.get("Error", {}).get(
-                                    "Code"
-                                ) != "AccessDeniedException":
-                                    # Log only non-permission errors
-                                    print(
-                                        f"Error listing Fargate profiles for {cluster_name}: {fargate_error}"
-                                    )
+            async with self.client_pool.client("eks", region_name=region) as eks:
+                async with self.client_pool.client(
+                    "cloudwatch", region_name=region
+                ) as cloudwatch:
+                    response = await eks.list_clusters()
+
+                    for cluster_name in response.get("clusters", []):
+                        cluster_info = await eks.describe_cluster(name=cluster_name)
+                        cluster = cluster_info["cluster"]
+
+                        # Basic metadata
+                        created_at = cluster["createdAt"]
+                        age_days = self._safe_datetime_age(created_at)
+                        k8s_version = cluster.get("version", "Unknown")
+                        cluster_status = cluster.get("status", "Unknown")
 
-                            # Collect node information
-                            total_nodes = 0
-                            unhealthy_nodes = 0
-                            node_instance_ids = []
-                            node_details = []
+                        # Skip if too young
+                        if age_days < min_age_days:
+                            continue
 
-                            for ng_name in nodegroups:
-                                ng_info = await eks.describe_nodegroup(
-                                    clusterName=cluster_name, nodegroupName=ng_name
-                                )
-                                ng = ng_info["nodegroup"]
+                        # Get node groups
+                        nodegroups_response = await eks.list_nodegroups(
+                            clusterName=cluster_name
+                        )
+                        nodegroups = nodegroups_response.get("nodegroups", [])
 
-                                desired_size = (
-                                    ng.get("scalingConfig", {}).get("desiredSize", 0)
+                        # Get Fargate profiles (graceful failure if permission denied)
+                        fargate_profiles = []
+                        try:
+                            fargate_response = await eks.list_fargate_profiles(
+                                clusterName=cluster_name
+                            )
+                            fargate_profiles = fargate_response.get(
+                                "fargateProfileNames", []
+                            )
+                        except ClientError as fargate_error:
+                            # Silently continue if Fargate permissions are missing
+                            # This allows detection to work even without Fargate access
+                            if fargate_error.response.get("Error", {}).get(
+                                "Code"
+                            ) != "AccessDeniedException":
+                                # Log only non-permission errors
+                                print(
+                                    f"Error listing Fargate profiles for {cluster_name}: {fargate_error}"
                                 )
-                                total_nodes += desired_size
 
-                                # Check health
-                                ng_status = ng.get("status", "UNKNOWN")
-                                ng_health = ng.get("health", {})
-                                health_issues = ng_health.get("issues", [])
+                        # Collect node information
+                        total_nodes = 0
+                        unhealthy_nodes = 0
+                        node_instance_ids = []
+                        node_details = []
 
-                                if (
-                                    ng_status
-                                    not in ["ACTIVE", "CREATING", "UPDATING"]
-                                    or health_issues
-                                ):
-                                    unhealthy_nodes += desired_size
-
-                                node_details.append(
-                                    {
-                                        "name": ng_name,
-                                        "status": ng_status,
-                                        "desired_size": desired_size,
-                                        "instance_type": ng.get("instanceTypes", [
-                                            "unknown"
-                                        ])[0],
-                                        "health_issues": len(health_issues),
-                                    }
-                                )
+                        for ng_name in nodegroups:
+                            ng_info = await eks.describe_nodegroup(
+                                clusterName=cluster_name, nodegroupName=ng_name
+                            )
+                            ng = ng_info["nodegroup"]
 
-                            # Try to find EC2 instances by EKS cluster tag for CPU metrics
-                            try:
-                                instances_response = await ec2.describe_instances(
-                                    Filters=[
-                                        {
-                                            "Name": "tag:eks:cluster-name",
-                                            "Values": [cluster_name],
-                                        },
-                                        {
-                                            "Name": "instance-state-name",
-                                            "Values": ["running"],
-                                        },
-                                    ]
-                                )
-                                for reservation in instances_response.get(
-                                    "Reservations", []
-                                ):
-                                    for instance in reservation.get("Instances", []):
-                                        node_instance_ids.append(instance["InstanceId"])
-                            except Exception:
-                                pass
+                            desired_size = (
+                                ng.get("scalingConfig", {}).get("desiredSize", 0)
+                            )
+                            total_nodes += desired_size
 
-                            # Detection logic
-                            is_orphaned = False
-                            orphan_type = None
-                            orphan_reasons = []
-                            confidence_level = "medium"
+                            # Check health
+                            ng_status = ng.get("status", "UNKNOWN")
+                            ng_health = ng.get("health", {})
+                            health_issues = ng_health.get("issues", [])
 
-                            # Scenario #1: No worker nodes
                             if (
-                                detect_no_nodes
-                                and total_nodes == 0
-                                and len(fargate_profiles) == 0
+                                ng_status
+                                not in ["ACTIVE", "CREATING", "UPDATING"]
+                                or health_issues
                             ):
-                                is_orphaned = True
-                                orphan_type = "no_worker_nodes"
-                                orphan_reasons.append(
-                                    f"No worker nodes and no Fargate profiles (age: {age_days} days)"
-                                )
-                                orphan_reasons.append(
-                                    "Paying $73/month for unused control plane"
-                                )
-
-                                if age_days >= critical_age_days:
-                                    confidence_level = "critical"
-                                    orphan_reasons.append(
-                                        f"CRITICAL: Unused for {age_days}+ days"
-                                    )
-                                elif age_days >= confidence_threshold_days:
-                                    confidence_level = "high"
-                                else:
-                                    confidence_level = "medium"
+                                unhealthy_nodes += desired_size
+
+                            node_details.append(
+                                {
+                                    "name": ng_name,
+                                    "status": ng_status,
+                                    "desired_size": desired_size,
+                                    "instance_type": ng.get("instanceTypes", [
+                                        "unknown"
+                                    ])[0],
+                                    "health_issues": len(health_issues),
+                                }
+                            )
 
-                            # Scenario #4: Fargate no profiles
-                            elif (
-                                detect_fargate_no_profiles
-                                and total_nodes == 0
-                                and len(nodegroups) == 0
-                                and len(fargate_profiles) == 0
+                        # Try to find EC2 instances by EKS cluster tag for CPU metrics
+                        try:
+                            instances_response = await self._ec2_snapshot(region).describe_instances(states=["running"], tags={"eks:cluster-name": [cluster_name]})
+                            for reservation in instances_response.get(
+                                "Reservations", []
                             ):
-                                is_orphaned = True
-                                orphan_type = "fargate_no_profiles"
-                                orphan_reasons.append(
-                                    "Fargate-configured but no profiles created"
-                                )
-                                orphan_reasons.append(
-                                    "Cannot deploy pods without Fargate profiles or node groups"
-                                )
-                                confidence_level = (
-                                    "high"
-                                    if age_days >= confidence_threshold_days
-                                    else "medium"
-                                )
+                                for instance in reservation.get("Instances", []):
+                                    node_instance_ids.append(instance["InstanceId"])
+                        except Exception:
+                            pass
 
-                            # Scenario #2: All nodes unhealthy
-                            elif (
-                                detect_unhealthy_nodes
-                                and total_nodes > 0
-                                and unhealthy_nodes == total_nodes
-                                and age_days >= min_unhealthy_days
-                            ):
-                                is_orphaned = True
-                                orphan_type = "all_nodes_unhealthy"
+                        # Detection logic
+                        is_orphaned = False
+                        orphan_type = None
+                        orphan_reasons = []
+                        confidence_level = "medium"
+
+                        # Scenario #1: No worker nodes
+                        if (
+                            detect_no_nodes
+                            and total_nodes == 0
+                            and len(fargate_profiles) == 0
+                        ):
+                            is_orphaned = True
+                            orphan_type = "no_worker_nodes"
+                            orphan_reasons.append(
+                                f"No worker nodes and no Fargate profiles (age: {age_days} days)"
+                            )
+                            orphan_reasons.append(
+                                "Paying $73/month for unused control plane"
+                            )
+
+                            if age_days >= critical_age_days:
+                                confidence_level = "critical"
                                 orphan_reasons.append(
-                                    f"All {total_nodes} nodes are unhealthy/degraded"
-                                )
-                                orphan_reasons.append("Cluster unable to run workloads")
-                                confidence_level = (
-                                    "high"
-                                    if age_days >= confidence_threshold_days
-                                    else "medium"
+                                    f"CRITICAL: Unused for {age_days}+ days"
                                 )
+                            elif age_days >= confidence_threshold_days:
+                                confidence_level = "high"
+                            else:
+                                confidence_level = "medium"
 
-                            # Scenario #3: Low CPU utilization on all nodes
-                            elif (
-                                detect_low_utilization
-                                and total_nodes > 0
-                                and len(node_instance_ids) > 0
-                                and age_days >= min_idle_days
-                            ):
-                                # Check CloudWatch CPU for nodes
-                                low_cpu_nodes = 0
-                                total_checked_nodes = 0
-                                avg_cpu_overall = 0.0
+                        # Scenario #4: Fargate no profiles
+                        elif (
+                            detect_fargate_no_profiles
+                            and total_nodes == 0
+                            and len(nodegroups) == 0
+                            and len(fargate_profiles) == 0
+                        ):
+                            is_orphaned = True
+                            orphan_type = "fargate_no_profiles"
+                            orphan_reasons.append(
+                                "Fargate-configured but no profiles created"
+                            )
+                            orphan_reasons.append(
+                                "Cannot deploy pods without Fargate profiles or node groups"
+                            )
+                            confidence_level = (
+                                "high"
+                                if age_days >= confidence_threshold_days
+                                else "medium"
+                            )
 
-                                now = datetime.now(timezone.utc)
-                                start_time = now - timedelta(days=idle_lookback_days)
+                        # Scenario #2: All nodes unhealthy
+                        elif (
+                            detect_unhealthy_nodes
+                            and total_nodes > 0
+                            and unhealthy_nodes == total_nodes
+                            and age_days >= min_unhealthy_days
+                        ):
+                            is_orphaned = True
+                            orphan_type = "all_nodes_unhealthy"
+                            orphan_reasons.append(
+                                f"All {total_nodes} nodes are unhealthy/degraded"
+                            )
+                            orphan_reasons.append("Cluster unable to run workloads")
+                            confidence_level = (
+                                "high"
+                                if age_days >= confidence_threshold_days
+                                else "medium"
+                            )
 
-                                # Limit to 10 instances to avoid API throttling
-                                for instance_id in node_instance_ids[:10]:
-                                    try:
-                                        cpu_response = (
-                                            await cloudwatch.get_metric_statistics(
-                                                Namespace="AWS/EC2",
-                                                MetricName="CPUUtilization",
-                                                Dimensions=[
-                                                    {
-                                                        "Name": "InstanceId",
-                                                        "Value": instance_id,
-                                                    }
-                                                ],
-                                                StartTime=start_time,
-                                                EndTime=now,
-                                                Period=86400,  # 1 day
-                                                Statistics=["Average"],
-                                            )
-                                        )
-                                        datapoints = cpu_response.get("Datapoints", [])
-                                        if datapoints:
-                                            avg_cpu = sum(
-                                                dp["Average"] for dp in datapoints
-                                            ) / len(datapoints)
-                                            avg_cpu_overall += avg_cpu
-                                            total_checked_nodes += 1
-                                            if avg_cpu < cpu_threshold_percent:
-                                                low_cpu_nodes += 1
-                                    except Exception:
-                                        pass
+                        # Scenario #3: Low CPU utilization on all nodes
+                        elif (
+                            detect_low_utilization
+                            and total_nodes > 0
+                            and len(node_instance_ids) > 0
+                            and age_days >= min_idle_days
+                        ):
+                            # Check CloudWatch CPU for nodes
+                            low_cpu_nodes = 0
+                            total_checked_nodes = 0
+                            avg_cpu_overall = 0.0
 
-                                if total_checked_nodes > 0:
-                                    avg_cpu_overall /= total_checked_nodes
+                            now = datetime.now(timezone.utc)
+                            start_time = now - timedelta(days=idle_lookback_days)
 
-                                    # If all checked nodes have low CPU
-                                    if (
-                                        low_cpu_nodes == total_checked_nodes
-                                        and avg_cpu_overall < cpu_threshold_percent
-                                    ):
-                                        is_orphaned = True
-                                        orphan_type = "low_utilization"
-                                        orphan_reasons.append(
-                                            f"All nodes have <{cpu_threshold_percent}% CPU utilization (avg: {avg_cpu_overall:.2f}%)"
-                                        )
-                                        orphan_reasons.append(
-                                            "Over-provisioned or abandoned cluster"
-                                        )
-                                        confidence_level = (
-                                            "high"
-                                            if age_days >= critical_age_days
-                                            else "medium"
+                            # Limit to 10 instances to avoid API throttling
+                            for instance_id in node_instance_ids[:10]:
+                                try:
+                                    cpu_response = (
+                                        await cloudwatch.get_metric_statistics(
+                                            Namespace="AWS/EC2",
+                                            MetricName="CPUUtilization",
+                                            Dimensions=[
+                                                {
+                                                    "Name": "InstanceId",
+                                                    "Value": instance_id,
+                                                }
+                                            ],
+                                            StartTime=start_time,
+                                            EndTime=now,
+                                            Period=86400,  # 1 day
+                                            Statistics=["Average"],
                                         )
+                                    )
+                                    datapoints = cpu_response.get("Datapoints", [])
+                                    if datapoints:
+                                        avg_cpu = sum(
+                                            dp["Average"] for dp in datapoints
+                                        ) / len(datapoints)
+                                        avg_cpu_overall += avg_cpu
+                                        total_checked_nodes += 1
+                                        if avg_cpu < cpu_threshold_percent:
+                                            low_cpu_nodes += 1
+                                except Exception:
+                                    pass
 
-                            # Scenario #5: Outdated Kubernetes version
-                            if detect_outdated_version and k8s_version != "Unknown":
-                                try:
-                                    latest_major, latest_minor = map(
-                                        int, LATEST_K8S_VERSION.split(".")[:2]
+                            if total_checked_nodes > 0:
+                                avg_cpu_overall /= total_checked_nodes
+
+                                # If all checked nodes have low CPU
+                                if (
+                                    low_cpu_nodes == total_checked_nodes
+                                    and avg_cpu_overall < cpu_threshold_percent
+                                ):
+                                    is_orphaned = True
+                                    orphan_type = "low_utilization"
+                                    orphan_reasons.append(
+                                        f"All nodes have <{cpu_threshold_percent}% CPU utilization (avg: {avg_cpu_overall:.2f}%)"
+                                    )
+                                    orphan_reasons.append(
+                                        "Over-provisioned or abandoned cluster"
                                     )
-                                    current_major, current_minor = map(
-                                        int, k8s_version.split(".")[:2]
+                                    confidence_level = (
+                                        "high"
+                                        if age_days >= critical_age_days
+                                        else "medium"
                                     )
 
-                                    version_diff = (
-                                        latest_major - current_major
-                                    ) * 100 + (latest_minor - current_minor)
+                        # Scenario #5: Outdated Kubernetes version
+                        if detect_outdated_version and k8s_version != "Unknown":
+                            try:
+                                latest_major, latest_minor = map(
+                                    int, LATEST_K8S_VERSION.split(".")[:2]
+                                )
+                                current_major, current_minor = map(
+                                    int, k8s_version.split(".")[:2]
+                                )
 
-                                    if version_diff >= min_supported_minor_versions:
-                                        if not is_orphaned:
-                                            is_orphaned = True
-                                            orphan_type = "outdated_version"
-                                            confidence_level = "medium"
+                                version_diff = (
+                                    latest_major - current_major
+                                ) * 100 + (latest_minor - current_minor)
 
-                                        orphan_reasons.append(
-                                            f"Kubernetes version {k8s_version} is {version_diff} versions behind latest ({LATEST_K8S_VERSION})"
-                                        )
-                                        orphan_reasons.append(
-                                            "Likely abandoned cluster (security risk)"
-                                        )
-                                except Exception:
-                                    pass
+                                if version_diff >= min_supported_minor_versions:
+                                    if not is_orphaned:
+                                        is_orphaned = True
+                                        orphan_type = "outdated_version"
+                                        confidence_level = "medium"
 
-                            # ========== PHASE 2 - Advanced Detection (Scenarios 6-10) ==========
+                                    orphan_reasons.append(
+                                        f"Kubernetes version {k8s_version} is {version_diff} versions behind latest ({LATEST_K8S_VERSION})"
+                                    )
+                                    orphan_reasons.append(
+                                        "Likely abandoned cluster (security risk)"
+                                    )
+                            except Exception:
+                                pass
 
-                            # Scenario #6: Over-provisioned nodes (CPU <20%)
-                            if detect_over_provisioned_nodes and total_nodes > 0 and len(node_instance_ids) > 0 and age_days >= min_age_for_cpu_analysis and orphan_type is None:
-                                try:
-                                    start_time_cpu = datetime.now(timezone.utc) - timedelta(days=cpu_lookback_days)
-                                    over_prov_low_cpu_nodes = 0
-                                    over_prov_total_checked = 0
-                                    over_prov_avg_cpu = 0.0
+                        # ========== PHASE 2 - Advanced Detection (Scenarios 6-10) ==========
 
-                                    for instance_id in node_instance_ids:
-                                        try:
-                                            cpu_response = await cloudwatch.get_metric_statistics(
-                                                Namespace="AWS/EC2",
-                                                MetricName="CPUUtilization",
-                                                Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
-                                                StartTime=start_time_cpu,
-                                                EndTime=datetime.now(timezone.utc),
-                                                Period=86400,
-                                                Statistics=["Average"],
-                                            )
-                                            datapoints = cpu_response.get("Datapoints", [])
-                                            if datapoints and len(datapoints) >= 7:
-                                                avg_cpu = sum(dp["Average"] for dp in datapoints) / len(datapoints)
-                                                over_prov_avg_cpu += avg_cpu
-                                                over_prov_total_checked += 1
-                                                if avg_cpu < cpu_over_provisioned_threshold:
-                                                    over_prov_low_cpu_nodes += 1
-                                        except Exception:
-                                            pass
+                        # Scenario #6: Over-provisioned nodes (CPU <20%)
+                        if detect_over_provisioned_nodes and total_nodes > 0 and len(node_instance_ids) > 0 and age_days >= min_age_for_cpu_analysis and orphan_type is None:
+                            try:
+                                start_time_cpu = datetime.now(timezone.utc) - timedelta(days=cpu_lookback_days)
+                                over_prov_low_cpu_nodes = 0
+                                over_prov_total_checked = 0
+                                over_prov_avg_cpu = 0.0
+
+                                for instance_id in node_instance_ids:
+                                    try:
+                                        cpu_response = await cloudwatch.get_metric_statistics(
+                                            Namespace="AWS/EC2",
+                                            MetricName="CPUUtilization",
+                                            Dimensions=[{"Name": "InstanceId", "Value": instance_id}],
+                                            StartTime=start_time_cpu,
+                                            EndTime=datetime.now(timezone.utc),
+                                            Period=86400,
+                                            Statistics=["Average"],
+                                        )
+                                        datapoints = cpu_response.get("Datapoints", [])
+                                        if datapoints and len(datapoints) >= 7:
+                                            avg_cpu = sum(dp["Average"] for dp in datapoints) / len(datapoints)
+                                            over_prov_avg_cpu += avg_cpu
+                                            over_prov_total_checked += 1
+                                            if avg_cpu < cpu_over_provisioned_threshold:
+                                                over_prov_low_cpu_nodes += 1
+                                    except Exception:
+                                        pass
 
-                                    if over_prov_total_checked > 0:
-                                        over_prov_avg_cpu /= over_prov_total_checked
+                                if over_prov_total_checked > 0:
+                                    over_prov_avg_cpu /= over_prov_total_checked
 
-                                        if over_prov_low_cpu_nodes == over_prov_total_checked and over_prov_avg_cpu < cpu_over_provisioned_threshold:
-                                            is_orphaned = True
-                                            orphan_type = "over_provisioned_nodes"
-                                            orphan_reasons.append(f"All nodes have <{cpu_over_provisioned_threshold}% CPU utilization (avg: {over_prov_avg_cpu:.2f}%)")
-                                            orphan_reasons.append("Right-sizing recommended - downsize instance types to reduce cost 30-50%")
-                                            confidence_level = "high" if over_prov_avg_cpu < 10.0 else "medium"
-                                except Exception as e:
-                                    print(f"Warning: Could not analyze CPU for over-provisioning on {cluster_name}: {e}")
+                                    if over_prov_low_cpu_nodes == over_prov_total_checked and over_prov_avg_cpu < cpu_over_provisioned_threshold:
+                                        is_orphaned = True
+                                        orphan_type = "over_provisioned_nodes"
+                                        orphan_reasons.append(f"All nodes have <{cpu_over_provisioned_threshold}% CPU utilization (avg: {over_prov_avg_cpu:.2f}%)")
+                                        orphan_reasons.append("Right-sizing recommended - downsize instance types to reduce cost 30-50%")
+                                        confidence_level = "high" if over_prov_avg_cpu < 10.0 else "medium"
+                            except Exception as e:
+                                print(f"Warning: Could not analyze CPU for over-provisioning on {cluster_name}: {e}")
+
+                        # Scenario #7: Old generation instance types
+                        if detect_old_generation_nodes and total_nodes > 0 and orphan_type is None:
+                            old_gen_node_groups = []
+                            for node in node_details:
+                                instance_type = node["instance_type"]
+                                # Check if instance type is old generation
+                                is_old_gen = any(f".{gen_type}." in instance_type for gen_type in old_generation_types)
+                                if is_old_gen:
+                                    old_gen_node_groups.append(node)
+
+                            if old_gen_node_groups:
+                                is_orphaned = True
+                                orphan_type = "old_generation_nodes"
 
-                            # Scenario #7: Old generation instance types
-                            if detect_old_generation_nodes and total_nodes > 0 and orphan_type is None:
-                                old_gen_node_groups = []
-                                for node in node_details:
+                                # Determine new generation recommendations
+                                recommendations = []
+                                for node in old_gen_node_groups:
                                     instance_type = node["instance_type"]
-                                    # Check if instance type is old generation
-                                    is_old_gen = any(f".{gen_type}." in instance_type for gen_type in old_generation_types)
-                                    if is_old_gen:
-                                        old_gen_node_groups.append(node)
+                                    new_generation = instance_type
+                                    if ".t2." in instance_type:
+                                        new_generation = instance_type.replace(".t2.", ".t3.")
+                                    elif ".m4." in instance_type:
+                                        new_generation = instance_type.replace(".m4.", ".m5.")
+                                    elif ".c4." in instance_type:
+                                        new_generation = instance_type.replace(".c4.", ".c5.")
+                                    elif ".r4." in instance_type:
+                                        new_generation = instance_type.replace(".r4.", ".r5.")
+                                    recommendations.append(f"{instance_type} → {new_generation}")
+
+                                orphan_reasons.append(f"Old generation instance types detected: {len(old_gen_node_groups)} node groups")
+                                orphan_reasons.append(f"Recommended upgrades: {', '.join(recommendations[:3])}")
+                                orphan_reasons.append(f"Modern instances offer ~{old_generation_savings_percent}% cost savings + better performance")
+                                confidence_level = "medium"
 
-                                if old_gen_node_groups:
-                                    is_orphaned = True
-                                    orphan_type = "old_generation_nodes"
-
-                                    # Determine new generation recommendations
-                                    recommendations = []
-                                    for node in old_gen_node_groups:
-                                        instance_type = node["instance_type"]
-                                        new_generation = instance_type
-                                        if ".t2." in instance_type:
-                                            new_generation = instance_type.replace(".t2.", ".t3.")
-                                        elif ".m4." in instance_type:
-                                            new_generation = instance_type.replace(".m4.", ".m5.")
-                                        elif ".c4." in instance_type:
-                                            new_generation = instance_type.replace(".c4.", ".c5.")
-                                        elif ".r4." in instance_type:
-                                            new_generation = instance_type.replace(".r4.", ".r5.")
-                                        recommendations.append(f"{instance_type} → {new_generation}")
-
-                                    orphan_reasons.append(f"Old generation instance types detected: {len(old_gen_node_groups)} node groups")
-                                    orphan_reasons.append(f"Recommended upgrades: {', '.join(recommendations[:3])}")
-                                    orphan_reasons.append(f"Modern instances offer ~{old_generation_savings_percent}% cost savings + better performance")
-                                    confidence_level = "medium"
+                        # Scenario #8: Dev/Test clusters running 24/7
+                        if detect_dev_test_24_7 and total_nodes > 0 and orphan_type is None:
+                            is_dev_test_cluster = False
+                            detection_method = ""
 
-                            # Scenario #8: Dev/Test clusters running 24/7
-                            if detect_dev_test_24_7 and total_nodes > 0 and orphan_type is None:
-                                is_dev_test_cluster = False
-                                detection_method = ""
+                            # Check tags
+                            try:
+                                tags_response = await eks.list_tags_for_resource(
+                                    resourceArn=cluster.get("arn", "")
+                                )
+                                tags_dict = tags_response.get("tags", {})
+                                env_tag = tags_dict.get(dev_test_tag_key, "").lower()
 
-                                # Check tags
-                                try:
-                                    tags_response = await eks.list_tags_for_resource(
-                                        resourceArn=cluster.get("arn", "")
-                                    )
-                                    tags_dict = tags_response.get("tags", {})
-                                    env_tag = tags_dict.get(dev_test_tag_key, "").lower()
+                                if env_tag in [v.lower() for v in dev_test_tag_values]:
+                                    is_dev_test_cluster = True
+                                    detection_method = f"Environment tag: {env_tag}"
+                            except Exception:
+                                pass
 
-                                    if env_tag in [v.lower() for v in dev_test_tag_values]:
+                            # Check naming patterns
+                            if not is_dev_test_cluster:
+                                for pattern in dev_test_name_patterns:
+                                    if cluster_name.lower().startswith(pattern.lower()):
                                         is_dev_test_cluster = True
-                                        detection_method = f"Environment tag: {env_tag}"
-                                except Exception:
-                                    pass
+                                        detection_method = f"Name pattern: {pattern}"
+                                        break
 
-                                # Check naming patterns
-                                if not is_dev_test_cluster:
-                                    for pattern in dev_test_name_patterns:
-                                        if cluster_name.lower().startswith(pattern.lower()):
-                                            is_dev_test_cluster = True
-                                            detection_method = f"Name pattern: {pattern}"
-                                            break
+                            if is_dev_test_cluster:
+                                is_orphaned = True
+                                orphan_type = "dev_test_24_7"
 
-                                if is_dev_test_cluster:
-                                    is_orphaned = True
-                                    orphan_type = "dev_test_24_7"
-
-                                    # Calculate business hours savings
-                                    off_hours_percentage = 123 / 168  # 73.2%
-                                    orphan_reasons.append(f"Dev/test cluster running 24/7 ({detection_method})")
-                                    orphan_reasons.append(f"Business hours only: {business_hours_start}:00-{business_hours_end}:00, Mon-Fri")
-                                    orphan_reasons.append(f"Off-hours waste: {off_hours_percentage*100:.1f}% of time ({123}h/{168}h per week)")
-                                    orphan_reasons.append("Recommendation: Scale to zero nights/weekends or use Karpenter auto-scaling")
-                                    confidence_level = "high" if "tag" in detection_method.lower() else "medium"
-
-                            # Scenario #9: 100% On-Demand nodes (Spot instances not used)
-                            if detect_spot_not_used and total_nodes >= min_nodes_for_spot and orphan_type is None:
-                                on_demand_nodes_count = 0
-                                spot_nodes_count = 0
-
-                                for ng_name in nodegroups:
-                                    ng_info = await eks.describe_nodegroup(
-                                        clusterName=cluster_name, nodegroupName=ng_name
-                                    )
-                                    ng = ng_info["nodegroup"]
-                                    capacity_type = ng.get("capacityType", "ON_DEMAND")
-                                    desired_size = ng.get("scalingConfig", {}).get("desiredSize", 0)
+                                # Calculate business hours savings
+                                off_hours_percentage = 123 / 168  # 73.2%
+                                orphan_reasons.append(f"Dev/test cluster running 24/7 ({detection_method})")
+                                orphan_reasons.append(f"Business hours only: {business_hours_start}:00-{business_hours_end}:00, Mon-Fri")
+                                orphan_reasons.append(f"Off-hours waste: {off_hours_percentage*100:.1f}% of time ({123}h/{168}h per week)")
+                                orphan_reasons.append("Recommendation: Scale to zero nights/weekends or use Karpenter auto-scaling")
+                                confidence_level = "high" if "tag" in detection_method.lower() else "medium"
 
-                                    if capacity_type == "SPOT":
-                                        spot_nodes_count += desired_size
-                                    else:
-                                        on_demand_nodes_count += desired_size
+                        # Scenario #9: 100% On-Demand nodes (Spot instances not used)
+                        if detect_spot_not_used and total_nodes >= min_nodes_for_spot and orphan_type is None:
+                            on_demand_nodes_count = 0
+                            spot_nodes_count = 0
 
-                                # Flag if 100% on-demand (no spot instances)
-                                if on_demand_nodes_count > 0 and spot_nodes_count == 0:
-                                    is_orphaned = True
-                                    orphan_type = "spot_not_used"
-                                    spot_percentage = spot_mix_percentage_recommended
+                            for ng_name in nodegroups:
+                                ng_info = await eks.describe_nodegroup(
+                                    clusterName=cluster_name, nodegroupName=ng_name
+                                )
+                                ng = ng_info["nodegroup"]
+                                capacity_type = ng.get("capacityType", "ON_DEMAND")
+                                desired_size = ng.get("scalingConfig", {}).get("desiredSize", 0)
 
-                                    orphan_reasons.append(f"100% On-Demand nodes ({on_demand_nodes_count} nodes, 0 Spot)")
-                                    orphan_reasons.append(f"Spot instances are 70% cheaper than On-Demand")
-                                    orphan_reasons.append(f"Recommendation: Migrate {spot_percentage:.0f}% to Spot for 42% cost savings")
-                                    orphan_reasons.append("Use managed node groups with Spot capacity for fault-tolerant workloads")
-                                    confidence_level = "medium"
+                                if capacity_type == "SPOT":
+                                    spot_nodes_count += desired_size
+                                else:
+                                    on_demand_nodes_count += desired_size
 
-                            # Scenario #10: Fargate cost vs EC2 analysis
-                            if detect_fargate_cost_vs_ec2 and len(fargate_profiles) > 0 and total_nodes == 0 and orphan_type is None:
-                                # This is a Fargate-only cluster
-                                # Estimate if EC2 would be cheaper based on pod count (simplified)
-                                # Note: In production, would query Kubernetes API for actual pod count
-                                # For now, we'll flag Fargate-only clusters with many profiles as potential candidates
-                                if len(fargate_profiles) >= fargate_break_even_pods // 2:  # Heuristic: profiles suggest many pods
-                                    is_orphaned = True
-                                    orphan_type = "fargate_cost_vs_ec2"
+                            # Flag if 100% on-demand (no spot instances)
+                            if on_demand_nodes_count > 0 and spot_nodes_count == 0:
+                                is_orphaned = True
+                                orphan_type = "spot_not_used"
+                                spot_percentage = spot_mix_percentage_recommended
 
-                                    orphan_reasons.append(f"Fargate-only cluster with {len(fargate_profiles)} profiles")
-                                    orphan_reasons.append("Fargate is more expensive than EC2 for high-utilization steady workloads")
-                                    orphan_reasons.append(f"If >15 pods running 24/7, EC2 nodes would be ~40% cheaper")
-                                    orphan_reasons.append("Recommendation: Analyze pod count and consider migrating to EC2 node groups")
-                                    confidence_level = "low"  # Low confidence without actual pod count
+                                orphan_reasons.append(f"100% On-Demand nodes ({on_demand_nodes_count} nodes, 0 Spot)")
+                                orphan_reasons.append(f"Spot instances are 70% cheaper than On-Demand")
+                                orphan_reasons.append(f"Recommendation: Migrate {spot_percentage:.0f}% to Spot for 42% cost savings")
+                                orphan_reasons.append("Use managed node groups with Spot capacity for fault-tolerant workloads")
+                                confidence_level = "medium"
 
-                            if is_orphaned:
-                                # Calculate costs
-                                control_plane_cost = self.PRICING["eks_control_plane"]
-                                node_cost = 0.0
+                        # Scenario #10: Fargate cost vs EC2 analysis
+                        if detect_fargate_cost_vs_ec2 and len(fargate_profiles) > 0 and total_nodes == 0 and orphan_type is None:
+                            # This is a Fargate-only cluster
+                            # Estimate if EC2 would be cheaper based on pod count (simplified)
+                            # Note: In production, would query Kubernetes API for actual pod count
+                            # For now, we'll flag Fargate-only clusters with many profiles as potential candidates
+                            if len(fargate_profiles) >= fargate_break_even_pods // 2:  # Heuristic: profiles suggest many pods
+                                is_orphaned = True
+                                orphan_type = "fargate_cost_vs_ec2"
 
-                                for node in node_details:
-                                    instance_type = node["instance_type"]
-                                    desired_size = node["desired_size"]
+                                orphan_reasons.append(f"Fargate-only cluster with {len(fargate_profiles)} profiles")
+                                orphan_reasons.append("Fargate is more expensive than EC2 for high-utilization steady workloads")
+                                orphan_reasons.append(f"If >15 pods running 24/7, EC2 nodes would be ~40% cheaper")
+                                orphan_reasons.append("Recommendation: Analyze pod count and consider migrating to EC2 node groups")
+                                confidence_level = "low"  # Low confidence without actual pod count
 
-                                    # Map instance type to pricing
-                                    instance_type_lower = instance_type.lower()
-                                    price_key = (
-                                        f"eks_{instance_type_lower.replace('.', '_')}"
-                                    )
+                        if is_orphaned:
+                            # Calculate costs
+                            control_plane_cost = self.PRICING["eks_control_plane"]
+                            node_cost = 0.0
+
+                            for node in node_details:
+                                instance_type = node["instance_type"]
+                                desired_size = node["desired_size"]
+
+                                # Map instance type to pricing
+                                instance_type_lower = instance_type.lower()
+                                price_key = (
+                                    f"eks_{instance_type_lower.replace('.', '_')}"
+                                )
 
-                                    if price_key in self.PRICING:
-                                        node_cost += (
-                                            self.PRICING[price_key] * desired_size
-                                        )
-                                    elif "t3.small" in instance_type_lower:
-                                        node_cost += (
-                                            self.PRICING["eks_t3_small"] * desired_size
-                                        )
-                                    elif "t3.medium" in instance_type_lower:
-                                        node_cost += (
-                                            self.PRICING["eks_t3_medium"] * desired_size
-                                        )
-                                    elif "t3.large" in instance_type_lower:
-                                        node_cost += (
-                                            self.PRICING["eks_t3_large"] * desired_size
-                                        )
-                                    elif "m5.large" in instance_type_lower:
-                                        node_cost += (
-                                            self.PRICING["eks_m5_large"] * desired_size
-                                        )
-                                    else:
-                                        # Default fallback to t3.medium
-                                        node_cost += (
-                                            self.PRICING["eks_t3_medium"] * desired_size
-                                        )
+                                if price_key in self.PRICING:
+                                    node_cost += (
+                                        self.PRICING[price_key] * desired_size
+                                    )
+                                elif "t3.small" in instance_type_lower:
+                                    node_cost += (
+                                        self.PRICING["eks_t3_small"] * desired_size
+                                    )
+                                elif "t3.medium" in instance_type_lower:
+                                    node_cost += (
+                                        self.PRICING["eks_t3_medium"] * desired_size
+                                    )
+                                elif "t3.large" in instance_type_lower:
+                                    node_cost += (
+                                        self.PRICING["eks_t3_large"] * desired_size
+                                    )
+                                elif "m5.large" in instance_type_lower:
+                                    node_cost += (
+                                        self.PRICING["eks_m5_large"] * desired_size
+                                    )
+                                else:
+                                    # Default fallback to t3.medium
+                                    node_cost += (
+                                        self.PRICING["eks_t3_medium"] * desired_size
+                                    )
 
-                                total_cost = control_plane_cost + node_cost
+                            total_cost = control_plane_cost + node_cost
 
-                                orphans.append(
-                                    OrphanResourceData(
-                                        resource_type="eks_cluster",
-                                        resource_id=cluster_name,
-                                        resource_name=cluster_name,
-                                        region=region,
-                                        estimated_monthly_cost=round(total_cost, 2),
-                                        resource_metadata={
-                                            "version": k8s_version,
-                                            "status": cluster_status,
-                                            "nodegroup_count": len(nodegroups),
-                                            "total_nodes": total_nodes,
-                                            "unhealthy_nodes": unhealthy_nodes,
-                                            "fargate_profile_count": len(
-                                                fargate_profiles
-                                            ),
-                                            "node_details": node_details,
-                                            "created_at": created_at.isoformat(),
-                                            "age_days": age_days,
-                                            "orphan_type": orphan_type,
-                                            "orphan_reason": " | ".join(orphan_reasons),
-                                            "orphan_reasons": orphan_reasons,
-                                            "confidence_level": confidence_level,
-                                            "control_plane_cost_monthly": round(
-                                                control_plane_cost, 2
-                                            ),
-                                            "node_cost_monthly": round(node_cost, 2),
-                                            "wasted_amount": round(total_cost, 2),
-                                        },
-                                    )
+                            orphans.append(
+                                OrphanResourceData(
+                                    resource_type="eks_cluster",
+                                    resource_id=cluster_name,
+                                    resource_name=cluster_name,
+                                    region=region,
+                                    estimated_monthly_cost=round(total_cost, 2),
+                                    resource_metadata={
+                                        "version": k8s_version,
+                                        "status": cluster_status,
+                                        "nodegroup_count": len(nodegroups),
+                                        "total_nodes": total_nodes,
+                                        "unhealthy_nodes": unhealthy_nodes,
+                                        "fargate_profile_count": len(
+                                            fargate_profiles
+                                        ),
+                                        "node_details": node_details,
+                                        "created_at": created_at.isoformat(),
+                                        "age_days": age_days,
+                                        "orphan_type": orphan_type,
+                                        "orphan_reason": " | ".join(orphan_reasons),
+                                        "orphan_reasons": orphan_reasons,
+                                        "confidence_level": confidence_level,
+                                        "control_plane_cost_monthly": round(
+                                            control_plane_cost, 2
+                                        ),
+                                        "node_cost_monthly": round(node_cost, 2),
+                                        "wasted_amount": round(total_cost, 2),
+                                    },
                                 )
+                            )
 
         except ClientError as e:
             print(f"Error scanning EKS clusters in {region}: {e}")
@@ -8950,8 +9065,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("sagemaker", region_name=region) as sagemaker:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("sagemaker", region_name=region) as sagemaker:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await sagemaker.list_endpoints()
 
                     for endpoint in response.get("Endpoints", []):
@@ -9062,8 +9177,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("redshift", region_name=region) as redshift:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("redshift", region_name=region) as redshift:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await redshift.describe_clusters()
 
                     for cluster in response.get("Clusters", []):
@@ -9193,8 +9308,8 @@ class AWSProvider(CloudProviderBase):
         print(f"🗄️ [DEBUG] scan_idle_elasticache_clusters called for region: {region}")
 
         try:
-            async with self.session.client("elasticache", region_name=region) as elasticache:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("elasticache", region_name=region) as elasticache:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     # List all ElastiCache clusters (Redis + Memcached)
                     response = await elasticache.describe_cache_clusters()
                     clusters = response.get("CacheClusters", [])
@@ -9487,8 +9602,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await ec2.describe_vpn_connections()
 
                     for vpn in response.get("VpnConnections", []):
@@ -9577,8 +9692,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await ec2.describe_transit_gateway_attachments()
 
                     for attachment in response.get("TransitGatewayAttachments", []):
@@ -9685,8 +9800,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("opensearch", region_name=region) as opensearch:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("opensearch", region_name=region) as opensearch:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await opensearch.list_domain_names()
 
                     for domain_info in response.get("DomainNames", []):
@@ -9804,10 +9919,10 @@ class AWSProvider(CloudProviderBase):
             return orphans
 
         try:
-            async with self.session.client(
+            async with self.client_pool.client(
                 "globalaccelerator", region_name="us-west-2"
             ) as ga:
-                async with self.session.client("cloudwatch", region_name="us-west-2") as cw:
+                async with self.client_pool.client("cloudwatch", region_name="us-west-2") as cw:
                     response = await ga.list_accelerators()
 
                     for accelerator in response.get("Accelerators", []):
@@ -9931,8 +10046,8 @@ class AWSProvider(CloudProviderBase):
         print(f"🌊 [DEBUG] scan_idle_kinesis_streams called for region: {region}")
 
         try:
-            async with self.session.client("kinesis", region_name=region) as kinesis:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("kinesis", region_name=region) as kinesis:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await kinesis.list_streams()
                     stream_names = response.get("StreamNames", [])
 
@@ -10243,7 +10358,7 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 response = await ec2.describe_vpc_endpoints()
 
                 for endpoint in response.get("VpcEndpoints", []):
@@ -10325,8 +10440,8 @@ class AWSProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 3) if detection_rules else 3
 
         try:
-            async with self.session.client("docdb", region_name=region) as docdb:
-                async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("docdb", region_name=region) as docdb:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                     response = await docdb.describe_db_clusters()
 
                     for cluster in response.get("DBClusters", []):
@@ -10479,7 +10594,7 @@ class AWSProvider(CloudProviderBase):
         glacier_retrieval_lookback_days = detection_rules.get("glacier_retrieval_lookback_days", 365) if detection_rules else 365
 
         try:
-            async with self.session.client("s3") as s3:
+            async with self.client_pool.client("s3") as s3:
                 # List all buckets (global)
                 response = await s3.list_buckets()
                 buckets = response.get("Buckets", [])
@@ -10908,8 +11023,8 @@ class AWSProvider(CloudProviderBase):
         print(f"⚡ [DEBUG] scan_idle_lambda_functions called for region: {region}")
 
         try:
-            async with self.session.client("lambda", region_name=region) as lambda_client:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch_client:
+            async with self.client_pool.client("lambda", region_name=region) as lambda_client:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch_client:
                     # List all Lambda functions
                     paginator = lambda_client.get_paginator("list_functions")
                     async for page in paginator.paginate():
@@ -11447,8 +11562,8 @@ class AWSProvider(CloudProviderBase):
         print(f"🗃️ [DEBUG] scan_idle_dynamodb_tables called for region: {region}")
 
         try:
-            async with self.session.client("dynamodb", region_name=region) as dynamodb_client:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch_client:
+            async with self.client_pool.client("dynamodb", region_name=region) as dynamodb_client:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch_client:
                     # List all DynamoDB tables
                     paginator = dynamodb_client.get_paginator("list_tables")
                     all_table_names = []
@@ -11991,9 +12106,9 @@ class AWSProvider(CloudProviderBase):
         FARGATE_MEMORY_GB_HOUR = 0.004445  # $0.004445 per GB-hour
 
         try:
-            async with self.session.client("ecs", region_name=region) as ecs_client:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch_client:
-                    async with self.session.client("logs", region_name=region) as logs_client:
+            async with self.client_pool.client("ecs", region_name=region) as ecs_client:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch_client:
+                    async with self.client_pool.client("logs", region_name=region) as logs_client:
                         # List all ECS clusters in region
                         clusters_response = await ecs_client.list_clusters()
                         cluster_arns = clusters_response.get("clusterArns", [])
@@ -0,0 +1,121 @@
+"""Pool of long-lived aioboto3 clients shared by a provider instance."""
+
+import asyncio
+import logging
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator
+
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Identity of a pooled client: (service, region, endpoint_url)
+ClientKey = tuple[str, str | None, str | None]
+
+
+class AWSClientPool:
+    """
+    One aioboto3 client per (service, region) for the lifetime of a scan.
+
+    Creating a client builds a botocore client (endpoint resolution, service
+    model loading) and a new HTTP connection pool, so the first request of
+    every `async with session.client(...)` block paid for a fresh TLS
+    handshake. The pool creates each client once, with a connection pool
+    sized for concurrent scenarios and adaptive retries, and closes them all
+    in close().
+
+    The pool exposes the same `client(...)` call as an aioboto3 Session, so it
+    can be used in place of the session: leaving the `async with` block keeps
+    the client open for the next caller.
+    """
+
+    def __init__(self, session: Any, config: Config | None = None, max_pool_connections: int = 50) -> None:
+        """
+        Initialize the pool (clients are created on first use).
+
+        Args:
+            session: aioboto3 session holding the credentials
+            config: Base botocore Config (timeouts, retries)
+            max_pool_connections: HTTP connections per client
+        """
+        self.session = session
+        self.config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={"max_attempts": 5, "mode": "adaptive"},
+        )
+        if config is not None:
+            self.config = self.config.merge(config)
+
+        self._clients: dict[ClientKey, Any] = {}
+        self._locks: dict[ClientKey, asyncio.Lock] = {}
+        self._exit_stack = AsyncExitStack()
+        self.clients_created = 0
+        self.creation_seconds = 0.0
+
+    async def get_client(
+        self, service: str, region_name: str | None = None, endpoint_url: str | None = None
+    ) -> Any:
+        """
+        Return the pooled client for a service and region, creating it once.
+
+        Args:
+            service: AWS service name (e.g., 'ec2', 'cloudwatch')
+            region_name: AWS region name
+            endpoint_url: Optional explicit endpoint URL
+
+        Returns:
+            Open aioboto3 client
+        """
+        key = (service, region_name, endpoint_url)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if key not in self._clients:
+                started = time.perf_counter()
+                kwargs: dict[str, Any] = {"region_name": region_name, "config": self.config}
+                if endpoint_url:
+                    kwargs["endpoint_url"] = endpoint_url
+                self._clients[key] = await self._exit_stack.enter_async_context(
+                    self.session.client(service, **kwargs)
+                )
+                self.creation_seconds += time.perf_counter() - started
+                self.clients_created += 1
+            return self._clients[key]
+
+    @asynccontextmanager
+    async def client(
+        self,
+        service: str,
+        region_name: str | None = None,
+        endpoint_url: str | None = None,
+        config: Config | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Drop-in replacement for `aioboto3.Session.client` returning a pooled client.
+
+        Args:
+            service: AWS service name
+            region_name: AWS region name
+            endpoint_url: Optional explicit endpoint URL
+            config: Ignored; every pooled client uses the pool configuration
+
+        Yields:
+            Pooled aioboto3 client (not closed when the block exits)
+        """
+        yield await self.get_client(service, region_name, endpoint_url)
+
+    async def close(self) -> None:
+        """Close every pooled client and its connections."""
+        if self._clients:
+            logger.info(
+                f"Closing AWS client pool: {self.clients_created} clients, "
+                f"{self.creation_seconds:.2f}s spent creating them"
+            )
+        self._clients.clear()
+        self._locks.clear()
+        await self._exit_stack.aclose()
+        self._exit_stack = AsyncExitStack()
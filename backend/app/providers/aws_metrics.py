@@ -0,0 +1,394 @@
+"""Batched CloudWatch metric collection using GetMetricData."""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from app.providers.incremental import record_scenario_error
+
+logger = logging.getLogger(__name__)
+
+# GetMetricData accepts at most 500 metric queries per request
+MAX_QUERIES_PER_REQUEST = 500
+
+# Identity of a metric series in the scan cache: (namespace, metric, dimensions, period, statistic)
+SeriesKey = tuple[str, str, tuple[tuple[str, str], ...], int, str]
+
+
+@dataclass(frozen=True)
+class MetricQuery:
+    """
+    One CloudWatch metric series to fetch.
+
+    Attributes:
+        namespace: CloudWatch namespace (e.g., 'AWS/EBS')
+        metric_name: Metric name (e.g., 'VolumeReadOps')
+        dimensions: (name, value) pairs identifying the resource
+        statistic: Statistic (Average, Sum, Maximum, Minimum, SampleCount)
+        period: Aggregation period in seconds
+        start_time: Start of the window
+        end_time: End of the window
+    """
+
+    namespace: str
+    metric_name: str
+    dimensions: tuple[tuple[str, str], ...]
+    statistic: str
+    period: int
+    start_time: datetime
+    end_time: datetime
+
+    @classmethod
+    def create(
+        cls,
+        namespace: str,
+        metric_name: str,
+        dimensions: dict[str, str] | list[dict[str, str]],
+        statistic: str,
+        start_time: datetime,
+        end_time: datetime,
+        period: int = 86400,
+    ) -> "MetricQuery":
+        """
+        Build a query from boto3-style or dict dimensions.
+
+        Args:
+            namespace: CloudWatch namespace
+            metric_name: Metric name
+            dimensions: {'VolumeId': 'vol-123'} or [{'Name': 'VolumeId', 'Value': 'vol-123'}]
+            statistic: Statistic to retrieve
+            start_time: Start of the window
+            end_time: End of the window
+            period: Aggregation period in seconds (default: 1 day)
+
+        Returns:
+            MetricQuery instance
+        """
+        if isinstance(dimensions, dict):
+            pairs = tuple(sorted(dimensions.items()))
+        else:
+            pairs = tuple(sorted((d["Name"], d["Value"]) for d in dimensions))
+        return cls(namespace, metric_name, pairs, statistic, period, start_time, end_time)
+
+    @property
+    def series_key(self) -> SeriesKey:
+        """Cache key of the series, independent of the time window."""
+        return (self.namespace, self.metric_name, self.dimensions, self.period, self.statistic)
+
+    def to_metric_stat(self) -> dict[str, Any]:
+        """Build the MetricStat structure of a GetMetricData query."""
+        return {
+            "Metric": {
+                "Namespace": self.namespace,
+                "MetricName": self.metric_name,
+                "Dimensions": [{"Name": name, "Value": value} for name, value in self.dimensions],
+            },
+            "Period": self.period,
+            "Stat": self.statistic,
+        }
+
+
+def _window_contains(outer: Any, query: MetricQuery) -> bool:
+    """Whether outer's [start_time, end_time] contains the query's window."""
+    return outer.start_time <= query.start_time and query.end_time <= outer.end_time
+
+
+@dataclass
+class CachedSeries:
+    """A fetched metric series and the window it covers."""
+
+    start_time: datetime
+    end_time: datetime
+    datapoints: list[dict[str, Any]]
+
+    def covers(self, query: MetricQuery) -> bool:
+        """Whether the cached window contains the query's window."""
+        return _window_contains(self, query)
+
+    def slice(self, query: MetricQuery) -> list[dict[str, Any]]:
+        """Return the datapoints within the query's window."""
+        return [
+            dp for dp in self.datapoints
+            if query.start_time <= dp["Timestamp"] <= query.end_time
+        ]
+
+
+class CloudWatchMetricCollector:
+    """
+    Collect CloudWatch metric series for one region through GetMetricData.
+
+    Instead of one get_metric_statistics round-trip per metric and resource,
+    queries are sent in batches of up to 500 per GetMetricData request:
+    - fetch(queries): batch an explicit list of queries (e.g., every volume a
+      scenario is about to evaluate) in as few requests as possible
+    - get(query): single lookup; concurrent lookups issued within a short
+      window are coalesced into the same batch
+
+    Series are returned in get_metric_statistics datapoint format
+    ({'Timestamp': ..., '<Statistic>': value}) so existing aggregation code is
+    unchanged.
+
+    Fetched series are cached for the collector's lifetime (one scan), keyed by
+    (namespace, metric, dimensions, period, statistic). A lookback narrower
+    than an already fetched window is served by slicing the cached series, and
+    a series being fetched is awaited rather than requested again, so
+    overlapping scenarios never refetch the same data. Hits and misses are
+    counted for observability.
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        region: str,
+        config: Any | None = None,
+        end_time: datetime | None = None,
+        max_concurrent_requests: int = 4,
+        batch_window_seconds: float = 0.02,
+    ) -> None:
+        """
+        Initialize collector.
+
+        Args:
+            session: aioboto3 session or AWSClientPool
+            region: AWS region name
+            config: Optional botocore Config for the CloudWatch client
+            end_time: Reference 'now' for lookback windows (default: current time)
+            max_concurrent_requests: GetMetricData requests in flight at once
+            batch_window_seconds: How long get() waits for more lookups before sending a batch
+        """
+        self.session = session
+        self.region = region
+        self.config = config
+        self.end_time = end_time or datetime.now(timezone.utc)
+        self.batch_window_seconds = batch_window_seconds
+        self.api_calls = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        self._series: dict[SeriesKey, CachedSeries] = {}
+        self._inflight: dict[SeriesKey, tuple[MetricQuery, asyncio.Future]] = {}
+        self._request_slots = asyncio.Semaphore(max(1, max_concurrent_requests))
+        self._pending: dict[MetricQuery, asyncio.Future] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    def window(self, lookback_days: int) -> tuple[datetime, datetime]:
+        """
+        Return the (start, end) window for a lookback relative to end_time.
+
+        Using the collector's fixed end_time keeps identical lookbacks mapped
+        to identical queries across scenarios.
+        """
+        return self.end_time - timedelta(days=lookback_days), self.end_time
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return cache and request counters.
+
+        Returns:
+            Dict with cache_hits, cache_misses, hit_rate and api_calls
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": round(self.cache_hits / lookups, 3) if lookups else 0.0,
+            "api_calls": self.api_calls,
+        }
+
+    def _lookup(self, query: MetricQuery) -> list[dict[str, Any]] | None:
+        """Serve a query from the cache, or None if its window is not cached."""
+        cached = self._series.get(query.series_key)
+        if cached is not None and cached.covers(query):
+            return cached.slice(query)
+        return None
+
+    async def fetch(self, queries: list[MetricQuery]) -> dict[MetricQuery, list[dict[str, Any]]]:
+        """
+        Fetch series for many queries in batched GetMetricData requests.
+
+        Queries served by the cache (or by a request already in flight) do not
+        trigger a new request. Missing series are fetched over the union of the
+        requested and previously cached windows, so the cache only grows wider.
+
+        Args:
+            queries: Queries to fetch
+
+        Returns:
+            Datapoints keyed by query
+        """
+        to_fetch: dict[SeriesKey, MetricQuery] = {}
+        waiting: list[asyncio.Future] = []
+
+        for query in dict.fromkeys(queries):
+            key = query.series_key
+            if self._lookup(query) is not None:
+                self.cache_hits += 1
+                continue
+
+            inflight = self._inflight.get(key)
+            if inflight is not None and _window_contains(inflight[0], query):
+                self.cache_hits += 1
+                waiting.append(inflight[1])
+                continue
+
+            self.cache_misses += 1
+            # Fetch the union of every window requested or cached for this series
+            start_time, end_time = query.start_time, query.end_time
+            for known in (to_fetch.get(key), self._series.get(key)):
+                if known is not None:
+                    start_time = min(start_time, known.start_time)
+                    end_time = max(end_time, known.end_time)
+            to_fetch[key] = MetricQuery(
+                query.namespace, query.metric_name, query.dimensions,
+                query.statistic, query.period, start_time, end_time,
+            )
+
+        if to_fetch:
+            loop = asyncio.get_running_loop()
+            futures = {}
+            for key, query in to_fetch.items():
+                futures[key] = loop.create_future()
+                self._inflight[key] = (query, futures[key])
+
+            # Group queries with similar windows so each request spans as little time as possible
+            missing = sorted(to_fetch.values(), key=lambda q: (q.start_time, q.end_time))
+            batches = [
+                missing[i:i + MAX_QUERIES_PER_REQUEST]
+                for i in range(0, len(missing), MAX_QUERIES_PER_REQUEST)
+            ]
+            try:
+                await asyncio.gather(*(self._fetch_batch(batch) for batch in batches))
+            except Exception as e:
+                for future in futures.values():
+                    if not future.done():
+                        future.set_exception(e)
+                        # Mark retrieved: waiters (if any) re-raise it themselves
+                        future.exception()
+                # Callers skip the resource: its scenario's findings are incomplete
+                record_scenario_error(e)
+                raise
+            else:
+                for future in futures.values():
+                    future.set_result(None)
+            finally:
+                for key, future in futures.items():
+                    if self._inflight.get(key, (None, None))[1] is future:
+                        del self._inflight[key]
+
+        if waiting:
+            try:
+                await asyncio.gather(*(asyncio.shield(f) for f in waiting))
+            except Exception as e:
+                record_scenario_error(e)
+                raise
+
+        return {q: self._lookup(q) or [] for q in queries}
+
+    async def get(self, query: MetricQuery) -> list[dict[str, Any]]:
+        """
+        Fetch a single series, coalescing concurrent lookups into batches.
+
+        Args:
+            query: Query to fetch
+
+        Returns:
+            Datapoints for the query
+        """
+        cached = self._lookup(query)
+        if cached is not None:
+            self.cache_hits += 1
+            return cached
+
+        future = self._pending.get(query)
+        if future is not None:
+            self.cache_hits += 1
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[query] = future
+            if len(self._pending) >= MAX_QUERIES_PER_REQUEST:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.batch_window_seconds, self._flush)
+
+        try:
+            return await asyncio.shield(future)
+        except Exception as e:
+            record_scenario_error(e)
+            raise
+
+    def _flush(self) -> None:
+        """Send all pending get() lookups as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        async def run() -> None:
+            try:
+                results = await self.fetch(list(pending))
+            except Exception as e:
+                for future in pending.values():
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for query, future in pending.items():
+                if not future.done():
+                    future.set_result(results[query])
+
+        task = asyncio.get_running_loop().create_task(run())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _fetch_batch(self, batch: list[MetricQuery]) -> None:
+        """Run one GetMetricData request (all pages) for up to 500 queries."""
+        start_time = min(q.start_time for q in batch)
+        end_time = max(q.end_time for q in batch)
+        by_id = {f"q{i}": query for i, query in enumerate(batch)}
+        datapoints: dict[str, list[dict[str, Any]]] = {query_id: [] for query_id in by_id}
+
+        async with self._request_slots:
+            async with self.session.client(
+                "cloudwatch", region_name=self.region, config=self.config
+            ) as cw:
+                params: dict[str, Any] = {
+                    "MetricDataQueries": [
+                        {"Id": query_id, "MetricStat": query.to_metric_stat(), "ReturnData": True}
+                        for query_id, query in by_id.items()
+                    ],
+                    "StartTime": start_time,
+                    "EndTime": end_time,
+                    "ScanBy": "TimestampAscending",
+                }
+                while True:
+                    response = await cw.get_metric_data(**params)
+                    self.api_calls += 1
+                    for result in response.get("MetricDataResults", []):
+                        query = by_id.get(result["Id"])
+                        if query is None:
+                            continue
+                        for timestamp, value in zip(result.get("Timestamps", []), result.get("Values", [])):
+                            # The request spans the widest window of the batch: keep each series' own window
+                            if query.start_time <= timestamp <= query.end_time:
+                                datapoints[result["Id"]].append(
+                                    {"Timestamp": timestamp, query.statistic: value}
+                                )
+                    next_token = response.get("NextToken")
+                    if not next_token:
+                        break
+                    params["NextToken"] = next_token
+
+        for query_id, query in by_id.items():
+            self._series[query.series_key] = CachedSeries(
+                query.start_time, query.end_time, datapoints[query_id]
+            )
+
+        logger.debug(
+            f"CloudWatch GetMetricData in {self.region}: {len(batch)} queries, "
+            f"{self.api_calls} requests so far"
+        )
@@ -0,0 +1,253 @@
+"""Region-scoped EC2 resource snapshot shared by AWS scan scenarios."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class EC2RegionSnapshot:
+    """
+    Paginated, indexed view of one region's EC2 inventory for a single scan.
+
+    Most AWS scenarios start by listing the same volumes, instances, snapshots
+    or Elastic IPs. The snapshot runs each describe call once per region
+    (all pages, on first use) and serves every scenario from in-memory indexes,
+    applying the scenario's filters locally. Responses keep the shape of the
+    corresponding EC2 API response so scenarios read them as before.
+
+    Concurrent callers of the same describe call share a single load.
+    """
+
+    def __init__(self, session: Any, region: str, config: Any | None = None) -> None:
+        """
+        Initialize snapshot (nothing is fetched until first use).
+
+        Args:
+            session: aioboto3 session or AWSClientPool
+            region: AWS region name
+            config: Optional botocore Config for the EC2 client
+        """
+        self.session = session
+        self.region = region
+        self.config = config
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._items: dict[str, list[dict[str, Any]]] = {}
+        self.api_calls = 0
+
+        # Indexes, built when the corresponding describe call is loaded
+        self.volumes_by_id: dict[str, dict[str, Any]] = {}
+        self.volumes_by_instance: dict[str, list[dict[str, Any]]] = {}
+        self.instances_by_id: dict[str, dict[str, Any]] = {}
+        self.reservation_by_instance: dict[str, dict[str, Any]] = {}
+        self.snapshots_by_id: dict[str, dict[str, Any]] = {}
+        self.snapshots_by_volume: dict[str, list[dict[str, Any]]] = {}
+        self.addresses_by_instance: dict[str, list[dict[str, Any]]] = {}
+
+    async def _load(self, operation: str, result_key: str, **params: Any) -> list[dict[str, Any]]:
+        """
+        Fetch all pages of a describe call once and cache the items.
+
+        Args:
+            operation: EC2 operation name (e.g., 'describe_volumes')
+            result_key: Key holding the items in each page (e.g., 'Volumes')
+            **params: Extra request parameters
+
+        Returns:
+            All items across pages
+        """
+        if operation in self._items:
+            return self._items[operation]
+
+        lock = self._locks.setdefault(operation, asyncio.Lock())
+        async with lock:
+            if operation in self._items:
+                return self._items[operation]
+
+            items: list[dict[str, Any]] = []
+            async with self.session.client("ec2", region_name=self.region, config=self.config) as ec2:
+                if ec2.can_paginate(operation):
+                    paginator = ec2.get_paginator(operation)
+                    async for page in paginator.paginate(**params):
+                        self.api_calls += 1
+                        items.extend(page.get(result_key, []))
+                else:
+                    response = await getattr(ec2, operation)(**params)
+                    self.api_calls += 1
+                    items.extend(response.get(result_key, []))
+
+            self._index(operation, items)
+            self._items[operation] = items
+            logger.debug(
+                f"EC2 snapshot loaded {operation} in {self.region}: "
+                f"{len(items)} items, {self.api_calls} API calls so far"
+            )
+            return items
+
+    def _index(self, operation: str, items: list[dict[str, Any]]) -> None:
+        """Build lookup maps for a freshly loaded describe call."""
+        if operation == "describe_volumes":
+            for volume in items:
+                self.volumes_by_id[volume["VolumeId"]] = volume
+                for attachment in volume.get("Attachments", []):
+                    if attachment.get("InstanceId"):
+                        self.volumes_by_instance.setdefault(attachment["InstanceId"], []).append(volume)
+        elif operation == "describe_instances":
+            for reservation in items:
+                for instance in reservation.get("Instances", []):
+                    self.instances_by_id[instance["InstanceId"]] = instance
+                    self.reservation_by_instance[instance["InstanceId"]] = reservation
+        elif operation == "describe_snapshots":
+            for snapshot in items:
+                self.snapshots_by_id[snapshot["SnapshotId"]] = snapshot
+                if snapshot.get("VolumeId"):
+                    self.snapshots_by_volume.setdefault(snapshot["VolumeId"], []).append(snapshot)
+        elif operation == "describe_addresses":
+            for address in items:
+                if address.get("InstanceId"):
+                    self.addresses_by_instance.setdefault(address["InstanceId"], []).append(address)
+
+    async def describe_volumes(
+        self,
+        volume_types: list[str] | None = None,
+        volume_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Return volumes, optionally filtered (replaces ec2.describe_volumes).
+
+        Args:
+            volume_types: Only volumes of these types (e.g., ['gp2'])
+            volume_ids: Only these volume IDs
+
+        Returns:
+            Dict with a 'Volumes' list, like the EC2 API response
+        """
+        volumes = await self._load("describe_volumes", "Volumes")
+        if volume_ids is not None:
+            volumes = [self.volumes_by_id[v] for v in volume_ids if v in self.volumes_by_id]
+        if volume_types is not None:
+            volumes = [v for v in volumes if v.get("VolumeType") in volume_types]
+        return {"Volumes": volumes}
+
+    async def describe_instances(
+        self,
+        states: list[str] | None = None,
+        image_ids: list[str] | None = None,
+        tags: dict[str, list[str]] | None = None,
+        on_demand_only: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Return reservations with instances matching the filters (replaces ec2.describe_instances).
+
+        Args:
+            states: Only instances in these states (e.g., ['running'])
+            image_ids: Only instances launched from these AMIs
+            tags: Only instances having each tag key with one of the given values
+            on_demand_only: Exclude Spot and Scheduled instances
+
+        Returns:
+            Dict with a 'Reservations' list, like the EC2 API response
+        """
+        reservations = await self._load("describe_instances", "Reservations")
+        if states is None and image_ids is None and tags is None and not on_demand_only:
+            return {"Reservations": reservations}
+
+        def matches(instance: dict[str, Any]) -> bool:
+            if states is not None and instance.get("State", {}).get("Name") not in states:
+                return False
+            if image_ids is not None and instance.get("ImageId") not in image_ids:
+                return False
+            if on_demand_only and instance.get("InstanceLifecycle"):
+                return False
+            if tags:
+                instance_tags = {t["Key"]: t.get("Value") for t in instance.get("Tags", [])}
+                for key, values in tags.items():
+                    if instance_tags.get(key) not in values:
+                        return False
+            return True
+
+        filtered = []
+        for reservation in reservations:
+            instances = [i for i in reservation.get("Instances", []) if matches(i)]
+            if instances:
+                filtered.append({**reservation, "Instances": instances})
+        return {"Reservations": filtered}
+
+    async def describe_snapshots(self) -> dict[str, Any]:
+        """
+        Return all EBS snapshots owned by the account (replaces ec2.describe_snapshots(OwnerIds=[...])).
+
+        Returns:
+            Dict with a 'Snapshots' list, like the EC2 API response
+        """
+        snapshots = await self._load("describe_snapshots", "Snapshots", OwnerIds=["self"])
+        return {"Snapshots": snapshots}
+
+    async def describe_addresses(self) -> dict[str, Any]:
+        """
+        Return all Elastic IPs (replaces ec2.describe_addresses).
+
+        Returns:
+            Dict with an 'Addresses' list, like the EC2 API response
+        """
+        addresses = await self._load("describe_addresses", "Addresses")
+        return {"Addresses": addresses}
+
+    async def change_markers(self, resource_type: str) -> dict[str, str] | None:
+        """
+        Return a change marker per resource, for incremental scans.
+
+        Markers are built from the cached describe responses (no extra API
+        call): state (with the state transition reason and its timestamp for
+        instances), configuration, attachments/associations and tags.
+
+        Args:
+            resource_type: 'ebs_volume', 'ec2_instance' or 'elastic_ip'
+
+        Returns:
+            Dict of resource ID -> marker, or None for other resource types
+        """
+
+        def marker(*parts: Any) -> str:
+            return json.dumps(parts, sort_keys=True, default=str)
+
+        def tags(resource: dict[str, Any]) -> list[tuple[str, Any]]:
+            return sorted((t["Key"], t.get("Value")) for t in resource.get("Tags", []))
+
+        if resource_type == "ebs_volume":
+            volumes = (await self.describe_volumes())["Volumes"]
+            return {
+                v["VolumeId"]: marker(
+                    v.get("State"),
+                    v.get("VolumeType"),
+                    v.get("Size"),
+                    v.get("Iops"),
+                    v.get("Throughput"),
+                    sorted((a.get("InstanceId"), a.get("State")) for a in v.get("Attachments", [])),
+                    tags(v),
+                )
+                for v in volumes
+            }
+        if resource_type == "ec2_instance":
+            await self.describe_instances()
+            return {
+                instance_id: marker(
+                    i.get("State", {}).get("Name"),
+                    i.get("StateTransitionReason"),
+                    i.get("InstanceType"),
+                    i.get("LaunchTime"),
+                    tags(i),
+                )
+                for instance_id, i in self.instances_by_id.items()
+            }
+        if resource_type == "elastic_ip":
+            addresses = (await self.describe_addresses())["Addresses"]
+            return {
+                a.get("AllocationId") or a.get("PublicIp"): marker(
+                    a.get("AssociationId"), a.get("InstanceId"), a.get("NetworkInterfaceId"), tags(a)
+                )
+                for a in addresses
+            }
+        return None
@@ -1,9 +1,15 @@
 """Azure cloud provider implementation (skeleton)."""
 
 from datetime import timedelta
-from typing import Any
+from typing import Any, Awaitable, Callable
 
+from app.core.config import settings
+from app.providers.azure_client_pool import AzureClientPool
+from app.providers.azure_inventory import AzureSubscriptionInventory
 from app.providers.base import CloudProviderBase, OrphanResourceData
+from app.providers.incremental import IncrementalPlan, record_scenario_error
+from app.providers.scenario_engine import Scenario
+from app.services.pricing_service import PriceTable
 
 
 class AzureProvider(CloudProviderBase):
@@ -16,6 +22,31 @@ class AzureProvider(CloudProviderBase):
     Authentication uses Azure Service Principal (tenant_id, client_id, client_secret).
     """
 
+    # Azure Resource Manager throttles reads per subscription, not per
+    # resource provider, so every scenario shares the "arm" limit
+    SCENARIO_SERVICE_LIMITS: dict[str, int] = {"arm": 8}
+
+    # Azure Monitor-based scenarios reusing their last verdict in incremental
+    # scans while these resources are unchanged (ARM changedTime markers)
+    INCREMENTAL_SCENARIO_INPUTS: dict[str, tuple[str, ...]] = {
+        "scan_idle_disks": ("managed_disk",),
+        "scan_unused_bursting": ("managed_disk",),
+        "scan_overprovisioned_disks": ("managed_disk",),
+        "scan_underutilized_hdd_disks": ("managed_disk",),
+        "scan_idle_running_instances": ("virtual_machine",),
+        "scan_underutilized_vms": ("virtual_machine",),
+        "scan_memory_overprovisioned_vms": ("virtual_machine",),
+        "scan_no_traffic_ips": ("public_ip",),
+        "scan_very_low_traffic_ips": ("public_ip",),
+    }
+
+    # ARM resource type of each incremental input
+    CHANGE_MARKER_RESOURCE_TYPES: dict[str, str] = {
+        "managed_disk": "Microsoft.Compute/disks",
+        "virtual_machine": "Microsoft.Compute/virtualMachines",
+        "public_ip": "Microsoft.Network/publicIPAddresses",
+    }
+
     def __init__(
         self,
         tenant_id: str,
@@ -24,6 +55,7 @@ class AzureProvider(CloudProviderBase):
         subscription_id: str,
         regions: list[str] | None = None,
         resource_groups: list[str] | None = None,
+        price_table: PriceTable | None = None,
     ) -> None:
         """
         Initialize Azure provider client.
@@ -36,6 +68,7 @@ class AzureProvider(CloudProviderBase):
             regions: List of Azure regions to scan (e.g., ['eastus', 'westeurope'])
             resource_groups: List of Azure resource groups to scan (e.g., ['rg-prod', 'rg-dev'])
                            If None or empty, all resource groups will be scanned.
+            price_table: Optional price snapshot loaded at scan start (overrides built-in prices)
         """
         # Azure uses different authentication than AWS, so we override the base class params
         self.tenant_id = tenant_id
@@ -45,6 +78,89 @@ class AzureProvider(CloudProviderBase):
         self.regions = regions or []
         self.resource_groups = resource_groups or []
 
+        # Prices snapshotted at scan start: cost calculations are in-memory lookups
+        self.price_table = price_table or PriceTable()
+
+        # One credential, one client per management client class and bounded
+        # worker threads, shared by every scenario of the scan
+        self.client_pool = AzureClientPool(
+            tenant_id, client_id, client_secret, max_workers=settings.AZURE_SCAN_MAX_THREADS
+        )
+
+        # Subscription-wide resource listings, loaded once and partitioned by
+        # location and resource group for every scenario and region
+        self.inventory = AzureSubscriptionInventory(
+            self.client_pool, subscription_id, use_resource_graph=settings.AZURE_USE_RESOURCE_GRAPH
+        )
+
+    @property
+    def credential(self) -> Any:
+        """Shared ClientSecretCredential for this scan."""
+        return self.client_pool.credential
+
+    def _azure_client(self, client_cls: type, *args: Any) -> Any:
+        """
+        Get the shared Azure SDK client for a client class.
+
+        Args:
+            client_cls: Azure SDK client class (e.g., ComputeManagementClient)
+            *args: Arguments following the credential (usually the subscription ID)
+
+        Returns:
+            Pooled client instance
+        """
+        return self.client_pool.get_client(client_cls, *args)
+
+    async def _run_blocking(self, method: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Run a scan method built on the synchronous Azure SDK on a worker thread.
+
+        Args:
+            method: Coroutine method making blocking SDK calls
+            *args: Arguments passed to the method
+
+        Returns:
+            The method's result
+        """
+        return await self.client_pool.run(method, *args)
+
+    async def close(self) -> None:
+        """Stop worker threads and close pooled Azure clients."""
+        self.client_pool.close()
+
+    async def resource_change_markers(
+        self, region: str, resource_types: list[str]
+    ) -> dict[str, dict[str, str]]:
+        """
+        Collect the ARM changedTime of disks, VMs and public IPs in a region.
+
+        Power state changes of a VM do not update its changedTime: verdicts
+        depending on them are refreshed when they reach
+        SCAN_INCREMENTAL_MAX_AGE_HOURS.
+
+        Args:
+            region: Azure region
+            resource_types: Resource types to collect markers for
+
+        Returns:
+            Resource type -> {resource ID: change marker} (supported types only)
+        """
+
+        async def collect() -> dict[str, dict[str, str]]:
+            markers = {}
+            for resource_type in resource_types:
+                arm_type = self.CHANGE_MARKER_RESOURCE_TYPES.get(resource_type)
+                if arm_type is None:
+                    continue
+                markers[resource_type] = {
+                    resource_id: marker
+                    for resource_id, marker in self.inventory.changed_times(arm_type, region).items()
+                    if self._is_resource_in_scope(resource_id)
+                }
+            return markers
+
+        return await self._run_blocking(collect)
+
     def _is_resource_in_scope(self, resource_id: str) -> bool:
         """
         Check if a resource is in scope based on resource_groups filter.
@@ -133,8 +249,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan disk resources with accurate cost estimates
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -142,17 +256,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            # Initialize Azure clients
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks in the subscription
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region (Azure uses 'location')
@@ -263,7 +368,12 @@ class AzureProvider(CloudProviderBase):
             'UltraSSD_LRS': 0.30,       # Ultra SSD (base only, IOPS/throughput extra)
         }
 
-        base_cost_per_gb = cost_per_gb.get(sku_name, 0.10)  # Default to Standard SSD if unknown
+        base_cost_per_gb = self.price_table.get(
+            "azure",
+            sku_name,
+            getattr(disk, "location", ""),
+            default=cost_per_gb.get(sku_name, 0.10),  # Default to Standard SSD if unknown
+        )
         base_cost = disk_size_gb * base_cost_per_gb
 
         # Add encryption cost if enabled (roughly +5-10%)
@@ -323,7 +433,12 @@ class AzureProvider(CloudProviderBase):
             'Standard': 3.00,   # Standard Static IP (zonal)
         }
 
-        base_cost = base_costs.get(sku_name, 3.00)
+        base_cost = self.price_table.get(
+            "azure",
+            f"public_ip_{sku_name.lower()}",
+            getattr(public_ip, "location", ""),
+            default=base_costs.get(sku_name, 3.00),
+        )
 
         # Add zone redundancy premium for Standard SKU with multiple zones
         if sku_name == 'Standard' and public_ip.zones and len(public_ip.zones) >= 3:
@@ -500,16 +615,9 @@ class AzureProvider(CloudProviderBase):
             Kubeconfig dict or None if failed
         """
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.containerservice import ContainerServiceClient
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            aks_client = ContainerServiceClient(credential, self.subscription_id)
+            aks_client = self._azure_client(ContainerServiceClient, self.subscription_id)
 
             # Get admin credentials (cluster admin access)
             creds_result = aks_client.managed_clusters.list_cluster_admin_credentials(
@@ -564,15 +672,8 @@ class AzureProvider(CloudProviderBase):
         try:
             from datetime import datetime, timedelta, timezone
             from azure.monitor.query import MetricsQueryClient, MetricAggregationType
-            from azure.identity import ClientSecretCredential
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # Calculate timespan
             end_time = datetime.now(timezone.utc)
@@ -697,669 +798,369 @@ class AzureProvider(CloudProviderBase):
         return []
 
     async def scan_all_resources(
-        self, region: str, detection_rules: dict[str, dict] | None = None, scan_global_resources: bool = False
+        self,
+        region: str,
+        detection_rules: dict[str, dict] | None = None,
+        scan_global_resources: bool = False,
+        incremental: IncrementalPlan | None = None,
     ) -> list[OrphanResourceData]:
         """
         Scan all Azure resource types in a specific region.
 
         Override from base class to use Azure-specific resource type names.
+        Scenarios run concurrently through the scenario engine; the Azure SDK
+        is synchronous, so each scenario executes in the provider's bounded
+        thread pool with the shared credential and management clients.
 
         Args:
             region: Azure region to scan
             detection_rules: Optional user-defined detection rules per resource type
             scan_global_resources: If True, also scan global resources (e.g., Storage Accounts).
                                    Should only be True for the first region in a multi-region scan.
+            incremental: Optional plan reusing the verdicts of metric-based scenarios
+                         whose input resources are unchanged (incremental scans)
 
         Returns:
             Combined list of all orphan resources found
         """
-        results: list[OrphanResourceData] = []
         rules = detection_rules or {}
 
-        # Scan Azure Managed Disks (equivalent to AWS EBS Volumes)
-        volume_orphans = await self.scan_unattached_volumes(region, rules.get("managed_disk_unattached"))
-        results.extend(volume_orphans)
-
-        # Scan Azure Public IPs (equivalent to AWS Elastic IPs)
-        ip_orphans = await self.scan_unassigned_ips(region, rules.get("public_ip_unassociated"))
-        results.extend(ip_orphans)
-
-        # Phase 1 - Quick Wins: Additional waste detection scenarios
-        # Scan Managed Disks attached to stopped VMs
-        disks_on_stopped_vms = await self.scan_disks_on_stopped_vms(region, rules.get("managed_disk_on_stopped_vm"))
-        results.extend(disks_on_stopped_vms)
-
-        # Scan orphaned Disk Snapshots (source disk deleted)
-        orphaned_snapshots = await self.scan_orphaned_snapshots(region, rules.get("disk_snapshot_orphaned"))
-        results.extend(orphaned_snapshots)
-
-        # Scan redundant Disk Snapshots (multiple snapshots for same source disk)
-        redundant_snapshots = await self.scan_redundant_snapshots(region, rules.get("disk_snapshot_redundant"))
-        results.extend(redundant_snapshots)
-
-        # Additional Disk Snapshot waste scenarios (100% coverage)
-        very_old_snapshots = await self.scan_disk_snapshot_very_old(region, rules.get("disk_snapshot_very_old"))
-        results.extend(very_old_snapshots)
-
-        premium_source_snapshots = await self.scan_disk_snapshot_premium_source(region, rules.get("disk_snapshot_premium_source"))
-        results.extend(premium_source_snapshots)
-
-        large_unused_snapshots = await self.scan_disk_snapshot_large_unused(region, rules.get("disk_snapshot_large_unused"))
-        results.extend(large_unused_snapshots)
-
-        full_vs_incremental = await self.scan_disk_snapshot_full_instead_incremental(region, rules.get("disk_snapshot_full_instead_incremental"))
-        results.extend(full_vs_incremental)
-
-        excessive_retention = await self.scan_disk_snapshot_excessive_retention(region, rules.get("disk_snapshot_excessive_retention"))
-        results.extend(excessive_retention)
-
-        manual_without_policy = await self.scan_disk_snapshot_manual_without_policy(region, rules.get("disk_snapshot_manual_without_policy"))
-        results.extend(manual_without_policy)
-
-        never_restored = await self.scan_disk_snapshot_never_restored(region, rules.get("disk_snapshot_never_restored"))
-        results.extend(never_restored)
-
-        frequent_creation = await self.scan_disk_snapshot_frequent_creation(region, rules.get("disk_snapshot_frequent_creation"))
-        results.extend(frequent_creation)
-
-        # Scan disks with unnecessary Zone-Redundant Storage (ZRS) in dev/test
-        unnecessary_zrs = await self.scan_unnecessary_zrs_disks(region, rules.get("managed_disk_unnecessary_zrs"))
-        results.extend(unnecessary_zrs)
-
-        # Scan disks with unnecessary Customer-Managed Key encryption
-        unnecessary_cmk = await self.scan_unnecessary_cmk_encryption(region, rules.get("managed_disk_unnecessary_cmk"))
-        results.extend(unnecessary_cmk)
-
-        # Scan Public IPs associated to stopped resources (VMs, LBs)
-        ips_on_stopped = await self.scan_ips_on_stopped_resources(region, rules.get("public_ip_on_stopped_resource"))
-        results.extend(ips_on_stopped)
-
-        # Phase B - Additional Public IP waste detection scenarios (100% coverage)
-        # Scenario 3: Dynamic Public IPs stuck in provisioned state (anomaly)
-        dynamic_unassociated = await self.scan_dynamic_unassociated_ips(region, rules.get("public_ip_dynamic_unassociated"))
-        results.extend(dynamic_unassociated)
-
-        # Scenario 4: Standard SKU used in dev/test (Basic would suffice)
-        unnecessary_standard = await self.scan_unnecessary_standard_sku_ips(region, rules.get("public_ip_unnecessary_standard_sku"))
-        results.extend(unnecessary_standard)
-
-        # Scenario 5: Zone-redundant IPs without high-availability requirements
-        unnecessary_zone_redundancy = await self.scan_unnecessary_zone_redundant_ips(region, rules.get("public_ip_unnecessary_zone_redundancy"))
-        results.extend(unnecessary_zone_redundancy)
-
-        # Scenario 6: DDoS Protection Standard that has never been triggered (HIGH VALUE)
-        ddos_unused = await self.scan_ddos_protection_unused_ips(region, rules.get("public_ip_ddos_protection_unused"))
-        results.extend(ddos_unused)
-
-        # Scenario 7: Public IPs attached to orphaned NICs (NIC without VM)
-        ips_on_nic_without_vm = await self.scan_ips_on_nic_without_vm(region, rules.get("public_ip_on_nic_without_vm"))
-        results.extend(ips_on_nic_without_vm)
-
-        # Scenario 8: Reserved Public IPs that have never been assigned an IP address
-        reserved_unused = await self.scan_reserved_unused_ips(region, rules.get("public_ip_reserved_but_unused"))
-        results.extend(reserved_unused)
-
-        # Phase C - Azure Monitor Metrics-based Public IP scenarios
-        # Scenario 9: Public IPs with zero network traffic (never used)
-        no_traffic = await self.scan_no_traffic_ips(region, rules.get("public_ip_no_traffic"))
-        results.extend(no_traffic)
-
-        # Scenario 10: Public IPs with very low traffic (under-utilized)
-        very_low_traffic = await self.scan_very_low_traffic_ips(region, rules.get("public_ip_very_low_traffic"))
-        results.extend(very_low_traffic)
-
-        # Phase A - Virtual Machine waste detection scenarios (simple detection)
-        # Scenario 1: VMs deallocated (stopped) for extended periods
-        deallocated_vms = await self.scan_stopped_instances(region, rules.get("virtual_machine_deallocated"))
-        results.extend(deallocated_vms)
-
-        # Scenario 2: VMs stopped but NOT deallocated (CRITICAL - still paying full price!)
-        stopped_not_deallocated = await self.scan_stopped_not_deallocated_vms(region, rules.get("virtual_machine_stopped_not_deallocated"))
-        results.extend(stopped_not_deallocated)
-
-        # Scenario 3: VMs created but never started
-        never_started = await self.scan_never_started_vms(region, rules.get("virtual_machine_never_started"))
-        results.extend(never_started)
-
-        # Scenario 4: VMs oversized with premium disks
-        oversized_premium = await self.scan_oversized_premium_vms(region, rules.get("virtual_machine_oversized_premium"))
-        results.extend(oversized_premium)
-
-        # Scenario 5: VMs missing required governance tags (orphaned)
-        untagged_orphans = await self.scan_untagged_orphan_vms(region, rules.get("virtual_machine_untagged_orphan"))
-        results.extend(untagged_orphans)
-
-        # Scenario 6: VMs using old generation SKUs (v1/v2/v3 → v4/v5)
-        old_generation = await self.scan_old_generation_vms(region, rules.get("virtual_machine_old_generation"))
-        results.extend(old_generation)
-
-        # Scenario 7: VMs that could use Spot pricing (60-90% savings)
-        spot_convertible = await self.scan_spot_convertible_vms(region, rules.get("virtual_machine_spot_convertible"))
-        results.extend(spot_convertible)
-
-        # Phase 2 - Azure Monitor Metrics-based Advanced Scenarios (requires "Monitoring Reader" permission)
-        # Disk scenarios
-        # Scenario 6: Idle disks (zero I/O activity)
-        idle_disks = await self.scan_idle_disks(region, rules.get("managed_disk_idle"))
-        results.extend(idle_disks)
-
-        # Scenario 7: Unused disk bursting (bursting enabled but never used)
-        unused_bursting = await self.scan_unused_bursting(region, rules.get("managed_disk_unused_bursting"))
-        results.extend(unused_bursting)
-
-        # Scenario 8: Over-provisioned Premium disks (performance tier too high)
-        overprovisioned_disks = await self.scan_overprovisioned_disks(region, rules.get("managed_disk_overprovisioned"))
-        results.extend(overprovisioned_disks)
-
-        # Scenario 9: Under-utilized Standard HDD disks (should be SSD)
-        underutilized_hdd = await self.scan_underutilized_hdd_disks(region, rules.get("managed_disk_underutilized_hdd"))
-        results.extend(underutilized_hdd)
-
-        # Phase 2 - VM Azure Monitor Metrics-based Scenarios
-        # Scenario 8: Idle running VMs (low CPU utilization)
-        idle_vms = await self.scan_idle_running_instances(region, rules.get("virtual_machine_idle"))
-        results.extend(idle_vms)
-
-        # Scenario 9: Underutilized VMs (rightsizing - CPU-based)
-        underutilized_vms = await self.scan_underutilized_vms(region, rules.get("virtual_machine_underutilized"))
-        results.extend(underutilized_vms)
-
-        # Scenario 10: Memory-overprovisioned VMs (E-series with low memory usage)
-        memory_overprovisioned = await self.scan_memory_overprovisioned_vms(region, rules.get("virtual_machine_memory_overprovisioned"))
-        results.extend(memory_overprovisioned)
-
-        # ===== Azure NAT Gateway Waste Detection (10 Scenarios) =====
-
-        # Scenario 1: NAT Gateway without subnet attached
-        nat_gw_no_subnet = await self.scan_nat_gateway_no_subnet(region, rules.get("nat_gateway_no_subnet"))
-        results.extend(nat_gw_no_subnet)
-
-        # Scenario 2: NAT Gateway never used (has subnets but no VMs)
-        nat_gw_never_used = await self.scan_nat_gateway_never_used(region, rules.get("nat_gateway_never_used"))
-        results.extend(nat_gw_never_used)
-
-        # Scenario 3: NAT Gateway without Public IP
-        nat_gw_no_public_ip = await self.scan_nat_gateway_no_public_ip(region, rules.get("nat_gateway_no_public_ip"))
-        results.extend(nat_gw_no_public_ip)
-
-        # Scenario 4: NAT Gateway used by single VM
-        nat_gw_single_vm = await self.scan_nat_gateway_single_vm(region, rules.get("nat_gateway_single_vm"))
-        results.extend(nat_gw_single_vm)
-
-        # Scenario 5: Redundant NAT Gateway in same VNet
-        nat_gw_redundant = await self.scan_nat_gateway_redundant(region, rules.get("nat_gateway_redundant"))
-        results.extend(nat_gw_redundant)
-
-        # Scenario 6: Dev/Test NAT Gateway always on
-        nat_gw_dev_test = await self.scan_nat_gateway_dev_test_always_on(region, rules.get("nat_gateway_dev_test_always_on"))
-        results.extend(nat_gw_dev_test)
-
-        # Scenario 7: NAT Gateway with unnecessary multi-zone configuration
-        nat_gw_unnecessary_zones = await self.scan_nat_gateway_unnecessary_zones(region, rules.get("nat_gateway_unnecessary_zones"))
-        results.extend(nat_gw_unnecessary_zones)
-
-        # Scenario 8: NAT Gateway with zero traffic (Azure Monitor metrics)
-        nat_gw_no_traffic = await self.scan_nat_gateway_no_traffic(region, rules.get("nat_gateway_no_traffic"))
-        results.extend(nat_gw_no_traffic)
-
-        # Scenario 9: NAT Gateway with very low traffic (<10 GB/month)
-        nat_gw_very_low_traffic = await self.scan_nat_gateway_very_low_traffic(region, rules.get("nat_gateway_very_low_traffic"))
-        results.extend(nat_gw_very_low_traffic)
-
-        # Scenario 10: NAT Gateway where Private Link/Service Endpoints would be better
-        nat_gw_private_link = await self.scan_nat_gateway_private_link_alternative(region, rules.get("nat_gateway_private_link_alternative"))
-        results.extend(nat_gw_private_link)
-
-        # ===== Azure Load Balancer & Application Gateway Waste Detection (10 Scenarios) =====
-
-        # Scenario 1: Load Balancer without backend instances
-        lb_no_backend = await self.scan_load_balancer_no_backend_instances(region, rules.get("load_balancer_no_backend_instances"))
-        results.extend(lb_no_backend)
-
-        # Scenario 2: Load Balancer with all backends unhealthy
-        lb_unhealthy = await self.scan_load_balancer_all_backends_unhealthy(region, rules.get("load_balancer_all_backends_unhealthy"))
-        results.extend(lb_unhealthy)
-
-        # Scenario 3: Load Balancer without load balancing or NAT rules
-        lb_no_rules = await self.scan_load_balancer_no_inbound_rules(region, rules.get("load_balancer_no_inbound_rules"))
-        results.extend(lb_no_rules)
-
-        # Scenario 4: Load Balancer using retired Basic SKU (CRITICAL)
-        lb_basic_retired = await self.scan_load_balancer_basic_sku_retired(region, rules.get("load_balancer_basic_sku_retired"))
-        results.extend(lb_basic_retired)
-
-        # Scenario 5: Application Gateway without backend targets
-        appgw_no_backend = await self.scan_application_gateway_no_backend_targets(region, rules.get("application_gateway_no_backend_targets"))
-        results.extend(appgw_no_backend)
-
-        # Scenario 6: Application Gateway in stopped state
-        appgw_stopped = await self.scan_application_gateway_stopped(region, rules.get("application_gateway_stopped"))
-        results.extend(appgw_stopped)
-
-        # Scenario 7: Load Balancer never used (created but unused)
-        lb_never_used = await self.scan_load_balancer_never_used(region, rules.get("load_balancer_never_used"))
-        results.extend(lb_never_used)
-
-        # Scenario 8: Load Balancer with zero traffic (Azure Monitor metrics)
-        lb_no_traffic = await self.scan_load_balancer_no_traffic(region, rules.get("load_balancer_no_traffic"))
-        results.extend(lb_no_traffic)
-
-        # Scenario 9: Application Gateway with zero HTTP requests (Azure Monitor metrics)
-        appgw_no_requests = await self.scan_application_gateway_no_requests(region, rules.get("application_gateway_no_requests"))
-        results.extend(appgw_no_requests)
-
-        # Scenario 10: Application Gateway underutilized (<5% capacity - Azure Monitor metrics)
-        appgw_underutilized = await self.scan_application_gateway_underutilized(region, rules.get("application_gateway_underutilized"))
-        results.extend(appgw_underutilized)
-
-        # ===== Azure Databases Waste Detection (15 Scenarios) =====
-
-        # Azure SQL Database (4 scenarios)
-        sql_db_stopped = await self.scan_sql_database_stopped(region, rules.get("sql_database_stopped"))
-        results.extend(sql_db_stopped)
-
-        sql_db_idle = await self.scan_sql_database_idle_connections(region, rules.get("sql_database_idle_connections"))
-        results.extend(sql_db_idle)
-
-        sql_db_overprovisioned_dtu = await self.scan_sql_database_over_provisioned_dtu(region, rules.get("sql_database_over_provisioned_dtu"))
-        results.extend(sql_db_overprovisioned_dtu)
-
-        sql_db_serverless = await self.scan_sql_database_serverless_not_pausing(region, rules.get("sql_database_serverless_not_pausing"))
-        results.extend(sql_db_serverless)
-
-        # Azure Cosmos DB (3 scenarios)
-        cosmos_overprovisioned_ru = await self.scan_cosmosdb_over_provisioned_ru(region, rules.get("cosmosdb_over_provisioned_ru"))
-        results.extend(cosmos_overprovisioned_ru)
-
-        cosmos_idle_containers = await self.scan_cosmosdb_idle_containers(region, rules.get("cosmosdb_idle_containers"))
-        results.extend(cosmos_idle_containers)
-
-        cosmos_hot_partitions = await self.scan_cosmosdb_hot_partitions_idle_others(region, rules.get("cosmosdb_hot_partitions_idle_others"))
-        results.extend(cosmos_hot_partitions)
-
-        # Azure Cosmos DB Table API (12 scenarios - 100% coverage)
-        cosmosdb_table_api_orphans = await self.scan_azure_cosmosdb_table_api(region, rules)
-        results.extend(cosmosdb_table_api_orphans)
-
-        # Azure PostgreSQL/MySQL (4 scenarios)
-        pg_mysql_stopped = await self.scan_postgres_mysql_stopped(region, rules.get("postgres_mysql_stopped"))
-        results.extend(pg_mysql_stopped)
-
-        pg_mysql_idle = await self.scan_postgres_mysql_idle_connections(region, rules.get("postgres_mysql_idle_connections"))
-        results.extend(pg_mysql_idle)
-
-        pg_mysql_overprovisioned = await self.scan_postgres_mysql_over_provisioned_vcores(region, rules.get("postgres_mysql_over_provisioned_vcores"))
-        results.extend(pg_mysql_overprovisioned)
-
-        pg_mysql_burstable = await self.scan_postgres_mysql_burstable_always_bursting(region, rules.get("postgres_mysql_burstable_always_bursting"))
-        results.extend(pg_mysql_burstable)
-
-        # Azure Synapse Analytics (2 scenarios)
-        synapse_paused = await self.scan_synapse_sql_pool_paused(region, rules.get("synapse_sql_pool_paused"))
-        results.extend(synapse_paused)
-
-        synapse_idle = await self.scan_synapse_sql_pool_idle_queries(region, rules.get("synapse_sql_pool_idle_queries"))
-        results.extend(synapse_idle)
-
-        # Azure Cache for Redis (2 scenarios)
-        redis_idle = await self.scan_redis_idle_cache(region, rules.get("redis_idle_cache"))
-        results.extend(redis_idle)
-
-        redis_oversized = await self.scan_redis_over_sized_tier(region, rules.get("redis_over_sized_tier"))
-        results.extend(redis_oversized)
+        def scenario(method_name: str, rule_key: str | None = None, regional: bool = True) -> Scenario:
+            method = getattr(self, method_name)
+            method_rules = rules.get(rule_key) if rule_key else rules
+            args = (region, method_rules) if regional else (method_rules,)
+            # Every scenario calls Azure Resource Manager, whose read throttling
+            # applies per subscription: they all share the "arm" service limit
+            return Scenario(
+                name=method_name,
+                service="arm",
+                run=lambda _deps: self._run_blocking(method, *args),
+                rules=method_rules,
+            )
 
-        # ===== Azure AKS Clusters Waste Detection (10 Scenarios) - BONUS =====
-        aks_clusters = await self.scan_idle_eks_clusters(region, rules.get("azure_aks_cluster"))
-        results.extend(aks_clusters)
+        scenarios = [
+            # Scan Azure Managed Disks (equivalent to AWS EBS Volumes)
+            scenario("scan_unattached_volumes", "managed_disk_unattached"),
+            # Scan Azure Public IPs (equivalent to AWS Elastic IPs)
+            scenario("scan_unassigned_ips", "public_ip_unassociated"),
+            # Phase 1 - Quick Wins: Additional waste detection scenarios
+            # Scan Managed Disks attached to stopped VMs
+            scenario("scan_disks_on_stopped_vms", "managed_disk_on_stopped_vm"),
+            # Scan orphaned Disk Snapshots (source disk deleted)
+            scenario("scan_orphaned_snapshots", "disk_snapshot_orphaned"),
+            # Scan redundant Disk Snapshots (multiple snapshots for same source disk)
+            scenario("scan_redundant_snapshots", "disk_snapshot_redundant"),
+            # Additional Disk Snapshot waste scenarios (100% coverage)
+            scenario("scan_disk_snapshot_very_old", "disk_snapshot_very_old"),
+            scenario("scan_disk_snapshot_premium_source", "disk_snapshot_premium_source"),
+            scenario("scan_disk_snapshot_large_unused", "disk_snapshot_large_unused"),
+            scenario("scan_disk_snapshot_full_instead_incremental", "disk_snapshot_full_instead_incremental"),
+            scenario("scan_disk_snapshot_excessive_retention", "disk_snapshot_excessive_retention"),
+            scenario("scan_disk_snapshot_manual_without_policy", "disk_snapshot_manual_without_policy"),
+            scenario("scan_disk_snapshot_never_restored", "disk_snapshot_never_restored"),
+            scenario("scan_disk_snapshot_frequent_creation", "disk_snapshot_frequent_creation"),
+            # Scan disks with unnecessary Zone-Redundant Storage (ZRS) in dev/test
+            scenario("scan_unnecessary_zrs_disks", "managed_disk_unnecessary_zrs"),
+            # Scan disks with unnecessary Customer-Managed Key encryption
+            scenario("scan_unnecessary_cmk_encryption", "managed_disk_unnecessary_cmk"),
+            # Scan Public IPs associated to stopped resources (VMs, LBs)
+            scenario("scan_ips_on_stopped_resources", "public_ip_on_stopped_resource"),
+            # Phase B - Additional Public IP waste detection scenarios (100% coverage)
+            # Scenario 3: Dynamic Public IPs stuck in provisioned state (anomaly)
+            scenario("scan_dynamic_unassociated_ips", "public_ip_dynamic_unassociated"),
+            # Scenario 4: Standard SKU used in dev/test (Basic would suffice)
+            scenario("scan_unnecessary_standard_sku_ips", "public_ip_unnecessary_standard_sku"),
+            # Scenario 5: Zone-redundant IPs without high-availability requirements
+            scenario("scan_unnecessary_zone_redundant_ips", "public_ip_unnecessary_zone_redundancy"),
+            # Scenario 6: DDoS Protection Standard that has never been triggered (HIGH VALUE)
+            scenario("scan_ddos_protection_unused_ips", "public_ip_ddos_protection_unused"),
+            # Scenario 7: Public IPs attached to orphaned NICs (NIC without VM)
+            scenario("scan_ips_on_nic_without_vm", "public_ip_on_nic_without_vm"),
+            # Scenario 8: Reserved Public IPs that have never been assigned an IP address
+            scenario("scan_reserved_unused_ips", "public_ip_reserved_but_unused"),
+            # Phase C - Azure Monitor Metrics-based Public IP scenarios
+            # Scenario 9: Public IPs with zero network traffic (never used)
+            scenario("scan_no_traffic_ips", "public_ip_no_traffic"),
+            # Scenario 10: Public IPs with very low traffic (under-utilized)
+            scenario("scan_very_low_traffic_ips", "public_ip_very_low_traffic"),
+            # Phase A - Virtual Machine waste detection scenarios (simple detection)
+            # Scenario 1: VMs deallocated (stopped) for extended periods
+            scenario("scan_stopped_instances", "virtual_machine_deallocated"),
+            # Scenario 2: VMs stopped but NOT deallocated (CRITICAL - still paying full price!)
+            scenario("scan_stopped_not_deallocated_vms", "virtual_machine_stopped_not_deallocated"),
+            # Scenario 3: VMs created but never started
+            scenario("scan_never_started_vms", "virtual_machine_never_started"),
+            # Scenario 4: VMs oversized with premium disks
+            scenario("scan_oversized_premium_vms", "virtual_machine_oversized_premium"),
+            # Scenario 5: VMs missing required governance tags (orphaned)
+            scenario("scan_untagged_orphan_vms", "virtual_machine_untagged_orphan"),
+            # Scenario 6: VMs using old generation SKUs (v1/v2/v3 → v4/v5)
+            scenario("scan_old_generation_vms", "virtual_machine_old_generation"),
+            # Scenario 7: VMs that could use Spot pricing (60-90% savings)
+            scenario("scan_spot_convertible_vms", "virtual_machine_spot_convertible"),
+            # Phase 2 - Azure Monitor Metrics-based Advanced Scenarios (requires "Monitoring Reader" permission)
+            # Disk scenarios
+            # Scenario 6: Idle disks (zero I/O activity)
+            scenario("scan_idle_disks", "managed_disk_idle"),
+            # Scenario 7: Unused disk bursting (bursting enabled but never used)
+            scenario("scan_unused_bursting", "managed_disk_unused_bursting"),
+            # Scenario 8: Over-provisioned Premium disks (performance tier too high)
+            scenario("scan_overprovisioned_disks", "managed_disk_overprovisioned"),
+            # Scenario 9: Under-utilized Standard HDD disks (should be SSD)
+            scenario("scan_underutilized_hdd_disks", "managed_disk_underutilized_hdd"),
+            # Phase 2 - VM Azure Monitor Metrics-based Scenarios
+            # Scenario 8: Idle running VMs (low CPU utilization)
+            scenario("scan_idle_running_instances", "virtual_machine_idle"),
+            # Scenario 9: Underutilized VMs (rightsizing - CPU-based)
+            scenario("scan_underutilized_vms", "virtual_machine_underutilized"),
+            # Scenario 10: Memory-overprovisioned VMs (E-series with low memory usage)
+            scenario("scan_memory_overprovisioned_vms", "virtual_machine_memory_overprovisioned"),
+            # ===== Azure NAT Gateway Waste Detection (10 Scenarios) =====
+            # Scenario 1: NAT Gateway without subnet attached
+            scenario("scan_nat_gateway_no_subnet", "nat_gateway_no_subnet"),
+            # Scenario 2: NAT Gateway never used (has subnets but no VMs)
+            scenario("scan_nat_gateway_never_used", "nat_gateway_never_used"),
+            # Scenario 3: NAT Gateway without Public IP
+            scenario("scan_nat_gateway_no_public_ip", "nat_gateway_no_public_ip"),
+            # Scenario 4: NAT Gateway used by single VM
+            scenario("scan_nat_gateway_single_vm", "nat_gateway_single_vm"),
+            # Scenario 5: Redundant NAT Gateway in same VNet
+            scenario("scan_nat_gateway_redundant", "nat_gateway_redundant"),
+            # Scenario 6: Dev/Test NAT Gateway always on
+            scenario("scan_nat_gateway_dev_test_always_on", "nat_gateway_dev_test_always_on"),
+            # Scenario 7: NAT Gateway with unnecessary multi-zone configuration
+            scenario("scan_nat_gateway_unnecessary_zones", "nat_gateway_unnecessary_zones"),
+            # Scenario 8: NAT Gateway with zero traffic (Azure Monitor metrics)
+            scenario("scan_nat_gateway_no_traffic", "nat_gateway_no_traffic"),
+            # Scenario 9: NAT Gateway with very low traffic (<10 GB/month)
+            scenario("scan_nat_gateway_very_low_traffic", "nat_gateway_very_low_traffic"),
+            # Scenario 10: NAT Gateway where Private Link/Service Endpoints would be better
+            scenario("scan_nat_gateway_private_link_alternative", "nat_gateway_private_link_alternative"),
+            # ===== Azure Load Balancer & Application Gateway Waste Detection (10 Scenarios) =====
+            # Scenario 1: Load Balancer without backend instances
+            scenario("scan_load_balancer_no_backend_instances", "load_balancer_no_backend_instances"),
+            # Scenario 2: Load Balancer with all backends unhealthy
+            scenario("scan_load_balancer_all_backends_unhealthy", "load_balancer_all_backends_unhealthy"),
+            # Scenario 3: Load Balancer without load balancing or NAT rules
+            scenario("scan_load_balancer_no_inbound_rules", "load_balancer_no_inbound_rules"),
+            # Scenario 4: Load Balancer using retired Basic SKU (CRITICAL)
+            scenario("scan_load_balancer_basic_sku_retired", "load_balancer_basic_sku_retired"),
+            # Scenario 5: Application Gateway without backend targets
+            scenario("scan_application_gateway_no_backend_targets", "application_gateway_no_backend_targets"),
+            # Scenario 6: Application Gateway in stopped state
+            scenario("scan_application_gateway_stopped", "application_gateway_stopped"),
+            # Scenario 7: Load Balancer never used (created but unused)
+            scenario("scan_load_balancer_never_used", "load_balancer_never_used"),
+            # Scenario 8: Load Balancer with zero traffic (Azure Monitor metrics)
+            scenario("scan_load_balancer_no_traffic", "load_balancer_no_traffic"),
+            # Scenario 9: Application Gateway with zero HTTP requests (Azure Monitor metrics)
+            scenario("scan_application_gateway_no_requests", "application_gateway_no_requests"),
+            # Scenario 10: Application Gateway underutilized (<5% capacity - Azure Monitor metrics)
+            scenario("scan_application_gateway_underutilized", "application_gateway_underutilized"),
+            # ===== Azure Databases Waste Detection (15 Scenarios) =====
+            # Azure SQL Database (4 scenarios)
+            scenario("scan_sql_database_stopped", "sql_database_stopped"),
+            scenario("scan_sql_database_idle_connections", "sql_database_idle_connections"),
+            scenario("scan_sql_database_over_provisioned_dtu", "sql_database_over_provisioned_dtu"),
+            scenario("scan_sql_database_serverless_not_pausing", "sql_database_serverless_not_pausing"),
+            # Azure Cosmos DB (3 scenarios)
+            scenario("scan_cosmosdb_over_provisioned_ru", "cosmosdb_over_provisioned_ru"),
+            scenario("scan_cosmosdb_idle_containers", "cosmosdb_idle_containers"),
+            scenario("scan_cosmosdb_hot_partitions_idle_others", "cosmosdb_hot_partitions_idle_others"),
+            # Azure Cosmos DB Table API (12 scenarios - 100% coverage)
+            scenario("scan_azure_cosmosdb_table_api"),
+            # Azure PostgreSQL/MySQL (4 scenarios)
+            scenario("scan_postgres_mysql_stopped", "postgres_mysql_stopped"),
+            scenario("scan_postgres_mysql_idle_connections", "postgres_mysql_idle_connections"),
+            scenario("scan_postgres_mysql_over_provisioned_vcores", "postgres_mysql_over_provisioned_vcores"),
+            scenario("scan_postgres_mysql_burstable_always_bursting", "postgres_mysql_burstable_always_bursting"),
+            # Azure Synapse Analytics (2 scenarios)
+            scenario("scan_synapse_sql_pool_paused", "synapse_sql_pool_paused"),
+            scenario("scan_synapse_sql_pool_idle_queries", "synapse_sql_pool_idle_queries"),
+            # Azure Cache for Redis (2 scenarios)
+            scenario("scan_redis_idle_cache", "redis_idle_cache"),
+            scenario("scan_redis_over_sized_tier", "redis_over_sized_tier"),
+            # ===== Azure AKS Clusters Waste Detection (10 Scenarios) - BONUS =====
+            scenario("scan_idle_eks_clusters", "azure_aks_cluster"),
+        ]
 
         # ===== Azure Storage Accounts Waste Detection (8 implemented scenarios) =====
         # Note: Storage Accounts are global resources (not region-specific)
         # Only scan once when scan_global_resources flag is True
         if scan_global_resources:
-            storage_orphans = await self.scan_azure_storage_accounts(rules)
-            results.extend(storage_orphans)
+            scenarios += [
+                scenario("scan_azure_storage_accounts", regional=False),
+            ]
 
         # ===== Azure Files Shares Waste Detection (10 scenarios - 100% coverage) =====
         # Note: Azure Files are subscription-level resources (not strictly region-specific)
         # Only scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            file_shares_orphans = await self.scan_azure_file_shares(rules)
-            results.extend(file_shares_orphans)
+            scenarios += [
+                scenario("scan_azure_file_shares", regional=False),
+            ]
 
         # ===== Azure Functions Waste Detection (10 scenarios - 100% coverage) =====
         # Note: Azure Functions are subscription-level resources (not strictly region-specific)
         # They are deployed to regions but scanned at subscription level
         # Only scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            functions_orphans = await self.scan_azure_function_apps(region, rules)
-            results.extend(functions_orphans)
+            scenarios += [
+                scenario("scan_azure_function_apps"),
+            ]
 
         # ===== Azure Container Apps Waste Detection (16 scenarios - 100% coverage) =====
         # Note: Container Apps are subscription-level resources (deployed to specific regions)
         # Scan once when scan_global_resources flag is True to avoid duplicates across regions
         if scan_global_resources:
-            # Phase 1 - Detection Simple (10 scenarios)
-            container_app_stopped = await self.scan_container_app_stopped(region, rules.get("container_app_stopped"))
-            results.extend(container_app_stopped)
-
-            container_app_zero_replicas = await self.scan_container_app_zero_replicas(region, rules.get("container_app_zero_replicas"))
-            results.extend(container_app_zero_replicas)
-
-            container_app_unnecessary_premium = await self.scan_container_app_unnecessary_premium_tier(region, rules.get("container_app_unnecessary_premium_tier"))
-            results.extend(container_app_unnecessary_premium)
-
-            container_app_dev_zone_redundancy = await self.scan_container_app_dev_zone_redundancy(region, rules.get("container_app_dev_zone_redundancy"))
-            results.extend(container_app_dev_zone_redundancy)
-
-            container_app_no_ingress = await self.scan_container_app_no_ingress_configured(region, rules.get("container_app_no_ingress_configured"))
-            results.extend(container_app_no_ingress)
-
-            container_app_empty_env = await self.scan_container_app_empty_environment(region, rules.get("container_app_empty_environment"))
-            results.extend(container_app_empty_env)
-
-            container_app_unused_revision = await self.scan_container_app_unused_revision(region, rules.get("container_app_unused_revision"))
-            results.extend(container_app_unused_revision)
-
-            container_app_overprovisioned = await self.scan_container_app_overprovisioned_cpu_memory(region, rules.get("container_app_overprovisioned_cpu_memory"))
-            results.extend(container_app_overprovisioned)
-
-            container_app_custom_domain = await self.scan_container_app_custom_domain_unused(region, rules.get("container_app_custom_domain_unused"))
-            results.extend(container_app_custom_domain)
-
-            container_app_secrets = await self.scan_container_app_secrets_unused(region, rules.get("container_app_secrets_unused"))
-            results.extend(container_app_secrets)
-
-            # Phase 2 - Azure Monitor Metrics (6 scenarios)
-            container_app_low_cpu = await self.scan_container_app_low_cpu_utilization(region, rules.get("container_app_low_cpu_utilization"))
-            results.extend(container_app_low_cpu)
-
-            container_app_low_memory = await self.scan_container_app_low_memory_utilization(region, rules.get("container_app_low_memory_utilization"))
-            results.extend(container_app_low_memory)
-
-            container_app_zero_requests = await self.scan_container_app_zero_http_requests(region, rules.get("container_app_zero_http_requests"))
-            results.extend(container_app_zero_requests)
-
-            container_app_high_replica = await self.scan_container_app_high_replica_low_traffic(region, rules.get("container_app_high_replica_low_traffic"))
-            results.extend(container_app_high_replica)
-
-            container_app_autoscale = await self.scan_container_app_autoscaling_not_triggering(region, rules.get("container_app_autoscaling_not_triggering"))
-            results.extend(container_app_autoscale)
-
-            container_app_cold_start = await self.scan_container_app_cold_start_issues(region, rules.get("container_app_cold_start_issues"))
-            results.extend(container_app_cold_start)
+            scenarios += [
+                # Phase 1 - Detection Simple (10 scenarios)
+                scenario("scan_container_app_stopped", "container_app_stopped"),
+                scenario("scan_container_app_zero_replicas", "container_app_zero_replicas"),
+                scenario("scan_container_app_unnecessary_premium_tier", "container_app_unnecessary_premium_tier"),
+                scenario("scan_container_app_dev_zone_redundancy", "container_app_dev_zone_redundancy"),
+                scenario("scan_container_app_no_ingress_configured", "container_app_no_ingress_configured"),
+                scenario("scan_container_app_empty_environment", "container_app_empty_environment"),
+                scenario("scan_container_app_unused_revision", "container_app_unused_revision"),
+                scenario("scan_container_app_overprovisioned_cpu_memory", "container_app_overprovisioned_cpu_memory"),
+                scenario("scan_container_app_custom_domain_unused", "container_app_custom_domain_unused"),
+                scenario("scan_container_app_secrets_unused", "container_app_secrets_unused"),
+                # Phase 2 - Azure Monitor Metrics (6 scenarios)
+                scenario("scan_container_app_low_cpu_utilization", "container_app_low_cpu_utilization"),
+                scenario("scan_container_app_low_memory_utilization", "container_app_low_memory_utilization"),
+                scenario("scan_container_app_zero_http_requests", "container_app_zero_http_requests"),
+                scenario("scan_container_app_high_replica_low_traffic", "container_app_high_replica_low_traffic"),
+                scenario("scan_container_app_autoscaling_not_triggering", "container_app_autoscaling_not_triggering"),
+                scenario("scan_container_app_cold_start_issues", "container_app_cold_start_issues"),
+            ]
 
         # ===== Azure Virtual Desktop (AVD) Waste Detection (18 scenarios - 100% coverage) =====
         # Note: AVD resources are subscription-level (not region-specific)
         # Scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            # Phase 1 - Detection Simple (12 scenarios)
-            avd_host_pool_empty = await self.scan_avd_host_pool_empty(region, rules.get("avd_host_pool_empty"))
-            results.extend(avd_host_pool_empty)
-
-            avd_session_host_stopped = await self.scan_avd_session_host_stopped(region, rules.get("avd_session_host_stopped"))
-            results.extend(avd_session_host_stopped)
-
-            avd_session_host_never_used = await self.scan_avd_session_host_never_used(region, rules.get("avd_session_host_never_used"))
-            results.extend(avd_session_host_never_used)
-
-            avd_host_pool_no_autoscale = await self.scan_avd_host_pool_no_autoscale(region, rules.get("avd_host_pool_no_autoscale"))
-            results.extend(avd_host_pool_no_autoscale)
-
-            avd_host_pool_over_provisioned = await self.scan_avd_host_pool_over_provisioned(region, rules.get("avd_host_pool_over_provisioned"))
-            results.extend(avd_host_pool_over_provisioned)
-
-            avd_application_group_empty = await self.scan_avd_application_group_empty(region, rules.get("avd_application_group_empty"))
-            results.extend(avd_application_group_empty)
-
-            avd_workspace_empty = await self.scan_avd_workspace_empty(region, rules.get("avd_workspace_empty"))
-            results.extend(avd_workspace_empty)
-
-            avd_premium_disk_in_dev = await self.scan_avd_premium_disk_in_dev(region, rules.get("avd_premium_disk_in_dev"))
-            results.extend(avd_premium_disk_in_dev)
-
-            avd_unnecessary_zones = await self.scan_avd_unnecessary_availability_zones(region, rules.get("avd_unnecessary_availability_zones"))
-            results.extend(avd_unnecessary_zones)
-
-            avd_personal_desktop = await self.scan_avd_personal_desktop_never_used(region, rules.get("avd_personal_desktop_never_used"))
-            results.extend(avd_personal_desktop)
-
-            avd_fslogix = await self.scan_avd_fslogix_oversized(region, rules.get("avd_fslogix_oversized"))
-            results.extend(avd_fslogix)
-
-            avd_old_vm_gen = await self.scan_avd_session_host_old_vm_generation(region, rules.get("avd_session_host_old_vm_generation"))
-            results.extend(avd_old_vm_gen)
-
-            # Phase 2 - Azure Monitor Metrics (6 scenarios)
-            avd_low_cpu = await self.scan_avd_low_cpu_utilization(region, rules.get("avd_low_cpu_utilization"))
-            results.extend(avd_low_cpu)
-
-            avd_low_memory = await self.scan_avd_low_memory_utilization(region, rules.get("avd_low_memory_utilization"))
-            results.extend(avd_low_memory)
-
-            avd_zero_sessions = await self.scan_avd_zero_user_sessions(region, rules.get("avd_zero_user_sessions"))
-            results.extend(avd_zero_sessions)
-
-            avd_high_hosts = await self.scan_avd_high_host_count_low_users(region, rules.get("avd_high_host_count_low_users"))
-            results.extend(avd_high_hosts)
-
-            avd_disconnected = await self.scan_avd_disconnected_sessions_waste(region, rules.get("avd_disconnected_sessions_waste"))
-            results.extend(avd_disconnected)
-
-            avd_peak_mismatch = await self.scan_avd_peak_hours_mismatch(region, rules.get("avd_peak_hours_mismatch"))
-            results.extend(avd_peak_mismatch)
+            scenarios += [
+                # Phase 1 - Detection Simple (12 scenarios)
+                scenario("scan_avd_host_pool_empty", "avd_host_pool_empty"),
+                scenario("scan_avd_session_host_stopped", "avd_session_host_stopped"),
+                scenario("scan_avd_session_host_never_used", "avd_session_host_never_used"),
+                scenario("scan_avd_host_pool_no_autoscale", "avd_host_pool_no_autoscale"),
+                scenario("scan_avd_host_pool_over_provisioned", "avd_host_pool_over_provisioned"),
+                scenario("scan_avd_application_group_empty", "avd_application_group_empty"),
+                scenario("scan_avd_workspace_empty", "avd_workspace_empty"),
+                scenario("scan_avd_premium_disk_in_dev", "avd_premium_disk_in_dev"),
+                scenario("scan_avd_unnecessary_availability_zones", "avd_unnecessary_availability_zones"),
+                scenario("scan_avd_personal_desktop_never_used", "avd_personal_desktop_never_used"),
+                scenario("scan_avd_fslogix_oversized", "avd_fslogix_oversized"),
+                scenario("scan_avd_session_host_old_vm_generation", "avd_session_host_old_vm_generation"),
+                # Phase 2 - Azure Monitor Metrics (6 scenarios)
+                scenario("scan_avd_low_cpu_utilization", "avd_low_cpu_utilization"),
+                scenario("scan_avd_low_memory_utilization", "avd_low_memory_utilization"),
+                scenario("scan_avd_zero_user_sessions", "avd_zero_user_sessions"),
+                scenario("scan_avd_high_host_count_low_users", "avd_high_host_count_low_users"),
+                scenario("scan_avd_disconnected_sessions_waste", "avd_disconnected_sessions_waste"),
+                scenario("scan_avd_peak_hours_mismatch", "avd_peak_hours_mismatch"),
+            ]
 
         # ===== Azure HDInsight Spark Cluster Waste Detection (18 scenarios - 100% coverage) =====
         # Note: HDInsight clusters are subscription-level resources (not region-specific)
         # Scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            # Phase 1 - Detection Simple (10 scenarios)
-            hdinsight_cluster_stopped = await self.scan_hdinsight_spark_cluster_stopped(region, rules.get("hdinsight_spark_cluster_stopped"))
-            results.extend(hdinsight_cluster_stopped)
-
-            hdinsight_cluster_never_used = await self.scan_hdinsight_spark_cluster_never_used(region, rules.get("hdinsight_spark_cluster_never_used"))
-            results.extend(hdinsight_cluster_never_used)
-
-            hdinsight_premium_storage_dev = await self.scan_hdinsight_spark_premium_storage_dev(region, rules.get("hdinsight_spark_premium_storage_dev"))
-            results.extend(hdinsight_premium_storage_dev)
-
-            hdinsight_no_autoscale = await self.scan_hdinsight_spark_no_autoscale(region, rules.get("hdinsight_spark_no_autoscale"))
-            results.extend(hdinsight_no_autoscale)
-
-            hdinsight_outdated_version = await self.scan_hdinsight_spark_outdated_version(region, rules.get("hdinsight_spark_outdated_version"))
-            results.extend(hdinsight_outdated_version)
-
-            hdinsight_external_metastore_unused = await self.scan_hdinsight_spark_external_metastore_unused(region, rules.get("hdinsight_spark_external_metastore_unused"))
-            results.extend(hdinsight_external_metastore_unused)
-
-            hdinsight_empty_cluster = await self.scan_hdinsight_spark_empty_cluster(region, rules.get("hdinsight_spark_empty_cluster"))
-            results.extend(hdinsight_empty_cluster)
-
-            hdinsight_oversized_head_nodes = await self.scan_hdinsight_spark_oversized_head_nodes(region, rules.get("hdinsight_spark_oversized_head_nodes"))
-            results.extend(hdinsight_oversized_head_nodes)
-
-            hdinsight_unnecessary_edge_node = await self.scan_hdinsight_spark_unnecessary_edge_node(region, rules.get("hdinsight_spark_unnecessary_edge_node"))
-            results.extend(hdinsight_unnecessary_edge_node)
-
-            hdinsight_undersized_disks = await self.scan_hdinsight_spark_undersized_disks(region, rules.get("hdinsight_spark_undersized_disks"))
-            results.extend(hdinsight_undersized_disks)
-
-            # Phase 2 - Detection with Azure Monitor + Ambari API (8 scenarios)
-            hdinsight_low_cpu_utilization = await self.scan_hdinsight_spark_low_cpu_utilization(region, rules.get("hdinsight_spark_low_cpu_utilization"))
-            results.extend(hdinsight_low_cpu_utilization)
-
-            hdinsight_zero_jobs_metrics = await self.scan_hdinsight_spark_zero_jobs_metrics(region, rules.get("hdinsight_spark_zero_jobs_metrics"))
-            results.extend(hdinsight_zero_jobs_metrics)
-
-            hdinsight_idle_business_hours = await self.scan_hdinsight_spark_idle_business_hours(region, rules.get("hdinsight_spark_idle_business_hours"))
-            results.extend(hdinsight_idle_business_hours)
-
-            hdinsight_high_yarn_memory_waste = await self.scan_hdinsight_spark_high_yarn_memory_waste(region, rules.get("hdinsight_spark_high_yarn_memory_waste"))
-            results.extend(hdinsight_high_yarn_memory_waste)
-
-            hdinsight_excessive_shuffle_data = await self.scan_hdinsight_spark_excessive_shuffle_data(region, rules.get("hdinsight_spark_excessive_shuffle_data"))
-            results.extend(hdinsight_excessive_shuffle_data)
-
-            hdinsight_autoscale_not_working = await self.scan_hdinsight_spark_autoscale_not_working(region, rules.get("hdinsight_spark_autoscale_not_working"))
-            results.extend(hdinsight_autoscale_not_working)
-
-            hdinsight_low_memory_utilization = await self.scan_hdinsight_spark_low_memory_utilization(region, rules.get("hdinsight_spark_low_memory_utilization"))
-            results.extend(hdinsight_low_memory_utilization)
-
-            hdinsight_high_job_failure_rate = await self.scan_hdinsight_spark_high_job_failure_rate(region, rules.get("hdinsight_spark_high_job_failure_rate"))
-            results.extend(hdinsight_high_job_failure_rate)
+            scenarios += [
+                # Phase 1 - Detection Simple (10 scenarios)
+                scenario("scan_hdinsight_spark_cluster_stopped", "hdinsight_spark_cluster_stopped"),
+                scenario("scan_hdinsight_spark_cluster_never_used", "hdinsight_spark_cluster_never_used"),
+                scenario("scan_hdinsight_spark_premium_storage_dev", "hdinsight_spark_premium_storage_dev"),
+                scenario("scan_hdinsight_spark_no_autoscale", "hdinsight_spark_no_autoscale"),
+                scenario("scan_hdinsight_spark_outdated_version", "hdinsight_spark_outdated_version"),
+                scenario("scan_hdinsight_spark_external_metastore_unused", "hdinsight_spark_external_metastore_unused"),
+                scenario("scan_hdinsight_spark_empty_cluster", "hdinsight_spark_empty_cluster"),
+                scenario("scan_hdinsight_spark_oversized_head_nodes", "hdinsight_spark_oversized_head_nodes"),
+                scenario("scan_hdinsight_spark_unnecessary_edge_node", "hdinsight_spark_unnecessary_edge_node"),
+                scenario("scan_hdinsight_spark_undersized_disks", "hdinsight_spark_undersized_disks"),
+                # Phase 2 - Detection with Azure Monitor + Ambari API (8 scenarios)
+                scenario("scan_hdinsight_spark_low_cpu_utilization", "hdinsight_spark_low_cpu_utilization"),
+                scenario("scan_hdinsight_spark_zero_jobs_metrics", "hdinsight_spark_zero_jobs_metrics"),
+                scenario("scan_hdinsight_spark_idle_business_hours", "hdinsight_spark_idle_business_hours"),
+                scenario("scan_hdinsight_spark_high_yarn_memory_waste", "hdinsight_spark_high_yarn_memory_waste"),
+                scenario("scan_hdinsight_spark_excessive_shuffle_data", "hdinsight_spark_excessive_shuffle_data"),
+                scenario("scan_hdinsight_spark_autoscale_not_working", "hdinsight_spark_autoscale_not_working"),
+                scenario("scan_hdinsight_spark_low_memory_utilization", "hdinsight_spark_low_memory_utilization"),
+                scenario("scan_hdinsight_spark_high_job_failure_rate", "hdinsight_spark_high_job_failure_rate"),
+            ]
 
         # ===== Azure Machine Learning Compute Instance Waste Detection (18 scenarios - 100% coverage) =====
         # Note: ML Compute Instances are workspace-level resources
         # Scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            # Phase 1 - Detection Simple (10 scenarios)
-            ml_no_auto_shutdown = await self.scan_ml_compute_instance_no_auto_shutdown(region, rules.get("ml_compute_instance_no_auto_shutdown"))
-            results.extend(ml_no_auto_shutdown)
-
-            ml_gpu_for_cpu = await self.scan_ml_compute_instance_gpu_for_cpu_workload(region, rules.get("ml_compute_instance_gpu_for_cpu_workload"))
-            results.extend(ml_gpu_for_cpu)
-
-            ml_stopped_30_days = await self.scan_ml_compute_instance_stopped_30_days(region, rules.get("ml_compute_instance_stopped_30_days"))
-            results.extend(ml_stopped_30_days)
-
-            ml_over_provisioned = await self.scan_ml_compute_instance_over_provisioned(region, rules.get("ml_compute_instance_over_provisioned"))
-            results.extend(ml_over_provisioned)
-
-            ml_never_accessed = await self.scan_ml_compute_instance_never_accessed(region, rules.get("ml_compute_instance_never_accessed"))
-            results.extend(ml_never_accessed)
-
-            ml_multiple_per_user = await self.scan_ml_compute_instance_multiple_per_user(region, rules.get("ml_compute_instance_multiple_per_user"))
-            results.extend(ml_multiple_per_user)
-
-            ml_premium_ssd = await self.scan_ml_compute_instance_premium_ssd_unnecessary(region, rules.get("ml_compute_instance_premium_ssd_unnecessary"))
-            results.extend(ml_premium_ssd)
-
-            ml_no_idle_shutdown = await self.scan_ml_compute_instance_no_idle_shutdown(region, rules.get("ml_compute_instance_no_idle_shutdown"))
-            results.extend(ml_no_idle_shutdown)
-
-            ml_dev_high_perf = await self.scan_ml_compute_instance_dev_high_performance_sku(region, rules.get("ml_compute_instance_dev_high_performance_sku"))
-            results.extend(ml_dev_high_perf)
-
-            ml_old_sdk = await self.scan_ml_compute_instance_old_sdk_deprecated_image(region, rules.get("ml_compute_instance_old_sdk_deprecated_image"))
-            results.extend(ml_old_sdk)
-
-            # Phase 2 - Detection with Azure Monitor + Azure ML API (8 scenarios)
-            ml_low_cpu = await self.scan_ml_compute_instance_low_cpu_utilization(region, rules.get("ml_compute_instance_low_cpu_utilization"))
-            results.extend(ml_low_cpu)
-
-            ml_low_gpu = await self.scan_ml_compute_instance_low_gpu_utilization(region, rules.get("ml_compute_instance_low_gpu_utilization"))
-            results.extend(ml_low_gpu)
-
-            ml_idle_business = await self.scan_ml_compute_instance_idle_business_hours(region, rules.get("ml_compute_instance_idle_business_hours"))
-            results.extend(ml_idle_business)
-
-            ml_no_jupyter = await self.scan_ml_compute_instance_no_jupyter_activity(region, rules.get("ml_compute_instance_no_jupyter_activity"))
-            results.extend(ml_no_jupyter)
-
-            ml_no_training = await self.scan_ml_compute_instance_no_training_jobs(region, rules.get("ml_compute_instance_no_training_jobs"))
-            results.extend(ml_no_training)
-
-            ml_low_memory = await self.scan_ml_compute_instance_low_memory_utilization(region, rules.get("ml_compute_instance_low_memory_utilization"))
-            results.extend(ml_low_memory)
-
-            ml_network_idle = await self.scan_ml_compute_instance_network_idle(region, rules.get("ml_compute_instance_network_idle"))
-            results.extend(ml_network_idle)
-
-            ml_disk_io_zero = await self.scan_ml_compute_instance_disk_io_near_zero(region, rules.get("ml_compute_instance_disk_io_near_zero"))
-            results.extend(ml_disk_io_zero)
+            scenarios += [
+                # Phase 1 - Detection Simple (10 scenarios)
+                scenario("scan_ml_compute_instance_no_auto_shutdown", "ml_compute_instance_no_auto_shutdown"),
+                scenario("scan_ml_compute_instance_gpu_for_cpu_workload", "ml_compute_instance_gpu_for_cpu_workload"),
+                scenario("scan_ml_compute_instance_stopped_30_days", "ml_compute_instance_stopped_30_days"),
+                scenario("scan_ml_compute_instance_over_provisioned", "ml_compute_instance_over_provisioned"),
+                scenario("scan_ml_compute_instance_never_accessed", "ml_compute_instance_never_accessed"),
+                scenario("scan_ml_compute_instance_multiple_per_user", "ml_compute_instance_multiple_per_user"),
+                scenario("scan_ml_compute_instance_premium_ssd_unnecessary", "ml_compute_instance_premium_ssd_unnecessary"),
+                scenario("scan_ml_compute_instance_no_idle_shutdown", "ml_compute_instance_no_idle_shutdown"),
+                scenario("scan_ml_compute_instance_dev_high_performance_sku", "ml_compute_instance_dev_high_performance_sku"),
+                scenario("scan_ml_compute_instance_old_sdk_deprecated_image", "ml_compute_instance_old_sdk_deprecated_image"),
+                # Phase 2 - Detection with Azure Monitor + Azure ML API (8 scenarios)
+                scenario("scan_ml_compute_instance_low_cpu_utilization", "ml_compute_instance_low_cpu_utilization"),
+                scenario("scan_ml_compute_instance_low_gpu_utilization", "ml_compute_instance_low_gpu_utilization"),
+                scenario("scan_ml_compute_instance_idle_business_hours", "ml_compute_instance_idle_business_hours"),
+                scenario("scan_ml_compute_instance_no_jupyter_activity", "ml_compute_instance_no_jupyter_activity"),
+                scenario("scan_ml_compute_instance_no_training_jobs", "ml_compute_instance_no_training_jobs"),
+                scenario("scan_ml_compute_instance_low_memory_utilization", "ml_compute_instance_low_memory_utilization"),
+                scenario("scan_ml_compute_instance_network_idle", "ml_compute_instance_network_idle"),
+                scenario("scan_ml_compute_instance_disk_io_near_zero", "ml_compute_instance_disk_io_near_zero"),
+            ]
 
         # ===== Azure App Service (Web Apps) Waste Detection (18 scenarios - 100% coverage) =====
         # Note: App Service Plans are subscription-level resources
         # Scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            # Phase 1 - Detection Simple (10 scenarios)
-            app_plan_empty = await self.scan_app_service_plan_empty(region, rules.get("app_service_plan_empty"))
-            results.extend(app_plan_empty)
-
-            app_premium_dev = await self.scan_app_service_premium_in_dev(region, rules.get("app_service_premium_in_dev"))
-            results.extend(app_premium_dev)
-
-            app_no_autoscale = await self.scan_app_service_no_auto_scale(region, rules.get("app_service_no_auto_scale"))
-            results.extend(app_no_autoscale)
-
-            app_always_on_low = await self.scan_app_service_always_on_low_traffic(region, rules.get("app_service_always_on_low_traffic"))
-            results.extend(app_always_on_low)
-
-            app_unused_slots = await self.scan_app_service_unused_deployment_slots(region, rules.get("app_service_unused_deployment_slots"))
-            results.extend(app_unused_slots)
-
-            app_over_provisioned = await self.scan_app_service_over_provisioned_plan(region, rules.get("app_service_over_provisioned_plan"))
-            results.extend(app_over_provisioned)
-
-            app_stopped_paid = await self.scan_app_service_stopped_apps_paid_plan(region, rules.get("app_service_stopped_apps_paid_plan"))
-            results.extend(app_stopped_paid)
-
-            app_consolidation = await self.scan_app_service_multiple_plans_consolidation(region, rules.get("app_service_multiple_plans_consolidation"))
-            results.extend(app_consolidation)
-
-            app_vnet_unused = await self.scan_app_service_vnet_integration_unused(region, rules.get("app_service_vnet_integration_unused"))
-            results.extend(app_vnet_unused)
-
-            app_old_runtime = await self.scan_app_service_old_runtime_version(region, rules.get("app_service_old_runtime_version"))
-            results.extend(app_old_runtime)
-
-            # Phase 2 - Detection with Azure Monitor (8 scenarios)
-            app_low_cpu = await self.scan_app_service_low_cpu_utilization(region, rules.get("app_service_low_cpu_utilization"))
-            results.extend(app_low_cpu)
-
-            app_low_memory = await self.scan_app_service_low_memory_utilization(region, rules.get("app_service_low_memory_utilization"))
-            results.extend(app_low_memory)
-
-            app_low_requests = await self.scan_app_service_low_request_count(region, rules.get("app_service_low_request_count"))
-            results.extend(app_low_requests)
-
-            app_no_traffic_business = await self.scan_app_service_no_traffic_business_hours(region, rules.get("app_service_no_traffic_business_hours"))
-            results.extend(app_no_traffic_business)
-
-            app_high_errors = await self.scan_app_service_high_http_error_rate(region, rules.get("app_service_high_http_error_rate"))
-            results.extend(app_high_errors)
-
-            app_slow_response = await self.scan_app_service_slow_response_time(region, rules.get("app_service_slow_response_time"))
-            results.extend(app_slow_response)
-
-            app_autoscale_no_trigger = await self.scan_app_service_auto_scale_never_triggers(region, rules.get("app_service_auto_scale_never_triggers"))
-            results.extend(app_autoscale_no_trigger)
-
-            app_cold_start = await self.scan_app_service_cold_start_excessive(region, rules.get("app_service_cold_start_excessive"))
-            results.extend(app_cold_start)
+            scenarios += [
+                # Phase 1 - Detection Simple (10 scenarios)
+                scenario("scan_app_service_plan_empty", "app_service_plan_empty"),
+                scenario("scan_app_service_premium_in_dev", "app_service_premium_in_dev"),
+                scenario("scan_app_service_no_auto_scale", "app_service_no_auto_scale"),
+                scenario("scan_app_service_always_on_low_traffic", "app_service_always_on_low_traffic"),
+                scenario("scan_app_service_unused_deployment_slots", "app_service_unused_deployment_slots"),
+                scenario("scan_app_service_over_provisioned_plan", "app_service_over_provisioned_plan"),
+                scenario("scan_app_service_stopped_apps_paid_plan", "app_service_stopped_apps_paid_plan"),
+                scenario("scan_app_service_multiple_plans_consolidation", "app_service_multiple_plans_consolidation"),
+                scenario("scan_app_service_vnet_integration_unused", "app_service_vnet_integration_unused"),
+                scenario("scan_app_service_old_runtime_version", "app_service_old_runtime_version"),
+                # Phase 2 - Detection with Azure Monitor (8 scenarios)
+                scenario("scan_app_service_low_cpu_utilization", "app_service_low_cpu_utilization"),
+                scenario("scan_app_service_low_memory_utilization", "app_service_low_memory_utilization"),
+                scenario("scan_app_service_low_request_count", "app_service_low_request_count"),
+                scenario("scan_app_service_no_traffic_business_hours", "app_service_no_traffic_business_hours"),
+                scenario("scan_app_service_high_http_error_rate", "app_service_high_http_error_rate"),
+                scenario("scan_app_service_slow_response_time", "app_service_slow_response_time"),
+                scenario("scan_app_service_auto_scale_never_triggers", "app_service_auto_scale_never_triggers"),
+                scenario("scan_app_service_cold_start_excessive", "app_service_cold_start_excessive"),
+            ]
 
         # ===== Azure Networking (ExpressRoute, VPN, NICs) Waste Detection (8 scenarios - 100% coverage) =====
         # Note: ExpressRoute circuits and VPN gateways are subscription-level resources
         # Scan once when scan_global_resources flag is True to avoid duplicates
         if scan_global_resources:
-            # ExpressRoute Circuit (4 scenarios)
-            expressroute_not_provisioned = await self.scan_expressroute_circuit_not_provisioned(region, rules.get("expressroute_circuit_not_provisioned"))
-            results.extend(expressroute_not_provisioned)
-
-            expressroute_no_connection = await self.scan_expressroute_circuit_no_connection(region, rules.get("expressroute_circuit_no_connection"))
-            results.extend(expressroute_no_connection)
-
-            expressroute_gateway_orphaned = await self.scan_expressroute_gateway_orphaned(region, rules.get("expressroute_gateway_orphaned"))
-            results.extend(expressroute_gateway_orphaned)
-
-            expressroute_underutilized = await self.scan_expressroute_circuit_underutilized(region, rules.get("expressroute_circuit_underutilized"))
-            results.extend(expressroute_underutilized)
-
-            # VPN Gateway (3 scenarios)
-            vpn_disconnected = await self.scan_vpn_gateway_disconnected(region, rules.get("vpn_gateway_disconnected"))
-            results.extend(vpn_disconnected)
-
-            vpn_basic_deprecated = await self.scan_vpn_gateway_basic_sku_deprecated(region, rules.get("vpn_gateway_basic_sku_deprecated"))
-            results.extend(vpn_basic_deprecated)
-
-            vpn_no_connections = await self.scan_vpn_gateway_no_connections(region, rules.get("vpn_gateway_no_connections"))
-            results.extend(vpn_no_connections)
-
-            # Network Interfaces (1 scenario)
-            nic_orphaned = await self.scan_network_interface_orphaned(region, rules.get("network_interface_orphaned"))
-            results.extend(nic_orphaned)
-
-        return results
+            scenarios += [
+                # ExpressRoute Circuit (4 scenarios)
+                scenario("scan_expressroute_circuit_not_provisioned", "expressroute_circuit_not_provisioned"),
+                scenario("scan_expressroute_circuit_no_connection", "expressroute_circuit_no_connection"),
+                scenario("scan_expressroute_gateway_orphaned", "expressroute_gateway_orphaned"),
+                scenario("scan_expressroute_circuit_underutilized", "expressroute_circuit_underutilized"),
+                # VPN Gateway (3 scenarios)
+                scenario("scan_vpn_gateway_disconnected", "vpn_gateway_disconnected"),
+                scenario("scan_vpn_gateway_basic_sku_deprecated", "vpn_gateway_basic_sku_deprecated"),
+                scenario("scan_vpn_gateway_no_connections", "vpn_gateway_no_connections"),
+                # Network Interfaces (1 scenario)
+                scenario("scan_network_interface_orphaned", "network_interface_orphaned"),
+            ]
+
+        return await self._run_scenarios(region, scenarios, incremental)
 
     async def scan_unassigned_ips(self, region: str, detection_rules: dict | None = None) -> list[OrphanResourceData]:
         """
@@ -1376,8 +1177,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan public IP resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
 
@@ -1385,17 +1184,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            # Initialize Azure clients
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all public IPs in the subscription
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 # Filter by region (Azure uses 'location')
@@ -1490,23 +1280,16 @@ class AzureProvider(CloudProviderBase):
             List of orphan disk resources on stopped VMs
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_stopped_days = detection_rules.get("min_stopped_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all VMs in the region
-            vms = compute_client.virtual_machines.list_all()
+            vms = self.inventory.list_resources("virtual_machines", region)
 
             for vm in vms:
                 if vm.location != region:
@@ -1659,7 +1442,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan snapshot resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
         from azure.core.exceptions import ResourceNotFoundError
 
@@ -1667,16 +1449,10 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 90) if detection_rules else 90
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all snapshots
-            snapshots = compute_client.snapshots.list()
+            snapshots = self.inventory.list_resources("snapshots", region)
 
             for snapshot in snapshots:
                 if snapshot.location != region:
@@ -1774,8 +1550,6 @@ class AzureProvider(CloudProviderBase):
             List of redundant snapshot resources (keeping newest N, flagging rest)
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -1784,16 +1558,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 90) if detection_rules else 90
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all snapshots
-            snapshots = list(compute_client.snapshots.list())
+            snapshots = list(self.inventory.list_resources("snapshots", region))
 
             # Filter by region
             region_snapshots = [s for s in snapshots if s.location == region]
@@ -1915,7 +1681,6 @@ class AzureProvider(CloudProviderBase):
             List of very old snapshot resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
         from azure.core.exceptions import ResourceNotFoundError
 
@@ -1927,16 +1692,10 @@ class AzureProvider(CloudProviderBase):
         exclude_tags_list = detection_rules.get("exclude_tags", ["keep", "permanent", "archive", "compliance", "DR"]) if detection_rules else ["keep", "permanent", "archive", "compliance", "DR"]
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all snapshots
-            snapshots = compute_client.snapshots.list()
+            snapshots = self.inventory.list_resources("snapshots", region)
 
             for snapshot in snapshots:
                 # Filter by region
@@ -2072,7 +1831,6 @@ class AzureProvider(CloudProviderBase):
             List of large Premium source snapshot resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
         from azure.core.exceptions import ResourceNotFoundError
 
@@ -2083,16 +1841,10 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all snapshots
-            snapshots = compute_client.snapshots.list()
+            snapshots = self.inventory.list_resources("snapshots", region)
 
             for snapshot in snapshots:
                 # Filter by region
@@ -2154,7 +1906,7 @@ class AzureProvider(CloudProviderBase):
                 if source_disk_exists and snapshot.creation_data and snapshot.creation_data.source_resource_id:
                     source_disk_id = snapshot.creation_data.source_resource_id
                     # Count snapshots from same source
-                    all_snaps = list(compute_client.snapshots.list())
+                    all_snaps = list(self.inventory.list_resources("snapshots"))
                     for snap in all_snaps:
                         if snap.creation_data and snap.creation_data.source_resource_id == source_disk_id:
                             total_snapshots_count += 1
@@ -2234,7 +1986,6 @@ class AzureProvider(CloudProviderBase):
             List of large unused snapshot resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
         from azure.core.exceptions import ResourceNotFoundError
 
@@ -2245,16 +1996,10 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 90) if detection_rules else 90
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all snapshots
-            snapshots = compute_client.snapshots.list()
+            snapshots = self.inventory.list_resources("snapshots", region)
 
             for snapshot in snapshots:
                 # Filter by region
@@ -2398,8 +2143,6 @@ class AzureProvider(CloudProviderBase):
             List of disks using full snapshots instead of incremental (grouped by source disk)
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -2409,16 +2152,8 @@ class AzureProvider(CloudProviderBase):
         assumed_change_rate = detection_rules.get("assumed_change_rate", 0.10) if detection_rules else 0.10  # 10% default
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all snapshots
-            all_snapshots = list(compute_client.snapshots.list())
+            all_snapshots = list(self.inventory.list_resources("snapshots", region))
 
             # Filter by region
             region_snapshots = [s for s in all_snapshots if s.location == region]
@@ -2569,8 +2304,6 @@ class AzureProvider(CloudProviderBase):
             List of disks with excessive snapshot retention (one entry per disk)
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -2580,16 +2313,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all snapshots
-            all_snapshots = list(compute_client.snapshots.list())
+            all_snapshots = list(self.inventory.list_resources("snapshots", region))
 
             # Filter by region
             region_snapshots = [s for s in all_snapshots if s.location == region]
@@ -2696,17 +2421,13 @@ class AzureProvider(CloudProviderBase):
     ) -> list[OrphanResourceData]:
         """Scan for manual snapshots without rotation policy (>10 manual snapshots risk infinite accumulation)."""
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         max_manual_snapshots = detection_rules.get("max_manual_snapshots", 10) if detection_rules else 10
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(self.tenant_id, self.client_id, self.client_secret)
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            all_snapshots = list(compute_client.snapshots.list())
+            all_snapshots = list(self.inventory.list_resources("snapshots", region))
             region_snapshots = [s for s in all_snapshots if s.location == region and self._is_resource_in_scope(s.id)]
 
             snapshots_by_source: dict[str, list] = {}
@@ -2760,17 +2481,13 @@ class AzureProvider(CloudProviderBase):
     ) -> list[OrphanResourceData]:
         """Scan for snapshots never restored since 90+ days (check via tags)."""
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_never_restored_days = detection_rules.get("min_never_restored_days", 90) if detection_rules else 90
         exclude_tags = detection_rules.get("exclude_tags", ["DR", "disaster-recovery", "archive", "compliance"]) if detection_rules else ["DR", "disaster-recovery", "archive", "compliance"]
 
         try:
-            credential = ClientSecretCredential(self.tenant_id, self.client_id, self.client_secret)
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            snapshots = compute_client.snapshots.list()
+            snapshots = self.inventory.list_resources("snapshots", region)
 
             for snapshot in snapshots:
                 if snapshot.location != region or not self._is_resource_in_scope(snapshot.id):
@@ -2816,17 +2533,13 @@ class AzureProvider(CloudProviderBase):
     ) -> list[OrphanResourceData]:
         """Scan for snapshots created too frequently (>1/day) - daily vs weekly = 86% savings."""
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         max_frequency_days = detection_rules.get("max_frequency_days", 1.0) if detection_rules else 1.0
         observation_period_days = detection_rules.get("observation_period_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(self.tenant_id, self.client_id, self.client_secret)
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            all_snapshots = list(compute_client.snapshots.list())
+            all_snapshots = list(self.inventory.list_resources("snapshots", region))
             region_snapshots = [s for s in all_snapshots if s.location == region and self._is_resource_in_scope(s.id)]
 
             snapshots_by_source: dict[str, list] = {}
@@ -2903,8 +2616,6 @@ class AzureProvider(CloudProviderBase):
             List of ZRS disk resources in non-production environments
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -2913,16 +2624,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region
@@ -3040,8 +2743,6 @@ class AzureProvider(CloudProviderBase):
             List of disks with unnecessary CMK encryption
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -3050,16 +2751,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region
@@ -3165,7 +2858,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan public IP resources on stopped resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.network import NetworkManagementClient
         from azure.mgmt.compute import ComputeManagementClient
 
@@ -3173,17 +2865,11 @@ class AzureProvider(CloudProviderBase):
         min_stopped_days = detection_rules.get("min_stopped_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all public IPs in the region
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3325,23 +3011,13 @@ class AzureProvider(CloudProviderBase):
             List of orphan dynamic public IP resources stuck in anomalous state
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all public IPs in the region
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3420,23 +3096,16 @@ class AzureProvider(CloudProviderBase):
             List of orphan public IP resources on orphaned NICs
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
 
             # List all public IPs
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3529,23 +3198,13 @@ class AzureProvider(CloudProviderBase):
             List of orphan reserved but unused public IP resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all public IPs
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3619,8 +3278,6 @@ class AzureProvider(CloudProviderBase):
             List of public IP resources using unnecessary Standard SKU
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
@@ -3629,16 +3286,8 @@ class AzureProvider(CloudProviderBase):
         ]) if detection_rules else ["dev", "test", "staging", "qa", "development", "non-prod", "sandbox"]
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all public IPs
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3739,8 +3388,6 @@ class AzureProvider(CloudProviderBase):
             List of public IP resources with unnecessary zone redundancy
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
@@ -3749,16 +3396,8 @@ class AzureProvider(CloudProviderBase):
         ]) if detection_rules else ["ha", "high-availability", "production", "critical", "tier:production", "prod"]
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all public IPs
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3853,23 +3492,13 @@ class AzureProvider(CloudProviderBase):
             List of public IP resources with unused DDoS Protection Standard
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
         min_observation_days = detection_rules.get("min_observation_days", 90) if detection_rules else 90
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all public IPs
-            public_ips = network_client.public_ip_addresses.list_all()
+            public_ips = self.inventory.list_resources("public_ip_addresses", region)
 
             for ip in public_ips:
                 if ip.location != region:
@@ -3988,19 +3617,8 @@ class AzureProvider(CloudProviderBase):
                 return orphans
 
             # Setup Azure credentials
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all Public IPs in subscription
-            public_ips = list(network_client.public_ip_addresses.list_all())
+            public_ips = list(self.inventory.list_resources("public_ip_addresses", region))
 
             for ip in public_ips:
                 # Skip if wrong region
@@ -4065,6 +3683,7 @@ class AzureProvider(CloudProviderBase):
                     orphans.append(orphan)
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning zero-traffic Public IPs in {region}: {str(e)}")
 
         return orphans
@@ -4121,19 +3740,8 @@ class AzureProvider(CloudProviderBase):
             traffic_threshold_bytes = traffic_threshold_gb * 1024 * 1024 * 1024  # 1 GB = 1,073,741,824 bytes
 
             # Setup Azure credentials
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # List all Public IPs in subscription
-            public_ips = list(network_client.public_ip_addresses.list_all())
+            public_ips = list(self.inventory.list_resources("public_ip_addresses", region))
 
             for ip in public_ips:
                 # Skip if wrong region
@@ -4210,6 +3818,7 @@ class AzureProvider(CloudProviderBase):
                     orphans.append(orphan)
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning very-low-traffic Public IPs in {region}: {str(e)}")
 
         return orphans
@@ -4287,21 +3896,14 @@ class AzureProvider(CloudProviderBase):
             List of deallocated VM resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_stopped_days = detection_rules.get("min_stopped_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -4424,21 +4026,14 @@ class AzureProvider(CloudProviderBase):
             List of stopped (not deallocated) VM resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_stopped_days = detection_rules.get("min_stopped_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -4537,7 +4132,6 @@ class AzureProvider(CloudProviderBase):
             List of VM resources that have never been started
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
@@ -4546,16 +4140,10 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # Get all VMs across all resource groups
-            vms = list(compute_client.virtual_machines.list_all())
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -4701,7 +4289,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of oversized VM resources with premium disks
         """
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
@@ -4711,16 +4298,10 @@ class AzureProvider(CloudProviderBase):
         disk_tier = detection_rules.get("disk_tier", "Premium_LRS") if detection_rules else "Premium_LRS"
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # Get all VMs
-            vms = list(compute_client.virtual_machines.list_all())
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -4888,7 +4469,6 @@ class AzureProvider(CloudProviderBase):
             List of untagged VM resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
@@ -4898,16 +4478,10 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # Get all VMs
-            vms = list(compute_client.virtual_machines.list_all())
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -5047,8 +4621,6 @@ class AzureProvider(CloudProviderBase):
             List of VMs using old generation SKUs
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -5066,14 +4638,7 @@ class AzureProvider(CloudProviderBase):
         }
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -5216,8 +4781,6 @@ class AzureProvider(CloudProviderBase):
             List of VMs eligible for Spot conversion
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -5231,14 +4794,7 @@ class AzureProvider(CloudProviderBase):
         exclude_ha_vms = detection_rules.get("exclude_ha_vms", True) if detection_rules else True
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -5386,7 +4942,6 @@ class AzureProvider(CloudProviderBase):
             List of underutilized VMs with rightsizing recommendations
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
         import re
 
@@ -5398,14 +4953,8 @@ class AzureProvider(CloudProviderBase):
         max_p95_cpu_percent = detection_rules.get("max_p95_cpu_percent", 40.0) if detection_rules else 40.0
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -5423,6 +4972,7 @@ class AzureProvider(CloudProviderBase):
                         vm_name=vm.name
                     )
                 except Exception as e:
+                    record_scenario_error(e)
                     print(f"Error getting instance view for VM {vm.name}: {str(e)}")
                     continue
 
@@ -5542,10 +5092,12 @@ class AzureProvider(CloudProviderBase):
                     ))
 
                 except Exception as e:
+                    record_scenario_error(e)
                     print(f"Error querying metrics for VM {vm.name}: {str(e)}")
                     continue
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning underutilized VMs in {region}: {str(e)}")
 
         return orphans
@@ -5579,7 +5131,6 @@ class AzureProvider(CloudProviderBase):
             List of memory-overprovisioned VMs
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
@@ -5590,14 +5141,8 @@ class AzureProvider(CloudProviderBase):
         memory_optimized_series = detection_rules.get("memory_optimized_series", ["E", "M", "G"]) if detection_rules else ["E", "M", "G"]
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -5629,6 +5174,7 @@ class AzureProvider(CloudProviderBase):
                         vm_name=vm.name
                     )
                 except Exception as e:
+                    record_scenario_error(e)
                     print(f"Error getting instance view for VM {vm.name}: {str(e)}")
                     continue
 
@@ -5746,11 +5292,13 @@ class AzureProvider(CloudProviderBase):
                     ))
 
                 except Exception as e:
+                    record_scenario_error(e)
                     print(f"Error querying memory metrics for VM {vm.name}: {str(e)}")
                     # Note: If agent not installed, this will fail silently and VM will be skipped
                     continue
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning memory-overprovisioned VMs in {region}: {str(e)}")
 
         return orphans
@@ -5785,16 +5333,9 @@ class AzureProvider(CloudProviderBase):
         """
         from datetime import datetime, timedelta, timezone
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
-        from azure.identity import ClientSecretCredential
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # Calculate timespan
             end_time = datetime.now(timezone.utc)
@@ -5845,6 +5386,7 @@ class AzureProvider(CloudProviderBase):
             return results
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error querying Azure Monitor metrics for {disk_id}: {str(e)}")
             # Return zeros if metrics unavailable
             return {name: 0.0 for name in metric_names}
@@ -5881,16 +5423,9 @@ class AzureProvider(CloudProviderBase):
         """
         from datetime import datetime, timedelta, timezone
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
-        from azure.identity import ClientSecretCredential
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # Calculate timespan
             end_time = datetime.now(timezone.utc)
@@ -5944,6 +5479,7 @@ class AzureProvider(CloudProviderBase):
             return results
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error querying Azure Monitor metrics for Public IP {ip_id}: {str(e)}")
             # Return zeros if metrics unavailable
             return {name: 0.0 for name in metric_names}
@@ -5986,16 +5522,9 @@ class AzureProvider(CloudProviderBase):
         """
         from datetime import datetime, timedelta, timezone
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
-        from azure.identity import ClientSecretCredential
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # Calculate timespan
             end_time = datetime.now(timezone.utc)
@@ -6051,6 +5580,7 @@ class AzureProvider(CloudProviderBase):
             return results
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error querying Azure Monitor metrics for VM {vm_id}: {str(e)}")
             # Return zeros if metrics unavailable
             return {name: 0.0 for name in metric_names}
@@ -6080,24 +5610,14 @@ class AzureProvider(CloudProviderBase):
             List of idle disk resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_idle_days = detection_rules.get("min_idle_days", 60) if detection_rules else 60
         max_iops_threshold = detection_rules.get("max_iops_threshold", 0.1) if detection_rules else 0.1
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region
@@ -6168,6 +5688,7 @@ class AzureProvider(CloudProviderBase):
                     orphans.append(orphan)
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning idle disks in {region}: {str(e)}")
 
         return orphans
@@ -6198,24 +5719,14 @@ class AzureProvider(CloudProviderBase):
             List of disks with unused bursting feature
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_observation_days = detection_rules.get("min_observation_days", 30) if detection_rules else 30
         max_burst_usage = detection_rules.get("max_burst_usage_percent", 0.01) if detection_rules else 0.01
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region
@@ -6302,6 +5813,7 @@ class AzureProvider(CloudProviderBase):
                     orphans.append(orphan)
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning unused bursting in {region}: {str(e)}")
 
         return orphans
@@ -6334,8 +5846,6 @@ class AzureProvider(CloudProviderBase):
             List of over-provisioned disk resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_observation_days = detection_rules.get("min_observation_days", 30) if detection_rules else 30
@@ -6355,16 +5865,8 @@ class AzureProvider(CloudProviderBase):
         ]
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region
@@ -6481,6 +5983,7 @@ class AzureProvider(CloudProviderBase):
                             orphans.append(orphan)
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning overprovisioned disks in {region}: {str(e)}")
 
         return orphans
@@ -6514,8 +6017,6 @@ class AzureProvider(CloudProviderBase):
             List of under-utilized HDD disk resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
         min_observation_days = detection_rules.get("min_observation_days", 30) if detection_rules else 30
@@ -6534,16 +6035,8 @@ class AzureProvider(CloudProviderBase):
         ]
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # List all disks
-            disks = compute_client.disks.list()
+            disks = self.inventory.list_resources("disks", region)
 
             for disk in disks:
                 # Filter by region
@@ -6637,6 +6130,7 @@ class AzureProvider(CloudProviderBase):
                         orphans.append(orphan)
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning underutilized HDD disks in {region}: {str(e)}")
 
         return orphans
@@ -6671,7 +6165,6 @@ class AzureProvider(CloudProviderBase):
             List of idle VM resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
@@ -6682,14 +6175,8 @@ class AzureProvider(CloudProviderBase):
         max_network_mb_per_day = detection_rules.get("max_network_mb_per_day", 7.0) if detection_rules else 7.0
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            vms = list(compute_client.virtual_machines.list_all())
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
+            vms = list(self.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 if vm.location != region:
@@ -6707,6 +6194,7 @@ class AzureProvider(CloudProviderBase):
                         vm_name=vm.name
                     )
                 except Exception as e:
+                    record_scenario_error(e)
                     print(f"Error getting instance view for VM {vm.name}: {str(e)}")
                     continue
 
@@ -6795,10 +6283,12 @@ class AzureProvider(CloudProviderBase):
                         ))
 
                 except Exception as e:
+                    record_scenario_error(e)
                     print(f"Error querying metrics for VM {vm.name}: {str(e)}")
                     continue
 
         except Exception as e:
+            record_scenario_error(e)
             print(f"Error scanning idle VMs in {region}: {str(e)}")
 
         return orphans
@@ -6831,28 +6321,14 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Load Balancers with no backend instances
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         # Extract detection rules with defaults
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all Load Balancers across subscription
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.inventory.list_resources("load_balancers", region))
 
             for lb in load_balancers:
                 # Filter by region
@@ -6990,25 +6466,11 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Load Balancers with retired Basic SKU
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         try:
-            # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all Load Balancers across subscription
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.inventory.list_resources("load_balancers", region))
 
             for lb in load_balancers:
                 # Filter by region
@@ -7111,8 +6573,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Application Gateways with no backend targets
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
         from datetime import datetime, timezone
 
         orphans = []
@@ -7121,19 +6581,8 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all Application Gateways across subscription
-            app_gateways = list(network_client.application_gateways.list_all())
+            app_gateways = list(self.inventory.list_resources("application_gateways", region))
 
             for appgw in app_gateways:
                 # Filter by region
@@ -7296,8 +6745,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Application Gateways with no HTTP requests
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
         from datetime import datetime, timedelta, timezone
 
@@ -7309,19 +6756,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # List all Application Gateways across subscription
-            app_gateways = list(network_client.application_gateways.list_all())
+            app_gateways = list(self.inventory.list_resources("application_gateways", region))
 
             # Calculate timespan for metrics
             end_time = datetime.now(timezone.utc)
@@ -7547,8 +6985,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Load Balancers with no traffic
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
         from datetime import datetime, timedelta, timezone
 
@@ -7561,19 +6997,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # List all Load Balancers across subscription
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.inventory.list_resources("load_balancers", region))
 
             # Calculate timespan for metrics
             end_time = datetime.now(timezone.utc)
@@ -7799,8 +7226,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of underutilized Application Gateways with optimization recommendations
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
         from datetime import datetime, timedelta, timezone
 
@@ -7813,19 +7238,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # List all Application Gateways across subscription
-            app_gateways = list(network_client.application_gateways.list_all())
+            app_gateways = list(self.inventory.list_resources("application_gateways", region))
 
             # Calculate timespan for metrics
             end_time = datetime.now(timezone.utc)
@@ -8072,7 +7488,6 @@ class AzureProvider(CloudProviderBase):
             List of Load Balancers with all backends unhealthy
         """
         from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
 
         orphans = []
 
@@ -8082,18 +7497,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
 
             # List all Load Balancers
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.inventory.list_resources("load_balancers", region))
 
             for lb in load_balancers:
                 # Filter by region
@@ -8227,9 +7634,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Load Balancers with no routing rules
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         # Extract detection rules with defaults
@@ -8237,18 +7641,8 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all Load Balancers
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.inventory.list_resources("load_balancers", region))
 
             for lb in load_balancers:
                 # Filter by region
@@ -8361,9 +7755,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of stopped Application Gateways
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         # Extract detection rules with defaults
@@ -8371,18 +7762,8 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all Application Gateways
-            app_gateways = list(network_client.application_gateways.list_all())
+            app_gateways = list(self.inventory.list_resources("application_gateways", region))
 
             for appgw in app_gateways:
                 # Filter by region
@@ -8487,9 +7868,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of Load Balancers that appear to have never been used
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         # Extract detection rules with defaults
@@ -8497,18 +7875,8 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credentials
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all Load Balancers
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.inventory.list_resources("load_balancers", region))
 
             for lb in load_balancers:
                 # Filter by region
@@ -8639,23 +8007,16 @@ class AzureProvider(CloudProviderBase):
             List of orphan SQL Database resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.sql import SqlManagementClient
 
         orphans = []
         min_age_days = detection_rules.get("min_age_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            sql_client = SqlManagementClient(credential, self.subscription_id)
+            sql_client = self._azure_client(SqlManagementClient, self.subscription_id)
 
             # List all SQL servers
-            for server in sql_client.servers.list():
+            for server in self.inventory.list_resources("sql_servers", region):
                 if server.location != region:
                     continue
 
@@ -8732,7 +8093,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan SQL Database resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.sql import SqlManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
@@ -8741,19 +8101,13 @@ class AzureProvider(CloudProviderBase):
         monitoring_days = detection_rules.get("monitoring_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            sql_client = SqlManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            sql_client = self._azure_client(SqlManagementClient, self.subscription_id)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for server in sql_client.servers.list():
+            for server in self.inventory.list_resources("sql_servers", region):
                 if server.location != region:
                     continue
 
@@ -8839,7 +8193,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan SQL Database resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.sql import SqlManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
@@ -8849,19 +8202,13 @@ class AzureProvider(CloudProviderBase):
         max_utilization = detection_rules.get("max_dtu_utilization_percent", 30.0) if detection_rules else 30.0
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            sql_client = SqlManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            sql_client = self._azure_client(SqlManagementClient, self.subscription_id)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for server in sql_client.servers.list():
+            for server in self.inventory.list_resources("sql_servers", region):
                 if server.location != region:
                     continue
 
@@ -8955,7 +8302,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan SQL Database resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.sql import SqlManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
@@ -8964,19 +8310,13 @@ class AzureProvider(CloudProviderBase):
         monitoring_days = detection_rules.get("monitoring_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            sql_client = SqlManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            sql_client = self._azure_client(SqlManagementClient, self.subscription_id)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for server in sql_client.servers.list():
+            for server in self.inventory.list_resources("sql_servers", region):
                 if server.location != region:
                     continue
 
@@ -9059,8 +8399,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan Cosmos DB resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.cosmosdb import CosmosDBManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
         orphans = []
@@ -9069,19 +8407,12 @@ class AzureProvider(CloudProviderBase):
         max_utilization = detection_rules.get("max_ru_utilization_percent", 30.0) if detection_rules else 30.0
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            cosmos_client = CosmosDBManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for account in cosmos_client.database_accounts.list():
+            for account in self.inventory.list_resources("cosmosdb_accounts", region):
                 if account.location != region:
                     continue
 
@@ -9155,8 +8486,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan Cosmos DB container resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.cosmosdb import CosmosDBManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
         orphans = []
@@ -9164,19 +8493,12 @@ class AzureProvider(CloudProviderBase):
         monitoring_days = detection_rules.get("monitoring_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            cosmos_client = CosmosDBManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for account in cosmos_client.database_accounts.list():
+            for account in self.inventory.list_resources("cosmosdb_accounts", region):
                 if account.location != region:
                     continue
 
@@ -9244,8 +8566,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan Cosmos DB resources with hot partition issues
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.cosmosdb import CosmosDBManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
         orphans = []
@@ -9254,19 +8574,12 @@ class AzureProvider(CloudProviderBase):
         hot_threshold = detection_rules.get("hot_partition_threshold_percent", 80.0) if detection_rules else 80.0
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            cosmos_client = CosmosDBManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for account in cosmos_client.database_accounts.list():
+            for account in self.inventory.list_resources("cosmosdb_accounts", region):
                 if account.location != region:
                     continue
 
@@ -9333,7 +8646,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan PostgreSQL/MySQL resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.rdbms.postgresql_flexibleservers import PostgreSQLManagementClient as PGFlexClient
         from azure.mgmt.rdbms.mysql_flexibleservers import MySQLManagementClient as MySQLFlexClient
 
@@ -9341,14 +8653,8 @@ class AzureProvider(CloudProviderBase):
         min_stopped_days = detection_rules.get("min_stopped_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
             # Scan PostgreSQL
-            pg_client = PGFlexClient(credential, self.subscription_id)
+            pg_client = self._azure_client(PGFlexClient, self.subscription_id)
             for server in pg_client.servers.list():
                 if server.location != region:
                     continue
@@ -9377,7 +8683,7 @@ class AzureProvider(CloudProviderBase):
                     orphans.append(orphan)
 
             # Scan MySQL
-            mysql_client = MySQLFlexClient(credential, self.subscription_id)
+            mysql_client = self._azure_client(MySQLFlexClient, self.subscription_id)
             for server in mysql_client.servers.list():
                 if server.location != region:
                     continue
@@ -9475,20 +8781,13 @@ class AzureProvider(CloudProviderBase):
             List of orphan Synapse SQL pool resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.synapse import SynapseManagementClient
 
         orphans = []
         min_paused_days = detection_rules.get("min_paused_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            synapse_client = SynapseManagementClient(credential, self.subscription_id)
+            synapse_client = self._azure_client(SynapseManagementClient, self.subscription_id)
 
             for workspace in synapse_client.workspaces.list():
                 if workspace.location != region:
@@ -9559,8 +8858,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan Redis cache resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.redis import RedisManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
         orphans = []
@@ -9568,19 +8865,12 @@ class AzureProvider(CloudProviderBase):
         monitoring_days = detection_rules.get("monitoring_days", 30) if detection_rules else 30
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            redis_client = RedisManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for cache in redis_client.redis.list():
+            for cache in self.inventory.list_resources("redis_caches", region):
                 if cache.location != region:
                     continue
 
@@ -9647,8 +8937,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan Redis cache resources
         """
         from datetime import datetime, timezone, timedelta
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.redis import RedisManagementClient
         from azure.monitor.query import MetricsQueryClient, MetricAggregationType
 
         orphans = []
@@ -9657,19 +8945,12 @@ class AzureProvider(CloudProviderBase):
         max_memory = detection_rules.get("max_memory_utilization_percent", 30.0) if detection_rules else 30.0
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            redis_client = RedisManagementClient(credential, self.subscription_id)
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=monitoring_days)
 
-            for cache in redis_client.redis.list():
+            for cache in self.inventory.list_resources("redis_caches", region):
                 if cache.location != region:
                     continue
 
@@ -9755,8 +9036,6 @@ class AzureProvider(CloudProviderBase):
             List of NAT Gateways without subnets
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.network import NetworkManagementClient
 
         orphans = []
 
@@ -9764,14 +9043,7 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 if nat_gw.location != region:
@@ -9874,9 +9146,7 @@ class AzureProvider(CloudProviderBase):
             List of never-used NAT Gateways
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.network import NetworkManagementClient
-        from azure.mgmt.compute import ComputeManagementClient
 
         orphans = []
 
@@ -9884,16 +9154,9 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 14) if detection_rules else 14
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
 
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 if nat_gw.location != region:
@@ -9919,7 +9182,7 @@ class AzureProvider(CloudProviderBase):
 
                     # Get all VMs and check if they're in this subnet
                     try:
-                        vms = list(compute_client.virtual_machines.list_all())
+                        vms = list(self.inventory.list_resources("virtual_machines"))
                         for vm in vms:
                             if vm.network_profile and vm.network_profile.network_interfaces:
                                 for nic_ref in vm.network_profile.network_interfaces:
@@ -10027,9 +9290,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of NAT Gateways without Public IP addresses
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         # Extract detection rules with defaults
@@ -10038,19 +9298,8 @@ class AzureProvider(CloudProviderBase):
         )
 
         try:
-            # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -10172,8 +9421,6 @@ class AzureProvider(CloudProviderBase):
             List of NAT Gateways used by only a single VM
         """
         from azure.mgmt.network import NetworkManagementClient
-        from azure.mgmt.compute import ComputeManagementClient
-        from azure.identity import ClientSecretCredential
 
         orphans = []
 
@@ -10184,21 +9431,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credential and clients
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            compute_client = ComputeManagementClient(
-                credential, self.subscription_id
-            )
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
 
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -10396,8 +9632,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of redundant NAT Gateways in same VNet
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
         from collections import defaultdict
 
         orphans = []
@@ -10408,19 +9642,8 @@ class AzureProvider(CloudProviderBase):
         )
 
         try:
-            # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             # Filter by region and scope
             filtered_nat_gws = []
@@ -10599,9 +9822,6 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of dev/test NAT Gateways running 24/7
         """
-        from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
-
         orphans = []
 
         # Extract detection rules with defaults
@@ -10615,19 +9835,8 @@ class AzureProvider(CloudProviderBase):
         )
 
         try:
-            # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -10821,7 +10030,6 @@ class AzureProvider(CloudProviderBase):
         """
         from azure.mgmt.network import NetworkManagementClient
         from azure.mgmt.compute import ComputeManagementClient
-        from azure.identity import ClientSecretCredential
 
         orphans = []
 
@@ -10832,21 +10040,11 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credential and clients
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            compute_client = ComputeManagementClient(
-                credential, self.subscription_id
-            )
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
+            compute_client = self._azure_client(ComputeManagementClient, self.subscription_id)
 
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -11077,9 +10275,7 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of NAT Gateways with zero traffic
         """
-        from azure.mgmt.network import NetworkManagementClient
         from azure.monitor.query import MetricsQueryClient
-        from azure.identity import ClientSecretCredential
         from datetime import datetime, timedelta
 
         orphans = []
@@ -11096,19 +10292,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credential and clients
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -11272,9 +10459,7 @@ class AzureProvider(CloudProviderBase):
         Returns:
             List of NAT Gateways with very low traffic
         """
-        from azure.mgmt.network import NetworkManagementClient
         from azure.monitor.query import MetricsQueryClient
-        from azure.identity import ClientSecretCredential
         from datetime import datetime, timedelta
 
         orphans = []
@@ -11296,19 +10481,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credential and clients
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -11503,7 +10679,6 @@ class AzureProvider(CloudProviderBase):
             List of NAT Gateways where Private Link is a better alternative
         """
         from azure.mgmt.network import NetworkManagementClient
-        from azure.identity import ClientSecretCredential
 
         orphans = []
 
@@ -11514,18 +10689,10 @@ class AzureProvider(CloudProviderBase):
 
         try:
             # Create Azure credential and network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            network_client = NetworkManagementClient(
-                credential, self.subscription_id
-            )
+            network_client = self._azure_client(NetworkManagementClient, self.subscription_id)
 
             # List all NAT Gateways across subscription
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.inventory.list_resources("nat_gateways", region))
 
             for nat_gw in nat_gateways:
                 # Filter by region
@@ -12661,7 +11828,6 @@ class AzureProvider(CloudProviderBase):
             List of orphan AKS cluster resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.containerservice import ContainerServiceClient
 
         orphans: list[OrphanResourceData] = []
@@ -12670,16 +11836,10 @@ class AzureProvider(CloudProviderBase):
         min_age_days = detection_rules.get("min_age_days", 7) if detection_rules else 7
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            aks_client = ContainerServiceClient(credential, self.subscription_id)
+            aks_client = self._azure_client(ContainerServiceClient, self.subscription_id)
 
             # List all AKS clusters in the subscription
-            clusters = aks_client.managed_clusters.list()
+            clusters = self.inventory.list_resources("managed_clusters", region)
 
             for cluster in clusters:
                 # Filter by region (Azure uses 'location')
@@ -12951,17 +12111,10 @@ class AzureProvider(CloudProviderBase):
             Dict with aggregated metrics
         """
         from datetime import datetime, timedelta, timezone
-        from azure.identity import ClientSecretCredential
         from azure.monitor.query import MetricsQueryClient
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            metrics_client = MetricsQueryClient(credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             end_time = datetime.now(timezone.utc)
             start_time = end_time - timedelta(days=days)
@@ -13040,7 +12193,6 @@ class AzureProvider(CloudProviderBase):
             OrphanResourceData if waste detected, None otherwise
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.storage.blob import BlobServiceClient
 
         min_age_days = detection_rules.get("min_age_days", 30)
@@ -13060,11 +12212,7 @@ class AzureProvider(CloudProviderBase):
                 return None
 
             # Connect to Blob Service
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
+            credential = self.credential
 
             account_url = f"https://{storage_account.name}.blob.core.windows.net"
             blob_service_client = BlobServiceClient(account_url, credential=credential)
@@ -13131,7 +12279,6 @@ class AzureProvider(CloudProviderBase):
             OrphanResourceData if waste detected, None otherwise
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.storage import StorageManagementClient
 
         min_size_threshold = detection_rules.get("min_size_threshold", 100)  # GB
@@ -13156,13 +12303,7 @@ class AzureProvider(CloudProviderBase):
                     return None
 
             # Check if lifecycle management policy exists
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            storage_client = StorageManagementClient(credential, self.subscription_id)
+            storage_client = self._azure_client(StorageManagementClient, self.subscription_id)
 
             # Parse resource group from storage account ID
             parts = storage_account.id.split('/')
@@ -13231,7 +12372,6 @@ class AzureProvider(CloudProviderBase):
             List of OrphanResourceData (can return multiple container-level detections)
         """
         from datetime import datetime, timedelta, timezone
-        from azure.identity import ClientSecretCredential
         from azure.storage.blob import BlobServiceClient
 
         orphans = []
@@ -13245,11 +12385,7 @@ class AzureProvider(CloudProviderBase):
             if access_tier != "Hot":
                 return orphans
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
+            credential = self.credential
 
             account_url = f"https://{storage_account.name}.blob.core.windows.net"
             blob_service_client = BlobServiceClient(account_url, credential=credential)
@@ -13537,18 +12673,13 @@ class AzureProvider(CloudProviderBase):
         self, storage_account, detection_rules: dict
     ) -> OrphanResourceData | None:
         """Detect soft-deleted blobs with retention too long (>30 days)."""
-        from azure.identity import ClientSecretCredential
         from azure.storage.blob import BlobServiceClient
 
         max_retention_days = detection_rules.get("max_retention_days", 30)
         min_deleted_size_gb = detection_rules.get("min_deleted_size_gb", 10)
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
+            credential = self.credential
 
             account_url = f"https://{storage_account.name}.blob.core.windows.net"
             blob_service_client = BlobServiceClient(account_url, credential=credential)
@@ -13602,18 +12733,13 @@ class AzureProvider(CloudProviderBase):
         self, storage_account, detection_rules: dict
     ) -> OrphanResourceData | None:
         """Detect blob versioning with excessive versions accumulated (>20 per blob)."""
-        from azure.identity import ClientSecretCredential
         from azure.storage.blob import BlobServiceClient
 
         max_versions_per_blob = detection_rules.get("max_versions_per_blob", 5)
         min_age_days = detection_rules.get("min_age_days", 30)
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
+            credential = self.credential
 
             account_url = f"https://{storage_account.name}.blob.core.windows.net"
             blob_service_client = BlobServiceClient(account_url, credential=credential)
@@ -13729,8 +12855,6 @@ class AzureProvider(CloudProviderBase):
             List of all detected orphan storage resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
-        from azure.mgmt.storage import StorageManagementClient
         from azure.storage.blob import BlobServiceClient
 
         orphans: list[OrphanResourceData] = []
@@ -13739,16 +12863,10 @@ class AzureProvider(CloudProviderBase):
         rules = detection_rules or {}
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            storage_client = StorageManagementClient(credential, self.subscription_id)
+            credential = self.credential
 
             # List all Storage Accounts
-            storage_accounts = storage_client.storage_accounts.list()
+            storage_accounts = self.inventory.list_resources("storage_accounts")
 
             for account in storage_accounts:
                 # Filter by resource group scope
@@ -13890,7 +13008,6 @@ class AzureProvider(CloudProviderBase):
             List of all detected orphan file share resources
         """
         from datetime import datetime, timezone
-        from azure.identity import ClientSecretCredential
         from azure.mgmt.storage import StorageManagementClient
         from azure.storage.fileshare import ShareServiceClient
 
@@ -13900,16 +13017,10 @@ class AzureProvider(CloudProviderBase):
         rules = detection_rules or {}
 
         try:
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-
-            storage_client = StorageManagementClient(credential, self.subscription_id)
+            storage_client = self._azure_client(StorageManagementClient, self.subscription_id)
 
             # List all Storage Accounts
-            storage_accounts = storage_client.storage_accounts.list()
+            storage_accounts = self.inventory.list_resources("storage_accounts")
 
             for account in storage_accounts:
                 # Filter by resource group scope
@@ -15428,7 +14539,7 @@ class AzureProvider(CloudProviderBase):
             all_function_apps = []
 
             try:
-                for function_app in self.web_client.web_apps.list():
+                for function_app in self.inventory.list_resources("web_apps", region):
                     # Filter Function Apps
                     if function_app.kind and "functionapp" in function_app.kind.lower():
                         # Filter by region if specified
@@ -15650,7 +14761,7 @@ class AzureProvider(CloudProviderBase):
             from azure.monitor.query import MetricsQueryClient
 
             # Initialize metrics client
-            metrics_client = MetricsQueryClient(self.credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # Calculate time range
             end_time = datetime.now(timezone.utc)
@@ -16617,14 +15728,7 @@ class AzureProvider(CloudProviderBase):
             all_cosmosdb_accounts = []
 
             try:
-                from azure.mgmt.cosmosdb import CosmosDBManagementClient
-
-                # Initialize Cosmos DB client
-                cosmosdb_client = CosmosDBManagementClient(
-                    self.credential, self.subscription_id
-                )
-
-                for account in cosmosdb_client.database_accounts.list():
+                for account in self.inventory.list_resources("cosmosdb_accounts"):
                     # Filter accounts with Table API capability
                     if hasattr(account, "capabilities") and account.capabilities:
                         has_table_api = any(
@@ -16840,7 +15944,7 @@ class AzureProvider(CloudProviderBase):
             from datetime import datetime, timezone
 
             # Create metrics client
-            metrics_client = MetricsQueryClient(self.credential)
+            metrics_client = self._azure_client(MetricsQueryClient)
 
             # Map aggregation string to enum
             aggregation_map = {
@@ -0,0 +1,135 @@
+"""Shared Azure credential, management clients and worker threads for a scan."""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class AzureClientPool:
+    """
+    One credential, one client per (client class, arguments) and a bounded
+    thread pool for the lifetime of a scan.
+
+    The Azure management SDK used by the provider is synchronous: each
+    scenario blocked the event loop for the duration of its HTTP calls, and
+    built a fresh ClientSecretCredential (new token request) and fresh
+    management clients (new connection pool). The pool authenticates once,
+    reuses clients across scenarios and runs scenarios on worker threads so
+    they overlap instead of serializing on the event loop.
+
+    Azure SDK clients and ClientSecretCredential are thread-safe, so pooled
+    instances can be shared between worker threads.
+    """
+
+    def __init__(self, tenant_id: str, client_id: str, client_secret: str, max_workers: int = 8) -> None:
+        """
+        Initialize the pool (credential, clients and threads are created on first use).
+
+        Args:
+            tenant_id: Azure AD Tenant ID
+            client_id: Service Principal Application/Client ID
+            client_secret: Service Principal Client Secret
+            max_workers: Maximum number of scenarios executing at once
+        """
+        self.tenant_id = tenant_id
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.max_workers = max_workers
+
+        self._credential: Any | None = None
+        self._clients: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.clients_created = 0
+
+    @property
+    def credential(self) -> Any:
+        """Shared ClientSecretCredential (caches its access tokens)."""
+        if self._credential is None:
+            with self._lock:
+                if self._credential is None:
+                    from azure.identity import ClientSecretCredential
+
+                    self._credential = ClientSecretCredential(
+                        tenant_id=self.tenant_id,
+                        client_id=self.client_id,
+                        client_secret=self.client_secret,
+                    )
+        return self._credential
+
+    def get_client(self, client_cls: type, *args: Any) -> Any:
+        """
+        Return the pooled client for a client class and arguments, creating it once.
+
+        Args:
+            client_cls: Azure SDK client class (e.g., ComputeManagementClient)
+            *args: Positional arguments following the credential (e.g., subscription ID)
+
+        Returns:
+            Shared client instance
+        """
+        key = (client_cls, args)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        credential = self.credential
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = client_cls(credential, *args)
+                self.clients_created += 1
+            return self._clients[key]
+
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Run a coroutine function that makes blocking SDK calls on a worker thread.
+
+        The coroutine runs to completion in its own event loop on the worker
+        thread, so its blocking calls never stall the caller's loop. It runs
+        in a copy of the caller's context (see contextvars), like asyncio.to_thread.
+
+        Args:
+            func: Coroutine function to run (e.g., a scan scenario method)
+            *args: Arguments passed to func
+
+        Returns:
+            The coroutine's result
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="azure-scan"
+                    )
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor, context.run, lambda: asyncio.run(func(*args))
+        )
+
+    def close(self) -> None:
+        """Stop the worker threads and close every pooled client and the credential."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        with self._lock:
+            if self._clients:
+                logger.info(f"Closing Azure client pool: {self.clients_created} clients")
+            for client in self._clients.values():
+                close = getattr(client, "close", None)
+                if close is not None:
+                    try:
+                        close()
+                    except Exception as e:
+                        logger.debug(f"Error closing Azure client {type(client).__name__}: {e}")
+            self._clients.clear()
+
+            if self._credential is not None:
+                self._credential.close()
+                self._credential = None
@@ -0,0 +1,324 @@
+"""Subscription-wide Azure resource listings shared by every scenario and region of a scan."""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CollectionSpec:
+    """How to list one Azure resource collection for a whole subscription."""
+
+    client: str  # "module:ClientClass" of the management client
+    operation_group: str  # Client attribute holding the operations (e.g., 'disks')
+    method: str  # Subscription-wide list method (e.g., 'list', 'list_all')
+    resource_type: str  # ARM resource type, used by the Resource Graph backend
+    model: str  # SDK model the Resource Graph rows are deserialized into
+
+
+COLLECTIONS: dict[str, CollectionSpec] = {
+    "disks": CollectionSpec(
+        "azure.mgmt.compute:ComputeManagementClient", "disks", "list", "microsoft.compute/disks", "Disk"
+    ),
+    "snapshots": CollectionSpec(
+        "azure.mgmt.compute:ComputeManagementClient", "snapshots", "list", "microsoft.compute/snapshots", "Snapshot"
+    ),
+    "virtual_machines": CollectionSpec(
+        "azure.mgmt.compute:ComputeManagementClient",
+        "virtual_machines",
+        "list_all",
+        "microsoft.compute/virtualmachines",
+        "VirtualMachine",
+    ),
+    "public_ip_addresses": CollectionSpec(
+        "azure.mgmt.network:NetworkManagementClient",
+        "public_ip_addresses",
+        "list_all",
+        "microsoft.network/publicipaddresses",
+        "PublicIPAddress",
+    ),
+    "load_balancers": CollectionSpec(
+        "azure.mgmt.network:NetworkManagementClient",
+        "load_balancers",
+        "list_all",
+        "microsoft.network/loadbalancers",
+        "LoadBalancer",
+    ),
+    "application_gateways": CollectionSpec(
+        "azure.mgmt.network:NetworkManagementClient",
+        "application_gateways",
+        "list_all",
+        "microsoft.network/applicationgateways",
+        "ApplicationGateway",
+    ),
+    "nat_gateways": CollectionSpec(
+        "azure.mgmt.network:NetworkManagementClient",
+        "nat_gateways",
+        "list_all",
+        "microsoft.network/natgateways",
+        "NatGateway",
+    ),
+    "express_route_circuits": CollectionSpec(
+        "azure.mgmt.network:NetworkManagementClient",
+        "express_route_circuits",
+        "list_all",
+        "microsoft.network/expressroutecircuits",
+        "ExpressRouteCircuit",
+    ),
+    "virtual_networks": CollectionSpec(
+        "azure.mgmt.network:NetworkManagementClient",
+        "virtual_networks",
+        "list_all",
+        "microsoft.network/virtualnetworks",
+        "VirtualNetwork",
+    ),
+    "sql_servers": CollectionSpec(
+        "azure.mgmt.sql:SqlManagementClient", "servers", "list", "microsoft.sql/servers", "Server"
+    ),
+    "cosmosdb_accounts": CollectionSpec(
+        "azure.mgmt.cosmosdb:CosmosDBManagementClient",
+        "database_accounts",
+        "list",
+        "microsoft.documentdb/databaseaccounts",
+        "DatabaseAccountGetResults",
+    ),
+    "redis_caches": CollectionSpec(
+        "azure.mgmt.redis:RedisManagementClient",
+        "redis",
+        "list_by_subscription",
+        "microsoft.cache/redis",
+        "RedisResource",
+    ),
+    "storage_accounts": CollectionSpec(
+        "azure.mgmt.storage:StorageManagementClient",
+        "storage_accounts",
+        "list",
+        "microsoft.storage/storageaccounts",
+        "StorageAccount",
+    ),
+    "managed_clusters": CollectionSpec(
+        "azure.mgmt.containerservice:ContainerServiceClient",
+        "managed_clusters",
+        "list",
+        "microsoft.containerservice/managedclusters",
+        "ManagedCluster",
+    ),
+    "web_apps": CollectionSpec(
+        "azure.mgmt.web:WebSiteManagementClient", "web_apps", "list", "microsoft.web/sites", "Site"
+    ),
+}
+
+
+def normalize_location(location: str | None) -> str:
+    """Normalize an Azure location ('West Europe' -> 'westeurope')."""
+    return (location or "").replace(" ", "").lower()
+
+
+def resource_group_of(resource_id: str | None) -> str:
+    """Extract the lower-cased resource group name from an ARM resource ID."""
+    parts = (resource_id or "").split("/")
+    try:
+        return parts[parts.index("resourceGroups") + 1].lower()
+    except (ValueError, IndexError):
+        return ""
+
+
+class _Partition:
+    """One listed collection with its location and resource group indexes."""
+
+    def __init__(self, items: list[Any]) -> None:
+        self.items = items
+        self.by_location: dict[str, list[Any]] = {}
+        self.by_resource_group: dict[str, list[Any]] = {}
+        for item in items:
+            self.by_location.setdefault(normalize_location(getattr(item, "location", None)), []).append(item)
+            self.by_resource_group.setdefault(resource_group_of(getattr(item, "id", None)), []).append(item)
+
+
+class AzureSubscriptionInventory:
+    """
+    Per-scan cache of subscription-wide Azure resource listings.
+
+    Azure list APIs return every resource of the subscription, and scenarios
+    filter by region afterwards. Without a cache, an N-region scan downloaded
+    the full disk, snapshot or VM inventory once per scenario and region.
+    Here each collection is listed once (on first use), partitioned by
+    location and resource group, and served to every scenario and region.
+
+    With `use_resource_graph`, collections are loaded through Azure Resource
+    Graph queries (up to 1,000 resources per page instead of ARM's smaller
+    pages) and deserialized into the same SDK models. The
+    azure-mgmt-resourcegraph package is optional: without it, or if a query
+    fails, the collection is listed through ARM.
+
+    Scenarios run on worker threads, so loading is guarded by per-collection
+    locks: concurrent callers share a single listing.
+    """
+
+    RESOURCE_GRAPH_PAGE_SIZE = 1000
+
+    def __init__(self, client_pool: Any, subscription_id: str, use_resource_graph: bool = False) -> None:
+        """
+        Initialize inventory (nothing is listed until first use).
+
+        Args:
+            client_pool: AzureClientPool providing shared management clients
+            subscription_id: Azure Subscription ID
+            use_resource_graph: Load collections through Azure Resource Graph
+        """
+        self.client_pool = client_pool
+        self.subscription_id = subscription_id
+        self.use_resource_graph = use_resource_graph
+        self._partitions: dict[str, _Partition] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.api_calls = 0
+
+    def list_resources(
+        self, collection: str, region: str | None = None, resource_group: str | None = None
+    ) -> list[Any]:
+        """
+        Return resources of a collection, optionally restricted to a region and/or resource group.
+
+        Args:
+            collection: Collection name (key of COLLECTIONS, e.g., 'disks')
+            region: Only resources in this Azure location
+            resource_group: Only resources in this resource group
+
+        Returns:
+            SDK model instances, as returned by the subscription-wide list call
+        """
+        partition = self._load(collection)
+        if region is None and resource_group is None:
+            return list(partition.items)
+        if resource_group is None:
+            return list(partition.by_location.get(normalize_location(region), []))
+
+        items = partition.by_resource_group.get(resource_group.lower(), [])
+        if region is not None:
+            location = normalize_location(region)
+            items = [item for item in items if normalize_location(getattr(item, "location", None)) == location]
+        return list(items)
+
+    def changed_times(self, resource_type: str, region: str | None = None) -> dict[str, str]:
+        """
+        Return the last change time of every resource of an ARM type (incremental scans).
+
+        Resources are listed once per type through the generic resources API
+        with `$expand=changedTime,provisioningState`, then partitioned like
+        collections.
+
+        Args:
+            resource_type: ARM resource type (e.g., 'Microsoft.Compute/disks')
+            region: Only resources in this Azure location
+
+        Returns:
+            Dict of lower-cased resource ID -> 'changedTime|provisioningState'
+        """
+        key = f"changed_time:{resource_type.lower()}"
+        partition = self._partitions.get(key)
+        if partition is None:
+            with self._locks_guard:
+                lock = self._locks.setdefault(key, threading.Lock())
+            with lock:
+                if key not in self._partitions:
+                    from azure.mgmt.resource import ResourceManagementClient
+
+                    client = self.client_pool.get_client(ResourceManagementClient, self.subscription_id)
+                    self.api_calls += 1
+                    items = list(
+                        client.resources.list(
+                            filter=f"resourceType eq '{resource_type}'",
+                            expand="changedTime,provisioningState",
+                        )
+                    )
+                    self._partitions[key] = _Partition(items)
+                partition = self._partitions[key]
+
+        items = partition.items if region is None else partition.by_location.get(normalize_location(region), [])
+        return {
+            item.id.lower(): f"{getattr(item, 'changed_time', None)}|{getattr(item, 'provisioning_state', None)}"
+            for item in items
+        }
+
+    def _load(self, collection: str) -> _Partition:
+        """List a collection once and index it."""
+        partition = self._partitions.get(collection)
+        if partition is not None:
+            return partition
+
+        with self._locks_guard:
+            lock = self._locks.setdefault(collection, threading.Lock())
+        with lock:
+            if collection not in self._partitions:
+                spec = COLLECTIONS[collection]
+                items = None
+                if self.use_resource_graph:
+                    items = self._list_resource_graph(spec)
+                if items is None:
+                    items = self._list_arm(spec)
+                self._partitions[collection] = _Partition(items)
+                logger.debug(
+                    f"Azure inventory loaded {collection}: {len(items)} resources, "
+                    f"{self.api_calls} list calls so far"
+                )
+            return self._partitions[collection]
+
+    def _client(self, spec: CollectionSpec) -> Any:
+        """Get the pooled management client for a collection."""
+        module_name, class_name = spec.client.split(":")
+        client_cls = getattr(importlib.import_module(module_name), class_name)
+        return self.client_pool.get_client(client_cls, self.subscription_id)
+
+    def _list_arm(self, spec: CollectionSpec) -> list[Any]:
+        """List a collection through its management client."""
+        operations = getattr(self._client(spec), spec.operation_group)
+        self.api_calls += 1
+        return list(getattr(operations, spec.method)())
+
+    def _list_resource_graph(self, spec: CollectionSpec) -> list[Any] | None:
+        """
+        List a collection through Azure Resource Graph.
+
+        Returns:
+            SDK model instances, or None to fall back to ARM listing
+        """
+        try:
+            from azure.mgmt.resourcegraph import ResourceGraphClient
+            from azure.mgmt.resourcegraph.models import QueryRequest, QueryRequestOptions
+        except ImportError:
+            logger.warning("azure-mgmt-resourcegraph is not installed, listing Azure resources through ARM")
+            self.use_resource_graph = False
+            return None
+
+        try:
+            graph_client = self.client_pool.get_client(ResourceGraphClient)
+            model = getattr(getattr(self._client(spec), spec.operation_group).models, spec.model)
+            query = f"Resources | where type =~ '{spec.resource_type}'"
+
+            items: list[Any] = []
+            skip_token = None
+            while True:
+                response = graph_client.resources(
+                    QueryRequest(
+                        subscriptions=[self.subscription_id],
+                        query=query,
+                        options=QueryRequestOptions(
+                            top=self.RESOURCE_GRAPH_PAGE_SIZE,
+                            skip_token=skip_token,
+                            result_format="objectArray",
+                        ),
+                    )
+                )
+                self.api_calls += 1
+                items.extend(model.deserialize(row) for row in response.data)
+                skip_token = response.skip_token
+                if not skip_token:
+                    return items
+        except Exception as e:
+            logger.warning(f"Resource Graph query for {spec.resource_type} failed, listing through ARM: {e}")
+            return None
@@ -1,9 +1,18 @@
 """Base abstract class for cloud provider implementations."""
 
+import json
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
+from app.providers.incremental import (
+    IncrementalPlan,
+    ScenarioVerdict,
+    evaluate_scenario,
+    markers_digest,
+)
+from app.providers.scenario_engine import Scenario, ScenarioEngine, ScenarioRunReport
+
 
 @dataclass
 class OptimizationScenario:
@@ -64,6 +73,34 @@ class OrphanResourceData:
         self.estimated_monthly_cost = estimated_monthly_cost
         self.resource_metadata = resource_metadata
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible values (metadata is deep-copied)."""
+        return json.loads(
+            json.dumps(
+                {
+                    "resource_type": self.resource_type,
+                    "resource_id": self.resource_id,
+                    "resource_name": self.resource_name,
+                    "region": self.region,
+                    "estimated_monthly_cost": self.estimated_monthly_cost,
+                    "resource_metadata": self.resource_metadata,
+                },
+                default=str,
+            )
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "OrphanResourceData":
+        """Rebuild a finding serialized by to_dict()."""
+        return cls(
+            resource_type=data["resource_type"],
+            resource_id=data["resource_id"],
+            resource_name=data.get("resource_name"),
+            region=data["region"],
+            estimated_monthly_cost=data["estimated_monthly_cost"],
+            resource_metadata=dict(data.get("resource_metadata") or {}),
+        )
+
 
 class AllCloudResourceData:
     """Data class for complete cloud resource information (inventory mode)."""
@@ -154,6 +191,18 @@ class CloudProviderBase(ABC):
     to ensure consistent scanning behavior across different providers.
     """
 
+    # Per-service overrides of settings.SCAN_MAX_CONCURRENT_PER_SERVICE
+    # (e.g., {"cloudwatch": 2} for a provider whose metrics API throttles early)
+    SCENARIO_SERVICE_LIMITS: dict[str, int] = {}
+
+    # Metric-based scenarios -> resource types whose change markers their
+    # verdicts depend on; incremental scans reuse the last verdict of these
+    # scenarios while the markers are unchanged (see resource_change_markers)
+    INCREMENTAL_SCENARIO_INPUTS: dict[str, tuple[str, ...]] = {}
+
+    # Timing report of the most recent scan_all_resources() call
+    last_scenario_report: ScenarioRunReport | None = None
+
     def __init__(
         self,
         access_key: str,
@@ -326,6 +375,13 @@ class CloudProviderBase(ABC):
 
         return deduplicated
 
+    async def close(self) -> None:
+        """
+        Release resources held for the scan (e.g., pooled API clients).
+
+        Providers without long-lived resources keep this no-op default.
+        """
+
     @abstractmethod
     async def validate_credentials(self) -> dict[str, str]:
         """
@@ -1010,256 +1066,373 @@ class CloudProviderBase(ABC):
         """
         pass
 
-    async def scan_all_resources(
-        self, region: str, detection_rules: dict[str, dict] | None = None, scan_global_resources: bool = False
-    ) -> list[OrphanResourceData]:
-        """
-        Scan all resource types in a specific region.
+    def _scenario_engine(self) -> ScenarioEngine:
+        """Build a scenario engine with this provider's concurrency limits."""
+        from app.core.config import settings
 
-        Args:
-            region: Region to scan
-            detection_rules: Optional user-defined detection rules per resource type
-            scan_global_resources: If True, also scan global resources (e.g., S3 buckets).
-                                   Should only be True for the first region in a multi-region scan.
+        return ScenarioEngine(
+            max_concurrency=settings.SCAN_MAX_CONCURRENT_SCENARIOS,
+            default_service_limit=settings.SCAN_MAX_CONCURRENT_PER_SERVICE,
+            service_limits=self.SCENARIO_SERVICE_LIMITS,
+        )
 
-        Returns:
-            Combined list of all orphan resources found
+    async def resource_change_markers(
+        self, region: str, resource_types: list[str]
+    ) -> dict[str, dict[str, str]]:
         """
-        results: list[OrphanResourceData] = []
-        rules = detection_rules or {}
-
-        # Execute all scan methods with user's rules
-        # Original 7 resource types
-
-        # EBS Volume scanning - 10 waste scenarios (100% coverage)
-        # SCENARIO 1 & 7: Unattached and idle volumes
-        volume_orphans = await self.scan_unattached_volumes(region, rules.get("ebs_volume"))
-        results.extend(volume_orphans)
-
-        # SCENARIO 2: Volumes on stopped instances
-        results.extend(await self.scan_volumes_on_stopped_instances(region, rules.get("ebs_volume")))
+        Collect change markers of resources, for incremental scans.
 
-        # SCENARIO 3: gp2 → gp3 migration opportunities
-        results.extend(await self.scan_gp2_migration_opportunities(region, rules.get("ebs_volume")))
+        A marker is any string that changes whenever the resource changes in
+        a way that can affect a verdict (state, configuration, modification
+        time). Resource types missing from the result have no markers: the
+        scenarios reading them are always evaluated. The base implementation
+        supports none.
 
-        # SCENARIO 4: Unnecessary io2 volumes
-        results.extend(await self.scan_unnecessary_io2_volumes(region, rules.get("ebs_volume")))
-
-        # SCENARIO 5: Over-provisioned IOPS
-        results.extend(await self.scan_overprovisioned_iops_volumes(region, rules.get("ebs_volume")))
-
-        # SCENARIO 6: Over-provisioned throughput
-        results.extend(await self.scan_overprovisioned_throughput_volumes(region, rules.get("ebs_volume")))
-
-        # SCENARIO 8: Low IOPS usage (CloudWatch)
-        results.extend(await self.scan_low_iops_usage_volumes(region, rules.get("ebs_volume")))
-
-        # SCENARIO 9: Low throughput usage (CloudWatch)
-        results.extend(await self.scan_low_throughput_usage_volumes(region, rules.get("ebs_volume")))
-
-        # SCENARIO 10: Volume type downgrade opportunities (CloudWatch)
-        results.extend(await self.scan_volume_type_downgrade_opportunities(region, rules.get("ebs_volume")))
-
-        # Extract orphaned volume IDs to pass to snapshot scanner
-        orphaned_volume_ids = [
-            vol.resource_id for vol in volume_orphans
-            if vol.resource_metadata.get("orphan_type") in ["unattached", "attached_never_used", "attached_idle"]
-        ]
-
-        # Elastic IP scanning - 10 waste scenarios (100% coverage)
-        # SCENARIO 1-2: Unassociated and stopped instance EIPs
-        results.extend(await self.scan_unassigned_ips(region, rules.get("elastic_ip")))
-
-        # SCENARIO 3: Multiple EIPs per instance
-        results.extend(await self.scan_additional_eips_per_instance(region, rules.get("elastic_ip")))
-
-        # SCENARIO 4: EIPs on detached ENIs
-        results.extend(await self.scan_eips_on_detached_enis(region, rules.get("elastic_ip")))
+        Args:
+            region: Region being scanned
+            resource_types: Keys used in INCREMENTAL_SCENARIO_INPUTS
 
-        # SCENARIO 5: Never-used EIPs
-        results.extend(await self.scan_never_used_eips(region, rules.get("elastic_ip")))
+        Returns:
+            Resource type -> {resource ID: change marker}
+        """
+        return {}
 
-        # SCENARIO 6: EIPs on unused NAT Gateways (basic traffic check)
-        results.extend(await self.scan_eips_on_unused_nat_gateways(region, rules.get("elastic_ip")))
+    async def _plan_incremental(
+        self, region: str, scenarios: list[Scenario], plan: IncrementalPlan
+    ) -> list[Scenario]:
+        """
+        Swap scenarios whose inputs are unchanged for their previous verdict.
 
-        # SCENARIO 7: Idle EIPs (CloudWatch - minimal network traffic)
-        results.extend(await self.scan_idle_eips(region, rules.get("elastic_ip")))
+        Scenarios listed in INCREMENTAL_SCENARIO_INPUTS either reuse the
+        findings of their previous evaluation (see IncrementalPlan) or run
+        and record their new evaluation in `plan.evaluated`, unless they
+        swallowed an error meanwhile. Other scenarios are returned unchanged.
 
-        # SCENARIO 8: Low-traffic EIPs (CloudWatch - < 1 GB/month)
-        results.extend(await self.scan_low_traffic_eips(region, rules.get("elastic_ip")))
+        Args:
+            region: Region being scanned
+            scenarios: Scenarios of the region scan
+            plan: Incremental plan of the region scan
 
-        # SCENARIO 9: EIPs on NAT Gateways with zero connections (CloudWatch)
-        results.extend(await self.scan_unused_nat_gateway_eips(region, rules.get("elastic_ip")))
+        Returns:
+            Scenarios to execute, in the same order
+        """
+        import structlog
 
-        # SCENARIO 10: EIPs on failed instances (CloudWatch - status check failures)
-        results.extend(await self.scan_eips_on_failed_instances(region, rules.get("elastic_ip")))
+        logger = structlog.get_logger()
 
-        # EBS Snapshot scanning - 10 waste scenarios (100% coverage)
-        # SCENARIO 1: Orphaned snapshots (volume deleted or idle)
-        results.extend(
-            await self.scan_orphaned_snapshots(region, rules.get("ebs_snapshot"), orphaned_volume_ids)
+        inputs = {
+            scenario.name: self.INCREMENTAL_SCENARIO_INPUTS.get(scenario.name, ())
+            for scenario in scenarios
+        }
+        resource_types = sorted({t for types in inputs.values() for t in types})
+        if not resource_types:
+            return scenarios
+
+        try:
+            markers = await self.resource_change_markers(region, resource_types)
+        except Exception as e:
+            # Without markers the scan is a full scan
+            logger.warning("scan.change_markers_failed", region=region, error=str(e))
+            return scenarios
+
+        def reuse(verdict: ScenarioVerdict) -> Any:
+            async def run(_deps: dict[str, list[Any]]) -> list[OrphanResourceData]:
+                return [OrphanResourceData.from_dict(f) for f in verdict.findings]
+
+            return run
+
+        def evaluate(scenario: Scenario, inputs_digest: str) -> Any:
+            async def run(deps: dict[str, list[Any]]) -> list[OrphanResourceData]:
+                results, errors = await evaluate_scenario(scenario.run(deps))
+                if errors:
+                    # Findings may be incomplete: evaluate again next scan
+                    plan.failed.append(scenario.name)
+                    logger.warning(
+                        "scan.incremental_evaluation_failed",
+                        region=region,
+                        scenario=scenario.name,
+                        errors=errors[:5],
+                    )
+                else:
+                    plan.evaluated[scenario.name] = ScenarioVerdict(
+                        inputs_digest, plan.now, [r.to_dict() for r in results]
+                    )
+                return results
+
+            return run
+
+        planned = []
+        for scenario in scenarios:
+            types = inputs[scenario.name]
+            if not types or any(t not in markers for t in types):
+                planned.append(scenario)
+                continue
+
+            inputs_digest = markers_digest({t: markers[t] for t in types}, scenario.rules)
+            verdict = plan.reusable_verdict(scenario.name, inputs_digest)
+            if verdict is not None:
+                plan.reused.append(scenario.name)
+                planned.append(replace(scenario, run=reuse(verdict)))
+            else:
+                planned.append(replace(scenario, run=evaluate(scenario, inputs_digest)))
+
+        logger.info(
+            "scan.incremental_plan",
+            provider=type(self).__name__,
+            region=region,
+            scenarios=len(planned),
+            reused=plan.reused,
         )
-        # SCENARIO 2: Redundant snapshots (exceeding retention limit)
-        results.extend(await self.scan_redundant_snapshots(region, rules.get("ebs_snapshot")))
-
-        # SCENARIO 3: Old unused snapshots (>365 days without compliance tags)
-        results.extend(await self.scan_old_unused_snapshots(region, rules.get("ebs_snapshot")))
-
-        # SCENARIO 4: Snapshots from deleted instances
-        results.extend(await self.scan_snapshots_from_deleted_instances(region, rules.get("ebs_snapshot")))
+        return planned
 
-        # SCENARIO 5: Incomplete/failed snapshots
-        results.extend(await self.scan_incomplete_failed_snapshots(region, rules.get("ebs_snapshot")))
-
-        # SCENARIO 6: Untagged snapshots
-        results.extend(await self.scan_untagged_snapshots(region, rules.get("ebs_snapshot")))
-
-        # SCENARIO 7: Never restored snapshots (CloudTrail - Phase 2, deferred)
-        # TODO: Implement CloudTrail-based detection
+    async def _run_scenarios(
+        self, region: str, scenarios: list[Scenario], incremental: IncrementalPlan | None = None
+    ) -> list[OrphanResourceData]:
+        """
+        Run scenarios through the scenario engine and flatten their results.
 
-        # SCENARIO 8: Excessive retention in non-prod
-        results.extend(await self.scan_excessive_retention_snapshots(region, rules.get("ebs_snapshot")))
+        Results are returned in scenario declaration order (not completion order)
+        so deduplication stays deterministic. The timing report is kept on
+        `self.last_scenario_report` and logged for critical path analysis.
 
-        # SCENARIO 9: Duplicate snapshots
-        results.extend(await self.scan_duplicate_snapshots(region, rules.get("ebs_snapshot")))
+        Args:
+            region: Region being scanned (for logging)
+            scenarios: Scenarios to execute
+            incremental: Optional plan reusing the verdicts of unchanged scenarios
 
-        # SCENARIO 10: Snapshots of unused AMIs
-        results.extend(await self.scan_unused_ami_snapshots(region, rules.get("ebs_snapshot")))
+        Returns:
+            Combined list of orphan resources from all scenarios
+        """
+        import structlog
 
-        # EC2 Instance scanning - 10 waste scenarios (100% coverage)
-        # SCENARIO 1: Stopped instances >30 days
-        results.extend(await self.scan_stopped_instances(region, rules.get("ec2_instance_stopped")))
+        logger = structlog.get_logger()
 
-        # SCENARIO 2: Over-provisioned instances (CPU <30%)
-        results.extend(await self.scan_oversized_instances(region, rules.get("ec2_instance")))
+        if incremental is not None:
+            scenarios = await self._plan_incremental(region, scenarios, incremental)
 
-        # SCENARIO 3: Old generation instances (t2→t3, m4→m5)
-        results.extend(await self.scan_old_generation_instances(region, rules.get("ec2_instance")))
+        results_by_name, report = await self._scenario_engine().run(scenarios)
+        self.last_scenario_report = report
 
-        # SCENARIO 4: Burstable credit waste (T2/T3/T4 unused credits)
-        results.extend(await self.scan_burstable_credit_waste(region, rules.get("ec2_instance")))
+        logger.info(
+            "scan.scenario_timings",
+            provider=type(self).__name__,
+            region=region,
+            total_seconds=round(report.total_seconds, 2),
+            critical_path=[t.name for t in report.critical_path()],
+            slowest={t.name: round(t.wall_seconds, 2) for t in report.slowest(5)},
+        )
 
-        # SCENARIO 5: Dev/Test instances running 24/7
-        results.extend(await self.scan_dev_test_24_7_instances(region, rules.get("ec2_instance")))
+        results: list[OrphanResourceData] = []
+        for scenario in scenarios:
+            results.extend(results_by_name[scenario.name])
+        return results
 
-        # SCENARIO 6: Untagged instances
-        results.extend(await self.scan_untagged_ec2_instances(region, rules.get("ec2_instance")))
+    def _build_scan_scenarios(
+        self, region: str, rules: dict[str, dict], scan_global_resources: bool
+    ) -> list[Scenario]:
+        """
+        Build the scenario DAG for a region scan.
 
-        # SCENARIO 7: Idle running instances (CPU <5%)
-        results.extend(await self.scan_idle_running_instances(region, rules.get("ec2_instance")))
+        Every scenario is independent except orphaned snapshot detection, which
+        needs the orphaned volume IDs found by scan_unattached_volumes.
 
-        # SCENARIO 8: Advanced right-sizing opportunities
-        results.extend(await self.scan_right_sizing_opportunities(region, rules.get("ec2_instance")))
+        Args:
+            region: Region to scan
+            rules: User-defined detection rules per resource type
+            scan_global_resources: Include global resources (e.g., S3 buckets)
 
-        # SCENARIO 9: Spot-eligible workloads
-        results.extend(await self.scan_spot_eligible_workloads(region, rules.get("ec2_instance")))
+        Returns:
+            List of scenarios in declaration (result) order
+        """
 
-        # SCENARIO 10: Scheduled unused instances (business hours only)
-        results.extend(await self.scan_scheduled_unused_instances(region, rules.get("ec2_instance")))
+        def scenario(method_name: str, service: str, rule_key: str) -> Scenario:
+            method = getattr(self, method_name)
+            return Scenario(
+                name=method_name,
+                service=service,
+                run=lambda _deps: method(region, rules.get(rule_key)),
+                rules=rules.get(rule_key),
+            )
 
-        # Load Balancer scanning - 10 waste scenarios (100% coverage)
-        # Scenarios 1-7 + 10: Basic detection (no listeners, no targets, unhealthy, CLB migration)
-        results.extend(
-            await self.scan_unused_load_balancers(region, rules.get("load_balancer"))
-        )
+        def orphaned_snapshots(deps: dict[str, list[Any]]) -> Any:
+            # Extract orphaned volume IDs to pass to snapshot scanner
+            orphaned_volume_ids = [
+                vol.resource_id for vol in deps["scan_unattached_volumes"]
+                if vol.resource_metadata.get("orphan_type") in ["unattached", "attached_never_used", "attached_idle"]
+            ]
+            return self.scan_orphaned_snapshots(
+                region, rules.get("ebs_snapshot"), orphaned_volume_ids
+            )
 
-        # Scenario 8: Cross-zone load balancing disabled
-        results.extend(
-            await self.scan_load_balancer_cross_zone_disabled(region, rules.get("load_balancer"))
-        )
+        scenarios = [
+            # EBS Volume scanning - 10 waste scenarios (100% coverage)
+            # SCENARIO 1 & 7: Unattached and idle volumes
+            scenario("scan_unattached_volumes", "ec2", "ebs_volume"),
+            # SCENARIO 2: Volumes on stopped instances
+            scenario("scan_volumes_on_stopped_instances", "ec2", "ebs_volume"),
+            # SCENARIO 3: gp2 → gp3 migration opportunities
+            scenario("scan_gp2_migration_opportunities", "ec2", "ebs_volume"),
+            # SCENARIO 4: Unnecessary io2 volumes
+            scenario("scan_unnecessary_io2_volumes", "ec2", "ebs_volume"),
+            # SCENARIO 5: Over-provisioned IOPS
+            scenario("scan_overprovisioned_iops_volumes", "ec2", "ebs_volume"),
+            # SCENARIO 6: Over-provisioned throughput
+            scenario("scan_overprovisioned_throughput_volumes", "ec2", "ebs_volume"),
+            # SCENARIO 8: Low IOPS usage (CloudWatch)
+            scenario("scan_low_iops_usage_volumes", "ec2", "ebs_volume"),
+            # SCENARIO 9: Low throughput usage (CloudWatch)
+            scenario("scan_low_throughput_usage_volumes", "ec2", "ebs_volume"),
+            # SCENARIO 10: Volume type downgrade opportunities (CloudWatch)
+            scenario("scan_volume_type_downgrade_opportunities", "ec2", "ebs_volume"),
+            # Elastic IP scanning - 10 waste scenarios (100% coverage)
+            # SCENARIO 1-2: Unassociated and stopped instance EIPs
+            scenario("scan_unassigned_ips", "ec2", "elastic_ip"),
+            # SCENARIO 3: Multiple EIPs per instance
+            scenario("scan_additional_eips_per_instance", "ec2", "elastic_ip"),
+            # SCENARIO 4: EIPs on detached ENIs
+            scenario("scan_eips_on_detached_enis", "ec2", "elastic_ip"),
+            # SCENARIO 5: Never-used EIPs
+            scenario("scan_never_used_eips", "ec2", "elastic_ip"),
+            # SCENARIO 6: EIPs on unused NAT Gateways (basic traffic check)
+            scenario("scan_eips_on_unused_nat_gateways", "ec2", "elastic_ip"),
+            # SCENARIO 7: Idle EIPs (CloudWatch - minimal network traffic)
+            scenario("scan_idle_eips", "ec2", "elastic_ip"),
+            # SCENARIO 8: Low-traffic EIPs (CloudWatch - < 1 GB/month)
+            scenario("scan_low_traffic_eips", "ec2", "elastic_ip"),
+            # SCENARIO 9: EIPs on NAT Gateways with zero connections (CloudWatch)
+            scenario("scan_unused_nat_gateway_eips", "ec2", "elastic_ip"),
+            # SCENARIO 10: EIPs on failed instances (CloudWatch - status check failures)
+            scenario("scan_eips_on_failed_instances", "ec2", "elastic_ip"),
+            # EBS Snapshot scanning - 10 waste scenarios (100% coverage)
+            # SCENARIO 1: Orphaned snapshots (volume deleted or idle) - DAG edge on volumes
+            Scenario(
+                name="scan_orphaned_snapshots",
+                service="ec2",
+                run=orphaned_snapshots,
+                depends_on=("scan_unattached_volumes",),
+            ),
+            # SCENARIO 2: Redundant snapshots (exceeding retention limit)
+            scenario("scan_redundant_snapshots", "ec2", "ebs_snapshot"),
+            # SCENARIO 3: Old unused snapshots (>365 days without compliance tags)
+            scenario("scan_old_unused_snapshots", "ec2", "ebs_snapshot"),
+            # SCENARIO 4: Snapshots from deleted instances
+            scenario("scan_snapshots_from_deleted_instances", "ec2", "ebs_snapshot"),
+            # SCENARIO 5: Incomplete/failed snapshots
+            scenario("scan_incomplete_failed_snapshots", "ec2", "ebs_snapshot"),
+            # SCENARIO 6: Untagged snapshots
+            scenario("scan_untagged_snapshots", "ec2", "ebs_snapshot"),
+            # SCENARIO 7: Never restored snapshots (CloudTrail - Phase 2, deferred)
+            # TODO: Implement CloudTrail-based detection
+            # SCENARIO 8: Excessive retention in non-prod
+            scenario("scan_excessive_retention_snapshots", "ec2", "ebs_snapshot"),
+            # SCENARIO 9: Duplicate snapshots
+            scenario("scan_duplicate_snapshots", "ec2", "ebs_snapshot"),
+            # SCENARIO 10: Snapshots of unused AMIs
+            scenario("scan_unused_ami_snapshots", "ec2", "ebs_snapshot"),
+            # EC2 Instance scanning - 10 waste scenarios (100% coverage)
+            # SCENARIO 1: Stopped instances >30 days
+            scenario("scan_stopped_instances", "ec2", "ec2_instance_stopped"),
+            # SCENARIO 2: Over-provisioned instances (CPU <30%)
+            scenario("scan_oversized_instances", "ec2", "ec2_instance"),
+            # SCENARIO 3: Old generation instances (t2→t3, m4→m5)
+            scenario("scan_old_generation_instances", "ec2", "ec2_instance"),
+            # SCENARIO 4: Burstable credit waste (T2/T3/T4 unused credits)
+            scenario("scan_burstable_credit_waste", "ec2", "ec2_instance"),
+            # SCENARIO 5: Dev/Test instances running 24/7
+            scenario("scan_dev_test_24_7_instances", "ec2", "ec2_instance"),
+            # SCENARIO 6: Untagged instances
+            scenario("scan_untagged_ec2_instances", "ec2", "ec2_instance"),
+            # SCENARIO 7: Idle running instances (CPU <5%)
+            scenario("scan_idle_running_instances", "ec2", "ec2_instance"),
+            # SCENARIO 8: Advanced right-sizing opportunities
+            scenario("scan_right_sizing_opportunities", "ec2", "ec2_instance"),
+            # SCENARIO 9: Spot-eligible workloads
+            scenario("scan_spot_eligible_workloads", "ec2", "ec2_instance"),
+            # SCENARIO 10: Scheduled unused instances (business hours only)
+            scenario("scan_scheduled_unused_instances", "ec2", "ec2_instance"),
+            # Load Balancer scanning - 10 waste scenarios (100% coverage)
+            # Scenarios 1-7 + 10: Basic detection (no listeners, no targets, unhealthy, CLB migration)
+            scenario("scan_unused_load_balancers", "elb", "load_balancer"),
+            # Scenario 8: Cross-zone load balancing disabled
+            scenario("scan_load_balancer_cross_zone_disabled", "elb", "load_balancer"),
+            # Scenario 9: Idle connection patterns (business hours only)
+            scenario("scan_load_balancer_idle_patterns", "elb", "load_balancer"),
+            scenario("scan_stopped_databases", "rds", "rds_instance"),
+            # NAT Gateway scanning - 10 waste scenarios (100% coverage)
+            # Scenario 1-7: Basic detection (no routes, zero traffic, etc.)
+            scenario("scan_unused_nat_gateways", "nat_gateway", "nat_gateway"),
+            # Scenario 8: VPC Endpoint candidates
+            scenario("scan_nat_gateway_vpc_endpoint_candidates", "nat_gateway", "nat_gateway"),
+            # Scenario 9: Dev/Test business hours only
+            scenario("scan_nat_gateway_dev_test_unused_hours", "nat_gateway", "nat_gateway"),
+            # Scenario 10: Obsolete after migration
+            scenario("scan_nat_gateway_obsolete_migration", "nat_gateway", "nat_gateway"),
+            # TOP 15 high-cost idle resources
+            scenario("scan_unused_fsx_file_systems", "fsx", "fsx_file_system"),
+            scenario("scan_idle_neptune_clusters", "neptune", "neptune_cluster"),
+            scenario("scan_idle_msk_clusters", "kafka", "msk_cluster"),
+            scenario("scan_idle_eks_clusters", "eks", "eks_cluster"),
+            scenario("scan_idle_sagemaker_endpoints", "sagemaker", "sagemaker_endpoint"),
+            scenario("scan_idle_redshift_clusters", "redshift", "redshift_cluster"),
+            scenario("scan_idle_elasticache_clusters", "elasticache", "elasticache_cluster"),
+            scenario("scan_idle_vpn_connections", "vpn", "vpn_connection"),
+            scenario(
+                "scan_idle_transit_gateway_attachments",
+                "transit_gateway",
+                "transit_gateway_attachment",
+            ),
+            scenario("scan_idle_opensearch_domains", "opensearch", "opensearch_domain"),
+            scenario("scan_idle_global_accelerators", "globalaccelerator", "global_accelerator"),
+            scenario("scan_idle_kinesis_streams", "kinesis", "kinesis_stream"),
+            scenario("scan_unused_vpc_endpoints", "vpc_endpoint", "vpc_endpoint"),
+            scenario("scan_idle_documentdb_clusters", "docdb", "documentdb_cluster"),
+            scenario("scan_idle_lambda_functions", "lambda", "lambda_function"),
+            scenario("scan_idle_dynamodb_tables", "dynamodb", "dynamodb_table"),
+            scenario("scan_fargate_tasks", "ecs", "fargate_task"),
+        ]
 
-        # Scenario 9: Idle connection patterns (business hours only)
-        results.extend(
-            await self.scan_load_balancer_idle_patterns(region, rules.get("load_balancer"))
-        )
+        # Global resources (scanned only once, not per region)
+        if scan_global_resources:
+            scenarios.append(
+                Scenario(
+                    name="scan_idle_s3_buckets",
+                    service="s3",
+                    run=lambda _deps: self.scan_idle_s3_buckets(rules.get("s3_bucket")),
+                )
+            )
 
-        results.extend(
-            await self.scan_stopped_databases(region, rules.get("rds_instance"))
-        )
+        return scenarios
 
-        # NAT Gateway scanning - 10 waste scenarios (100% coverage)
-        # Scenario 1-7: Basic detection (no routes, zero traffic, etc.)
-        results.extend(
-            await self.scan_unused_nat_gateways(region, rules.get("nat_gateway"))
-        )
+    async def scan_all_resources(
+        self,
+        region: str,
+        detection_rules: dict[str, dict] | None = None,
+        scan_global_resources: bool = False,
+        incremental: IncrementalPlan | None = None,
+    ) -> list[OrphanResourceData]:
+        """
+        Scan all resource types in a specific region.
 
-        # Scenario 8: VPC Endpoint candidates
-        results.extend(
-            await self.scan_nat_gateway_vpc_endpoint_candidates(region, rules.get("nat_gateway"))
-        )
+        Scenarios run concurrently through the scenario engine (see
+        _build_scan_scenarios for the scenario DAG and SCAN_MAX_CONCURRENT_*
+        settings for the concurrency limits).
 
-        # Scenario 9: Dev/Test business hours only
-        results.extend(
-            await self.scan_nat_gateway_dev_test_unused_hours(region, rules.get("nat_gateway"))
-        )
+        Args:
+            region: Region to scan
+            detection_rules: Optional user-defined detection rules per resource type
+            scan_global_resources: If True, also scan global resources (e.g., S3 buckets).
+                                   Should only be True for the first region in a multi-region scan.
+            incremental: Optional plan reusing the verdicts of metric-based scenarios
+                         whose input resources are unchanged (incremental scans)
 
-        # Scenario 10: Obsolete after migration
-        results.extend(
-            await self.scan_nat_gateway_obsolete_migration(region, rules.get("nat_gateway"))
-        )
+        Returns:
+            Combined list of all orphan resources found
+        """
+        rules = detection_rules or {}
 
-        # TOP 15 high-cost idle resources
-        results.extend(
-            await self.scan_unused_fsx_file_systems(region, rules.get("fsx_file_system"))
-        )
-        results.extend(
-            await self.scan_idle_neptune_clusters(region, rules.get("neptune_cluster"))
-        )
-        results.extend(await self.scan_idle_msk_clusters(region, rules.get("msk_cluster")))
-        results.extend(await self.scan_idle_eks_clusters(region, rules.get("eks_cluster")))
-        results.extend(
-            await self.scan_idle_sagemaker_endpoints(
-                region, rules.get("sagemaker_endpoint")
-            )
-        )
-        results.extend(
-            await self.scan_idle_redshift_clusters(region, rules.get("redshift_cluster"))
-        )
-        results.extend(
-            await self.scan_idle_elasticache_clusters(
-                region, rules.get("elasticache_cluster")
-            )
-        )
-        results.extend(
-            await self.scan_idle_vpn_connections(region, rules.get("vpn_connection"))
+        results = await self._run_scenarios(
+            region, self._build_scan_scenarios(region, rules, scan_global_resources), incremental
         )
-        results.extend(
-            await self.scan_idle_transit_gateway_attachments(
-                region, rules.get("transit_gateway_attachment")
-            )
-        )
-        results.extend(
-            await self.scan_idle_opensearch_domains(region, rules.get("opensearch_domain"))
-        )
-        results.extend(
-            await self.scan_idle_global_accelerators(
-                region, rules.get("global_accelerator")
-            )
-        )
-        results.extend(
-            await self.scan_idle_kinesis_streams(region, rules.get("kinesis_stream"))
-        )
-        results.extend(
-            await self.scan_unused_vpc_endpoints(region, rules.get("vpc_endpoint"))
-        )
-        results.extend(
-            await self.scan_idle_documentdb_clusters(
-                region, rules.get("documentdb_cluster")
-            )
-        )
-        results.extend(
-            await self.scan_idle_lambda_functions(region, rules.get("lambda_function"))
-        )
-        results.extend(
-            await self.scan_idle_dynamodb_tables(region, rules.get("dynamodb_table"))
-        )
-        results.extend(
-            await self.scan_fargate_tasks(region, rules.get("fargate_task"))
-        )
-
-        # Global resources (scanned only once, not per region)
-        if scan_global_resources:
-            results.extend(await self.scan_idle_s3_buckets(rules.get("s3_bucket")))
 
         # Deduplicate resources to avoid counting the same resource multiple times
         # (e.g., a volume detected as unattached + over-provisioned + low IOPS usage)
@@ -7,7 +7,7 @@ import re
 import time
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from google.cloud import compute_v1, container_v1, functions_v1, functions_v2, logging, monitoring_v3, run_v2
 from google.oauth2 import service_account
@@ -15,12 +15,21 @@ from google.protobuf.timestamp_pb2 import Timestamp
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
 
+from app.core.config import settings
 from app.providers.base import CloudProviderBase, OrphanResourceData
+from app.providers.gcp_client_pool import GCPClientPool
+from app.providers.gcp_inventory import GCPComputeInventory
+from app.providers.gcp_metrics import CloudMonitoringMetricCollector
+from app.providers.scenario_engine import Scenario
+from app.services.pricing_service import PriceTable
 
 
 class GCPProvider(CloudProviderBase):
     """Google Cloud Platform provider implementation."""
 
+    # Compute Engine read quotas are per project, so scenarios share one limit
+    SCENARIO_SERVICE_LIMITS: dict[str, int] = {"compute": 8}
+
     # GCP Machine Type Pricing (us-central1, monthly with Sustained Use Discounts)
     MACHINE_PRICING = {
         "e2-micro": 7.11,
@@ -72,6 +81,7 @@ class GCPProvider(CloudProviderBase):
         project_id: str,
         service_account_json: str,
         regions: list[str] | None = None,
+        price_table: PriceTable | None = None,
     ) -> None:
         """
         Initialize GCP provider.
@@ -80,18 +90,28 @@ class GCPProvider(CloudProviderBase):
             project_id: GCP Project ID
             service_account_json: Service Account JSON key (as string)
             regions: List of GCP regions to scan (None = all regions)
+            price_table: Optional price snapshot loaded at scan start (overrides built-in prices)
         """
         self.project_id = project_id
         self.service_account_json = service_account_json
         self.regions = regions or []
 
-        # Initialize GCP clients
+        # Prices snapshotted at scan start: cost calculations are in-memory lookups
+        self.price_table = price_table or PriceTable()
+
         self._credentials = None
-        self._compute_client = None
-        self._monitoring_client = None
-        self._gke_client = None
-        self._logging_client = None
-        self._run_client = None
+
+        # Long-lived API clients and bounded worker threads shared by every
+        # scenario of the scan (the google-cloud clients are synchronous)
+        self.client_pool = GCPClientPool(
+            self._get_credentials, max_workers=settings.GCP_SCAN_MAX_THREADS
+        )
+
+        # Project-wide Compute Engine listings (aggregated_list), loaded once per scan
+        self.inventory = GCPComputeInventory(self.client_pool, project_id)
+
+        # Project-wide Cloud Monitoring summaries (one aggregated query per metric), per scan
+        self.metrics = CloudMonitoringMetricCollector(self.client_pool, project_id)
 
     def _get_credentials(self) -> service_account.Credentials:
         """Get GCP credentials from service account JSON."""
@@ -102,37 +122,56 @@ class GCPProvider(CloudProviderBase):
             )
         return self._credentials
 
+    @property
+    def credentials(self) -> service_account.Credentials:
+        """Service account credentials shared by all clients of this scan."""
+        return self._get_credentials()
+
+    def _gcp_client(self, client_cls: type, **kwargs: Any) -> Any:
+        """
+        Get the shared client for a google-cloud client class.
+
+        Args:
+            client_cls: Client class (e.g., compute_v1.InstancesClient)
+            **kwargs: Extra constructor arguments (e.g., client_options, project)
+
+        Returns:
+            Pooled client instance
+        """
+        return self.client_pool.get_client(client_cls, **kwargs)
+
+    async def _run_blocking(self, method: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Run a scan method built on the synchronous GCP clients on a worker thread.
+
+        Args:
+            method: Coroutine method making blocking client calls
+            *args: Arguments passed to the method
+
+        Returns:
+            The method's result
+        """
+        return await self.client_pool.run(method, *args)
+
+    async def close(self) -> None:
+        """Stop worker threads and close pooled GCP clients."""
+        self.client_pool.close()
+
     def _get_compute_client(self) -> compute_v1.InstancesClient:
         """Get or create Compute Engine client."""
-        if self._compute_client is None:
-            self._compute_client = compute_v1.InstancesClient(
-                credentials=self._get_credentials()
-            )
-        return self._compute_client
+        return self._gcp_client(compute_v1.InstancesClient)
 
     def _get_monitoring_client(self) -> monitoring_v3.MetricServiceClient:
         """Get or create Cloud Monitoring client."""
-        if self._monitoring_client is None:
-            self._monitoring_client = monitoring_v3.MetricServiceClient(
-                credentials=self._get_credentials()
-            )
-        return self._monitoring_client
+        return self._gcp_client(monitoring_v3.MetricServiceClient)
 
     def _get_gke_client(self) -> container_v1.ClusterManagerClient:
         """Get or create GKE (Google Kubernetes Engine) client."""
-        if self._gke_client is None:
-            self._gke_client = container_v1.ClusterManagerClient(
-                credentials=self._get_credentials()
-            )
-        return self._gke_client
+        return self._gcp_client(container_v1.ClusterManagerClient)
 
     def _get_run_client(self) -> run_v2.ServicesClient:
         """Get or create Cloud Run client."""
-        if self._run_client is None:
-            self._run_client = run_v2.ServicesClient(
-                credentials=self._get_credentials()
-            )
-        return self._run_client
+        return self._gcp_client(run_v2.ServicesClient)
 
     def _get_k8s_config(self, cluster: container_v1.Cluster, location: str) -> dict:
         """
@@ -204,12 +243,13 @@ class GCPProvider(CloudProviderBase):
             return base_cost * (1 - self.SPOT_DISCOUNT)
         return base_cost
 
-    def _calculate_disk_cost(self, disks: list[dict]) -> float:
+    def _calculate_disk_cost(self, disks: list[dict], region: str = "") -> float:
         """
         Calculate total monthly cost for disks.
 
         Args:
             disks: List of disk configurations
+            region: Region of the disks (selects regional prices from the price table)
 
         Returns:
             Total monthly cost in USD
@@ -218,7 +258,9 @@ class GCPProvider(CloudProviderBase):
         for disk in disks:
             disk_size_gb = disk.get("diskSizeGb", 0)
             disk_type = disk.get("type", "pd-standard").split("/")[-1]
-            price_per_gb = self.DISK_PRICING.get(disk_type, 0.040)
+            price_per_gb = self.price_table.get(
+                "gcp", disk_type, region, default=self.DISK_PRICING.get(disk_type, 0.040)
+            )
             total_cost += disk_size_gb * price_per_gb
         return total_cost
 
@@ -277,67 +319,29 @@ class GCPProvider(CloudProviderBase):
         """
         Get CPU utilization metrics from Cloud Monitoring.
 
+        Values come from project-wide summaries computed server-side (one
+        aggregated query per statistic for all instances, cached for the scan).
+
         Args:
             instance_id: Instance ID
-            zone: Zone name
+            zone: Zone name (instance IDs are unique per project)
             lookback_days: Number of days to look back
 
         Returns:
             Dict with avg, max, min CPU values and datapoints count
         """
         try:
-            monitoring_client = self._get_monitoring_client()
-
-            # Build time interval
-            now = time.time()
-            end_time = Timestamp(seconds=int(now))
-            start_time = Timestamp(seconds=int(now - lookback_days * 24 * 3600))
-
-            interval = monitoring_v3.TimeInterval(
-                {"end_time": end_time, "start_time": start_time}
-            )
-
-            # Build filter
-            filter_str = (
-                f'metric.type="compute.googleapis.com/instance/cpu/utilization" '
-                f'AND resource.instance_id="{instance_id}" '
-                f'AND resource.zone="{zone}"'
-            )
-
-            # Query metrics
-            results = monitoring_client.list_time_series(
-                request={
-                    "name": f"projects/{self.project_id}",
-                    "filter": filter_str,
-                    "interval": interval,
-                    "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-                }
+            summary = self.metrics.get(
+                "compute.googleapis.com/instance/cpu/utilization",
+                "resource.label.instance_id",
+                str(instance_id),
+                lookback_days,
             )
+        except Exception:
+            summary = None
 
-            # Extract values
-            cpu_values = []
-            for series in results:
-                for point in series.points:
-                    # CPU utilization is reported as fraction (0.0-1.0)
-                    cpu_values.append(point.value.double_value * 100)
-
-            if not cpu_values:
-                return {
-                    "avg_cpu": 0.0,
-                    "max_cpu": 0.0,
-                    "min_cpu": 0.0,
-                    "datapoints": 0,
-                }
-
-            return {
-                "avg_cpu": sum(cpu_values) / len(cpu_values),
-                "max_cpu": max(cpu_values),
-                "min_cpu": min(cpu_values),
-                "datapoints": len(cpu_values),
-            }
-
-        except Exception as e:
-            # If metrics not available, return zeros
+        # If metrics not available, return zeros
+        if summary is None or not summary.count:
             return {
                 "avg_cpu": 0.0,
                 "max_cpu": 0.0,
@@ -345,73 +349,43 @@ class GCPProvider(CloudProviderBase):
                 "datapoints": 0,
             }
 
+        # CPU utilization is reported as fraction (0.0-1.0)
+        return {
+            "avg_cpu": (summary.mean or 0.0) * 100,
+            "max_cpu": (summary.max or 0.0) * 100,
+            "min_cpu": (summary.min or 0.0) * 100,
+            "datapoints": summary.count,
+        }
+
     async def _get_memory_metrics(
         self, instance_id: str, zone: str, lookback_days: int = 14
     ) -> dict[str, Any]:
         """
         Get memory utilization metrics from Cloud Monitoring.
 
-        Requires Cloud Monitoring Agent installed on instance.
+        Requires Cloud Monitoring Agent installed on instance. Values come from
+        project-wide summaries computed server-side, cached for the scan.
 
         Args:
             instance_id: Instance ID
-            zone: Zone name
+            zone: Zone name (instance IDs are unique per project)
             lookback_days: Number of days to look back
 
         Returns:
             Dict with avg, max, min memory values and datapoints count
         """
         try:
-            monitoring_client = self._get_monitoring_client()
-
-            # Build time interval
-            now = time.time()
-            end_time = Timestamp(seconds=int(now))
-            start_time = Timestamp(seconds=int(now - lookback_days * 24 * 3600))
-
-            interval = monitoring_v3.TimeInterval(
-                {"end_time": end_time, "start_time": start_time}
-            )
-
-            # Build filter for memory metrics
-            filter_str = (
-                f'metric.type="agent.googleapis.com/memory/percent_used" '
-                f'AND resource.instance_id="{instance_id}"'
-            )
-
-            # Query metrics
-            results = monitoring_client.list_time_series(
-                request={
-                    "name": f"projects/{self.project_id}",
-                    "filter": filter_str,
-                    "interval": interval,
-                    "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL,
-                }
+            summary = self.metrics.get(
+                "agent.googleapis.com/memory/percent_used",
+                "resource.label.instance_id",
+                str(instance_id),
+                lookback_days,
             )
-
-            # Extract values
-            memory_values = []
-            for series in results:
-                for point in series.points:
-                    memory_values.append(point.value.double_value)
-
-            if not memory_values:
-                return {
-                    "avg_memory": 0.0,
-                    "max_memory": 0.0,
-                    "min_memory": 0.0,
-                    "datapoints": 0,
-                }
-
-            return {
-                "avg_memory": sum(memory_values) / len(memory_values),
-                "max_memory": max(memory_values),
-                "min_memory": min(memory_values),
-                "datapoints": len(memory_values),
-            }
-
         except Exception:
-            # Memory metrics not available (agent not installed)
+            summary = None
+
+        # Memory metrics not available (agent not installed)
+        if summary is None or not summary.count:
             return {
                 "avg_memory": 0.0,
                 "max_memory": 0.0,
@@ -419,6 +393,41 @@ class GCPProvider(CloudProviderBase):
                 "datapoints": 0,
             }
 
+        return {
+            "avg_memory": summary.mean or 0.0,
+            "max_memory": summary.max or 0.0,
+            "min_memory": summary.min or 0.0,
+            "datapoints": summary.count,
+        }
+
+    def _get_cloud_sql_metric(
+        self,
+        instance_name: str,
+        metric_type: str,
+        lookback_days: int,
+        statistics: tuple[str, ...] = ("mean", "max", "count"),
+    ):
+        """
+        Get a Cloud SQL metric summary from project-wide server-side aggregation.
+
+        Args:
+            instance_name: Cloud SQL instance name
+            metric_type: Metric type (e.g., 'cloudsql.googleapis.com/database/cpu/utilization')
+            lookback_days: Number of days to look back
+            statistics: Statistics to compute ('mean', 'max', 'min', 'count', 'sum')
+
+        Returns:
+            MetricSummary, or None if the instance reported no data
+        """
+        return self.metrics.get(
+            metric_type,
+            "resource.label.database_id",
+            f"{self.project_id}:{instance_name}",
+            lookback_days,
+            statistics=statistics,
+            resource_filter='resource.type="cloudsql_database"',
+        )
+
     async def validate_credentials(self) -> dict[str, str]:
         """
         Validate GCP credentials.
@@ -427,9 +436,9 @@ class GCPProvider(CloudProviderBase):
             Dict with project_id
         """
         try:
-            # Test credentials by making a simple API call
-            compute_client = self._get_compute_client()
+            # Test credentials by building a client from them
             # This will raise an exception if credentials are invalid
+            self._get_compute_client()
             return {"project_id": self.project_id}
         except Exception as e:
             raise Exception(f"Invalid GCP credentials: {str(e)}")
@@ -457,54 +466,44 @@ class GCPProvider(CloudProviderBase):
         """
         Scan all GCP resources for waste detection.
 
+        Scenarios of every region run concurrently through the scenario
+        engine; each one executes on the provider's worker threads because the
+        GCP clients are synchronous.
+
         Args:
             detection_rules: Optional detection configuration
 
         Returns:
             List of detected orphan resources
         """
-        all_resources = []
-
         # Get regions to scan
         regions = self.regions if self.regions else await self.get_available_regions()
 
-        # Scan Compute Engine instances (all 10 scenarios)
-        for region in regions:
+        # Compute Engine instance scenarios (all 10), per region
+        methods = [
             # Phase 1 scenarios (7)
-            all_resources.extend(
-                await self.scan_stopped_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_idle_running_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_overprovisioned_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_old_generation_compute_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_no_spot_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_untagged_compute_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_devtest_247_instances(region, detection_rules)
-            )
-
+            self.scan_stopped_instances,
+            self.scan_idle_running_instances,
+            self.scan_overprovisioned_instances,
+            self.scan_old_generation_compute_instances,
+            self.scan_no_spot_instances,
+            self.scan_untagged_compute_instances,
+            self.scan_devtest_247_instances,
             # Phase 2 scenarios (3)
-            all_resources.extend(
-                await self.scan_memory_waste_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_rightsizing_instances(region, detection_rules)
-            )
-            all_resources.extend(
-                await self.scan_burstable_waste_instances(region, detection_rules)
+            self.scan_memory_waste_instances,
+            self.scan_rightsizing_instances,
+            self.scan_burstable_waste_instances,
+        ]
+
+        def scenario(method: Callable[..., Awaitable[Any]], region: str) -> Scenario:
+            return Scenario(
+                name=f"{method.__name__}:{region}",
+                service="compute",
+                run=lambda _deps: self._run_blocking(method, region, detection_rules),
             )
 
-        return all_resources
+        scenarios = [scenario(method, region) for region in regions for method in methods]
+        return await self._run_scenarios(",".join(regions), scenarios)
 
     # ==================== PHASE 1 SCENARIOS ====================
 
@@ -529,21 +528,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
-
             # List all zones in region
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
                     # List instances in zone with TERMINATED status
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="TERMINATED"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="TERMINATED")
 
                     for instance in instances:
                         # Calculate age since last stop
@@ -562,7 +553,7 @@ class GCPProvider(CloudProviderBase):
                                 }
                                 for disk in instance.disks
                             ]
-                            monthly_cost = self._calculate_disk_cost(disks)
+                            monthly_cost = self._calculate_disk_cost(disks, region)
                             already_wasted = monthly_cost * (age_days / 30.0)
 
                             resources.append(
@@ -630,18 +621,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         # Get CPU metrics
@@ -743,18 +727,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         cpu_metrics = await self._get_cpu_metrics(
@@ -856,18 +833,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         machine_type = self._get_machine_type_name(
@@ -965,18 +935,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         # Check if not using spot
@@ -1078,17 +1041,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone)
 
                     for instance in instances:
                         labels = dict(instance.labels) if instance.labels else {}
@@ -1173,18 +1130,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         labels = dict(instance.labels) if instance.labels else {}
@@ -1289,18 +1239,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         # Get memory metrics (requires monitoring agent)
@@ -1411,18 +1354,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         # Get both CPU and memory metrics
@@ -1553,18 +1489,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            compute_client = self._get_compute_client()
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListInstancesRequest(
-                        project=self.project_id,
-                        zone=zone,
-                        filter='status="RUNNING"',
-                    )
-
-                    instances = compute_client.list(request=request)
+                    instances = self.inventory.list_resources("instances", zone, status="RUNNING")
 
                     for instance in instances:
                         machine_type = self._get_machine_type_name(
@@ -1667,27 +1596,15 @@ class GCPProvider(CloudProviderBase):
 
     def _get_disks_client(self) -> compute_v1.DisksClient:
         """Get or create Disks client."""
-        if not hasattr(self, "_disks_client") or self._disks_client is None:
-            self._disks_client = compute_v1.DisksClient(
-                credentials=self._get_credentials()
-            )
-        return self._disks_client
+        return self._gcp_client(compute_v1.DisksClient)
 
     def _get_snapshots_client(self) -> compute_v1.SnapshotsClient:
         """Get or create Snapshots client."""
-        if not hasattr(self, "_snapshots_client") or self._snapshots_client is None:
-            self._snapshots_client = compute_v1.SnapshotsClient(
-                credentials=self._get_credentials()
-            )
-        return self._snapshots_client
+        return self._gcp_client(compute_v1.SnapshotsClient)
 
     def _get_logging_client(self) -> logging.Client:
         """Get or create Cloud Logging client."""
-        if not hasattr(self, "_logging_client") or self._logging_client is None:
-            self._logging_client = logging.Client(
-                project=self.project_id, credentials=self._get_credentials()
-            )
-        return self._logging_client
+        return self._gcp_client(logging.Client, project=self.project_id)
 
     def _get_disk_pricing(self, disk_type: str) -> float:
         """Get pricing per GB/month for disk type (us-central1 pricing)."""
@@ -1722,20 +1639,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
-
             # List all disks in the region
             # GCP uses zones, so iterate through common zones in the region
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Check if disk is unattached
@@ -1840,19 +1750,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             instances_client = self._get_compute_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Check if disk is attached
@@ -1974,19 +1878,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             monitoring_client = self._get_monitoring_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Check age
@@ -2132,25 +2030,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-            disks_client = self._get_disks_client()
-
             # Get all snapshots
-            snapshots_list = list(snapshots_client.list(project=self.project_id))
-
-            # Get all existing disk names
-            all_disk_names = set()
-
-            # Aggregate list across all zones
-            aggregated_request = compute_v1.AggregatedListDisksRequest(
-                project=self.project_id
-            )
-            agg_list = disks_client.aggregated_list(request=aggregated_request)
+            snapshots_list = self.inventory.snapshots()
 
-            for zone_name, response in agg_list:
-                if hasattr(response, "disks") and response.disks:
-                    for disk in response.disks:
-                        all_disk_names.add(disk.name)
+            # Get all existing disk names (aggregated across all zones)
+            all_disk_names = {disk.name for disk in self.inventory.list_resources("disks")}
 
             # Check each snapshot
             for snapshot in snapshots_list:
@@ -2258,19 +2142,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             monitoring_client = self._get_monitoring_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         disk_type = disk.type.split("/")[-1]
@@ -2426,19 +2304,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             monitoring_client = self._get_monitoring_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         disk_type = disk.type.split("/")[-1]
@@ -2603,18 +2475,11 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
-
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Check labels
@@ -2715,19 +2580,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             monitoring_client = self._get_monitoring_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Only check attached disks
@@ -2927,19 +2786,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             monitoring_client = self._get_monitoring_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Only check attached disks
@@ -3090,19 +2943,13 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            disks_client = self._get_disks_client()
             monitoring_client = self._get_monitoring_client()
 
             zones = [f"{region}-a", f"{region}-b", f"{region}-c", f"{region}-f"]
 
             for zone in zones:
                 try:
-                    request = compute_v1.ListDisksRequest(
-                        project=self.project_id,
-                        zone=zone,
-                    )
-
-                    disks = disks_client.list(request=request)
+                    disks = self.inventory.list_resources("disks", zone)
 
                     for disk in disks:
                         # Only check attached disks
@@ -3284,7 +3131,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_sql_stopped"]
                 min_age_days = rules.get("min_age_days", 30)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             # List all Cloud SQL instances
             try:
@@ -3388,8 +3235,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import sql_v1
-            from google.cloud import monitoring_v3
-            from datetime import datetime, timezone, timedelta
+            from datetime import datetime, timezone
 
             # Get detection parameters
             lookback_days = 14
@@ -3397,8 +3243,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_sql_idle"]
                 lookback_days = rules.get("lookback_days", 14)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             # List all RUNNABLE instances
             try:
@@ -3410,40 +3255,20 @@ class GCPProvider(CloudProviderBase):
 
                     instance_name = instance.name
 
-                    # Query connection metrics
-                    end_time = datetime.now(timezone.utc)
-                    start_time = end_time - timedelta(days=lookback_days)
-
+                    # Connection metrics (aggregated for all instances in one query)
                     try:
-                        interval = monitoring_v3.TimeInterval({
-                            "end_time": {"seconds": int(end_time.timestamp())},
-                            "start_time": {"seconds": int(start_time.timestamp())}
-                        })
-
-                        connections_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/network/connections"'
+                        connections = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/network/connections",
+                            lookback_days,
                         )
 
-                        connections_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": connections_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
-
-                        connection_values = []
-                        for series in monitoring_client.list_time_series(request=connections_request):
-                            for point in series.points:
-                                connection_values.append(point.value.double_value or 0)
-
-                        if not connection_values:
+                        if connections is None or not connections.count:
                             # No metrics available yet
                             continue
 
-                        avg_connections = sum(connection_values) / len(connection_values)
-                        max_connections = max(connection_values)
+                        avg_connections = connections.mean or 0
+                        max_connections = connections.max or 0
 
                         # Detect idle (zero connections)
                         if avg_connections == 0 and max_connections == 0:
@@ -3544,8 +3369,6 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import sql_v1
-            from google.cloud import monitoring_v3
-            from datetime import datetime, timezone, timedelta
 
             # Get detection parameters
             cpu_threshold = 30.0
@@ -3557,8 +3380,7 @@ class GCPProvider(CloudProviderBase):
                 memory_threshold = rules.get("memory_threshold", 40.0)
                 lookback_days = rules.get("lookback_days", 14)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             # List RUNNABLE instances
             try:
@@ -3571,57 +3393,26 @@ class GCPProvider(CloudProviderBase):
                     instance_name = instance.name
                     tier = instance.settings.tier if instance.settings else "db-n1-standard-1"
 
-                    # Query CPU and Memory metrics
-                    end_time = datetime.now(timezone.utc)
-                    start_time = end_time - timedelta(days=lookback_days)
-
+                    # CPU and Memory metrics (aggregated for all instances in one query each)
                     try:
-                        interval = monitoring_v3.TimeInterval({
-                            "end_time": {"seconds": int(end_time.timestamp())},
-                            "start_time": {"seconds": int(start_time.timestamp())}
-                        })
-
-                        # CPU metrics
-                        cpu_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/cpu/utilization"'
+                        cpu = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/cpu/utilization",
+                            lookback_days,
+                            statistics=("mean", "max"),
                         )
-                        cpu_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": cpu_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
-
-                        cpu_values = []
-                        for series in monitoring_client.list_time_series(request=cpu_request):
-                            for point in series.points:
-                                cpu_values.append(point.value.double_value * 100)  # Convert to percentage
-
-                        # Memory metrics
-                        memory_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/memory/utilization"'
+                        memory = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/memory/utilization",
+                            lookback_days,
+                            statistics=("mean", "max"),
                         )
-                        memory_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": memory_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
-
-                        memory_values = []
-                        for series in monitoring_client.list_time_series(request=memory_request):
-                            for point in series.points:
-                                memory_values.append(point.value.double_value * 100)
 
-                        if not cpu_values or not memory_values:
+                        if cpu is None or cpu.mean is None or memory is None or memory.mean is None:
                             continue
 
-                        avg_cpu = sum(cpu_values) / len(cpu_values)
-                        avg_memory = sum(memory_values) / len(memory_values)
+                        avg_cpu = cpu.mean * 100  # Convert to percentage
+                        avg_memory = memory.mean * 100
 
                         # Detect over-provisioning
                         if avg_cpu < cpu_threshold and avg_memory < memory_threshold:
@@ -3669,11 +3460,11 @@ class GCPProvider(CloudProviderBase):
                                         "availability_type": "HA" if ha_enabled else "ZONAL",
                                         "cpu_metrics": {
                                             "avg_cpu_14d": round(avg_cpu, 1),
-                                            "max_cpu_14d": round(max(cpu_values), 1) if cpu_values else 0
+                                            "max_cpu_14d": round(cpu.max * 100, 1) if cpu.max is not None else 0
                                         },
                                         "memory_metrics": {
                                             "avg_memory_14d": round(avg_memory, 1),
-                                            "max_memory_14d": round(max(memory_values), 1) if memory_values else 0
+                                            "max_memory_14d": round(memory.max * 100, 1) if memory.max is not None else 0
                                         },
                                         "current_cost_monthly": round(current_cost, 2),
                                         "recommended_tier": recommended_tier,
@@ -3713,7 +3504,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import sql_v1
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -3824,7 +3615,7 @@ class GCPProvider(CloudProviderBase):
                 business_hours_per_week = rules.get("business_hours_per_week", 60)
                 devtest_labels = rules.get("devtest_labels", devtest_labels)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -3925,8 +3716,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import sql_v1
-            from google.cloud import monitoring_v3
-            from datetime import datetime, timezone, timedelta
+            from datetime import datetime, timezone
 
             # Get detection parameters
             lookback_days = 14
@@ -3934,8 +3724,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_sql_unused_replicas"]
                 lookback_days = rules.get("lookback_days", 14)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -3950,33 +3739,15 @@ class GCPProvider(CloudProviderBase):
 
                     instance_name = instance.name
 
-                    # Query read operations
-                    end_time = datetime.now(timezone.utc)
-                    start_time = end_time - timedelta(days=lookback_days)
-
+                    # Query count (aggregated for all instances in one query)
                     try:
-                        interval = monitoring_v3.TimeInterval({
-                            "end_time": {"seconds": int(end_time.timestamp())},
-                            "start_time": {"seconds": int(start_time.timestamp())}
-                        })
-
-                        queries_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/queries"'
+                        queries = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/queries",
+                            lookback_days,
+                            statistics=("sum",),
                         )
-
-                        queries_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": queries_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
-
-                        total_queries = 0
-                        for series in monitoring_client.list_time_series(request=queries_request):
-                            for point in series.points:
-                                total_queries += point.value.int64_value or 0
+                        total_queries = (queries.sum or 0) if queries else 0
 
                         # Detect unused replica
                         if total_queries == 0:
@@ -4068,7 +3839,7 @@ class GCPProvider(CloudProviderBase):
                 required_labels = rules.get("required_labels", required_labels)
                 governance_waste_pct = rules.get("governance_waste_pct", 0.05)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -4151,8 +3922,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import sql_v1
-            from google.cloud import monitoring_v3
-            from datetime import datetime, timezone, timedelta
+            from datetime import datetime, timezone
 
             # Get detection parameters
             lookback_days = 14
@@ -4162,8 +3932,7 @@ class GCPProvider(CloudProviderBase):
                 lookback_days = rules.get("lookback_days", 14)
                 min_age_days = rules.get("min_age_days", 7)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -4184,51 +3953,23 @@ class GCPProvider(CloudProviderBase):
 
                     instance_name = instance.name
 
-                    # Query I/O metrics
-                    end_time = datetime.now(timezone.utc)
-                    start_time = end_time - timedelta(days=lookback_days)
-
+                    # I/O metrics (aggregated for all instances in one query each)
                     try:
-                        interval = monitoring_v3.TimeInterval({
-                            "end_time": {"seconds": int(end_time.timestamp())},
-                            "start_time": {"seconds": int(start_time.timestamp())}
-                        })
-
-                        # Read ops
-                        read_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/disk/read_ops_count"'
+                        read_ops = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/disk/read_ops_count",
+                            lookback_days,
+                            statistics=("sum",),
                         )
-                        read_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": read_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
-
-                        total_read_ops = 0
-                        for series in monitoring_client.list_time_series(request=read_request):
-                            for point in series.points:
-                                total_read_ops += point.value.int64_value or 0
+                        total_read_ops = (read_ops.sum or 0) if read_ops else 0
 
-                        # Write ops
-                        write_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/disk/write_ops_count"'
+                        write_ops = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/disk/write_ops_count",
+                            lookback_days,
+                            statistics=("sum",),
                         )
-                        write_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": write_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
-
-                        total_write_ops = 0
-                        for series in monitoring_client.list_time_series(request=write_request):
-                            for point in series.points:
-                                total_write_ops += point.value.int64_value or 0
+                        total_write_ops = (write_ops.sum or 0) if write_ops else 0
 
                         # Detect zero I/O
                         if total_read_ops == 0 and total_write_ops == 0:
@@ -4301,8 +4042,6 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import sql_v1
-            from google.cloud import monitoring_v3
-            from datetime import datetime, timezone, timedelta
 
             # Get detection parameters
             free_space_threshold = 80.0
@@ -4316,8 +4055,7 @@ class GCPProvider(CloudProviderBase):
                 min_savings_threshold = rules.get("min_savings_threshold", 5.0)
                 lookback_days = rules.get("lookback_days", 14)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -4326,37 +4064,19 @@ class GCPProvider(CloudProviderBase):
                     instance_name = instance.name
                     allocated_storage_gb = instance.settings.data_disk_size_gb if instance.settings else 100
 
-                    # Query storage usage
-                    end_time = datetime.now(timezone.utc)
-                    start_time = end_time - timedelta(days=lookback_days)
-
+                    # Storage usage (aggregated for all instances in one query)
                     try:
-                        interval = monitoring_v3.TimeInterval({
-                            "end_time": {"seconds": int(end_time.timestamp())},
-                            "start_time": {"seconds": int(start_time.timestamp())}
-                        })
-
-                        bytes_used_filter = (
-                            f'resource.type="cloudsql_database" '
-                            f'AND resource.labels.database_id="{self.project_id}:{instance_name}" '
-                            f'AND metric.type="cloudsql.googleapis.com/database/disk/bytes_used"'
+                        bytes_used = self._get_cloud_sql_metric(
+                            instance_name,
+                            "cloudsql.googleapis.com/database/disk/bytes_used",
+                            lookback_days,
+                            statistics=("mean",),
                         )
-                        bytes_used_request = monitoring_v3.ListTimeSeriesRequest({
-                            "name": f"projects/{self.project_id}",
-                            "filter": bytes_used_filter,
-                            "interval": interval,
-                            "view": monitoring_v3.ListTimeSeriesRequest.TimeSeriesView.FULL
-                        })
 
-                        used_bytes_values = []
-                        for series in monitoring_client.list_time_series(request=bytes_used_request):
-                            for point in series.points:
-                                used_bytes_values.append(point.value.double_value or 0)
-
-                        if not used_bytes_values:
+                        if bytes_used is None or bytes_used.mean is None:
                             continue
 
-                        avg_used_bytes = sum(used_bytes_values) / len(used_bytes_values)
+                        avg_used_bytes = bytes_used.mean
                         avg_used_gb = avg_used_bytes / (1024**3)
 
                         # Calculate percentage
@@ -4452,7 +4172,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_sql_unnecessary_ha"]
                 devtest_labels = rules.get("devtest_labels", devtest_labels)
 
-            sql_client = sql_v1.CloudSqlInstancesServiceClient(credentials=self.credentials)
+            sql_client = self._gcp_client(sql_v1.CloudSqlInstancesServiceClient)
 
             try:
                 request = sql_v1.ListInstancesRequest(project=self.project_id)
@@ -4551,8 +4271,8 @@ class GCPProvider(CloudProviderBase):
                 lookback_days = rules.get("lookback_days", 14)
                 min_savings_threshold = rules.get("min_savings_threshold", 100.0)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Cloud Spanner instances
             try:
@@ -4705,7 +4425,7 @@ class GCPProvider(CloudProviderBase):
                 regional_concentration_threshold = rules.get("regional_concentration_threshold", 90.0)
                 lookback_days = rules.get("lookback_days", 14)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
 
             # List all instances
             try:
@@ -4833,7 +4553,7 @@ class GCPProvider(CloudProviderBase):
                 recommended_devtest_pu = rules.get("recommended_devtest_pu", 300)
                 min_savings_threshold = rules.get("min_savings_threshold", 100.0)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
 
             # List all instances
             try:
@@ -4948,8 +4668,8 @@ class GCPProvider(CloudProviderBase):
                 min_age_days = rules.get("min_age_days", 7)
                 min_requests_threshold = rules.get("min_requests_threshold", 0)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all instances
             try:
@@ -5088,8 +4808,8 @@ class GCPProvider(CloudProviderBase):
                 lookback_days = rules.get("lookback_days", 14)
                 min_savings_threshold = rules.get("min_savings_threshold", 50.0)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all instances with nodes (not PU)
             try:
@@ -5234,8 +4954,8 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_spanner_empty_databases"]
                 min_age_days = rules.get("min_age_days", 7)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            database_admin_client = spanner_admin_database_v1.DatabaseAdminClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            database_admin_client = self._gcp_client(spanner_admin_database_v1.DatabaseAdminClient)
 
             # List all instances
             try:
@@ -5364,7 +5084,7 @@ class GCPProvider(CloudProviderBase):
                 required_labels = rules.get("required_labels", required_labels)
                 governance_waste_pct = rules.get("governance_waste_pct", 0.05)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
 
             # List all instances
             try:
@@ -5463,8 +5183,8 @@ class GCPProvider(CloudProviderBase):
                 target_cpu = rules.get("target_cpu", 65.0)
                 lookback_days = rules.get("lookback_days", 14)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all instances
             try:
@@ -5613,8 +5333,8 @@ class GCPProvider(CloudProviderBase):
                 max_growth_rate_pct = rules.get("max_growth_rate_pct", 5.0)
                 lookback_days = rules.get("lookback_days", 30)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all instances
             try:
@@ -5763,8 +5483,8 @@ class GCPProvider(CloudProviderBase):
                 excessive_retention_days_prod = rules.get("excessive_retention_days_prod", 365)
                 devtest_labels = rules.get("devtest_labels", devtest_labels)
 
-            spanner_client = spanner_admin_instance_v1.InstanceAdminClient(credentials=self.credentials)
-            database_admin_client = spanner_admin_database_v1.DatabaseAdminClient(credentials=self.credentials)
+            spanner_client = self._gcp_client(spanner_admin_instance_v1.InstanceAdminClient)
+            database_admin_client = self._gcp_client(spanner_admin_database_v1.DatabaseAdminClient)
 
             # List all instances
             try:
@@ -5884,8 +5604,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            admin_client = FirestoreAdminClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6002,7 +5722,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6084,7 +5804,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6152,7 +5872,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6230,7 +5950,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
             from google.cloud import firestore
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6308,7 +6028,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6376,9 +6096,9 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
-            from datetime import datetime, timedelta
+            from datetime import datetime
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6461,7 +6181,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6527,7 +6247,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6607,7 +6327,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.firestore_admin_v1 import FirestoreAdminClient
 
-            admin_client = FirestoreAdminClient()
+            admin_client = self._gcp_client(FirestoreAdminClient)
 
             # List all Firestore databases
             parent = f"projects/{self.project_id}"
@@ -6680,8 +6400,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -6804,7 +6524,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.bigtable_admin_v2 import BigtableInstanceAdminClient
 
-            instance_admin_client = BigtableInstanceAdminClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -6889,8 +6609,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7010,7 +6730,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.bigtable_admin_v2 import BigtableInstanceAdminClient
 
-            instance_admin_client = BigtableInstanceAdminClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7096,8 +6816,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7198,8 +6918,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.bigtable_admin_v2 import BigtableInstanceAdminClient, BigtableTableAdminClient
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            table_admin_client = BigtableTableAdminClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            table_admin_client = self._gcp_client(BigtableTableAdminClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7282,7 +7002,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.bigtable_admin_v2 import BigtableInstanceAdminClient
 
-            instance_admin_client = BigtableInstanceAdminClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7360,8 +7080,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7476,8 +7196,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7582,8 +7302,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud.bigtable_admin_v2 import BigtableInstanceAdminClient, BigtableTableAdminClient
 
-            instance_admin_client = BigtableInstanceAdminClient()
-            table_admin_client = BigtableTableAdminClient()
+            instance_admin_client = self._gcp_client(BigtableInstanceAdminClient)
+            table_admin_client = self._gcp_client(BigtableTableAdminClient)
 
             # List all Bigtable instances
             parent = f"projects/{self.project_id}"
@@ -7661,7 +7381,6 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
             from google.cloud import monitoring_v3
             from datetime import datetime, timezone, timedelta
 
@@ -7671,25 +7390,18 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_nat_gateway_idle"]
                 min_idle_days = rules.get("min_idle_days", 7)
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             # Scan each region for Cloud Routers with NAT
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         # Check if router has NAT configurations
                         if not router.nats:
                             continue
@@ -7838,21 +7550,15 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
             # Get detection parameters
             vms_per_ip_threshold = 64  # GCP default: 64 VMs per NAT IP
             if detection_rules and "gcp_nat_over_allocated_ips" in detection_rules:
                 rules = detection_rules["gcp_nat_over_allocated_ips"]
                 vms_per_ip_threshold = rules.get("vms_per_ip_threshold", 64)
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
@@ -7863,23 +7569,14 @@ class GCPProvider(CloudProviderBase):
                     vm_count = 0
                     for zone_name in [f"{gcp_region}-a", f"{gcp_region}-b", f"{gcp_region}-c"]:
                         try:
-                            request = compute_v1.ListInstancesRequest(
-                                project=self.project_id,
-                                zone=zone_name
-                            )
-                            for instance in instances_client.list(request=request):
+                            for instance in self.inventory.list_resources("instances", zone_name):
                                 if instance.status == "RUNNING":
                                     vm_count += 1
                         except:
                             pass
 
                     # Check routers with NAT
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -7952,14 +7649,11 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import compute_v1
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-            subnetworks_client = compute_v1.SubnetworksClient(credentials=self.credentials)
+            subnetworks_client = self._gcp_client(compute_v1.SubnetworksClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
@@ -7968,12 +7662,7 @@ class GCPProvider(CloudProviderBase):
                 try:
                     # Get NAT-enabled subnets
                     nat_subnets = set()
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -7998,11 +7687,7 @@ class GCPProvider(CloudProviderBase):
                     vms_with_double_cost = []
                     for zone_name in [f"{gcp_region}-a", f"{gcp_region}-b", f"{gcp_region}-c"]:
                         try:
-                            request = compute_v1.ListInstancesRequest(
-                                project=self.project_id,
-                                zone=zone_name
-                            )
-                            for instance in instances_client.list(request=request):
+                            for instance in self.inventory.list_resources("instances", zone_name):
                                 if instance.status != "RUNNING":
                                     continue
 
@@ -8066,21 +7751,15 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
             # Get detection parameters
             min_vm_count = 5
             if detection_rules and "gcp_nat_large_deployments" in detection_rules:
                 rules = detection_rules["gcp_nat_large_deployments"]
                 min_vm_count = rules.get("min_vm_count", 5)
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
@@ -8091,11 +7770,7 @@ class GCPProvider(CloudProviderBase):
                     vm_count = 0
                     for zone_name in [f"{gcp_region}-a", f"{gcp_region}-b", f"{gcp_region}-c"]:
                         try:
-                            request = compute_v1.ListInstancesRequest(
-                                project=self.project_id,
-                                zone=zone_name
-                            )
-                            for instance in instances_client.list(request=request):
+                            for instance in self.inventory.list_resources("instances", zone_name):
                                 if instance.status == "RUNNING":
                                     vm_count += 1
                         except:
@@ -8105,12 +7780,7 @@ class GCPProvider(CloudProviderBase):
                         continue
 
                     # Check for Cloud NAT
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8163,7 +7833,6 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
             from google.cloud import monitoring_v3
             from datetime import datetime, timezone, timedelta
 
@@ -8173,13 +7842,11 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_nat_devtest_unused"]
                 min_idle_days = rules.get("min_idle_days", 14)
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
@@ -8189,12 +7856,7 @@ class GCPProvider(CloudProviderBase):
             # Scan each region
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8297,13 +7959,11 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import compute_v1
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            subnetworks_client = compute_v1.SubnetworksClient(credentials=self.credentials)
+            subnetworks_client = self._gcp_client(compute_v1.SubnetworksClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
@@ -8313,12 +7973,7 @@ class GCPProvider(CloudProviderBase):
                     # Track NAT coverage by subnet
                     subnet_nat_map = defaultdict(list)
 
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8391,26 +8046,16 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             # Scan each region
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8465,7 +8110,6 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
             from google.cloud import monitoring_v3
             from datetime import datetime, timezone, timedelta
 
@@ -8475,25 +8119,18 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_nat_high_data_processing"]
                 min_bytes_per_month = rules.get("min_bytes_per_month", 1_000_000_000_000)
 
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             # Scan each region
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8582,15 +8219,9 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
@@ -8601,11 +8232,7 @@ class GCPProvider(CloudProviderBase):
                     vm_count = 0
                     for zone_name in [f"{gcp_region}-a", f"{gcp_region}-b", f"{gcp_region}-c"]:
                         try:
-                            request = compute_v1.ListInstancesRequest(
-                                project=self.project_id,
-                                zone=zone_name
-                            )
-                            for instance in instances_client.list(request=request):
+                            for instance in self.inventory.list_resources("instances", zone_name):
                                 if instance.status == "RUNNING":
                                     vm_count += 1
                         except:
@@ -8615,12 +8242,7 @@ class GCPProvider(CloudProviderBase):
                         continue
 
                     # Check for Cloud NAT
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8676,26 +8298,16 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
-            routers_client = compute_v1.RoutersClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             # Scan each region
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListRoutersRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for router in routers_client.list(request=request):
+                    for router in self.inventory.list_resources("routers", gcp_region):
                         if not router.nats:
                             continue
 
@@ -8965,12 +8577,10 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
             disks_client = self._get_disks_client()
 
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             for snapshot in snapshots:
                 if snapshot.status != "READY":
@@ -9089,11 +8699,8 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = list(snapshots_client.list(request=request))
+            snapshots = list(self.inventory.snapshots())
 
             # Group snapshots by source_disk
             snapshots_by_disk = defaultdict(list)
@@ -9203,11 +8810,8 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             for snapshot in snapshots:
                 if snapshot.status != "READY":
@@ -9291,11 +8895,8 @@ class GCPProvider(CloudProviderBase):
         governance_waste_pct = 0.05
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             for snapshot in snapshots:
                 if snapshot.status != "READY":
@@ -9383,12 +8984,10 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
             compute_client = self._get_compute_client()
 
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             # Get all zones for checking instance existence
             zones = []
@@ -9497,11 +9096,8 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             for snapshot in snapshots:
                 if snapshot.status == "FAILED":
@@ -9578,11 +9174,8 @@ class GCPProvider(CloudProviderBase):
         governance_waste_pct = 0.05
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             for snapshot in snapshots:
                 if snapshot.status != "READY":
@@ -9669,11 +9262,8 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             for snapshot in snapshots:
                 if snapshot.status != "READY":
@@ -9757,11 +9347,8 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = list(snapshots_client.list(request=request))
+            snapshots = list(self.inventory.snapshots())
 
             # Group snapshots by source_disk
             snapshots_by_disk = defaultdict(list)
@@ -9877,11 +9464,8 @@ class GCPProvider(CloudProviderBase):
         )
 
         try:
-            snapshots_client = self._get_snapshots_client()
-
             # List all snapshots
-            request = compute_v1.ListSnapshotsRequest(project=self.project_id)
-            snapshots = snapshots_client.list(request=request)
+            snapshots = self.inventory.snapshots()
 
             # Get logging client if needed
             logging_client = self._get_logging_client() if check_restore_logs else None
@@ -11949,9 +11533,9 @@ class GCPProvider(CloudProviderBase):
             no_invocations_threshold_days = detection_rules.get("no_invocations_threshold_days", 30)
 
         try:
-            functions_v1_client = functions_v1.CloudFunctionsServiceClient(credentials=self.credentials)
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v1_client = self._gcp_client(functions_v1.CloudFunctionsServiceClient)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Scan 1st gen functions
             parent_v1 = f"projects/{self.project_id}/locations/{region}"
@@ -12133,8 +11717,8 @@ class GCPProvider(CloudProviderBase):
             lookback_days = detection_rules.get("lookback_days", 14)
 
         try:
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             parent = f"projects/{self.project_id}/locations/{region}"
 
@@ -12230,9 +11814,9 @@ class GCPProvider(CloudProviderBase):
             lookback_days = detection_rules.get("lookback_days", 14)
 
         try:
-            functions_v1_client = functions_v1.CloudFunctionsServiceClient(credentials=self.credentials)
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v1_client = self._gcp_client(functions_v1.CloudFunctionsServiceClient)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Scan 1st gen
             parent_v1 = f"projects/{self.project_id}/locations/{region}"
@@ -12405,9 +11989,9 @@ class GCPProvider(CloudProviderBase):
             lookback_days = detection_rules.get("lookback_days", 14)
 
         try:
-            functions_v1_client = functions_v1.CloudFunctionsServiceClient(credentials=self.credentials)
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v1_client = self._gcp_client(functions_v1.CloudFunctionsServiceClient)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Scan 1st gen
             parent_v1 = f"projects/{self.project_id}/locations/{region}"
@@ -12578,8 +12162,8 @@ class GCPProvider(CloudProviderBase):
             lookback_days = detection_rules.get("lookback_days", 14)
 
         try:
-            functions_v1_client = functions_v1.CloudFunctionsServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v1_client = self._gcp_client(functions_v1.CloudFunctionsServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             parent = f"projects/{self.project_id}/locations/{region}"
             functions_1st_gen = functions_v1_client.list_functions(parent=parent)
@@ -12713,8 +12297,8 @@ class GCPProvider(CloudProviderBase):
             required_labels = detection_rules.get("required_labels", ["environment", "owner"])
 
         try:
-            functions_v1_client = functions_v1.CloudFunctionsServiceClient(credentials=self.credentials)
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
+            functions_v1_client = self._gcp_client(functions_v1.CloudFunctionsServiceClient)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
 
             # Scan 1st gen
             parent_v1 = f"projects/{self.project_id}/locations/{region}"
@@ -12802,7 +12386,7 @@ class GCPProvider(CloudProviderBase):
             max_instances_threshold = detection_rules.get("max_instances_threshold", 100)
 
         try:
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
 
             parent = f"projects/{self.project_id}/locations/{region}"
             functions_2nd_gen = functions_v2_client.list_functions(parent=parent)
@@ -12871,8 +12455,8 @@ class GCPProvider(CloudProviderBase):
             lookback_days = detection_rules.get("lookback_days", 14)
 
         try:
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             parent = f"projects/{self.project_id}/locations/{region}"
             functions_2nd_gen = functions_v2_client.list_functions(parent=parent)
@@ -12972,8 +12556,8 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            functions_v1_client = functions_v1.CloudFunctionsServiceClient(credentials=self.credentials)
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
+            functions_v1_client = self._gcp_client(functions_v1.CloudFunctionsServiceClient)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
 
             function_hashes: dict[str, list] = {}
 
@@ -13075,8 +12659,8 @@ class GCPProvider(CloudProviderBase):
             lookback_days = detection_rules.get("lookback_days", 14)
 
         try:
-            functions_v2_client = functions_v2.FunctionServiceClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            functions_v2_client = self._gcp_client(functions_v2.FunctionServiceClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             parent = f"projects/{self.project_id}/locations/{region}"
             functions_2nd_gen = functions_v2_client.list_functions(parent=parent)
@@ -13221,7 +12805,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import storage
-            from datetime import datetime, timedelta
+            from datetime import datetime
 
             # Get detection parameters
             age_threshold_days = 30
@@ -13229,7 +12813,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_storage_empty"]
                 age_threshold_days = rules.get("age_threshold_days", 30)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -13299,7 +12883,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import storage, logging_v2
-            from datetime import datetime, timedelta
+            from datetime import datetime
 
             # Get detection parameters
             lookback_days = 90
@@ -13309,8 +12893,8 @@ class GCPProvider(CloudProviderBase):
                 lookback_days = rules.get("lookback_days", 90)
                 min_size_gb = rules.get("min_size_gb", 1.0)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
-            logging_client = logging_v2.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
+            logging_client = self._gcp_client(logging_v2.Client, project=self.project_id)
 
             # Sample a few buckets (full scan would be expensive)
             bucket_count = 0
@@ -13410,7 +12994,6 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import storage
-            from datetime import datetime
 
             # Get detection parameters
             min_noncurrent_versions = 10
@@ -13418,7 +13001,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_storage_versioning_waste"]
                 min_noncurrent_versions = rules.get("min_noncurrent_versions", 10)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -13498,7 +13081,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import storage
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -13570,7 +13153,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_storage_untagged"]
                 required_labels = rules.get("required_labels", required_labels)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -13622,7 +13205,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import storage
-            from datetime import datetime, timedelta
+            from datetime import datetime
 
             # Get detection parameters
             min_age_days = 90
@@ -13632,7 +13215,7 @@ class GCPProvider(CloudProviderBase):
                 min_age_days = rules.get("min_age_days", 90)
                 min_size_gb = rules.get("min_size_gb", 1.0)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             # Sample a few buckets (full scan would be expensive)
             bucket_count = 0
@@ -13716,7 +13299,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_storage_no_lifecycle"]
                 min_size_gb = rules.get("min_size_gb", 10.0)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -13787,7 +13370,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_storage_duplicates"]
                 min_size_gb = rules.get("min_size_gb", 0.1)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             # Sample a few buckets (full scan would be very expensive)
             bucket_count = 0
@@ -13882,7 +13465,7 @@ class GCPProvider(CloudProviderBase):
                 min_size_gb = rules.get("min_size_gb", 100.0)
                 max_size_gb_disable = rules.get("max_size_gb_disable", 10.0)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -13966,7 +13549,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["cloud_storage_excessive_redundancy"]
                 min_size_gb = rules.get("min_size_gb", 50.0)
 
-            storage_client = storage.Client(project=self.project_id, credentials=self.credentials)
+            storage_client = self._gcp_client(storage.Client, project=self.project_id)
 
             for bucket in storage_client.list_buckets():
                 try:
@@ -14068,8 +13651,8 @@ class GCPProvider(CloudProviderBase):
                 utilization_threshold = rules.get("utilization_threshold", 0.30)
                 lookback_days = rules.get("lookback_days", 14)
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Filestore instances
             parent = f"projects/{self.project_id}/locations/-"
@@ -14197,7 +13780,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import filestore_v1
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14302,8 +13885,8 @@ class GCPProvider(CloudProviderBase):
                 max_connections = rules.get("max_connections", 0)
                 max_total_iops = rules.get("max_total_iops", 10)
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14433,8 +14016,8 @@ class GCPProvider(CloudProviderBase):
                 utilization_threshold = rules.get("utilization_threshold", 0.10)
                 lookback_days = rules.get("lookback_days", 30)
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14548,7 +14131,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_filestore_untagged"]
                 required_labels = rules.get("required_labels", required_labels)
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14604,7 +14187,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import filestore_v1
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14669,7 +14252,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import filestore_v1
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14734,7 +14317,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import filestore_v1
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14801,7 +14384,6 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import filestore_v1
-            from datetime import datetime, timedelta
 
             # Get detection parameters
             min_age_days = 90
@@ -14809,7 +14391,7 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_filestore_snapshot_waste"]
                 min_age_days = rules.get("min_age_days", 90)
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14872,7 +14454,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import filestore_v1
 
-            filestore_client = filestore_v1.CloudFilestoreManagerClient(credentials=self.credentials)
+            filestore_client = self._gcp_client(filestore_v1.CloudFilestoreManagerClient)
 
             parent = f"projects/{self.project_id}/locations/-"
 
@@ -14945,24 +14527,16 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_static_ip_unattached"]
                 min_age_days = rules.get("min_age_days", 7)
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             # Scan regional IPs
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         # Check if IP is unattached (empty users list)
                         if not address.users:
                             # Calculate age
@@ -15017,7 +14591,7 @@ class GCPProvider(CloudProviderBase):
 
             # Scan global IPs
             try:
-                global_client = compute_v1.GlobalAddressesClient(credentials=self.credentials)
+                global_client = self._gcp_client(compute_v1.GlobalAddressesClient)
                 request = compute_v1.ListGlobalAddressesRequest(project=self.project_id)
 
                 for address in global_client.list(request=request):
@@ -15099,24 +14673,17 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_static_ip_stopped_vm"]
                 min_stopped_days = rules.get("min_stopped_days", 7)
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
+            instances_client = self._gcp_client(compute_v1.InstancesClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         # Check if IP is attached
                         if address.users and address.status == "IN_USE":
                             resource_url = address.users[0]
@@ -15223,7 +14790,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import compute_v1, monitoring_v3
-            from datetime import datetime, timezone, timedelta
+            from datetime import datetime, timedelta
             import re
 
             # Get detection parameters
@@ -15234,25 +14801,18 @@ class GCPProvider(CloudProviderBase):
                 cpu_threshold = rules.get("cpu_threshold", 0.05)
                 lookback_days = rules.get("lookback_days", 7)
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-            monitoring_client = monitoring_v3.MetricServiceClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
+            instances_client = self._gcp_client(compute_v1.InstancesClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         if address.users and address.status == "IN_USE":
                             resource_url = address.users[0]
 
@@ -15366,25 +14926,15 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         if address.network_tier == "PREMIUM":
                             labels = dict(address.labels) if address.labels else {}
                             environment = labels.get("environment", "").lower()
@@ -15444,23 +14994,15 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_static_ip_untagged"]
                 required_labels = rules.get("required_labels", required_labels)
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         labels = dict(address.labels) if address.labels else {}
 
                         # Check for missing labels
@@ -15506,7 +15048,7 @@ class GCPProvider(CloudProviderBase):
 
             # Also scan global IPs
             try:
-                global_client = compute_v1.GlobalAddressesClient(credentials=self.credentials)
+                global_client = self._gcp_client(compute_v1.GlobalAddressesClient)
                 request = compute_v1.ListGlobalAddressesRequest(project=self.project_id)
 
                 for address in global_client.list(request=request):
@@ -15572,7 +15114,6 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
             from datetime import datetime, timezone
 
             # Get detection parameters
@@ -15581,23 +15122,15 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_static_ip_old_never_used"]
                 min_age_days = rules.get("min_age_days", 90)
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         # Check if IP is unattached
                         if not address.users:
                             # Calculate age
@@ -15671,7 +15204,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import compute_v1
 
-            global_client = compute_v1.GlobalAddressesClient(credentials=self.credentials)
+            global_client = self._gcp_client(compute_v1.GlobalAddressesClient)
 
             # Check global IPs
             request = compute_v1.ListGlobalAddressesRequest(project=self.project_id)
@@ -15723,28 +15256,18 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
-
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Map: resource_url -> list of IPs
             resource_ips_map = {}
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         if address.users:
                             resource_url = address.users[0]
 
@@ -15812,7 +15335,6 @@ class GCPProvider(CloudProviderBase):
         resources = []
 
         try:
-            from google.cloud import compute_v1
             from datetime import datetime, timezone
 
             # Get detection parameters
@@ -15821,23 +15343,15 @@ class GCPProvider(CloudProviderBase):
                 rules = detection_rules["gcp_static_ip_devtest_not_released"]
                 max_age_days = rules.get("max_age_days", 30)
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
-
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         labels = dict(address.labels) if address.labels else {}
                         environment = labels.get("environment", "").lower()
 
@@ -15912,24 +15426,17 @@ class GCPProvider(CloudProviderBase):
             from datetime import datetime, timezone
             import re
 
-            addresses_client = compute_v1.AddressesClient(credentials=self.credentials)
-            instances_client = compute_v1.InstancesClient(credentials=self.credentials)
-            regions_client = compute_v1.RegionsClient(credentials=self.credentials)
+            instances_client = self._gcp_client(compute_v1.InstancesClient)
 
             # Get all active regions
             regions_to_scan = []
-            for gcp_region in regions_client.list(project=self.project_id):
+            for gcp_region in self.inventory.regions():
                 if gcp_region.status == "UP":
                     regions_to_scan.append(gcp_region.name)
 
             for gcp_region in regions_to_scan:
                 try:
-                    request = compute_v1.ListAddressesRequest(
-                        project=self.project_id,
-                        region=gcp_region
-                    )
-
-                    for address in addresses_client.list(request=request):
+                    for address in self.inventory.list_resources("addresses", gcp_region):
                         if address.users and address.status == "IN_USE":
                             resource_url = address.users[0]
                             resource_exists = False
@@ -16043,12 +15550,12 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            backend_services_client = compute_v1.BackendServicesClient()
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
-            regional_fr_client = compute_v1.ForwardingRulesClient()
-            target_http_proxies_client = compute_v1.TargetHttpProxiesClient()
-            target_https_proxies_client = compute_v1.TargetHttpsProxiesClient()
-            url_maps_client = compute_v1.UrlMapsClient()
+            backend_services_client = self._gcp_client(compute_v1.BackendServicesClient)
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
+            regional_fr_client = self._gcp_client(compute_v1.ForwardingRulesClient)
+            target_http_proxies_client = self._gcp_client(compute_v1.TargetHttpProxiesClient)
+            target_https_proxies_client = self._gcp_client(compute_v1.TargetHttpsProxiesClient)
+            url_maps_client = self._gcp_client(compute_v1.UrlMapsClient)
 
             # List all global backend services
             request = compute_v1.ListBackendServicesRequest(project=self.project_id)
@@ -16202,7 +15709,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            backend_services_client = compute_v1.BackendServicesClient()
+            backend_services_client = self._gcp_client(compute_v1.BackendServicesClient)
 
             # List all backend services
             request = compute_v1.ListBackendServicesRequest(project=self.project_id)
@@ -16336,15 +15843,14 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            global_fr_client = compute_v1.GlobalForwardingRulesClient()
-            regional_fr_client = compute_v1.ForwardingRulesClient()
-            regions_client = compute_v1.RegionsClient()
-            target_http_proxies_client = compute_v1.TargetHttpProxiesClient()
-            target_https_proxies_client = compute_v1.TargetHttpsProxiesClient()
-            target_tcp_proxies_client = compute_v1.TargetTcpProxiesClient()
-            target_ssl_proxies_client = compute_v1.TargetSslProxiesClient()
-            backend_services_client = compute_v1.BackendServicesClient()
-            regional_backend_services_client = compute_v1.RegionBackendServicesClient()
+            global_fr_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
+            regional_fr_client = self._gcp_client(compute_v1.ForwardingRulesClient)
+            target_http_proxies_client = self._gcp_client(compute_v1.TargetHttpProxiesClient)
+            target_https_proxies_client = self._gcp_client(compute_v1.TargetHttpsProxiesClient)
+            target_tcp_proxies_client = self._gcp_client(compute_v1.TargetTcpProxiesClient)
+            target_ssl_proxies_client = self._gcp_client(compute_v1.TargetSslProxiesClient)
+            backend_services_client = self._gcp_client(compute_v1.BackendServicesClient)
+            regional_backend_services_client = self._gcp_client(compute_v1.RegionBackendServicesClient)
 
             # Check global forwarding rules
             global_frs = global_fr_client.list(project=self.project_id)
@@ -16404,7 +15910,7 @@ class GCPProvider(CloudProviderBase):
                     )
 
             # Check regional forwarding rules
-            regions = regions_client.list(project=self.project_id)
+            regions = self.inventory.regions()
             for gcp_region in regions:
                 try:
                     regional_frs = regional_fr_client.list(
@@ -16554,8 +16060,8 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            monitoring_client = monitoring_v3.MetricServiceClient()
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
             project_name = f"projects/{self.project_id}"
 
             # Time interval for lookback
@@ -16670,8 +16176,8 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all forwarding rules
             frs = forwarding_rules_client.list(project=self.project_id)
@@ -16787,7 +16293,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
 
             # List all forwarding rules
             frs = forwarding_rules_client.list(project=self.project_id)
@@ -16857,8 +16363,8 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List global forwarding rules
             global_frs = forwarding_rules_client.list(project=self.project_id)
@@ -16970,10 +16476,10 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
-            target_http_proxies_client = compute_v1.TargetHttpProxiesClient()
-            target_https_proxies_client = compute_v1.TargetHttpsProxiesClient()
-            url_maps_client = compute_v1.UrlMapsClient()
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
+            target_http_proxies_client = self._gcp_client(compute_v1.TargetHttpProxiesClient)
+            target_https_proxies_client = self._gcp_client(compute_v1.TargetHttpsProxiesClient)
+            url_maps_client = self._gcp_client(compute_v1.UrlMapsClient)
 
             # Map backend services to forwarding rules
             backend_to_frs = {}
@@ -17063,8 +16569,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            backend_services_client = compute_v1.BackendServicesClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            backend_services_client = self._gcp_client(compute_v1.BackendServicesClient)
 
             # List backend services
             backend_services = backend_services_client.list(project=self.project_id)
@@ -17072,11 +16577,7 @@ class GCPProvider(CloudProviderBase):
             for backend_service in backend_services:
                 if backend_service.backends and len(backend_service.backends) > 0:
                     # Check CPU utilization of backends via Cloud Monitoring
-                    avg_cpu = await self._get_backend_avg_cpu(
-                        backend_service.name,
-                        lookback_days,
-                        monitoring_client
-                    )
+                    avg_cpu = await self._get_backend_avg_cpu(backend_service.name, lookback_days)
 
                     if avg_cpu is not None and avg_cpu < cpu_threshold:
                         # Over-provisioned: too many backends for load
@@ -17120,36 +16621,18 @@ class GCPProvider(CloudProviderBase):
         self,
         backend_service_name: str,
         lookback_days: int,
-        monitoring_client
     ) -> float | None:
         """Helper method to get average CPU utilization of backend instances."""
         try:
-            project_name = f"projects/{self.project_id}"
-            end_time = int(time.time())
-            start_time = end_time - (lookback_days * 86400)
-
-            interval = monitoring_v3.TimeInterval({
-                'end_time': {'seconds': end_time},
-                'start_time': {'seconds': start_time}
-            })
-
-            results = monitoring_client.list_time_series(
-                request={
-                    'name': project_name,
-                    'filter': 'metric.type = "compute.googleapis.com/instance/cpu/utilization"',
-                    'interval': interval,
-                    'aggregation': {
-                        'alignment_period': {'seconds': 3600},
-                        'per_series_aligner': monitoring_v3.Aggregation.Aligner.ALIGN_MEAN
-                    }
-                }
+            # Per-instance means from the shared project-wide summary (no query per backend)
+            summaries = self.metrics.summaries(
+                "compute.googleapis.com/instance/cpu/utilization",
+                "resource.label.instance_id",
+                lookback_days,
+                statistics=("mean",),
             )
 
-            cpu_values = []
-            for result in results:
-                for point in result.points:
-                    cpu_values.append(point.value.double_value)
-
+            cpu_values = [s.mean for s in summaries.values() if s.mean is not None]
             if cpu_values:
                 return sum(cpu_values) / len(cpu_values)
             return None
@@ -17177,7 +16660,7 @@ class GCPProvider(CloudProviderBase):
 
         try:
             # Initialize clients
-            forwarding_rules_client = compute_v1.GlobalForwardingRulesClient()
+            forwarding_rules_client = self._gcp_client(compute_v1.GlobalForwardingRulesClient)
 
             # List forwarding rules
             frs = forwarding_rules_client.list(project=self.project_id)
@@ -17253,8 +16736,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            redis_client = redis_v1.CloudRedisClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Redis instances in region (or all regions if None)
             if region:
@@ -17412,8 +16895,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            redis_client = redis_v1.CloudRedisClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Redis instances
             if region:
@@ -17533,8 +17016,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import monitoring_v3
             from datetime import datetime, timedelta
 
-            redis_client = redis_v1.CloudRedisClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Redis instances
             if region:
@@ -17656,7 +17139,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import redis_v1
 
-            redis_client = redis_v1.CloudRedisClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
 
             # List all Redis instances
             if region:
@@ -17742,7 +17225,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import redis_v1
 
-            redis_client = redis_v1.CloudRedisClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
 
             # List all Redis instances
             if region:
@@ -17821,7 +17304,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import redis_v1
 
-            redis_client = redis_v1.CloudRedisClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
 
             # List all Redis instances
             if region:
@@ -17908,7 +17391,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import redis_v1
 
-            redis_client = redis_v1.CloudRedisClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
 
             # List all Redis instances
             if region:
@@ -17981,8 +17464,8 @@ class GCPProvider(CloudProviderBase):
             from datetime import datetime, timedelta
             import statistics
 
-            redis_client = redis_v1.CloudRedisClient()
-            monitoring_client = monitoring_v3.MetricServiceClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
+            monitoring_client = self._gcp_client(monitoring_v3.MetricServiceClient)
 
             # List all Redis instances
             if region:
@@ -18093,7 +17576,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import redis_v1
 
-            redis_client = redis_v1.CloudRedisClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
 
             # List all Redis instances
             if region:
@@ -18184,7 +17667,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import redis_v1
 
-            redis_client = redis_v1.CloudRedisClient()
+            redis_client = self._gcp_client(redis_v1.CloudRedisClient)
 
             # List all Redis instances
             if region:
@@ -18238,7 +17721,6 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import bigquery
-            from datetime import datetime, timedelta
 
             client = bigquery.Client(project=self.project_id)
 
@@ -19187,9 +18669,10 @@ class GCPProvider(CloudProviderBase):
 
         try:
             from google.cloud import dataproc_v1
-            from datetime import datetime, timezone, timedelta
+            from datetime import datetime, timezone
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19216,7 +18699,8 @@ class GCPProvider(CloudProviderBase):
 
                 if check_job_history:
                     try:
-                        job_client = dataproc_v1.JobControllerClient(
+                        job_client = self._gcp_client(
+                            dataproc_v1.JobControllerClient,
                             client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
                         )
 
@@ -19340,7 +18824,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataproc_v1
             from datetime import datetime, timezone
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19419,7 +18904,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataproc_v1
             from datetime import datetime, timezone
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19515,7 +19001,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataproc_v1
             from datetime import datetime, timezone
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19603,7 +19090,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataproc_v1
             from datetime import datetime, timezone
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19709,7 +19197,8 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataproc_v1
             from datetime import datetime, timezone
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19788,7 +19277,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataproc_v1
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19863,7 +19353,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataproc_v1
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -19940,7 +19431,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataproc_v1
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -20019,7 +19511,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataproc_v1
 
-            client = dataproc_v1.ClusterControllerClient(
+            client = self._gcp_client(
+                dataproc_v1.ClusterControllerClient,
                 client_options={"api_endpoint": f"{region or 'us-central1'}-dataproc.googleapis.com"}
             )
 
@@ -20116,10 +19609,27 @@ class GCPProvider(CloudProviderBase):
         return current_type
 
     async def _get_cluster_cpu_utilization(self, cluster_name: str, region: str, days: int) -> float | None:
-        """Get average CPU utilization from Cloud Monitoring."""
-        # Placeholder - would implement Cloud Monitoring API call
+        """Get average CPU utilization (%) of a cluster's VMs from Cloud Monitoring."""
+        # Dataproc VMs carry the cluster name and location as labels: one query
+        # grouped by both serves every cluster of the project
+        try:
+            summary = self.metrics.get(
+                "compute.googleapis.com/instance/cpu/utilization",
+                (
+                    'metadata.user_labels."goog-dataproc-cluster-name"',
+                    'metadata.user_labels."goog-dataproc-location"',
+                ),
+                (cluster_name, region or "us-central1"),
+                days,
+                statistics=("mean",),
+            )
+        except Exception:
+            return None
+
         # Returns None if metrics not available
-        return None
+        if summary is None or summary.mean is None:
+            return None
+        return summary.mean * 100
 
     async def _get_cluster_memory_utilization(self, cluster_name: str, region: str, days: int) -> float | None:
         """Get average memory utilization from Cloud Monitoring."""
@@ -20162,7 +19672,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataflow_v1beta3
             from datetime import datetime, timezone
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             # List all jobs in region
             request = dataflow_v1beta3.ListJobsRequest(
@@ -20274,7 +19784,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataflow_v1beta3
             from datetime import datetime, timezone
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20378,9 +19888,8 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataflow_v1beta3
             from collections import defaultdict
-            from datetime import datetime, timezone, timedelta
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20493,7 +20002,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataflow_v1beta3
             from datetime import datetime, timezone
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20596,7 +20105,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataflow_v1beta3
             from datetime import datetime, timezone
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20690,7 +20199,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import dataflow_v1beta3
             from datetime import datetime, timezone
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20800,7 +20309,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataflow_v1beta3
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20888,7 +20397,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataflow_v1beta3
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -20991,7 +20500,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataflow_v1beta3
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -21085,7 +20594,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import dataflow_v1beta3
 
-            client = dataflow_v1beta3.JobsV1Beta3Client()
+            client = self._gcp_client(dataflow_v1beta3.JobsV1Beta3Client)
 
             request = dataflow_v1beta3.ListJobsRequest(
                 project_id=self.project_id,
@@ -22389,7 +21898,7 @@ class GCPProvider(CloudProviderBase):
             from google.cloud import notebooks_v1
 
             # Initialize client
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
 
             # List all locations if region not specified
             locations = [region] if region else ["us-central1-a", "us-central1-b", "us-east1-c", "europe-west1-b", "asia-east1-a"]
@@ -22517,7 +22026,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a", "us-central1-b", "us-east1-c", "europe-west1-b"]
 
             for location in locations:
@@ -22682,7 +22191,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a", "us-central1-b", "us-east1-c"]
 
             for location in locations:
@@ -22826,7 +22335,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a", "us-central1-b"]
 
             for location in locations:
@@ -22926,7 +22435,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a"]
 
             # Downgrade mapping
@@ -23052,7 +22561,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a"]
 
             for location in locations:
@@ -23170,7 +22679,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a"]
 
             downgrade_map = {
@@ -23294,7 +22803,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a"]
 
             for location in locations:
@@ -23405,7 +22914,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a"]
 
             for location in locations:
@@ -23499,7 +23008,7 @@ class GCPProvider(CloudProviderBase):
         try:
             from google.cloud import notebooks_v1
 
-            client = notebooks_v1.NotebookServiceClient()
+            client = self._gcp_client(notebooks_v1.NotebookServiceClient)
             locations = [region] if region else ["us-central1-a"]
 
             for location in locations:
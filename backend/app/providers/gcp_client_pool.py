@@ -0,0 +1,104 @@
+"""Shared GCP API clients and worker threads for a scan."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class GCPClientPool:
+    """
+    One client per (client class, options) and a bounded thread pool for the
+    lifetime of a scan.
+
+    The google-cloud client libraries are synchronous (gRPC/REST), so calling
+    them from `async def` scenarios blocked the event loop, and several
+    scenarios built a new client (new channel, new auth handshake) on every
+    call. The pool creates each client once with the scan's service account
+    credentials and runs scenarios on worker threads so their API calls
+    overlap.
+
+    google-cloud clients are thread-safe, so pooled instances can be shared
+    between worker threads.
+    """
+
+    def __init__(self, credentials_factory: Callable[[], Any], max_workers: int = 8) -> None:
+        """
+        Initialize the pool (clients and threads are created on first use).
+
+        Args:
+            credentials_factory: Returns the service account credentials
+            max_workers: Maximum number of scenarios executing at once
+        """
+        self.credentials_factory = credentials_factory
+        self.max_workers = max_workers
+
+        self._clients: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.clients_created = 0
+
+    def get_client(self, client_cls: type, **kwargs: Any) -> Any:
+        """
+        Return the pooled client for a client class and options, creating it once.
+
+        Args:
+            client_cls: google-cloud client class (e.g., compute_v1.InstancesClient)
+            **kwargs: Extra constructor arguments (e.g., client_options)
+
+        Returns:
+            Shared client instance
+        """
+        key = (client_cls, repr(sorted(kwargs.items())))
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        credentials = self.credentials_factory()
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = client_cls(credentials=credentials, **kwargs)
+                self.clients_created += 1
+            return self._clients[key]
+
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Run a coroutine function that makes blocking client calls on a worker thread.
+
+        Args:
+            func: Coroutine function to run (e.g., a scan scenario method)
+            *args: Arguments passed to func
+
+        Returns:
+            The coroutine's result
+        """
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="gcp-scan"
+                    )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: asyncio.run(func(*args)))
+
+    def close(self) -> None:
+        """Stop the worker threads and close every pooled client's transport."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        with self._lock:
+            if self._clients:
+                logger.info(f"Closing GCP client pool: {self.clients_created} clients")
+            for client in self._clients.values():
+                transport = getattr(client, "transport", None)
+                close = getattr(transport, "close", None) or getattr(client, "close", None)
+                if close is not None:
+                    try:
+                        close()
+                    except Exception as e:
+                        logger.debug(f"Error closing GCP client {type(client).__name__}: {e}")
+            self._clients.clear()
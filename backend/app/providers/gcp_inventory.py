@@ -0,0 +1,140 @@
+"""Project-wide Compute Engine listings shared by every GCP scenario of a scan."""
+
+import logging
+import threading
+from typing import Any
+
+from google.cloud import compute_v1
+
+logger = logging.getLogger(__name__)
+
+# Collections listed through aggregated_list: (client class, request class, scoped list field)
+AGGREGATED_COLLECTIONS: dict[str, tuple[type, type, str]] = {
+    "instances": (
+        compute_v1.InstancesClient,
+        compute_v1.AggregatedListInstancesRequest,
+        "instances",
+    ),
+    "disks": (compute_v1.DisksClient, compute_v1.AggregatedListDisksRequest, "disks"),
+    "addresses": (
+        compute_v1.AddressesClient,
+        compute_v1.AggregatedListAddressesRequest,
+        "addresses",
+    ),
+    "routers": (compute_v1.RoutersClient, compute_v1.AggregatedListRoutersRequest, "routers"),
+}
+
+
+class GCPComputeInventory:
+    """
+    Per-scan cache of Compute Engine instances, disks, addresses, routers,
+    snapshots and regions.
+
+    Scenarios listed instances and disks zone by zone (4 zones per region),
+    addresses and routers region by region, and each scenario repeated the
+    listing.
+    Here each collection is fetched once for the whole project with
+    `aggregated_list`, indexed by zone or region, and served to every
+    scenario. Status filters are applied locally.
+
+    Scenarios run on worker threads, so loading is guarded by per-collection
+    locks: concurrent callers share a single listing.
+    """
+
+    def __init__(self, client_pool: Any, project_id: str) -> None:
+        """
+        Initialize inventory (nothing is listed until first use).
+
+        Args:
+            client_pool: GCPClientPool providing shared clients
+            project_id: GCP Project ID
+        """
+        self.client_pool = client_pool
+        self.project_id = project_id
+        self._by_scope: dict[str, dict[str, list[Any]]] = {}
+        self._flat: dict[str, list[Any]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self.api_calls = 0
+
+    def list_resources(
+        self, collection: str, scope: str | None = None, status: str | None = None
+    ) -> list[Any]:
+        """
+        Return resources of a collection, optionally restricted to a zone/region and status.
+
+        Args:
+            collection: 'instances', 'disks', 'addresses' or 'routers'
+            scope: Zone (instances, disks) or region (addresses, routers) name; None for all
+            status: Only resources with this status (e.g., 'RUNNING')
+
+        Returns:
+            compute_v1 resource messages
+        """
+        self._load(collection)
+        if scope is None:
+            items = self._flat[collection]
+        else:
+            items = self._by_scope[collection].get(scope, [])
+        if status is not None:
+            items = [item for item in items if item.status == status]
+        return list(items)
+
+    def snapshots(self) -> list[Any]:
+        """Return all disk snapshots of the project (global resources)."""
+        return list(self._load_once("snapshots", self._list_snapshots))
+
+    def regions(self) -> list[Any]:
+        """Return all Compute Engine regions of the project."""
+        return list(self._load_once("regions", self._list_regions))
+
+    def _load(self, collection: str) -> None:
+        """Fetch an aggregated collection once and index it by zone/region."""
+        self._load_once(collection, lambda: self._list_aggregated(collection))
+
+    def _load_once(self, collection: str, loader: Any) -> list[Any]:
+        """Run a loader once per collection, sharing the result between threads."""
+        if collection in self._flat:
+            return self._flat[collection]
+
+        with self._locks_guard:
+            lock = self._locks.setdefault(collection, threading.Lock())
+        with lock:
+            if collection not in self._flat:
+                items = loader()
+                self._flat[collection] = items
+                logger.debug(
+                    f"GCP inventory loaded {collection}: {len(items)} resources, "
+                    f"{self.api_calls} list calls so far"
+                )
+            return self._flat[collection]
+
+    def _list_aggregated(self, collection: str) -> list[Any]:
+        """List a collection for every zone/region with one aggregated_list call."""
+        client_cls, request_cls, field = AGGREGATED_COLLECTIONS[collection]
+        client = self.client_pool.get_client(client_cls)
+        self.api_calls += 1
+
+        by_scope: dict[str, list[Any]] = {}
+        items: list[Any] = []
+        for scope, scoped_list in client.aggregated_list(
+            request=request_cls(project=self.project_id)
+        ):
+            resources = list(getattr(scoped_list, field, None) or [])
+            if resources:
+                # Scope keys look like 'zones/us-central1-a' or 'regions/us-central1'
+                by_scope[scope.rsplit("/", 1)[-1]] = resources
+                items.extend(resources)
+
+        self._by_scope[collection] = by_scope
+        return items
+
+    def _list_snapshots(self) -> list[Any]:
+        client = self.client_pool.get_client(compute_v1.SnapshotsClient)
+        self.api_calls += 1
+        return list(client.list(request=compute_v1.ListSnapshotsRequest(project=self.project_id)))
+
+    def _list_regions(self) -> list[Any]:
+        client = self.client_pool.get_client(compute_v1.RegionsClient)
+        self.api_calls += 1
+        return list(client.list(project=self.project_id))
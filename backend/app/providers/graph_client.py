@@ -0,0 +1,272 @@
+"""Pooled Microsoft Graph client with JSON batching, throttling retries and a per-scan cache."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Graph throttling and transient gateway errors worth retrying
+RETRY_STATUS_CODES = {429, 503, 504}
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional h2 package (httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class GraphClient:
+    """
+    Microsoft Graph client shared by every Microsoft 365 scenario of a scan.
+
+    - One pooled HTTP/2 connection instead of a new `httpx.AsyncClient`
+      (TCP + TLS handshake) per call
+    - At most `max_concurrency` requests in flight
+    - 429/503/504 responses retried after the `Retry-After` delay (exponential
+      backoff when the header is missing)
+    - `prefetch()` resolves many GET URLs through JSON `$batch` requests of
+      up to 20 sub-requests
+    - GET responses are cached for the scan, and concurrent callers of the
+      same URL share one request, so scenarios crawling the same sites and
+      drives only pay for it once
+    """
+
+    BATCH_SIZE = 20  # Graph $batch limit
+
+    def __init__(
+        self,
+        token_provider: Callable[[], Awaitable[str]],
+        base_url: str = "https://graph.microsoft.com/v1.0",
+        beta_url: str = "https://graph.microsoft.com/beta",
+        max_concurrency: int = 8,
+        max_retries: int = 5,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize client (the HTTP connection is opened on first request).
+
+        Args:
+            token_provider: Coroutine returning a valid Graph access token
+            base_url: Graph v1.0 endpoint
+            beta_url: Graph beta endpoint
+            max_concurrency: Maximum concurrent HTTP requests
+            max_retries: Retries for throttled or unavailable responses
+            timeout: Request timeout in seconds
+        """
+        self.token_provider = token_provider
+        self.base_url = base_url
+        self.beta_url = beta_url
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency = max_concurrency
+        self._http: httpx.AsyncClient | None = None
+        self._cache: dict[str, asyncio.Future] = {}
+
+        self.requests_sent = 0
+        self.batch_requests_sent = 0
+        self.throttled_responses = 0
+        self.cache_hits = 0
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                http2=_http2_available(),
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency,
+                    max_keepalive_connections=self._max_concurrency,
+                ),
+            )
+        return self._http
+
+    def url(self, endpoint: str, params: dict | None = None, use_beta: bool = False) -> str:
+        """Build the absolute URL for an endpoint and query parameters."""
+        base_url = self.beta_url if use_beta else self.base_url
+        query = f"{'&' if '?' in endpoint else '?'}{urlencode(params)}" if params else ""
+        return f"{base_url}{endpoint}{query}"
+
+    @staticmethod
+    def _retry_delay(headers: Any, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After if present, else exponential backoff."""
+        retry_after = (headers or {}).get("Retry-After") or (headers or {}).get("retry-after")
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            return min(2.0**attempt, 30.0)
+
+    async def request(self, method: str, url: str, json_data: dict | None = None) -> httpx.Response:
+        """
+        Send one request, retrying throttled responses.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            json_data: Optional JSON body
+
+        Returns:
+            Successful response
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails (after retries)
+        """
+        for attempt in range(self.max_retries + 1):
+            token = await self.token_provider()
+            headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+            async with self._semaphore:
+                response = await self._client().request(method, url, json=json_data, headers=headers)
+                self.requests_sent += 1
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                self.throttled_responses += 1
+                delay = self._retry_delay(response.headers, attempt)
+                logger.debug(f"Graph returned {response.status_code}, retrying in {delay:.1f}s: {url}")
+                await asyncio.sleep(delay)
+                continue
+
+            response.raise_for_status()
+            return response
+
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    async def _get_all_pages(self, url: str) -> dict | list:
+        """GET a URL, following @odata.nextLink for collections."""
+        all_results: list = []
+        next_link: str | None = url
+        while next_link:
+            data = (await self.request("GET", next_link)).json()
+            if "value" not in data:
+                return data
+            all_results.extend(data["value"])
+            next_link = data.get("@odata.nextLink")
+        return all_results
+
+    async def get(self, endpoint: str, params: dict | None = None, use_beta: bool = False) -> dict | list:
+        """
+        GET an endpoint (all pages), served from the scan cache when possible.
+
+        Args:
+            endpoint: API endpoint path (e.g., "/sites")
+            params: Query parameters
+            use_beta: Use beta endpoint instead of v1.0
+
+        Returns:
+            Object for single resources, list of items for collections
+        """
+        url = self.url(endpoint, params, use_beta)
+        future = self._cache.get(url)
+        if future is not None:
+            self.cache_hits += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._cache[url] = future
+        try:
+            result = await self._get_all_pages(url)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: callers may never await it
+            raise
+        future.set_result(result)
+        return result
+
+    async def prefetch(self, endpoints: list[str], use_beta: bool = False) -> None:
+        """
+        Resolve many GET endpoints through $batch and cache their responses.
+
+        Later `get()` calls for these endpoints are served from the cache;
+        failed sub-requests are cached as errors so they fail the same way.
+
+        Args:
+            endpoints: Endpoint paths (may include query strings)
+            use_beta: Use beta endpoint instead of v1.0
+        """
+        base_url = self.beta_url if use_beta else self.base_url
+        pending: dict[str, asyncio.Future] = {}
+        for endpoint in dict.fromkeys(endpoints):
+            url = f"{base_url}{endpoint}"
+            if url not in self._cache:
+                pending[endpoint] = self._cache[url] = asyncio.get_running_loop().create_future()
+
+        chunks = list(pending)
+        await asyncio.gather(
+            *(
+                self._send_batch(chunks[i : i + self.BATCH_SIZE], pending, base_url)
+                for i in range(0, len(chunks), self.BATCH_SIZE)
+            )
+        )
+
+    async def _send_batch(self, endpoints: list[str], futures: dict[str, asyncio.Future], base_url: str) -> None:
+        """Send one $batch request, retrying throttled sub-requests, and resolve their futures."""
+        remaining = list(endpoints)
+        try:
+            for attempt in range(self.max_retries + 1):
+                body = {
+                    "requests": [
+                        {"id": str(i), "method": "GET", "url": endpoint}
+                        for i, endpoint in enumerate(remaining)
+                    ]
+                }
+                response = await self.request("POST", f"{base_url}/$batch", json_data=body)
+                self.batch_requests_sent += 1
+
+                throttled: list[str] = []
+                delay = 0.0
+                for sub in response.json().get("responses", []):
+                    endpoint = remaining[int(sub["id"])]
+                    status = sub.get("status", 500)
+                    if status in RETRY_STATUS_CODES and attempt < self.max_retries:
+                        self.throttled_responses += 1
+                        throttled.append(endpoint)
+                        delay = max(delay, self._retry_delay(sub.get("headers"), attempt))
+                    elif status >= 400:
+                        request = httpx.Request("GET", f"{base_url}{endpoint}")
+                        error = httpx.HTTPStatusError(
+                            f"Graph batch sub-request failed with status {status}",
+                            request=request,
+                            response=httpx.Response(status, json=sub.get("body"), request=request),
+                        )
+                        futures[endpoint].set_exception(error)
+                        futures[endpoint].exception()
+                    else:
+                        data = sub.get("body") or {}
+                        if "value" in data:
+                            items = list(data["value"])
+                            if data.get("@odata.nextLink"):
+                                items.extend(await self._get_all_pages(data["@odata.nextLink"]))
+                            futures[endpoint].set_result(items)
+                        else:
+                            futures[endpoint].set_result(data)
+
+                if not throttled:
+                    return
+                remaining = throttled
+                await asyncio.sleep(delay)
+        except Exception as e:
+            for endpoint in endpoints:
+                if not futures[endpoint].done():
+                    futures[endpoint].set_exception(e)
+                    futures[endpoint].exception()
+
+    def stats(self) -> dict[str, int]:
+        """Request counters for scan logging."""
+        return {
+            "requests": self.requests_sent,
+            "batch_requests": self.batch_requests_sent,
+            "throttled": self.throttled_responses,
+            "cache_hits": self.cache_hits,
+        }
+
+    async def close(self) -> None:
+        """Close the pooled HTTP connection and drop cached responses."""
+        self._cache.clear()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
@@ -0,0 +1,133 @@
+"""Incremental scans: reuse scenario verdicts while their input resources are unchanged."""
+
+import hashlib
+import json
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable
+
+# Errors swallowed by the scenario evaluation running in the current context
+_scenario_errors: ContextVar[list[str] | None] = ContextVar("scenario_errors", default=None)
+
+
+def markers_digest(markers: dict[str, dict[str, str]], rules: Any = None) -> str:
+    """
+    Hash change markers of resources and the detection rules evaluated on them.
+
+    Args:
+        markers: Resource type -> {resource ID: change marker}
+        rules: Detection rules of the scenario (changing them invalidates its verdict)
+
+    Returns:
+        Hex SHA-256 digest (independent of ordering)
+    """
+    inputs = {"markers": markers, "rules": rules}
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def record_scenario_error(error: BaseException) -> None:
+    """
+    Note an error a scenario handled itself (logged and skipped).
+
+    Scenarios skip resources whose API calls fail instead of failing the
+    scan, so their findings may be incomplete: an evaluation that recorded
+    an error is not stored for reuse. No-op outside an evaluation.
+
+    Args:
+        error: Exception caught by the scenario
+    """
+    errors = _scenario_errors.get()
+    if errors is not None:
+        errors.append(f"{type(error).__name__}: {error}")
+
+
+async def evaluate_scenario(run: Awaitable[list[Any]]) -> tuple[list[Any], list[str]]:
+    """
+    Await a scenario evaluation, collecting the errors it records.
+
+    Args:
+        run: Scenario coroutine
+
+    Returns:
+        Tuple of (findings, errors recorded with record_scenario_error)
+    """
+    errors: list[str] = []
+    token = _scenario_errors.set(errors)
+    try:
+        return await run, errors
+    finally:
+        _scenario_errors.reset(token)
+
+
+@dataclass
+class ScenarioVerdict:
+    """Findings of one full scenario evaluation and the inputs they were computed from."""
+
+    inputs_digest: str
+    evaluated_at: datetime
+    findings: list[dict[str, Any]]  # OrphanResourceData.to_dict() of each finding
+
+
+@dataclass
+class IncrementalPlan:
+    """
+    Incremental evaluation of one region scan.
+
+    Metric-based scenarios (the slow ones: they query a lookback window of
+    metrics per resource) declare the resource types they read in the
+    provider's INCREMENTAL_SCENARIO_INPUTS. Before a region scan, the
+    provider collects the change markers of those resource types (state,
+    configuration, modification time). A scenario whose markers hash to
+    the digest of its previous evaluation (with the same detection rules)
+    reuses that evaluation's findings, unless it is older than max_age:
+    metrics keep moving with the lookback window even when nothing else
+    changed, so verdicts are refreshed periodically. Evaluations during which
+    the scenario swallowed an error (see record_scenario_error) are not kept
+    for reuse. Every other scenario is evaluated as usual.
+
+    Attributes:
+        previous: Last evaluation per scenario name (empty: evaluate everything)
+        max_age: Age after which a verdict is evaluated again
+        now: Reference time of the scan
+        evaluated: Scenarios evaluated by this scan (to store for the next one)
+        reused: Names of the scenarios whose previous verdict was reused
+        failed: Names of the scenarios evaluated with errors (not stored)
+    """
+
+    previous: dict[str, ScenarioVerdict] = field(default_factory=dict)
+    max_age: timedelta = timedelta(hours=72)
+    now: datetime = field(default_factory=datetime.utcnow)
+    evaluated: dict[str, ScenarioVerdict] = field(default_factory=dict)
+    reused: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    def reusable_verdict(self, scenario: str, inputs_digest: str) -> ScenarioVerdict | None:
+        """
+        Return the previous verdict of a scenario if its inputs are unchanged and it is recent.
+
+        Args:
+            scenario: Scenario name
+            inputs_digest: Digest of the current change markers of its inputs and its rules
+
+        Returns:
+            Previous verdict, or None if the scenario must be evaluated
+        """
+        verdict = self.previous.get(scenario)
+        if verdict is None or verdict.inputs_digest != inputs_digest:
+            return None
+        if self.now - verdict.evaluated_at >= self.max_age:
+            return None
+        return verdict
+
+    def evaluation_rows(self) -> list[dict[str, Any]]:
+        """Rows of the scenarios evaluated by this scan (see app.crud.scenario_evaluation)."""
+        return [
+            {
+                "scenario": scenario,
+                "inputs_digest": verdict.inputs_digest,
+                "evaluated_at": verdict.evaluated_at,
+                "findings": verdict.findings,
+            }
+            for scenario, verdict in self.evaluated.items()
+        ]
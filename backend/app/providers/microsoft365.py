@@ -1,11 +1,17 @@
 """Microsoft 365 cloud provider implementation (SharePoint + OneDrive)."""
 
+import asyncio
+import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any
 import re
-import httpx
 from azure.identity import ClientSecretCredential
+from app.core.config import settings
 from app.providers.base import CloudProviderBase, OrphanResourceData
+from app.providers.graph_client import GraphClient
+from app.providers.scenario_engine import Scenario
+
+logger = logging.getLogger(__name__)
 
 
 class Microsoft365Provider(CloudProviderBase):
@@ -21,6 +27,15 @@ class Microsoft365Provider(CloudProviderBase):
     Authentication uses Entra ID App Registration with Microsoft Graph permissions.
     """
 
+    # Graph throttles per tenant/app; request concurrency is bounded by the
+    # shared GraphClient, so all 10 scenarios may run at once
+    SCENARIO_SERVICE_LIMITS: dict[str, int] = {"graph": 10}
+
+    # Drive item fields read by the file-based scenarios (one shared listing per drive)
+    DRIVE_FILE_SELECT = (
+        "id,name,size,createdDateTime,lastModifiedDateTime,lastAccessedDateTime,webUrl,createdBy,file"
+    )
+
     def __init__(
         self,
         tenant_id: str,
@@ -60,6 +75,15 @@ class Microsoft365Provider(CloudProviderBase):
         self._access_token: str | None = None
         self._token_expires_at: datetime | None = None
 
+        # Pooled Graph client shared by all scenarios of the scan (caches the
+        # site/user/drive crawl, batches lookups, honors throttling)
+        self.graph = GraphClient(
+            self._get_access_token,
+            base_url=self.graph_api_base,
+            beta_url=self.graph_api_beta,
+            max_concurrency=settings.M365_GRAPH_MAX_CONCURRENCY,
+        )
+
     async def _get_access_token(self) -> str:
         """
         Get Microsoft Graph API access token with caching.
@@ -109,57 +133,88 @@ class Microsoft365Provider(CloudProviderBase):
             API response as dict or list
 
         Raises:
-            httpx.HTTPStatusError: If API call fails
+            httpx.HTTPStatusError: If the Graph request fails (raised by GraphClient after retries)
+            ValueError: If the HTTP method is not supported
         """
-        token = await self._get_access_token()
-        base_url = self.graph_api_beta if use_beta else self.graph_api_base
-        url = f"{base_url}{endpoint}"
-
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Handle pagination for GET requests
-            if method == "GET":
-                all_results = []
-                next_link = url
-
-                while next_link:
-                    response = await client.get(
-                        next_link,
-                        params=params if next_link == url else None,
-                        headers=headers,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    # Handle both single objects and value arrays
-                    if "value" in data:
-                        all_results.extend(data["value"])
-                        next_link = data.get("@odata.nextLink")
-                    else:
-                        return data
-
-                return all_results
-
-            # Non-GET requests
-            elif method == "POST":
-                response = await client.post(
-                    url, params=params, json=json_data, headers=headers
-                )
-            elif method == "PATCH":
-                response = await client.patch(
-                    url, params=params, json=json_data, headers=headers
-                )
-            elif method == "DELETE":
-                response = await client.delete(url, params=params, headers=headers)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
-            response.raise_for_status()
-            return response.json() if response.content else {}
+        # GET requests (all pages) are cached for the scan and shared between scenarios
+        if method == "GET":
+            return await self.graph.get(endpoint, params=params, use_beta=use_beta)
+
+        if method not in ("POST", "PATCH", "DELETE"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        response = await self.graph.request(
+            method, self.graph.url(endpoint, params, use_beta), json_data=json_data
+        )
+        return response.json() if response.content else {}
+
+    async def close(self) -> None:
+        """Close the pooled Graph connection."""
+        await self.graph.close()
+
+    async def _list_sites(self, crawl_files: bool = False) -> list[dict]:
+        """
+        List all SharePoint sites, prefetching their drives through $batch.
+
+        Args:
+            crawl_files: Also fetch every site drive's file listing (concurrently)
+
+        Returns:
+            SharePoint sites
+        """
+        sites = await self._call_graph_api("/sites?search=*")
+        drive_endpoints = [f"/sites/{site.get('id')}/drive" for site in sites]
+        await self.graph.prefetch(drive_endpoints)
+        if crawl_files:
+            await self._crawl_drive_files(drive_endpoints)
+        return sites
+
+    async def _list_users(self, crawl_files: bool = False) -> list[dict]:
+        """
+        List all users, prefetching their OneDrive drives through $batch.
+
+        Args:
+            crawl_files: Also fetch every user drive's file listing (concurrently)
+
+        Returns:
+            Users (id, displayName, userPrincipalName)
+        """
+        users = await self._call_graph_api("/users", params={"$select": "id,displayName,userPrincipalName"})
+        drive_endpoints = [f"/users/{user.get('id')}/drive" for user in users]
+        await self.graph.prefetch(drive_endpoints)
+        if crawl_files:
+            await self._crawl_drive_files(drive_endpoints)
+        return users
+
+    async def _drive_files(self, drive_id: str) -> list[dict]:
+        """
+        List all files of a drive (cached for the scan).
+
+        Scenarios filter this shared listing locally instead of each running
+        its own search with different $filter/$select parameters.
+
+        Args:
+            drive_id: Drive ID
+
+        Returns:
+            Drive items that are files, with DRIVE_FILE_SELECT fields
+        """
+        return await self._call_graph_api(
+            f"/drives/{drive_id}/root/search(q='')",
+            params={"$filter": "file ne null", "$select": self.DRIVE_FILE_SELECT},
+        )
+
+    async def _crawl_drive_files(self, drive_endpoints: list[str]) -> None:
+        """Fetch the file listings of many drives concurrently (bounded by the Graph client)."""
+
+        async def crawl(drive_endpoint: str) -> None:
+            try:
+                drive = await self._call_graph_api(drive_endpoint)
+                await self._drive_files(drive.get("id"))
+            except Exception:
+                pass  # Scenarios skip drives they cannot read
+
+        await asyncio.gather(*(crawl(endpoint) for endpoint in drive_endpoints))
 
     async def validate_credentials(self) -> dict[str, str]:
         """
@@ -224,46 +279,30 @@ class Microsoft365Provider(CloudProviderBase):
         Returns:
             List of detected orphan resources across all 10 scenarios
         """
-        all_orphans: list[OrphanResourceData] = []
-
         # Get detection rules for each resource type
         sharepoint_rules = detection_rules.get("sharepoint_sites", {}) if detection_rules else {}
         onedrive_rules = detection_rules.get("onedrive_drives", {}) if detection_rules else {}
 
-        # SharePoint scenarios (5)
-        all_orphans.extend(
-            await self.scan_sharepoint_large_files_unused(sharepoint_rules)
-        )
-        all_orphans.extend(
-            await self.scan_sharepoint_duplicate_files(sharepoint_rules)
-        )
-        all_orphans.extend(
-            await self.scan_sharepoint_sites_abandoned(sharepoint_rules)
-        )
-        all_orphans.extend(
-            await self.scan_sharepoint_excessive_versions(sharepoint_rules)
-        )
-        all_orphans.extend(
-            await self.scan_sharepoint_recycle_bin_old(sharepoint_rules)
-        )
-
-        # OneDrive scenarios (5)
-        all_orphans.extend(
-            await self.scan_onedrive_large_files_unused(onedrive_rules)
-        )
-        all_orphans.extend(
-            await self.scan_onedrive_disabled_users(onedrive_rules)
-        )
-        all_orphans.extend(
-            await self.scan_onedrive_temp_files_accumulated(onedrive_rules)
-        )
-        all_orphans.extend(
-            await self.scan_onedrive_excessive_sharing(onedrive_rules)
-        )
-        all_orphans.extend(
-            await self.scan_onedrive_duplicate_attachments(onedrive_rules)
-        )
-
+        def scenario(method: Any, rules: dict) -> Scenario:
+            return Scenario(name=method.__name__, service="graph", run=lambda _deps: method(rules))
+
+        scenarios = [
+            # SharePoint scenarios (5)
+            scenario(self.scan_sharepoint_large_files_unused, sharepoint_rules),
+            scenario(self.scan_sharepoint_duplicate_files, sharepoint_rules),
+            scenario(self.scan_sharepoint_sites_abandoned, sharepoint_rules),
+            scenario(self.scan_sharepoint_excessive_versions, sharepoint_rules),
+            scenario(self.scan_sharepoint_recycle_bin_old, sharepoint_rules),
+            # OneDrive scenarios (5)
+            scenario(self.scan_onedrive_large_files_unused, onedrive_rules),
+            scenario(self.scan_onedrive_disabled_users, onedrive_rules),
+            scenario(self.scan_onedrive_temp_files_accumulated, onedrive_rules),
+            scenario(self.scan_onedrive_excessive_sharing, onedrive_rules),
+            scenario(self.scan_onedrive_duplicate_attachments, onedrive_rules),
+        ]
+
+        all_orphans = await self._run_scenarios(region, scenarios)
+        logger.info(f"Microsoft 365 scan Graph usage: {self.graph.stats()}")
         return all_orphans
 
     # ========================================================================
@@ -306,8 +345,8 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            # Get all SharePoint sites
-            sites = await self._call_graph_api("/sites?search=*")
+            # Get all SharePoint sites (drives and file listings shared with other scenarios)
+            sites = await self._list_sites(crawl_files=True)
 
             for site in sites:
                 site_id = site.get("id")
@@ -319,14 +358,12 @@ class Microsoft365Provider(CloudProviderBase):
                     drive = await self._call_graph_api(f"/sites/{site_id}/drive")
                     drive_id = drive.get("id")
 
-                    # Query large files (>min_file_size_mb)
-                    files = await self._call_graph_api(
-                        f"/drives/{drive_id}/root/search(q='')",
-                        params={
-                            "$filter": f"file ne null and size gt {min_file_size_bytes}",
-                            "$select": "id,name,size,createdDateTime,lastModifiedDateTime,lastAccessedDateTime,webUrl,createdBy,file",
-                        },
-                    )
+                    # Large files (>min_file_size_mb), filtered from the shared drive listing
+                    files = [
+                        f
+                        for f in await self._drive_files(drive_id)
+                        if f.get("size", 0) > min_file_size_bytes
+                    ]
 
                     for file_item in files:
                         file_size_bytes = file_item.get("size", 0)
@@ -403,7 +440,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            sites = await self._call_graph_api("/sites?search=*")
+            sites = await self._list_sites(crawl_files=True)
 
             # Track files by hash across all sites
             files_by_hash: dict[str, list[dict]] = {}
@@ -417,13 +454,7 @@ class Microsoft365Provider(CloudProviderBase):
                     drive_id = drive.get("id")
 
                     # Get all files with hash info
-                    files = await self._call_graph_api(
-                        f"/drives/{drive_id}/root/search(q='')",
-                        params={
-                            "$filter": "file ne null",
-                            "$select": "id,name,size,webUrl,file",
-                        },
-                    )
+                    files = await self._drive_files(drive_id)
 
                     for file_item in files:
                         hashes = file_item.get("file", {}).get("hashes", {})
@@ -515,7 +546,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            sites = await self._call_graph_api("/sites?search=*")
+            sites = await self._list_sites()
 
             for site in sites:
                 site_id = site.get("id")
@@ -611,7 +642,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            sites = await self._call_graph_api("/sites?search=*")
+            sites = await self._list_sites(crawl_files=True)
 
             for site in sites:
                 site_id = site.get("id")
@@ -621,13 +652,10 @@ class Microsoft365Provider(CloudProviderBase):
                     drive = await self._call_graph_api(f"/sites/{site_id}/drive")
                     drive_id = drive.get("id")
 
-                    # Get all files
-                    files = await self._call_graph_api(
-                        f"/drives/{drive_id}/root/search(q='')",
-                        params={
-                            "$filter": "file ne null",
-                            "$select": "id,name,size,webUrl",
-                        },
+                    # Get all files, then fetch their version lists through $batch
+                    files = await self._drive_files(drive_id)
+                    await self.graph.prefetch(
+                        [f"/drives/{drive_id}/items/{f.get('id')}/versions" for f in files]
                     )
 
                     for file_item in files:
@@ -724,7 +752,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            sites = await self._call_graph_api("/sites?search=*")
+            sites = await self._list_sites()
 
             for site in sites:
                 site_id = site.get("id")
@@ -823,7 +851,7 @@ class Microsoft365Provider(CloudProviderBase):
 
         try:
             # Get all users
-            users = await self._call_graph_api("/users", params={"$select": "id,displayName,userPrincipalName"})
+            users = await self._list_users(crawl_files=True)
 
             for user in users:
                 user_id = user.get("id")
@@ -834,14 +862,12 @@ class Microsoft365Provider(CloudProviderBase):
                     drive = await self._call_graph_api(f"/users/{user_id}/drive")
                     drive_id = drive.get("id")
 
-                    # Query large files
-                    files = await self._call_graph_api(
-                        f"/drives/{drive_id}/root/search(q='')",
-                        params={
-                            "$filter": f"file ne null and size gt {min_file_size_bytes}",
-                            "$select": "id,name,size,createdDateTime,lastModifiedDateTime,lastAccessedDateTime,webUrl,file",
-                        },
-                    )
+                    # Large files, filtered from the shared drive listing
+                    files = [
+                        f
+                        for f in await self._drive_files(drive_id)
+                        if f.get("size", 0) > min_file_size_bytes
+                    ]
 
                     for file_item in files:
                         file_size_bytes = file_item.get("size", 0)
@@ -931,6 +957,8 @@ class Microsoft365Provider(CloudProviderBase):
                 },
             )
 
+            await self.graph.prefetch([f"/users/{user.get('id')}/drive" for user in disabled_users])
+
             for user in disabled_users:
                 user_id = user.get("id")
                 user_email = user.get("userPrincipalName", "")
@@ -1028,7 +1056,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            users = await self._call_graph_api("/users", params={"$select": "id,displayName,userPrincipalName"})
+            users = await self._list_users()
 
             for user in users:
                 user_id = user.get("id")
@@ -1141,7 +1169,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            users = await self._call_graph_api("/users", params={"$select": "id,displayName,userPrincipalName"})
+            users = await self._list_users(crawl_files=True)
 
             for user in users:
                 user_id = user.get("id")
@@ -1152,13 +1180,10 @@ class Microsoft365Provider(CloudProviderBase):
                     drive = await self._call_graph_api(f"/users/{user_id}/drive")
                     drive_id = drive.get("id")
 
-                    # Get all files
-                    files = await self._call_graph_api(
-                        f"/drives/{drive_id}/root/search(q='')",
-                        params={
-                            "$filter": "file ne null",
-                            "$select": "id,name,size,createdDateTime,webUrl",
-                        },
+                    # Get all files, then fetch their permissions through $batch
+                    files = await self._drive_files(drive_id)
+                    await self.graph.prefetch(
+                        [f"/drives/{drive_id}/items/{f.get('id')}/permissions" for f in files]
                     )
 
                     for file_item in files:
@@ -1247,7 +1272,7 @@ class Microsoft365Provider(CloudProviderBase):
         orphans: list[OrphanResourceData] = []
 
         try:
-            users = await self._call_graph_api("/users", params={"$select": "id,displayName,userPrincipalName"})
+            users = await self._list_users()
 
             for user in users:
                 user_id = user.get("id")
@@ -0,0 +1,249 @@
+"""Concurrent execution engine for cloud provider scan scenarios."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+# A scenario receives the results of the scenarios it depends on (keyed by name)
+ScenarioRunner = Callable[[dict[str, list[Any]]], Awaitable[list[Any]]]
+
+
+@dataclass
+class Scenario:
+    """
+    A single detection scenario to execute during a region scan.
+
+    Attributes:
+        name: Unique scenario name (usually the provider method name)
+        service: Cloud API service the scenario talks to (e.g., 'ec2', 'rds').
+                 Scenarios sharing a service share that service's concurrency limit.
+        run: Coroutine factory receiving the results of `depends_on` scenarios
+        depends_on: Names of scenarios that must complete before this one starts
+        rules: Detection rules the scenario runs with (part of its incremental verdict inputs)
+    """
+
+    name: str
+    service: str
+    run: ScenarioRunner
+    depends_on: tuple[str, ...] = ()
+    rules: Any = None
+
+
+@dataclass
+class ScenarioTiming:
+    """Wall-time measurement for one executed scenario."""
+
+    name: str
+    service: str
+    started_at: float  # Seconds since the engine run started
+    wall_seconds: float  # Time spent executing (excludes queueing)
+    queued_seconds: float  # Time spent waiting on dependencies and concurrency slots
+    result_count: int
+    depends_on: tuple[str, ...] = ()
+
+    @property
+    def finished_at(self) -> float:
+        """Seconds since the engine run started when this scenario finished."""
+        return self.started_at + self.wall_seconds
+
+
+@dataclass
+class ScenarioRunReport:
+    """Per-scenario timings for one engine run, with critical path analysis."""
+
+    timings: list[ScenarioTiming] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    def critical_path(self) -> list[ScenarioTiming]:
+        """
+        Return the chain of scenarios that determined the total run time.
+
+        Starts from the scenario that finished last and walks back through the
+        dependency that finished last, so the returned chain (first → last) is
+        the sequence to optimize to shorten the scan.
+
+        Returns:
+            Ordered list of timings along the critical path
+        """
+        if not self.timings:
+            return []
+
+        by_name = {t.name: t for t in self.timings}
+        current: ScenarioTiming | None = max(self.timings, key=lambda t: t.finished_at)
+        path: list[ScenarioTiming] = []
+        while current is not None:
+            path.append(current)
+            deps = [by_name[d] for d in current.depends_on if d in by_name]
+            current = max(deps, key=lambda t: t.finished_at) if deps else None
+
+        return list(reversed(path))
+
+    def slowest(self, limit: int = 10) -> list[ScenarioTiming]:
+        """Return the `limit` scenarios with the highest wall time."""
+        return sorted(self.timings, key=lambda t: t.wall_seconds, reverse=True)[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the report for logging or task metadata."""
+        return {
+            "total_seconds": round(self.total_seconds, 3),
+            "scenario_count": len(self.timings),
+            "critical_path": [t.name for t in self.critical_path()],
+            "critical_path_seconds": round(
+                sum(t.wall_seconds for t in self.critical_path()), 3
+            ),
+            "scenarios": {
+                t.name: {
+                    "service": t.service,
+                    "wall_seconds": round(t.wall_seconds, 3),
+                    "queued_seconds": round(t.queued_seconds, 3),
+                    "results": t.result_count,
+                }
+                for t in self.timings
+            },
+        }
+
+
+class ScenarioEngine:
+    """
+    Run independent scan scenarios concurrently under concurrency limits.
+
+    Scenarios are I/O-bound (cloud API calls), so running them concurrently
+    shortens a region scan to roughly its critical path instead of the sum of
+    all scenario durations. Two limits apply:
+    - max_concurrency: total scenarios in flight for the provider
+    - per-service limits: scenarios in flight for one cloud API service, to stay
+      under that service's throttling limits
+
+    Dependencies between scenarios form a DAG: a scenario only starts once
+    every scenario in its `depends_on` has completed, and receives their results.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        default_service_limit: int = 4,
+        service_limits: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            max_concurrency: Maximum scenarios running at once (all services)
+            default_service_limit: Maximum scenarios running at once per service
+            service_limits: Per-service overrides of default_service_limit
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.default_service_limit = max(1, default_service_limit)
+        self.service_limits = service_limits or {}
+
+    def _validate(self, scenarios: list[Scenario]) -> None:
+        """
+        Check scenario names are unique and dependencies form a DAG.
+
+        Raises:
+            ValueError: If a name is duplicated, a dependency is unknown,
+                        or the dependencies contain a cycle
+        """
+        names = [s.name for s in scenarios]
+        if len(names) != len(set(names)):
+            duplicates = sorted({n for n in names if names.count(n) > 1})
+            raise ValueError(f"Duplicate scenario names: {duplicates}")
+
+        by_name = {s.name: s for s in scenarios}
+        for scenario in scenarios:
+            for dep in scenario.depends_on:
+                if dep not in by_name:
+                    raise ValueError(
+                        f"Scenario '{scenario.name}' depends on unknown scenario '{dep}'"
+                    )
+
+        # Depth-first search for cycles
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at scenario '{name}'")
+            visiting.add(name)
+            for dep in by_name[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in names:
+            visit(name)
+
+    async def run(
+        self, scenarios: list[Scenario]
+    ) -> tuple[dict[str, list[Any]], ScenarioRunReport]:
+        """
+        Execute scenarios concurrently, respecting dependencies and limits.
+
+        If a scenario raises, the remaining scenarios are cancelled and the
+        exception propagates (same behavior as the former sequential loop).
+
+        Args:
+            scenarios: Scenarios to execute
+
+        Returns:
+            Tuple of (results keyed by scenario name, timing report)
+        """
+        self._validate(scenarios)
+
+        global_slots = asyncio.Semaphore(self.max_concurrency)
+        service_slots: dict[str, asyncio.Semaphore] = {}
+        for scenario in scenarios:
+            if scenario.service not in service_slots:
+                limit = self.service_limits.get(scenario.service, self.default_service_limit)
+                service_slots[scenario.service] = asyncio.Semaphore(max(1, limit))
+
+        report = ScenarioRunReport()
+        run_start = time.perf_counter()
+        tasks: dict[str, asyncio.Task[list[Any]]] = {}
+
+        async def execute(scenario: Scenario) -> list[Any]:
+            queued_at = time.perf_counter()
+
+            dependency_results: dict[str, list[Any]] = {}
+            for dep in scenario.depends_on:
+                dependency_results[dep] = await tasks[dep]
+
+            # Acquire the service slot first so a throttled service never
+            # holds a global slot while waiting
+            async with service_slots[scenario.service], global_slots:
+                started = time.perf_counter()
+                results = await scenario.run(dependency_results)
+                finished = time.perf_counter()
+
+            report.timings.append(
+                ScenarioTiming(
+                    name=scenario.name,
+                    service=scenario.service,
+                    started_at=started - run_start,
+                    wall_seconds=finished - started,
+                    queued_seconds=started - queued_at,
+                    result_count=len(results),
+                    depends_on=scenario.depends_on,
+                )
+            )
+            return results
+
+        # Tasks look up their dependencies lazily, so the dict is complete
+        # before any of them gets to run
+        for scenario in scenarios:
+            tasks[scenario.name] = asyncio.create_task(execute(scenario), name=scenario.name)
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        report.total_seconds = time.perf_counter() - run_start
+        results_by_name = {name: task.result() for name, task in tasks.items()}
+        return results_by_name, report
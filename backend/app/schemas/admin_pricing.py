@@ -19,6 +19,14 @@ class PricingCacheItem(BaseModel):
     is_expired: bool = Field(..., description="Whether cache entry is expired")
 
 
+class PricingTierStats(BaseModel):
+    """Lookup statistics of one pricing cache tier."""
+
+    hits: int = Field(0, description="Lookups answered by this tier")
+    misses: int = Field(0, description="Lookups passed on to the next tier")
+    hit_rate: float = Field(0.0, description="Hit rate percentage (0-100)")
+
+
 class PricingStats(BaseModel):
     """Pricing system statistics."""
 
@@ -29,6 +37,11 @@ class PricingStats(BaseModel):
     last_refresh_at: datetime | None = Field(None, description="Last pricing refresh timestamp")
     cache_hit_rate: float = Field(..., description="Cache hit rate percentage (0-100)")
     api_success_rate: float = Field(..., description="API call success rate (0-100)")
+    tiers: dict[str, PricingTierStats] = Field(
+        default_factory=dict, description="Lookup statistics per cache tier (memory, redis, postgres)"
+    )
+    api_fetches: int = Field(0, description="Lookups that reached the cloud provider pricing API")
+    fallback_lookups: int = Field(0, description="Lookups answered with hardcoded fallback prices")
 
 
 class PricingRefreshResponse(BaseModel):
@@ -49,6 +49,26 @@ class OrphanResource(OrphanResourceBase):
     updated_at: datetime
 
 
+class OrphanResourceChange(BaseModel):
+    """Schema for a finding added, changed or removed by a differential scan."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    scan_id: uuid.UUID
+    orphan_resource_id: uuid.UUID | None
+    change_type: str = Field(description="added, changed or removed")
+    resource_type: str
+    resource_id: str
+    resource_name: str | None
+    region: str
+    estimated_monthly_cost: float
+    previous_monthly_cost: float | None = Field(
+        default=None, description="Monthly cost found by the base scan (changed findings)"
+    )
+    created_at: datetime
+
+
 class OrphanResourceStats(BaseModel):
     """Schema for orphan resource statistics."""
 
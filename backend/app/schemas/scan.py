@@ -47,6 +47,9 @@ class Scan(ScanBase):
     celery_task_id: str | None
     started_at: datetime | None
     completed_at: datetime | None
+    base_scan_id: uuid.UUID | None = None
+    compacted_at: datetime | None = None
+    summary: dict | None = None
     created_at: datetime
 
 
@@ -71,6 +74,15 @@ class ScanSummary(BaseModel):
     last_scan_at: datetime | None
 
 
+class RegionProgress(BaseModel):
+    """Schema for the progress of one region within a scan."""
+
+    status: str = Field(description="Region status: pending, scanning, completed, failed")
+    resources_found: int = Field(default=0, description="Number of orphan resources found in this region")
+    elapsed_seconds: int = Field(default=0, description="Time spent scanning this region in seconds")
+    error: str | None = Field(default=None, description="Error message if the region scan failed")
+
+
 class ScanProgress(BaseModel):
     """Schema for scan progress tracking."""
 
@@ -79,6 +91,12 @@ class ScanProgress(BaseModel):
     total: int = Field(default=1, description="Total number of steps")
     percent: int = Field(default=0, ge=0, le=100, description="Progress percentage")
     current_step: str = Field(default="", description="Description of current step")
-    region: str = Field(default="", description="Current region being scanned")
+    region: str = Field(default="", description="Region(s) currently being scanned")
     resources_found: int = Field(default=0, description="Number of orphan resources found so far")
     elapsed_seconds: int = Field(default=0, description="Elapsed time in seconds")
+    eta_seconds: int | None = Field(
+        default=None, description="Estimated remaining time in seconds (once a region has finished)"
+    )
+    regions: dict[str, RegionProgress] = Field(
+        default_factory=dict, description="Per-region progress (regions are scanned concurrently)"
+    )
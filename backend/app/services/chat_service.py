@@ -35,43 +35,22 @@ async def build_user_context(
     """
     # Get latest scan summary across all user's accounts
     latest_scan_query = (
-        select(Scan)
-        .join(CloudAccount)
-        .where(CloudAccount.user_id == user_id)
-        .where(Scan.status == "completed")
-        .order_by(Scan.created_at.desc())
-        .limit(1)
-    )
-    result = await db.execute(latest_scan_query)
-    latest_scan = result.scalar_one_or_none()
-
-    # Get all orphan resources from latest scans per account
-    latest_scan_subquery = (
-        select(
-            Scan.cloud_account_id,
-            func.max(Scan.created_at).label("max_created_at")
-        )
-        .where(Scan.status == "completed")
-        .group_by(Scan.cloud_account_id)
-        .subquery()
-    )
-
-    latest_scan_ids = (
-        select(Scan.id)
+        select(func.max(Scan.created_at))
         .join(
-            latest_scan_subquery,
-            (Scan.cloud_account_id == latest_scan_subquery.c.cloud_account_id) &
-            (Scan.created_at == latest_scan_subquery.c.max_created_at)
+            CloudAccount,
+            (Scan.id == CloudAccount.latest_orphan_scan_id)
+            | (Scan.id == CloudAccount.latest_inventory_scan_id),
         )
-        .join(CloudAccount)
         .where(CloudAccount.user_id == user_id)
-        .subquery()
     )
+    result = await db.execute(latest_scan_query)
+    last_scan_date = result.scalar_one_or_none()
 
-    # Get all active orphan resources
+    # Get all active orphan resources from the latest scan per account
     orphan_resources_query = (
         select(OrphanResource)
-        .where(OrphanResource.scan_id.in_(select(latest_scan_ids)))
+        .join(CloudAccount, OrphanResource.scan_id == CloudAccount.latest_orphan_scan_id)
+        .where(CloudAccount.user_id == user_id)
         .where(OrphanResource.status == "active")
         .order_by(OrphanResource.estimated_monthly_cost.desc())
         .limit(settings.CHAT_CONTEXT_MAX_RESOURCES)
@@ -94,7 +73,7 @@ async def build_user_context(
     context = ChatContextData(
         total_waste_monthly=round(total_waste, 2),
         total_orphan_resources=len(top_resources),
-        last_scan_date=latest_scan.created_at if latest_scan else None,
+        last_scan_date=last_scan_date,
         top_resources=[
             {
                 "type": r.resource_type,
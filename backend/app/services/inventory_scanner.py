@@ -11,6 +11,7 @@ from typing import Any, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.providers.aws_metrics import MetricQuery
 from app.providers.base import AllCloudResourceData, OptimizationScenario
 from app.models.detection_rule import DEFAULT_DETECTION_RULES
 from app.crud import detection_rule as detection_rule_crud
@@ -64,6 +65,7 @@ class AWSInventoryScanner:
         """
         self.provider = provider
         self.session = provider.session
+        self.client_pool = provider.client_pool
         self.user_id = user_id
         self.db = db
         self.user_detection_rules: dict[str, dict] = {}  # Will be loaded async
@@ -198,7 +200,7 @@ class AWSInventoryScanner:
         all_instances: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Describe ALL instances (no filters)
                 response = await ec2.describe_instances()
 
@@ -332,7 +334,7 @@ class AWSInventoryScanner:
         all_volumes: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Describe ALL volumes (no filters)
                 response = await ec2.describe_volumes()
 
@@ -472,7 +474,7 @@ class AWSInventoryScanner:
         all_eips: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Describe ALL Elastic IPs (no filters)
                 response = await ec2.describe_addresses()
 
@@ -617,7 +619,7 @@ class AWSInventoryScanner:
             # ================================================================
             # Scan Application/Network/Gateway Load Balancers (ELBv2)
             # ================================================================
-            async with self.session.client("elbv2", region_name=region) as elbv2:
+            async with self.client_pool.client("elbv2", region_name=region) as elbv2:
                 response = await elbv2.describe_load_balancers()
 
                 for lb in response.get("LoadBalancers", []):
@@ -757,7 +759,7 @@ class AWSInventoryScanner:
             # ================================================================
             # Scan Classic Load Balancers (ELB)
             # ================================================================
-            async with self.session.client("elb", region_name=region) as elb:
+            async with self.client_pool.client("elb", region_name=region) as elb:
                 response = await elb.describe_load_balancers()
 
                 for lb in response.get("LoadBalancerDescriptions", []):
@@ -911,8 +913,8 @@ class AWSInventoryScanner:
         all_snapshots: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
-                async with self.session.client("sts", region_name=region) as sts:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
+                async with self.client_pool.client("sts", region_name=region) as sts:
                     # Get account ID
                     identity = await sts.get_caller_identity()
                     account_id = identity["Account"]
@@ -1063,12 +1065,12 @@ class AWSInventoryScanner:
         all_nat_gateways: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Describe all NAT Gateways
                 response = await ec2.describe_nat_gateways()
                 nat_gateways = response.get("NatGateways", [])
 
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     for nat in nat_gateways:
                         nat_gateway_id = nat["NatGatewayId"]
                         state = nat["State"]  # 'pending', 'available', 'deleting', 'deleted', 'failed'
@@ -1245,7 +1247,7 @@ class AWSInventoryScanner:
         all_rds: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("rds", region_name=region) as rds:
+            async with self.client_pool.client("rds", region_name=region) as rds:
                 response = await rds.describe_db_instances()
 
                 for db_instance in response.get("DBInstances", []):
@@ -1371,7 +1373,7 @@ class AWSInventoryScanner:
         all_buckets: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("s3") as s3:
+            async with self.client_pool.client("s3") as s3:
                 response = await s3.list_buckets()
 
                 for bucket in response.get("Buckets", []):
@@ -1481,7 +1483,7 @@ class AWSInventoryScanner:
     ) -> float:
         """Get average CPU utilization from CloudWatch (last 14 days)."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=14)
 
@@ -1515,7 +1517,7 @@ class AWSInventoryScanner:
     ) -> float | None:
         """Get average network in (Mbps) from CloudWatch."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=14)
 
@@ -1546,7 +1548,7 @@ class AWSInventoryScanner:
     ) -> float:
         """Get average RDS CPU utilization from CloudWatch."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=14)
 
@@ -1575,7 +1577,7 @@ class AWSInventoryScanner:
     ) -> float:
         """Get average RDS database connections from CloudWatch."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=14)
 
@@ -1604,7 +1606,7 @@ class AWSInventoryScanner:
     ) -> tuple[float, int]:
         """Get S3 bucket size (GB) and object count from CloudWatch."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=2)
 
@@ -1799,7 +1801,7 @@ class AWSInventoryScanner:
     ) -> float:
         """Get average volume read operations from CloudWatch (last 14 days)."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=14)
 
@@ -1835,7 +1837,7 @@ class AWSInventoryScanner:
     ) -> float:
         """Get average volume write operations from CloudWatch (last 14 days)."""
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
+            async with self.client_pool.client("cloudwatch", region_name=region) as cw:
                 end_time = datetime.utcnow()
                 start_time = end_time - timedelta(days=14)
 
@@ -2477,9 +2479,9 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("eks", region_name=region) as eks:
-                async with self.session.client("ec2", region_name=region) as ec2:
-                    async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("eks", region_name=region) as eks:
+                async with self.client_pool.client("ec2", region_name=region) as ec2:
+                    async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                         # List all clusters
                         response = await eks.list_clusters()
                         cluster_names = response.get("clusters", [])
@@ -2870,8 +2872,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("lambda", region_name=region) as lambda_client:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("lambda", region_name=region) as lambda_client:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all Lambda functions
                     paginator = lambda_client.get_paginator("list_functions")
                     async for page in paginator.paginate():
@@ -3295,8 +3297,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("dynamodb", region_name=region) as dynamodb:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("dynamodb", region_name=region) as dynamodb:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all tables
                     paginator = dynamodb.get_paginator("list_tables")
                     async for page in paginator.paginate():
@@ -3648,8 +3650,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ecs", region_name=region) as ecs:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("ecs", region_name=region) as ecs:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all ECS clusters
                     clusters_response = await ecs.list_clusters()
                     cluster_arns = clusters_response.get("clusterArns", [])
@@ -4201,8 +4203,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("opensearch", region_name=region) as opensearch:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("opensearch", region_name=region) as opensearch:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all domains
                     response = await opensearch.list_domain_names()
                     domain_names = [d["DomainName"] for d in response.get("DomainNames", [])]
@@ -4673,8 +4675,8 @@ class AWSInventoryScanner:
 
         try:
             # Scan REST APIs (apigateway client)
-            async with self.session.client("apigateway", region_name=region) as apigw:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("apigateway", region_name=region) as apigw:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List REST APIs
                     rest_response = await apigw.get_rest_apis()
                     rest_apis = rest_response.get("items", [])
@@ -4870,8 +4872,8 @@ class AWSInventoryScanner:
                             continue
 
             # Scan HTTP + WebSocket APIs (apigatewayv2 client)
-            async with self.session.client("apigatewayv2", region_name=region) as apigw2:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("apigatewayv2", region_name=region) as apigw2:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List HTTP + WebSocket APIs
                     v2_response = await apigw2.get_apis()
                     v2_apis = v2_response.get("Items", [])
@@ -5261,8 +5263,8 @@ class AWSInventoryScanner:
 
         try:
             # CloudFront is a global service, client doesn't take region parameter
-            async with self.session.client("cloudfront") as cloudfront:
-                async with self.session.client("cloudwatch", region_name="us-east-1") as cloudwatch:
+            async with self.client_pool.client("cloudfront") as cloudfront:
+                async with self.client_pool.client("cloudwatch", region_name="us-east-1") as cloudwatch:
                     # CloudWatch metrics for CloudFront are ONLY in us-east-1
 
                     # List all distributions
@@ -5684,8 +5686,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ecs", region_name=region) as ecs:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("ecs", region_name=region) as ecs:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all ECS clusters
                     list_response = await ecs.list_clusters()
                     cluster_arns = list_response.get("clusterArns", [])
@@ -6134,8 +6136,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("logs", region_name=region) as logs:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("logs", region_name=region) as logs:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # Paginate through all log groups
                     paginator = logs.get_paginator("describe_log_groups")
 
@@ -6448,8 +6450,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("efs", region_name=region) as efs:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("efs", region_name=region) as efs:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all EFS file systems
                     response = await efs.describe_file_systems()
                     file_systems = response.get("FileSystems", [])
@@ -7065,8 +7067,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("elasticache", region_name=region) as elasticache:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("elasticache", region_name=region) as elasticache:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all ElastiCache clusters (Redis + Memcached)
                     response = await elasticache.describe_cache_clusters()
                     clusters = response.get("CacheClusters", [])
@@ -7273,8 +7275,8 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("kinesis", region_name=region) as kinesis:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("kinesis", region_name=region) as kinesis:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all streams
                     paginator = kinesis.get_paginator("list_streams")
                     stream_names = []
@@ -7584,20 +7586,14 @@ class AWSInventoryScanner:
             Average value of the metric, or 0 if no datapoints
         """
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
-                response = await cw.get_metric_statistics(
-                    Namespace=namespace,
-                    MetricName=metric_name,
-                    Dimensions=dimensions,
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=period,
-                    Statistics=[statistic],
-                )
-                datapoints = response.get("Datapoints", [])
-                if datapoints:
-                    return sum(dp[statistic] for dp in datapoints) / len(datapoints)
-                return 0.0
+            # Batched with concurrent lookups through GetMetricData (shared with the orphan scan)
+            query = MetricQuery.create(
+                namespace, metric_name, dimensions, statistic, start_time, end_time, period
+            )
+            datapoints = await self.provider._metric_collector(region).get(query)
+            if datapoints:
+                return sum(dp[statistic] for dp in datapoints) / len(datapoints)
+            return 0.0
         except Exception as e:
             logger = structlog.get_logger()
             logger.warning(
@@ -7636,20 +7632,14 @@ class AWSInventoryScanner:
             Sum of the metric, or 0 if no datapoints
         """
         try:
-            async with self.session.client("cloudwatch", region_name=region) as cw:
-                response = await cw.get_metric_statistics(
-                    Namespace=namespace,
-                    MetricName=metric_name,
-                    Dimensions=dimensions,
-                    StartTime=start_time,
-                    EndTime=end_time,
-                    Period=period,
-                    Statistics=[statistic],
-                )
-                datapoints = response.get("Datapoints", [])
-                if datapoints:
-                    return sum(dp[statistic] for dp in datapoints)
-                return 0.0
+            # Batched with concurrent lookups through GetMetricData (shared with the orphan scan)
+            query = MetricQuery.create(
+                namespace, metric_name, dimensions, statistic, start_time, end_time, period
+            )
+            datapoints = await self.provider._metric_collector(region).get(query)
+            if datapoints:
+                return sum(dp[statistic] for dp in datapoints)
+            return 0.0
         except Exception as e:
             logger = structlog.get_logger()
             logger.warning(
@@ -7687,7 +7677,7 @@ class AWSInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Describe all VPC endpoints
                 response = await ec2.describe_vpc_endpoints()
                 endpoints = response.get("VpcEndpoints", [])
@@ -8164,7 +8154,7 @@ class AWSInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("neptune", region_name=region) as neptune:
+            async with self.client_pool.client("neptune", region_name=region) as neptune:
                 # Describe all Neptune clusters
                 response = await neptune.describe_db_clusters()
                 clusters = response.get("DBClusters", [])
@@ -8740,7 +8730,7 @@ class AWSInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("kafka", region_name=region) as kafka:
+            async with self.client_pool.client("kafka", region_name=region) as kafka:
                 # List all MSK clusters
                 response = await kafka.list_clusters_v2()
                 cluster_info_list = response.get("ClusterInfoList", [])
@@ -9266,7 +9256,7 @@ class AWSInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("redshift", region_name=region) as redshift:
+            async with self.client_pool.client("redshift", region_name=region) as redshift:
                 # Describe all Redshift clusters
                 response = await redshift.describe_clusters()
                 clusters = response.get("Clusters", [])
@@ -9720,7 +9710,7 @@ class AWSInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("ec2", region_name=region) as ec2:
+            async with self.client_pool.client("ec2", region_name=region) as ec2:
                 # Describe all VPN connections
                 response = await ec2.describe_vpn_connections()
                 vpn_connections = response.get("VpnConnections", [])
@@ -11449,19 +11439,12 @@ class AzureInventoryScanner:
         all_vms: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.compute import ComputeManagementClient
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
+            compute_client = self.provider._azure_client(ComputeManagementClient, self.subscription_id)
 
             # Get ALL VMs
-            vms = list(compute_client.virtual_machines.list_all())
+            vms = list(self.provider.inventory.list_resources("virtual_machines", region))
 
             for vm in vms:
                 # Filter by region
@@ -11595,19 +11578,8 @@ class AzureInventoryScanner:
         all_disks: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.compute import ComputeManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-
             # Get ALL disks
-            disks = list(compute_client.disks.list())
+            disks = list(self.provider.inventory.list_resources("disks", region))
 
             for disk in disks:
                 # Filter by region
@@ -11714,19 +11686,8 @@ class AzureInventoryScanner:
         all_ips: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # Get ALL public IPs
-            public_ips = list(network_client.public_ip_addresses.list_all())
+            public_ips = list(self.provider.inventory.list_resources("public_ip_addresses", region))
 
             for ip in public_ips:
                 # Filter by region
@@ -11837,17 +11798,10 @@ class AzureInventoryScanner:
             Average CPU utilization percentage (0-100)
         """
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.monitor import MonitorManagementClient
             from datetime import datetime, timedelta, timezone
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            monitor_client = MonitorManagementClient(credential, self.subscription_id)
+            monitor_client = self.provider._azure_client(MonitorManagementClient, self.subscription_id)
 
             # Build resource ID
             resource_id = f"/subscriptions/{self.subscription_id}/resourceGroups/{resource_group}/providers/Microsoft.Compute/virtualMachines/{vm_name}"
@@ -11899,17 +11853,10 @@ class AzureInventoryScanner:
             Average network in MB/s
         """
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.monitor import MonitorManagementClient
             from datetime import datetime, timedelta, timezone
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            monitor_client = MonitorManagementClient(credential, self.subscription_id)
+            monitor_client = self.provider._azure_client(MonitorManagementClient, self.subscription_id)
 
             # Build resource ID
             resource_id = f"/subscriptions/{self.subscription_id}/resourceGroups/{resource_group}/providers/Microsoft.Compute/virtualMachines/{vm_name}"
@@ -12225,19 +12172,8 @@ class AzureInventoryScanner:
         all_lbs: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-
             # Get ALL load balancers
-            load_balancers = list(network_client.load_balancers.list_all())
+            load_balancers = list(self.provider.inventory.list_resources("load_balancers", region))
 
             for lb in load_balancers:
                 # Filter by region
@@ -12439,17 +12375,7 @@ class AzureInventoryScanner:
         all_app_gateways: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-            app_gateways = list(network_client.application_gateways.list_all())
+            app_gateways = list(self.provider.inventory.list_resources("application_gateways", region))
 
             logger.info(
                 "inventory.azure_app_gateways_fetched",
@@ -12690,17 +12616,10 @@ class AzureInventoryScanner:
         all_storage_accounts: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.storage import StorageManagementClient
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            storage_client = StorageManagementClient(credential, self.subscription_id)
-            storage_accounts = list(storage_client.storage_accounts.list())
+            storage_client = self.provider._azure_client(StorageManagementClient, self.subscription_id)
+            storage_accounts = list(self.provider.inventory.list_resources("storage_accounts", region))
 
             logger.info(
                 "inventory.azure_storage_accounts_fetched",
@@ -12929,17 +12848,7 @@ class AzureInventoryScanner:
         all_expressroute: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-            expressroute_circuits = list(network_client.express_route_circuits.list_all())
+            expressroute_circuits = list(self.provider.inventory.list_resources("express_route_circuits", region))
 
             logger.info(
                 "inventory.azure_expressroute_fetched",
@@ -13190,18 +13099,9 @@ class AzureInventoryScanner:
         all_snapshots: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.compute import ComputeManagementClient
             from datetime import datetime, timezone
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            compute_client = ComputeManagementClient(credential, self.subscription_id)
-            snapshots = list(compute_client.snapshots.list())
+            snapshots = list(self.provider.inventory.list_resources("snapshots", region))
 
             logger.info(
                 "inventory.azure_snapshots_fetched",
@@ -13210,7 +13110,7 @@ class AzureInventoryScanner:
             )
 
             # Get all disks to check for orphaned snapshots
-            all_disks = list(compute_client.disks.list())
+            all_disks = list(self.provider.inventory.list_resources("disks"))
             disk_ids = {disk.id for disk in all_disks}
 
             # Group snapshots by source disk
@@ -13426,17 +13326,7 @@ class AzureInventoryScanner:
         all_nat_gateways: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.network import NetworkManagementClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            network_client = NetworkManagementClient(credential, self.subscription_id)
-            nat_gateways = list(network_client.nat_gateways.list_all())
+            nat_gateways = list(self.provider.inventory.list_resources("nat_gateways", region))
 
             logger.info(
                 "inventory.azure_nat_gateways_fetched",
@@ -13445,7 +13335,7 @@ class AzureInventoryScanner:
             )
 
             # Get all VNets to count NAT Gateways per VNet
-            vnets = list(network_client.virtual_networks.list_all())
+            vnets = list(self.provider.inventory.list_resources("virtual_networks"))
             nat_per_vnet: dict[str, int] = {}
 
             for nat in nat_gateways:
@@ -13659,19 +13549,12 @@ class AzureInventoryScanner:
         all_sql_databases: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.sql import SqlManagementClient
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            sql_client = SqlManagementClient(credential, self.subscription_id)
+            sql_client = self.provider._azure_client(SqlManagementClient, self.subscription_id)
 
             # Get all SQL servers first
-            sql_servers = list(sql_client.servers.list())
+            sql_servers = list(self.provider.inventory.list_resources("sql_servers", region))
 
             logger.info(
                 "inventory.azure_sql_servers_fetched",
@@ -13938,17 +13821,7 @@ class AzureInventoryScanner:
         all_aks_clusters: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
-            from azure.mgmt.containerservice import ContainerServiceClient
-
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            aks_client = ContainerServiceClient(credential, self.subscription_id)
-            clusters = list(aks_client.managed_clusters.list())
+            clusters = list(self.provider.inventory.list_resources("managed_clusters", region))
 
             logger.info(
                 "inventory.azure_aks_fetched",
@@ -14183,19 +14056,12 @@ class AzureInventoryScanner:
         all_function_apps: list[AllCloudResourceData] = []
 
         try:
-            from azure.identity import ClientSecretCredential
             from azure.mgmt.web import WebSiteManagementClient
 
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-
-            web_client = WebSiteManagementClient(credential, self.subscription_id)
+            web_client = self.provider._azure_client(WebSiteManagementClient, self.subscription_id)
 
             # List all web apps (includes Function Apps)
-            all_sites = list(web_client.web_apps.list())
+            all_sites = list(self.provider.inventory.list_resources("web_apps", region))
 
             # Filter to only Function Apps
             function_apps = [site for site in all_sites if site.kind and "functionapp" in site.kind.lower()]
@@ -23175,12 +23041,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Synapse client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            synapse_client = SynapseManagementClient(credential, self.subscription_id)
+            synapse_client = self.provider._azure_client(SynapseManagementClient, self.subscription_id)
 
             # Iterate through workspaces
             workspaces = synapse_client.workspaces.list()
@@ -23452,12 +23313,7 @@ class AzureInventoryScanner:
 
         try:
             # Create network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            network_client = NetworkManagementClient(credential, self.subscription_id)
+            network_client = self.provider._azure_client(NetworkManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -23711,12 +23567,7 @@ class AzureInventoryScanner:
 
         try:
             # Create network client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            network_client = NetworkManagementClient(credential, self.subscription_id)
+            network_client = self.provider._azure_client(NetworkManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -23962,12 +23813,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Front Door client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            frontdoor_client = FrontDoorManagementClient(credential, self.subscription_id)
+            frontdoor_client = self.provider._azure_client(FrontDoorManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -24217,12 +24063,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Container Registry client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            acr_client = ContainerRegistryManagementClient(credential, self.subscription_id)
+            acr_client = self.provider._azure_client(ContainerRegistryManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -24481,12 +24322,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Service Bus client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            sb_client = ServiceBusManagementClient(credential, self.subscription_id)
+            sb_client = self.provider._azure_client(ServiceBusManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -24635,12 +24471,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Service Bus client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            sb_client = ServiceBusManagementClient(credential, self.subscription_id)
+            sb_client = self.provider._azure_client(ServiceBusManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -24973,12 +24804,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Event Grid client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            eventgrid_client = EventGridManagementClient(credential, self.subscription_id)
+            eventgrid_client = self.provider._azure_client(EventGridManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -25233,12 +25059,7 @@ class AzureInventoryScanner:
 
         try:
             # Create Key Vault client
-            credential = ClientSecretCredential(
-                tenant_id=self.tenant_id,
-                client_id=self.client_id,
-                client_secret=self.client_secret
-            )
-            kv_client = KeyVaultManagementClient(credential, self.subscription_id)
+            kv_client = self.provider._azure_client(KeyVaultManagementClient, self.subscription_id)
 
             # Get all resource groups
             resource_groups = await self._get_resource_groups()
@@ -25450,8 +25271,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            credential = self._get_azure_credential()
-            app_config_client = AppConfigurationManagementClient(credential, self.subscription_id)
+            app_config_client = self.provider._azure_client(AppConfigurationManagementClient, self.subscription_id)
 
             # Iterate over resource groups
             for rg_name in self.resource_groups:
@@ -25710,8 +25530,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            credential = self._get_azure_credential()
-            apim_client = ApiManagementClient(credential, self.subscription_id)
+            apim_client = self.provider._azure_client(ApiManagementClient, self.subscription_id)
 
             # Iterate over resource groups
             for rg_name in self.resource_groups:
@@ -26017,8 +25836,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            credential = self._get_azure_credential()
-            logic_client = LogicManagementClient(credential, self.subscription_id)
+            logic_client = self.provider._azure_client(LogicManagementClient, self.subscription_id)
 
             # Iterate over resource groups
             for rg_name in self.resource_groups:
@@ -26308,8 +26126,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            credential = self._get_azure_credential()
-            df_client = DataFactoryManagementClient(credential, self.subscription_id)
+            df_client = self.provider._azure_client(DataFactoryManagementClient, self.subscription_id)
 
             # Iterate over resource groups
             for rg_name in self.resource_groups:
@@ -26604,8 +26421,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            credential = self._get_azure_credential()
-            web_client = WebSiteManagementClient(credential, self.subscription_id)
+            web_client = self.provider._azure_client(WebSiteManagementClient, self.subscription_id)
 
             # Iterate over resource groups
             for rg_name in self.resource_groups:
@@ -27116,8 +26932,7 @@ class AzureInventoryScanner:
             return resources
 
         try:
-            credential = DefaultAzureCredential()
-            client = IotHubClient(credential, self.subscription_id)
+            client = self.provider._azure_client(IotHubClient, self.subscription_id)
 
             # Iterate through all resource groups
             for rg_name in await self._get_resource_group_names():
@@ -28055,8 +27870,7 @@ class AzureInventoryScanner:
             return resources
 
         try:
-            credential = DefaultAzureCredential()
-            automation_client = AutomationClient(credential, self.subscription_id)
+            automation_client = self.provider._azure_client(AutomationClient, self.subscription_id)
 
             # Iterate through all resource groups
             for rg_name in await self._get_resource_group_names():
@@ -29447,7 +29261,7 @@ class AzureInventoryScanner:
             all_policies: list[AllCloudResourceData] = []
 
             # List all storage accounts
-            storage_accounts = list(storage_client.storage_accounts.list())
+            storage_accounts = list(self.provider.inventory.list_resources("storage_accounts", region))
 
             # Filter by region
             region_accounts = [acc for acc in storage_accounts if acc.location == region]
@@ -29987,8 +29801,8 @@ class AzureInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("fsx", region_name=region) as fsx:
-                async with self.session.client("cloudwatch", region_name=region) as cloudwatch:
+            async with self.client_pool.client("fsx", region_name=region) as fsx:
+                async with self.client_pool.client("cloudwatch", region_name=region) as cloudwatch:
                     # List all file systems
                     paginator = fsx.get_paginator("describe_file_systems")
                     file_systems = []
@@ -30519,7 +30333,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("sagemaker", region_name=region) as sagemaker:
+            async with self.client_pool.client("sagemaker", region_name=region) as sagemaker:
                 # List all SageMaker endpoints
                 response = await sagemaker.list_endpoints()
                 endpoints = response.get("Endpoints", [])
@@ -32304,7 +32118,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("secretsmanager", region_name=region) as sm:
+            async with self.client_pool.client("secretsmanager", region_name=region) as sm:
                 # List all secrets
                 paginator = sm.get_paginator("list_secrets")
                 async for page in paginator.paginate():
@@ -32674,7 +32488,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("backup", region_name=region) as backup:
+            async with self.client_pool.client("backup", region_name=region) as backup:
                 # List all backup vaults
                 paginator = backup.get_paginator("list_backup_vaults")
                 async for page in paginator.paginate():
@@ -32734,7 +32548,7 @@ class AzureInventoryScanner:
                             last_restore_time = None
 
                             try:
-                                async with self.session.client(
+                                async with self.client_pool.client(
                                     "cloudwatch", region_name=region
                                 ) as cw:
                                     # NumberOfBackupJobs metric
@@ -33170,7 +32984,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("apprunner", region_name=region) as apprunner:
+            async with self.client_pool.client("apprunner", region_name=region) as apprunner:
                 # List all App Runner services
                 paginator = apprunner.get_paginator("list_services")
                 async for page in paginator.paginate():
@@ -33213,7 +33027,7 @@ class AzureInventoryScanner:
                             error_responses_30d = 0
 
                             try:
-                                async with self.session.client(
+                                async with self.client_pool.client(
                                     "cloudwatch", region_name=region
                                 ) as cw:
                                     # Requests metric (30 days)
@@ -33672,7 +33486,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("lightsail", region_name=region) as lightsail:
+            async with self.client_pool.client("lightsail", region_name=region) as lightsail:
                 # Get all Lightsail instances
                 response = await lightsail.get_instances()
                 instances = response.get("instances", [])
@@ -34080,7 +33894,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("workspaces", region_name=region) as ws:
+            async with self.client_pool.client("workspaces", region_name=region) as ws:
                 # List all WorkSpaces
                 paginator = ws.get_paginator("describe_workspaces")
                 async for page in paginator.paginate():
@@ -34135,7 +33949,7 @@ class AzureInventoryScanner:
 
                             # Get CloudWatch metrics for user connected time
                             try:
-                                async with self.session.client(
+                                async with self.client_pool.client(
                                     "cloudwatch", region_name=region
                                 ) as cw:
                                     # UserConnected metric (30 days)
@@ -34473,7 +34287,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("emr", region_name=region) as emr:
+            async with self.client_pool.client("emr", region_name=region) as emr:
                 # List all EMR clusters (active and recently terminated)
                 cluster_states = ["RUNNING", "WAITING", "TERMINATING", "TERMINATED"]
                 paginator = emr.get_paginator("list_clusters")
@@ -34532,7 +34346,7 @@ class AzureInventoryScanner:
                             hdfs_utilization_pct = 0.0
 
                             try:
-                                async with self.session.client(
+                                async with self.client_pool.client(
                                     "cloudwatch", region_name=region
                                 ) as cloudwatch:
                                     # IsIdle metric (7 days)
@@ -34920,7 +34734,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("sagemaker", region_name=region) as sagemaker:
+            async with self.client_pool.client("sagemaker", region_name=region) as sagemaker:
                 # List all notebook instances
                 paginator = sagemaker.get_paginator("list_notebook_instances")
 
@@ -34964,7 +34778,7 @@ class AzureInventoryScanner:
 
                             if status == "InService":
                                 try:
-                                    async with self.session.client(
+                                    async with self.client_pool.client(
                                         "cloudwatch", region_name=region
                                     ) as cloudwatch:
                                         # CPUUtilization metric (7 days)
@@ -35311,7 +35125,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("transfer", region_name=region) as transfer:
+            async with self.client_pool.client("transfer", region_name=region) as transfer:
                 # List all Transfer Family servers
                 paginator = transfer.get_paginator("list_servers")
 
@@ -35346,7 +35160,7 @@ class AzureInventoryScanner:
                             bytes_out = 0.0
 
                             try:
-                                async with self.session.client(
+                                async with self.client_pool.client(
                                     "cloudwatch", region_name=region
                                 ) as cloudwatch:
                                     # FilesIn metric (30 days)
@@ -35746,7 +35560,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("elasticbeanstalk", region_name=region) as eb:
+            async with self.client_pool.client("elasticbeanstalk", region_name=region) as eb:
                 # List all Elastic Beanstalk environments
                 environments_response = await eb.describe_environments(
                     IncludeDeleted=False  # Don't include deleted environments
@@ -35809,7 +35623,7 @@ class AzureInventoryScanner:
                         cpu_utilization_pct = 0.0
 
                         try:
-                            async with self.session.client(
+                            async with self.client_pool.client(
                                 "cloudwatch", region_name=region
                             ) as cloudwatch:
                                 # ApplicationRequests4xx metric (30 days)
@@ -36210,7 +36024,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("directconnect", region_name=region) as dx:
+            async with self.client_pool.client("directconnect", region_name=region) as dx:
                 # List all Direct Connect connections
                 connections_response = await dx.describe_connections()
 
@@ -36238,7 +36052,7 @@ class AzureInventoryScanner:
                         bytes_in = 0.0
 
                         try:
-                            async with self.session.client(
+                            async with self.client_pool.client(
                                 "cloudwatch", region_name=region
                             ) as cloudwatch:
                                 # ConnectionBpsEgress metric (30 days)
@@ -36619,7 +36433,7 @@ class AzureInventoryScanner:
         resources = []
 
         try:
-            async with self.session.client("mq", region_name=region) as mq:
+            async with self.client_pool.client("mq", region_name=region) as mq:
                 # List all MQ brokers
                 brokers_response = await mq.list_brokers()
 
@@ -36668,7 +36482,7 @@ class AzureInventoryScanner:
                         producer_count = 0
 
                         try:
-                            async with self.session.client(
+                            async with self.client_pool.client(
                                 "cloudwatch", region_name=region
                             ) as cloudwatch:
                                 # CpuUtilization metric (7 days)
@@ -37068,7 +36882,7 @@ class AzureInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("kendra", region_name=region) as kendra:
+            async with self.client_pool.client("kendra", region_name=region) as kendra:
                 # List all Kendra indexes
                 paginator = kendra.get_paginator("list_indices")
                 async for page in paginator.paginate():
@@ -37410,7 +37224,7 @@ class AzureInventoryScanner:
         resources: list[AllCloudResourceData] = []
 
         try:
-            async with self.session.client("cloudformation", region_name=region) as cfn:
+            async with self.client_pool.client("cloudformation", region_name=region) as cfn:
                 # List all stacks (including deleted in last 90 days)
                 # We filter out DELETE_COMPLETE stacks as they're already cleaned up
                 paginator = cfn.get_paginator("list_stacks")
@@ -7,9 +7,9 @@ All data is anonymized to protect user privacy and comply with GDPR.
 
 from datetime import datetime
 from typing import Any, Dict, List
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.cloud_account import CloudAccount
@@ -19,7 +19,6 @@ from app.models.ml_training_data import MLTrainingData
 from app.models.orphan_resource import OrphanResource
 from app.models.resource_lifecycle_event import ResourceLifecycleEvent
 from app.models.scan import Scan
-from app.models.user import User
 from app.services.ml_anonymization import (
     anonymize_account_id,
     anonymize_metrics,
@@ -30,100 +29,194 @@ from app.services.ml_anonymization import (
 )
 
 
+def ml_resource_payload(orphan: Any) -> Dict[str, Any]:
+    """
+    Fields of a scan result used for ML collection, as a JSON-serializable dict.
+
+    Args:
+        orphan: OrphanResourceData (or OrphanResource) detected by a scan
+
+    Returns:
+        Dict with resource_type, resource_id, region, estimated_monthly_cost
+        and resource_metadata
+    """
+    return {
+        "resource_type": orphan.resource_type,
+        "resource_id": orphan.resource_id,
+        "region": orphan.region,
+        "estimated_monthly_cost": orphan.estimated_monthly_cost,
+        "resource_metadata": orphan.resource_metadata or {},
+    }
+
+
+def _lifecycle_event_row(
+    resource: Dict[str, Any],
+    provider: str,
+    region_anonymized: str,
+    event_type: str,
+    event_timestamp: datetime,
+    event_metadata: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """Column values of a resource_lifecycle_events row."""
+    metadata = resource["resource_metadata"] or {}
+    return {
+        "id": uuid4(),
+        "resource_hash": anonymize_resource_id(resource["resource_id"]),
+        "resource_type": resource["resource_type"],
+        "provider": provider,
+        "region_anonymized": region_anonymized,
+        "event_type": event_type,
+        "age_at_event_days": calculate_resource_age_days(metadata.get("created_date")),
+        "cost_at_event": resource["estimated_monthly_cost"],
+        "metrics_snapshot": anonymize_metrics(metadata.get("cloudwatch_metrics", {})),
+        "event_metadata": event_metadata or {},
+        "event_timestamp": event_timestamp,
+    }
+
+
+def _metrics_history_rows(
+    resource: Dict[str, Any],
+    provider: str,
+    region_anonymized: str,
+    metrics: Dict[str, Any],
+    collected_at: datetime,
+) -> List[Dict[str, Any]]:
+    """Column values of the cloudwatch_metrics_history rows of a resource (one per metric)."""
+    metadata = resource["resource_metadata"] or {}
+    period_days = metadata.get("metrics_period_days", 30)
+    start_date = datetime.fromtimestamp(collected_at.timestamp() - (period_days * 86400))
+
+    rows = []
+    for metric_name, metric_data in metrics.items():
+        if not isinstance(metric_data, dict):
+            continue
+
+        # Anonymize metric values
+        anonymized_values = {
+            "timeseries": metric_data.get("timeseries", []),
+            "avg": metric_data.get("avg"),
+            "p50": metric_data.get("p50"),
+            "p95": metric_data.get("p95"),
+            "p99": metric_data.get("p99"),
+            "min": metric_data.get("min"),
+            "max": metric_data.get("max"),
+            "trend": metric_data.get("trend", "unknown"),
+        }
+
+        rows.append(
+            {
+                "id": uuid4(),
+                "resource_type": resource["resource_type"],
+                "provider": provider,
+                "region_anonymized": region_anonymized,
+                "metric_name": metric_name,
+                # Remove None values
+                "metric_values": {k: v for k, v in anonymized_values.items() if v is not None},
+                "aggregation_period": "daily",
+                "start_date": start_date,
+                "end_date": collected_at,
+                "collected_at": collected_at,
+            }
+        )
+    return rows
+
+
+async def _bulk_insert(
+    db: AsyncSession, model: Any, rows: List[Dict[str, Any]], chunk_size: int
+) -> None:
+    """Insert rows of a model with executemany INSERTs, chunk by chunk."""
+    for start in range(0, len(rows), chunk_size):
+        await db.execute(insert(model), rows[start : start + chunk_size])
+
+
 async def collect_ml_training_data(
-    scan: Scan,
-    orphan_resources: List[OrphanResource],
-    user: User,
+    cloud_account: CloudAccount,
+    orphan_resources: List[Dict[str, Any]],
     db: AsyncSession,
+    detected_at: datetime | None = None,
+    chunk_size: int = 1000,
 ) -> int:
     """
     Collect anonymized ML training data from scan results.
 
+    Works on the scan's in-memory results (see `ml_resource_payload`): the
+    account is resolved once by the caller, regions are anonymized once per
+    distinct region, and the MLTrainingData, lifecycle ("detected") and
+    metrics history rows are bulk-inserted in a single transaction.
+
     Args:
-        scan: Completed scan object
-        orphan_resources: List of detected orphan resources
-        user: User who owns the scan
+        cloud_account: Cloud account the resources belong to
+        orphan_resources: Detected resources (ml_resource_payload dicts)
         db: Database session
+        detected_at: Detection time (default: now)
+        chunk_size: Rows per INSERT statement
 
     Returns:
         Number of ML training records created
     """
     # Data collection is automatic (mentioned in CGV/Terms of Service)
     # No frontend opt-in required - user agreed via CGV
-    records_created = 0
+    now = datetime.now()
+    detected_at = detected_at or now
+    provider = cloud_account.provider
 
-    for resource in orphan_resources:
-        try:
-            # Extract metadata
-            metadata = resource.resource_metadata or {}
-
-            # Calculate resource age
-            created_date = metadata.get("created_date")
-            resource_age = calculate_resource_age_days(created_date)
+    # Few distinct regions per scan: anonymize each once
+    anonymized_regions = {
+        region: anonymize_region(region)
+        for region in {resource["region"] for resource in orphan_resources}
+    }
 
-            # Get detection scenario and confidence
-            detection_scenario = metadata.get("detection_scenario", "unknown")
-            confidence_level = metadata.get("confidence", "medium")
+    training_rows: List[Dict[str, Any]] = []
+    lifecycle_rows: List[Dict[str, Any]] = []
+    metrics_rows: List[Dict[str, Any]] = []
 
-            # Anonymize metrics
+    for resource in orphan_resources:
+        try:
+            metadata = resource["resource_metadata"] or {}
+            region_anonymized = anonymized_regions[resource["region"]]
             raw_metrics = metadata.get("cloudwatch_metrics", {})
-            anonymized_metrics = anonymize_metrics(raw_metrics)
-
-            # Anonymize resource config
-            anonymized_config = anonymize_resource_config(metadata)
 
-            # Get cloud account
-            result = await db.execute(
-                select(CloudAccount).where(CloudAccount.id == resource.cloud_account_id)
+            training_rows.append(
+                {
+                    "id": uuid4(),
+                    "resource_type": resource["resource_type"],
+                    "provider": provider,
+                    "region_anonymized": region_anonymized,
+                    "resource_age_days": calculate_resource_age_days(
+                        metadata.get("created_date")
+                    ),
+                    "detection_scenario": metadata.get("detection_scenario", "unknown"),
+                    "metrics_summary": anonymize_metrics(raw_metrics),
+                    "cost_monthly": resource["estimated_monthly_cost"],
+                    "confidence_level": metadata.get("confidence", "medium"),
+                    "user_action": None,  # Will be set later when user takes action
+                    "resource_config": anonymize_resource_config(metadata),
+                    "detected_at": detected_at,
+                }
             )
-            account = result.scalar_one_or_none()
-            if not account:
-                continue
-
-            # Create ML training record
-            ml_record = MLTrainingData(
-                resource_type=resource.resource_type,
-                provider=account.provider,
-                region_anonymized=anonymize_region(resource.region),
-                resource_age_days=resource_age,
-                detection_scenario=detection_scenario,
-                metrics_summary=anonymized_metrics,
-                cost_monthly=resource.estimated_monthly_cost,
-                confidence_level=confidence_level,
-                user_action=None,  # Will be set later when user takes action
-                resource_config=anonymized_config,
-                detected_at=resource.created_at,
+            lifecycle_rows.append(
+                _lifecycle_event_row(resource, provider, region_anonymized, "detected", now)
             )
-
-            db.add(ml_record)
-            records_created += 1
-
-            # Also create lifecycle event
-            await collect_resource_lifecycle_event(
-                resource=resource,
-                account=account,
-                event_type="detected",
-                db=db,
-            )
-
             # Collect CloudWatch metrics history if available
             if raw_metrics:
-                await collect_cloudwatch_metrics_history(
-                    resource=resource,
-                    account=account,
-                    metrics=raw_metrics,
-                    db=db,
+                metrics_rows.extend(
+                    _metrics_history_rows(resource, provider, region_anonymized, raw_metrics, now)
                 )
 
         except Exception as e:
             # Log error but continue processing other resources
-            print(f"Error collecting ML data for resource {resource.id}: {e}")
+            print(f"Error collecting ML data for resource {resource.get('resource_id')}: {e}")
             continue
 
-    if records_created > 0:
-        await db.commit()
+    if not training_rows:
+        return 0
+
+    await _bulk_insert(db, MLTrainingData, training_rows, chunk_size)
+    await _bulk_insert(db, ResourceLifecycleEvent, lifecycle_rows, chunk_size)
+    await _bulk_insert(db, CloudWatchMetricsHistory, metrics_rows, chunk_size)
+    await db.commit()
 
-    return records_created
+    return len(training_rows)
 
 
 async def collect_resource_lifecycle_event(
@@ -144,29 +237,15 @@ async def collect_resource_lifecycle_event(
         event_metadata: Optional additional metadata about the event
     """
     try:
-        # Get resource metadata
-        metadata = resource.resource_metadata or {}
-
-        # Calculate resource age
-        created_date = metadata.get("created_date")
-        resource_age = calculate_resource_age_days(created_date)
-
-        # Anonymize metrics snapshot
-        raw_metrics = metadata.get("cloudwatch_metrics", {})
-        anonymized_metrics = anonymize_metrics(raw_metrics)
-
-        # Create lifecycle event
         lifecycle_event = ResourceLifecycleEvent(
-            resource_hash=anonymize_resource_id(resource.resource_id),
-            resource_type=resource.resource_type,
-            provider=account.provider,
-            region_anonymized=anonymize_region(resource.region),
-            event_type=event_type,
-            age_at_event_days=resource_age,
-            cost_at_event=resource.estimated_monthly_cost,
-            metrics_snapshot=anonymized_metrics,
-            event_metadata=event_metadata or {},
-            event_timestamp=datetime.now(),
+            **_lifecycle_event_row(
+                ml_resource_payload(resource),
+                account.provider,
+                anonymize_region(resource.region),
+                event_type,
+                datetime.now(),
+                event_metadata,
+            )
         )
 
         db.add(lifecycle_event)
@@ -193,47 +272,14 @@ async def collect_cloudwatch_metrics_history(
         db: Database session
     """
     try:
-        # Get time range from metadata
-        metadata = resource.resource_metadata or {}
-        period_days = metadata.get("metrics_period_days", 30)
-
-        end_date = datetime.now()
-        start_date = datetime.fromtimestamp(end_date.timestamp() - (period_days * 86400))
-
-        # Process each metric
-        for metric_name, metric_data in metrics.items():
-            if not isinstance(metric_data, dict):
-                continue
-
-            # Anonymize metric values
-            anonymized_values = {
-                "timeseries": metric_data.get("timeseries", []),
-                "avg": metric_data.get("avg"),
-                "p50": metric_data.get("p50"),
-                "p95": metric_data.get("p95"),
-                "p99": metric_data.get("p99"),
-                "min": metric_data.get("min"),
-                "max": metric_data.get("max"),
-                "trend": metric_data.get("trend", "unknown"),
-            }
-
-            # Remove None values
-            anonymized_values = {k: v for k, v in anonymized_values.items() if v is not None}
-
-            # Create metrics history record
-            metrics_history = CloudWatchMetricsHistory(
-                resource_type=resource.resource_type,
-                provider=account.provider,
-                region_anonymized=anonymize_region(resource.region),
-                metric_name=metric_name,
-                metric_values=anonymized_values,
-                aggregation_period="daily",
-                start_date=start_date,
-                end_date=end_date,
-                collected_at=datetime.now(),
-            )
-
-            db.add(metrics_history)
+        for row in _metrics_history_rows(
+            ml_resource_payload(resource),
+            account.provider,
+            anonymize_region(resource.region),
+            metrics,
+            datetime.now(),
+        ):
+            db.add(CloudWatchMetricsHistory(**row))
 
         await db.commit()
 
@@ -242,11 +288,35 @@ async def collect_cloudwatch_metrics_history(
         # Don't raise - this is non-critical
 
 
+async def scan_cost_breakdown(db: AsyncSession, scan_id: UUID) -> List[Dict[str, Any]]:
+    """
+    Monthly cost of a scan's orphan resources per type and region.
+
+    Args:
+        db: Database session
+        scan_id: Scan UUID
+
+    Returns:
+        One dict per (type, region) with resource_type, region and
+        estimated_monthly_cost, as accepted by `aggregate_monthly_cost_trends`
+    """
+    result = await db.execute(
+        select(
+            OrphanResource.resource_type,
+            OrphanResource.region,
+            func.sum(OrphanResource.estimated_monthly_cost).label("estimated_monthly_cost"),
+        )
+        .where(OrphanResource.scan_id == scan_id)
+        .group_by(OrphanResource.resource_type, OrphanResource.region)
+    )
+    return [dict(row) for row in result.mappings().all()]
+
+
 async def aggregate_monthly_cost_trends(
     cloud_account: CloudAccount,
     month: str,  # Format: YYYY-MM
     scan: Scan,
-    orphan_resources: List[OrphanResource],
+    orphan_resources: List[Dict[str, Any]],
     db: AsyncSession,
 ) -> None:
     """
@@ -256,25 +326,31 @@ async def aggregate_monthly_cost_trends(
         cloud_account: The cloud account
         month: Month in YYYY-MM format
         scan: The scan that was just completed
-        orphan_resources: List of orphan resources found in scan
+        orphan_resources: Resources found in scan (ml_resource_payload dicts)
         db: Database session
     """
     try:
         # Calculate waste by resource type
         waste_by_type: Dict[str, float] = {}
         regional_breakdown: Dict[str, float] = {}
+        anonymized_regions: Dict[str, str] = {}
 
         for resource in orphan_resources:
+            resource_type = resource["resource_type"]
+            cost = resource["estimated_monthly_cost"]
+
             # Aggregate by type
-            if resource.resource_type not in waste_by_type:
-                waste_by_type[resource.resource_type] = 0
-            waste_by_type[resource.resource_type] += resource.estimated_monthly_cost
+            if resource_type not in waste_by_type:
+                waste_by_type[resource_type] = 0
+            waste_by_type[resource_type] += cost
 
             # Aggregate by region (anonymized)
-            region = anonymize_region(resource.region)
+            if resource["region"] not in anonymized_regions:
+                anonymized_regions[resource["region"]] = anonymize_region(resource["region"])
+            region = anonymized_regions[resource["region"]]
             if region not in regional_breakdown:
                 regional_breakdown[region] = 0
-            regional_breakdown[region] += resource.estimated_monthly_cost
+            regional_breakdown[region] += cost
 
         # Check if record already exists for this month
         account_hash = anonymize_account_id(str(cloud_account.id))
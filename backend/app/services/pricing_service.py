@@ -2,16 +2,24 @@
 
 import asyncio
 import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 import boto3
+import redis.asyncio as aioredis
 import structlog
 from botocore.exceptions import BotoCoreError, ClientError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.crud import pricing_cache as pricing_cache_crud
 from app.models.pricing_cache import CloudProvider, PricingCache
 
 logger = structlog.get_logger()
@@ -33,6 +41,8 @@ FALLBACK_PRICING = {
         "alb": 16.20,  # Application Load Balancer
         "nlb": 16.20,  # Network Load Balancer
         "clb": 18.00,  # Classic Load Balancer
+        # NAT Gateways
+        "nat_gateway": 32.85,  # $0.045/hour
         # Add more as needed
     },
     "azure": {
@@ -53,6 +63,314 @@ FALLBACK_PRICING = {
 }
 
 
+# Price lookup tiers, fastest first (the AWS Pricing API is the last resort)
+PRICING_TIERS = ("memory", "redis", "postgres")
+
+# Redis hash aggregating tier counters of every API/worker process
+PRICING_STATS_KEY = "pricing:stats"
+
+# Seconds between flushes of a process' tier counters to Redis
+PRICING_STATS_FLUSH_INTERVAL = 10
+
+# Cache key of one price: (provider, service, region)
+PriceKey = tuple[str, str, str]
+
+# AWS services priced per region during scans (AWSProvider._get_price)
+AWS_SCAN_SERVICES = ("ebs_gp3", "ebs_gp2", "ebs_io1", "ebs_io2", "ebs_st1", "ebs_sc1", "elastic_ip")
+
+
+class LocalPriceCache:
+    """
+    Process-wide LRU of prices with a TTL, keyed by (provider, service, region).
+
+    Shared by every PricingService of the process, so consecutive scans on a
+    Celery worker reuse prices without touching Redis or PostgreSQL.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of prices kept (least recently used are evicted)
+            ttl_seconds: Seconds a price stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[PriceKey, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: PriceKey) -> float | None:
+        """Cached price, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            price, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return price
+
+    def set(self, key: PriceKey, price: float) -> None:
+        """Cache a price, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = (price, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached price."""
+        with self._lock:
+            self._entries.clear()
+
+
+class PricingTierCounters:
+    """
+    Hit/miss counters per lookup tier, accumulated in-process.
+
+    Counting memory hits in Redis would cost a round trip per lookup, so
+    counters are kept locally and added to the PRICING_STATS_KEY hash in
+    batches (see PricingService.flush_stats()).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self.last_flush = time.monotonic()
+
+    def record(self, field: str) -> None:
+        """Increment a counter (e.g., 'memory_hits', 'redis_misses', 'api_fetches')."""
+        with self._lock:
+            self._counts[field] += 1
+
+    def pending(self) -> dict[str, int]:
+        """Counters not flushed yet."""
+        with self._lock:
+            return dict(self._counts)
+
+    def take(self) -> dict[str, int]:
+        """Return and reset the counters not flushed yet."""
+        with self._lock:
+            counts, self._counts = dict(self._counts), Counter()
+            self.last_flush = time.monotonic()
+            return counts
+
+    def restore(self, counts: dict[str, int]) -> None:
+        """Put back counters whose flush failed."""
+        with self._lock:
+            self._counts.update(counts)
+
+
+local_price_cache = LocalPriceCache(
+    settings.PRICING_MEMORY_CACHE_SIZE, settings.PRICING_MEMORY_CACHE_TTL_SECONDS
+)
+tier_counters = PricingTierCounters()
+
+
+def summarize_tier_stats(counts: dict[str, int]) -> dict[str, Any]:
+    """
+    Hit rates per tier from raw counters.
+
+    Args:
+        counts: Counters such as 'memory_hits', 'memory_misses', 'api_fetches'
+
+    Returns:
+        Dict with 'tiers' (tier -> hits, misses, hit_rate in %), 'api_fetches' and 'fallbacks'
+    """
+    tiers = {}
+    for tier in PRICING_TIERS:
+        hits = int(counts.get(f"{tier}_hits", 0))
+        misses = int(counts.get(f"{tier}_misses", 0))
+        lookups = hits + misses
+        tiers[tier] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups * 100, 2) if lookups else 0.0,
+        }
+    return {
+        "tiers": tiers,
+        "api_fetches": int(counts.get("api_fetches", 0)),
+        "fallbacks": int(counts.get("fallbacks", 0)),
+    }
+
+
+class PriceTable:
+    """
+    Immutable snapshot of the prices a scan needs, keyed by (provider, service, region).
+
+    Loaded once at scan start (see load_price_table() and
+    PricingService.build_price_table()) and handed to the provider, so cost
+    calculations are dictionary lookups instead of cache/database round trips.
+    """
+
+    def __init__(self, prices: Mapping[PriceKey, float] | None = None) -> None:
+        """
+        Initialize table.
+
+        Args:
+            prices: Price per unit by (provider, service, region)
+        """
+        self._prices = MappingProxyType(dict(prices or {}))
+
+    def get(
+        self, provider: str, service: str, region: str, default: float | None = None
+    ) -> float | None:
+        """Price of a service in a region, or default if the snapshot has none."""
+        return self._prices.get((provider, service, region), default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._prices
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+
+async def load_price_table(db: AsyncSession, provider: str, regions: Iterable[str]) -> PriceTable:
+    """
+    Load every unexpired pricing_cache row of a provider's regions in one query.
+
+    Args:
+        db: SQLAlchemy async database session
+        provider: Cloud provider ('aws', 'azure', 'gcp')
+        regions: Regions the scan covers
+
+    Returns:
+        PriceTable with the cached prices (empty if the query fails)
+    """
+    regions = list(regions)
+    try:
+        result = await db.execute(
+            select(PricingCache.service, PricingCache.region, PricingCache.price_per_unit).where(
+                PricingCache.provider == provider,
+                PricingCache.region.in_(regions),
+                PricingCache.expires_at > datetime.utcnow(),
+            )
+        )
+        prices = {(provider, service, region): price for service, region, price in result.all()}
+    except Exception as e:
+        logger.error("pricing.price_table_load_error", error=str(e), provider=provider)
+        prices = {}
+
+    logger.info(
+        "pricing.price_table_loaded", provider=provider, regions=len(regions), prices=len(prices)
+    )
+    return PriceTable(prices)
+
+
+async def get_tier_stats() -> dict[str, Any]:
+    """
+    Lookup tier statistics of all processes (Redis hash plus this process' pending counters).
+
+    Returns:
+        See summarize_tier_stats()
+    """
+    counts: Counter[str] = Counter(tier_counters.pending())
+    client = aioredis.from_url(str(settings.REDIS_URL), decode_responses=True)
+    try:
+        stored = await client.hgetall(PRICING_STATS_KEY)
+        counts.update({field: int(value) for field, value in stored.items()})
+    except Exception as e:
+        logger.warning("pricing.tier_stats_unavailable", error=str(e))
+    finally:
+        await client.aclose()
+    return summarize_tier_stats(counts)
+
+
+HOURS_PER_MONTH = 730
+
+
+def _usagetype_suffix(suffix: str, service: str) -> Callable[[dict[str, str]], str | None]:
+    """Map products whose usagetype ends with suffix (e.g., 'EUW1-NatGateway-Hours') to service."""
+    return lambda attributes: service if attributes.get("usagetype", "").endswith(suffix) else None
+
+
+@dataclass(frozen=True)
+class AWSPriceListQuery:
+    """
+    One get_products listing of the pricing refresh job, covering every region.
+
+    Attributes:
+        service_code: Price List service code (e.g., 'AmazonEC2', 'AWSELB')
+        filters: TERM_MATCH filters of the listing (no location: all regions at once;
+            locationType 'AWS Region' keeps Local Zone, Wavelength and Outposts SKUs out)
+        service_for: Product attributes -> service identifier, or None to skip the product
+        unit: Unit stored in pricing_cache
+        multiplier: Factor applied to the on-demand price (e.g., hours per month)
+    """
+
+    service_code: str
+    filters: dict[str, str]
+    service_for: Callable[[dict[str, str]], str | None]
+    unit: str = "GB"
+    multiplier: float = 1.0
+
+
+# Price lists refreshed by the pricing job; a new service is one more listing,
+# fetched in parallel with the others
+AWS_PRICE_LIST_QUERIES = (
+    # EBS volumes, $/GB/month ('ebs_gp3', 'ebs_io2', ...)
+    AWSPriceListQuery(
+        "AmazonEC2",
+        {"productFamily": "Storage", "locationType": "AWS Region"},
+        lambda attributes: (
+            f"ebs_{attributes['volumeApiName']}" if attributes.get("volumeApiName") else None
+        ),
+    ),
+    # Idle Elastic IP, $/month
+    AWSPriceListQuery(
+        "AmazonEC2",
+        {"productFamily": "IP Address", "locationType": "AWS Region"},
+        _usagetype_suffix("ElasticIP:IdleAddress", "elastic_ip"),
+        unit="month",
+        multiplier=HOURS_PER_MONTH,
+    ),
+    # NAT Gateway hours, $/month
+    AWSPriceListQuery(
+        "AmazonEC2",
+        {"productFamily": "NAT Gateway", "locationType": "AWS Region"},
+        _usagetype_suffix("NatGateway-Hours", "nat_gateway"),
+        unit="month",
+        multiplier=HOURS_PER_MONTH,
+    ),
+    # Load balancer hours, $/month
+    AWSPriceListQuery(
+        "AWSELB",
+        {"productFamily": "Load Balancer-Application", "locationType": "AWS Region"},
+        _usagetype_suffix("LoadBalancerUsage", "alb"),
+        unit="month",
+        multiplier=HOURS_PER_MONTH,
+    ),
+    AWSPriceListQuery(
+        "AWSELB",
+        {"productFamily": "Load Balancer-Network", "locationType": "AWS Region"},
+        _usagetype_suffix("LoadBalancerUsage", "nlb"),
+        unit="month",
+        multiplier=HOURS_PER_MONTH,
+    ),
+    AWSPriceListQuery(
+        "AWSELB",
+        {"productFamily": "Load Balancer", "locationType": "AWS Region"},
+        _usagetype_suffix("LoadBalancerUsage", "clb"),
+        unit="month",
+        multiplier=HOURS_PER_MONTH,
+    ),
+)
+
+
+def _on_demand_price(price_item: dict[str, Any]) -> float | None:
+    """First non-zero on-demand USD price of a Price List product."""
+    for term_attrs in price_item.get("terms", {}).get("OnDemand", {}).values():
+        for dim_attrs in term_attrs.get("priceDimensions", {}).values():
+            price = dim_attrs.get("pricePerUnit", {}).get("USD")
+            if price and float(price) > 0:
+                return float(price)
+    return None
+
+
 class AWSPricingClient:
     """
     Client for AWS Price List API.
@@ -67,6 +385,23 @@ class AWSPricingClient:
     All API calls must be made to us-east-1 regardless of the resource region.
     """
 
+    # Region code -> location name used by the Pricing API
+    REGION_LOCATIONS = {
+        "us-east-1": "US East (N. Virginia)",
+        "us-east-2": "US East (Ohio)",
+        "us-west-1": "US West (N. California)",
+        "us-west-2": "US West (Oregon)",
+        "eu-west-1": "Europe (Ireland)",
+        "eu-west-2": "Europe (London)",
+        "eu-west-3": "Europe (Paris)",
+        "eu-central-1": "Europe (Frankfurt)",
+        "ap-southeast-1": "Asia Pacific (Singapore)",
+        "ap-southeast-2": "Asia Pacific (Sydney)",
+        "ap-northeast-1": "Asia Pacific (Tokyo)",
+        "ap-northeast-2": "Asia Pacific (Seoul)",
+        # Add more regions as needed
+    }
+
     def __init__(self):
         """Initialize AWS Pricing API client (us-east-1 only)."""
         self.client = boto3.client("pricing", region_name="us-east-1")
@@ -77,22 +412,60 @@ class AWSPricingClient:
 
         Example: 'us-east-1' → 'US East (N. Virginia)'
         """
-        region_map = {
-            "us-east-1": "US East (N. Virginia)",
-            "us-east-2": "US East (Ohio)",
-            "us-west-1": "US West (N. California)",
-            "us-west-2": "US West (Oregon)",
-            "eu-west-1": "Europe (Ireland)",
-            "eu-west-2": "Europe (London)",
-            "eu-west-3": "Europe (Paris)",
-            "eu-central-1": "Europe (Frankfurt)",
-            "ap-southeast-1": "Asia Pacific (Singapore)",
-            "ap-southeast-2": "Asia Pacific (Sydney)",
-            "ap-northeast-1": "Asia Pacific (Tokyo)",
-            "ap-northeast-2": "Asia Pacific (Seoul)",
-            # Add more regions as needed
-        }
-        return region_map.get(region_code, region_code)
+        return self.REGION_LOCATIONS.get(region_code, region_code)
+
+    def _location_to_region_code(self, location: str) -> str | None:
+        """Reverse of _region_code_to_location (None for unknown locations)."""
+        for region_code, name in self.REGION_LOCATIONS.items():
+            if name == location:
+                return region_code
+        return None
+
+    def _collect_price_list(self, query: AWSPriceListQuery) -> dict[tuple[str, str], float]:
+        """
+        Page through one price list and extract the price of every (service, region).
+
+        Products are parsed page by page (100 per call), so only the
+        extracted prices are kept in memory.
+        """
+        prices: dict[tuple[str, str], float] = {}
+        paginator = self.client.get_paginator("get_products")
+        pages = paginator.paginate(
+            ServiceCode=query.service_code,
+            Filters=[
+                {"Type": "TERM_MATCH", "Field": name, "Value": value}
+                for name, value in query.filters.items()
+            ],
+            FormatVersion="aws_v1",
+            PaginationConfig={"PageSize": 100},
+        )
+        for page in pages:
+            for raw_item in page.get("PriceList", []):
+                price_item = json.loads(raw_item)
+                attributes = price_item.get("product", {}).get("attributes", {})
+                service = query.service_for(attributes)
+                region = attributes.get("regionCode") or self._location_to_region_code(
+                    attributes.get("location", "")
+                )
+                if not service or not region or (service, region) in prices:
+                    continue
+                price = _on_demand_price(price_item)
+                if price is not None:
+                    prices[(service, region)] = price * query.multiplier
+        return prices
+
+    async def get_price_list(self, query: AWSPriceListQuery) -> dict[tuple[str, str], float]:
+        """
+        Fetch all prices of one price list, for every region, in a worker thread.
+
+        Args:
+            query: Price list to fetch
+
+        Returns:
+            Dict of (service, region) -> price
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._collect_price_list, query)
 
     async def get_ebs_price(self, volume_type: str, region: str) -> float | None:
         """
@@ -226,25 +599,156 @@ class PricingService:
     """
     Centralized pricing service for all cloud providers.
 
-    Pricing strategy (3-tier fallback):
-    1. Redis cache (24h TTL) - Fastest, lowest latency
-    2. PostgreSQL pricing_cache table - Backup if Redis fails
-    3. Hardcoded fallback prices - Last resort if APIs unavailable
+    Pricing strategy (tiered, fastest first):
+    1. In-process LRU (PRICING_MEMORY_CACHE_TTL_SECONDS) - shared by the process
+    2. Redis cache (PRICING_REDIS_TTL_SECONDS) - shared by all workers
+    3. PostgreSQL pricing_cache table - cold tier, also backs the admin dashboard
+    4. AWS Pricing API, then hardcoded fallback prices if the API is unavailable
+
+    Prices found in a slower tier are written back to the faster ones.
+    Concurrent lookups of the same price (scan scenarios pricing volumes in
+    parallel) are coalesced, so a miss triggers a single Redis/DB/API load.
+    Redis is optional: if it cannot be reached, the tier is skipped.
 
     Usage:
         service = PricingService(db_session)
         price = await service.get_aws_price("ebs_gp3", "us-east-1")
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis_client: Any | None = None):
         """
         Initialize pricing service.
 
         Args:
             db: SQLAlchemy async database session
+            redis_client: Optional redis.asyncio client (default: created from settings.REDIS_URL)
         """
         self.db = db
         self.aws_client = AWSPricingClient()
+        # Scan scenarios run concurrently and share this session, which
+        # does not support concurrent operations
+        self._db_lock = asyncio.Lock()
+        self._redis = redis_client
+        self._owns_redis = redis_client is None
+        self._redis_available = True
+        # In-flight loads, keyed by (provider, service, region, force_refresh)
+        self._inflight: dict[tuple[str, str, str, bool], asyncio.Future] = {}
+
+    async def build_price_table(
+        self, regions: Iterable[str], services: Iterable[str] = AWS_SCAN_SERVICES
+    ) -> PriceTable:
+        """
+        Snapshot the AWS prices of a scan before it starts.
+
+        Cached prices of all regions come from one pricing_cache query;
+        pairs missing from it are resolved now (Redis, API or fallback, and
+        saved) rather than in the middle of the scan.
+
+        Args:
+            regions: AWS regions the scan covers
+            services: Service identifiers to price in every region
+
+        Returns:
+            PriceTable covering every (service, region) pair
+        """
+        provider = CloudProvider.AWS.value
+        regions = list(regions)
+        async with self._db_lock:
+            table = await load_price_table(self.db, provider, regions)
+
+        prices = {}
+        missing = []
+        for region in regions:
+            for service in services:
+                price = table.get(provider, service, region)
+                if price is None:
+                    missing.append((service, region))
+                else:
+                    prices[(provider, service, region)] = price
+                    local_price_cache.set((provider, service, region), price)
+
+        # Cold cache: bound concurrent Pricing API calls (the API is throttled)
+        semaphore = asyncio.Semaphore(4)
+
+        async def resolve(service: str, region: str) -> float:
+            async with semaphore:
+                return await self.get_aws_price(service, region)
+
+        resolved = await asyncio.gather(*(resolve(service, region) for service, region in missing))
+        for (service, region), price in zip(missing, resolved):
+            prices[(provider, service, region)] = price
+
+        return PriceTable(prices)
+
+    async def refresh_aws_prices(
+        self, queries: Iterable[AWSPriceListQuery] = AWS_PRICE_LIST_QUERIES
+    ) -> dict[str, int]:
+        """
+        Refresh every AWS price of pricing_cache from the Price List API.
+
+        Each price list is fetched once for all regions (listings run in
+        parallel), then all prices are upserted in one batch; unchanged
+        prices only get their expiration extended. Changed prices are also
+        written to Redis and the in-process cache.
+
+        Args:
+            queries: Price lists to fetch
+
+        Returns:
+            Dict with updated_count, unchanged_count and failed_count (failed price lists)
+        """
+        provider = CloudProvider.AWS.value
+        queries = list(queries)
+        results = await asyncio.gather(
+            *(self.aws_client.get_price_list(query) for query in queries), return_exceptions=True
+        )
+
+        rows = []
+        failed_count = 0
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                failed_count += 1
+                logger.error(
+                    "pricing.price_list_error",
+                    provider=provider,
+                    service_code=query.service_code,
+                    filters=query.filters,
+                    error=str(result),
+                )
+                continue
+            rows.extend(
+                {
+                    "service": service,
+                    "region": region,
+                    "price_per_unit": price,
+                    "unit": query.unit,
+                    "source": "api",
+                }
+                for (service, region), price in result.items()
+            )
+
+        async with self._db_lock:
+            changed, unchanged_count = await pricing_cache_crud.upsert_prices(
+                self.db, provider, rows
+            )
+
+        for row in changed:
+            key = (provider, row["service"], row["region"])
+            local_price_cache.set(key, row["price_per_unit"])
+            await self._set_cached_price_in_redis(*key, row["price_per_unit"])
+
+        return {
+            "updated_count": len(changed),
+            "unchanged_count": unchanged_count,
+            "failed_count": failed_count,
+        }
+
+    async def close(self) -> None:
+        """Flush tier counters and close the Redis connection."""
+        await self.flush_stats()
+        if self._redis is not None and self._owns_redis:
+            await self._redis.aclose()
+            self._redis = None
 
     async def get_aws_price(
         self,
@@ -263,16 +767,66 @@ class PricingService:
         Returns:
             Price per unit (e.g., $/GB/month)
         """
-        cache_key = f"pricing:aws:{service}:{region}"
+        provider = CloudProvider.AWS.value
+        key = (provider, service, region)
+
+        if not force_refresh:
+            price = local_price_cache.get(key)
+            tier_counters.record("memory_hits" if price is not None else "memory_misses")
+            if price is not None:
+                await self._maybe_flush_stats()
+                return price
+
+        # Single flight: concurrent misses of the same price share one load
+        flight_key = (*key, force_refresh)
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            price = await self._load_aws_price(service, region, force_refresh)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't warn if there are none
+            raise
+        else:
+            future.set_result(price)
+        finally:
+            del self._inflight[flight_key]
+
+        await self._maybe_flush_stats()
+        return price
+
+    async def _load_aws_price(self, service: str, region: str, force_refresh: bool) -> float:
+        """
+        Load a price missing from the in-process cache (Redis, PostgreSQL, API, fallback).
+
+        Args:
+            service: Service identifier
+            region: AWS region code
+            force_refresh: Skip Redis/PostgreSQL and fetch from API
 
-        # 1. Try Redis cache (TODO: implement Redis integration)
-        # For now, skip Redis and go directly to PostgreSQL
+        Returns:
+            Price per unit
+        """
+        provider = CloudProvider.AWS.value
+        key = (provider, service, region)
 
         if not force_refresh:
-            # 2. Try PostgreSQL cache
-            cached_price = await self._get_cached_price_from_db(
-                CloudProvider.AWS.value, service, region
-            )
+            # 2. Try Redis cache
+            cached_price = await self._get_cached_price_from_redis(provider, service, region)
+            if cached_price is not None:
+                local_price_cache.set(key, cached_price)
+                return cached_price
+
+            # 3. Try PostgreSQL cache
+            cached_price = await self._get_cached_price_from_db(provider, service, region)
+            tier_counters.record("postgres_hits" if cached_price is not None else "postgres_misses")
             if cached_price is not None:
                 logger.debug(
                     "pricing.cache_hit",
@@ -281,9 +835,12 @@ class PricingService:
                     region=region,
                     price=cached_price,
                 )
+                local_price_cache.set(key, cached_price)
+                await self._set_cached_price_in_redis(provider, service, region, cached_price)
                 return cached_price
 
-        # 3. Fetch from AWS Pricing API
+        # 4. Fetch from AWS Pricing API
+        tier_counters.record("api_fetches")
         api_price = await self._fetch_aws_price_from_api(service, region)
 
         if api_price is not None:
@@ -295,6 +852,8 @@ class PricingService:
                 api_price,
                 source="api",
             )
+            local_price_cache.set(key, api_price)
+            await self._set_cached_price_in_redis(provider, service, region, api_price)
             logger.info(
                 "pricing.api_success",
                 provider="aws",
@@ -304,7 +863,8 @@ class PricingService:
             )
             return api_price
 
-        # 4. Fallback to hardcoded prices
+        # 5. Fallback to hardcoded prices
+        tier_counters.record("fallbacks")
         fallback_price = FALLBACK_PRICING["aws"].get(service)
         if fallback_price is None:
             # Unknown service, use conservative estimate
@@ -333,9 +893,100 @@ class PricingService:
             fallback_price,
             source="fallback",
         )
+        local_price_cache.set(key, fallback_price)
+        await self._set_cached_price_in_redis(provider, service, region, fallback_price)
 
         return fallback_price
 
+    def _get_redis(self) -> Any | None:
+        """Redis client, or None once Redis turned out to be unavailable."""
+        if not self._redis_available:
+            return None
+        if self._redis is None:
+            self._redis = aioredis.from_url(
+                str(settings.REDIS_URL),
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+        return self._redis
+
+    def _redis_unavailable(self, error: Exception) -> None:
+        """Skip the Redis tier for the rest of this service's lifetime."""
+        self._redis_available = False
+        logger.warning("pricing.redis_unavailable", error=str(error))
+
+    async def _get_cached_price_from_redis(
+        self, provider: str, service: str, region: str
+    ) -> float | None:
+        """
+        Get cached price from Redis.
+
+        Args:
+            provider: Cloud provider ('aws', 'azure', 'gcp')
+            service: Service identifier
+            region: Region code
+
+        Returns:
+            Cached price or None if not found (or Redis is unavailable)
+        """
+        client = self._get_redis()
+        if client is None:
+            return None
+        try:
+            value = await client.get(f"pricing:{provider}:{service}:{region}")
+        except Exception as e:
+            self._redis_unavailable(e)
+            return None
+        tier_counters.record("redis_hits" if value is not None else "redis_misses")
+        return float(value) if value is not None else None
+
+    async def _set_cached_price_in_redis(
+        self, provider: str, service: str, region: str, price: float
+    ) -> None:
+        """
+        Cache price in Redis for PRICING_REDIS_TTL_SECONDS.
+
+        Args:
+            provider: Cloud provider
+            service: Service identifier
+            region: Region code
+            price: Price per unit
+        """
+        client = self._get_redis()
+        if client is None:
+            return
+        try:
+            await client.setex(
+                f"pricing:{provider}:{service}:{region}",
+                settings.PRICING_REDIS_TTL_SECONDS,
+                str(price),
+            )
+        except Exception as e:
+            self._redis_unavailable(e)
+
+    async def _maybe_flush_stats(self) -> None:
+        """Flush tier counters if the last flush is older than PRICING_STATS_FLUSH_INTERVAL."""
+        if time.monotonic() - tier_counters.last_flush >= PRICING_STATS_FLUSH_INTERVAL:
+            await self.flush_stats()
+
+    async def flush_stats(self) -> None:
+        """Add this process' pending tier counters to the shared Redis hash."""
+        counts = tier_counters.take()
+        client = self._get_redis()
+        if not counts or client is None:
+            if counts:
+                tier_counters.restore(counts)
+            return
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for field, count in counts.items():
+                    pipe.hincrby(PRICING_STATS_KEY, field, count)
+                await pipe.execute()
+        except Exception as e:
+            tier_counters.restore(counts)
+            self._redis_unavailable(e)
+
     async def _fetch_aws_price_from_api(self, service: str, region: str) -> float | None:
         """
         Fetch price from AWS Pricing API based on service type.
@@ -377,15 +1028,16 @@ class PricingService:
             Cached price or None if not found or expired
         """
         try:
-            result = await self.db.execute(
-                select(PricingCache).where(
-                    PricingCache.provider == provider,
-                    PricingCache.service == service,
-                    PricingCache.region == region,
-                    PricingCache.expires_at > datetime.utcnow(),
+            async with self._db_lock:
+                result = await self.db.execute(
+                    select(PricingCache).where(
+                        PricingCache.provider == provider,
+                        PricingCache.service == service,
+                        PricingCache.region == region,
+                        PricingCache.expires_at > datetime.utcnow(),
+                    )
                 )
-            )
-            cache_entry = result.scalar_one_or_none()
+                cache_entry = result.scalar_one_or_none()
 
             if cache_entry:
                 return cache_entry.price_per_unit
@@ -422,62 +1074,63 @@ class PricingService:
             source: Source of pricing ('api', 'fallback', 'manual')
             api_metadata: Optional API response metadata
         """
-        try:
-            # Check if entry exists
-            result = await self.db.execute(
-                select(PricingCache).where(
-                    PricingCache.provider == provider,
-                    PricingCache.service == service,
-                    PricingCache.region == region,
-                )
-            )
-            existing = result.scalar_one_or_none()
-
-            if existing:
-                # Update existing entry
-                existing.price_per_unit = price
-                existing.source = source
-                existing.api_metadata = api_metadata
-                existing.refresh_expiration()
-                logger.debug(
-                    "pricing.cache_updated",
-                    provider=provider,
-                    service=service,
-                    region=region,
-                    price=price,
-                )
-            else:
-                # Create new entry
-                new_entry = PricingCache(
-                    provider=provider,
-                    service=service,
-                    region=region,
-                    price_per_unit=price,
-                    unit="GB",  # Default unit
-                    source=source,
-                    api_metadata=api_metadata,
-                    expires_at=datetime.utcnow() + timedelta(hours=24),
+        async with self._db_lock:
+            try:
+                # Check if entry exists
+                result = await self.db.execute(
+                    select(PricingCache).where(
+                        PricingCache.provider == provider,
+                        PricingCache.service == service,
+                        PricingCache.region == region,
+                    )
                 )
-                self.db.add(new_entry)
-                logger.debug(
-                    "pricing.cache_created",
+                existing = result.scalar_one_or_none()
+
+                if existing:
+                    # Update existing entry
+                    existing.price_per_unit = price
+                    existing.source = source
+                    existing.api_metadata = api_metadata
+                    existing.refresh_expiration()
+                    logger.debug(
+                        "pricing.cache_updated",
+                        provider=provider,
+                        service=service,
+                        region=region,
+                        price=price,
+                    )
+                else:
+                    # Create new entry
+                    new_entry = PricingCache(
+                        provider=provider,
+                        service=service,
+                        region=region,
+                        price_per_unit=price,
+                        unit="GB",  # Default unit
+                        source=source,
+                        api_metadata=api_metadata,
+                        expires_at=datetime.utcnow() + timedelta(hours=24),
+                    )
+                    self.db.add(new_entry)
+                    logger.debug(
+                        "pricing.cache_created",
+                        provider=provider,
+                        service=service,
+                        region=region,
+                        price=price,
+                    )
+
+                await self.db.commit()
+
+            except Exception as e:
+                logger.error(
+                    "pricing.cache_write_error",
+                    error=str(e),
                     provider=provider,
                     service=service,
                     region=region,
-                    price=price,
                 )
-
-            await self.db.commit()
-
-        except Exception as e:
-            logger.error(
-                "pricing.cache_write_error",
-                error=str(e),
-                provider=provider,
-                service=service,
-                region=region,
-            )
-            await self.db.rollback()
+                await self.db.rollback()
 
 
 # Singleton instance (optional, for convenience)
@@ -0,0 +1,171 @@
+"""
+Push-based scan progress over Redis.
+
+The scan worker publishes every progress update twice in one pipeline:
+- as a snapshot (SCAN_PROGRESS_KEY, expiring after SCAN_PROGRESS_TTL_SECONDS),
+  read by GET /scans/{id}/progress without touching Celery or the database
+- on a pub/sub channel (SCAN_PROGRESS_CHANNEL), streamed to clients by
+  GET /scans/{id}/progress/stream (Server-Sent Events)
+
+Events are dicts matching the ScanProgress schema. The last event of a scan
+has a terminal state (SUCCESS or FAILURE). Redis is optional: if it cannot be
+reached, publishing is skipped and the API falls back to the Celery state.
+"""
+
+import json
+from typing import Any, AsyncIterator
+
+import redis
+import redis.asyncio as aioredis
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+SCAN_PROGRESS_KEY = "scan_progress:{scan_id}"
+SCAN_PROGRESS_CHANNEL = "scan_progress:{scan_id}:events"
+
+TERMINAL_STATES = ("SUCCESS", "FAILURE")
+
+
+class ScanProgressPublisher:
+    """
+    Publish the progress events of one scan (used by the scan worker).
+
+    Uses a synchronous Redis client: an update is a single pipelined round
+    trip, made a handful of times per region.
+    """
+
+    def __init__(self, scan_id: str, redis_client: Any | None = None) -> None:
+        """
+        Initialize publisher.
+
+        Args:
+            scan_id: UUID of the scan
+            redis_client: Optional redis.Redis client (default: created from settings.REDIS_URL)
+        """
+        self.key = SCAN_PROGRESS_KEY.format(scan_id=scan_id)
+        self.channel = SCAN_PROGRESS_CHANNEL.format(scan_id=scan_id)
+        self._redis = redis_client
+        self._owns_redis = redis_client is None
+        self._available = True
+
+    def publish(self, state: str, meta: dict[str, Any]) -> None:
+        """
+        Store the progress snapshot and push it to subscribers.
+
+        Args:
+            state: PENDING, PROGRESS, SUCCESS or FAILURE
+            meta: Progress fields of the ScanProgress schema
+        """
+        if not self._available:
+            return
+        event = json.dumps({"state": state, **meta})
+        try:
+            if self._redis is None:
+                self._redis = redis.Redis.from_url(str(settings.REDIS_URL))
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.set(self.key, event, ex=settings.SCAN_PROGRESS_TTL_SECONDS)
+            pipe.publish(self.channel, event)
+            pipe.execute()
+        except redis.RedisError as e:
+            # Don't fail (or slow down) the scan: clients fall back to the Celery state
+            logger.warning("scan_progress.publish_failed", key=self.key, error=str(e))
+            self._available = False
+
+    def publish_result(self, result: dict[str, Any]) -> None:
+        """
+        Publish the terminal event of a scan from the scan task result.
+
+        Args:
+            result: Dict returned by the scan task ('status' is 'completed' on success)
+        """
+        if result.get("status") == "completed":
+            total = result.get("total_resources_scanned", 0)
+            self.publish(
+                "SUCCESS",
+                {
+                    "current": total,
+                    "total": total,
+                    "percent": 100,
+                    "current_step": "Completed",
+                    "resources_found": result.get("orphan_resources_found", 0),
+                },
+            )
+        else:
+            self.publish(
+                "FAILURE",
+                {"current_step": f"Failed: {result.get('error', 'Unknown error')}"},
+            )
+
+    def close(self) -> None:
+        """Close the Redis client if this publisher created it."""
+        if self._owns_redis and self._redis is not None:
+            self._redis.close()
+
+
+async def get_progress_snapshot(
+    scan_id: str, redis_client: Any | None = None
+) -> dict[str, Any] | None:
+    """
+    Get the last published progress event of a scan.
+
+    Args:
+        scan_id: UUID of the scan
+        redis_client: Optional redis.asyncio client (default: created from settings.REDIS_URL)
+
+    Returns:
+        Progress event, or None if nothing was published (or Redis is unavailable)
+    """
+    client = redis_client or aioredis.from_url(str(settings.REDIS_URL))
+    try:
+        event = await client.get(SCAN_PROGRESS_KEY.format(scan_id=scan_id))
+    except redis.RedisError as e:
+        logger.warning("scan_progress.snapshot_unavailable", scan_id=scan_id, error=str(e))
+        return None
+    finally:
+        if redis_client is None:
+            await client.aclose()
+    return json.loads(event) if event else None
+
+
+async def stream_progress(
+    scan_id: str, redis_client: Any | None = None
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Yield the progress events of a scan as they are published.
+
+    Starts with the current snapshot (if any) and ends after a terminal event.
+    Subscribes before reading the snapshot, so no event is lost in between.
+
+    Args:
+        scan_id: UUID of the scan
+        redis_client: Optional redis.asyncio client (default: created from settings.REDIS_URL)
+
+    Yields:
+        Progress events (dicts matching the ScanProgress schema)
+    """
+    client = redis_client or aioredis.from_url(str(settings.REDIS_URL))
+    pubsub = client.pubsub()
+    try:
+        await pubsub.subscribe(SCAN_PROGRESS_CHANNEL.format(scan_id=scan_id))
+
+        snapshot = await client.get(SCAN_PROGRESS_KEY.format(scan_id=scan_id))
+        if snapshot:
+            event = json.loads(snapshot)
+            yield event
+            if event["state"] in TERMINAL_STATES:
+                return
+
+        async for message in pubsub.listen():
+            if message["type"] != "message":
+                continue
+            event = json.loads(message["data"])
+            yield event
+            if event["state"] in TERMINAL_STATES:
+                return
+    finally:
+        await pubsub.aclose()
+        if redis_client is None:
+            await client.aclose()
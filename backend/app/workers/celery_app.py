@@ -15,7 +15,7 @@ celery_app = Celery(
     "cloudwaste",
     broker=str(settings.REDIS_URL),
     backend=str(settings.REDIS_URL),
-    include=["app.workers.tasks"],
+    include=["app.workers.tasks", "app.workers.ml_tasks"],
 )
 
 # Celery configuration
@@ -49,6 +49,10 @@ celery_app.conf.beat_schedule = {
         "task": "app.workers.tasks.update_pricing_cache",
         "schedule": crontab(hour=2, minute=0),  # Every day at 2:00 AM UTC
     },
+    "compact-scan-history": {
+        "task": "app.workers.tasks.compact_scan_history",
+        "schedule": crontab(hour=4, minute=0),  # Every day at 4:00 AM UTC
+    },
 }
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 """
 Celery tasks for ML data collection and export.
 
-Background tasks for automated ML dataset exports and data quality monitoring.
+Background tasks for scan ML data ingestion, automated ML dataset exports
+and data quality monitoring.
 """
 
 import asyncio
@@ -12,14 +13,135 @@ from app.ml.data_pipeline import export_all_ml_datasets, validate_data_quality
 from app.workers.celery_app import celery_app
 
 
+@celery_app.task(name="app.workers.ml_tasks.collect_scan_ml_data")
+def collect_scan_ml_data(
+    scan_id: str, cloud_account_id: str, resources: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """
+    Collect ML training data and cost trends for a completed scan.
+
+    Queued by the scan tasks with the scan's in-memory results
+    (ml_resource_payload dicts), so ingestion never extends scan latency and
+    never re-reads the orphan resources just written.
+
+    Args:
+        scan_id: UUID of the completed scan
+        cloud_account_id: UUID of the scanned cloud account
+        resources: Detected resources (ml_resource_payload dicts)
+
+    Returns:
+        Dict with the number of ML training records created
+    """
+    try:
+        # Get or create event loop
+        try:
+            loop = asyncio.get_event_loop()
+            if loop.is_closed():
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+        except RuntimeError:
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+
+        records_created = loop.run_until_complete(
+            _collect_scan_ml_data_async(scan_id, cloud_account_id, resources)
+        )
+
+        return {
+            "status": "success",
+            "timestamp": datetime.now().isoformat(),
+            "ml_records": records_created,
+        }
+
+    except Exception as e:
+        print(f"❌ ML data collection failed for scan {scan_id}: {e}")
+        return {
+            "status": "failed",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e),
+        }
+
+
+async def _collect_scan_ml_data_async(
+    scan_id: str, cloud_account_id: str, resources: list[dict[str, Any]]
+) -> int:
+    """
+    Async implementation of scan ML data collection.
+
+    Args:
+        scan_id: UUID of the completed scan
+        cloud_account_id: UUID of the scanned cloud account
+        resources: Detected resources (ml_resource_payload dicts); for a
+            differential scan, only those added or changed since its base scan
+
+    Returns:
+        Number of ML training records created
+    """
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.core.config import settings
+    from app.models.cloud_account import CloudAccount
+    from app.models.scan import Scan
+    from app.services.ml_data_collector import (
+        aggregate_monthly_cost_trends,
+        collect_ml_training_data,
+        scan_cost_breakdown,
+    )
+
+    engine = create_async_engine(str(settings.DATABASE_URL), echo=False, pool_pre_ping=True)
+    AsyncSessionLocal = sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False  # type: ignore
+    )
+
+    try:
+        async with AsyncSessionLocal() as db:
+            # Resolve the account and scan once for the whole batch
+            account = (
+                await db.execute(select(CloudAccount).where(CloudAccount.id == cloud_account_id))
+            ).scalar_one_or_none()
+            scan = (await db.execute(select(Scan).where(Scan.id == scan_id))).scalar_one_or_none()
+            if not account or not scan:
+                return 0
+
+            records_created = await collect_ml_training_data(
+                cloud_account=account,
+                orphan_resources=resources,
+                db=db,
+                detected_at=scan.completed_at,
+            )
+
+            # Differential scans send only their changed findings: the cost
+            # trends are aggregated from all of the scan's rows instead
+            trend_resources = resources
+            if scan.base_scan_id is not None:
+                trend_resources = await scan_cost_breakdown(db, scan.id)
+
+            # Aggregate cost trends
+            await aggregate_monthly_cost_trends(
+                cloud_account=account,
+                month=datetime.now().strftime("%Y-%m"),
+                scan=scan,
+                orphan_resources=trend_resources,
+                db=db,
+            )
+    finally:
+        await engine.dispose()
+
+    if records_created > 0:
+        print(f"✅ Collected {records_created} ML training records for scan {scan_id}")
+    return records_created
+
+
 @celery_app.task(name="app.workers.ml_tasks.export_ml_datasets_weekly")
 def export_ml_datasets_weekly() -> dict[str, Any]:
     """
     Export ML datasets every week for training purposes.
 
-    This task runs weekly and exports:
-    - ML training data (last 90 days)
-    - User action patterns (last 90 days)
+    This task runs weekly and exports, as Parquet:
+    - ML training data (created since the previous weekly export)
+    - User action patterns (created since the previous weekly export)
     - Cost trends (last 12 months)
 
     Returns:
@@ -38,7 +160,11 @@ def export_ml_datasets_weekly() -> dict[str, Any]:
 
         # Run export
         results = loop.run_until_complete(
-            export_all_ml_datasets(output_format="json", output_dir="/tmp/cloudwaste_ml_exports")
+            export_all_ml_datasets(
+                output_format="parquet",
+                output_dir="/tmp/cloudwaste_ml_exports",
+                incremental=True,
+            )
         )
 
         return {
@@ -0,0 +1,195 @@
+"""Parallel multi-region scan fan-out with per-region progress tracking."""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from app.core.config import settings
+
+
+class RegionProgressTracker:
+    """
+    Aggregate per-region scan progress into Celery task metadata.
+
+    Regions are scanned concurrently, so progress can no longer be expressed as
+    "region i of n". The tracker keeps one entry per region (pending, scanning,
+    completed, failed) and derives the overall counters from them, keeping the
+    /scans/{id}/progress payload accurate. Each update is also pushed to the
+    optional ScanProgressPublisher (Redis snapshot + pub/sub channel).
+
+    Steps:
+        1 step for credential validation, 1 per region, 1 for saving results.
+    """
+
+    def __init__(
+        self,
+        task: Any,
+        regions: list[str],
+        started_at: datetime,
+        publisher: Any | None = None,
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            task: Celery task instance (bound task, exposes update_state)
+            regions: Regions to be scanned
+            started_at: Scan start time (for elapsed_seconds)
+            publisher: Optional ScanProgressPublisher receiving every update
+        """
+        self.task = task
+        self.publisher = publisher
+        self.regions = list(regions)
+        self.started_at = started_at
+        self.region_states: dict[str, dict[str, Any]] = {
+            region: {"status": "pending", "resources_found": 0, "elapsed_seconds": 0}
+            for region in self.regions
+        }
+        self._region_started_at: dict[str, datetime] = {}
+        self.current_step = ""
+
+    @property
+    def total(self) -> int:
+        """Total number of progress steps."""
+        return len(self.regions) + 2
+
+    @property
+    def completed_regions(self) -> int:
+        """Number of regions whose scan has finished (successfully or not)."""
+        return sum(
+            1 for state in self.region_states.values()
+            if state["status"] in ("completed", "failed")
+        )
+
+    @property
+    def resources_found(self) -> int:
+        """Orphan resources found so far across all regions."""
+        return sum(state["resources_found"] for state in self.region_states.values())
+
+    def _elapsed(self, since: datetime) -> int:
+        return int((datetime.now() - since).total_seconds())
+
+    def _eta(self) -> int | None:
+        """Remaining seconds, extrapolated from the pace of the finished regions."""
+        completed = self.completed_regions
+        if not completed:
+            return None
+        remaining = len(self.regions) - completed
+        return int(self._elapsed(self.started_at) / completed * remaining)
+
+    def meta(self, percent: int | None = None) -> dict[str, Any]:
+        """
+        Build the progress metadata for the Celery task state.
+
+        Args:
+            percent: Override the computed percentage (e.g., 95 while saving)
+
+        Returns:
+            Dict matching the ScanProgress schema
+        """
+        current = min(self.completed_regions + 1, self.total)
+        scanning = [
+            region for region, state in self.region_states.items()
+            if state["status"] == "scanning"
+        ]
+        return {
+            "current": current,
+            "total": self.total,
+            "percent": percent if percent is not None else int(current / self.total * 100),
+            "current_step": self.current_step,
+            "region": ", ".join(scanning),
+            "resources_found": self.resources_found,
+            "elapsed_seconds": self._elapsed(self.started_at),
+            "eta_seconds": self._eta(),
+            "regions": {region: dict(state) for region, state in self.region_states.items()},
+        }
+
+    def publish(self, current_step: str | None = None, percent: int | None = None) -> None:
+        """Push the current progress to the Celery result backend and the publisher."""
+        if current_step is not None:
+            self.current_step = current_step
+        meta = self.meta(percent)
+        self.task.update_state(state="PROGRESS", meta=meta)
+        if self.publisher:
+            self.publisher.publish("PROGRESS", meta)
+
+    def _scanning_step(self) -> str:
+        return (
+            f"Scanning {len(self.regions)} regions "
+            f"({self.completed_regions}/{len(self.regions)} complete)..."
+        )
+
+    def region_started(self, region: str) -> None:
+        """Mark a region as being scanned."""
+        self._region_started_at[region] = datetime.now()
+        self.region_states[region]["status"] = "scanning"
+        self.publish(self._scanning_step())
+
+    def region_completed(self, region: str, resources_found: int) -> None:
+        """Mark a region as scanned with the number of resources it produced."""
+        state = self.region_states[region]
+        state["status"] = "completed"
+        state["resources_found"] = resources_found
+        state["elapsed_seconds"] = self._elapsed(self._region_started_at.get(region, self.started_at))
+        self.publish(self._scanning_step())
+
+    def region_failed(self, region: str, error: str) -> None:
+        """Mark a region scan as failed."""
+        state = self.region_states[region]
+        state["status"] = "failed"
+        state["error"] = error[:200]
+        state["elapsed_seconds"] = self._elapsed(self._region_started_at.get(region, self.started_at))
+        self.publish(self._scanning_step())
+
+
+async def scan_regions_in_parallel(
+    regions: list[str],
+    scan_region: Callable[[str], Awaitable[list[Any]]],
+    progress: RegionProgressTracker | None = None,
+    max_concurrent_regions: int | None = None,
+) -> dict[str, list[Any]]:
+    """
+    Scan regions concurrently within the current worker.
+
+    Region scans are I/O-bound, so a bounded fan-out keeps total scan time close
+    to the slowest region instead of the sum of all regions. If a region fails,
+    the regions still running are cancelled and the exception propagates (the
+    scan fails, as with the former serial loop).
+
+    Args:
+        regions: Regions to scan
+        scan_region: Coroutine function scanning one region and returning its results
+        progress: Optional tracker updated as regions start and finish
+        max_concurrent_regions: Regions scanned at once (default: settings.SCAN_MAX_CONCURRENT_REGIONS)
+
+    Returns:
+        Results keyed by region, in the order of `regions`
+    """
+    limit = max_concurrent_regions or settings.SCAN_MAX_CONCURRENT_REGIONS
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(region: str) -> list[Any]:
+        async with semaphore:
+            if progress:
+                progress.region_started(region)
+            try:
+                results = await scan_region(region)
+            except Exception as e:
+                if progress:
+                    progress.region_failed(region, str(e))
+                raise
+            if progress:
+                progress.region_completed(region, len(results))
+            return results
+
+    # On the first failure the other regions are cancelled and awaited, so none
+    # of them keeps writing results once the scan has been marked failed
+    tasks = [asyncio.create_task(run(region), name=region) for region in regions]
+    try:
+        region_results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return dict(zip(regions, region_results))
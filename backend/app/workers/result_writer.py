@@ -0,0 +1,251 @@
+"""Bulk persistence of scan results, written region by region."""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud import all_cloud_resource as all_cloud_resource_crud
+from app.crud import orphan_resource as orphan_resource_crud
+from app.crud import orphan_resource_change as orphan_resource_change_crud
+
+
+def _normalize_datetime(dt: Any) -> datetime | None:
+    """
+    Convert any datetime to naive UTC datetime for PostgreSQL.
+
+    PostgreSQL columns are 'timestamp without time zone', so we must:
+    1. Convert timezone-aware datetimes (e.g. tzlocal()) to UTC
+    2. Strip timezone info before insertion
+
+    Args:
+        dt: Any value (datetime, None, or other)
+
+    Returns:
+        Naive datetime in UTC, or None if input is None/invalid
+    """
+    if dt is None:
+        return None
+    if not isinstance(dt, datetime):
+        return None
+
+    if dt.tzinfo is None:
+        # Already naive - assume it's UTC
+        return dt
+    else:
+        # Convert to UTC then strip timezone for PostgreSQL
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class ScanResultWriter:
+    """
+    Stream scan results into the database as each region finishes.
+
+    Results used to be persisted with one `db.add(OrphanResource(...))` /
+    `db.add(AllCloudResource(...))` per finding and a single commit at the
+    end of the scan, so inventory scans of 50k+ resources spent minutes in
+    the flush and kept every ORM object in the session's identity map.
+
+    The writer turns results into plain row dicts and inserts them with
+    executemany INSERTs in chunks of `SCAN_PERSIST_CHUNK_SIZE`, each in its
+    own short-lived session. Regions write concurrently on separate pooled
+    connections, independent of the scan's own session (which pricing
+    lookups commit and roll back during the scan).
+
+    Rows of a scan that fails can be removed with `discard()`.
+
+    With a `base_scan_id` (differential scan), only the findings added or
+    changed since that scan are inserted. Unchanged ones stay on the base
+    scan, still the account's latest, until `finish_orphans()` moves them
+    (see app.crud.orphan_resource_change) and logs the findings that went
+    away, in the transaction that completes the scan.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        scan_id: uuid.UUID,
+        cloud_account_id: uuid.UUID,
+        chunk_size: int | None = None,
+        base_scan_id: uuid.UUID | None = None,
+    ) -> None:
+        """
+        Initialize writer.
+
+        Args:
+            session_factory: Async session factory (e.g., AsyncSessionLocal)
+            scan_id: Scan the results belong to
+            cloud_account_id: Cloud account the results belong to
+            chunk_size: Rows per INSERT and transaction (default: settings.SCAN_PERSIST_CHUNK_SIZE)
+            base_scan_id: Previous scan to diff the orphan resources with (None: write them all)
+        """
+        self.session_factory = session_factory
+        self.scan_id = scan_id
+        self.cloud_account_id = cloud_account_id
+        self.chunk_size = chunk_size or settings.SCAN_PERSIST_CHUNK_SIZE
+        self.base_scan_id = base_scan_id
+        self.orphans_written = 0
+        self.inventory_written = 0
+        # Identities of the findings written (differential scans only)
+        self.changed_identities: set[tuple[str, str, str]] = set()
+        # Unchanged findings to move from the base scan, by base scan row ID
+        self.carried: dict[uuid.UUID, dict[str, Any]] = {}
+
+    def orphan_row(self, orphan: Any) -> dict[str, Any]:
+        """Column values of an orphan_resources row for an OrphanResourceData."""
+        row = {
+            "scan_id": self.scan_id,
+            "cloud_account_id": self.cloud_account_id,
+            "resource_type": orphan.resource_type,
+            "resource_id": orphan.resource_id,
+            "resource_name": orphan.resource_name,
+            "region": orphan.region,
+            "estimated_monthly_cost": orphan.estimated_monthly_cost,
+            "resource_metadata": orphan.resource_metadata,
+        }
+        row["fingerprint"] = orphan_resource_change_crud.finding_fingerprint(row)
+        return row
+
+    def inventory_row(self, resource: Any) -> dict[str, Any]:
+        """Column values of an all_cloud_resources row for an inventory resource."""
+        return {
+            "scan_id": self.scan_id,  # Same scan_id as orphan resources
+            "cloud_account_id": self.cloud_account_id,
+            "resource_type": resource.resource_type,
+            "resource_id": resource.resource_id,
+            "resource_name": resource.resource_name,
+            "region": resource.region,
+            "estimated_monthly_cost": resource.estimated_monthly_cost,
+            "currency": resource.currency,
+            "utilization_status": resource.utilization_status,
+            "cpu_utilization_percent": resource.cpu_utilization_percent,
+            "memory_utilization_percent": resource.memory_utilization_percent,
+            "storage_utilization_percent": resource.storage_utilization_percent,
+            "network_utilization_mbps": resource.network_utilization_mbps,
+            "is_optimizable": resource.is_optimizable,
+            "optimization_priority": resource.optimization_priority,
+            "optimization_score": resource.optimization_score,
+            "potential_monthly_savings": resource.potential_monthly_savings,
+            "optimization_recommendations": resource.optimization_recommendations,
+            "resource_metadata": resource.resource_metadata,
+            "tags": resource.tags,
+            "resource_status": resource.resource_status,
+            "created_at_cloud": _normalize_datetime(resource.created_at_cloud),
+        }
+
+    async def write_orphans(self, orphans: list[Any]) -> int:
+        """
+        Insert orphan resources (e.g., the results of one region).
+
+        Args:
+            orphans: OrphanResourceData results
+
+        Returns:
+            Number of rows inserted
+        """
+        if not orphans:
+            return 0
+        rows = [self.orphan_row(orphan) for orphan in orphans]
+        async with self.session_factory() as db:
+            if self.base_scan_id is None:
+                written = await orphan_resource_crud.bulk_insert_orphan_resources(
+                    db, rows, chunk_size=self.chunk_size
+                )
+            else:
+                inserted, carried = await orphan_resource_change_crud.write_differential_orphans(
+                    db, self.scan_id, self.base_scan_id, rows, chunk_size=self.chunk_size
+                )
+                self._track_changed(inserted)
+                self.carried.update(carried)
+                written = len(inserted)
+        self.orphans_written += written
+        return written
+
+    def _track_changed(self, inserted: list[dict[str, Any]]) -> None:
+        """Remember the findings a differential scan wrote (see `changed_orphans`)."""
+        self.changed_identities.update(
+            (row["resource_type"], row["resource_id"], row["region"]) for row in inserted
+        )
+
+    async def finish_orphans(self, db: AsyncSession) -> int:
+        """
+        Carry the unchanged findings over from the base scan and log the ones gone.
+
+        Call once every orphan resource is written, with the session that
+        completes the scan: nothing is committed, so the findings change
+        scans in the same transaction as the latest scan pointer. No-op
+        unless differential.
+
+        Args:
+            db: Session of the transaction completing the scan
+
+        Returns:
+            Number of findings removed since the base scan (0 if not differential)
+        """
+        if self.base_scan_id is None:
+            return 0
+        inserted = await orphan_resource_change_crud.carry_over_orphans(
+            db, self.scan_id, self.base_scan_id, self.carried, chunk_size=self.chunk_size
+        )
+        self._track_changed(inserted)
+        self.orphans_written += len(inserted)
+        return await orphan_resource_change_crud.record_removed_orphans(
+            db, self.scan_id, self.base_scan_id, chunk_size=self.chunk_size, commit=False
+        )
+
+    def changed_orphans(self, orphans: list[Any]) -> list[Any]:
+        """
+        Findings of the scan that were written (all of them unless differential).
+
+        Args:
+            orphans: Every OrphanResourceData found by the scan
+
+        Returns:
+            The orphans added or changed since the base scan
+        """
+        if self.base_scan_id is None:
+            return orphans
+        return [
+            orphan
+            for orphan in orphans
+            if (orphan.resource_type, orphan.resource_id, orphan.region)
+            in self.changed_identities
+        ]
+
+    async def write_inventory(self, resources: list[Any]) -> int:
+        """
+        Insert inventory resources (e.g., the results of one region).
+
+        Args:
+            resources: AllCloudResourceData results
+
+        Returns:
+            Number of rows inserted
+        """
+        if not resources:
+            return 0
+        rows = [self.inventory_row(resource) for resource in resources]
+        async with self.session_factory() as db:
+            written = await all_cloud_resource_crud.bulk_insert_resources(
+                db, rows, chunk_size=self.chunk_size
+            )
+        self.inventory_written += written
+        return written
+
+    async def discard_inventory(self) -> None:
+        """Delete the inventory resources written for this scan."""
+        async with self.session_factory() as db:
+            await all_cloud_resource_crud.delete_resources_by_scan(db, self.scan_id)
+        self.inventory_written = 0
+
+    async def discard(self) -> None:
+        """Delete every result written for this scan (e.g., when the scan fails)."""
+        # Unchanged findings never left the base scan (moved only on completion)
+        async with self.session_factory() as db:
+            await orphan_resource_crud.delete_orphan_resources_by_scan(db, self.scan_id)
+            await orphan_resource_change_crud.delete_changes_by_scan(db, self.scan_id)
+        self.orphans_written = 0
+        self.carried = {}
+        await self.discard_inventory()
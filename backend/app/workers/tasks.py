@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 from typing import Any
 
 from sqlalchemy import select
@@ -12,23 +12,25 @@ from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from app.core.security import credential_encryption
 from app.crud import cloud_account as cloud_account_crud
+from app.crud import scan as scan_crud
+from app.crud import scenario_evaluation as scenario_evaluation_crud
 from app.models.cloud_account import CloudAccount
-from app.models.orphan_resource import OrphanResource
-from app.models.scan import Scan, ScanStatus
+from app.models.scan import Scan, ScanStatus, ScanType
 from app.models.user import User
 from app.providers.aws import AWSProvider
 from app.providers.azure import AzureProvider
 from app.providers.gcp import GCPProvider
+from app.providers.incremental import IncrementalPlan, ScenarioVerdict
 from app.providers.microsoft365 import Microsoft365Provider
 from app.services.email_service import send_scan_summary_email
-from app.services.ml_data_collector import (
-    aggregate_monthly_cost_trends,
-    collect_ml_training_data,
-)
-from app.services.pricing_service import PricingService
+from app.services.ml_data_collector import ml_resource_payload
+from app.services.pricing_service import PricingService, load_price_table
+from app.services.scan_progress import ScanProgressPublisher
 from app.services.inventory_scanner import AWSInventoryScanner, AzureInventoryScanner
 from app.workers.celery_app import celery_app
-from app.models.all_cloud_resource import AllCloudResource
+from app.workers.ml_tasks import collect_scan_ml_data
+from app.workers.region_scan import RegionProgressTracker, scan_regions_in_parallel
+from app.workers.result_writer import ScanResultWriter
 from app.schemas.all_cloud_resource import AllCloudResourceCreate
 
 # Create async engine for database operations
@@ -44,31 +46,57 @@ async def get_db_session() -> AsyncSession:
         return session
 
 
-def _normalize_datetime(dt: Any) -> datetime | None:
+async def _load_scenario_verdicts(
+    db: AsyncSession, scan: Scan
+) -> dict[str, dict[str, ScenarioVerdict]] | None:
     """
-    Convert any datetime to naive UTC datetime for PostgreSQL.
-
-    PostgreSQL columns are 'timestamp without time zone', so we must:
-    1. Convert timezone-aware datetimes (e.g. tzlocal()) to UTC
-    2. Strip timezone info before insertion
+    Load the previous scenario verdicts an incremental scan can reuse.
 
     Args:
-        dt: Any value (datetime, None, or other)
+        db: Database session
+        scan: Scan being run
 
     Returns:
-        Naive datetime in UTC, or None if input is None/invalid
+        Region -> scenario -> verdict; empty for scans evaluating every
+        scenario (manual scans), None when incremental scans are disabled
     """
-    if dt is None:
+    if not settings.SCAN_INCREMENTAL_SCHEDULED:
         return None
-    if not isinstance(dt, datetime):
+    if scan.scan_type != ScanType.SCHEDULED.value:
+        return {}
+
+    verdicts: dict[str, dict[str, ScenarioVerdict]] = {}
+    for evaluation in await scenario_evaluation_crud.get_evaluations_by_account(
+        db, scan.cloud_account_id
+    ):
+        verdicts.setdefault(evaluation.region, {})[evaluation.scenario] = ScenarioVerdict(
+            evaluation.inputs_digest, evaluation.evaluated_at, evaluation.findings
+        )
+    return verdicts
+
+
+def _incremental_plan(
+    verdicts: dict[str, dict[str, ScenarioVerdict]] | None, region: str
+) -> IncrementalPlan | None:
+    """Build the incremental plan of a region scan (None when incremental scans are disabled)."""
+    if verdicts is None:
         return None
-
-    if dt.tzinfo is None:
-        # Already naive - assume it's UTC
-        return dt
-    else:
-        # Convert to UTC then strip timezone for PostgreSQL
-        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return IncrementalPlan(
+        previous=verdicts.get(region, {}),
+        max_age=timedelta(hours=settings.SCAN_INCREMENTAL_MAX_AGE_HOURS),
+    )
+
+
+async def _save_scenario_verdicts(
+    cloud_account_id: Any, region: str, plan: IncrementalPlan | None
+) -> None:
+    """Store the scenarios a region scan evaluated, for the next incremental scan."""
+    if plan is None or not plan.evaluated:
+        return
+    async with AsyncSessionLocal() as session:
+        await scenario_evaluation_crud.upsert_evaluations(
+            session, cloud_account_id, region, plan.evaluation_rows()
+        )
 
 
 @celery_app.task(name="app.workers.tasks.scan_cloud_account", bind=True)
@@ -93,11 +121,23 @@ def scan_cloud_account(self: Any, scan_id: str, cloud_account_id: str) -> dict[s
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
-    return loop.run_until_complete(_scan_cloud_account_async(self, scan_id, cloud_account_id))
+    # Push progress to clients through Redis (snapshot + pub/sub)
+    publisher = ScanProgressPublisher(scan_id)
+    try:
+        result = loop.run_until_complete(
+            _scan_cloud_account_async(self, scan_id, cloud_account_id, publisher)
+        )
+        publisher.publish_result(result)
+        return result
+    finally:
+        publisher.close()
 
 
 async def _scan_cloud_account_async(
-    task: Any, scan_id: str, cloud_account_id: str
+    task: Any,
+    scan_id: str,
+    cloud_account_id: str,
+    publisher: ScanProgressPublisher | None = None,
 ) -> dict[str, Any]:
     """
     Async implementation of cloud account scanning.
@@ -106,6 +146,7 @@ async def _scan_cloud_account_async(
         task: Celery task instance
         scan_id: UUID of the scan job
         cloud_account_id: UUID of the cloud account to scan
+        publisher: Optional publisher of the scan progress events
 
     Returns:
         Dict with scan results
@@ -130,6 +171,8 @@ async def _scan_cloud_account_async(
 
             # Track start time for elapsed calculation
             scan_start_time = datetime.now()
+            if publisher:
+                publisher.publish("PROGRESS", {"current_step": "Starting scan..."})
 
             # Get cloud account
             result = await db.execute(
@@ -175,6 +218,18 @@ async def _scan_cloud_account_async(
                     has_secret_key=secret_key != 'MISSING',
                 )
 
+            # Results are bulk-inserted as each region finishes. Differential scans
+            # only write the findings changed since the account's previous scan.
+            if settings.SCAN_DIFFERENTIAL_PERSISTENCE:
+                scan.base_scan_id = account.latest_orphan_scan_id
+            writer = ScanResultWriter(
+                AsyncSessionLocal, scan.id, account.id, base_scan_id=scan.base_scan_id
+            )
+
+            # Scheduled incremental scans reuse the verdicts of metric-based
+            # scenarios whose input resources are unchanged since their last evaluation
+            scenario_verdicts = await _load_scenario_verdicts(db, scan)
+
             # Get user's detection rules
             from app.crud import detection_rule as detection_rule_crud
             user_detection_rules = {}
@@ -204,81 +259,52 @@ async def _scan_cloud_account_async(
                     else await provider.get_available_regions()
                 )
 
-                # Limit to first 3 regions for faster scanning in MVP
-                regions_to_scan = regions_to_scan[:3]
+                # Snapshot every price the scan needs (one query, cold misses resolved now)
+                provider.price_table = await pricing_service.build_price_table(regions_to_scan)
 
-                # Scan all regions
-                all_orphans = []
-                total_resources = 0
-
-                # Update: Validating credentials
-                task.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "current": 0,
-                        "total": len(regions_to_scan) + 2,
-                        "percent": 0,
-                        "current_step": "Validating credentials...",
-                        "region": "",
-                        "resources_found": 0,
-                        "elapsed_seconds": 0,
-                    },
+                # Track progress per region (regions are scanned concurrently)
+                progress = RegionProgressTracker(
+                    task, regions_to_scan, scan_start_time, publisher=publisher
                 )
 
-                for i, region in enumerate(regions_to_scan):
-                    elapsed = (datetime.now() - scan_start_time).total_seconds()
-
-                    # Update task progress
-                    task.update_state(
-                        state="PROGRESS",
-                        meta={
-                            "current": i + 1,
-                            "total": len(regions_to_scan) + 2,
-                            "percent": int((i + 1) / (len(regions_to_scan) + 2) * 100),
-                            "current_step": f"Scanning region {region}...",
-                            "region": region,
-                            "resources_found": len(all_orphans),
-                            "elapsed_seconds": int(elapsed),
-                        },
-                    )
+                # Update: Validating credentials
+                progress.publish("Validating credentials...", percent=0)
 
+                async def scan_region(region: str) -> list:
                     # Scan all resource types in this region
                     # Pass user's detection rules
-                    # Scan global resources (S3, etc.) only in the first region (i == 0)
+                    # Scan global resources (S3, etc.) exactly once, with the first region
+                    plan = _incremental_plan(scenario_verdicts, region)
                     orphans = await provider.scan_all_resources(
-                        region, user_detection_rules, scan_global_resources=(i == 0)
+                        region,
+                        user_detection_rules,
+                        scan_global_resources=(region == regions_to_scan[0]),
+                        incremental=plan,
                     )
-                    all_orphans.extend(orphans)
-                    total_resources += len(orphans)
+                    await writer.write_orphans(orphans)
+                    await _save_scenario_verdicts(account.id, region, plan)
+                    return orphans
 
-                # Update: Saving results
-                elapsed = (datetime.now() - scan_start_time).total_seconds()
-                task.update_state(
-                    state="PROGRESS",
-                    meta={
-                        "current": len(regions_to_scan) + 1,
-                        "total": len(regions_to_scan) + 2,
-                        "percent": 95,
-                        "current_step": "Saving results...",
-                        "region": "",
-                        "resources_found": len(all_orphans),
-                        "elapsed_seconds": int(elapsed),
-                    },
+                # Scan all regions in parallel
+                region_results = await scan_regions_in_parallel(
+                    regions_to_scan, scan_region, progress=progress
+                )
+                all_orphans = [
+                    orphan for region in regions_to_scan for orphan in region_results[region]
+                ]
+                total_resources = len(all_orphans)
+                logger.info(
+                    "scan.cloudwatch_metrics",
+                    scan_id=scan_id,
+                    **provider.metric_cache_stats(),
                 )
 
-                # Save orphan resources to database
-                for orphan in all_orphans:
-                    orphan_resource = OrphanResource(
-                        scan_id=scan.id,
-                        cloud_account_id=account.id,
-                        resource_type=orphan.resource_type,
-                        resource_id=orphan.resource_id,
-                        resource_name=orphan.resource_name,
-                        region=orphan.region,
-                        estimated_monthly_cost=orphan.estimated_monthly_cost,
-                        resource_metadata=orphan.resource_metadata,
-                    )
-                    db.add(orphan_resource)
+                # Update: Saving results
+                progress.publish("Saving results...", percent=95)
+
+                # Carry unchanged findings over and log the ones gone since the base
+                # scan (differential scans), committed with the scan's completion
+                await writer.finish_orphans(db)
 
                 # Calculate total waste
                 total_waste = sum(o.estimated_monthly_cost for o in all_orphans)
@@ -290,45 +316,29 @@ async def _scan_cloud_account_async(
                 scan.estimated_monthly_waste = total_waste
                 scan.completed_at = datetime.now()
 
-                # Update account last_scan_at
+                # Update account last_scan_at and latest scan pointer
                 account.last_scan_at = datetime.now()
+                scan_crud.set_latest_scan(account, scan)
 
                 await db.commit()
 
-                # Collect ML training data if user has consented
                 result = await db.execute(select(User).where(User.id == account.user_id))
                 user = result.scalar_one_or_none()
-                if user:
-                    try:
-                        # Get orphan_resources list from database
-                        orphan_resources_list = await db.execute(
-                            select(OrphanResource).where(OrphanResource.scan_id == scan.id)
-                        )
-                        orphan_resources_from_db = list(orphan_resources_list.scalars().all())
-
-                        # Collect ML data
-                        ml_records = await collect_ml_training_data(
-                            scan=scan,
-                            orphan_resources=orphan_resources_from_db,
-                            user=user,
-                            db=db,
-                        )
-
-                        # Aggregate cost trends
-                        current_month = datetime.now().strftime("%Y-%m")
-                        await aggregate_monthly_cost_trends(
-                            cloud_account=account,
-                            month=current_month,
-                            scan=scan,
-                            orphan_resources=orphan_resources_from_db,
-                            db=db,
-                        )
 
-                        if ml_records > 0:
-                            print(f"✅ Collected {ml_records} ML training records for scan {scan.id}")
-                    except Exception as e:
-                        # Log but don't fail the scan
-                        print(f"⚠️ ML data collection failed for scan {scan.id}: {e}")
+                # ML training data and cost trends are ingested from the in-memory
+                # results by their own task, outside the scan's latency
+                try:
+                    collect_scan_ml_data.delay(
+                        str(scan.id),
+                        str(account.id),
+                        [
+                            ml_resource_payload(orphan)
+                            for orphan in writer.changed_orphans(all_orphans)
+                        ],
+                    )
+                except Exception as e:
+                    # Log but don't fail the scan
+                    print(f"⚠️ ML data collection failed for scan {scan.id}: {e}")
 
                 # ===================================================================
                 # INVENTORY SCAN: Scan ALL AWS resources for cost intelligence
@@ -352,238 +362,92 @@ async def _scan_cloud_account_async(
                     # Load user's detection rules
                     await inventory_scanner._load_detection_rules()
 
-                    all_inventory_resources = []
-
-                    # Scan all regions for complete inventory
+                    # Core resource types: a failure here fails the inventory scan
+                    core_scans = [
+                        ("inventory.ec2_scanned", "ec2_count", inventory_scanner.scan_ec2_instances),
+                        ("inventory.ebs_scanned", "ebs_count", inventory_scanner.scan_ebs_volumes),
+                        ("inventory.eip_scanned", "eip_count", inventory_scanner.scan_elastic_ips),
+                        # AWS Load Balancers (all: ALB, NLB, GLB, CLB)
+                        ("inventory.lb_scanned", "lb_count", inventory_scanner.scan_aws_load_balancers),
+                        ("inventory.snapshot_scanned", "snapshot_count", inventory_scanner.scan_ebs_snapshots),
+                        ("inventory.nat_scanned", "nat_count", inventory_scanner.scan_aws_nat_gateways),
+                        ("inventory.rds_scanned", "rds_count", inventory_scanner.scan_rds_instances),
+                    ]
+
+                    # BATCH 2-4 resource types: a failure only skips that type in that region
+                    optional_scans = [
+                        # BATCH 2
+                        ("inventory.eks_scanned", "eks_count", "inventory.eks_scan_skipped", inventory_scanner.scan_eks_clusters),
+                        ("inventory.lambda_scanned", "lambda_count", "inventory.lambda_scan_skipped", inventory_scanner.scan_lambda_functions),
+                        ("inventory.dynamodb_scanned", "dynamodb_count", "inventory.dynamodb_scan_skipped", inventory_scanner.scan_dynamodb_tables),
+                        ("inventory.fargate_scanned", "fargate_count", "inventory.fargate_scan_skipped", inventory_scanner.scan_fargate_tasks),
+                        # BATCH 3
+                        ("inventory.elasticache_scanned", "elasticache_count", "inventory.elasticache_scan_skipped", inventory_scanner.scan_elasticache_clusters),
+                        ("inventory.kinesis_scanned", "kinesis_count", "inventory.kinesis_scan_skipped", inventory_scanner.scan_kinesis_streams),
+                        ("inventory.efs_scanned", "efs_count", "inventory.efs_scan_skipped", inventory_scanner.scan_efs_file_systems),
+                        ("inventory.opensearch_scanned", "opensearch_count", "inventory.opensearch_scan_skipped", inventory_scanner.scan_opensearch_domains),
+                        ("inventory.api_gateway_scanned", "api_gateway_count", "inventory.api_gateway_scan_skipped", inventory_scanner.scan_api_gateways),
+                        ("inventory.cloudwatch_logs_scanned", "cloudwatch_log_count", "inventory.cloudwatch_logs_scan_skipped", inventory_scanner.scan_cloudwatch_log_groups),
+                        ("inventory.ecs_clusters_scanned", "ecs_cluster_count", "inventory.ecs_clusters_scan_skipped", inventory_scanner.scan_ecs_clusters),
+                        # BATCH 4: Advanced Services ($561/month)
+                        ("inventory.vpc_endpoints_scanned", "vpc_endpoint_count", "inventory.vpc_endpoints_scan_skipped", inventory_scanner.scan_vpc_endpoints),
+                        ("inventory.neptune_scanned", "neptune_count", "inventory.neptune_scan_skipped", inventory_scanner.scan_neptune_clusters),
+                        ("inventory.msk_scanned", "msk_count", "inventory.msk_scan_skipped", inventory_scanner.scan_msk_clusters),
+                        ("inventory.redshift_scanned", "redshift_count", "inventory.redshift_scan_skipped", inventory_scanner.scan_redshift_clusters),
+                        ("inventory.vpn_connections_scanned", "vpn_count", "inventory.vpn_connections_scan_skipped", inventory_scanner.scan_vpn_connections),
+                        ("inventory.transit_gateway_attachments_scanned", "tgw_attachment_count", "inventory.transit_gateway_attachments_scan_skipped", inventory_scanner.scan_transit_gateway_attachments),
+                        ("inventory.documentdb_scanned", "documentdb_count", "inventory.documentdb_scan_skipped", inventory_scanner.scan_documentdb_clusters),
+                    ]
+
+                    async def scan_inventory_region(region: str) -> list:
+                        logger.info("inventory.scan_region_start", region=region)
+                        region_resources = []
+
+                        for event, count_field, scan_method in core_scans:
+                            resources = await scan_method(region)
+                            region_resources.extend(resources)
+                            logger.info(event, region=region, **{count_field: len(resources)})
+
+                        for event, count_field, skipped_event, scan_method in optional_scans:
+                            try:
+                                resources = await scan_method(region)
+                                region_resources.extend(resources)
+                                logger.info(event, region=region, **{count_field: len(resources)})
+                            except Exception as e:
+                                logger.warning(skipped_event, region=region, error=str(e))
+
+                        # Save this region's inventory as soon as it is scanned
+                        await writer.write_inventory(region_resources)
+                        return region_resources
+
+                    # Scan all regions in parallel for complete inventory
                     # NOTE: Only calling implemented methods in AWSInventoryScanner
                     # Future methods will be added as they are implemented
-                    for i, region in enumerate(regions_to_scan):
-                        logger.info(
-                            "inventory.scan_region_start",
-                            region=region,
-                            progress=f"{i+1}/{len(regions_to_scan)}",
-                        )
-
-                        # Scan EC2 instances (all)
-                        ec2_resources = await inventory_scanner.scan_ec2_instances(region)
-                        all_inventory_resources.extend(ec2_resources)
-                        logger.info(
-                            "inventory.ec2_scanned",
-                            region=region,
-                            ec2_count=len(ec2_resources),
-                        )
-
-                        # Scan EBS volumes (all)
-                        ebs_resources = await inventory_scanner.scan_ebs_volumes(region)
-                        all_inventory_resources.extend(ebs_resources)
-                        logger.info(
-                            "inventory.ebs_scanned",
-                            region=region,
-                            ebs_count=len(ebs_resources),
-                        )
-
-                        # Scan Elastic IPs (all)
-                        eip_resources = await inventory_scanner.scan_elastic_ips(region)
-                        all_inventory_resources.extend(eip_resources)
-                        logger.info(
-                            "inventory.eip_scanned",
-                            region=region,
-                            eip_count=len(eip_resources),
-                        )
-
-                        # Scan AWS Load Balancers (all: ALB, NLB, GLB, CLB)
-                        lb_resources = await inventory_scanner.scan_aws_load_balancers(region)
-                        all_inventory_resources.extend(lb_resources)
-                        logger.info(
-                            "inventory.lb_scanned",
-                            region=region,
-                            lb_count=len(lb_resources),
-                        )
-
-                        # Scan EBS Snapshots (all)
-                        snapshot_resources = await inventory_scanner.scan_ebs_snapshots(region)
-                        all_inventory_resources.extend(snapshot_resources)
-                        logger.info(
-                            "inventory.snapshot_scanned",
-                            region=region,
-                            snapshot_count=len(snapshot_resources),
-                        )
-
-                        # Scan AWS NAT Gateways (all)
-                        nat_resources = await inventory_scanner.scan_aws_nat_gateways(region)
-                        all_inventory_resources.extend(nat_resources)
-                        logger.info(
-                            "inventory.nat_scanned",
-                            region=region,
-                            nat_count=len(nat_resources),
-                        )
-
-                        # Scan RDS instances (all)
-                        rds_resources = await inventory_scanner.scan_rds_instances(region)
-                        all_inventory_resources.extend(rds_resources)
-                        logger.info(
-                            "inventory.rds_scanned",
-                            region=region,
-                            rds_count=len(rds_resources),
-                        )
+                    inventory_by_region = await scan_regions_in_parallel(
+                        regions_to_scan, scan_inventory_region
+                    )
+                    all_inventory_resources = [
+                        resource
+                        for region in regions_to_scan
+                        for resource in inventory_by_region[region]
+                    ]
 
                     # Scan S3 buckets (global, only once)
                     if regions_to_scan:
                         s3_resources = await inventory_scanner.scan_s3_buckets()
                         all_inventory_resources.extend(s3_resources)
+                        await writer.write_inventory(s3_resources)
                         logger.info(
                             "inventory.s3_scanned",
                             s3_count=len(s3_resources),
                         )
 
-                    # Scan EKS Clusters (all) - BATCH 2
-                    try:
-                        for region in regions_to_scan:
-                            eks_resources = await inventory_scanner.scan_eks_clusters(region)
-                            all_inventory_resources.extend(eks_resources)
-                            logger.info(
-                                "inventory.eks_scanned",
-                                region=region,
-                                eks_count=len(eks_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.eks_scan_skipped", error=str(e))
-
-                    # Scan Lambda Functions (all) - BATCH 2
-                    try:
-                        for region in regions_to_scan:
-                            lambda_resources = await inventory_scanner.scan_lambda_functions(region)
-                            all_inventory_resources.extend(lambda_resources)
-                            logger.info(
-                                "inventory.lambda_scanned",
-                                region=region,
-                                lambda_count=len(lambda_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.lambda_scan_skipped", error=str(e))
-
-                    # Scan DynamoDB Tables (all) - BATCH 2
-                    try:
-                        for region in regions_to_scan:
-                            dynamodb_resources = await inventory_scanner.scan_dynamodb_tables(region)
-                            all_inventory_resources.extend(dynamodb_resources)
-                            logger.info(
-                                "inventory.dynamodb_scanned",
-                                region=region,
-                                dynamodb_count=len(dynamodb_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.dynamodb_scan_skipped", error=str(e))
-
-                    # Scan Fargate Tasks (all) - BATCH 2
-                    try:
-                        for region in regions_to_scan:
-                            fargate_resources = await inventory_scanner.scan_fargate_tasks(region)
-                            all_inventory_resources.extend(fargate_resources)
-                            logger.info(
-                                "inventory.fargate_scanned",
-                                region=region,
-                                fargate_count=len(fargate_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.fargate_scan_skipped", error=str(e))
-
-                    # Scan ElastiCache Clusters (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            elasticache_resources = await inventory_scanner.scan_elasticache_clusters(region)
-                            all_inventory_resources.extend(elasticache_resources)
-                            logger.info(
-                                "inventory.elasticache_scanned",
-                                region=region,
-                                elasticache_count=len(elasticache_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.elasticache_scan_skipped", error=str(e))
-
-                    # Scan Kinesis Streams (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            kinesis_resources = await inventory_scanner.scan_kinesis_streams(region)
-                            all_inventory_resources.extend(kinesis_resources)
-                            logger.info(
-                                "inventory.kinesis_scanned",
-                                region=region,
-                                kinesis_count=len(kinesis_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.kinesis_scan_skipped", error=str(e))
-
-                    # Scan EFS File Systems (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            efs_resources = await inventory_scanner.scan_efs_file_systems(region)
-                            all_inventory_resources.extend(efs_resources)
-                            logger.info(
-                                "inventory.efs_scanned",
-                                region=region,
-                                efs_count=len(efs_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.efs_scan_skipped", error=str(e))
-
-                    # Scan OpenSearch Domains (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            opensearch_resources = await inventory_scanner.scan_opensearch_domains(region)
-                            all_inventory_resources.extend(opensearch_resources)
-                            logger.info(
-                                "inventory.opensearch_scanned",
-                                region=region,
-                                opensearch_count=len(opensearch_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.opensearch_scan_skipped", error=str(e))
-
-                    # Scan API Gateways (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            api_gateway_resources = await inventory_scanner.scan_api_gateways(region)
-                            all_inventory_resources.extend(api_gateway_resources)
-                            logger.info(
-                                "inventory.api_gateway_scanned",
-                                region=region,
-                                api_gateway_count=len(api_gateway_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.api_gateway_scan_skipped", error=str(e))
-
-                    # Scan CloudWatch Log Groups (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            cloudwatch_log_resources = await inventory_scanner.scan_cloudwatch_log_groups(region)
-                            all_inventory_resources.extend(cloudwatch_log_resources)
-                            logger.info(
-                                "inventory.cloudwatch_logs_scanned",
-                                region=region,
-                                cloudwatch_log_count=len(cloudwatch_log_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.cloudwatch_logs_scan_skipped", error=str(e))
-
-                    # Scan ECS Clusters (all) - BATCH 3
-                    try:
-                        for region in regions_to_scan:
-                            ecs_cluster_resources = await inventory_scanner.scan_ecs_clusters(region)
-                            all_inventory_resources.extend(ecs_cluster_resources)
-                            logger.info(
-                                "inventory.ecs_clusters_scanned",
-                                region=region,
-                                ecs_cluster_count=len(ecs_cluster_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.ecs_clusters_scan_skipped", error=str(e))
-
                     # Scan CloudFront Distributions (global, once) - BATCH 3
                     try:
                         if regions_to_scan:
                             cloudfront_resources = await inventory_scanner.scan_cloudfront_distributions()
                             all_inventory_resources.extend(cloudfront_resources)
+                            await writer.write_inventory(cloudfront_resources)
                             logger.info(
                                 "inventory.cloudfront_scanned",
                                 cloudfront_count=len(cloudfront_resources),
@@ -591,93 +455,12 @@ async def _scan_cloud_account_async(
                     except Exception as e:
                         logger.warning("inventory.cloudfront_scan_skipped", error=str(e))
 
-                    # =========================================================================
-                    # BATCH 4: Advanced Services ($561/month)
-                    # =========================================================================
-
-                    # Scan VPC Endpoints - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            vpc_endpoint_resources = await inventory_scanner.scan_vpc_endpoints(region)
-                            all_inventory_resources.extend(vpc_endpoint_resources)
-                            logger.info(
-                                "inventory.vpc_endpoints_scanned",
-                                region=region,
-                                vpc_endpoint_count=len(vpc_endpoint_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.vpc_endpoints_scan_skipped", error=str(e))
-
-                    # Scan Neptune Clusters - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            neptune_resources = await inventory_scanner.scan_neptune_clusters(region)
-                            all_inventory_resources.extend(neptune_resources)
-                            logger.info(
-                                "inventory.neptune_scanned",
-                                region=region,
-                                neptune_count=len(neptune_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.neptune_scan_skipped", error=str(e))
-
-                    # Scan MSK (Kafka) Clusters - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            msk_resources = await inventory_scanner.scan_msk_clusters(region)
-                            all_inventory_resources.extend(msk_resources)
-                            logger.info(
-                                "inventory.msk_scanned",
-                                region=region,
-                                msk_count=len(msk_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.msk_scan_skipped", error=str(e))
-
-                    # Scan Redshift Clusters - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            redshift_resources = await inventory_scanner.scan_redshift_clusters(region)
-                            all_inventory_resources.extend(redshift_resources)
-                            logger.info(
-                                "inventory.redshift_scanned",
-                                region=region,
-                                redshift_count=len(redshift_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.redshift_scan_skipped", error=str(e))
-
-                    # Scan VPN Connections - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            vpn_resources = await inventory_scanner.scan_vpn_connections(region)
-                            all_inventory_resources.extend(vpn_resources)
-                            logger.info(
-                                "inventory.vpn_connections_scanned",
-                                region=region,
-                                vpn_count=len(vpn_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.vpn_connections_scan_skipped", error=str(e))
-
-                    # Scan Transit Gateway Attachments - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            tgw_resources = await inventory_scanner.scan_transit_gateway_attachments(region)
-                            all_inventory_resources.extend(tgw_resources)
-                            logger.info(
-                                "inventory.transit_gateway_attachments_scanned",
-                                region=region,
-                                tgw_attachment_count=len(tgw_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.transit_gateway_attachments_scan_skipped", error=str(e))
-
                     # Scan Global Accelerators (global, once) - BATCH 4
                     try:
                         if regions_to_scan:
                             global_accelerator_resources = await inventory_scanner.scan_global_accelerators("us-west-2")
                             all_inventory_resources.extend(global_accelerator_resources)
+                            await writer.write_inventory(global_accelerator_resources)
                             logger.info(
                                 "inventory.global_accelerators_scanned",
                                 global_accelerator_count=len(global_accelerator_resources),
@@ -685,49 +468,6 @@ async def _scan_cloud_account_async(
                     except Exception as e:
                         logger.warning("inventory.global_accelerators_scan_skipped", error=str(e))
 
-                    # Scan DocumentDB Clusters - BATCH 4
-                    try:
-                        for region in regions_to_scan:
-                            documentdb_resources = await inventory_scanner.scan_documentdb_clusters(region)
-                            all_inventory_resources.extend(documentdb_resources)
-                            logger.info(
-                                "inventory.documentdb_scanned",
-                                region=region,
-                                documentdb_count=len(documentdb_resources),
-                            )
-                    except Exception as e:
-                        logger.warning("inventory.documentdb_scan_skipped", error=str(e))
-
-                    # Save all inventory resources to database
-                    for resource in all_inventory_resources:
-                        all_cloud_resource = AllCloudResource(
-                            scan_id=scan.id,  # Same scan_id as orphan resources
-                            cloud_account_id=account.id,
-                            resource_type=resource.resource_type,
-                            resource_id=resource.resource_id,
-                            resource_name=resource.resource_name,
-                            region=resource.region,
-                            estimated_monthly_cost=resource.estimated_monthly_cost,
-                            currency=resource.currency,
-                            utilization_status=resource.utilization_status,
-                            cpu_utilization_percent=resource.cpu_utilization_percent,
-                            memory_utilization_percent=resource.memory_utilization_percent,
-                            storage_utilization_percent=resource.storage_utilization_percent,
-                            network_utilization_mbps=resource.network_utilization_mbps,
-                            is_optimizable=resource.is_optimizable,
-                            optimization_priority=resource.optimization_priority,
-                            optimization_score=resource.optimization_score,
-                            potential_monthly_savings=resource.potential_monthly_savings,
-                            optimization_recommendations=resource.optimization_recommendations,
-                            resource_metadata=resource.resource_metadata,
-                            tags=resource.tags,
-                            resource_status=resource.resource_status,
-                            created_at_cloud=_normalize_datetime(resource.created_at_cloud),
-                        )
-                        db.add(all_cloud_resource)
-
-                    await db.commit()
-
                     logger.info(
                         "inventory.scan_complete",
                         total_resources=len(all_inventory_resources),
@@ -739,9 +479,10 @@ async def _scan_cloud_account_async(
                     print(f"✅ Inventory scan complete: {len(all_inventory_resources)} resources scanned")
 
                 except Exception as e:
-                    # Log but don't fail the main scan
+                    # Log but don't fail the main scan (nor keep a partial inventory)
                     logger.error("inventory.scan_failed", error=str(e))
                     print(f"⚠️ Inventory scan failed for scan {scan.id}: {e}")
+                    await writer.discard_inventory()
 
                 # Send email notification if user has enabled notifications
                 if user and user.email_scan_notifications:
@@ -788,46 +529,45 @@ async def _scan_cloud_account_async(
                     else await provider.get_available_regions()
                 )
 
-                # Limit to first 3 regions for faster scanning in MVP
-                regions_to_scan = regions_to_scan[:3]
-
-                # Scan all regions
-                all_orphans = []
-                total_resources = 0
+                # Snapshot the cached prices of the scanned regions (one query)
+                provider.price_table = await load_price_table(db, "azure", regions_to_scan)
 
-                for i, region in enumerate(regions_to_scan):
-                    # Update task progress
-                    task.update_state(
-                        state="PROGRESS",
-                        meta={
-                            "current": i + 1,
-                            "total": len(regions_to_scan),
-                            "region": region,
-                        },
-                    )
+                # Track progress per region (regions are scanned concurrently)
+                progress = RegionProgressTracker(
+                    task, regions_to_scan, scan_start_time, publisher=publisher
+                )
+                progress.publish("Scanning regions...")
 
+                # Scan all regions in parallel
+                async def scan_region(region: str) -> list:
                     # Scan all resource types in this region
                     # Pass user's detection rules
-                    # Scan global resources (Storage Accounts, etc.) only in the first region (i == 0)
+                    # Scan global resources (Storage Accounts, etc.) only in the first region
+                    plan = _incremental_plan(scenario_verdicts, region)
                     orphans = await provider.scan_all_resources(
-                        region, user_detection_rules, scan_global_resources=(i == 0)
+                        region,
+                        user_detection_rules,
+                        scan_global_resources=(region == regions_to_scan[0]),
+                        incremental=plan,
                     )
-                    all_orphans.extend(orphans)
-                    total_resources += len(orphans)
+                    await writer.write_orphans(orphans)
+                    await _save_scenario_verdicts(account.id, region, plan)
+                    return orphans
 
-                # Save orphan resources to database
-                for orphan in all_orphans:
-                    orphan_resource = OrphanResource(
-                        scan_id=scan.id,
-                        cloud_account_id=account.id,
-                        resource_type=orphan.resource_type,
-                        resource_id=orphan.resource_id,
-                        resource_name=orphan.resource_name,
-                        region=orphan.region,
-                        estimated_monthly_cost=orphan.estimated_monthly_cost,
-                        resource_metadata=orphan.resource_metadata,
-                    )
-                    db.add(orphan_resource)
+                region_results = await scan_regions_in_parallel(
+                    regions_to_scan, scan_region, progress=progress
+                )
+                all_orphans = [
+                    orphan
+                    for region in regions_to_scan
+                    for orphan in region_results[region]
+                ]
+                total_resources = len(all_orphans)
+                progress.publish("Saving results...", percent=95)
+
+                # Carry unchanged findings over and log the ones gone since the base
+                # scan (differential scans), committed with the scan's completion
+                await writer.finish_orphans(db)
 
                 # Calculate total waste
                 total_waste = sum(o.estimated_monthly_cost for o in all_orphans)
@@ -839,45 +579,29 @@ async def _scan_cloud_account_async(
                 scan.estimated_monthly_waste = total_waste
                 scan.completed_at = datetime.now()
 
-                # Update account last_scan_at
+                # Update account last_scan_at and latest scan pointer
                 account.last_scan_at = datetime.now()
+                scan_crud.set_latest_scan(account, scan)
 
                 await db.commit()
 
-                # Collect ML training data if user has consented (Azure)
                 result = await db.execute(select(User).where(User.id == account.user_id))
                 user = result.scalar_one_or_none()
-                if user:
-                    try:
-                        # Get orphan_resources list from database
-                        orphan_resources_list = await db.execute(
-                            select(OrphanResource).where(OrphanResource.scan_id == scan.id)
-                        )
-                        orphan_resources_from_db = list(orphan_resources_list.scalars().all())
-
-                        # Collect ML data
-                        ml_records = await collect_ml_training_data(
-                            scan=scan,
-                            orphan_resources=orphan_resources_from_db,
-                            user=user,
-                            db=db,
-                        )
-
-                        # Aggregate cost trends
-                        current_month = datetime.now().strftime("%Y-%m")
-                        await aggregate_monthly_cost_trends(
-                            cloud_account=account,
-                            month=current_month,
-                            scan=scan,
-                            orphan_resources=orphan_resources_from_db,
-                            db=db,
-                        )
 
-                        if ml_records > 0:
-                            print(f"✅ Collected {ml_records} ML training records for scan {scan.id}")
-                    except Exception as e:
-                        # Log but don't fail the scan
-                        print(f"⚠️ ML data collection failed for scan {scan.id}: {e}")
+                # ML training data and cost trends are ingested from the in-memory
+                # results by their own task, outside the scan's latency
+                try:
+                    collect_scan_ml_data.delay(
+                        str(scan.id),
+                        str(account.id),
+                        [
+                            ml_resource_payload(orphan)
+                            for orphan in writer.changed_orphans(all_orphans)
+                        ],
+                    )
+                except Exception as e:
+                    # Log but don't fail the scan
+                    print(f"⚠️ ML data collection failed for scan {scan.id}: {e}")
 
                 # ===================================================================
                 # INVENTORY SCAN: Scan ALL Azure resources for cost intelligence
@@ -893,19 +617,14 @@ async def _scan_cloud_account_async(
 
                     # Create inventory scanner
                     inventory_scanner = AzureInventoryScanner(provider)
-                    all_inventory_resources = []
 
-                    # Scan all regions for complete inventory
-                    for i, region in enumerate(regions_to_scan):
-                        logger.info(
-                            "inventory.scan_region_start",
-                            region=region,
-                            progress=f"{i+1}/{len(regions_to_scan)}",
-                        )
+                    async def scan_inventory_region(region: str) -> list:
+                        logger.info("inventory.scan_region_start", region=region)
+                        region_resources = []
 
                         # Scan Virtual Machines (all)
                         vm_resources = await inventory_scanner.scan_virtual_machines(region)
-                        all_inventory_resources.extend(vm_resources)
+                        region_resources.extend(vm_resources)
                         logger.info(
                             "inventory.vm_scanned",
                             region=region,
@@ -914,7 +633,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Managed Disks (all)
                         disk_resources = await inventory_scanner.scan_managed_disks(region)
-                        all_inventory_resources.extend(disk_resources)
+                        region_resources.extend(disk_resources)
                         logger.info(
                             "inventory.disk_scanned",
                             region=region,
@@ -923,7 +642,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Public IPs (all)
                         ip_resources = await inventory_scanner.scan_public_ips(region)
-                        all_inventory_resources.extend(ip_resources)
+                        region_resources.extend(ip_resources)
                         logger.info(
                             "inventory.ip_scanned",
                             region=region,
@@ -932,7 +651,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Load Balancers (all)
                         lb_resources = await inventory_scanner.scan_load_balancers(region)
-                        all_inventory_resources.extend(lb_resources)
+                        region_resources.extend(lb_resources)
                         logger.info(
                             "inventory.lb_scanned",
                             region=region,
@@ -941,7 +660,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Application Gateways (all)
                         ag_resources = await inventory_scanner.scan_app_gateways(region)
-                        all_inventory_resources.extend(ag_resources)
+                        region_resources.extend(ag_resources)
                         logger.info(
                             "inventory.ag_scanned",
                             region=region,
@@ -950,7 +669,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Storage Accounts (all)
                         sa_resources = await inventory_scanner.scan_storage_accounts(region)
-                        all_inventory_resources.extend(sa_resources)
+                        region_resources.extend(sa_resources)
                         logger.info(
                             "inventory.sa_scanned",
                             region=region,
@@ -959,7 +678,7 @@ async def _scan_cloud_account_async(
 
                         # Scan ExpressRoute Circuits (all)
                         er_resources = await inventory_scanner.scan_expressroute_circuits(region)
-                        all_inventory_resources.extend(er_resources)
+                        region_resources.extend(er_resources)
                         logger.info(
                             "inventory.er_scanned",
                             region=region,
@@ -968,7 +687,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Disk Snapshots (all)
                         snapshot_resources = await inventory_scanner.scan_disk_snapshots(region)
-                        all_inventory_resources.extend(snapshot_resources)
+                        region_resources.extend(snapshot_resources)
                         logger.info(
                             "inventory.snapshot_scanned",
                             region=region,
@@ -977,7 +696,7 @@ async def _scan_cloud_account_async(
 
                         # Scan NAT Gateways (all)
                         nat_resources = await inventory_scanner.scan_nat_gateways(region)
-                        all_inventory_resources.extend(nat_resources)
+                        region_resources.extend(nat_resources)
                         logger.info(
                             "inventory.nat_scanned",
                             region=region,
@@ -986,7 +705,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Azure SQL Databases (all)
                         sqldb_resources = await inventory_scanner.scan_azure_sql_databases(region)
-                        all_inventory_resources.extend(sqldb_resources)
+                        region_resources.extend(sqldb_resources)
                         logger.info(
                             "inventory.sqldb_scanned",
                             region=region,
@@ -995,7 +714,7 @@ async def _scan_cloud_account_async(
 
                         # Scan AKS Clusters (all)
                         aks_resources = await inventory_scanner.scan_aks_clusters(region)
-                        all_inventory_resources.extend(aks_resources)
+                        region_resources.extend(aks_resources)
                         logger.info(
                             "inventory.aks_scanned",
                             region=region,
@@ -1004,7 +723,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Function Apps (all)
                         function_resources = await inventory_scanner.scan_function_apps(region)
-                        all_inventory_resources.extend(function_resources)
+                        region_resources.extend(function_resources)
                         logger.info(
                             "inventory.functions_scanned",
                             region=region,
@@ -1013,7 +732,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Cosmos DB accounts (all)
                         cosmos_resources = await inventory_scanner.scan_cosmos_dbs(region)
-                        all_inventory_resources.extend(cosmos_resources)
+                        region_resources.extend(cosmos_resources)
                         logger.info(
                             "inventory.cosmos_scanned",
                             region=region,
@@ -1022,7 +741,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Container Apps (all)
                         container_app_resources = await inventory_scanner.scan_container_apps(region)
-                        all_inventory_resources.extend(container_app_resources)
+                        region_resources.extend(container_app_resources)
                         logger.info(
                             "inventory.container_apps_scanned",
                             region=region,
@@ -1031,7 +750,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Virtual Desktop host pools (all)
                         vd_resources = await inventory_scanner.scan_virtual_desktops(region)
-                        all_inventory_resources.extend(vd_resources)
+                        region_resources.extend(vd_resources)
                         logger.info(
                             "inventory.virtual_desktops_scanned",
                             region=region,
@@ -1040,7 +759,7 @@ async def _scan_cloud_account_async(
 
                         # Scan HDInsight clusters (all)
                         hdinsight_resources = await inventory_scanner.scan_hdinsight_clusters(region)
-                        all_inventory_resources.extend(hdinsight_resources)
+                        region_resources.extend(hdinsight_resources)
                         logger.info(
                             "inventory.hdinsight_scanned",
                             region=region,
@@ -1049,7 +768,7 @@ async def _scan_cloud_account_async(
 
                         # Scan ML Compute Instances (all)
                         ml_resources = await inventory_scanner.scan_ml_compute_instances(region)
-                        all_inventory_resources.extend(ml_resources)
+                        region_resources.extend(ml_resources)
                         logger.info(
                             "inventory.ml_compute_scanned",
                             region=region,
@@ -1058,7 +777,7 @@ async def _scan_cloud_account_async(
 
                         # Scan App Services (all, excluding Function Apps)
                         app_service_resources = await inventory_scanner.scan_app_services(region)
-                        all_inventory_resources.extend(app_service_resources)
+                        region_resources.extend(app_service_resources)
                         logger.info(
                             "inventory.app_services_scanned",
                             region=region,
@@ -1067,7 +786,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Redis Caches (all)
                         redis_resources = await inventory_scanner.scan_redis_caches(region)
-                        all_inventory_resources.extend(redis_resources)
+                        region_resources.extend(redis_resources)
                         logger.info(
                             "inventory.redis_scanned",
                             region=region,
@@ -1076,7 +795,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Event Hubs (all)
                         event_hub_resources = await inventory_scanner.scan_event_hubs(region)
-                        all_inventory_resources.extend(event_hub_resources)
+                        region_resources.extend(event_hub_resources)
                         logger.info(
                             "inventory.event_hubs_scanned",
                             region=region,
@@ -1085,7 +804,7 @@ async def _scan_cloud_account_async(
 
                         # Scan NetApp Files (all)
                         netapp_resources = await inventory_scanner.scan_netapp_files(region)
-                        all_inventory_resources.extend(netapp_resources)
+                        region_resources.extend(netapp_resources)
                         logger.info(
                             "inventory.netapp_scanned",
                             region=region,
@@ -1094,7 +813,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Cognitive Search (all)
                         cognitive_search_resources = await inventory_scanner.scan_cognitive_search(region)
-                        all_inventory_resources.extend(cognitive_search_resources)
+                        region_resources.extend(cognitive_search_resources)
                         logger.info(
                             "inventory.cognitive_search_scanned",
                             region=region,
@@ -1103,7 +822,7 @@ async def _scan_cloud_account_async(
 
                         # Scan API Management (all)
                         apim_resources = await inventory_scanner.scan_api_management(region)
-                        all_inventory_resources.extend(apim_resources)
+                        region_resources.extend(apim_resources)
                         logger.info(
                             "inventory.api_management_scanned",
                             region=region,
@@ -1112,7 +831,7 @@ async def _scan_cloud_account_async(
 
                         # Scan CDN (all)
                         cdn_resources = await inventory_scanner.scan_cdn(region)
-                        all_inventory_resources.extend(cdn_resources)
+                        region_resources.extend(cdn_resources)
                         logger.info(
                             "inventory.cdn_scanned",
                             region=region,
@@ -1121,7 +840,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Container Instances (all)
                         aci_resources = await inventory_scanner.scan_container_instances(region)
-                        all_inventory_resources.extend(aci_resources)
+                        region_resources.extend(aci_resources)
                         logger.info(
                             "inventory.container_instances_scanned",
                             region=region,
@@ -1130,7 +849,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Logic Apps (all)
                         logic_app_resources = await inventory_scanner.scan_logic_apps(region)
-                        all_inventory_resources.extend(logic_app_resources)
+                        region_resources.extend(logic_app_resources)
                         logger.info(
                             "inventory.logic_apps_scanned",
                             region=region,
@@ -1139,7 +858,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Log Analytics Workspaces (all)
                         log_analytics_resources = await inventory_scanner.scan_log_analytics(region)
-                        all_inventory_resources.extend(log_analytics_resources)
+                        region_resources.extend(log_analytics_resources)
                         logger.info(
                             "inventory.log_analytics_scanned",
                             region=region,
@@ -1148,7 +867,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Backup Vaults (all)
                         backup_vault_resources = await inventory_scanner.scan_backup_vaults(region)
-                        all_inventory_resources.extend(backup_vault_resources)
+                        region_resources.extend(backup_vault_resources)
                         logger.info(
                             "inventory.backup_vaults_scanned",
                             region=region,
@@ -1157,7 +876,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Data Factory Pipelines (all)
                         data_factory_resources = await inventory_scanner.scan_data_factory_pipelines(region)
-                        all_inventory_resources.extend(data_factory_resources)
+                        region_resources.extend(data_factory_resources)
                         logger.info(
                             "inventory.data_factory_scanned",
                             region=region,
@@ -1166,7 +885,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Synapse Serverless SQL (all)
                         synapse_resources = await inventory_scanner.scan_synapse_serverless_sql(region)
-                        all_inventory_resources.extend(synapse_resources)
+                        region_resources.extend(synapse_resources)
                         logger.info(
                             "inventory.synapse_serverless_scanned",
                             region=region,
@@ -1175,7 +894,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Storage SFTP (all)
                         sftp_resources = await inventory_scanner.scan_storage_sftp(region)
-                        all_inventory_resources.extend(sftp_resources)
+                        region_resources.extend(sftp_resources)
                         logger.info(
                             "inventory.storage_sftp_scanned",
                             region=region,
@@ -1184,7 +903,7 @@ async def _scan_cloud_account_async(
 
                         # Scan AD Domain Services (all)
                         ad_domain_resources = await inventory_scanner.scan_ad_domain_services(region)
-                        all_inventory_resources.extend(ad_domain_resources)
+                        region_resources.extend(ad_domain_resources)
                         logger.info(
                             "inventory.ad_domain_services_scanned",
                             region=region,
@@ -1193,7 +912,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Service Bus Premium (all)
                         service_bus_resources = await inventory_scanner.scan_service_bus_premium(region)
-                        all_inventory_resources.extend(service_bus_resources)
+                        region_resources.extend(service_bus_resources)
                         logger.info(
                             "inventory.service_bus_premium_scanned",
                             region=region,
@@ -1202,7 +921,7 @@ async def _scan_cloud_account_async(
 
                         # Scan IoT Hub (all)
                         iot_hub_resources = await inventory_scanner.scan_iot_hub(region)
-                        all_inventory_resources.extend(iot_hub_resources)
+                        region_resources.extend(iot_hub_resources)
                         logger.info(
                             "inventory.iot_hub_scanned",
                             region=region,
@@ -1211,7 +930,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Stream Analytics (all)
                         stream_analytics_resources = await inventory_scanner.scan_stream_analytics(region)
-                        all_inventory_resources.extend(stream_analytics_resources)
+                        region_resources.extend(stream_analytics_resources)
                         logger.info(
                             "inventory.stream_analytics_scanned",
                             region=region,
@@ -1220,7 +939,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Document Intelligence (all)
                         document_intelligence_resources = await inventory_scanner.scan_ai_document_intelligence(region)
-                        all_inventory_resources.extend(document_intelligence_resources)
+                        region_resources.extend(document_intelligence_resources)
                         logger.info(
                             "inventory.document_intelligence_scanned",
                             region=region,
@@ -1229,7 +948,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Computer Vision (all)
                         computer_vision_resources = await inventory_scanner.scan_computer_vision(region)
-                        all_inventory_resources.extend(computer_vision_resources)
+                        region_resources.extend(computer_vision_resources)
                         logger.info(
                             "inventory.computer_vision_scanned",
                             region=region,
@@ -1238,7 +957,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Face API (all)
                         face_api_resources = await inventory_scanner.scan_face_api(region)
-                        all_inventory_resources.extend(face_api_resources)
+                        region_resources.extend(face_api_resources)
                         logger.info(
                             "inventory.face_api_scanned",
                             region=region,
@@ -1247,7 +966,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Text Analytics (all)
                         text_analytics_resources = await inventory_scanner.scan_text_analytics(region)
-                        all_inventory_resources.extend(text_analytics_resources)
+                        region_resources.extend(text_analytics_resources)
                         logger.info(
                             "inventory.text_analytics_scanned",
                             region=region,
@@ -1256,7 +975,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Speech Services (all)
                         speech_services_resources = await inventory_scanner.scan_speech_services(region)
-                        all_inventory_resources.extend(speech_services_resources)
+                        region_resources.extend(speech_services_resources)
                         logger.info(
                             "inventory.speech_services_scanned",
                             region=region,
@@ -1265,7 +984,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Bot Service (all)
                         bot_service_resources = await inventory_scanner.scan_bot_service(region)
-                        all_inventory_resources.extend(bot_service_resources)
+                        region_resources.extend(bot_service_resources)
                         logger.info(
                             "inventory.bot_service_scanned",
                             region=region,
@@ -1274,7 +993,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Application Insights (all)
                         application_insights_resources = await inventory_scanner.scan_application_insights(region)
-                        all_inventory_resources.extend(application_insights_resources)
+                        region_resources.extend(application_insights_resources)
                         logger.info(
                             "inventory.application_insights_scanned",
                             region=region,
@@ -1283,7 +1002,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Managed DevOps Pools (all)
                         managed_devops_pools_resources = await inventory_scanner.scan_managed_devops_pools(region)
-                        all_inventory_resources.extend(managed_devops_pools_resources)
+                        region_resources.extend(managed_devops_pools_resources)
                         logger.info(
                             "inventory.managed_devops_pools_scanned",
                             region=region,
@@ -1292,7 +1011,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Private Endpoints (all)
                         private_endpoint_resources = await inventory_scanner.scan_private_endpoints(region)
-                        all_inventory_resources.extend(private_endpoint_resources)
+                        region_resources.extend(private_endpoint_resources)
                         logger.info(
                             "inventory.private_endpoints_scanned",
                             region=region,
@@ -1301,7 +1020,7 @@ async def _scan_cloud_account_async(
 
                         # Scan ML Endpoints (all)
                         ml_endpoint_resources = await inventory_scanner.scan_ml_endpoints(region)
-                        all_inventory_resources.extend(ml_endpoint_resources)
+                        region_resources.extend(ml_endpoint_resources)
                         logger.info(
                             "inventory.ml_endpoints_scanned",
                             region=region,
@@ -1310,7 +1029,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Synapse SQL Pools (all)
                         synapse_sql_pool_resources = await inventory_scanner.scan_synapse_sql_pools(region)
-                        all_inventory_resources.extend(synapse_sql_pool_resources)
+                        region_resources.extend(synapse_sql_pool_resources)
                         logger.info(
                             "inventory.synapse_sql_pools_scanned",
                             region=region,
@@ -1319,7 +1038,7 @@ async def _scan_cloud_account_async(
 
                         # Scan VPN Gateways (all)
                         vpn_gateway_resources = await inventory_scanner.scan_vpn_gateways(region)
-                        all_inventory_resources.extend(vpn_gateway_resources)
+                        region_resources.extend(vpn_gateway_resources)
                         logger.info(
                             "inventory.vpn_gateways_scanned",
                             region=region,
@@ -1328,7 +1047,7 @@ async def _scan_cloud_account_async(
 
                         # Scan VNet Peerings (all)
                         vnet_peering_resources = await inventory_scanner.scan_vnet_peerings(region)
-                        all_inventory_resources.extend(vnet_peering_resources)
+                        region_resources.extend(vnet_peering_resources)
                         logger.info(
                             "inventory.vnet_peerings_scanned",
                             region=region,
@@ -1338,7 +1057,7 @@ async def _scan_cloud_account_async(
                         # Scan Front Doors (global - only once, not per region)
                         if region == regions_to_scan[0]:  # Only scan once (Front Door is global)
                             front_door_resources = await inventory_scanner.scan_front_doors(region)
-                            all_inventory_resources.extend(front_door_resources)
+                            region_resources.extend(front_door_resources)
                             logger.info(
                                 "inventory.front_doors_scanned",
                                 front_door_count=len(front_door_resources),
@@ -1346,7 +1065,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Container Registries (all)
                         container_registry_resources = await inventory_scanner.scan_container_registries(region)
-                        all_inventory_resources.extend(container_registry_resources)
+                        region_resources.extend(container_registry_resources)
                         logger.info(
                             "inventory.container_registries_scanned",
                             region=region,
@@ -1355,7 +1074,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Service Bus Topics (all)
                         service_bus_topic_resources = await inventory_scanner.scan_service_bus_topics(region)
-                        all_inventory_resources.extend(service_bus_topic_resources)
+                        region_resources.extend(service_bus_topic_resources)
                         logger.info(
                             "inventory.service_bus_topics_scanned",
                             region=region,
@@ -1364,7 +1083,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Service Bus Queues (all)
                         service_bus_queue_resources = await inventory_scanner.scan_service_bus_queues(region)
-                        all_inventory_resources.extend(service_bus_queue_resources)
+                        region_resources.extend(service_bus_queue_resources)
                         logger.info(
                             "inventory.service_bus_queues_scanned",
                             region=region,
@@ -1373,7 +1092,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Event Grid Subscriptions (all)
                         event_grid_sub_resources = await inventory_scanner.scan_event_grid_subscriptions(region)
-                        all_inventory_resources.extend(event_grid_sub_resources)
+                        region_resources.extend(event_grid_sub_resources)
                         logger.info(
                             "inventory.event_grid_subscriptions_scanned",
                             region=region,
@@ -1382,7 +1101,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Key Vault Secrets (all)
                         key_vault_secret_resources = await inventory_scanner.scan_key_vault_secrets(region)
-                        all_inventory_resources.extend(key_vault_secret_resources)
+                        region_resources.extend(key_vault_secret_resources)
                         logger.info(
                             "inventory.key_vault_secrets_scanned",
                             region=region,
@@ -1391,7 +1110,7 @@ async def _scan_cloud_account_async(
 
                         # Scan App Configuration stores (all)
                         app_config_resources = await inventory_scanner.scan_app_configurations(region)
-                        all_inventory_resources.extend(app_config_resources)
+                        region_resources.extend(app_config_resources)
                         logger.info(
                             "inventory.app_configurations_scanned",
                             region=region,
@@ -1400,7 +1119,7 @@ async def _scan_cloud_account_async(
 
                         # Scan API Management services (all)
                         api_mgmt_resources = await inventory_scanner.scan_api_managements(region)
-                        all_inventory_resources.extend(api_mgmt_resources)
+                        region_resources.extend(api_mgmt_resources)
                         logger.info(
                             "inventory.api_managements_scanned",
                             region=region,
@@ -1409,7 +1128,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Logic Apps (all)
                         logic_app_resources = await inventory_scanner.scan_logic_apps(region)
-                        all_inventory_resources.extend(logic_app_resources)
+                        region_resources.extend(logic_app_resources)
                         logger.info(
                             "inventory.logic_apps_scanned",
                             region=region,
@@ -1418,7 +1137,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Data Factories (all)
                         data_factory_resources = await inventory_scanner.scan_data_factories(region)
-                        all_inventory_resources.extend(data_factory_resources)
+                        region_resources.extend(data_factory_resources)
                         logger.info(
                             "inventory.data_factories_scanned",
                             region=region,
@@ -1427,7 +1146,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Static Web Apps (all)
                         static_web_app_resources = await inventory_scanner.scan_static_web_apps(region)
-                        all_inventory_resources.extend(static_web_app_resources)
+                        region_resources.extend(static_web_app_resources)
                         logger.info(
                             "inventory.static_web_apps_scanned",
                             region=region,
@@ -1436,7 +1155,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Dedicated HSMs (all)
                         dedicated_hsm_resources = await inventory_scanner.scan_dedicated_hsms(region)
-                        all_inventory_resources.extend(dedicated_hsm_resources)
+                        region_resources.extend(dedicated_hsm_resources)
                         logger.info(
                             "inventory.dedicated_hsms_scanned",
                             region=region,
@@ -1445,7 +1164,7 @@ async def _scan_cloud_account_async(
 
                         # Scan IoT Hub Message Routing (all)
                         iot_hub_routing_resources = await inventory_scanner.scan_iot_hub_message_routing(region)
-                        all_inventory_resources.extend(iot_hub_routing_resources)
+                        region_resources.extend(iot_hub_routing_resources)
                         logger.info(
                             "inventory.iot_hub_routing_scanned",
                             region=region,
@@ -1454,7 +1173,7 @@ async def _scan_cloud_account_async(
 
                         # Scan ML Online Endpoints (all)
                         ml_online_endpoint_resources = await inventory_scanner.scan_ml_online_endpoints(region)
-                        all_inventory_resources.extend(ml_online_endpoint_resources)
+                        region_resources.extend(ml_online_endpoint_resources)
                         logger.info(
                             "inventory.ml_online_endpoints_scanned",
                             region=region,
@@ -1463,7 +1182,7 @@ async def _scan_cloud_account_async(
 
                         # Scan ML Batch Endpoints (all)
                         ml_batch_endpoint_resources = await inventory_scanner.scan_ml_batch_endpoints(region)
-                        all_inventory_resources.extend(ml_batch_endpoint_resources)
+                        region_resources.extend(ml_batch_endpoint_resources)
                         logger.info(
                             "inventory.ml_batch_endpoints_scanned",
                             region=region,
@@ -1472,7 +1191,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Automation Accounts (all)
                         automation_account_resources = await inventory_scanner.scan_automation_accounts(region)
-                        all_inventory_resources.extend(automation_account_resources)
+                        region_resources.extend(automation_account_resources)
                         logger.info(
                             "inventory.automation_accounts_scanned",
                             region=region,
@@ -1481,7 +1200,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Azure Advisor Recommendations (all)
                         advisor_recommendation_resources = await inventory_scanner.scan_advisor_recommendations(region)
-                        all_inventory_resources.extend(advisor_recommendation_resources)
+                        region_resources.extend(advisor_recommendation_resources)
                         logger.info(
                             "inventory.advisor_recommendations_scanned",
                             region=region,
@@ -1490,7 +1209,7 @@ async def _scan_cloud_account_async(
 
                         # Scan ARM Template Deployments (all)
                         arm_deployment_resources = await inventory_scanner.scan_arm_deployments(region)
-                        all_inventory_resources.extend(arm_deployment_resources)
+                        region_resources.extend(arm_deployment_resources)
                         logger.info(
                             "inventory.arm_deployments_scanned",
                             region=region,
@@ -1499,7 +1218,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Container Instances (all)
                         container_instance_resources = await inventory_scanner.scan_container_instances(region)
-                        all_inventory_resources.extend(container_instance_resources)
+                        region_resources.extend(container_instance_resources)
                         logger.info(
                             "inventory.container_instances_scanned",
                             region=region,
@@ -1508,7 +1227,7 @@ async def _scan_cloud_account_async(
 
                         # Scan Batch Jobs (all)
                         batch_job_resources = await inventory_scanner.scan_batch_jobs(region)
-                        all_inventory_resources.extend(batch_job_resources)
+                        region_resources.extend(batch_job_resources)
                         logger.info(
                             "inventory.batch_jobs_scanned",
                             region=region,
@@ -1517,42 +1236,32 @@ async def _scan_cloud_account_async(
 
                         # Scan Storage Lifecycle Policies (all)
                         storage_lifecycle_policy_resources = await inventory_scanner.scan_storage_lifecycle_policies(region)
-                        all_inventory_resources.extend(storage_lifecycle_policy_resources)
+                        region_resources.extend(storage_lifecycle_policy_resources)
                         logger.info(
                             "inventory.storage_lifecycle_policies_scanned",
                             region=region,
                             storage_lifecycle_policy_count=len(storage_lifecycle_policy_resources),
                         )
 
-                    # Save all inventory resources to database
-                    for resource in all_inventory_resources:
-                        all_cloud_resource = AllCloudResource(
-                            scan_id=scan.id,  # Same scan_id as orphan resources
-                            cloud_account_id=account.id,
-                            resource_type=resource.resource_type,
-                            resource_id=resource.resource_id,
-                            resource_name=resource.resource_name,
-                            region=resource.region,
-                            estimated_monthly_cost=resource.estimated_monthly_cost,
-                            currency=resource.currency,
-                            utilization_status=resource.utilization_status,
-                            cpu_utilization_percent=resource.cpu_utilization_percent,
-                            memory_utilization_percent=resource.memory_utilization_percent,
-                            storage_utilization_percent=resource.storage_utilization_percent,
-                            network_utilization_mbps=resource.network_utilization_mbps,
-                            is_optimizable=resource.is_optimizable,
-                            optimization_priority=resource.optimization_priority,
-                            optimization_score=resource.optimization_score,
-                            potential_monthly_savings=resource.potential_monthly_savings,
-                            optimization_recommendations=resource.optimization_recommendations,
-                            resource_metadata=resource.resource_metadata,
-                            tags=resource.tags,
-                            resource_status=resource.resource_status,
-                            created_at_cloud=_normalize_datetime(resource.created_at_cloud),
-                        )
-                        db.add(all_cloud_resource)
+                        return region_resources
 
-                    await db.commit()
+                    # The Azure SDK is blocking, so each region runs on the
+                    # provider's worker threads; its inventory is saved back
+                    # on the event loop as soon as the region is scanned
+                    async def scan_and_save_inventory_region(region: str) -> list:
+                        region_resources = await provider._run_blocking(scan_inventory_region, region)
+                        await writer.write_inventory(region_resources)
+                        return region_resources
+
+                    # Scan all regions in parallel for complete inventory
+                    inventory_by_region = await scan_regions_in_parallel(
+                        regions_to_scan, scan_and_save_inventory_region
+                    )
+                    all_inventory_resources = [
+                        resource
+                        for region in regions_to_scan
+                        for resource in inventory_by_region[region]
+                    ]
 
                     logger.info(
                         "inventory.scan_complete",
@@ -1565,9 +1274,10 @@ async def _scan_cloud_account_async(
                     print(f"✅ Inventory scan complete: {len(all_inventory_resources)} resources scanned")
 
                 except Exception as e:
-                    # Log but don't fail the main scan
+                    # Log but don't fail the main scan (nor keep a partial inventory)
                     logger.error("inventory.scan_failed", error=str(e))
                     print(f"⚠️ Inventory scan failed for scan {scan.id}: {e}")
+                    await writer.discard_inventory()
 
                 # Send email notification if user has enabled notifications
                 if user and user.email_scan_notifications:
@@ -1620,8 +1330,9 @@ async def _scan_cloud_account_async(
                 scan.estimated_monthly_waste = 0.0
                 scan.completed_at = datetime.now()
 
-                # Update account last_scan_at
+                # Update account last_scan_at and latest scan pointer
                 account.last_scan_at = datetime.now()
+                scan_crud.set_latest_scan(account, scan)
 
                 await db.commit()
 
@@ -1672,18 +1383,11 @@ async def _scan_cloud_account_async(
                 total_resources = len(all_orphans)
 
                 # Save orphan resources to database
-                for orphan in all_orphans:
-                    orphan_resource = OrphanResource(
-                        scan_id=scan.id,
-                        cloud_account_id=account.id,
-                        resource_type=orphan.resource_type,
-                        resource_id=orphan.resource_id,
-                        resource_name=orphan.resource_name,
-                        region=orphan.region,  # "global" for M365
-                        estimated_monthly_cost=orphan.estimated_monthly_cost,
-                        resource_metadata=orphan.resource_metadata,
-                    )
-                    db.add(orphan_resource)
+                await writer.write_orphans(all_orphans)
+
+                # Carry unchanged findings over and log the ones gone since the base
+                # scan (differential scans), committed with the scan's completion
+                await writer.finish_orphans(db)
 
                 # Calculate total waste
                 total_waste = sum(o.estimated_monthly_cost for o in all_orphans)
@@ -1695,8 +1399,9 @@ async def _scan_cloud_account_async(
                 scan.estimated_monthly_waste = total_waste
                 scan.completed_at = datetime.now()
 
-                # Update account last_scan_at
+                # Update account last_scan_at and latest scan pointer
                 account.last_scan_at = datetime.now()
+                scan_crud.set_latest_scan(account, scan)
 
                 await db.commit()
 
@@ -1766,9 +1471,15 @@ async def _scan_cloud_account_async(
 
             # Try to update scan with error if scan was retrieved
             try:
+                # Drop the scan's uncommitted work (e.g., findings being carried over)
+                await db.rollback()
                 result = await db.execute(select(Scan).where(Scan.id == scan_id))
                 scan = result.scalar_one_or_none()
                 if scan:
+                    # Results already written region by region are not kept for a failed scan
+                    if "writer" in locals() and scan.status != ScanStatus.COMPLETED.value:
+                        await writer.discard()
+
                     scan.status = ScanStatus.FAILED.value
                     scan.error_message = str(e)[:500]  # Limit error message length
                     scan.completed_at = datetime.now()
@@ -1802,6 +1513,13 @@ async def _scan_cloud_account_async(
                 "status": "failed",
             }
 
+        finally:
+            # Release pooled cloud API clients and their connections
+            if "provider" in locals():
+                await provider.close()
+            if "pricing_service" in locals():
+                await pricing_service.close()
+
 
 @celery_app.task(name="app.workers.tasks.scan_cloud_account_scheduled")
 def scan_cloud_account_scheduled(cloud_account_id: str) -> dict[str, Any]:
@@ -2099,7 +1817,8 @@ async def _update_pricing_cache_async() -> dict[str, Any]:
     """
     Async implementation of pricing cache update.
 
-    Fetches prices from cloud provider APIs and stores them in the database.
+    Fetches each AWS price list once for all regions (in parallel) and
+    upserts every price in one batch, skipping unchanged prices.
     """
     import structlog
 
@@ -2108,100 +1827,75 @@ async def _update_pricing_cache_async() -> dict[str, Any]:
     async with AsyncSessionLocal() as db:
         try:
             pricing_service = PricingService(db)
+            result = await pricing_service.refresh_aws_prices()
 
-            # AWS regions to fetch pricing for
-            aws_regions = [
-                "us-east-1",
-                "us-east-2",
-                "us-west-1",
-                "us-west-2",
-                "eu-west-1",
-                "eu-west-2",
-                "eu-west-3",
-                "eu-central-1",
-                "ap-southeast-1",
-                "ap-southeast-2",
-                "ap-northeast-1",
-                "ap-northeast-2",
-            ]
-
-            # EBS volume types to update
-            ebs_volume_types = ["ebs_gp3", "ebs_gp2", "ebs_io1", "ebs_io2", "ebs_st1", "ebs_sc1"]
-
-            # Other AWS services
-            other_services = ["elastic_ip"]
-
-            updated_count = 0
-            failed_count = 0
-
-            # Update EBS pricing for each region
-            for region in aws_regions:
-                for volume_type in ebs_volume_types:
-                    try:
-                        # Force refresh to fetch from API
-                        price = await pricing_service.get_aws_price(
-                            volume_type, region, force_refresh=True
-                        )
-                        updated_count += 1
-                        logger.info(
-                            "pricing.updated",
-                            provider="aws",
-                            service=volume_type,
-                            region=region,
-                            price=price,
-                        )
-                    except Exception as e:
-                        failed_count += 1
-                        logger.error(
-                            "pricing.update_failed",
-                            provider="aws",
-                            service=volume_type,
-                            region=region,
-                            error=str(e),
-                        )
+            logger.info("pricing.cache_update_complete", provider="aws", **result)
 
-            # Update other service pricing (region-independent or us-east-1)
-            for service in other_services:
-                try:
-                    price = await pricing_service.get_aws_price(
-                        service, "us-east-1", force_refresh=True
-                    )
-                    updated_count += 1
-                    logger.info(
-                        "pricing.updated",
-                        provider="aws",
-                        service=service,
-                        region="us-east-1",
-                        price=price,
-                    )
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(
-                        "pricing.update_failed",
-                        provider="aws",
-                        service=service,
-                        region="us-east-1",
-                        error=str(e),
-                    )
+            return {"status": "success", **result}
 
-            logger.info(
-                "pricing.cache_update_complete",
-                updated_count=updated_count,
-                failed_count=failed_count,
+        except Exception as e:
+            logger.error(
+                "pricing.cache_update_error",
+                error=str(e),
             )
-
             return {
-                "status": "success",
-                "updated_count": updated_count,
-                "failed_count": failed_count,
+                "status": "error",
+                "error": str(e),
             }
 
+        finally:
+            if "pricing_service" in locals():
+                await pricing_service.close()
+
+
+@celery_app.task(name="app.workers.tasks.compact_scan_history")
+def compact_scan_history() -> dict[str, Any]:
+    """
+    Compact the scan history of every cloud account.
+
+    This task runs daily via Celery Beat: scans beyond the last
+    SCAN_RETENTION_KEEP_LAST of each account keep a per-type/region summary
+    and lose their resource rows (archived first if
+    SCAN_RETENTION_ARCHIVE_DETAILS is enabled), keeping the resource tables small.
+
+    Returns:
+        Dict with compaction results
+    """
+    # Get or create event loop
+    try:
+        loop = asyncio.get_event_loop()
+        if loop.is_closed():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(_compact_scan_history_async())
+
+
+async def _compact_scan_history_async() -> dict[str, Any]:
+    """Async implementation of scan history compaction."""
+    import structlog
+
+    from app.crud import scan_retention as scan_retention_crud
+
+    logger = structlog.get_logger()
+
+    async with AsyncSessionLocal() as db:
+        try:
+            result = await scan_retention_crud.compact_scan_history(db)
+
+            logger.info("scan_retention.completed", **result)
+
+            return {"status": "success", **result}
+
         except Exception as e:
             logger.error(
-                "pricing.cache_update_error",
+                "scan_retention.error",
                 error=str(e),
             )
             return {
                 "status": "error",
                 "error": str(e),
-            }
\ No newline at end of file
+            }
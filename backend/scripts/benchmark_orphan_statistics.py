@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark: orphan resource statistics with ORM rows vs. SQL-side aggregation.
+
+Seeds one user with several cloud accounts, each with an older and a latest
+completed scan, then computes the /resources/stats payload with:
+- orm: load every OrphanResource of the latest scans (including
+       resource_metadata) and count/sum in Python (former implementation)
+- sql: get_orphan_resource_statistics, grouped counts and sums in one statement
+
+WARNING: creates and drops all tables of the target database. Point it at a
+scratch database only.
+
+Usage:
+    python scripts/benchmark_orphan_statistics.py [--database-url URL] [--resources N] [--accounts A]
+
+Options:
+    --database-url  Scratch database (default: temporary SQLite file)
+    --resources     Findings in the latest scans (default: 100000)
+    --accounts      Cloud accounts the findings are spread over (default: 5)
+    --runs          Timed runs per implementation (default: 5)
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import and_, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.crud.orphan_resource import get_orphan_resource_statistics
+from app.models.cloud_account import CloudAccount
+from app.models.orphan_resource import OrphanResource
+from app.models.scan import Scan
+from app.models.user import User
+
+RESOURCE_TYPES = ["ebs_volume", "elastic_ip", "ec2_instance", "load_balancer", "rds_instance"]
+REGIONS = ["us-east-1", "us-west-2", "eu-west-1", "eu-central-1", "ap-southeast-1"]
+STATUSES = ["active", "ignored", "marked_for_deletion"]
+
+
+async def seed(session_factory, resources: int, accounts: int) -> uuid.UUID:
+    """Create a user, its accounts, two completed scans per account and the findings."""
+    user_id = uuid.uuid4()
+    now = datetime.utcnow()
+    async with session_factory() as db:
+        db.add(User(id=user_id, email="benchmark@example.com", hashed_password="x"))
+        latest_scans = []
+        for a in range(accounts):
+            account_id = uuid.uuid4()
+            db.add(
+                CloudAccount(
+                    id=account_id,
+                    user_id=user_id,
+                    provider="aws",
+                    account_name=f"account-{a}",
+                    account_identifier=f"{a:012d}",
+                    credentials_encrypted=b"x",
+                )
+            )
+            for days_ago in (1, 0):
+                scan = Scan(
+                    id=uuid.uuid4(),
+                    cloud_account_id=account_id,
+                    status="completed",
+                    scan_type="manual",
+                    created_at=now - timedelta(days=days_ago),
+                )
+                db.add(scan)
+            latest_scans.append((scan.id, account_id))
+        await db.commit()
+
+        rows = [
+            {
+                "scan_id": latest_scans[i % accounts][0],
+                "cloud_account_id": latest_scans[i % accounts][1],
+                "resource_type": RESOURCE_TYPES[i % len(RESOURCE_TYPES)],
+                "resource_id": f"res-{i:08d}",
+                "resource_name": f"resource-{i}",
+                "region": REGIONS[(i // 7) % len(REGIONS)],
+                "status": STATUSES[i % len(STATUSES)],
+                "estimated_monthly_cost": (i % 100) * 0.37,
+                "resource_metadata": {"size_gb": i % 500, "tags": {"team": "platform"}, "i": i},
+            }
+            for i in range(resources)
+        ]
+        for start in range(0, len(rows), 5000):
+            await db.execute(insert(OrphanResource), rows[start : start + 5000])
+        await db.commit()
+    return user_id
+
+
+async def statistics_with_orm(db: AsyncSession, user_id: uuid.UUID) -> dict:
+    """Former implementation: ORM rows of the latest scans, aggregated in Python."""
+    latest = (
+        select(Scan.cloud_account_id, func.max(Scan.created_at).label("max_created_at"))
+        .where(Scan.status == "completed", Scan.scan_type != "inventory")
+        .join(CloudAccount, Scan.cloud_account_id == CloudAccount.id)
+        .where(CloudAccount.user_id == user_id)
+        .group_by(Scan.cloud_account_id)
+        .subquery()
+    )
+    latest_scan_ids = (
+        select(Scan.id)
+        .join(
+            latest,
+            and_(
+                Scan.cloud_account_id == latest.c.cloud_account_id,
+                Scan.created_at == latest.c.max_created_at,
+            ),
+        )
+        .subquery()
+    )
+    result = await db.execute(
+        select(OrphanResource).where(OrphanResource.scan_id.in_(select(latest_scan_ids)))
+    )
+    resources = result.scalars().all()
+
+    by_type: dict[str, int] = {}
+    by_region: dict[str, int] = {}
+    by_status: dict[str, int] = {}
+    for resource in resources:
+        by_type[resource.resource_type] = by_type.get(resource.resource_type, 0) + 1
+        by_region[resource.region] = by_region.get(resource.region, 0) + 1
+        by_status[resource.status] = by_status.get(resource.status, 0) + 1
+    total_monthly_cost = sum(resource.estimated_monthly_cost for resource in resources)
+
+    return {
+        "total_resources": len(resources),
+        "by_type": by_type,
+        "by_region": by_region,
+        "by_status": by_status,
+        "total_monthly_cost": round(total_monthly_cost, 2),
+        "total_annual_cost": round(total_monthly_cost * 12, 2),
+    }
+
+
+async def statistics_with_sql(db: AsyncSession, user_id: uuid.UUID) -> dict:
+    """Current implementation."""
+    return await get_orphan_resource_statistics(db, user_id=user_id)
+
+
+async def run(database_url: str, resources: int, accounts: int, runs: int) -> None:
+    """Run both implementations on a fresh schema and print timings."""
+    engine = create_async_engine(database_url, echo=False)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    print("=" * 60)
+    print(f"Database:  {engine.url.render_as_string(hide_password=True)}")
+    print(f"Findings:  {resources} in the latest scans of {accounts} accounts")
+    print("=" * 60)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        user_id = await seed(session_factory, resources, accounts)
+
+        timings = {}
+        results = {}
+        for name, statistics in (("orm", statistics_with_orm), ("sql", statistics_with_sql)):
+            durations = []
+            for _ in range(runs):
+                async with session_factory() as db:
+                    started = time.perf_counter()
+                    results[name] = await statistics(db, user_id)
+                    durations.append(time.perf_counter() - started)
+            timings[name] = min(durations)
+            print(
+                f"{name:>4}: {timings[name] * 1000:9.1f} ms  "
+                f"(best of {runs}, {results[name]['total_resources']} findings)"
+            )
+
+        # Cost sums may differ in the last float digits before rounding
+        same = {k: v for k, v in results["orm"].items() if "cost" not in k} == {
+            k: v for k, v in results["sql"].items() if "cost" not in k
+        } and abs(
+            results["orm"]["total_monthly_cost"] - results["sql"]["total_monthly_cost"]
+        ) < 0.05
+        print(f"Same results: {same}")
+        print(f"Speedup: {timings['orm'] / timings['sql']:.1f}x")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--resources", type=int, default=100000)
+    parser.add_argument("--accounts", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    database_url = args.database_url or (
+        f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/benchmark_orphan_statistics.db"
+    )
+    asyncio.run(run(database_url, args.resources, args.accounts, args.runs))
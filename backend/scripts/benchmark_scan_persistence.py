@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: saving scan results with ORM objects vs. the bulk ScanResultWriter.
+
+Inserts the same synthetic inventory (all_cloud_resources) and orphan
+(orphan_resources) results with:
+- orm:  one db.add(Model(...)) per result and a single commit (former path)
+- bulk: ScanResultWriter, executemany INSERTs committed per chunk, one
+        write per region
+
+WARNING: creates and drops all tables of the target database. Point it at a
+scratch database only.
+
+Usage:
+    python scripts/benchmark_scan_persistence.py [--database-url URL] [--resources N] [--regions R]
+
+Options:
+    --database-url  Scratch database (default: temporary SQLite file)
+    --resources     Inventory resources per run (default: 50000)
+    --regions       Regions the results are spread over (default: 10)
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.all_cloud_resource import AllCloudResource
+from app.models.orphan_resource import OrphanResource
+from app.providers.base import AllCloudResourceData, OrphanResourceData
+from app.workers.result_writer import ScanResultWriter
+
+
+def build_results(
+    count: int, regions: int
+) -> dict[str, tuple[list[AllCloudResourceData], list[OrphanResourceData]]]:
+    """Synthetic inventory and orphan results per region (1 orphan per 10 resources)."""
+    results: dict[str, tuple[list, list]] = {}
+    for i in range(count):
+        region = f"region-{i % regions}"
+        inventory, orphans = results.setdefault(region, ([], []))
+        inventory.append(
+            AllCloudResourceData(
+                resource_type="ec2_instance",
+                resource_id=f"i-{i:08d}",
+                resource_name=f"instance-{i}",
+                region=region,
+                estimated_monthly_cost=42.0,
+                resource_metadata={"instance_type": "t3.medium", "state": "running"},
+                tags={"env": "prod", "team": "platform"},
+                optimization_recommendations=[{"action": "rightsize", "savings": 12.5}],
+            )
+        )
+        if i % 10 == 0:
+            orphans.append(
+                OrphanResourceData(
+                    resource_type="ebs_volume",
+                    resource_id=f"vol-{i:08d}",
+                    resource_name=f"volume-{i}",
+                    region=region,
+                    estimated_monthly_cost=8.0,
+                    resource_metadata={"size_gb": 100, "volume_type": "gp2"},
+                )
+            )
+    return results
+
+
+async def save_with_orm(session_factory, scan_id, account_id, results) -> None:
+    """Former path: one ORM object per result, single commit."""
+    writer = ScanResultWriter(session_factory, scan_id, account_id)
+    async with session_factory() as db:
+        for inventory, orphans in results.values():
+            for orphan in orphans:
+                db.add(OrphanResource(**writer.orphan_row(orphan)))
+            for resource in inventory:
+                db.add(AllCloudResource(**writer.inventory_row(resource)))
+        await db.commit()
+
+
+async def save_with_writer(session_factory, scan_id, account_id, results) -> None:
+    """Bulk path: one chunked write per region, regions written concurrently."""
+    writer = ScanResultWriter(session_factory, scan_id, account_id)
+
+    async def save_region(inventory, orphans) -> None:
+        await writer.write_orphans(orphans)
+        await writer.write_inventory(inventory)
+
+    await asyncio.gather(*(save_region(*region) for region in results.values()))
+
+
+async def run(database_url: str, resources: int, regions: int) -> None:
+    """Run both paths on a fresh schema and print timings."""
+    engine = create_async_engine(database_url, echo=False)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    results = build_results(resources, regions)
+    orphan_count = sum(len(orphans) for _, orphans in results.values())
+
+    print("=" * 60)
+    print(f"Database:  {engine.url.render_as_string(hide_password=True)}")
+    print(f"Results:   {resources} inventory + {orphan_count} orphans over {regions} regions")
+    print("=" * 60)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        timings = {}
+        for name, save in (("orm", save_with_orm), ("bulk", save_with_writer)):
+            scan_id, account_id = uuid.uuid4(), uuid.uuid4()
+            started = time.perf_counter()
+            await save(session_factory, scan_id, account_id, results)
+            timings[name] = time.perf_counter() - started
+
+            async with session_factory() as db:
+                saved = await db.scalar(
+                    select(func.count())
+                    .select_from(AllCloudResource)
+                    .where(AllCloudResource.scan_id == scan_id)
+                )
+            rate = (resources + orphan_count) / timings[name]
+            print(f"{name:>5}: {timings[name]:8.2f}s  ({rate:,.0f} rows/s, {saved} inventory rows)")
+
+        print(f"Speedup: {timings['orm'] / timings['bulk']:.1f}x")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--resources", type=int, default=50000)
+    parser.add_argument("--regions", type=int, default=10)
+    args = parser.parse_args()
+
+    database_url = args.database_url or (
+        f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/benchmark_scan_persistence.db"
+    )
+    asyncio.run(run(database_url, args.resources, args.regions))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Database migration script: Rebuild the impact rollups of every cloud account.
+
+The /impact endpoints read the pre-aggregated impact_rollups table. Run this
+once after the 003_add_impact_rollups migration to backfill existing
+accounts, or at any time to recompute the rollups from orphan_resources
+(e.g., to tighten the max/min aggregates after many deletions). Scans
+compacted by the retention job have no orphan resources left: a rebuild
+drops their history from the rollups.
+
+Usage:
+    python scripts/rebuild_impact_rollups.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import app modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.crud.impact_rollup import rebuild_account_rollups
+from app.models.cloud_account import CloudAccount
+
+
+async def rebuild_impact_rollups() -> int:
+    """Recompute the impact rollups of all cloud accounts."""
+
+    engine = create_async_engine(settings.DATABASE_URL, echo=False)
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with async_session() as session:
+        try:
+            print("=" * 60)
+            print("🔄 Impact Rollups Rebuild Script")
+            print("=" * 60)
+
+            result = await session.execute(select(CloudAccount.id, CloudAccount.account_name))
+            accounts = result.all()
+            print(f"📊 Cloud accounts to rebuild: {len(accounts)}")
+
+            for account_id, account_name in accounts:
+                await rebuild_account_rollups(session, account_id)
+                print(f"  - {account_name} (ID: {account_id})")
+
+            print("=" * 60)
+            print(f"✅ Rebuilt impact rollups of {len(accounts)} accounts!")
+            print("=" * 60)
+            return 0
+
+        except Exception as e:
+            print()
+            print("=" * 60)
+            print(f"❌ ERROR during rebuild: {e}")
+            print("=" * 60)
+            await session.rollback()
+            return 1
+
+        finally:
+            await session.close()
+            await engine.dispose()
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(rebuild_impact_rollups())
+    sys.exit(exit_code)
@@ -0,0 +1 @@
+"""Cloud provider tests."""
@@ -0,0 +1,75 @@
+"""Tests for the pooled aioboto3 clients."""
+
+import asyncio
+
+import pytest
+
+from app.providers.aws_client_pool import AWSClientPool
+
+
+class FakeClient:
+    """Client stand-in tracking whether it was closed."""
+
+    def __init__(self, service: str, kwargs: dict) -> None:
+        self.service = service
+        self.kwargs = kwargs
+        self.closed = False
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+        return False
+
+
+class FakeSession:
+    """aioboto3 session stand-in recording created clients."""
+
+    def __init__(self) -> None:
+        self.created: list[FakeClient] = []
+
+    def client(self, service: str, **kwargs) -> FakeClient:
+        client = FakeClient(service, kwargs)
+        self.created.append(client)
+        return client
+
+
+class TestAWSClientPool:
+    """Test client reuse, configuration and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_one_client_per_service_and_region(self):
+        """Test that concurrent callers share one client per (service, region)."""
+        session = FakeSession()
+        pool = AWSClientPool(session, max_pool_connections=32)
+
+        async def use(service: str, region: str):
+            async with pool.client(service, region_name=region) as client:
+                return client
+
+        clients = await asyncio.gather(
+            *(use("ec2", "eu-west-1") for _ in range(5)),
+            use("ec2", "us-east-1"),
+            use("cloudwatch", "eu-west-1"),
+        )
+
+        assert len(session.created) == 3
+        assert len({id(c) for c in clients[:5]}) == 1
+        assert not clients[0].closed  # Leaving the block keeps the client open
+        assert clients[0].kwargs["config"].max_pool_connections == 32
+        assert clients[0].kwargs["config"].retries["mode"] == "adaptive"
+
+    @pytest.mark.asyncio
+    async def test_close_releases_all_clients(self):
+        """Test that close() exits every pooled client."""
+        session = FakeSession()
+        pool = AWSClientPool(session)
+        await pool.get_client("ec2", "eu-west-1")
+        await pool.get_client("sts", "us-east-1", endpoint_url="https://sts.us-east-1.amazonaws.com")
+
+        await pool.close()
+
+        assert all(client.closed for client in session.created)
+        assert session.created[1].kwargs["endpoint_url"] == "https://sts.us-east-1.amazonaws.com"
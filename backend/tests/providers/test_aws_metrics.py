@@ -0,0 +1,154 @@
+"""Tests for the batched CloudWatch GetMetricData collector."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.providers.aws_metrics import CloudWatchMetricCollector, MetricQuery
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+
+
+class FakeCloudWatchClient:
+    """CloudWatch client stand-in returning one daily datapoint per query."""
+
+    def __init__(self, requests: list) -> None:
+        self.requests = requests
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get_metric_data(self, **params):
+        self.requests.append(params)
+        days = (params["EndTime"] - params["StartTime"]).days
+        timestamps = [params["EndTime"] - timedelta(days=d) for d in range(days)]
+        return {
+            "MetricDataResults": [
+                {
+                    "Id": query["Id"],
+                    "Timestamps": timestamps,
+                    "Values": [1.0] * len(timestamps),
+                }
+                for query in params["MetricDataQueries"]
+            ]
+        }
+
+
+class FakeSession:
+    """aioboto3 session stand-in."""
+
+    def __init__(self) -> None:
+        self.requests: list = []
+
+    def client(self, service: str, region_name: str, config=None) -> FakeCloudWatchClient:
+        return FakeCloudWatchClient(self.requests)
+
+
+def _volume_query(collector: CloudWatchMetricCollector, volume_id: str, days: int = 30) -> MetricQuery:
+    start_time, end_time = collector.window(days)
+    return MetricQuery.create("AWS/EBS", "VolumeReadOps", {"VolumeId": volume_id}, "Sum", start_time, end_time)
+
+
+class TestCloudWatchMetricCollector:
+    """Test batching, window trimming and request coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_batches_500_queries_per_request(self):
+        """Test that 1,200 queries are sent in 3 GetMetricData requests."""
+        session = FakeSession()
+        collector = CloudWatchMetricCollector(session, "eu-west-1", end_time=NOW)
+        queries = [_volume_query(collector, f"vol-{i}") for i in range(1200)]
+
+        results = await collector.fetch(queries)
+
+        assert len(session.requests) == 3
+        assert max(len(r["MetricDataQueries"]) for r in session.requests) == 500
+        assert len(results[queries[42]]) == 30
+        assert results[queries[42]][0]["Sum"] == 1.0
+
+        # Already fetched queries are served without new requests
+        await collector.fetch(queries[:10])
+        assert len(session.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_mixed_windows_trimmed_per_query(self):
+        """Test that a shared request keeps only each query's own window."""
+        session = FakeSession()
+        collector = CloudWatchMetricCollector(session, "eu-west-1", end_time=NOW)
+        short_query = _volume_query(collector, "vol-1", days=7)
+        long_query = _volume_query(collector, "vol-2", days=90)
+
+        results = await collector.fetch([short_query, long_query])
+
+        assert len(session.requests) == 1
+        assert len(results[short_query]) == 8  # Both window bounds inclusive
+        assert len(results[long_query]) == 90
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_coalesced(self):
+        """Test that concurrent single lookups share one request."""
+        session = FakeSession()
+        collector = CloudWatchMetricCollector(session, "eu-west-1", end_time=NOW)
+        queries = [_volume_query(collector, f"vol-{i}") for i in range(20)]
+
+        results = await asyncio.gather(*(collector.get(q) for q in queries))
+
+        assert len(session.requests) == 1
+        assert all(len(series) == 30 for series in results)
+
+    def test_dimension_formats_equivalent(self):
+        """Test that dict and boto3-style dimensions build the same query."""
+        as_dict = MetricQuery.create("AWS/EC2", "NetworkIn", {"InstanceId": "i-1"}, "Sum", NOW, NOW)
+        as_list = MetricQuery.create(
+            "AWS/EC2", "NetworkIn", [{"Name": "InstanceId", "Value": "i-1"}], "Sum", NOW, NOW
+        )
+        assert as_dict == as_list
+
+
+class TestMetricCache:
+    """Test the scan-scoped series cache."""
+
+    @pytest.mark.asyncio
+    async def test_narrower_window_sliced_from_cache(self):
+        """Test that a shorter lookback is served from a wider cached series."""
+        session = FakeSession()
+        collector = CloudWatchMetricCollector(session, "eu-west-1", end_time=NOW)
+
+        wide = await collector.fetch([_volume_query(collector, "vol-1", days=90)])
+        narrow = await collector.fetch([_volume_query(collector, "vol-1", days=14)])
+
+        assert len(session.requests) == 1
+        assert len(list(wide.values())[0]) == 90
+        assert len(list(narrow.values())[0]) == 15
+        assert collector.stats() == {"cache_hits": 1, "cache_misses": 1, "hit_rate": 0.5, "api_calls": 1}
+
+    @pytest.mark.asyncio
+    async def test_wider_window_refetched_as_union(self):
+        """Test that a wider lookback refetches once, then serves both windows."""
+        session = FakeSession()
+        collector = CloudWatchMetricCollector(session, "eu-west-1", end_time=NOW)
+
+        await collector.fetch([_volume_query(collector, "vol-1", days=7)])
+        await collector.fetch([_volume_query(collector, "vol-1", days=30)])
+        await collector.fetch([_volume_query(collector, "vol-1", days=7)])
+
+        assert len(session.requests) == 2
+        assert collector.cache_misses == 2
+        assert collector.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scenarios_share_inflight_fetch(self):
+        """Test that overlapping scenarios never request the same series twice."""
+        session = FakeSession()
+        collector = CloudWatchMetricCollector(session, "eu-west-1", end_time=NOW)
+        wide = [_volume_query(collector, f"vol-{i}", days=30) for i in range(10)]
+        narrow = [_volume_query(collector, f"vol-{i}", days=7) for i in range(10)]
+
+        await asyncio.gather(collector.fetch(wide), collector.fetch(narrow))
+
+        assert len(session.requests) == 1
+        assert collector.cache_hits == 10
@@ -0,0 +1,164 @@
+"""Tests for the shared per-region EC2 describe snapshot."""
+
+import asyncio
+
+import pytest
+
+from app.providers.aws_snapshot import EC2RegionSnapshot
+
+
+class FakePaginator:
+    """Async paginator yielding pre-built pages."""
+
+    def __init__(self, client: "FakeEC2Client", operation: str) -> None:
+        self.client = client
+        self.operation = operation
+
+    async def paginate(self, **params):
+        self.client.calls.append((self.operation, params))
+        await asyncio.sleep(0.01)
+        for page in self.client.pages[self.operation]:
+            yield page
+
+
+class FakeEC2Client:
+    """EC2 client stand-in recording describe calls."""
+
+    def __init__(self, pages: dict, calls: list) -> None:
+        self.pages = pages
+        self.calls = calls
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def can_paginate(self, operation: str) -> bool:
+        return True
+
+    def get_paginator(self, operation: str) -> FakePaginator:
+        return FakePaginator(self, operation)
+
+
+class FakeSession:
+    """aioboto3 session stand-in."""
+
+    def __init__(self, pages: dict) -> None:
+        self.pages = pages
+        self.calls: list = []
+
+    def client(self, service: str, region_name: str, config=None) -> FakeEC2Client:
+        return FakeEC2Client(self.pages, self.calls)
+
+
+def _instance(instance_id: str, state: str, image_id: str = "ami-1", tags=None, lifecycle=None) -> dict:
+    instance = {
+        "InstanceId": instance_id,
+        "State": {"Name": state},
+        "ImageId": image_id,
+        "Tags": tags or [],
+    }
+    if lifecycle:
+        instance["InstanceLifecycle"] = lifecycle
+    return instance
+
+
+PAGES = {
+    "describe_volumes": [
+        {"Volumes": [
+            {"VolumeId": "vol-1", "VolumeType": "gp2", "Attachments": [{"InstanceId": "i-1"}]},
+            {"VolumeId": "vol-2", "VolumeType": "gp3", "Attachments": []},
+        ]},
+        {"Volumes": [{"VolumeId": "vol-3", "VolumeType": "io2", "Attachments": []}]},
+    ],
+    "describe_instances": [
+        {"Reservations": [
+            {"ReservationId": "r-1", "Instances": [
+                _instance("i-1", "running", tags=[{"Key": "eks:cluster-name", "Value": "prod"}]),
+                _instance("i-2", "stopped"),
+            ]},
+            {"ReservationId": "r-2", "Instances": [
+                _instance("i-3", "running", image_id="ami-2", lifecycle="spot"),
+            ]},
+        ]},
+    ],
+    "describe_snapshots": [
+        {"Snapshots": [{"SnapshotId": "snap-1", "VolumeId": "vol-1"}]},
+    ],
+    "describe_addresses": [
+        {"Addresses": [{"AllocationId": "eipalloc-1", "InstanceId": "i-1"}]},
+    ],
+}
+
+
+class TestEC2RegionSnapshot:
+    """Test single-load pagination, indexes and local filtering."""
+
+    @pytest.mark.asyncio
+    async def test_each_describe_call_loaded_once(self):
+        """Test that concurrent scenarios share a single paginated load."""
+        session = FakeSession(PAGES)
+        snapshot = EC2RegionSnapshot(session, "eu-west-1")
+
+        results = await asyncio.gather(
+            *(snapshot.describe_volumes() for _ in range(10)),
+            snapshot.describe_volumes(volume_types=["gp3"]),
+        )
+
+        assert [op for op, _ in session.calls] == ["describe_volumes"]
+        assert len(results[0]["Volumes"]) == 3
+        assert [v["VolumeId"] for v in results[-1]["Volumes"]] == ["vol-2"]
+        assert snapshot.api_calls == 2  # Two pages
+        assert snapshot.volumes_by_instance["i-1"][0]["VolumeId"] == "vol-1"
+
+    @pytest.mark.asyncio
+    async def test_instance_filters(self):
+        """Test state, AMI, tag and lifecycle filters applied in memory."""
+        snapshot = EC2RegionSnapshot(FakeSession(PAGES), "eu-west-1")
+
+        def ids(response: dict) -> list[str]:
+            return [i["InstanceId"] for r in response["Reservations"] for i in r["Instances"]]
+
+        assert ids(await snapshot.describe_instances()) == ["i-1", "i-2", "i-3"]
+        assert ids(await snapshot.describe_instances(states=["running"])) == ["i-1", "i-3"]
+        assert ids(await snapshot.describe_instances(image_ids=["ami-2"])) == ["i-3"]
+        assert ids(await snapshot.describe_instances(states=["running"], on_demand_only=True)) == ["i-1"]
+        assert ids(await snapshot.describe_instances(tags={"eks:cluster-name": ["prod"]})) == ["i-1"]
+        assert (await snapshot.describe_instances(states=["stopped"]))["Reservations"][0]["ReservationId"] == "r-1"
+
+    @pytest.mark.asyncio
+    async def test_snapshots_and_addresses_indexed(self):
+        """Test snapshot and Elastic IP indexes."""
+        session = FakeSession(PAGES)
+        snapshot = EC2RegionSnapshot(session, "eu-west-1")
+
+        await snapshot.describe_snapshots()
+        await snapshot.describe_addresses()
+
+        assert session.calls[0] == ("describe_snapshots", {"OwnerIds": ["self"]})
+        assert snapshot.snapshots_by_volume["vol-1"][0]["SnapshotId"] == "snap-1"
+        assert snapshot.addresses_by_instance["i-1"][0]["AllocationId"] == "eipalloc-1"
+
+    @pytest.mark.asyncio
+    async def test_change_markers(self):
+        """Test that change markers follow state and configuration, from the cached describes."""
+        session = FakeSession(PAGES)
+        snapshot = EC2RegionSnapshot(session, "eu-west-1")
+
+        instances = await snapshot.change_markers("ec2_instance")
+        volumes = await snapshot.change_markers("ebs_volume")
+        addresses = await snapshot.change_markers("elastic_ip")
+        before = dict(instances)
+        await snapshot.describe_instances()
+
+        assert sorted(instances) == ["i-1", "i-2", "i-3"]
+        assert sorted(volumes) == ["vol-1", "vol-2", "vol-3"]
+        assert list(addresses) == ["eipalloc-1"]
+        assert await snapshot.change_markers("nat_gateway") is None
+        assert [op for op, _ in session.calls].count("describe_instances") == 1
+
+        snapshot.instances_by_id["i-2"]["State"] = {"Name": "running"}
+        after = await snapshot.change_markers("ec2_instance")
+        assert after["i-2"] != before["i-2"]
+        assert after["i-1"] == before["i-1"]
@@ -0,0 +1,101 @@
+"""Tests for the shared Azure credential, clients and worker threads."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.providers.azure_client_pool import AzureClientPool
+from app.providers.incremental import evaluate_scenario, record_scenario_error
+
+
+class FakeCredential:
+    """ClientSecretCredential stand-in counting instances."""
+
+    instances = 0
+
+    def __init__(self, **kwargs) -> None:
+        FakeCredential.instances += 1
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeManagementClient:
+    """Management client stand-in tracking whether it was closed."""
+
+    def __init__(self, credential, subscription_id: str) -> None:
+        self.credential = credential
+        self.subscription_id = subscription_id
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr("azure.identity.ClientSecretCredential", FakeCredential)
+    FakeCredential.instances = 0
+    return AzureClientPool("tenant", "client", "secret", max_workers=4)
+
+
+class TestAzureClientPool:
+    """Test credential and client reuse, threaded execution and shutdown."""
+
+    def test_one_credential_and_client_per_class(self, pool):
+        """Test that clients share a single credential and are created once."""
+        first = pool.get_client(FakeManagementClient, "sub-1")
+        second = pool.get_client(FakeManagementClient, "sub-1")
+        other = pool.get_client(FakeManagementClient, "sub-2")
+
+        assert first is second
+        assert other is not first
+        assert FakeCredential.instances == 1
+        assert first.credential is pool.credential
+        assert pool.credential.kwargs["tenant_id"] == "tenant"
+
+    @pytest.mark.asyncio
+    async def test_blocking_scenarios_overlap_on_worker_threads(self, pool):
+        """Test that blocking coroutines run concurrently off the event loop thread."""
+        loop_thread = threading.get_ident()
+
+        async def blocking_scenario(seconds: float) -> int:
+            time.sleep(seconds)  # Synchronous SDK call
+            return threading.get_ident()
+
+        started = time.perf_counter()
+        threads = await asyncio.gather(*(pool.run(blocking_scenario, 0.2) for _ in range(4)))
+        elapsed = time.perf_counter() - started
+
+        assert loop_thread not in threads
+        assert elapsed < 0.6  # Sequential execution would take 0.8s
+        pool.close()
+
+    @pytest.mark.asyncio
+    async def test_worker_threads_see_the_callers_context(self, pool):
+        """Test that errors swallowed on a worker thread reach the incremental evaluation."""
+
+        async def blocking_scenario() -> list:
+            record_scenario_error(TimeoutError("Azure Monitor timed out"))
+            return []
+
+        results, errors = await evaluate_scenario(pool.run(blocking_scenario))
+
+        assert results == []
+        assert errors == ["TimeoutError: Azure Monitor timed out"]
+        pool.close()
+
+    def test_close_releases_clients_and_credential(self, pool):
+        """Test that close() closes every pooled client and the credential."""
+        client = pool.get_client(FakeManagementClient, "sub-1")
+        credential = pool.credential
+
+        pool.close()
+
+        assert client.closed
+        assert credential.closed
+        assert pool.get_client(FakeManagementClient, "sub-1") is not client
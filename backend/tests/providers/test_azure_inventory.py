@@ -0,0 +1,136 @@
+"""Tests for the per-scan Azure subscription inventory."""
+
+import sys
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from azure.mgmt.compute import ComputeManagementClient
+
+from app.providers.azure_inventory import AzureSubscriptionInventory
+
+DISK_MODEL = ComputeManagementClient(object(), "sub").disks.models.Disk
+
+
+def _disk(name: str, location: str, resource_group: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=f"/subscriptions/sub/resourceGroups/{resource_group}/providers/Microsoft.Compute/disks/{name}",
+        name=name,
+        location=location,
+    )
+
+
+class FakeDisksOperations:
+    """disks operation group stand-in counting list calls."""
+
+    models = SimpleNamespace(Disk=DISK_MODEL)
+
+    def __init__(self, disks: list) -> None:
+        self.disks = disks
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def list(self):
+        with self._lock:
+            self.calls += 1
+        return iter(self.disks)
+
+
+class FakePool:
+    """AzureClientPool stand-in returning one fake compute client."""
+
+    def __init__(self, disks: list) -> None:
+        self.compute = SimpleNamespace(disks=FakeDisksOperations(disks))
+        self.graph_client = None
+
+    def get_client(self, client_cls, *args):
+        if client_cls.__name__ == "ResourceGraphClient":
+            return self.graph_client
+        return self.compute
+
+
+@pytest.fixture
+def pool():
+    return FakePool(
+        [
+            _disk("d1", "eastus", "rg-prod"),
+            _disk("d2", "eastus", "RG-Dev"),
+            _disk("d3", "westeurope", "rg-prod"),
+        ]
+    )
+
+
+class TestAzureSubscriptionInventory:
+    """Test single listing, partitioning and the Resource Graph backend."""
+
+    def test_listed_once_and_partitioned(self, pool):
+        """Test that every region and resource group is served from one list call."""
+        inventory = AzureSubscriptionInventory(pool, "sub")
+
+        assert [d.name for d in inventory.list_resources("disks", "eastus")] == ["d1", "d2"]
+        assert [d.name for d in inventory.list_resources("disks", "West Europe")] == ["d3"]
+        assert [d.name for d in inventory.list_resources("disks", resource_group="rg-dev")] == ["d2"]
+        assert [d.name for d in inventory.list_resources("disks", "westeurope", "rg-prod")] == ["d3"]
+        assert len(inventory.list_resources("disks")) == 3
+        assert inventory.list_resources("disks", "northeurope") == []
+        assert pool.compute.disks.calls == 1
+
+    def test_concurrent_threads_share_one_listing(self, pool):
+        """Test that scenarios on worker threads never list the same collection twice."""
+        inventory = AzureSubscriptionInventory(pool, "sub")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: inventory.list_resources("disks", "eastus"), range(16)))
+
+        assert all(len(r) == 2 for r in results)
+        assert pool.compute.disks.calls == 1
+
+    def test_resource_graph_rows_deserialized_to_sdk_models(self, pool, monkeypatch):
+        """Test that Resource Graph pages become SDK models like the ARM listing."""
+        pages = [
+            SimpleNamespace(
+                data=[{"id": "/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Compute/disks/g1",
+                       "name": "g1", "location": "eastus", "properties": {"diskState": "Unattached"}}],
+                skip_token="next",
+            ),
+            SimpleNamespace(
+                data=[{"id": "/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Compute/disks/g2",
+                       "name": "g2", "location": "westus", "properties": {"diskState": "Attached"}}],
+                skip_token=None,
+            ),
+        ]
+        requests = []
+
+        def resources(request):
+            requests.append(request)
+            return pages[len(requests) - 1]
+
+        pool.graph_client = SimpleNamespace(resources=resources)
+
+        module = types.ModuleType("azure.mgmt.resourcegraph")
+        module.ResourceGraphClient = type("ResourceGraphClient", (), {})
+        models = types.ModuleType("azure.mgmt.resourcegraph.models")
+        models.QueryRequest = lambda **kwargs: kwargs
+        models.QueryRequestOptions = lambda **kwargs: kwargs
+        monkeypatch.setitem(sys.modules, "azure.mgmt.resourcegraph", module)
+        monkeypatch.setitem(sys.modules, "azure.mgmt.resourcegraph.models", models)
+
+        inventory = AzureSubscriptionInventory(pool, "sub", use_resource_graph=True)
+        disks = inventory.list_resources("disks", "eastus")
+
+        assert [d.disk_state for d in disks] == ["Unattached"]
+        assert isinstance(disks[0], DISK_MODEL)
+        assert len(requests) == 2
+        assert "microsoft.compute/disks" in requests[0]["query"]
+        assert pool.compute.disks.calls == 0
+
+    def test_falls_back_to_arm_without_resource_graph_package(self, pool, monkeypatch):
+        """Test that a missing azure-mgmt-resourcegraph package falls back to ARM listing."""
+        monkeypatch.setitem(sys.modules, "azure.mgmt.resourcegraph", None)
+        inventory = AzureSubscriptionInventory(pool, "sub", use_resource_graph=True)
+
+        assert len(inventory.list_resources("disks")) == 3
+        assert pool.compute.disks.calls == 1
+        assert inventory.use_resource_graph is False
@@ -0,0 +1,94 @@
+"""Tests for the Cloud SQL scenarios built on project-wide metric summaries."""
+
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from app.providers.gcp import GCPProvider
+from app.providers.gcp_metrics import MetricSummary
+
+CPU_METRIC = "cloudsql.googleapis.com/database/cpu/utilization"
+MEMORY_METRIC = "cloudsql.googleapis.com/database/memory/utilization"
+
+
+def _sql_v1() -> ModuleType:
+    """google.cloud.sql_v1 stand-in with the enums and request type the scenarios use."""
+    module = ModuleType("google.cloud.sql_v1")
+    module.Instance = SimpleNamespace(State=SimpleNamespace(RUNNABLE="RUNNABLE", STOPPED="STOPPED"))
+    module.Settings = SimpleNamespace(AvailabilityType=SimpleNamespace(ZONAL="ZONAL", REGIONAL="REGIONAL"))
+    module.ListInstancesRequest = lambda project: {"project": project}
+    module.CloudSqlInstancesServiceClient = FakeSqlClient
+    return module
+
+
+def _instance(name: str, tier: str, state: str = "RUNNABLE") -> SimpleNamespace:
+    return SimpleNamespace(
+        name=name,
+        state=state,
+        region="us-central1",
+        database_version="POSTGRES_15",
+        settings=SimpleNamespace(tier=tier, availability_type="ZONAL"),
+    )
+
+
+class FakeSqlClient:
+    """CloudSqlInstancesServiceClient stand-in listing a fixed set of instances."""
+
+    instances = [
+        _instance("db-idle", "db-n1-standard-4"),
+        _instance("db-busy", "db-n1-standard-4"),
+        _instance("db-stopped", "db-n1-standard-4", state="STOPPED"),
+    ]
+
+    def list(self, request):
+        return iter(self.instances)
+
+
+class FakePool:
+    """GCPClientPool stand-in."""
+
+    def get_client(self, client_cls, **kwargs):
+        assert client_cls is FakeSqlClient
+        return FakeSqlClient()
+
+
+class FakeMetrics:
+    """CloudMonitoringMetricCollector stand-in serving fixed summaries."""
+
+    def __init__(self, summaries: dict[tuple[str, str], MetricSummary]) -> None:
+        self.summaries = summaries
+        self.statistics: set[str] = set()
+
+    def get(self, metric_type, group_by, resource, lookback_days, statistics=(), resource_filter=""):
+        self.statistics.update(statistics)
+        return self.summaries.get((metric_type, resource))
+
+
+class TestCloudSqlOverprovisioned:
+    """Test the over-provisioned Cloud SQL scenario end to end."""
+
+    @pytest.mark.asyncio
+    async def test_reports_avg_and_max_utilization(self, monkeypatch):
+        """Test that idle instances are flagged with their mean and peak CPU/memory."""
+        monkeypatch.setitem(sys.modules, "google.cloud.sql_v1", _sql_v1())
+        provider = GCPProvider("proj", "{}")
+        provider.client_pool = FakePool()
+        provider.metrics = FakeMetrics(
+            {
+                (CPU_METRIC, "proj:db-idle"): MetricSummary(mean=0.12, max=0.35),
+                (MEMORY_METRIC, "proj:db-idle"): MetricSummary(mean=0.25, max=0.5),
+                (CPU_METRIC, "proj:db-busy"): MetricSummary(mean=0.7, max=0.95),
+                (MEMORY_METRIC, "proj:db-busy"): MetricSummary(mean=0.6, max=0.8),
+            }
+        )
+
+        resources = await provider.scan_cloud_sql_overprovisioned("us-central1", {})
+
+        assert [r.resource_id for r in resources] == ["db-idle"]
+        metadata = resources[0].resource_metadata
+        assert metadata["cpu_metrics"] == {"avg_cpu_14d": 12.0, "max_cpu_14d": 35.0}
+        assert metadata["memory_metrics"] == {"avg_memory_14d": 25.0, "max_memory_14d": 50.0}
+        assert metadata["recommended_tier"] == "db-n1-standard-2"
+        assert resources[0].estimated_monthly_cost == pytest.approx(92.4)
+        assert provider.metrics.statistics == {"mean", "max"}
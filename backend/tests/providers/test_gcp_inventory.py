@@ -0,0 +1,84 @@
+"""Tests for the per-scan GCP Compute Engine inventory."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from google.cloud import compute_v1
+
+from app.providers.gcp_inventory import GCPComputeInventory
+
+
+class FakeInstancesClient:
+    """InstancesClient stand-in serving an aggregated listing."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def aggregated_list(self, request):
+        with self._lock:
+            self.calls += 1
+        return iter(
+            [
+                (
+                    "zones/us-central1-a",
+                    SimpleNamespace(
+                        instances=[
+                            SimpleNamespace(name="web-1", status="RUNNING"),
+                            SimpleNamespace(name="batch-1", status="TERMINATED"),
+                        ]
+                    ),
+                ),
+                ("zones/us-central1-b", SimpleNamespace(instances=[])),
+                (
+                    "zones/europe-west1-b",
+                    SimpleNamespace(instances=[SimpleNamespace(name="web-2", status="RUNNING")]),
+                ),
+            ]
+        )
+
+
+class FakePool:
+    """GCPClientPool stand-in."""
+
+    def __init__(self) -> None:
+        self.instances = FakeInstancesClient()
+
+    def get_client(self, client_cls, **kwargs):
+        assert client_cls is compute_v1.InstancesClient
+        return self.instances
+
+
+class TestGCPComputeInventory:
+    """Test aggregated listing, zone partitioning and thread sharing."""
+
+    def test_one_aggregated_call_serves_every_zone(self):
+        """Test that all zones and status filters come from a single aggregated_list."""
+        pool = FakePool()
+        inventory = GCPComputeInventory(pool, "proj")
+
+        running = inventory.list_resources("instances", "us-central1-a", status="RUNNING")
+        stopped = inventory.list_resources("instances", "us-central1-a", status="TERMINATED")
+
+        assert [i.name for i in running] == ["web-1"]
+        assert [i.name for i in stopped] == ["batch-1"]
+        assert inventory.list_resources("instances", "us-central1-b") == []
+        assert inventory.list_resources("instances", "us-central1-f") == []
+        assert len(inventory.list_resources("instances")) == 3
+        assert pool.instances.calls == 1
+
+    def test_concurrent_threads_share_one_listing(self):
+        """Test that scenarios on worker threads never list the same collection twice."""
+        pool = FakePool()
+        inventory = GCPComputeInventory(pool, "proj")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: inventory.list_resources("instances", "europe-west1-b"), range(16)
+                )
+            )
+
+        assert all([i.name for i in r] == ["web-2"] for r in results)
+        assert pool.instances.calls == 1
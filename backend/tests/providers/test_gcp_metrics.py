@@ -0,0 +1,93 @@
+"""Tests for project-wide Cloud Monitoring metric summaries."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from google.cloud import monitoring_v3
+
+from app.providers.gcp_metrics import CloudMonitoringMetricCollector
+
+CPU_METRIC = "compute.googleapis.com/instance/cpu/utilization"
+
+# Aggregated value per instance for each aligner
+VALUES = {
+    monitoring_v3.Aggregation.Aligner.ALIGN_MEAN: {"111": 0.05, "222": 0.6},
+    monitoring_v3.Aggregation.Aligner.ALIGN_MAX: {"111": 0.2, "222": 0.9},
+    monitoring_v3.Aggregation.Aligner.ALIGN_MIN: {"111": 0.01, "222": 0.3},
+    monitoring_v3.Aggregation.Aligner.ALIGN_COUNT: {"111": 20160, "222": 40},
+}
+
+
+def _series(instance_id: str, value: float | int) -> monitoring_v3.TimeSeries:
+    typed = {"int64_value": value} if isinstance(value, int) else {"double_value": value}
+    return monitoring_v3.TimeSeries(
+        {
+            "resource": {"type": "gce_instance", "labels": {"instance_id": instance_id}},
+            "points": [{"value": typed}],
+        }
+    )
+
+
+class FakeMetricClient:
+    """MetricServiceClient stand-in answering aggregated list_time_series requests."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+        self._lock = threading.Lock()
+
+    def list_time_series(self, request):
+        with self._lock:
+            self.requests.append(request)
+        aligner = request["aggregation"].per_series_aligner
+        return [_series(instance_id, v) for instance_id, v in VALUES[aligner].items()]
+
+
+class FakePool:
+    """GCPClientPool stand-in."""
+
+    def __init__(self) -> None:
+        self.client = FakeMetricClient()
+
+    def get_client(self, client_cls, **kwargs):
+        assert client_cls is monitoring_v3.MetricServiceClient
+        return self.client
+
+
+class TestCloudMonitoringMetricCollector:
+    """Test server-side aggregation, per-instance lookups and thread sharing."""
+
+    def test_one_query_per_statistic_serves_every_instance(self):
+        """Test that avg/max/min/count for all instances come from 4 aggregated queries."""
+        pool = FakePool()
+        collector = CloudMonitoringMetricCollector(pool, "proj", end_time=1_700_000_000)
+
+        idle = collector.get(CPU_METRIC, "resource.label.instance_id", "111", 14)
+        busy = collector.get(CPU_METRIC, "resource.label.instance_id", "222", 14)
+
+        assert (idle.mean, idle.max, idle.min, idle.count) == (0.05, 0.2, 0.01, 20160)
+        assert busy.count == 40
+        assert collector.get(CPU_METRIC, "resource.label.instance_id", "333", 14) is None
+        assert len(pool.client.requests) == 4
+
+        request = pool.client.requests[0]
+        assert request["aggregation"].alignment_period.total_seconds() == 14 * 86400
+        assert list(request["aggregation"].group_by_fields) == ["resource.label.instance_id"]
+        assert "instance_id" not in request["filter"]
+
+    def test_concurrent_threads_share_one_query(self):
+        """Test that scenarios on worker threads never repeat the same aggregated query."""
+        pool = FakePool()
+        collector = CloudMonitoringMetricCollector(pool, "proj")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(
+                    lambda _: collector.get(
+                        CPU_METRIC, "resource.label.instance_id", "222", 7, statistics=("mean",)
+                    ),
+                    range(16),
+                )
+            )
+
+        assert all(r.mean == 0.6 for r in results)
+        assert len(pool.client.requests) == 1
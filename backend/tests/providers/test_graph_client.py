@@ -0,0 +1,94 @@
+"""Tests for the pooled Microsoft Graph client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.providers.graph_client import GraphClient
+
+BASE_URL = "https://graph.microsoft.com/v1.0"
+
+
+async def _token() -> str:
+    return "token"
+
+
+def _client(handler) -> GraphClient:
+    client = GraphClient(_token, base_url=BASE_URL)
+    client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+class TestGraphClient:
+    """Test throttling retries, $batch prefetching and the request cache."""
+
+    @pytest.mark.asyncio
+    async def test_throttled_request_retried_after_retry_after(self):
+        """Test that a 429 is retried and the collection pages are followed."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            if "skiptoken" in str(request.url):
+                return httpx.Response(200, json={"value": [{"id": "2"}]})
+            return httpx.Response(
+                200, json={"value": [{"id": "1"}], "@odata.nextLink": f"{BASE_URL}/users?skiptoken=x"}
+            )
+
+        client = _client(handler)
+        users = await client.get("/users")
+
+        assert [u["id"] for u in users] == ["1", "2"]
+        assert len(calls) == 3
+        assert client.throttled_responses == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_prefetch_batches_and_serves_from_cache(self):
+        """Test that 45 endpoints take 3 $batch requests and later GETs hit the cache."""
+        batch_sizes = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path.endswith("/$batch")
+            requests = json.loads(request.content)["requests"]
+            batch_sizes.append(len(requests))
+            return httpx.Response(
+                200,
+                json={
+                    "responses": [
+                        {"id": r["id"], "status": 200, "body": {"id": r["url"].split("/")[2]}}
+                        for r in requests
+                    ]
+                },
+            )
+
+        client = _client(handler)
+        endpoints = [f"/sites/site-{i}/drive" for i in range(45)]
+        await client.prefetch(endpoints)
+
+        assert sorted(batch_sizes) == [5, 20, 20]
+        assert (await client.get("/sites/site-7/drive")) == {"id": "site-7"}
+        assert client.cache_hits == 1
+        assert client.requests_sent == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_share_one_request(self):
+        """Test that scenarios asking for the same URL at once share one request."""
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"value": [{"id": "site"}]})
+
+        client = _client(handler)
+        results = await asyncio.gather(*(client.get("/sites", {"search": "*"}) for _ in range(10)))
+
+        assert all(r == [{"id": "site"}] for r in results)
+        assert len(calls) == 1
+        await client.close()
@@ -0,0 +1,163 @@
+"""Tests for incremental scans reusing the verdicts of unchanged scenarios."""
+
+from datetime import timedelta
+
+import pytest
+
+from app.providers.aws import AWSProvider
+from app.providers.base import OrphanResourceData
+from app.providers.incremental import IncrementalPlan, record_scenario_error
+from app.providers.scenario_engine import Scenario
+
+
+def _provider(monkeypatch) -> AWSProvider:
+    """AWS provider whose instance and volume markers never change."""
+    provider = AWSProvider("key", "secret")
+
+    async def resource_change_markers(region, resource_types):
+        return {"ec2_instance": {"i-1": "running"}, "ebs_volume": {"vol-1": "available"}}
+
+    monkeypatch.setattr(provider, "resource_change_markers", resource_change_markers)
+    return provider
+
+
+def _finding(resource_id: str, orphan_type: str) -> OrphanResourceData:
+    return OrphanResourceData(
+        resource_type="ec2_instance",
+        resource_id=resource_id,
+        resource_name=None,
+        region="eu-west-1",
+        estimated_monthly_cost=42.0,
+        resource_metadata={"orphan_type": orphan_type},
+    )
+
+
+class TestIncrementalPlan:
+    """Test which scenarios run and which reuse their previous verdict."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_scenarios_reuse_their_verdict(self, monkeypatch):
+        """Test reuse on unchanged markers, and evaluation on changed markers or old verdicts."""
+        provider = AWSProvider("key", "secret")
+        markers = {
+            "ec2_instance": {"i-1": "running"},
+            "ebs_volume": {"vol-1": "available"},
+        }
+
+        async def resource_change_markers(region, resource_types):
+            return {t: dict(markers[t]) for t in resource_types if t in markers}
+
+        monkeypatch.setattr(provider, "resource_change_markers", resource_change_markers)
+
+        calls: list[str] = []
+
+        def runner(name: str, orphan_type: str):
+            async def run(_deps):
+                calls.append(name)
+                return [_finding(f"{name}-1", orphan_type)]
+
+            return run
+
+        scenarios = [
+            Scenario("scan_idle_running_instances", "ec2", runner("scan_idle_running_instances", "idle")),
+            Scenario("scan_low_iops_usage_volumes", "ec2", runner("scan_low_iops_usage_volumes", "low_iops")),
+            Scenario("scan_stopped_instances", "ec2", runner("scan_stopped_instances", "stopped")),
+        ]
+
+        # First scan: nothing to reuse, metric-based evaluations are recorded
+        first = IncrementalPlan()
+        results = await provider._run_scenarios("eu-west-1", scenarios, first)
+        assert len(results) == 3
+        assert sorted(first.evaluated) == ["scan_idle_running_instances", "scan_low_iops_usage_volumes"]
+
+        # Only the volume changed: the instance scenario reuses its findings
+        calls.clear()
+        markers["ebs_volume"]["vol-1"] = "in-use"
+        second = IncrementalPlan(previous=first.evaluated, now=first.now + timedelta(hours=1))
+        results = await provider._run_scenarios("eu-west-1", scenarios, second)
+
+        assert sorted(calls) == ["scan_low_iops_usage_volumes", "scan_stopped_instances"]
+        assert second.reused == ["scan_idle_running_instances"]
+        assert [r.resource_id for r in results] == [
+            "scan_idle_running_instances-1",
+            "scan_low_iops_usage_volumes-1",
+            "scan_stopped_instances-1",
+        ]
+        assert results[0].resource_metadata == {"orphan_type": "idle"}
+
+        # Verdicts older than max_age are evaluated again
+        calls.clear()
+        third = IncrementalPlan(
+            previous={**first.evaluated, **second.evaluated},
+            max_age=timedelta(hours=72),
+            now=first.now + timedelta(hours=72, minutes=30),
+        )
+        await provider._run_scenarios("eu-west-1", scenarios, third)
+
+        assert "scan_idle_running_instances" in calls
+        assert third.reused == ["scan_low_iops_usage_volumes"]
+
+    @pytest.mark.asyncio
+    async def test_changed_rules_evaluate_again(self, monkeypatch):
+        """Test that a verdict is not reused once the scenario's detection rules change."""
+        provider = _provider(monkeypatch)
+        calls: list[dict] = []
+
+        def scenario(rules: dict) -> Scenario:
+            async def run(_deps):
+                calls.append(rules)
+                return [_finding("i-1", "idle")]
+
+            return Scenario("scan_idle_running_instances", "ec2", run, rules=rules)
+
+        first = IncrementalPlan()
+        await provider._run_scenarios("eu-west-1", [scenario({"min_idle_days": 7})], first)
+
+        same = IncrementalPlan(previous=first.evaluated, now=first.now + timedelta(hours=1))
+        await provider._run_scenarios("eu-west-1", [scenario({"min_idle_days": 7})], same)
+        assert same.reused == ["scan_idle_running_instances"]
+
+        changed = IncrementalPlan(previous=first.evaluated, now=first.now + timedelta(hours=1))
+        await provider._run_scenarios("eu-west-1", [scenario({"min_idle_days": 3})], changed)
+        assert changed.reused == []
+        assert calls == [{"min_idle_days": 7}, {"min_idle_days": 3}]
+        assert "scan_idle_running_instances" in changed.evaluated
+
+    @pytest.mark.asyncio
+    async def test_evaluations_with_swallowed_errors_are_not_stored(self, monkeypatch):
+        """Test that a scenario that logged and skipped an error is evaluated again next scan."""
+        provider = _provider(monkeypatch)
+        calls: list[str] = []
+
+        async def throttled(_deps):
+            calls.append("scan_idle_running_instances")
+            try:
+                raise RuntimeError("Throttling: Rate exceeded")
+            except RuntimeError as e:
+                # Scenarios skip the resource instead of failing the scan
+                record_scenario_error(e)
+            return []
+
+        async def healthy(_deps):
+            calls.append("scan_low_iops_usage_volumes")
+            return [_finding("vol-1", "low_iops")]
+
+        scenarios = [
+            Scenario("scan_idle_running_instances", "ec2", throttled),
+            Scenario("scan_low_iops_usage_volumes", "ec2", healthy),
+        ]
+
+        first = IncrementalPlan()
+        results = await provider._run_scenarios("eu-west-1", scenarios, first)
+
+        assert [r.resource_id for r in results] == ["vol-1"]
+        assert first.failed == ["scan_idle_running_instances"]
+        assert list(first.evaluated) == ["scan_low_iops_usage_volumes"]
+
+        # The failed scenario has no verdict to reuse
+        calls.clear()
+        second = IncrementalPlan(previous=first.evaluated, now=first.now + timedelta(hours=1))
+        await provider._run_scenarios("eu-west-1", scenarios, second)
+
+        assert calls == ["scan_idle_running_instances"]
+        assert second.reused == ["scan_low_iops_usage_volumes"]
@@ -0,0 +1,140 @@
+"""Tests for the concurrent scenario execution engine."""
+
+import asyncio
+
+import pytest
+
+from app.providers.scenario_engine import Scenario, ScenarioEngine
+
+
+def _sleeping(result: list, delay: float = 0.05, tracker: dict | None = None):
+    """Build a scenario runner that sleeps then returns `result`."""
+
+    async def run(_deps: dict) -> list:
+        if tracker is not None:
+            tracker["running"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["running"])
+        await asyncio.sleep(delay)
+        if tracker is not None:
+            tracker["running"] -= 1
+        return result
+
+    return run
+
+
+class TestScenarioEngine:
+    """Test concurrency, dependencies and timing reports."""
+
+    @pytest.mark.asyncio
+    async def test_independent_scenarios_run_concurrently(self):
+        """Test that independent scenarios overlap instead of running serially."""
+        engine = ScenarioEngine(max_concurrency=10, default_service_limit=10)
+        scenarios = [
+            Scenario(name=f"s{i}", service="ec2", run=_sleeping([i], delay=0.1))
+            for i in range(5)
+        ]
+
+        results, report = await engine.run(scenarios)
+
+        assert results == {f"s{i}": [i] for i in range(5)}
+        # Serial execution would take 0.5s
+        assert report.total_seconds < 0.3
+        assert len(report.timings) == 5
+
+    @pytest.mark.asyncio
+    async def test_service_limit_is_respected(self):
+        """Test that a service never exceeds its concurrency limit."""
+        tracker = {"running": 0, "peak": 0}
+        engine = ScenarioEngine(
+            max_concurrency=10, default_service_limit=10, service_limits={"cloudwatch": 2}
+        )
+        scenarios = [
+            Scenario(name=f"cw{i}", service="cloudwatch", run=_sleeping([], tracker=tracker))
+            for i in range(6)
+        ]
+
+        await engine.run(scenarios)
+
+        assert tracker["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_global_limit_is_respected(self):
+        """Test that the provider-wide limit caps scenarios across services."""
+        tracker = {"running": 0, "peak": 0}
+        engine = ScenarioEngine(max_concurrency=3, default_service_limit=10)
+        scenarios = [
+            Scenario(name=f"s{i}", service=f"svc{i % 2}", run=_sleeping([], tracker=tracker))
+            for i in range(8)
+        ]
+
+        await engine.run(scenarios)
+
+        assert tracker["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_dependency_receives_upstream_results(self):
+        """Test that a dependent scenario waits for and receives its dependency's results."""
+        engine = ScenarioEngine()
+        received: dict = {}
+
+        async def snapshots(deps: dict) -> list:
+            received.update(deps)
+            return ["snap-1"]
+
+        scenarios = [
+            Scenario(
+                name="snapshots",
+                service="ec2",
+                run=snapshots,
+                depends_on=("volumes",),
+            ),
+            Scenario(name="volumes", service="ec2", run=_sleeping(["vol-1", "vol-2"])),
+        ]
+
+        results, report = await engine.run(scenarios)
+
+        assert received == {"volumes": ["vol-1", "vol-2"]}
+        assert results["snapshots"] == ["snap-1"]
+        assert [t.name for t in report.critical_path()] == ["volumes", "snapshots"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_dependency_and_cycle_are_rejected(self):
+        """Test that invalid DAGs fail before any scenario runs."""
+        engine = ScenarioEngine()
+
+        with pytest.raises(ValueError, match="unknown scenario"):
+            await engine.run(
+                [Scenario(name="a", service="ec2", run=_sleeping([]), depends_on=("missing",))]
+            )
+
+        with pytest.raises(ValueError, match="cycle"):
+            await engine.run(
+                [
+                    Scenario(name="a", service="ec2", run=_sleeping([]), depends_on=("b",)),
+                    Scenario(name="b", service="ec2", run=_sleeping([]), depends_on=("a",)),
+                ]
+            )
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_remaining_scenarios(self):
+        """Test that a failing scenario propagates and cancels its siblings."""
+        engine = ScenarioEngine()
+        finished: list[str] = []
+
+        async def failing(_deps: dict) -> list:
+            raise RuntimeError("boom")
+
+        async def slow(_deps: dict) -> list:
+            await asyncio.sleep(1)
+            finished.append("slow")
+            return []
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await engine.run(
+                [
+                    Scenario(name="slow", service="ec2", run=slow),
+                    Scenario(name="failing", service="rds", run=failing),
+                ]
+            )
+
+        assert finished == []
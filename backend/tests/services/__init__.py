@@ -0,0 +1 @@
+"""Service layer tests."""
@@ -0,0 +1,237 @@
+"""Tests for the tiered price cache of PricingService."""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from sqlalchemy import select
+
+from app.models.pricing_cache import PricingCache
+from app.providers.aws import AWSProvider
+from app.services import pricing_service as pricing_module
+from app.services.pricing_service import (
+    AWS_PRICE_LIST_QUERIES,
+    PricingService,
+    summarize_tier_stats,
+)
+
+
+class FakeRedis:
+    """redis.asyncio client stand-in keeping values in a dict."""
+
+    def __init__(self, values: dict[str, str] | None = None) -> None:
+        self.values = dict(values or {})
+        self.hashes: dict[str, dict[str, int]] = {}
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return self.values.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline stand-in applying HINCRBY on execute()."""
+
+    def __init__(self, redis: FakeRedis) -> None:
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def hincrby(self, key, field, amount):
+        self.commands.append((key, field, amount))
+
+    async def execute(self):
+        for key, field, amount in self.commands:
+            fields = self.redis.hashes.setdefault(key, {})
+            fields[field] = fields.get(field, 0) + amount
+
+
+@pytest.fixture(autouse=True)
+def fresh_tiers(monkeypatch):
+    """Isolate the process-wide cache and counters between tests."""
+    monkeypatch.setattr(pricing_module, "local_price_cache", pricing_module.LocalPriceCache(16, 60))
+    monkeypatch.setattr(pricing_module, "tier_counters", pricing_module.PricingTierCounters())
+
+
+class TestPricingServiceTiers:
+    """Test tier order, write-back, single flight and tier counters."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_fetch_once(self, db_session):
+        """Test that concurrent lookups of a missing price trigger one API call."""
+        redis = FakeRedis()
+        service = PricingService(db_session, redis_client=redis)
+        api_calls = 0
+
+        async def fetch(service_name, region):
+            nonlocal api_calls
+            api_calls += 1
+            await asyncio.sleep(0.01)
+            return 0.08
+
+        service._fetch_aws_price_from_api = fetch
+
+        prices = await asyncio.gather(
+            *(service.get_aws_price("ebs_gp3", "us-east-1") for _ in range(50))
+        )
+
+        assert prices == [0.08] * 50
+        assert api_calls == 1
+        assert redis.values["pricing:aws:ebs_gp3:us-east-1"] == "0.08"
+        assert await service._get_cached_price_from_db("aws", "ebs_gp3", "us-east-1") == 0.08
+
+        # Now served from memory: no Redis round trip
+        gets = redis.gets
+        assert await service.get_aws_price("ebs_gp3", "us-east-1") == 0.08
+        assert redis.gets == gets
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_and_tier_stats(self, db_session):
+        """Test that a Redis hit skips PostgreSQL and counters are flushed to Redis."""
+        redis = FakeRedis({"pricing:aws:elastic_ip:eu-west-1": "3.65"})
+        service = PricingService(db_session, redis_client=redis)
+
+        async def no_db(*args):
+            raise AssertionError("PostgreSQL should not be queried")
+
+        service._get_cached_price_from_db = no_db
+
+        assert await service.get_aws_price("elastic_ip", "eu-west-1") == 3.65
+        assert await service.get_aws_price("elastic_ip", "eu-west-1") == 3.65
+        await service.close()
+
+        stats = summarize_tier_stats(redis.hashes[pricing_module.PRICING_STATS_KEY])
+        assert stats["tiers"]["memory"] == {"hits": 1, "misses": 1, "hit_rate": 50.0}
+        assert stats["tiers"]["redis"]["hits"] == 1
+        assert stats["tiers"]["postgres"]["hits"] + stats["api_fetches"] == 0
+
+
+class TestPriceTable:
+    """Test the price snapshot taken at scan start."""
+
+    @pytest.mark.asyncio
+    async def test_build_price_table_covers_every_pair(self, db_session):
+        """Test that cached rows come from the DB and only missing pairs are fetched."""
+        now = datetime.utcnow()
+        for service, region, price, expires_at in [
+            ("ebs_gp3", "us-east-1", 0.08, now + timedelta(hours=1)),
+            ("ebs_gp3", "eu-west-1", 0.088, now + timedelta(hours=1)),
+            ("ebs_gp2", "us-east-1", 0.5, now - timedelta(hours=1)),  # Expired
+        ]:
+            db_session.add(
+                PricingCache(
+                    provider="aws",
+                    service=service,
+                    region=region,
+                    price_per_unit=price,
+                    unit="GB",
+                    source="api",
+                    expires_at=expires_at,
+                )
+            )
+        await db_session.commit()
+
+        service = PricingService(db_session, redis_client=FakeRedis())
+        fetched = []
+
+        async def fetch(service_name, region):
+            fetched.append((service_name, region))
+            return 0.1
+
+        service._fetch_aws_price_from_api = fetch
+
+        table = await service.build_price_table(["us-east-1", "eu-west-1"], ("ebs_gp3", "ebs_gp2"))
+
+        assert len(table) == 4
+        assert table.get("aws", "ebs_gp3", "eu-west-1") == 0.088
+        assert table.get("aws", "ebs_gp2", "us-east-1") == 0.1
+        assert sorted(fetched) == [("ebs_gp2", "eu-west-1"), ("ebs_gp2", "us-east-1")]
+
+        # The provider prices from the snapshot without a pricing service
+        provider = AWSProvider("key", "secret", price_table=table)
+        assert await provider._get_price("ebs_gp3", "eu-west-1") == 0.088
+
+
+def _product(attributes: dict, usd: str) -> str:
+    return json.dumps(
+        {
+            "product": {"attributes": attributes},
+            "terms": {
+                "OnDemand": {"T": {"priceDimensions": {"D": {"pricePerUnit": {"USD": usd}}}}}
+            },
+        }
+    )
+
+
+class FakePricingClient:
+    """boto3 pricing client stand-in serving get_products pages per productFamily."""
+
+    def __init__(self, pages: dict[str, list[list[str]]]) -> None:
+        self.pages = pages
+        self.listings = []
+
+    def get_paginator(self, operation):
+        assert operation == "get_products"
+        return self
+
+    def paginate(self, ServiceCode, Filters, **kwargs):
+        family = Filters[0]["Value"]
+        assert {"Type": "TERM_MATCH", "Field": "locationType", "Value": "AWS Region"} in Filters
+        self.listings.append((ServiceCode, family))
+        return [{"PriceList": page} for page in self.pages.get(family, [])]
+
+
+class TestPricingRefresh:
+    """Test the bulk, incremental pricing refresh."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_upserts_all_regions_and_skips_unchanged(self, db_session):
+        """Test that one listing per price list covers every region and unchanged rows stay."""
+        storage = [
+            [
+                _product({"volumeApiName": "gp3", "regionCode": "us-east-1"}, "0.08"),
+                _product({"volumeApiName": "gp3", "location": "Europe (Ireland)"}, "0.088"),
+            ],
+            [_product({"volumeApiName": "io2", "regionCode": "us-east-1"}, "0.125")],
+        ]
+        ips = [
+            [
+                _product(
+                    {"usagetype": "EUW1-ElasticIP:IdleAddress", "regionCode": "eu-west-1"}, "0.005"
+                ),
+                _product({"usagetype": "EUW1-ElasticIP:AdditionalAddress"}, "0.005"),
+            ]
+        ]
+        service = PricingService(db_session, redis_client=FakeRedis())
+        service.aws_client.client = FakePricingClient({"Storage": storage, "IP Address": ips})
+
+        result = await service.refresh_aws_prices()
+
+        assert result == {"updated_count": 4, "unchanged_count": 0, "failed_count": 0}
+        assert len(service.aws_client.client.listings) == len(AWS_PRICE_LIST_QUERIES)
+        rows = (await db_session.scalars(select(PricingCache))).all()
+        prices = {(r.service, r.region): r.price_per_unit for r in rows}
+        assert prices[("ebs_gp3", "eu-west-1")] == 0.088
+        assert prices[("elastic_ip", "eu-west-1")] == pytest.approx(3.65)
+
+        storage[1][0] = _product({"volumeApiName": "io2", "regionCode": "us-east-1"}, "0.13")
+        result = await service.refresh_aws_prices()
+
+        assert result == {"updated_count": 1, "unchanged_count": 3, "failed_count": 0}
+        db_session.expire_all()
+        io2 = await db_session.scalar(select(PricingCache).where(PricingCache.service == "ebs_io2"))
+        assert io2.price_per_unit == 0.13
+        assert await service.get_aws_price("ebs_io2", "us-east-1") == 0.13
@@ -0,0 +1,133 @@
+"""Tests for the parallel multi-region scan fan-out."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.workers.region_scan import RegionProgressTracker, scan_regions_in_parallel
+
+
+class FakeTask:
+    """Minimal stand-in for a bound Celery task recording progress updates."""
+
+    def __init__(self) -> None:
+        self.updates: list[dict] = []
+
+    def update_state(self, state: str, meta: dict) -> None:
+        self.updates.append({"state": state, **meta})
+
+
+class FakePublisher:
+    """Minimal stand-in for ScanProgressPublisher recording published events."""
+
+    def __init__(self) -> None:
+        self.events: list[dict] = []
+
+    def publish(self, state: str, meta: dict) -> None:
+        self.events.append({"state": state, **meta})
+
+
+class TestScanRegionsInParallel:
+    """Test region fan-out, concurrency limit and progress tracking."""
+
+    @pytest.mark.asyncio
+    async def test_regions_scanned_concurrently_within_limit(self):
+        """Test that regions overlap but never exceed the region limit."""
+        regions = ["us-east-1", "eu-west-1", "eu-west-3", "ap-south-1"]
+        tracker = {"running": 0, "peak": 0}
+
+        async def scan_region(region: str) -> list:
+            tracker["running"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["running"])
+            await asyncio.sleep(0.05)
+            tracker["running"] -= 1
+            return [f"{region}-orphan"]
+
+        results = await scan_regions_in_parallel(regions, scan_region, max_concurrent_regions=2)
+
+        assert tracker["peak"] == 2
+        assert list(results) == regions
+        assert results["eu-west-3"] == ["eu-west-3-orphan"]
+
+    @pytest.mark.asyncio
+    async def test_progress_tracks_each_region(self):
+        """Test that the tracker reports per-region status and resource counts."""
+        task = FakeTask()
+        regions = ["us-east-1", "eu-west-1"]
+        progress = RegionProgressTracker(task, regions, datetime.now())
+
+        async def scan_region(region: str) -> list:
+            return ["orphan"] * (3 if region == "us-east-1" else 1)
+
+        await scan_regions_in_parallel(regions, scan_region, progress=progress)
+
+        last = task.updates[-1]
+        assert last["state"] == "PROGRESS"
+        assert last["resources_found"] == 4
+        assert last["current"] == 3
+        assert last["total"] == 4
+        assert last["regions"]["us-east-1"]["status"] == "completed"
+        assert last["regions"]["us-east-1"]["resources_found"] == 3
+
+    @pytest.mark.asyncio
+    async def test_region_failure_propagates(self):
+        """Test that a failing region fails the scan and is marked as failed."""
+        task = FakeTask()
+        progress = RegionProgressTracker(task, ["us-east-1"], datetime.now())
+
+        async def scan_region(region: str) -> list:
+            raise RuntimeError("throttled")
+
+        with pytest.raises(RuntimeError, match="throttled"):
+            await scan_regions_in_parallel(["us-east-1"], scan_region, progress=progress)
+
+        assert progress.region_states["us-east-1"]["status"] == "failed"
+        assert progress.region_states["us-east-1"]["error"] == "throttled"
+
+    @pytest.mark.asyncio
+    async def test_region_failure_cancels_other_regions(self):
+        """Test that a failing region cancels the regions still running before propagating."""
+        written: list[str] = []
+        cancelled: list[str] = []
+
+        async def scan_region(region: str) -> list:
+            if region == "us-east-1":
+                await asyncio.sleep(0.01)
+                raise RuntimeError("throttled")
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled.append(region)
+                raise
+            written.append(region)
+            return []
+
+        with pytest.raises(RuntimeError, match="throttled"):
+            await scan_regions_in_parallel(
+                ["us-east-1", "eu-west-1"], scan_region, max_concurrent_regions=2
+            )
+
+        # The slow region was cancelled before the failure propagated, not left running
+        assert cancelled == ["eu-west-1"]
+        await asyncio.sleep(0.6)
+        assert written == []
+
+    @pytest.mark.asyncio
+    async def test_progress_pushed_to_publisher(self):
+        """Test that every update also reaches the publisher, with an ETA."""
+        task = FakeTask()
+        publisher = FakePublisher()
+        regions = ["us-east-1", "eu-west-1"]
+        progress = RegionProgressTracker(task, regions, datetime.now(), publisher=publisher)
+
+        async def scan_region(region: str) -> list:
+            return ["orphan"]
+
+        await scan_regions_in_parallel(
+            regions, scan_region, progress=progress, max_concurrent_regions=1
+        )
+
+        assert publisher.events == task.updates
+        assert publisher.events[0]["eta_seconds"] is None
+        assert publisher.events[-1]["eta_seconds"] == 0
@@ -0,0 +1,154 @@
+"""Tests for bulk persistence of scan results."""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.models.all_cloud_resource import AllCloudResource
+from app.models.orphan_resource import OrphanResource
+from app.models.orphan_resource_change import OrphanResourceChange
+from app.providers.base import AllCloudResourceData, OrphanResourceData
+from app.workers.result_writer import ScanResultWriter
+
+
+def _orphan(i: int, region: str = "us-east-1") -> OrphanResourceData:
+    return OrphanResourceData(
+        resource_type="ebs_volume",
+        resource_id=f"vol-{i}",
+        resource_name=f"volume-{i}",
+        region=region,
+        estimated_monthly_cost=1.5,
+        resource_metadata={"size_gb": i},
+    )
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def _count(session_factory, model, scan_id) -> int:
+    async with session_factory() as db:
+        return await db.scalar(
+            select(func.count()).select_from(model).where(model.scan_id == scan_id)
+        )
+
+
+class TestScanResultWriter:
+    """Test chunked inserts, row mapping and discarding a failed scan's results."""
+
+    @pytest.mark.asyncio
+    async def test_orphans_written_in_chunks(self, session_factory):
+        """Test that region results are inserted in chunks and mapped to columns."""
+        scan_id, account_id = uuid.uuid4(), uuid.uuid4()
+        writer = ScanResultWriter(session_factory, scan_id, account_id, chunk_size=100)
+
+        assert await writer.write_orphans([_orphan(i) for i in range(250)]) == 250
+        assert await writer.write_orphans([_orphan(i, "eu-west-1") for i in range(10)]) == 10
+        assert await writer.write_orphans([]) == 0
+
+        assert writer.orphans_written == 260
+        assert await _count(session_factory, OrphanResource, scan_id) == 260
+        async with session_factory() as db:
+            row = await db.scalar(
+                select(OrphanResource).where(OrphanResource.resource_id == "vol-7")
+            )
+        assert row.cloud_account_id == account_id
+        assert row.resource_metadata == {"size_gb": 7}
+        assert row.status == "active"
+
+    @pytest.mark.asyncio
+    async def test_inventory_written_and_discarded(self, session_factory):
+        """Test inventory rows (normalized datetimes) and discard() for a failed scan."""
+        scan_id = uuid.uuid4()
+        writer = ScanResultWriter(session_factory, scan_id, uuid.uuid4())
+        created = datetime(2024, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+        resource = AllCloudResourceData(
+            resource_type="ec2_instance",
+            resource_id="i-1",
+            resource_name="web",
+            region="us-east-1",
+            estimated_monthly_cost=30.0,
+            resource_metadata={},
+            created_at_cloud=created,
+        )
+
+        await writer.write_inventory([resource])
+        await writer.write_orphans([_orphan(1)])
+        async with session_factory() as db:
+            row = await db.scalar(
+                select(AllCloudResource).where(AllCloudResource.scan_id == scan_id)
+            )
+        assert row.created_at_cloud == datetime(2024, 1, 1, 10)
+
+        await writer.discard()
+        assert await _count(session_factory, AllCloudResource, scan_id) == 0
+        assert await _count(session_factory, OrphanResource, scan_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_differential_scan(self, session_factory):
+        """Test that only changed findings are written and the rest carried over on completion."""
+        account_id, base_scan_id, scan_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        base_writer = ScanResultWriter(session_factory, base_scan_id, account_id)
+        await base_writer.write_orphans([_orphan(i) for i in range(5)])
+
+        # vol-0..2 unchanged, vol-3 costlier, vol-4 gone, vol-5 new
+        changed = _orphan(3)
+        changed.estimated_monthly_cost = 4.0
+        orphans = [_orphan(0), _orphan(1), _orphan(2), changed, _orphan(5)]
+        writer = ScanResultWriter(
+            session_factory, scan_id, account_id, base_scan_id=base_scan_id
+        )
+
+        assert await writer.write_orphans(orphans) == 2
+
+        # While the scan runs, the base scan keeps every finding
+        assert await _count(session_factory, OrphanResource, scan_id) == 2
+        assert await _count(session_factory, OrphanResource, base_scan_id) == 5
+
+        async with session_factory() as db:
+            assert await writer.finish_orphans(db) == 1
+            await db.rollback()
+        # Nothing moves unless the completing transaction commits
+        assert await _count(session_factory, OrphanResource, base_scan_id) == 5
+
+        async with session_factory() as db:
+            assert await writer.finish_orphans(db) == 1
+            await db.commit()
+        assert [o.resource_id for o in writer.changed_orphans(orphans)] == ["vol-3", "vol-5"]
+
+        # The scan holds the full current state, the base scan what it replaced
+        assert await _count(session_factory, OrphanResource, scan_id) == 5
+        assert await _count(session_factory, OrphanResource, base_scan_id) == 2
+        async with session_factory() as db:
+            changes = await db.execute(
+                select(OrphanResourceChange.resource_id, OrphanResourceChange.change_type)
+                .where(OrphanResourceChange.scan_id == scan_id)
+                .order_by(OrphanResourceChange.resource_id)
+            )
+            assert changes.all() == [
+                ("vol-3", "changed"),
+                ("vol-4", "removed"),
+                ("vol-5", "added"),
+            ]
+
+    @pytest.mark.asyncio
+    async def test_failed_differential_scan_leaves_base_scan_intact(self, session_factory):
+        """Test that discarding an unfinished differential scan never touches its base scan."""
+        account_id, base_scan_id, scan_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        await ScanResultWriter(session_factory, base_scan_id, account_id).write_orphans(
+            [_orphan(i) for i in range(3)]
+        )
+        writer = ScanResultWriter(
+            session_factory, scan_id, account_id, base_scan_id=base_scan_id
+        )
+        await writer.write_orphans([_orphan(0), _orphan(1), _orphan(7)])
+
+        await writer.discard()
+        assert await _count(session_factory, OrphanResource, scan_id) == 0
+        assert await _count(session_factory, OrphanResource, base_scan_id) == 3
+        assert await _count(session_factory, OrphanResourceChange, scan_id) == 0
@@ -0,0 +1,121 @@
+"""Tests for the cloud account scan task."""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.crud import cloud_account as cloud_account_crud
+from app.crud import scan as scan_crud
+from app.models.cloud_account import CloudAccount
+from app.models.orphan_resource import OrphanResource
+from app.models.scan import Scan, ScanStatus, ScanType
+from app.models.user import User
+from app.providers.base import OrphanResourceData
+from app.schemas.cloud_account import CloudAccountCreate
+from app.schemas.scan import ScanCreate
+from app.workers import tasks
+
+
+class _Task:
+    """Bound Celery task stand-in (progress updates are ignored)."""
+
+    def update_state(self, state, meta):
+        pass
+
+
+class _AzureProvider:
+    """Azure provider finding one unattached disk per region."""
+
+    def __init__(self, **credentials):
+        self.credentials = credentials
+        self.closed = False
+
+    async def validate_credentials(self):
+        return {"subscription_id": self.credentials["subscription_id"]}
+
+    async def scan_all_resources(self, region, detection_rules, scan_global_resources, incremental):
+        return [
+            OrphanResourceData(
+                resource_type="managed_disk_unattached",
+                resource_id=f"/subscriptions/sub/disks/{region}-disk",
+                resource_name=f"{region}-disk",
+                region=region,
+                estimated_monthly_cost=4.8,
+                resource_metadata={"disk_size_gb": 128},
+            )
+        ]
+
+    async def close(self):
+        self.closed = True
+
+
+class TestScanCloudAccountTask:
+    """Test the provider branches of the scan task."""
+
+    @pytest.mark.asyncio
+    async def test_azure_scan_completes(
+        self, engine, db_session: AsyncSession, test_user: User, monkeypatch
+    ):
+        """Test that an Azure scan stores its findings and completes (regression: AWS-only logging)."""
+        account = await cloud_account_crud.create_cloud_account(
+            db_session,
+            test_user.id,
+            CloudAccountCreate(
+                provider="azure",
+                account_name="Test Azure Subscription",
+                account_identifier="abcdef12-3456-7890-abcd-ef1234567890",
+                azure_tenant_id="12345678-1234-1234-1234-123456789abc",
+                azure_client_id="87654321-4321-4321-4321-abc987654321",
+                azure_client_secret="mock-azure-client-secret-for-testing",
+                azure_subscription_id="abcdef12-3456-7890-abcd-ef1234567890",
+                regions=["westeurope", "northeurope"],
+            ),
+        )
+        scan = await scan_crud.create_scan(
+            db_session, ScanCreate(cloud_account_id=account.id, scan_type=ScanType.MANUAL)
+        )
+
+        providers: list[_AzureProvider] = []
+
+        def azure_provider(**kwargs):
+            providers.append(_AzureProvider(**kwargs))
+            return providers[-1]
+
+        async def load_price_table(db, provider, regions):
+            return {}
+
+        def inventory_scanner(provider):
+            raise RuntimeError("inventory disabled in this test")
+
+        monkeypatch.setattr(
+            tasks,
+            "AsyncSessionLocal",
+            sessionmaker(engine, class_=AsyncSession, expire_on_commit=False),
+        )
+        monkeypatch.setattr(tasks, "AzureProvider", azure_provider)
+        monkeypatch.setattr(tasks, "load_price_table", load_price_table)
+        monkeypatch.setattr(tasks, "AzureInventoryScanner", inventory_scanner)
+        monkeypatch.setattr(tasks.collect_scan_ml_data, "delay", lambda *args: None)
+        emails: list[dict] = []
+        monkeypatch.setattr(tasks, "send_scan_summary_email", lambda **kwargs: emails.append(kwargs))
+
+        result = await tasks._scan_cloud_account_async(_Task(), str(scan.id), str(account.id))
+
+        assert result["status"] == "completed"
+        assert result["orphan_resources_found"] == 2
+        assert result["regions_scanned"] == ["westeurope", "northeurope"]
+        assert providers[0].credentials["tenant_id"] == "12345678-1234-1234-1234-123456789abc"
+        assert providers[0].closed
+        assert [email["status"] for email in emails] == ["completed"]
+
+        db_session.expire_all()
+        scan = await db_session.scalar(select(Scan).where(Scan.id == scan.id))
+        account = await db_session.scalar(select(CloudAccount).where(CloudAccount.id == account.id))
+        assert scan.status == ScanStatus.COMPLETED.value
+        assert scan.estimated_monthly_waste == pytest.approx(9.6)
+        assert account.latest_orphan_scan_id == scan.id
+        orphans = (
+            await db_session.scalars(select(OrphanResource).where(OrphanResource.scan_id == scan.id))
+        ).all()
+        assert sorted(o.region for o in orphans) == ["northeurope", "westeurope"]